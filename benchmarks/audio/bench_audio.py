@@ -0,0 +1,230 @@
+"""
+Load tests for pycord.ext.audio against an in-process fake Lavalink.
+
+Measures websocket event dispatch throughput, REST search latency,
+memory per player and websocket reconnect time, without a real node.
+
+Usage::
+
+    python benchmarks/audio/bench_audio.py --players 2000 --events 20000
+"""
+import aiohttp
+import argparse
+import asyncio
+import pathlib
+import statistics
+import sys
+import time
+import tracemalloc
+
+HERE = pathlib.Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+sys.path.insert(0, str(HERE.parents[1]))
+
+from mock_lavalink import MockLavalink  # noqa: E402
+from pycord.ext.audio import Node, Player  # noqa: E402
+
+
+class BenchBot:
+    """The parts of a commands.Bot used by Node, WebSocket and Player."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.shard_id = None
+
+    async def wait_until_ready(self):
+        return
+
+    def get_guild(self, guild_id):
+        return None
+
+
+class BenchClient:
+    """The parts of an audio.Client used by Node and WebSocket."""
+
+    def __init__(self, bot, session):
+        self.bot = bot
+        self.session = session
+        self.nodes = {}
+
+    async def _dispatch_listeners(self, name, *args, **kwargs):
+        return
+
+
+async def make_node(server: MockLavalink, client: BenchClient) -> Node:
+    node = Node(
+        server.host,
+        server.port,
+        1,
+        1234,
+        client=client,
+        session=client.session,
+        rest_uri=server.rest_uri,
+        password=server.password,
+        region="bench",
+        identifier="BENCH",
+    )
+    await node.connect(client.bot)
+
+    client.nodes[node.identifier] = node
+    return node
+
+
+def add_players(node: Node, count: int):
+    for guild_id in range(count):
+        node.players[guild_id] = Player(node._client.bot, guild_id, node)
+
+
+async def bench_events(server: MockLavalink, node: Node, events: int) -> dict:
+    done = asyncio.Event()
+    seen = 0
+
+    def hook(event):
+        nonlocal seen
+        seen += 1
+        if seen >= events:
+            done.set()
+
+    node.set_hook(hook)
+
+    start = time.perf_counter()
+    await server.emit_events(events, guild_ids=list(node.players))
+    await asyncio.wait_for(done.wait(), timeout=120)
+    elapsed = time.perf_counter() - start
+
+    node.hook = None
+    return {"events": events, "seconds": elapsed, "events/s": events / elapsed}
+
+
+async def bench_rest(node: Node, requests: int, concurrency: int) -> dict:
+    latencies = []
+    queue = asyncio.Queue()
+
+    for i in range(requests):
+        queue.put_nowait(f"ytsearch:bench {i}")
+
+    async def worker():
+        while not queue.empty():
+            query = queue.get_nowait()
+
+            start = time.perf_counter()
+            await node.get_tracks(query)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "req/s": requests / elapsed,
+        "p50 ms": statistics.median(latencies),
+        "p95 ms": latencies[int(len(latencies) * 0.95) - 1],
+        "p99 ms": latencies[int(len(latencies) * 0.99) - 1],
+        "pool": node.pool_stats,
+    }
+
+
+def bench_memory(node: Node, players: int) -> dict:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    base = max(node.players, default=0) + 1
+    for guild_id in range(base, base + players):
+        node.players[guild_id] = Player(node._client.bot, guild_id, node)
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    for guild_id in range(base, base + players):
+        del node.players[guild_id]
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return {"players": players, "bytes/player": size / players}
+
+
+async def bench_reconnect(server: MockLavalink, node: Node) -> dict:
+    """
+    Time from the websocket starting to reconnect to it being connected. The
+    backoff before it, which is the bulk of the downtime, is reported
+    separately.
+    """
+    websocket = node._websocket
+    connections = server.connections
+    connect = websocket._connect
+    connect_started = []
+
+    async def timed_connect():
+        connect_started.append(time.perf_counter())
+        await connect()
+
+    websocket._connect = timed_connect
+    try:
+        start = time.perf_counter()
+        await server.disconnect_all()
+
+        while not (websocket.is_connected and server.connections > connections):
+            await asyncio.sleep(0.001)
+        end = time.perf_counter()
+    finally:
+        del websocket._connect
+
+    return {
+        "players": len(node.players),
+        "backoff": connect_started[0] - start,
+        "seconds": end - connect_started[0],
+    }
+
+
+async def main(args):
+    server = MockLavalink(
+        rest_latency=args.rest_latency,
+        stats_interval=1.0,
+        update_interval=args.update_interval,
+    )
+    await server.start()
+
+    loop = asyncio.get_event_loop()
+    session = aiohttp.ClientSession()
+    client = BenchClient(BenchBot(loop), session)
+
+    node = await make_node(server, client)
+    add_players(node, args.players)
+
+    try:
+        results = {
+            "memory": bench_memory(node, args.players),
+            "events": await bench_events(server, node, args.events),
+            "rest": await bench_rest(node, args.requests, args.concurrency),
+        }
+
+        if not args.skip_reconnect:
+            results["reconnect"] = await asyncio.wait_for(
+                bench_reconnect(server, node), timeout=120
+            )
+    finally:
+        node._websocket._task.cancel()
+        await node.rest_session.close()
+        await session.close()
+        await server.close()
+
+    for name, result in results.items():
+        print(f"{name}:")
+        for key, value in result.items():
+            if isinstance(value, float):
+                value = f"{value:,.3f}"
+            print(f"    {key:<14} {value}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rest-latency", type=float, default=0.0)
+    parser.add_argument("--update-interval", type=float, default=None)
+    parser.add_argument("--skip-reconnect", action="store_true")
+
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,304 @@
+"""MIT License
+
+Copyright (c) 2021 Pycord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import aiohttp
+import asyncio
+import base64
+import json
+import logging
+import time
+from aiohttp import web
+from typing import Any, Dict, Optional, Set
+
+
+__log__ = logging.getLogger(__name__)
+
+
+class MockLavalink:
+    """An in-process fake Lavalink server.
+
+    Serves ``/loadtracks`` and ``/decodetrack`` over REST, and a websocket on ``/``
+    which emits ``stats``, ``playerUpdate`` and ``event`` ops at configurable rates.
+
+    Parameters
+    ------------
+    host: str
+        The host to bind to. Defaults to 127.0.0.1.
+    port: int
+        The port to bind to. Defaults to 0, which picks a free port.
+    password: str
+        The password clients must send in the Authorization header.
+    tracks_per_search: int
+        How many tracks ``/loadtracks`` returns for a search.
+    rest_latency: float
+        Artificial delay in seconds added to every REST response.
+    stats_interval: Optional[float]
+        Seconds between ``stats`` ops. None disables them.
+    update_interval: Optional[float]
+        Seconds between ``playerUpdate`` ops for every known player. None disables them.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        password: str = "youshallnotpass",
+        tracks_per_search: int = 5,
+        rest_latency: float = 0.0,
+        stats_interval: Optional[float] = 60.0,
+        update_interval: Optional[float] = 5.0,
+    ):
+        self.host = host
+        self.port = port
+        self.password = password
+        self.tracks_per_search = tracks_per_search
+        self.rest_latency = rest_latency
+        self.stats_interval = stats_interval
+        self.update_interval = update_interval
+
+        self.players: Dict[str, Dict[str, Any]] = {}
+        self.sockets: Set[web.WebSocketResponse] = set()
+        self.received = 0
+        self.connections = 0
+
+        self._started = time.time()
+        self._runner = None
+        self._tasks = []
+
+        self.app = web.Application()
+        self.app.router.add_get("/", self._websocket)
+        self.app.router.add_get("/loadtracks", self._loadtracks)
+        self.app.router.add_get("/decodetrack", self._decodetrack)
+
+    @property
+    def rest_uri(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+        # Resolve the real port when binding to port 0.
+        self.port = site._server.sockets[0].getsockname()[1]
+
+        if self.stats_interval:
+            self._tasks.append(asyncio.ensure_future(self._stats_loop()))
+        if self.update_interval:
+            self._tasks.append(asyncio.ensure_future(self._update_loop()))
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        await self.disconnect_all()
+
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def disconnect_all(self) -> None:
+        """Close every connected websocket, e.g. to measure reconnects."""
+        for ws in list(self.sockets):
+            await ws.close()
+
+    async def broadcast(self, payload: Dict[str, Any]) -> None:
+        data = json.dumps(payload)
+
+        for ws in list(self.sockets):
+            if not ws.closed:
+                await ws.send_str(data)
+
+    async def emit_events(
+        self, count: int, *, guild_ids=None, type_: str = "TrackStartEvent"
+    ) -> None:
+        """Emit ``count`` event ops, cycling through ``guild_ids`` or the known players."""
+        guild_ids = list(guild_ids or self.players.keys())
+        track = self.encode_track("mock:event")
+
+        for i in range(count):
+            payload = {
+                "op": "event",
+                "type": type_,
+                "guildId": str(guild_ids[i % len(guild_ids)]),
+                "track": track,
+            }
+            if type_ == "TrackEndEvent":
+                payload["reason"] = "FINISHED"
+
+            await self.broadcast(payload)
+
+    @staticmethod
+    def encode_track(identifier: str) -> str:
+        return base64.b64encode(identifier.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def track_info(identifier: str) -> Dict[str, Any]:
+        return {
+            "identifier": identifier,
+            "isSeekable": True,
+            "author": "Mock Author",
+            "length": 180000,
+            "isStream": False,
+            "position": 0,
+            "title": f"Mock Track {identifier}",
+            "uri": f"https://example.com/{identifier}",
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        playing = sum(1 for p in self.players.values() if p.get("track"))
+
+        return {
+            "op": "stats",
+            "players": len(self.players),
+            "playingPlayers": playing,
+            "uptime": int((time.time() - self._started) * 1000),
+            "memory": {
+                "free": 100_000_000,
+                "used": 50_000_000,
+                "allocated": 150_000_000,
+                "reservable": 1_000_000_000,
+            },
+            "cpu": {"cores": 4, "systemLoad": 0.1, "lavalinkLoad": 0.05},
+            "frameStats": {"sent": 3000, "nulled": 0, "deficit": 0},
+        }
+
+    def _authorized(self, request: web.Request) -> bool:
+        return request.headers.get("Authorization") == self.password
+
+    async def _loadtracks(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.json_response({"error": "Unauthorized"}, status=401)
+
+        if self.rest_latency:
+            await asyncio.sleep(self.rest_latency)
+
+        query = request.query.get("identifier", "")
+        tracks = []
+
+        for i in range(self.tracks_per_search):
+            identifier = f"{query}:{i}"
+            tracks.append(
+                {
+                    "track": self.encode_track(identifier),
+                    "info": self.track_info(identifier),
+                }
+            )
+
+        return web.json_response(
+            {
+                "loadType": "SEARCH_RESULT" if tracks else "NO_MATCHES",
+                "playlistInfo": {},
+                "tracks": tracks,
+            }
+        )
+
+    async def _decodetrack(self, request: web.Request) -> web.Response:
+        if not self._authorized(request):
+            return web.json_response({"error": "Unauthorized"}, status=401)
+
+        if self.rest_latency:
+            await asyncio.sleep(self.rest_latency)
+
+        try:
+            identifier = base64.b64decode(request.query["track"]).decode("utf-8")
+        except (KeyError, ValueError):
+            return web.json_response(
+                {"status": 500, "error": "Invalid track"}, status=500
+            )
+
+        return web.json_response(self.track_info(identifier))
+
+    async def _websocket(self, request: web.Request) -> web.StreamResponse:
+        if not self._authorized(request):
+            return web.Response(status=401)
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+
+        self.sockets.add(ws)
+        self.connections += 1
+
+        try:
+            async for msg in ws:
+                if msg.type is aiohttp.WSMsgType.TEXT:
+                    self.received += 1
+                    await self._handle_op(ws, json.loads(msg.data))
+        finally:
+            self.sockets.discard(ws)
+
+        return ws
+
+    async def _handle_op(self, ws: web.WebSocketResponse, data: Dict[str, Any]):
+        op = data.get("op")
+        guild_id = data.get("guildId")
+
+        if op == "voiceUpdate":
+            self.players.setdefault(guild_id, {})
+        elif op == "play":
+            player = self.players.setdefault(guild_id, {})
+            player["track"] = data["track"]
+            player["position"] = int(data.get("startTime", 0))
+
+            await ws.send_json(
+                {
+                    "op": "event",
+                    "type": "TrackStartEvent",
+                    "guildId": guild_id,
+                    "track": data["track"],
+                }
+            )
+        elif op == "stop":
+            player = self.players.get(guild_id)
+
+            if player and player.pop("track", None):
+                await ws.send_json(
+                    {
+                        "op": "event",
+                        "type": "TrackEndEvent",
+                        "guildId": guild_id,
+                        "reason": "STOPPED",
+                    }
+                )
+        elif op == "destroy":
+            self.players.pop(guild_id, None)
+
+    async def _stats_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            await self.broadcast(self.stats())
+
+    async def _update_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.update_interval)
+
+            now = int(time.time() * 1000)
+            for guild_id, player in list(self.players.items()):
+                await self.broadcast(
+                    {
+                        "op": "playerUpdate",
+                        "guildId": guild_id,
+                        "state": {"time": now, "position": player.get("position", 0)},
+                    }
+                )
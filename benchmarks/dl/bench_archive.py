@@ -0,0 +1,126 @@
+"""
+Download archive lookups against a large archive.
+
+Checks a playlist's worth of ids (half of them archived) against an archive
+of --lines ids, then records the missing ones, like a playlist download
+with --download-archive. Compares the old per-video scan of the text file
+with the in-memory DownloadArchive and the sqlite archive.
+
+Usage::
+
+    python benchmarks/dl/bench_archive.py --lines 500000 --lookups 2000
+"""
+import argparse
+import errno
+import pathlib
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pycord.ext.dl.archive import (  # noqa: E402
+    DownloadArchive,
+    SqliteDownloadArchive,
+)
+from pycord.ext.dl.utils import locked_file  # noqa: E402
+
+
+class ScanArchive:
+    """The previous YoutubeDL implementation: one file scan per lookup."""
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def __contains__(self, vid_id):
+        try:
+            with locked_file(self.filename, "r", encoding="utf-8") as archive_file:
+                for line in archive_file:
+                    if line.strip() == vid_id:
+                        return True
+        except IOError as ioe:
+            if ioe.errno != errno.ENOENT:
+                raise
+        return False
+
+    def add(self, vid_id):
+        with locked_file(self.filename, "a", encoding="utf-8") as archive_file:
+            archive_file.write(vid_id + "\n")
+
+    def close(self):
+        pass
+
+
+def archive_id(i):
+    return "youtube %011d" % i
+
+
+def fill_text(path, lines):
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            f.write(archive_id(i) + "\n")
+
+
+def fill_sqlite(path, lines):
+    archive = SqliteDownloadArchive(path)
+    conn = archive._connect()
+    with conn:
+        conn.executemany(
+            "INSERT INTO archive VALUES (?)", ((archive_id(i),) for i in range(lines))
+        )
+    archive.close()
+
+
+def playlist(lines, lookups):
+    # Half already archived, spread over the file, half new
+    step = max(lines // (lookups // 2), 1)
+    archived = [archive_id(i) for i in range(0, lines, step)][: lookups // 2]
+    new = [archive_id(lines + i) for i in range(lookups - len(archived))]
+    return [vid for pair in zip(archived, new) for vid in pair]
+
+
+def bench(archive, ids):
+    start = time.perf_counter()
+    hits = 0
+    for vid_id in ids:
+        if vid_id in archive:
+            hits += 1
+        else:
+            archive.add(vid_id)
+    elapsed = time.perf_counter() - start
+    archive.close()
+    return hits, elapsed
+
+
+def main(args):
+    ids = playlist(args.lines, args.lookups)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, cls, ext, fill in (
+            ("scan", ScanArchive, ".txt", fill_text),
+            ("memory", DownloadArchive, ".txt", fill_text),
+            ("sqlite", SqliteDownloadArchive, ".sqlite", fill_sqlite),
+        ):
+            if name == "scan" and args.skip_scan:
+                continue
+            path = str(pathlib.Path(tmp, name + ext))
+            fill(path, args.lines)
+            results[name] = bench(cls(path), ids)
+
+    print("%d lookups against %d archived ids" % (len(ids), args.lines))
+    for name, (hits, elapsed) in results.items():
+        print(
+            "    %-8s %8.3fs  %10.1f lookups/s  (%d hits)"
+            % (name, elapsed, len(ids) / elapsed, hits)
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=500000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--skip-scan", action="store_true")
+
+    main(parser.parse_args())
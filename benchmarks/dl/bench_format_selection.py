@@ -0,0 +1,131 @@
+"""
+Format selection over a YouTube-like info dict with 60 formats.
+
+Times what process_video_result does for every video: build the selector
+for the format spec and run it over the formats. "parse" compiles the spec
+for every video like before, "cached" goes through build_format_selector,
+which only compiles each spec once per YoutubeDL.
+
+Usage::
+
+    python benchmarks/dl/bench_format_selection.py --videos 2000
+"""
+import argparse
+import pathlib
+import sys
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pycord.ext.dl import YoutubeDL  # noqa: E402
+
+SPECS = (
+    "bestaudio/best",
+    "bestvideo[height<=?720][ext=mp4]+bestaudio[ext=m4a]/best[height<=?720]",
+    "best[filesize<50M][protocol^=http]/worst",
+)
+
+
+def make_formats():
+    formats = []
+    # Audio only, DASH and HLS
+    for i, (ext, acodec, abr) in enumerate(
+        [
+            ("webm", "opus", 50),
+            ("webm", "opus", 70),
+            ("m4a", "mp4a.40.5", 48),
+            ("m4a", "mp4a.40.2", 128),
+            ("webm", "opus", 160),
+        ]
+    ):
+        for protocol in ("https", "m3u8_native"):
+            formats.append(
+                {
+                    "format_id": "%d-%s" % (600 + i, protocol),
+                    "url": "https://example.com/audio/%d" % i,
+                    "ext": ext,
+                    "acodec": acodec,
+                    "vcodec": "none",
+                    "abr": abr,
+                    "tbr": abr,
+                    "asr": 48000,
+                    "filesize": abr * 1000 * 30,
+                    "protocol": protocol,
+                }
+            )
+    # Video only, in two codecs and two protocols per resolution
+    for height in (144, 240, 360, 480, 720, 1080):
+        for ext, vcodec in (("mp4", "avc1.4d401e"), ("webm", "vp9")):
+            for protocol in ("https", "m3u8_native"):
+                vbr = height * 4
+                formats.append(
+                    {
+                        "format_id": "%d-%s-%s" % (height, vcodec, protocol),
+                        "url": "https://example.com/video/%d/%s" % (height, ext),
+                        "ext": ext,
+                        "vcodec": vcodec,
+                        "acodec": "none",
+                        "width": height * 16 // 9,
+                        "height": height,
+                        "fps": 30,
+                        "vbr": vbr,
+                        "tbr": vbr,
+                        "filesize": vbr * 1000 * 30,
+                        "protocol": protocol,
+                    }
+                )
+    # Muxed
+    while len(formats) < 60:
+        height = (144, 240, 360, 480, 720)[len(formats) % 5]
+        formats.append(
+            {
+                "format_id": "%d" % len(formats),
+                "url": "https://example.com/muxed/%d" % len(formats),
+                "ext": "mp4",
+                "vcodec": "avc1.42001E",
+                "acodec": "mp4a.40.2",
+                "width": height * 16 // 9,
+                "height": height,
+                "tbr": height * 5,
+                "protocol": ("https", "m3u8_native")[len(formats) % 2],
+            }
+        )
+    formats.sort(key=lambda f: (f.get("height") or 0, f.get("tbr") or 0))
+    return formats
+
+
+def bench(ydl, build, spec, formats, videos):
+    ctx = {"formats": formats, "incomplete_formats": False}
+    start = time.perf_counter()
+    for _ in range(videos):
+        selected = list(build(spec)(ctx))
+    elapsed = time.perf_counter() - start
+    return selected, elapsed
+
+
+def main(args):
+    formats = make_formats()
+    ydl = YoutubeDL({"quiet": True})
+    print("%d videos with %d formats" % (args.videos, len(formats)))
+    for spec in SPECS:
+        print(spec)
+        _, parse = bench(
+            ydl, ydl._compile_format_selector, spec, formats, args.videos
+        )
+        selected, cached = bench(
+            ydl, ydl.build_format_selector, spec, formats, args.videos
+        )
+        for name, elapsed in (("parse", parse), ("cached", cached)):
+            print(
+                "    %-8s %8.3fs  %8.1f us/video"
+                % (name, elapsed, elapsed / args.videos * 1e6)
+            )
+        print("    selected %s" % ", ".join(f["format_id"] for f in selected))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--videos", type=int, default=2000)
+
+    main(parser.parse_args())
@@ -0,0 +1,148 @@
+"""
+HttpFD throughput against a local HTTP server.
+
+Serves a --size MiB file from a separate process (with sendfile, so that the
+server isn't the bottleneck) and downloads it with HttpFD, over one
+connection and over --connections connections. "read" is the previous
+read loop for comparison: a new bytes object for every block, written
+straight through, with the block size doubling or halving every read.
+
+Usage::
+
+    python benchmarks/dl/bench_http_download.py --size 1024 --connections 4
+"""
+import argparse
+import http.server
+import multiprocessing
+import os
+import pathlib
+import re
+import socketserver
+import sys
+import tempfile
+import time
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from pycord.ext.dl import YoutubeDL  # noqa: E402
+from pycord.ext.dl.downloader.common import FileDownloader  # noqa: E402
+from pycord.ext.dl.downloader.http import HttpFD  # noqa: E402
+from pycord.ext.dl.utils import sanitized_Request  # noqa: E402
+
+MiB = 1024 * 1024
+
+
+class FileHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    path_to_serve = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        size = os.path.getsize(self.path_to_serve)
+        start, end = 0, size - 1
+        range_m = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        if range_m:
+            start = int(range_m.group(1))
+            if range_m.group(2):
+                end = min(int(range_m.group(2)), size - 1)
+            self.send_response(206)
+            self.send_header("Content-Range", "bytes %d-%d/%d" % (start, end, size))
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        with open(self.path_to_serve, "rb") as f:
+            offset, count = start, end - start + 1
+            while count:
+                sent = os.sendfile(self.wfile.fileno(), f.fileno(), offset, count)
+                if not sent:
+                    break
+                offset += sent
+                count -= sent
+
+
+class Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+def serve(path, port_queue):
+    FileHandler.path_to_serve = path
+    server = Server(("127.0.0.1", 0), FileHandler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def make_file(path, size):
+    block = os.urandom(4 * MiB)
+    with open(path, "wb") as f:
+        for _ in range(size // len(block)):
+            f.write(block)
+        f.write(block[: size % len(block)])
+
+
+def read_loop(ydl, url, path):
+    request = sanitized_Request(url, None, {"Youtubedl-no-compression": "1"})
+    data = ydl.urlopen(request)
+    block_size = 1024
+    with open(path, "wb") as stream:
+        before = time.time()
+        while True:
+            data_block = data.read(block_size)
+            if not data_block:
+                break
+            stream.write(data_block)
+            now = time.time()
+            block_size = FileDownloader.best_block_size(now - before, len(data_block))
+            before = now
+
+
+def http_fd(connections):
+    def download(ydl, url, path):
+        params = dict(ydl.params, http_connections=connections)
+        assert HttpFD(ydl, params).download(path, {"url": url})
+
+    return download
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.bin")
+        make_file(source, args.size * MiB)
+
+        port_queue = multiprocessing.Queue()
+        server = multiprocessing.Process(
+            target=serve, args=(source, port_queue), daemon=True
+        )
+        server.start()
+        url = "http://127.0.0.1:%d/source.bin" % port_queue.get()
+
+        ydl = YoutubeDL({"quiet": True, "noprogress": True, "updatetime": False})
+        print("%d MiB from %s" % (args.size, url))
+        for name, download in (
+            ("read", read_loop),
+            ("readinto", http_fd(1)),
+            ("%d conns" % args.connections, http_fd(args.connections)),
+        ):
+            path = os.path.join(tmp, "out.bin")
+            start = time.perf_counter()
+            download(ydl, url, path)
+            elapsed = time.perf_counter() - start
+            assert os.path.getsize(path) == args.size * MiB
+            os.remove(path)
+            print(
+                "    %-10s %8.3fs  %8.1f MiB/s"
+                % (name, elapsed, args.size / elapsed)
+            )
+
+        server.terminate()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1024, help="MiB")
+    parser.add_argument("--connections", type=int, default=4)
+
+    main(parser.parse_args())
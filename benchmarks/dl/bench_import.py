@@ -0,0 +1,56 @@
+"""
+Startup cost of importing pycord.ext.dl, with and without lazy extractors.
+
+Each run imports the package in a fresh interpreter and reports the import
+time and the peak RSS of the process. The eager run blocks the generated
+lazy_extractors module so the extractor package falls back to importing
+every extractor module.
+
+Usage::
+
+    python benchmarks/dl/bench_import.py --runs 5
+"""
+import argparse
+import json
+import pathlib
+import statistics
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+SNIPPET = """
+import resource, sys, time, json
+if {eager!r}:
+    sys.modules["pycord.ext.dl.extractor.lazy_extractors"] = None
+start = time.perf_counter()
+import pycord.ext.dl
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+modules = sum(1 for m in sys.modules if m.startswith("pycord.ext.dl.extractor."))
+print(json.dumps({{"seconds": elapsed, "rss_kb": rss, "modules": modules}}))
+"""
+
+
+def run(eager: bool) -> dict:
+    out = subprocess.check_output(
+        [sys.executable, "-c", SNIPPET.format(eager=eager)], cwd=str(ROOT)
+    )
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def main(args):
+    for name, eager in (("eager", True), ("lazy", False)):
+        results = [run(eager) for _ in range(args.runs)]
+
+        print(f"{name}:")
+        print(f"    import s       {statistics.median(r['seconds'] for r in results):.3f}")
+        print(f"    peak RSS MiB   {statistics.median(r['rss_kb'] for r in results) / 1024:.1f}")
+        print(f"    extractor mods {results[0]['modules']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+
+    main(parser.parse_args())
@@ -0,0 +1,197 @@
+"""
+Generate pycord/ext/dl/extractor/lazy_extractors.py.
+
+The lazy module holds a small stand-in class per extractor with only its
+_VALID_URL, IE_NAME and suitable() override. The real extractor module is
+imported the first time the stand-in is instantiated, i.e. the first time
+it matches a URL.
+
+Rerun this whenever extractors are added, removed or their _VALID_URL or
+suitable() change::
+
+    python devscripts/make_lazy_extractors.py
+"""
+from __future__ import print_function, unicode_literals
+
+import dis
+import io
+import os
+import sys
+from inspect import getsource
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pycord.ext.dl import compat, utils  # noqa: E402
+from pycord.ext.dl.extractor import extractors  # noqa: E402
+from pycord.ext.dl.extractor.common import (  # noqa: E402
+    InfoExtractor,
+    SearchInfoExtractor,
+)
+from pycord.ext.dl.urlindex import parse_ie_hosts  # noqa: E402
+
+LAZY_EXTRACTORS = os.path.join(
+    ROOT, "pycord", "ext", "dl", "extractor", "lazy_extractors.py"
+)
+TEMPLATE = os.path.join(ROOT, "devscripts", "lazy_load_template.py")
+
+HEADER = "# This file is generated by devscripts/make_lazy_extractors.py, do not edit.\n"
+
+IE_TEMPLATE = """
+class {name}({bases}):
+    _VALID_URL = {valid_url!r}
+    _module = {module!r}
+"""
+
+IE_NAME_TEMPLATE = """    IE_NAME = {ie_name!r}
+"""
+
+MAKE_VALID_TEMPLATE = """
+    @classmethod
+    def _make_valid_url(cls):
+        return {valid_url!r}
+"""
+
+
+def get_all_classes():
+    # Same order as the eager fallback in extractor/__init__.py
+    classes = [
+        klass
+        for name, klass in vars(extractors).items()
+        if name.endswith("IE") and name != "GenericIE"
+    ]
+    classes.append(extractors.GenericIE)
+    return classes
+
+
+def get_base_name(base):
+    if base is InfoExtractor:
+        return "LazyLoadExtractor"
+    elif base is SearchInfoExtractor:
+        return "LazyLoadSearchExtractor"
+    else:
+        return base.__name__
+
+
+def get_suitable_imports(ie, defined):
+    """Return the utils/compat names a suitable() override needs, e.g. parse_qs."""
+    module = sys.modules[ie.suitable.__func__.__module__]
+    imports = set()
+
+    for instruction in dis.get_instructions(ie.suitable.__func__):
+        if instruction.opname != "LOAD_GLOBAL":
+            continue
+
+        name = instruction.argval
+        if name in defined or name == "re" or not hasattr(module, name):
+            continue
+
+        value = getattr(module, name)
+        if getattr(utils, name, None) is value:
+            imports.add(("utils", name))
+        elif getattr(compat, name, None) is value:
+            imports.add(("compat", name))
+        else:
+            raise RuntimeError(
+                "%s.suitable uses %s, which can not be lazily imported"
+                % (ie.__name__, name)
+            )
+
+    return imports
+
+
+def build_lazy_ie(ie):
+    s = IE_TEMPLATE.format(
+        name=ie.__name__,
+        bases=", ".join(map(get_base_name, ie.__bases__)),
+        valid_url=getattr(ie, "_VALID_URL", None),
+        module=ie.__module__,
+    )
+    ie_name = ie.__dict__.get("IE_NAME")
+    if isinstance(ie_name, str):
+        s += IE_NAME_TEMPLATE.format(ie_name=ie_name)
+    if ie.suitable.__func__ is not InfoExtractor.suitable.__func__:
+        s += "\n" + getsource(ie.suitable)
+    if hasattr(ie, "_make_valid_url"):
+        # search extractors
+        s += MAKE_VALID_TEMPLATE.format(valid_url=ie._make_valid_url())
+    return s
+
+
+def build_hosts(all_classes):
+    """
+    The host keys of every extractor, so that urlindex doesn't have to parse
+    every _VALID_URL the first time a process looks up a URL.
+    """
+    lines = []
+    for ie in all_classes:
+        hosts = parse_ie_hosts(ie)
+        if hosts is not None:
+            hosts = tuple(sorted(hosts))
+        lines.append("    %r: (%r, %r),\n" % (ie.__name__, ie.__module__, hosts))
+    return "\n_HOSTS = {\n%s}\n" % "".join(lines)
+
+
+def order_classes(all_classes):
+    """Order the classes so every base class is defined before its subclasses."""
+    skip = (object, InfoExtractor, SearchInfoExtractor)
+    ordered = []
+    seen = set()
+
+    def visit(klass):
+        if klass in seen or klass in skip:
+            return
+        seen.add(klass)
+        for base in klass.__bases__:
+            visit(base)
+        ordered.append(klass)
+
+    for klass in all_classes:
+        visit(klass)
+
+    return ordered
+
+
+def main():
+    with io.open(TEMPLATE, encoding="utf-8") as f:
+        template = f.read()
+
+    all_classes = get_all_classes()
+    ordered = order_classes(all_classes)
+    defined = {klass.__name__ for klass in ordered}
+
+    imports = set()
+    for ie in ordered:
+        imports |= get_suitable_imports(ie, defined)
+
+    import_lines = "".join(
+        "from ..%s import %s\n" % (module, name) for module, name in sorted(imports)
+    )
+
+    contents = [
+        # The template doesn't use re itself, the suitable() methods do
+        HEADER
+        + template.replace(
+            "\n\n\nclass LazyLoadExtractor",
+            "\n\nimport re\n" + import_lines + "\n\nclass LazyLoadExtractor",
+            1,
+        )
+        + "\n"
+        + getsource(InfoExtractor.suitable),
+        "\nclass LazyLoadSearchExtractor(LazyLoadExtractor):\n    pass\n",
+    ]
+    contents.extend(build_lazy_ie(ie) for ie in ordered)
+    contents.append(
+        "\n_ALL_CLASSES = [\n%s]\n"
+        % "".join("    %s,\n" % klass.__name__ for klass in all_classes)
+    )
+    contents.append(build_hosts(all_classes))
+
+    with io.open(LAZY_EXTRACTORS, "w", encoding="utf-8") as f:
+        f.write("".join(contents))
+
+    print("Wrote %d lazy extractors to %s" % (len(all_classes), LAZY_EXTRACTORS))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
 import asyncio
-import functools
 import itertools
 import math
 import random
@@ -44,7 +43,8 @@ class YTDLSource(discord.PCMVolumeTransformer):
         "options": "-vn",
     }
 
-    ytdl = dl.YoutubeDL(YTDL_OPTIONS)
+    # Extraction runs on a worker pool so it never blocks the event loop.
+    ytdl = dl.AsyncYoutubeDL(YTDL_OPTIONS, timeout=60)
 
     def __init__(
         self,
@@ -79,15 +79,8 @@ class YTDLSource(discord.PCMVolumeTransformer):
         return "**{0.title}** by **{0.uploader}**".format(self)
 
     @classmethod
-    async def create_source(
-        cls, ctx: commands.Context, search: str, *, loop: asyncio.BaseEventLoop = None
-    ):
-        loop = loop or asyncio.get_event_loop()
-
-        partial = functools.partial(
-            cls.ytdl.extract_info, search, download=False, process=False
-        )
-        data = await loop.run_in_executor(None, partial)
+    async def create_source(cls, ctx: commands.Context, search: str):
+        data = await cls.ytdl.extract_info_async(search, download=False, process=False)
 
         if data is None:
             raise YTDLError("Couldn't find anything that matches `{}`".format(search))
@@ -107,8 +100,7 @@ class YTDLSource(discord.PCMVolumeTransformer):
                 )
 
         webpage_url = process_info["webpage_url"]
-        partial = functools.partial(cls.ytdl.extract_info, webpage_url, download=False)
-        processed_info = await loop.run_in_executor(None, partial)
+        processed_info = await cls.ytdl.extract_info_async(webpage_url, download=False)
 
         if processed_info is None:
             raise YTDLError("Couldn't fetch `{}`".format(webpage_url))
@@ -505,8 +497,8 @@ class Music(commands.Cog):
 
         async with ctx.typing():
             try:
-                source = await YTDLSource.create_source(ctx, search, loop=self.bot.loop)
-            except YTDLError as e:
+                source = await YTDLSource.create_source(ctx, search)
+            except (YTDLError, dl.utils.DownloadError, asyncio.TimeoutError) as e:
                 await ctx.send(
                     "An error occurred while processing this request: {}".format(str(e))
                 )
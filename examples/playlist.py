@@ -15,7 +15,6 @@ e.g You might like to implement a vote before skipping the song or only allow ad
 Music bots require lots of work, and tuning. Goodluck.
 If you find any bugs feel free to ping me on discord. @Eviee#0666
 """
-import asyncio
 import datetime
 import discord
 import humanize
@@ -48,31 +47,21 @@ class MusicController:
         self.guild_id = guild_id
         self.channel = None
 
-        self.next = asyncio.Event()
-        self.queue = asyncio.Queue()
+        # The queue resolves upcoming songs in the background and
+        # starts the next one as soon as the current song ends.
+        self.player = self.bot.audio.get_player(self.guild_id)
+        self.queue = audio.Queue(self.player, prefetch=3)
 
         self.volume = 40
         self.now_playing = None
 
-        self.bot.loop.create_task(self.controller_loop())
+        self.bot.loop.create_task(self.player.set_volume(self.volume))
 
-    async def controller_loop(self):
-        await self.bot.wait_until_ready()
-
-        player = self.bot.audio.get_player(self.guild_id)
-        await player.set_volume(self.volume)
-
-        while True:
-            if self.now_playing:
-                await self.now_playing.delete()
+    async def announce(self, track):
+        if self.now_playing:
+            await self.now_playing.delete()
 
-            self.next.clear()
-
-            song = await self.queue.get()
-            await player.play(song)
-            self.now_playing = await self.channel.send(f"Now playing: `{song}`")
-
-            await self.next.wait()
+        self.now_playing = await self.channel.send(f"Now playing: `{track}`")
 
 
 class Music(commands.Cog):
@@ -104,9 +93,9 @@ class Music(commands.Cog):
 
     async def on_event_hook(self, event):
         """Node hook callback."""
-        if isinstance(event, (audio.TrackEnd, audio.TrackException)):
+        if isinstance(event, audio.TrackStart):
             controller = self.get_controller(event.player)
-            controller.next.set()
+            await controller.announce(event.player.current)
 
     def get_controller(self, value: Union[commands.Context, audio.Player]):
         if isinstance(value, commands.Context):
@@ -167,20 +156,20 @@ class Music(commands.Cog):
         if not RURL.match(query):
             query = f"ytsearch:{query}"
 
-        tracks = await self.bot.audio.get_tracks(f"{query}")
-
-        if not tracks:
-            return await ctx.send("Could not find any songs with that query.")
-
         player = self.bot.audio.get_player(ctx.guild.id)
         if not player.is_connected:
             await ctx.invoke(self.connect_)
 
-        track = tracks[0]
-
         controller = self.get_controller(ctx)
-        await controller.queue.put(track)
-        await ctx.send(f"Added {str(track)} to the queue.", delete_after=15)
+        controller.queue.add(query)
+
+        if not player.is_playing:
+            track = await controller.queue.play_next()
+
+            if not track:
+                return await ctx.send("Could not find any songs with that query.")
+        else:
+            await ctx.send(f"Added `{query}` to the queue.", delete_after=15)
 
     @commands.command()
     async def pause(self, ctx):
@@ -248,12 +237,12 @@ class Music(commands.Cog):
         player = self.bot.audio.get_player(ctx.guild.id)
         controller = self.get_controller(ctx)
 
-        if not player.current or not controller.queue._queue:
+        if not player.current or not controller.queue:
             return await ctx.send(
                 "There are no songs currently in the queue.", delete_after=20
             )
 
-        upcoming = list(itertools.islice(controller.queue._queue, 0, 5))
+        upcoming = list(itertools.islice(controller.queue, 0, 5))
 
         fmt = "\n".join(f"**`{str(song)}`**" for song in upcoming)
         embed = discord.Embed(title=f"Upcoming - Next {len(upcoming)}", description=fmt)
@@ -266,11 +255,12 @@ class Music(commands.Cog):
         player = self.bot.audio.get_player(ctx.guild.id)
 
         try:
-            del self.controllers[ctx.guild.id]
+            controller = self.controllers.pop(ctx.guild.id)
         except KeyError:
             await player.disconnect()
             return await ctx.send("There was no controller to stop.")
 
+        controller.queue.clear()
         await player.disconnect()
         await ctx.send("Disconnected player and killed controller.", delete_after=20)
 
@@ -13,5 +13,6 @@ from .eqs import *
 from .events import *
 from .player import *
 from .node import Node
+from .queue import Queue
 from .meta import audioMixin
 from .websocket import WebSocket
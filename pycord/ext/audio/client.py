@@ -26,11 +26,11 @@ import logging
 from discord.ext import commands
 from functools import partial
 from json import dumps
-from typing import Optional, Union
+from typing import Dict, Iterable, Optional, Union
 
 from .errors import *
 from .player import Player
-from .node import Node
+from .node import Node, _bulk
 
 
 __log__ = logging.getLogger(__name__)
@@ -139,7 +139,11 @@ class Client:
             self.loop.create_task(cog.on_audio_error(listener, fut.exception()))
 
     async def get_tracks(
-        self, query: str, *, retry_on_failure: bool = True
+        self,
+        query: str,
+        *,
+        retry_on_failure: bool = True,
+        timeout: Optional[float] = None,
     ) -> Optional[list]:
         """|coro|
 
@@ -154,6 +158,8 @@ class Client:
             Bool indicating whether the Node should retry upto a maximum of 5 attempts on load failure.
             If this is set to True, the Node will attempt to retrieve tracks with an exponential backoff delay
             between retries. Defaults to True.
+        timeout: Optional[float]
+            The total timeout in seconds for each attempt. Defaults to the node's ``rest_timeout``.
 
         Returns
         ---------
@@ -171,9 +177,11 @@ class Client:
         if node is None:
             raise ZeroConnectedNodes
 
-        return await node.get_tracks(query, retry_on_failure=retry_on_failure)
+        return await node.get_tracks(
+            query, retry_on_failure=retry_on_failure, timeout=timeout
+        )
 
-    async def build_track(self, identifier: str):
+    async def build_track(self, identifier: str, *, timeout: Optional[float] = None):
         """|coro|
 
         Build a track object with a valid track identifier.
@@ -182,6 +190,8 @@ class Client:
         ------------
         identifier: str
             The tracks unique Base64 encoded identifier. This is usually retrieved from various lavalink events.
+        timeout: Optional[float]
+            The total timeout in seconds for the request. Defaults to the node's ``rest_timeout``.
 
         Returns
         ---------
@@ -200,7 +210,7 @@ class Client:
         if node is None:
             raise ZeroConnectedNodes
 
-        return await node.build_track(identifier)
+        return await node.build_track(identifier, timeout=timeout)
 
     def _get_players(self) -> dict:
         players = []
@@ -210,6 +220,54 @@ class Client:
 
         return {player.guild_id: player for player in players}
 
+    async def bulk(
+        self,
+        method: str,
+        *args,
+        guild_ids: Iterable[int] = None,
+        limit: int = 25,
+        **kwargs,
+    ) -> Dict[int, Optional[Exception]]:
+        """|coro|
+
+        Call a :class:`audio.player.Player` method on many players across all Nodes concurrently.
+
+        Parameters
+        ------------
+        method: str
+            The player method to call. One of ``set_pause``, ``stop``, ``destroy`` or ``set_volume``.
+            ``stop`` doesn't make the players' queues play their next track.
+        \*args:
+            The positional arguments passed to the method. E.g ``50`` for ``set_volume``.
+        guild_ids: Optional[Iterable[int]]
+            The guild IDs of the players to act on. Guild IDs without a player are ignored.
+            If None, every player is used.
+        limit: int
+            The maximum amount of players acted on at once, across all Nodes. Defaults to 25.
+        \*\*kwargs:
+            The keyword arguments passed to the method. E.g ``force=True`` for ``destroy``.
+
+        Returns
+        ---------
+        Dict[int, Optional[Exception]]
+            A mapping of guild ID to the exception raised for that player, or None if it succeeded.
+
+        Raises
+        --------
+        audioException
+            The method provided is not supported.
+        """
+        players = self.players
+
+        if guild_ids is not None:
+            players = {
+                guild_id: players[guild_id]
+                for guild_id in guild_ids
+                if guild_id in players
+            }
+
+        return await _bulk(players, method, args, kwargs, limit)
+
     def get_node(self, identifier: str) -> Optional[Node]:
         """Retrieve a Node with the given identifier.
 
@@ -396,6 +454,10 @@ class Client:
         shard_id: int = None,
         secure: bool = False,
         heartbeat: float = None,
+        pool_size: int = 10,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        rest_timeout: Optional[float] = 10.0,
     ) -> Node:
         """|coro|
 
@@ -421,6 +483,14 @@ class Client:
             Whether the websocket should be started with the secure wss protocol.
         heartbeat: Optional[float]
             Send ping message every heartbeat seconds and wait pong response, if pong response is not received then close connection.
+        pool_size: int
+            The maximum amount of simultaneous REST connections to the node. Defaults to 10.
+        keepalive_timeout: float
+            How long in seconds idle REST connections are kept open for reuse. Defaults to 30.
+        dns_cache_ttl: Optional[int]
+            How long in seconds resolved DNS entries for the node are cached. None disables the cache. Defaults to 300.
+        rest_timeout: Optional[float]
+            The default total timeout in seconds for REST requests. None means no timeout. Defaults to 10.
 
         Returns
         ---------
@@ -455,6 +525,10 @@ class Client:
             secure=secure,
             heartbeat=heartbeat,
             dumps=self._dumps,
+            pool_size=pool_size,
+            keepalive_timeout=keepalive_timeout,
+            dns_cache_ttl=dns_cache_ttl,
+            rest_timeout=rest_timeout,
         )
 
         await node.connect(bot=self.bot)
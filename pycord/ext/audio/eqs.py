@@ -20,12 +20,19 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+
 import collections
 
 
 class Equalizer:
     """Class representing a usable equalizer.
 
+    Equalizers are immutable and hashable. Two equalizers compare equal when their band gains are equal,
+    regardless of their name.
+
+    .. versionchanged:: 1.4.0
+        Equalizers are now immutable, and the preset classmethods return shared instances.
+
     Parameters
     ------------
     levels: List[Tuple[int, float]]
@@ -36,16 +43,28 @@ class Equalizer:
     Attributes
     ------------
     eq: list
-        A list of {'band': int, 'gain': float}
-    raw: list
-        A list of tuple pairs containing a band int and gain float.
+        A list of {'band': int, 'gain': float}, as sent to the server. Built on every access, so
+        changing it doesn't change the Equalizer.
+    raw: tuple
+        A tuple of tuple pairs containing a band int and gain float.
     """
 
+    __slots__ = ("_gains", "_raw", "_name")
+
+    _presets = {}
+
     def __init__(self, *, levels: list, name: str = "CustomEqualizer"):
-        self.eq = self._factory(levels)
-        self.raw = levels
+        eq = self._factory(levels)
+
+        object.__setattr__(self, "_gains", tuple(band["gain"] for band in eq))
+        object.__setattr__(self, "_raw", tuple(tuple(level) for level in levels))
+        object.__setattr__(self, "_name", name)
 
-        self._name = name
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} objects are immutable")
 
     def __str__(self):
         return self._name
@@ -53,11 +72,28 @@ class Equalizer:
     def __repr__(self):
         return f"<audio.eqs.Equalizer: {self._name}, Raw: {self.eq}>"
 
+    def __eq__(self, other):
+        if not isinstance(other, Equalizer):
+            return NotImplemented
+
+        return self._gains == other._gains
+
+    def __hash__(self):
+        return hash(self._gains)
+
     @property
     def name(self):
         """The Equalizers friendly name."""
         return self._name
 
+    @property
+    def eq(self):
+        return [{"band": band, "gain": gain} for band, gain in enumerate(self._gains)]
+
+    @property
+    def raw(self):
+        return self._raw
+
     @staticmethod
     def _factory(levels: list):
         _dict = collections.defaultdict(int)
@@ -67,6 +103,14 @@ class Equalizer:
 
         return _dict
 
+    @classmethod
+    def _preset(cls, name: str, levels: list):
+        try:
+            return cls._presets[cls, name]
+        except KeyError:
+            preset = cls._presets[cls, name] = cls(levels=levels, name=name)
+            return preset
+
     @classmethod
     def build(cls, *, levels: list, name: str = "CustomEqualizer"):
         """Build a custom Equalizer class with the provided levels.
@@ -104,7 +148,7 @@ class Equalizer:
             (14, 0.0),
         ]
 
-        return cls(levels=levels, name="Flat")
+        return cls._preset("Flat", levels)
 
     @classmethod
     def boost(cls):
@@ -131,7 +175,7 @@ class Equalizer:
             (14, 0.05),
         ]
 
-        return cls(levels=levels, name="Boost")
+        return cls._preset("Boost", levels)
 
     @classmethod
     def metal(cls):
@@ -157,7 +201,7 @@ class Equalizer:
             (14, 0.0),
         ]
 
-        return cls(levels=levels, name="Metal")
+        return cls._preset("Metal", levels)
 
     @classmethod
     def piano(cls):
@@ -183,4 +227,4 @@ class Equalizer:
             (13, -0.025),
         ]
 
-        return cls(levels=levels, name="Piano")
+        return cls._preset("Piano", levels)
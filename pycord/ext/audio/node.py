@@ -20,12 +20,14 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+import aiohttp
 import asyncio
+import contextlib
 import inspect
 import json
 import logging
 from discord.ext import commands
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Union
 from urllib.parse import quote
 
 from .backoff import ExponentialBackoff
@@ -36,6 +38,37 @@ from .websocket import WebSocket
 
 __log__ = logging.getLogger(__name__)
 
+BULK_METHODS = frozenset({"set_pause", "stop", "destroy", "set_volume"})
+
+
+async def _bulk(
+    players: Dict[int, Player], method: str, args, kwargs, limit: int
+) -> Dict[int, Optional[Exception]]:
+    if method not in BULK_METHODS:
+        raise audioException(
+            f"Unsupported bulk method:: {method}. Expected one of {sorted(BULK_METHODS)}"
+        )
+
+    if method == "stop":
+        # Stopping many players at once shouldn't start their next tracks
+        kwargs = dict(kwargs, advance=False)
+
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def run(player: Player) -> None:
+        async with semaphore:
+            await getattr(player, method)(*args, **kwargs)
+
+    guild_ids = list(players.keys())
+    results = await asyncio.gather(
+        *(run(player) for player in players.values()), return_exceptions=True
+    )
+
+    return {
+        guild_id: result if isinstance(result, Exception) else None
+        for guild_id, result in zip(guild_ids, results)
+    }
+
 
 class Node:
     """A audio Node instance.
@@ -55,6 +88,11 @@ class Node:
         The region provided to the node on connection.
     identifier: str
         The unique indentifier associated with the node.
+    rest_session: aiohttp.ClientSession
+        The session used for this node's REST requests. Each node owns its own connection pool,
+        so a slow node can not starve the REST traffic of other nodes.
+    rest_timeout: Optional[float]
+        The default total timeout in seconds for REST requests. None means no timeout.
     """
 
     def __init__(
@@ -74,6 +112,10 @@ class Node:
         secure: bool = False,
         heartbeat: float = None,
         dumps: Callable[[Dict[str, Any]], Union[str, bytes]] = json.dumps,
+        pool_size: int = 10,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: Optional[int] = 300,
+        rest_timeout: Optional[float] = 10.0,
     ):
 
         self.host = host
@@ -94,6 +136,19 @@ class Node:
         self.players = {}
 
         self.session = session
+        self.rest_timeout = rest_timeout
+        self.rest_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=pool_size,
+                keepalive_timeout=keepalive_timeout,
+                use_dns_cache=dns_cache_ttl is not None,
+                ttl_dns_cache=dns_cache_ttl,
+            ),
+            timeout=aiohttp.ClientTimeout(total=rest_timeout),
+        )
+        self._rest_requests = 0
+        self._rest_timeouts = 0
+        self._rest_active = 0
         self._websocket = None
         self._client = client
 
@@ -126,6 +181,45 @@ class Node:
 
         return self.stats.penalty.total
 
+    @property
+    def pool_stats(self) -> Dict[str, int]:
+        """Returns utilisation stats for this node's REST connection pool.
+
+        Returns
+        ---------
+        Dict[str, int]
+            ``limit``: The maximum amount of connections in the pool.
+            ``limit_per_host``: The maximum amount of connections to the node's host.
+            ``active``: REST requests currently in flight, waiting for a connection or a response.
+            ``requests``: The total amount of REST requests made.
+            ``timeouts``: The total amount of REST requests which timed out.
+        """
+        connector = self.rest_session.connector
+
+        return {
+            "limit": connector.limit if connector else 0,
+            "limit_per_host": connector.limit_per_host if connector else 0,
+            "active": self._rest_active,
+            "requests": self._rest_requests,
+            "timeouts": self._rest_timeouts,
+        }
+
+    @contextlib.asynccontextmanager
+    async def _rest_get(self, url: str, *, timeout: Optional[float] = None, **kwargs):
+        self._rest_requests += 1
+
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        self._rest_active += 1
+        try:
+            async with self.rest_session.get(
+                url, headers={"Authorization": self.password}, **kwargs
+            ) as resp:
+                yield resp
+        finally:
+            self._rest_active -= 1
+
     async def connect(self, bot: Union[commands.Bot, commands.AutoShardedBot]) -> None:
         self._websocket = WebSocket(
             node=self,
@@ -142,7 +236,11 @@ class Node:
         __log__.info(f"NODE | {self.identifier} connected:: {self.__repr__()}")
 
     async def get_tracks(
-        self, query: str, *, retry_on_failure: bool = True
+        self,
+        query: str,
+        *,
+        retry_on_failure: bool = True,
+        timeout: Optional[float] = None,
     ) -> Union[list, TrackPlaylist, None]:
         """|coro|
 
@@ -157,6 +255,9 @@ class Node:
             Bool indicating whether the Node should retry upto a maximum of 5 attempts on load failure.
             If this is set to True, the Node will attempt to retrieve tracks with an exponential backoff delay
             between retries. Defaults to True.
+        timeout: Optional[float]
+            The total timeout in seconds for each attempt. Timed out attempts count as load failures.
+            Defaults to :attr:`rest_timeout`.
 
         Returns
         ---------
@@ -167,50 +268,71 @@ class Node:
         backoff = ExponentialBackoff(base=1)
 
         for attempt in range(5):
-            async with self.session.get(
-                f"{self.rest_uri}/loadtracks?identifier={quote(query)}",
-                headers={"Authorization": self.password},
-            ) as resp:
-
-                if not resp.status == 200 and retry_on_failure:
-                    retry = backoff.delay()
-
+            try:
+                async with self._rest_get(
+                    f"{self.rest_uri}/loadtracks?identifier={quote(query)}",
+                    timeout=timeout,
+                ) as resp:
+
+                    if not resp.status == 200 and retry_on_failure:
+                        retry = backoff.delay()
+
+                        __log__.info(
+                            f"REST | Status code ({resp.status}) while retrieving tracks. "
+                            f"Attempt {attempt} of 5, retrying in {retry} seconds."
+                        )
+
+                        await asyncio.sleep(retry)
+                        continue
+
+                    elif not resp.status == 200 and not retry_on_failure:
+                        __log__.info(
+                            f"REST | Status code ({resp.status}) while retrieving tracks. Not retrying."
+                        )
+                        return
+
+                    data = await resp.json()
+            except asyncio.TimeoutError:
+                self._rest_timeouts += 1
+
+                if not retry_on_failure:
                     __log__.info(
-                        f"REST | Status code ({resp.status}) while retrieving tracks. "
-                        f"Attempt {attempt} of 5, retrying in {retry} seconds."
+                        "REST | Timed out while retrieving tracks. Not retrying."
                     )
+                    return
 
-                    await asyncio.sleep(retry)
-                    continue
+                retry = backoff.delay()
 
-                elif not resp.status == 200 and not retry_on_failure:
-                    __log__.info(
-                        f"REST | Status code ({resp.status}) while retrieving tracks. Not retrying."
-                    )
-                    return
+                __log__.info(
+                    f"REST | Timed out while retrieving tracks. "
+                    f"Attempt {attempt} of 5, retrying in {retry} seconds."
+                )
 
-                data = await resp.json()
+                await asyncio.sleep(retry)
+                continue
 
-                if not data["tracks"]:
-                    __log__.info(f"REST | No tracks with query <{query}> found.")
-                    return None
+            if not data["tracks"]:
+                __log__.info(f"REST | No tracks with query <{query}> found.")
+                return None
 
-                if data["playlistInfo"]:
-                    return TrackPlaylist(data=data)
+            if data["playlistInfo"]:
+                return TrackPlaylist(data=data)
 
-                tracks = []
-                for track in data["tracks"]:
-                    tracks.append(Track(id_=track["track"], info=track["info"]))
+            tracks = []
+            for track in data["tracks"]:
+                tracks.append(Track(id_=track["track"], info=track["info"]))
 
-                __log__.debug(
-                    f"REST | Found <{len(tracks)}> tracks with query <{query}> ({self.__repr__()})"
-                )
+            __log__.debug(
+                f"REST | Found <{len(tracks)}> tracks with query <{query}> ({self.__repr__()})"
+            )
 
-                return tracks
+            return tracks
 
         __log__.warning("REST | Failure to load tracks after 5 attempts.")
 
-    async def build_track(self, identifier: str) -> Track:
+    async def build_track(
+        self, identifier: str, *, timeout: Optional[float] = None
+    ) -> Track:
         """|coro|
 
         Build a track object with a valid track identifier.
@@ -219,6 +341,8 @@ class Node:
         ------------
         identifier: str
             The tracks unique Base64 encoded identifier. This is usually retrieved from various lavalink events.
+        timeout: Optional[float]
+            The total timeout in seconds for the request. Defaults to :attr:`rest_timeout`.
 
         Returns
         ---------
@@ -230,21 +354,27 @@ class Node:
         BuildTrackError
             Decoding and building the track failed.
         """
-        async with self.session.get(
-            f"{self.rest_uri}/decodetrack?",
-            headers={"Authorization": self.password},
-            params={"track": identifier},
-        ) as resp:
-            data = await resp.json()
-
-            if not resp.status == 200:
-                raise BuildTrackError(
-                    f'Failed to build track. Status: {data["status"]}, Error: {data["error"]}.'
-                    f"Check the identifier is correct and try again."
-                )
+        try:
+            async with self._rest_get(
+                f"{self.rest_uri}/decodetrack?",
+                params={"track": identifier},
+                timeout=timeout,
+            ) as resp:
+                data = await resp.json()
+        except asyncio.TimeoutError as error:
+            self._rest_timeouts += 1
+            raise BuildTrackError(
+                "Failed to build track. The request timed out."
+            ) from error
 
-            track = Track(id_=identifier, info=data)
-            return track
+        if not resp.status == 200:
+            raise BuildTrackError(
+                f'Failed to build track. Status: {data["status"]}, Error: {data["error"]}.'
+                f"Check the identifier is correct and try again."
+            )
+
+        track = Track(id_=identifier, info=data)
+        return track
 
     def get_player(self, guild_id: int) -> Optional[Player]:
         """Retrieve a player object associated with the Node.
@@ -289,18 +419,74 @@ class Node:
 
         self.hook = func
 
-    async def destroy(self, *, force: bool = False) -> None:
-        """Destroy the node and all it's players."""
-        players = self.players.copy()
+    async def bulk(
+        self,
+        method: str,
+        *args,
+        guild_ids: Iterable[int] = None,
+        limit: int = 25,
+        **kwargs,
+    ) -> Dict[int, Optional[Exception]]:
+        """|coro|
+
+        Call a :class:`audio.player.Player` method on many of this Node's players concurrently.
+
+        Parameters
+        ------------
+        method: str
+            The player method to call. One of ``set_pause``, ``stop``, ``destroy`` or ``set_volume``.
+            ``stop`` doesn't make the players' queues play their next track.
+        \*args:
+            The positional arguments passed to the method. E.g ``True`` for ``set_pause``.
+        guild_ids: Optional[Iterable[int]]
+            The guild IDs of the players to act on. Guild IDs without a player on this Node are ignored.
+            If None, every player on this Node is used.
+        limit: int
+            The maximum amount of players acted on at once. Defaults to 25.
+        \*\*kwargs:
+            The keyword arguments passed to the method. E.g ``force=True`` for ``destroy``.
+
+        Returns
+        ---------
+        Dict[int, Optional[Exception]]
+            A mapping of guild ID to the exception raised for that player, or None if it succeeded.
 
-        for player in players.values():
-            await player.destroy(force=force)
+        Raises
+        --------
+        audioException
+            The method provided is not supported.
+        """
+        if guild_ids is None:
+            players = self.players.copy()
+        else:
+            players = {
+                guild_id: self.players[guild_id]
+                for guild_id in guild_ids
+                if guild_id in self.players
+            }
+
+        return await _bulk(players, method, args, kwargs, limit)
+
+    async def destroy(self, *, force: bool = False, limit: int = 25) -> None:
+        """Destroy the node and all it's players.
+
+        Players are destroyed concurrently, with at most ``limit`` at once.
+        """
+        results = await self.bulk("destroy", force=force, limit=limit)
+
+        for guild_id, error in results.items():
+            if error is not None:
+                __log__.warning(
+                    f"NODE | Failed to destroy player:: {guild_id} ({error!r})"
+                )
 
         try:
             self._websocket._task.cancel()
         except Exception:
             pass
 
+        await self.rest_session.close()
+
         del self._client.nodes[self.identifier]
 
     async def _send(self, **data) -> None:
@@ -20,6 +20,8 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+
+import asyncio
 import logging
 import time
 import re
@@ -31,7 +33,6 @@ from .errors import *
 from .eqs import *
 from .events import *
 
-
 __all__ = ("Track", "TrackPlaylist", "Player")
 __log__ = logging.getLogger(__name__)
 
@@ -149,6 +150,8 @@ class Player:
         The players seek position in the currently playing track in milliseconds. Returns 0 when there is no current track.
     channel_id: int
         The channel the player is connected to. Could be None if the player is not connected.
+    queue: Optional[:class:`audio.queue.Queue`]
+        The queue attached to the player. Could be None if no queue has been attached.
     """
 
     def __init__(
@@ -173,8 +176,11 @@ class Player:
         self.current = None
         self._equalizer = Equalizer.flat()
         self.channel_id = None
+        self.queue = None
 
         self._new_track = False
+        # Set by stop(advance=False) until its TrackEnd(STOPPED) arrives
+        self._hold_queue = False
 
     @property
     def equalizer(self):
@@ -257,6 +263,17 @@ class Player:
             self.current = None
         self._new_track = False
 
+        if (
+            isinstance(event, TrackEnd)
+            and event.reason == "STOPPED"
+            and self._hold_queue
+        ):
+            self._hold_queue = False
+            return
+
+        if self.queue is not None and isinstance(event, TrackEnd):
+            await self.queue._on_track_end(event)
+
     def _get_shard_socket(self, shard_id: int) -> Optional[DiscordWebSocket]:
         if isinstance(self.bot, commands.AutoShardedBot):
             try:
@@ -356,11 +373,19 @@ class Player:
             f"PLAYER | Started playing track:: {str(track)} ({self.channel_id})"
         )
 
-    async def stop(self) -> None:
+    async def stop(self, *, advance: bool = True) -> None:
         """|coro|
 
         Stop the Player's currently playing song.
+
+        Parameters
+        ------------
+        advance: bool
+            Whether the attached queue, if there is one, should play its next track. Defaults to True.
         """
+        if not advance and self.current is not None:
+            self._hold_queue = True
+
         await self.node._send(op="stop", guildId=str(self.guild_id))
         __log__.debug(
             f"PLAYER | Current track stopped:: {str(self.current)} ({self.channel_id})"
@@ -371,9 +396,15 @@ class Player:
         """|coro|
 
         Stop the player, and remove any internal references to it.
+
+        The attached queue, if there is one, is detached first so the stop doesn't advance it.
         """
-        await self.stop()
-        await self.disconnect(force=force)
+        if self.queue is not None:
+            self.queue.detach()
+
+        # The voice state update goes through the gateway and the stop through
+        # the node, so there's no reason to wait on one before the other.
+        await asyncio.gather(self.stop(), self.disconnect(force=force))
 
         await self.node._send(op="destroy", guildId=str(self.guild_id))
 
@@ -393,8 +424,11 @@ class Player:
         Parameters
         ------------
         equalizer: :class:`Equalizer`
-            The Equalizer to set.
+            The Equalizer to set. If it is equal to the current Equalizer nothing is sent.
         """
+        if equalizer == self._equalizer:
+            return
+
         await self.node._send(
             op="equalizer", guildId=str(self.guild_id), bands=equalizer.eq
         )
@@ -517,3 +551,8 @@ class Player:
             await self.node._send(
                 op="volume", guildId=str(self.guild_id), volume=self.volume
             )
+
+        if self._equalizer != Equalizer.flat():
+            await self.node._send(
+                op="equalizer", guildId=str(self.guild_id), bands=self._equalizer.eq
+            )
@@ -0,0 +1,318 @@
+"""MIT License
+
+Copyright (c) 2021 Pycord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import collections
+import logging
+import random
+from typing import Iterator, List, Optional, Union
+
+from .errors import *
+from .events import *
+from .player import Track, TrackPlaylist
+
+__all__ = ("Queue",)
+__log__ = logging.getLogger(__name__)
+
+# TrackEnd reasons which should advance the queue.
+# REPLACED and CLEANUP are caused by the library/user and must not.
+ADVANCE_REASONS = frozenset({"FINISHED", "LOAD_FAILED", "STOPPED"})
+
+
+class _QueueEntry:
+    __slots__ = ("query", "track", "task")
+
+    def __init__(self, query: Optional[str] = None, track: Optional[Track] = None):
+        self.query = query
+        self.track = track
+        self.task = None
+
+    @property
+    def resolved(self) -> bool:
+        return self.track is not None
+
+    def cancel(self) -> None:
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        self.task = None
+
+
+class Queue:
+    """A track queue attached to a :class:`audio.player.Player`.
+
+    Queries added to the queue are resolved in the background with :func:`audio.node.Node.get_tracks`
+    while they approach the head of the queue, so the next track is usually ready to be
+    played as soon as the current one ends, without an extra REST round trip.
+
+    Once attached, the queue automatically plays the next track when the player's current
+    track finishes, is stopped (unless with ``advance=False``), or fails to load.
+
+    Parameters
+    ------------
+    player: :class:`audio.player.Player`
+        The player to attach this queue to.
+    prefetch: int
+        How many upcoming entries should be resolved ahead of time. Defaults to 3.
+
+    Attributes
+    ------------
+    player: :class:`audio.player.Player`
+        The player this queue is attached to.
+    prefetch: int
+        How many upcoming entries are resolved ahead of time.
+    """
+
+    def __init__(self, player, *, prefetch: int = 3):
+        self.player = player
+        self.prefetch = max(prefetch, 0)
+
+        self._entries = collections.deque()
+
+        player.queue = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[Union[Track, str]]:
+        for entry in self._entries:
+            yield entry.track if entry.resolved else entry.query
+
+    def __repr__(self):
+        return f"<audio.Queue: {len(self._entries)} entries, prefetch={self.prefetch}>"
+
+    @property
+    def upcoming(self) -> List[Union[Track, str]]:
+        """A list of the queued entries. Resolved entries are :class:`audio.player.Track` objects,
+        unresolved entries are their query string."""
+        return list(self)
+
+    def add(self, item: Union[Track, str]) -> None:
+        """Add a track or query to the end of the queue.
+
+        Parameters
+        ------------
+        item: Union[:class:`audio.player.Track`, str]
+            A resolved Track, or a query to resolve with :func:`audio.node.Node.get_tracks`.
+        """
+        self._entries.append(self._make_entry(item))
+        self._fill()
+
+    def add_next(self, item: Union[Track, str]) -> None:
+        """Add a track or query to the front of the queue.
+
+        Parameters
+        ------------
+        item: Union[:class:`audio.player.Track`, str]
+            A resolved Track, or a query to resolve with :func:`audio.node.Node.get_tracks`.
+        """
+        self._entries.appendleft(self._make_entry(item))
+        self._fill()
+
+    def extend(self, items) -> None:
+        """Add multiple tracks or queries to the end of the queue.
+
+        Parameters
+        ------------
+        items: Union[Iterable[Union[:class:`audio.player.Track`, str]], :class:`audio.player.TrackPlaylist`]
+            The tracks or queries to add.
+        """
+        if isinstance(items, TrackPlaylist):
+            items = items.tracks
+
+        self._entries.extend(self._make_entry(item) for item in items)
+        self._fill()
+
+    def clear(self) -> None:
+        """Remove every entry from the queue, cancelling any pending resolutions."""
+        for entry in self._entries:
+            entry.cancel()
+
+        self._entries.clear()
+
+    def detach(self) -> None:
+        """Detach the queue from its player, cancelling any pending resolutions.
+
+        The player no longer advances the queue when its tracks end. Called by
+        :func:`audio.player.Player.destroy`.
+        """
+        for entry in self._entries:
+            entry.cancel()
+
+        if self.player.queue is self:
+            self.player.queue = None
+
+    def shuffle(self) -> None:
+        """Shuffle the queue in place.
+
+        Entries which have already been resolved keep their resolved track, so only the
+        entries which end up at the head of the queue need to be resolved again.
+        """
+        entries = list(self._entries)
+        random.shuffle(entries)
+
+        for entry in entries[self.prefetch :]:
+            entry.cancel()
+
+        self._entries = collections.deque(entries)
+        self._fill()
+
+    def to_dict(self) -> List[dict]:
+        """Return a JSON serialisable representation of the queue.
+
+        Resolved entries are stored with their Base64 track ID and info, so they can be
+        restored with :func:`from_dict` without resolving them again.
+        """
+        data = []
+
+        for entry in self._entries:
+            if entry.resolved:
+                track = entry.track
+                data.append(
+                    {"track": track.id, "info": track.info, "query": track.query}
+                )
+            else:
+                data.append({"query": entry.query})
+
+        return data
+
+    @classmethod
+    def from_dict(cls, player, data: List[dict], *, prefetch: int = 3):
+        """Build a queue from the data returned by :func:`to_dict`.
+
+        Parameters
+        ------------
+        player: :class:`audio.player.Player`
+            The player to attach the queue to.
+        data: List[dict]
+            The data previously returned by :func:`to_dict`.
+        prefetch: int
+            How many upcoming entries should be resolved ahead of time. Defaults to 3.
+        """
+        self = cls(player, prefetch=prefetch)
+
+        for item in data:
+            if "track" in item:
+                track = Track(
+                    id_=item["track"], info=item["info"], query=item.get("query")
+                )
+                self._entries.append(_QueueEntry(query=track.query, track=track))
+            else:
+                self._entries.append(_QueueEntry(query=item["query"]))
+
+        self._fill()
+        return self
+
+    async def get(self) -> Optional[Track]:
+        """|coro|
+
+        Remove and return the next playable track from the queue.
+
+        Entries which could not be resolved are skipped.
+
+        Returns
+        ---------
+        Optional[:class:`audio.player.Track`]
+            The next track. This could be None if the queue is empty.
+        """
+        while self._entries:
+            entry = self._entries.popleft()
+            self._fill()
+
+            if not entry.resolved:
+                if entry.task is None:
+                    self._schedule(entry)
+
+                await entry.task
+
+            if entry.resolved:
+                return entry.track
+
+            __log__.info(f"QUEUE | Skipping unresolvable query:: <{entry.query}>")
+
+        return None
+
+    async def play_next(self) -> Optional[Track]:
+        """|coro|
+
+        Play the next track in the queue on the attached player, replacing the current track.
+
+        Returns
+        ---------
+        Optional[:class:`audio.player.Track`]
+            The track which was started. This could be None if the queue is empty.
+        """
+        track = await self.get()
+
+        if track is not None:
+            await self.player.play(track)
+
+        return track
+
+    async def _on_track_end(self, event: TrackEnd) -> None:
+        if event.reason not in ADVANCE_REASONS:
+            return
+
+        await self.play_next()
+
+    def _make_entry(self, item: Union[Track, str]) -> _QueueEntry:
+        if isinstance(item, Track):
+            return _QueueEntry(query=item.query, track=item)
+
+        if isinstance(item, str):
+            return _QueueEntry(query=item)
+
+        raise audioException(f"Queue entries must be a Track or str, not {type(item)}")
+
+    def _fill(self) -> None:
+        for index, entry in enumerate(self._entries):
+            if index >= self.prefetch:
+                break
+
+            if not entry.resolved and entry.task is None:
+                self._schedule(entry)
+
+    def _schedule(self, entry: _QueueEntry) -> None:
+        entry.task = self.player.bot.loop.create_task(self._resolve(entry))
+
+    async def _resolve(self, entry: _QueueEntry) -> None:
+        try:
+            tracks = await self.player.node.get_tracks(entry.query)
+        except Exception as error:
+            __log__.warning(
+                f"QUEUE | Failed to resolve query:: <{entry.query}> ({error})"
+            )
+            return
+
+        if isinstance(tracks, TrackPlaylist):
+            tracks = tracks.tracks
+
+        if not tracks:
+            return
+
+        track = tracks[0]
+        track.query = entry.query
+        entry.track = track
+
+        __log__.debug(f"QUEUE | Resolved query:: <{entry.query}> -> {track}")
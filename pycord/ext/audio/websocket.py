@@ -34,6 +34,13 @@ from .stats import Stats
 
 __log__ = logging.getLogger(__name__)
 
+CLOSED_TYPES = (
+    aiohttp.WSMsgType.CLOSE,
+    aiohttp.WSMsgType.CLOSING,
+    aiohttp.WSMsgType.CLOSED,
+    aiohttp.WSMsgType.ERROR,
+)
+
 
 class WebSocket:
     def __init__(self, **attrs):
@@ -115,7 +122,7 @@ class WebSocket:
         while True:
             msg = await self._websocket.receive()
 
-            if msg.type is aiohttp.WSMsgType.CLOSED:
+            if msg.type in CLOSED_TYPES:
                 __log__.debug(f"WEBSOCKET | Close data: {msg.extra}")
 
                 self._closed = True
@@ -127,7 +134,9 @@ class WebSocket:
 
                 await asyncio.sleep(retry)
                 if not self.is_connected:
-                    self.bot.loop.create_task(self._connect())
+                    # Reconnect before receiving again, otherwise the next receive
+                    # is on the old, closed websocket and costs another backoff.
+                    await self._connect()
             else:
                 __log__.debug(f"WEBSOCKET | Received Payload:: <{msg.data}>")
                 self.bot.loop.create_task(self.process_data(msg.json()))
@@ -22,9 +22,11 @@ import subprocess
 import socket
 import sys
 import time
+import threading
 import tokenize
 import traceback
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 from string import ascii_letters
 
@@ -56,13 +58,14 @@ from .utils import (
     encodeFilename,
     error_to_compat_str,
     expand_path,
+    ExtractionCancelled,
     ExtractorError,
     format_bytes,
     formatSeconds,
     GeoRestrictedError,
+    HTTPConnectionPool,
     int_or_none,
     ISO3166Utils,
-    locked_file,
     make_HTTPS_handler,
     MaxDownloadsReached,
     orderedSet,
@@ -94,7 +97,10 @@ from .utils import (
     YoutubeDLHandler,
     YoutubeDLRedirectHandler,
 )
+from .archive import open_download_archive
 from .cache import Cache
+from .infocache import InfoCache
+from .urlindex import ExtractorIndex
 from .extractor import get_info_extractor, gen_extractor_classes, _LAZY_LOADER
 from .extractor.openload import PhantomJSwrapper
 from .downloader import get_suitable_downloader
@@ -173,6 +179,11 @@ class YoutubeDL(object):
     playlist_items:    Specific indices of playlist to download.
     playlistreverse:   Download playlist items in reverse order.
     playlistrandom:    Download playlist items in random order.
+    concurrent_playlist_extraction: Number of threads extracting the
+                       url entries of a playlist ahead of the one being
+                       processed. Entries are still processed, filtered and
+                       downloaded one by one, in order. Every thread extracts
+                       with its own YoutubeDL and extractor instances.
     matchtitle:        Download only matching titles.
     rejecttitle:       Reject downloads for matching titles.
     logger:            Log messages to a logging.Logger instance.
@@ -194,6 +205,20 @@ class YoutubeDL(object):
     skip_download:     Skip the actual download of the video file
     cachedir:          Location of the cache files in the filesystem.
                        False to disable filesystem cache.
+    cache_backend:     How the cache is stored in cachedir: "file" (one file
+                       per entry, the default) or "sqlite" (a single indexed
+                       database, with expiry and eviction).
+    cache_max_size:    Size in bytes above which the sqlite cache evicts the
+                       least recently used entries.
+    info_cache:        True to cache extraction results in memory, or an
+                       InfoCache to share between YoutubeDL instances.
+    info_cache_ttl:    Seconds extraction results are cached for at most
+                       (default 3600). Never past the expiry of signed
+                       media URLs.
+    info_cache_size:   How many extraction results to keep in memory.
+    info_cache_sqlite: Also cache extraction results in a sqlite database,
+                       True for the cache.sqlite of the sqlite cache
+                       backend in the cachedir (bounded by cache_max_size).
     noplaylist:        Download single video instead of a playlist if in doubt.
     age_limit:         An integer representing the user's age in years.
                        Unsuitable videos for the given age are skipped.
@@ -208,7 +233,9 @@ class YoutubeDL(object):
                        downloaded. None for no limit.
     download_archive:  File name of a file where all downloads are recorded.
                        Videos already present in the file are not downloaded
-                       again.
+                       again. Existing sqlite databases, and new files whose
+                       names end in .sqlite, .sqlite3 or .db, are sqlite
+                       archives, e.g. for archives shared by many processes.
     cookiefile:        File name where cookies should be read from and dumped to.
     nocheckcertificate:Do not verify SSL certificates
     prefer_insecure:   Use HTTP instead of HTTPS to retrieve information.
@@ -299,14 +326,16 @@ class YoutubeDL(object):
                        None or unset for standard (built-in) downloader.
     hls_prefer_native: Use the native HLS downloader instead of ffmpeg/avconv
                        if True, otherwise use ffmpeg/avconv if False, otherwise
-                       use downloader suggested by extractor if None.
+                       use downloader suggested by extractor if None. Live
+                       streams only use the native downloader if True.
 
     The following parameters are not used by YoutubeDL itself, they are used by
     the downloader (see youtube_dl/downloader/common.py):
-    nopart, updatetime, buffersize, ratelimit, min_filesize, max_filesize, test,
-    noresizebuffer, retries, continuedl, noprogress, consoletitle,
-    xattr_set_filesize, external_downloader_args, hls_use_mpegts,
-    http_chunk_size.
+    nopart, updatetime, buffersize, ratelimit, host_ratelimit, global_ratelimit,
+    min_filesize, max_filesize, test, noresizebuffer, retries, continuedl,
+    noprogress, consoletitle, xattr_set_filesize, external_downloader_args,
+    hls_use_mpegts, http_chunk_size, concurrent_fragment_downloads,
+    http_connections, live_refresh_retries.
 
     The following options are used by the post processors:
     prefer_ffmpeg:     If False, use avconv instead of ffmpeg if both are available,
@@ -373,6 +402,14 @@ class YoutubeDL(object):
             params = {}
         self._ies = []
         self._ies_instances = {}
+        self._ies_index = None
+        self._playlist_urls = set()
+        self._download_archive = None
+        self._prefetched = {}
+        self._prefetch_executor = None
+        self._prefetch_local = threading.local()
+        self._format_selectors = {}
+        self._format_filters = {}
         self._pps = []
         self._progress_hooks = []
         self._download_retcode = 0
@@ -386,6 +423,13 @@ class YoutubeDL(object):
         self.params.update(params)
         self.cache = Cache(self)
 
+        info_cache = self.params.get("info_cache")
+        if info_cache is True:
+            info_cache = InfoCache.from_params(self.params)
+        elif info_cache is False:
+            info_cache = None
+        self._info_cache = info_cache
+
         def check_deprecated(param, option, suggestion):
             if self.params.get(param) is not None:
                 self.report_warning(
@@ -500,6 +544,8 @@ class YoutubeDL(object):
     def add_info_extractor(self, ie):
         """Add an InfoExtractor object to the end of the list."""
         self._ies.append(ie)
+        if self._ies_index is not None:
+            self._ies_index.add(ie)
         if not isinstance(ie, type):
             self._ies_instances[ie.ie_key()] = ie
             ie.set_downloader(self)
@@ -516,6 +562,16 @@ class YoutubeDL(object):
             self.add_info_extractor(ie)
         return ie
 
+    def _suitable_ies(self, url):
+        """
+        The extractors in _ies which may be suitable for url, in order.
+        Only those registered for the URL's host, or which can't be looked up
+        by host, need to have their suitable() called.
+        """
+        if self._ies_index is None:
+            self._ies_index = ExtractorIndex(self._ies)
+        return self._ies_index.candidates(url)
+
     def add_default_info_extractors(self):
         """
         Add the InfoExtractors returned by gen_extractors to the end of the list
@@ -610,6 +666,9 @@ class YoutubeDL(object):
     def __exit__(self, *args):
         self.restore_console_title()
 
+        self._shutdown_prefetch()
+        self._connection_pool.close()
+
         if self.params.get("cookiefile") is not None:
             self.cookiejar.save(ignore_discard=True, ignore_expires=True)
 
@@ -907,7 +966,7 @@ class YoutubeDL(object):
         if ie_key:
             ies = [self.get_info_extractor(ie_key)]
         else:
-            ies = self._ies
+            ies = self._suitable_ies(url)
 
         for ie in ies:
             if not ie.suitable(url):
@@ -924,6 +983,74 @@ class YoutubeDL(object):
         else:
             self.report_error("no suitable InfoExtractor for URL %s" % url)
 
+    def iter_info(
+        self,
+        url,
+        download=False,
+        ie_key=None,
+        extra_info={},
+        force_generic_extractor=False,
+    ):
+        """
+        Like extract_info(), but yield the processed results one at a time.
+
+        The entries of a playlist are yielded as soon as each one has been
+        processed, instead of being collected into the playlist's entries,
+        and entries the extractor lists lazily are only fetched as they are
+        needed (unless playlist_items, playlistreverse or playlistrandom
+        need the whole list). Entries which failed with ignoreerrors are
+        skipped. Any other result is yielded as it is.
+        """
+        ie_result = self.extract_info(
+            url,
+            download=False,
+            ie_key=ie_key,
+            process=False,
+            force_generic_extractor=force_generic_extractor,
+        )
+        try:
+            for result in self.__iter_ie_result(ie_result, download, extra_info):
+                if result is not None:
+                    yield result
+        except ExtractorError as e:  # e.g. while fetching a page of entries
+            self.report_error(compat_str(e), e.format_traceback())
+
+    def __iter_ie_result(self, ie_result, download, extra_info):
+        if ie_result is None:
+            return
+        result_type = ie_result.get("_type", "video")
+
+        if result_type == "url" and self.params.get("extract_flat", False) is not True:
+            ie_result = self.extract_info(
+                sanitize_url(ie_result["url"]),
+                download=False,
+                ie_key=ie_result.get("ie_key"),
+                process=False,
+            )
+            for result in self.__iter_ie_result(ie_result, download, extra_info):
+                yield result
+        elif result_type in ("playlist", "multi_video"):
+            webpage_url = ie_result["webpage_url"]
+            if webpage_url in self._playlist_urls:
+                self.to_screen(
+                    "[download] Skipping already downloaded playlist: %s"
+                    % (ie_result.get("title") or ie_result.get("id"))
+                )
+                return
+
+            self._playlist_level += 1
+            self._playlist_urls.add(webpage_url)
+            try:
+                for result in self.__iter_playlist(ie_result, download, lazy=True):
+                    yield result
+            finally:
+                self._playlist_level -= 1
+                if not self._playlist_level:
+                    self._playlist_urls.clear()
+                    self._shutdown_prefetch()
+        else:
+            yield self.process_ie_result(ie_result, download, extra_info)
+
     def __handle_extraction_exceptions(func):
         def wrapper(self, *args, **kwargs):
             try:
@@ -938,7 +1065,7 @@ class YoutubeDL(object):
                 self.report_error(msg)
             except ExtractorError as e:  # An error we somewhat expected
                 self.report_error(compat_str(e), e.format_traceback())
-            except MaxDownloadsReached:
+            except (MaxDownloadsReached, ExtractionCancelled):
                 raise
             except Exception as e:
                 if self.params.get("ignoreerrors", False):
@@ -953,7 +1080,11 @@ class YoutubeDL(object):
 
     @__handle_extraction_exceptions
     def __extract_info(self, url, ie, download, extra_info, process):
-        ie_result = ie.extract(url)
+        prefetched = self._prefetched.pop((ie.ie_key(), url), None)
+        if prefetched is not None:
+            ie_result = prefetched.result()
+        else:
+            ie_result = self._extract_ie_result(ie, url)
         if (
             ie_result is None
         ):  # Finished already (backwards compatibility; listformats and friends should be moved here)
@@ -970,6 +1101,86 @@ class YoutubeDL(object):
         else:
             return ie_result
 
+    def _extract_ie_result(self, ie, url):
+        """Run the extractor, unless the result is in the info cache."""
+        info_cache = self._info_cache
+        if info_cache is None:
+            return ie.extract(url)
+
+        key = info_cache.key(ie, url)
+        ie_result = info_cache.get(key)
+        if ie_result is None:
+            ie_result = ie.extract(url)
+            if isinstance(ie_result, dict):
+                info_cache.put(key, ie_result)
+        elif self.params.get("verbose"):
+            self.to_screen("[debug] Using cached info for %s" % url)
+        return ie_result
+
+    def _prefetch_entry(self, entry):
+        """
+        Start extracting a url or url_transparent playlist entry in the
+        background. __extract_info picks the result up when the entry is
+        processed. Returns the prefetch key, or None.
+        """
+        if not isinstance(entry, dict) or entry.get("_type") not in (
+            "url",
+            "url_transparent",
+        ):
+            return None
+
+        url = sanitize_url(entry["url"])
+        ie_key = entry.get("ie_key")
+        if not ie_key:
+            for ie in self._suitable_ies(url):
+                if ie.suitable(url):
+                    ie_key = ie.ie_key()
+                    break
+            else:
+                return None
+
+        ie = self.get_info_extractor(ie_key)
+        key = (ie.ie_key(), url)
+        if key in self._prefetched:
+            return None
+
+        # Don't extract entries which won't be downloaded
+        max_downloads = self.params.get("max_downloads")
+        if max_downloads is not None and len(self._prefetched) >= int(
+            max_downloads
+        ) - self._num_downloads:
+            return None
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=self.params["concurrent_playlist_extraction"],
+                thread_name_prefix="youtube-dl-playlist",
+            )
+        self._prefetched[key] = self._prefetch_executor.submit(
+            self._prefetch_extract, type(ie), url
+        )
+        return key
+
+    def _prefetch_extract(self, ie_class, url):
+        # YoutubeDL and extractor instances aren't thread safe, every thread
+        # has its own, so that extractors are only initialized (e.g. logged
+        # in) once per thread
+        worker = getattr(self._prefetch_local, "ydl", None)
+        if worker is None:
+            worker = self._prefetch_local.ydl = YoutubeDL(
+                dict(self.params, info_cache=self._info_cache), auto_init=False
+            )
+        ie = worker._ies_instances.get(ie_class.ie_key())
+        if ie is None:
+            ie = ie_class()
+            worker.add_info_extractor(ie)
+        return worker._extract_ie_result(ie, url)
+
+    def _shutdown_prefetch(self):
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
+
     def add_default_extra_info(self, ie_result, ie, url):
         self.add_extra_info(
             ie_result,
@@ -1071,6 +1282,7 @@ class YoutubeDL(object):
                 self._playlist_level -= 1
                 if not self._playlist_level:
                     self._playlist_urls.clear()
+                    self._shutdown_prefetch()
         elif result_type == "compat_list":
             self.report_warning(
                 "Extractor %s returned a compat_list result. "
@@ -1098,13 +1310,21 @@ class YoutubeDL(object):
             raise Exception("Invalid result type: %s" % result_type)
 
     def __process_playlist(self, ie_result, download):
+        ie_result["entries"] = list(self.__iter_playlist(ie_result, download))
+        return ie_result
+
+    def __iter_playlist(self, ie_result, download, lazy=False):
+        """
+        Yield the processed entries of a playlist result. With lazy, entries
+        which the extractor generates (PagedList or iterators) are only
+        fetched as they are processed, unless the playlist options need the
+        whole list; the number of entries isn't known up front then.
+        """
         # We process each entry in the playlist
         playlist = ie_result.get("title") or ie_result.get("id")
 
         self.to_screen("[download] Downloading playlist: %s" % playlist)
 
-        playlist_results = []
-
         playliststart = self.params.get("playliststart", 1) - 1
         playlistend = self.params.get("playlistend")
         # For backwards compatibility, interpret -1 as whole list
@@ -1142,7 +1362,25 @@ class YoutubeDL(object):
                 % (ie_result["extractor"], playlist, num_entries)
             )
 
-        if isinstance(ie_entries, list):
+        lazy = (
+            lazy
+            and not isinstance(ie_entries, list)
+            and not playlistitems
+            and not self.params.get("playlistreverse", False)
+            and not self.params.get("playlistrandom", False)
+        )
+
+        if lazy:
+            if isinstance(ie_entries, PagedList):
+                entries = ie_entries.iterslice(playliststart, playlistend)
+            else:
+                entries = itertools.islice(ie_entries, playliststart, playlistend)
+            n_entries = None
+            self.to_screen(
+                "[%s] playlist %s: Downloading videos as they are listed"
+                % (ie_result["extractor"], playlist)
+            )
+        elif isinstance(ie_entries, list):
             n_all_entries = len(ie_entries)
             if playlistitems:
                 entries = make_playlistitems_entries(ie_entries)
@@ -1172,47 +1410,86 @@ class YoutubeDL(object):
             n_entries = len(entries)
             report_download(n_entries)
 
-        if self.params.get("playlistreverse", False):
-            entries = entries[::-1]
+        if not lazy:
+            if self.params.get("playlistreverse", False):
+                entries = entries[::-1]
 
-        if self.params.get("playlistrandom", False):
-            random.shuffle(entries)
+            if self.params.get("playlistrandom", False):
+                random.shuffle(entries)
 
         x_forwarded_for = ie_result.get("__x_forwarded_for_ip")
 
-        for i, entry in enumerate(entries, 1):
-            self.to_screen("[download] Downloading video %s of %s" % (i, n_entries))
-            # This __x_forwarded_for_ip thing is a bit ugly but requires
-            # minimal changes
-            if x_forwarded_for:
-                entry["__x_forwarded_for_ip"] = x_forwarded_for
-            extra = {
-                "n_entries": n_entries,
-                "playlist": playlist,
-                "playlist_id": ie_result.get("id"),
-                "playlist_title": ie_result.get("title"),
-                "playlist_uploader": ie_result.get("uploader"),
-                "playlist_uploader_id": ie_result.get("uploader_id"),
-                "playlist_index": playlistitems[i - 1]
-                if playlistitems
-                else i + playliststart,
-                "extractor": ie_result["extractor"],
-                "webpage_url": ie_result["webpage_url"],
-                "webpage_url_basename": url_basename(ie_result["webpage_url"]),
-                "extractor_key": ie_result["extractor_key"],
-            }
+        # Extract up to twice as many entries ahead as there are threads
+        prefetch_ahead = 0
+        if self.params.get("concurrent_playlist_extraction") and self.params.get(
+            "extract_flat", False
+        ) not in (True, "in_playlist"):
+            prefetch_ahead = 2 * self.params["concurrent_playlist_extraction"]
+        prefetch_keys = []
+        # Entries taken from entries but not processed yet, the current one
+        # and the ones being prefetched
+        pending = collections.deque()
+        entries = iter(entries)
 
-            reason = self._match_entry(entry, incomplete=True)
-            if reason is not None:
-                self.to_screen("[download] " + reason)
-                continue
+        try:
+            i = 0
+            while True:
+                for entry in itertools.islice(
+                    entries, max(prefetch_ahead, 1) - len(pending)
+                ):
+                    pending.append(entry)
+                    if not prefetch_ahead:
+                        continue
+                    if self._match_entry(entry, incomplete=True) is None:
+                        key = self._prefetch_entry(entry)
+                        if key is not None:
+                            prefetch_keys.append(key)
+                if not pending:
+                    break
+                entry = pending.popleft()
+                i += 1
+
+                if n_entries is None:
+                    self.to_screen("[download] Downloading video %s" % i)
+                else:
+                    self.to_screen(
+                        "[download] Downloading video %s of %s" % (i, n_entries)
+                    )
+                # This __x_forwarded_for_ip thing is a bit ugly but requires
+                # minimal changes
+                if x_forwarded_for:
+                    entry["__x_forwarded_for_ip"] = x_forwarded_for
+                extra = {
+                    "n_entries": n_entries,
+                    "playlist": playlist,
+                    "playlist_id": ie_result.get("id"),
+                    "playlist_title": ie_result.get("title"),
+                    "playlist_uploader": ie_result.get("uploader"),
+                    "playlist_uploader_id": ie_result.get("uploader_id"),
+                    "playlist_index": playlistitems[i - 1]
+                    if playlistitems
+                    else i + playliststart,
+                    "extractor": ie_result["extractor"],
+                    "webpage_url": ie_result["webpage_url"],
+                    "webpage_url_basename": url_basename(ie_result["webpage_url"]),
+                    "extractor_key": ie_result["extractor_key"],
+                }
+
+                reason = self._match_entry(entry, incomplete=True)
+                if reason is not None:
+                    self.to_screen("[download] " + reason)
+                    continue
+
+                # TODO: skip failed (empty) entries?
+                yield self.__process_iterable_entry(entry, download, extra)
+        finally:
+            # Drop what wasn't used, e.g. after --max-downloads was reached
+            for key in prefetch_keys:
+                future = self._prefetched.pop(key, None)
+                if future is not None:
+                    future.cancel()
 
-            entry_result = self.__process_iterable_entry(entry, download, extra)
-            # TODO: skip failed (empty) entries?
-            playlist_results.append(entry_result)
-        ie_result["entries"] = playlist_results
         self.to_screen("[download] Finished downloading playlist: %s" % playlist)
-        return ie_result
 
     @__handle_extraction_exceptions
     def __process_iterable_entry(self, entry, download, extra_info):
@@ -1220,7 +1497,13 @@ class YoutubeDL(object):
 
     def _build_format_filter(self, filter_spec):
         "Returns a function to filter the formats according to the filter_spec"
+        _filter = self._format_filters.get(filter_spec)
+        if _filter is None:
+            _filter = self._compile_format_filter(filter_spec)
+            self._format_filters[filter_spec] = _filter
+        return _filter
 
+    def _compile_format_filter(self, filter_spec):
         OPERATORS = {
             "<": operator.lt,
             "<=": operator.le,
@@ -1313,6 +1596,17 @@ class YoutubeDL(object):
         return "/".join(req_format_list)
 
     def build_format_selector(self, format_spec):
+        """
+        Return the function selecting the formats for format_spec. Specs
+        are only parsed the first time they are used.
+        """
+        selector = self._format_selectors.get(format_spec)
+        if selector is None:
+            selector = self._compile_format_selector(format_spec)
+            self._format_selectors[format_spec] = selector
+        return selector
+
+    def _compile_format_selector(self, format_spec):
         def syntax_error(note, start):
             message = "Invalid format specification: " "{0}\n\t{1}\n\t{2}^".format(
                 note, format_spec, " " * start[1]
@@ -1473,7 +1767,7 @@ class YoutubeDL(object):
                         return
                     if format_spec == "all":
                         for f in formats:
-                            yield f
+                            yield copy.deepcopy(f)
                     elif format_spec in ["best", "worst", None]:
                         format_idx = 0 if format_spec == "worst" else -1
                         audiovideo_formats = [
@@ -1482,36 +1776,36 @@ class YoutubeDL(object):
                             if f.get("vcodec") != "none" and f.get("acodec") != "none"
                         ]
                         if audiovideo_formats:
-                            yield audiovideo_formats[format_idx]
+                            yield copy.deepcopy(audiovideo_formats[format_idx])
                         # for extractors with incomplete formats (audio only (soundcloud)
                         # or video only (imgur)) we will fallback to best/worst
                         # {video,audio}-only format
                         elif ctx["incomplete_formats"]:
-                            yield formats[format_idx]
+                            yield copy.deepcopy(formats[format_idx])
                     elif format_spec == "bestaudio":
                         audio_formats = [
                             f for f in formats if f.get("vcodec") == "none"
                         ]
                         if audio_formats:
-                            yield audio_formats[-1]
+                            yield copy.deepcopy(audio_formats[-1])
                     elif format_spec == "worstaudio":
                         audio_formats = [
                             f for f in formats if f.get("vcodec") == "none"
                         ]
                         if audio_formats:
-                            yield audio_formats[0]
+                            yield copy.deepcopy(audio_formats[0])
                     elif format_spec == "bestvideo":
                         video_formats = [
                             f for f in formats if f.get("acodec") == "none"
                         ]
                         if video_formats:
-                            yield video_formats[-1]
+                            yield copy.deepcopy(video_formats[-1])
                     elif format_spec == "worstvideo":
                         video_formats = [
                             f for f in formats if f.get("acodec") == "none"
                         ]
                         if video_formats:
-                            yield video_formats[0]
+                            yield copy.deepcopy(video_formats[0])
                     else:
                         extensions = [
                             "mp4",
@@ -1530,7 +1824,7 @@ class YoutubeDL(object):
                             filter_f = lambda f: f["format_id"] == format_spec
                         matches = list(filter(filter_f, formats))
                         if matches:
-                            yield matches[-1]
+                            yield copy.deepcopy(matches[-1])
 
             elif selector.type == MERGE:
 
@@ -1590,15 +1884,16 @@ class YoutubeDL(object):
 
                 def selector_function(ctx):
                     for pair in itertools.product(
-                        video_selector(copy.deepcopy(ctx)),
-                        audio_selector(copy.deepcopy(ctx)),
+                        video_selector(ctx), audio_selector(ctx)
                     ):
                         yield _merge(pair)
 
             filters = [self._build_format_filter(f) for f in selector.filters]
 
+            # The selectors only copy the formats they pick, the
+            # filtered lists are built on a shallow copy of the context
             def final_selector(ctx):
-                ctx_copy = copy.deepcopy(ctx)
+                ctx_copy = dict(ctx)
                 for _filter in filters:
                     ctx_copy["formats"] = list(filter(_filter, ctx_copy["formats"]))
                 return selector_function(ctx_copy)
@@ -2412,6 +2707,56 @@ class YoutubeDL(object):
 
         return self._download_retcode
 
+    def download_to_sink(self, info_dict, sink):
+        """
+        Download the format selected in info_dict, as returned by
+        extract_info(download=False), into sink instead of a file (see
+        downloader.sink). Only HTTP and fragmented (DASH, native HLS)
+        formats can be downloaded this way, and no post processing happens.
+        Return True on success and False otherwise.
+        """
+        if info_dict.get("requested_formats") is not None:
+            sink.close()
+            self.report_error(
+                "formats that have to be merged can't be downloaded to a sink"
+            )
+            return False
+
+        params = self.params
+        if params.get("hls_prefer_native") is None:
+            # ffmpeg can't write to a sink
+            params = dict(params, hls_prefer_native=True)
+        fd_class = get_suitable_downloader(info_dict, params)
+        if not fd_class.SUPPORTS_SINK:
+            sink.close()
+            self.report_error(
+                "%s formats can't be downloaded to a sink"
+                % info_dict.get("protocol", "these")
+            )
+            return False
+
+        fd = fd_class(self, params)
+        for ph in self._progress_hooks:
+            fd.add_progress_hook(ph)
+        if self.params.get("verbose"):
+            self.to_screen("[debug] Invoking downloader on %r" % info_dict.get("url"))
+        try:
+            return fd.download("-", info_dict, sink=sink)
+        except (
+            compat_urllib_error.URLError,
+            compat_http_client.HTTPException,
+            socket.error,
+        ) as err:
+            self.report_error(
+                "unable to download video data: %s" % error_to_compat_str(err)
+            )
+        except (ContentTooShortError,) as err:
+            self.report_error(
+                "content too short (expected %s bytes and served %s)"
+                % (err.expected, err.downloaded)
+            )
+        return False
+
     def download_with_info_file(self, info_filename):
         with contextlib.closing(
             fileinput.FileInput(
@@ -2479,7 +2824,7 @@ class YoutubeDL(object):
             if not url:
                 return
             # Try to find matching extractor for the URL and take its ie_key
-            for ie in self._ies:
+            for ie in self._suitable_ies(url):
                 if ie.suitable(url):
                     extractor = ie.ie_key()
                     break
@@ -2496,15 +2841,7 @@ class YoutubeDL(object):
         if not vid_id:
             return False  # Incomplete video information
 
-        try:
-            with locked_file(fn, "r", encoding="utf-8") as archive_file:
-                for line in archive_file:
-                    if line.strip() == vid_id:
-                        return True
-        except IOError as ioe:
-            if ioe.errno != errno.ENOENT:
-                raise
-        return False
+        return vid_id in self._get_download_archive(fn)
 
     def record_download_archive(self, info_dict):
         fn = self.params.get("download_archive")
@@ -2512,8 +2849,14 @@ class YoutubeDL(object):
             return
         vid_id = self._make_archive_id(info_dict)
         assert vid_id
-        with locked_file(fn, "a", encoding="utf-8") as archive_file:
-            archive_file.write(vid_id + "\n")
+        self._get_download_archive(fn).add(vid_id)
+
+    def _get_download_archive(self, fn):
+        """The archive is loaded once and then kept in sync, see DownloadArchive."""
+        archive = self._download_archive
+        if archive is None or archive.filename != fn:
+            archive = self._download_archive = open_download_archive(fn)
+        return archive
 
     @staticmethod
     def format_resolution(format, default="unknown"):
@@ -2646,6 +2989,13 @@ class YoutubeDL(object):
             req = sanitized_Request(req)
         return self._opener.open(req, timeout=self._socket_timeout)
 
+    def connection_pool_stats(self):
+        """
+        How many HTTP(S) connections were opened and reused so far, and how
+        many are idle in the keep-alive pool.
+        """
+        return self._connection_pool.stats()
+
     def print_debug_header(self):
         if not self.params.get("verbose"):
             return
@@ -2756,8 +3106,14 @@ class YoutubeDL(object):
         proxy_handler = PerRequestProxyHandler(proxies)
 
         debuglevel = 1 if self.params.get("debug_printtraffic") else 0
-        https_handler = make_HTTPS_handler(self.params, debuglevel=debuglevel)
-        ydlh = YoutubeDLHandler(self.params, debuglevel=debuglevel)
+        # Shared by the HTTP and HTTPS handlers, see connection_pool_stats
+        self._connection_pool = HTTPConnectionPool()
+        https_handler = make_HTTPS_handler(
+            self.params, debuglevel=debuglevel, connection_pool=self._connection_pool
+        )
+        ydlh = YoutubeDLHandler(
+            self.params, debuglevel=debuglevel, connection_pool=self._connection_pool
+        )
         redirect_handler = YoutubeDLRedirectHandler()
         data_handler = compat_urllib_request_DataHandler()
 
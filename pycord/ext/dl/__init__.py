@@ -42,11 +42,16 @@ from .utils import (
 )
 from .update import update_self
 from .downloader import (
+    AsyncQueueSink,
+    CallbackSink,
     FileDownloader,
+    PipeSink,
 )
 from .extractor import gen_extractors, list_extractors
 from .extractor.adobepass import MSO_INFO
 from .YoutubeDL import YoutubeDL
+from .aio import AsyncYoutubeDL
+from .service import ExtractionService
 
 
 def _real_main(argv=None):
@@ -191,6 +196,16 @@ def _real_main(argv=None):
         if numeric_limit is None:
             parser.error("invalid rate limit specified")
         opts.ratelimit = numeric_limit
+    if opts.host_ratelimit is not None:
+        numeric_limit = FileDownloader.parse_bytes(opts.host_ratelimit)
+        if numeric_limit is None:
+            parser.error("invalid host rate limit specified")
+        opts.host_ratelimit = numeric_limit
+    if opts.global_ratelimit is not None:
+        numeric_limit = FileDownloader.parse_bytes(opts.global_ratelimit)
+        if numeric_limit is None:
+            parser.error("invalid global rate limit specified")
+        opts.global_ratelimit = numeric_limit
     if opts.min_filesize is not None:
         numeric_limit = FileDownloader.parse_bytes(opts.min_filesize)
         if numeric_limit is None:
@@ -236,6 +251,10 @@ def _real_main(argv=None):
         opts.retries = parse_retries(opts.retries)
     if opts.fragment_retries is not None:
         opts.fragment_retries = parse_retries(opts.fragment_retries)
+    if opts.concurrent_fragment_downloads < 1:
+        parser.error("concurrent fragments must be at least 1")
+    if opts.http_connections < 1:
+        parser.error("HTTP connections must be at least 1")
     if opts.buffersize is not None:
         numeric_buffersize = FileDownloader.parse_bytes(opts.buffersize)
         if numeric_buffersize is None:
@@ -439,11 +458,15 @@ def _real_main(argv=None):
         "ignoreerrors": opts.ignoreerrors,
         "force_generic_extractor": opts.force_generic_extractor,
         "ratelimit": opts.ratelimit,
+        "host_ratelimit": opts.host_ratelimit,
+        "global_ratelimit": opts.global_ratelimit,
         "nooverwrites": opts.nooverwrites,
         "retries": opts.retries,
         "fragment_retries": opts.fragment_retries,
         "skip_unavailable_fragments": opts.skip_unavailable_fragments,
         "keep_fragments": opts.keep_fragments,
+        "concurrent_fragment_downloads": opts.concurrent_fragment_downloads,
+        "http_connections": opts.http_connections,
         "buffersize": opts.buffersize,
         "noresizebuffer": opts.noresizebuffer,
         "http_chunk_size": opts.http_chunk_size,
@@ -454,6 +477,7 @@ def _real_main(argv=None):
         "playlistend": opts.playlistend,
         "playlistreverse": opts.playlist_reverse,
         "playlistrandom": opts.playlist_random,
+        "concurrent_playlist_extraction": opts.concurrent_playlist_extraction,
         "noplaylist": opts.noplaylist,
         "logtostderr": opts.outtmpl == "-",
         "consoletitle": opts.consoletitle,
@@ -485,6 +509,7 @@ def _real_main(argv=None):
         "max_views": opts.max_views,
         "daterange": date,
         "cachedir": opts.cachedir,
+        "cache_backend": opts.cache_backend,
         "youtube_print_sig_code": opts.youtube_print_sig_code,
         "age_limit": opts.age_limit,
         "download_archive": download_archive_fn,
@@ -576,4 +601,14 @@ def main(argv=None):
         sys.exit("\nERROR: Interrupted by user")
 
 
-__all__ = ["main", "YoutubeDL", "gen_extractors", "list_extractors"]
+__all__ = [
+    "main",
+    "YoutubeDL",
+    "AsyncYoutubeDL",
+    "ExtractionService",
+    "CallbackSink",
+    "PipeSink",
+    "AsyncQueueSink",
+    "gen_extractors",
+    "list_extractors",
+]
@@ -5,6 +5,26 @@ from math import ceil
 from .compat import compat_b64decode
 from .utils import bytes_to_intlist, intlist_to_bytes
 
+# Native AES implementations, the pure Python one below is the fallback
+try:
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+    AES_BACKEND = "cryptography"
+except ImportError:
+    try:
+        from Cryptodome.Cipher import AES as _AES
+
+        AES_BACKEND = "pycryptodomex"
+    except ImportError:
+        try:
+            # pycryptodome, or the legacy pycrypto
+            from Crypto.Cipher import AES as _AES
+
+            AES_BACKEND = "pycryptodome"
+        except ImportError:
+            AES_BACKEND = "builtin"
+
 BLOCK_SIZE_BYTES = 16
 
 
@@ -209,6 +229,63 @@ def aes_decrypt_text(data, password, key_size_bytes):
     return plaintext
 
 
+class _BlockDecryptor(object):
+    """Feeds whole blocks to a CBC decrypt function, keeping the remainder."""
+
+    def __init__(self, decrypt):
+        self._decrypt = decrypt
+        self._pending = b""
+
+    def update(self, data):
+        if self._pending:
+            data = self._pending + bytes(data)
+        whole = len(data) - len(data) % BLOCK_SIZE_BYTES
+        self._pending = bytes(data[whole:])
+        return self._decrypt(data[:whole]) if whole else b""
+
+    def finalize(self):
+        if self._pending:
+            raise ValueError("Data is not a multiple of the AES block size")
+        return b""
+
+
+def _builtin_cbc_decrypt(key, iv):
+    expanded_key = key_expansion(bytes_to_intlist(key))
+    state = {"previous_cipher_block": bytes_to_intlist(iv)}
+
+    def decrypt(data):
+        data = bytes_to_intlist(data)
+        previous_cipher_block = state["previous_cipher_block"]
+        decrypted_data = []
+        for i in range(0, len(data), BLOCK_SIZE_BYTES):
+            block = data[i : i + BLOCK_SIZE_BYTES]
+            decrypted_block = aes_decrypt(block, expanded_key)
+            decrypted_data += xor(decrypted_block, previous_cipher_block)
+            previous_cipher_block = block
+        state["previous_cipher_block"] = previous_cipher_block
+        return intlist_to_bytes(decrypted_data)
+
+    return decrypt
+
+
+def aes_cbc_decryptor(key, iv):
+    """
+    Incremental AES CBC decryption, without unpadding
+
+    @param {bytes} key  16/24/32-Byte cipher key
+    @param {bytes} iv   16-Byte IV
+    @returns            Object whose update(data) returns the bytes decrypted
+                        so far and finalize() the rest, using AES_BACKEND
+    """
+    if AES_BACKEND == "cryptography":
+        return Cipher(
+            algorithms.AES(bytes(key)), modes.CBC(bytes(iv)), backend=default_backend()
+        ).decryptor()
+    if AES_BACKEND == "builtin":
+        return _BlockDecryptor(_builtin_cbc_decrypt(key, iv))
+    return _BlockDecryptor(_AES.new(bytes(key), _AES.MODE_CBC, bytes(iv)).decrypt)
+
+
 RCON = (0x8D, 0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80, 0x1B, 0x36)
 SBOX = (
     0x63,
@@ -1342,4 +1419,5 @@ __all__ = [
     "aes_ctr_decrypt",
     "aes_cbc_decrypt",
     "aes_decrypt_text",
+    "aes_cbc_decryptor",
 ]
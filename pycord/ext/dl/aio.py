@@ -0,0 +1,200 @@
+"""
+pycord.ext.dl.aio
+~~~~~~~~~~~~~~~~~
+asyncio front end for YoutubeDL.
+
+Extraction is blocking urllib I/O, so AsyncYoutubeDL runs it on a bounded
+pool of worker threads, each with its own YoutubeDL instance, and lets
+coroutines await the result without blocking the event loop.
+
+:copyright: 2021 Pycord
+:license: MIT see LICENSE for more info
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .YoutubeDL import YoutubeDL
+from .infocache import InfoCache
+from .utils import ExtractionCancelled
+
+__all__ = ("AsyncYoutubeDL",)
+
+_DEFAULT = object()
+
+
+class _WorkerYoutubeDL(YoutubeDL):
+    """YoutubeDL which gives up at its next HTTP request once cancelled."""
+
+    _cancelled = None
+
+    def urlopen(self, req):
+        cancelled = self._cancelled
+        if cancelled is not None and cancelled.is_set():
+            raise ExtractionCancelled("Cancelled by the caller")
+        return super(_WorkerYoutubeDL, self).urlopen(req)
+
+
+class AsyncYoutubeDL(object):
+    """
+    Awaitable YoutubeDL backed by a bounded thread pool.
+
+    YoutubeDL instances aren't thread safe, so every worker thread lazily
+    creates its own from ``params``. At most ``max_workers`` extractions run
+    at once; further calls wait for a free worker.
+
+    Cancelling an awaiting coroutine, or exceeding its timeout, drops the
+    call if it hasn't started yet. A call already running is stopped at its
+    next HTTP request with ExtractionCancelled, which is never seen by the
+    caller as they have already received CancelledError or TimeoutError.
+
+    Usage::
+
+        ydl = AsyncYoutubeDL({"format": "bestaudio"}, timeout=30)
+        info = await ydl.extract_info_async(url, download=False)
+        ...
+        await ydl.close()
+
+    params      -- The YoutubeDL options, see YoutubeDL.
+    max_workers -- How many extractions can run at the same time.
+    timeout     -- Default per call timeout in seconds, None for no timeout.
+    """
+
+    def __init__(self, params=None, max_workers=4, timeout=None):
+        self.params = dict(params or {})
+        if self.params.get("info_cache") is True:
+            # Share the cache between the workers' YoutubeDL instances
+            self.params["info_cache"] = InfoCache.from_params(self.params)
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="youtube-dl"
+        )
+        self._local = threading.local()
+        self._running = set()
+        self._closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    def _get_ydl(self):
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            ydl = self._local.ydl = _WorkerYoutubeDL(self.params)
+        return ydl
+
+    def _call(self, cancelled, name, args, kwargs):
+        if cancelled.is_set():
+            raise ExtractionCancelled("Cancelled by the caller")
+
+        ydl = self._get_ydl()
+        ydl._cancelled = cancelled
+        try:
+            return getattr(ydl, name)(*args, **kwargs)
+        finally:
+            ydl._cancelled = None
+
+    async def run(self, name, *args, timeout=_DEFAULT, **kwargs):
+        """
+        Call the YoutubeDL method ``name`` on a worker thread and return its
+        result. ``timeout`` overrides the default timeout for this call.
+        """
+        if self._closed:
+            raise RuntimeError("AsyncYoutubeDL is closed")
+        if timeout is _DEFAULT:
+            timeout = self.timeout
+
+        loop = asyncio.get_running_loop()
+        cancelled = threading.Event()
+        future = loop.run_in_executor(
+            self._executor, self._call, cancelled, name, args, kwargs
+        )
+
+        self._running.add(cancelled)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            cancelled.set()
+            raise
+        finally:
+            self._running.discard(cancelled)
+
+    async def extract_info_async(
+        self,
+        url,
+        download=True,
+        ie_key=None,
+        extra_info={},
+        process=True,
+        force_generic_extractor=False,
+        *,
+        timeout=_DEFAULT
+    ):
+        """Awaitable YoutubeDL.extract_info(), see there for the arguments."""
+        return await self.run(
+            "extract_info",
+            url,
+            download=download,
+            ie_key=ie_key,
+            extra_info=extra_info,
+            process=process,
+            force_generic_extractor=force_generic_extractor,
+            timeout=timeout,
+        )
+
+    async def process_ie_result_async(
+        self, ie_result, download=True, extra_info={}, *, timeout=_DEFAULT
+    ):
+        """Awaitable YoutubeDL.process_ie_result(), e.g. for process=False results."""
+        return await self.run(
+            "process_ie_result",
+            ie_result,
+            download=download,
+            extra_info=extra_info,
+            timeout=timeout,
+        )
+
+    async def download_async(self, url_list, *, timeout=_DEFAULT):
+        """Awaitable YoutubeDL.download()."""
+        return await self.run("download", url_list, timeout=timeout)
+
+    async def download_to_sink_async(self, info_dict, sink, *, timeout=None):
+        """
+        Awaitable YoutubeDL.download_to_sink(). Unlike the other calls, there
+        is no timeout by default, as it lasts as long as the download. Use an
+        AsyncQueueSink to consume the data on the event loop::
+
+            queue = asyncio.Queue(maxsize=16)
+            sink = AsyncQueueSink(queue, asyncio.get_running_loop())
+            task = asyncio.ensure_future(ydl.download_to_sink_async(info, sink))
+            while (data := await queue.get()) is not None:
+                ...
+        """
+        return await self.run(
+            "download_to_sink", info_dict, sink, timeout=timeout
+        )
+
+    async def close(self, cancel=False):
+        """
+        Stop accepting calls and wait for the running ones to finish.
+        If ``cancel`` is True, running calls are cancelled instead.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if cancel:
+            for cancelled in list(self._running):
+                cancelled.set()
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
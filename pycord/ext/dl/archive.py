@@ -0,0 +1,152 @@
+from __future__ import unicode_literals
+
+import errno
+import os
+import sqlite3
+import threading
+
+from .utils import locked_file
+
+
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+
+
+class DownloadArchive(object):
+    """
+    The download archive as a set of archive ids, loaded from the text file
+    once instead of scanned for every video.
+
+    The file stays the source of truth: ids are appended to it as before,
+    and ids appended by other processes are picked up when an id isn't
+    found in memory and the file has grown since it was last read.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._ids = set()
+        self._offset = 0
+        self._size = -1
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        try:
+            size = os.path.getsize(self.filename)
+        except OSError as oe:
+            if oe.errno != errno.ENOENT:
+                raise
+            size = 0
+
+        if size == self._size:
+            return
+        if size < self._size:
+            # Truncated or replaced, start over
+            self._ids.clear()
+            self._offset = 0
+        self._size = size
+        if not size:
+            return
+
+        with locked_file(self.filename, "r", encoding="utf-8") as archive_file:
+            archive_file.f.seek(self._offset)
+            data = archive_file.read()
+            self._offset = archive_file.f.tell()
+
+        self._ids.update(line.strip() for line in data.splitlines())
+        self._ids.discard("")
+
+    def __contains__(self, vid_id):
+        with self._lock:
+            if vid_id in self._ids:
+                return True
+            self._refresh()
+            return vid_id in self._ids
+
+    def __len__(self):
+        with self._lock:
+            self._refresh()
+            return len(self._ids)
+
+    def add(self, vid_id):
+        with self._lock:
+            with locked_file(self.filename, "a", encoding="utf-8") as archive_file:
+                caught_up = archive_file.f.tell() == self._size == self._offset
+                archive_file.write(vid_id + "\n")
+                if caught_up:
+                    # Nobody else appended since the last read, skip our own line
+                    self._size = self._offset = archive_file.f.tell()
+            self._ids.add(vid_id)
+
+    def close(self):
+        pass
+
+
+class SqliteDownloadArchive(object):
+    """
+    Download archive in a sqlite database, for archives shared by many
+    processes. Used for existing sqlite databases, and for new
+    download_archive files whose names end in .sqlite, .sqlite3 or .db.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.filename, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS archive (id TEXT PRIMARY KEY)")
+            self._conn = conn
+        return self._conn
+
+    def __contains__(self, vid_id):
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT 1 FROM archive WHERE id = ?", (vid_id,))
+                .fetchone()
+            )
+        return row is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM archive").fetchone()[0]
+
+    def add(self, vid_id):
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT OR IGNORE INTO archive VALUES (?)", (vid_id,))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def _is_sqlite(filename):
+    """Whether filename is a sqlite database, None if it's missing or empty."""
+    try:
+        with open(filename, "rb") as f:
+            header = f.read(len(SQLITE_HEADER))
+    except IOError as ioe:
+        if ioe.errno != errno.ENOENT:
+            raise
+        return None
+    if not header:
+        return None
+    return header == SQLITE_HEADER
+
+
+def open_download_archive(filename):
+    is_sqlite = _is_sqlite(filename)
+    if is_sqlite is None:
+        # A new archive, its format is up to the extension
+        is_sqlite = filename.lower().endswith(SQLITE_EXTENSIONS)
+    if is_sqlite:
+        return SqliteDownloadArchive(filename)
+    return DownloadArchive(filename)
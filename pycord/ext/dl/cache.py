@@ -6,6 +6,9 @@ import json
 import os
 import re
 import shutil
+import sqlite3
+import threading
+import time
 import traceback
 
 from .compat import compat_getenv
@@ -15,65 +18,290 @@ from .utils import (
 )
 
 
+DTYPES = ("json", "bytes")
+
+
+class FileCacheBackend(object):
+    """One file per entry, <cachedir>/<section>/<key>.<dtype>. Ignores ttl."""
+
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+
+    def _get_cache_fn(self, section, key, dtype):
+        return os.path.join(self.root_dir, section, "%s.%s" % (key, dtype))
+
+    def store(self, section, key, data, dtype, ttl=None):
+        fn = self._get_cache_fn(section, key, dtype)
+        try:
+            os.makedirs(os.path.dirname(fn))
+        except OSError as ose:
+            if ose.errno != errno.EEXIST:
+                raise
+        if dtype == "json":
+            write_json_file(data, fn)
+        else:
+            with open(fn + ".tmp", "wb") as f:
+                f.write(data)
+            os.replace(fn + ".tmp", fn)
+
+    def load(self, section, key, dtype):
+        """Return the entry, or raise KeyError if there is none."""
+        cache_fn = self._get_cache_fn(section, key, dtype)
+        try:
+            if dtype == "json":
+                with io.open(cache_fn, "r", encoding="utf-8") as cachef:
+                    return json.load(cachef)
+            with open(cache_fn, "rb") as cachef:
+                return cachef.read()
+        except IOError:
+            raise KeyError(key)  # No cache available
+
+    def describe(self, section, key, dtype):
+        fn = self._get_cache_fn(section, key, dtype)
+        try:
+            file_size = os.path.getsize(fn)
+        except (OSError, IOError) as oe:
+            file_size = str(oe)
+        return "%s (%s)" % (fn, file_size)
+
+    def close(self):
+        pass
+
+
+class SqliteCacheBackend(object):
+    """
+    All the entries in a single sqlite database, <cachedir>/cache.sqlite
+    unless another filename is given.
+
+    Lookups are a single indexed read of a memory mapped database. Entries
+    can expire after ttl seconds, and the least recently used entries are
+    evicted once the values take up more than max_size bytes. Triggers keep
+    the total size in the meta table, so stores don't have to add up the
+    sizes of all the entries. WAL mode and per process connections make it
+    safe to share between processes.
+    """
+
+    # Only record an access if the last recorded one is older than this,
+    # so that loads don't all turn into writes.
+    ACCESS_RESOLUTION = 60
+
+    def __init__(self, root_dir, max_size=64 * 1024 * 1024, filename="cache.sqlite"):
+        self.root_dir = root_dir
+        self.path = os.path.join(root_dir, filename)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connect(self):
+        if self._conn is None or self._pid != os.getpid():
+            try:
+                os.makedirs(self.root_dir)
+            except OSError as ose:
+                if ose.errno != errno.EEXIST:
+                    raise
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=%d" % self.max_size)
+            # INSERT OR REPLACE only runs the delete trigger with these
+            conn.execute("PRAGMA recursive_triggers=ON")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "section TEXT NOT NULL, key TEXT NOT NULL, dtype TEXT NOT NULL, "
+                    "value BLOB NOT NULL, size INTEGER NOT NULL, expires REAL, "
+                    "accessed REAL NOT NULL, PRIMARY KEY (section, key, dtype))"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)"
+                )
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS meta ("
+                    "name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT "
+                    "ON entries BEGIN UPDATE meta SET value = value + new.size "
+                    "WHERE name = 'size'; END"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE "
+                    "ON entries BEGIN UPDATE meta SET value = value - old.size "
+                    "WHERE name = 'size'; END"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size "
+                    "ON entries BEGIN UPDATE meta SET value = value + new.size - "
+                    "old.size WHERE name = 'size'; END"
+                )
+                # Databases of older versions have entries but no total yet
+                if (
+                    conn.execute("SELECT 1 FROM meta WHERE name = 'size'").fetchone()
+                    is None
+                ):
+                    conn.execute(
+                        "INSERT OR IGNORE INTO meta "
+                        "SELECT 'size', COALESCE(SUM(size), 0) FROM entries"
+                    )
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def store(self, section, key, data, dtype, ttl=None):
+        if dtype == "json":
+            data = json.dumps(data).encode("utf-8")
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (section, key, dtype, data, len(data), expires, now),
+                )
+                conn.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+                self._evict(conn)
+
+    def _evict(self, conn):
+        total = conn.execute("SELECT value FROM meta WHERE name = 'size'").fetchone()[0]
+        if total <= self.max_size:
+            return
+        # Make some room, so that the next stores don't all evict again
+        excess = total - self.max_size * 9 // 10
+        rows = conn.execute("SELECT rowid, size FROM entries ORDER BY accessed")
+        evicted = []
+        for rowid, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((rowid,))
+            excess -= size
+        conn.executemany("DELETE FROM entries WHERE rowid = ?", evicted)
+
+    def load(self, section, key, dtype):
+        """Return the entry, or raise KeyError if there is none."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires, accessed FROM entries "
+                "WHERE section = ? AND key = ? AND dtype = ?",
+                (section, key, dtype),
+            ).fetchone()
+            if row is None or (row[1] is not None and row[1] <= now):
+                raise KeyError(key)
+            if row[2] < now - self.ACCESS_RESOLUTION:
+                with conn:
+                    conn.execute(
+                        "UPDATE entries SET accessed = ? "
+                        "WHERE section = ? AND key = ? AND dtype = ?",
+                        (now, section, key, dtype),
+                    )
+
+        value = bytes(row[0])
+        if dtype == "json":
+            return json.loads(value.decode("utf-8"))
+        return value
+
+    def clear(self, section):
+        """Remove all the entries of section."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM entries WHERE section = ?", (section,))
+
+    def describe(self, section, key, dtype):
+        return "%s [%s/%s.%s]" % (self.path, section, key, dtype)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 class Cache(object):
     def __init__(self, ydl):
         self._ydl = ydl
+        self._backend = None
 
-    def _get_root_dir(self):
-        res = self._ydl.params.get("cachedir")
+    @staticmethod
+    def root_dir(params):
+        res = params.get("cachedir")
         if res is None:
             cache_root = compat_getenv("XDG_CACHE_HOME", "~/.cache")
             res = os.path.join(cache_root, "youtube-dl")
         return expand_path(res)
 
-    def _get_cache_fn(self, section, key, dtype):
-        assert re.match(r"^[a-zA-Z0-9_.-]+$", section), "invalid section %r" % section
-        assert re.match(r"^[a-zA-Z0-9_.-]+$", key), "invalid key %r" % key
-        return os.path.join(self._get_root_dir(), section, "%s.%s" % (key, dtype))
+    def _get_root_dir(self):
+        return self.root_dir(self._ydl.params)
 
     @property
     def enabled(self):
         return self._ydl.params.get("cachedir") is not False
 
-    def store(self, section, key, data, dtype="json"):
-        assert dtype in ("json",)
+    @property
+    def backend(self):
+        """The backend selected by the cache_backend option, "file" by default."""
+        if self._backend is None:
+            name = self._ydl.params.get("cache_backend") or "file"
+            root_dir = self._get_root_dir()
+            if name == "file":
+                self._backend = FileCacheBackend(root_dir)
+            elif name == "sqlite":
+                max_size = self._ydl.params.get("cache_max_size")
+                if max_size is None:
+                    self._backend = SqliteCacheBackend(root_dir)
+                else:
+                    self._backend = SqliteCacheBackend(root_dir, max_size)
+            else:
+                raise ValueError("invalid cache backend %r" % name)
+        return self._backend
+
+    def _check(self, section, key, dtype):
+        assert dtype in DTYPES
+        assert re.match(r"^[a-zA-Z0-9_.-]+$", section), "invalid section %r" % section
+        assert re.match(r"^[a-zA-Z0-9_.-]+$", key), "invalid key %r" % key
+
+    def store(self, section, key, data, dtype="json", ttl=None):
+        """
+        Store data, which must be JSON serialisable for dtype "json" and
+        bytes for dtype "bytes". With ttl, the entry expires after that many
+        seconds (not supported by the file backend).
+        """
+        self._check(section, key, dtype)
 
         if not self.enabled:
             return
 
-        fn = self._get_cache_fn(section, key, dtype)
         try:
-            try:
-                os.makedirs(os.path.dirname(fn))
-            except OSError as ose:
-                if ose.errno != errno.EEXIST:
-                    raise
-            write_json_file(data, fn)
+            self.backend.store(section, key, data, dtype, ttl)
         except Exception:
             tb = traceback.format_exc()
-            self._ydl.report_warning("Writing cache to %r failed: %s" % (fn, tb))
+            self._ydl.report_warning(
+                "Writing cache to %r failed: %s"
+                % (self.backend.describe(section, key, dtype), tb)
+            )
 
     def load(self, section, key, dtype="json", default=None):
-        assert dtype in ("json",)
+        self._check(section, key, dtype)
 
         if not self.enabled:
             return default
 
-        cache_fn = self._get_cache_fn(section, key, dtype)
         try:
-            try:
-                with io.open(cache_fn, "r", encoding="utf-8") as cachef:
-                    return json.load(cachef)
-            except ValueError:
-                try:
-                    file_size = os.path.getsize(cache_fn)
-                except (OSError, IOError) as oe:
-                    file_size = str(oe)
-                self._ydl.report_warning(
-                    "Cache retrieval from %s failed (%s)" % (cache_fn, file_size)
-                )
-        except IOError:
-            pass  # No cache available
+            return self.backend.load(section, key, dtype)
+        except KeyError:
+            pass
+        except (ValueError, sqlite3.Error):
+            self._ydl.report_warning(
+                "Cache retrieval from %s failed"
+                % self.backend.describe(section, key, dtype)
+            )
 
         return default
 
@@ -91,6 +319,10 @@ class Cache(object):
                 % cachedir
             )
 
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+
         self._ydl.to_screen("Removing cache dir %s ." % cachedir, skip_eol=True)
         if os.path.exists(cachedir):
             self._ydl.to_screen(".", skip_eol=True)
@@ -12,6 +12,12 @@ from .external import (
     get_external_downloader,
     FFmpegFD,
 )
+from .sink import (
+    AsyncQueueSink,
+    CallbackSink,
+    DownloadSink,
+    PipeSink,
+)
 
 from ..utils import (
     determine_protocol,
@@ -44,7 +50,7 @@ def get_suitable_downloader(info_dict, params={}):
             return ed
 
     if protocol.startswith("m3u8") and info_dict.get("is_live"):
-        return FFmpegFD
+        return HlsFD if params.get("hls_prefer_native") is True else FFmpegFD
 
     if protocol == "m3u8" and params.get("hls_prefer_native") is True:
         return HlsFD
@@ -58,4 +64,8 @@ def get_suitable_downloader(info_dict, params={}):
 __all__ = [
     "get_suitable_downloader",
     "FileDownloader",
+    "DownloadSink",
+    "CallbackSink",
+    "PipeSink",
+    "AsyncQueueSink",
 ]
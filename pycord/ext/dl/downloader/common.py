@@ -6,12 +6,20 @@ import sys
 import time
 import random
 
-from ..compat import compat_os_name
+from .ratelimit import (
+    shared_bucket,
+    TokenBucket,
+)
+from ..compat import (
+    compat_os_name,
+    compat_urllib_parse_urlparse,
+)
 from ..utils import (
     decodeArgument,
     encodeFilename,
     error_to_compat_str,
     format_bytes,
+    sanitize_open,
     shell_quote,
     timeconvert,
 )
@@ -32,6 +40,10 @@ class FileDownloader(object):
     verbose:            Print additional info to stdout.
     quiet:              Do not print messages to stdout.
     ratelimit:          Download speed limit, in bytes/sec.
+    host_ratelimit:     Download speed limit for all the downloads of the
+                        process from the same host together, in bytes/sec.
+    global_ratelimit:   Download speed limit for all the downloads of the
+                        process together, in bytes/sec.
     retries:            Number of times to retry for HTTP error 5xx
     buffersize:         Size of download buffer in bytes.
     noresizebuffer:     Do not automatically resize the download buffer.
@@ -51,12 +63,19 @@ class FileDownloader(object):
     http_chunk_size:    Size of a chunk for chunk-based HTTP downloading. May be
                         useful for bypassing bandwidth throttling imposed by
                         a webserver (experimental)
+    http_connections:   Number of connections for HTTP downloads, each one
+                        fetching a different byte range, if the webserver
+                        supports ranges (default 1).
 
     Subclasses of this one must re-define the real_download method.
     """
 
     _TEST_FILE_SIZE = 10241
     params = None
+    # Whether download() can write to a sink instead of a file
+    SUPPORTS_SINK = False
+    sink = None
+    _ratelimit_bucket = None
 
     def __init__(self, ydl, params):
         """Create a FileDownloader object with the given options."""
@@ -136,6 +155,15 @@ class FileDownloader(object):
             return int(new_min)
         return int(rate)
 
+    @classmethod
+    def smooth_block_size(cls, block_size, elapsed_time, bytes):
+        """
+        Move block_size halfway towards best_block_size() for a read of
+        bytes that took elapsed_time, so that one fast or slow read doesn't
+        make it swing.
+        """
+        return (block_size + cls.best_block_size(elapsed_time, bytes) + 1) // 2
+
     @staticmethod
     def parse_bytes(bytestr):
         """Parse a string indicating a byte quantity into an integer."""
@@ -164,21 +192,69 @@ class FileDownloader(object):
     def report_error(self, *args, **kargs):
         self.ydl.report_error(*args, **kargs)
 
-    def slow_down(self, start_time, now, byte_counter):
-        """Sleep if the download speed is over the rate limit."""
+    def ratelimit_bucket(self):
+        """The TokenBucket for ratelimit, None if there is no rate limit."""
         rate_limit = self.params.get("ratelimit")
-        if rate_limit is None or byte_counter == 0:
-            return
-        if now is None:
-            now = time.time()
-        elapsed = now - start_time
-        if elapsed <= 0.0:
-            return
-        speed = float(byte_counter) / elapsed
-        if speed > rate_limit:
-            sleep_time = float(byte_counter) / rate_limit - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        if not rate_limit:
+            return None
+        if self._ratelimit_bucket is None:
+            self._ratelimit_bucket = TokenBucket(rate_limit)
+        elif self._ratelimit_bucket.rate != rate_limit:
+            self._ratelimit_bucket.set_rate(rate_limit)
+        return self._ratelimit_bucket
+
+    def _rate_buckets(self, url):
+        buckets = []
+        bucket = self.ratelimit_bucket()
+        if bucket is not None:
+            buckets.append(bucket)
+        host_rate_limit = self.params.get("host_ratelimit")
+        if host_rate_limit and url:
+            host = compat_urllib_parse_urlparse(url).hostname
+            if host:
+                buckets.append(shared_bucket(("host", host), host_rate_limit))
+        global_rate_limit = self.params.get("global_ratelimit")
+        if global_rate_limit:
+            buckets.append(shared_bucket(("global",), global_rate_limit))
+        return buckets
+
+    def throttle(self, byte_count, url=None):
+        """
+        Sleep after downloading byte_count bytes from url as long as needed
+        to keep this download under ratelimit, and all the downloads of the
+        process under host_ratelimit (per host) and global_ratelimit.
+        Returns how long it slept.
+        """
+        sleep_time = 0
+        for bucket in self._rate_buckets(url):
+            sleep_time = max(sleep_time, bucket.consume(byte_count))
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+        return sleep_time
+
+    def throttled_block_size(self, url=None):
+        """
+        The most to read at once from url under the rate limits, or None if
+        there are none: what the lowest one lets through in one go. Reading
+        more would make the downloads sharing a limit wait for each other in
+        long turns.
+        """
+        buckets = self._rate_buckets(url)
+        if not buckets:
+            return None
+        return max(int(min(bucket.burst for bucket in buckets)), 1)
+
+    def ratelimit_for(self, url):
+        """
+        The lowest rate limit that applies to downloads from url, for
+        downloaders that can only be given a fixed one.
+        """
+        rate_limits = [
+            self.params.get(param)
+            for param in ("ratelimit", "host_ratelimit", "global_ratelimit")
+        ]
+        rate_limits = [rate_limit for rate_limit in rate_limits if rate_limit]
+        return min(rate_limits) if rate_limits else None
 
     def temp_name(self, filename):
         """Returns a temporary filename for the given filename."""
@@ -201,6 +277,12 @@ class FileDownloader(object):
     def ytdl_filename(self, filename):
         return filename + ".ytdl"
 
+    def open_output(self, filename, open_mode):
+        """sanitize_open(), but "-" is the sink if there is one."""
+        if filename == "-" and self.sink is not None:
+            return (self.sink, filename)
+        return sanitize_open(filename, open_mode)
+
     def try_rename(self, old_filename, new_filename):
         try:
             if old_filename == new_filename:
@@ -337,10 +419,26 @@ class FileDownloader(object):
         """Report it was impossible to resume download."""
         self.to_screen("[download] Unable to resume")
 
-    def download(self, filename, info_dict):
+    def download(self, filename, info_dict, sink=None):
         """Download to a filename using the info from info_dict
         Return True on success and False otherwise
+
+        With a sink (see downloader.sink, only for downloaders with
+        SUPPORTS_SINK), the data is written to it instead of a file, like for
+        the "-" (stdout) filename. The sink is closed once the download is
+        over.
         """
+        if sink is not None:
+            if not self.SUPPORTS_SINK:
+                raise ValueError(
+                    "%s can't download to a sink" % self.__class__.__name__
+                )
+            self.sink = sink
+            try:
+                return self.download("-", info_dict)
+            finally:
+                self.sink = None
+                sink.close()
 
         nooverwrites_and_exists = self.params.get(
             "nooverwrites", False
@@ -90,6 +90,15 @@ class ExternalFD(FileDownloader):
     def _option(self, command_option, param):
         return cli_option(self.params, command_option, param)
 
+    def _ratelimit_option(self, command_option, info_dict):
+        # The external downloader can't draw from the host and global budgets
+        # shared with the other downloads, it is held to the lowest rate
+        return cli_option(
+            {"ratelimit": self.ratelimit_for(info_dict["url"])},
+            command_option,
+            "ratelimit",
+        )
+
     def _bool_option(
         self,
         command_option,
@@ -131,7 +140,7 @@ class CurlFD(ExternalFD):
         cmd += self._bool_option("--continue-at", "continuedl", "-", "0")
         cmd += self._valueless_option("--silent", "noprogress")
         cmd += self._valueless_option("--verbose", "verbose")
-        cmd += self._option("--limit-rate", "ratelimit")
+        cmd += self._ratelimit_option("--limit-rate", info_dict)
         retry = self._option("--retry", "retries")
         if len(retry) == 2:
             if retry[1] in ("inf", "infinite"):
@@ -175,7 +184,7 @@ class WgetFD(ExternalFD):
         cmd = [self.exe, "-O", tmpfilename, "-nv", "--no-cookies"]
         for key, val in info_dict["http_headers"].items():
             cmd += ["--header", "%s: %s" % (key, val)]
-        cmd += self._option("--limit-rate", "ratelimit")
+        cmd += self._ratelimit_option("--limit-rate", info_dict)
         retry = self._option("--tries", "retries")
         if len(retry) == 2:
             if retry[1] in ("inf", "infinite"):
@@ -205,6 +214,7 @@ class Aria2cFD(ExternalFD):
             cmd += ["--header", "%s: %s" % (key, val)]
         cmd += self._option("--interface", "source_address")
         cmd += self._option("--all-proxy", "proxy")
+        cmd += self._ratelimit_option("--max-download-limit", info_dict)
         cmd += self._bool_option(
             "--check-certificate", "nocheckcertificate", "false", "true", "="
         )
@@ -1,16 +1,29 @@
 from __future__ import division, unicode_literals
 
+import collections
+import errno
+import functools
+import itertools
 import os
+import socket
+import struct
+import threading
 import time
 import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 
 from .common import FileDownloader
 from .http import HttpFD
+from ..compat import compat_urllib_error
 from ..utils import (
+    ContentTooShortError,
+    DownloadError,
     error_to_compat_str,
     encodeFilename,
+    int_or_none,
     sanitize_open,
     sanitized_Request,
+    timeconvert,
 )
 
 
@@ -30,29 +43,50 @@ class FragmentFD(FileDownloader):
     skip_unavailable_fragments:
                         Skip unavailable fragments (DASH and hlsnative only)
     keep_fragments:     Keep downloaded fragments on disk after downloading is
-                        finished
+                        finished. Otherwise fragments are downloaded into
+                        memory and never written to disk on their own.
+    concurrent_fragment_downloads:
+                        Number of fragments to download at the same time
+                        (DASH and hlsnative only, default 1). Fragments are
+                        still appended in order, those done before the
+                        fragments preceding them are spilled to disk.
 
     For each incomplete fragment download youtube-dl keeps on disk a special
     bookkeeping file with download state and metadata (in future such files will
     be used for any incomplete download handled by youtube-dl). This file is
     used to properly handle resuming, check download file consistency and detect
-    potential errors. The file has a .ytdl extension and represents a standard
-    JSON file of the following format:
+    potential errors. The file has a .ytdl extension and is an append-only
+    journal: _JOURNAL_MAGIC followed by a _JOURNAL_RECORD for every fragment
+    appended to the temporary file, made of:
 
-    extractor:
-        Dictionary of extractor related data. TBD.
+    index:  Fragment index the download can resume after
+    size:   Size of the temporary file once the fragment was appended
 
-    downloader:
-        Dictionary of downloader related data. May contain following data:
-            current_fragment:
-                Dictionary with current (being downloaded) fragment data:
-                index:  0-based index of current fragment among all fragments
-            fragment_count:
-                Total count of fragments
+    Resuming goes back to the last record whose data made it to the temporary
+    file, so a fragment that was only partly written (or written but not
+    recorded) is downloaded again. The records don't depend on the order they
+    were written in. The JSON .ytdl files of older versions are still read.
+
+    Concurrent downloads finish fragments out of order. Until the fragments
+    before them are appended, these are written to a .ytdl.spill file:
+    _SPILL_MAGIC followed, for every fragment, by a _JOURNAL_RECORD of its
+    index and length and its content. A download resumes with the spilled
+    fragments instead of downloading them again, and the file is emptied
+    whenever all of them were appended.
 
     This feature is experimental and file format may change in future.
     """
 
+    SUPPORTS_SINK = True
+
+    _ytdl_stream = None
+    _dest_stream = None
+    _spill_stream = None
+
+    _JOURNAL_MAGIC = b"ytdl-fragments\n\x01"
+    _SPILL_MAGIC = b"ytdl-spill\n\x01"
+    _JOURNAL_RECORD = struct.Struct("<IQ")
+
     def report_retry_fragment(self, err, frag_index, count, retries):
         self.to_screen(
             "[download] Got server HTTP error: %s. Retrying fragment %d (attempt %d of %s)..."
@@ -79,31 +113,154 @@ class FragmentFD(FileDownloader):
     def __do_ytdl_file(ctx):
         return not ctx["live"] and not ctx["tmpfilename"] == "-"
 
-    def _read_ytdl_file(self, ctx):
+    def _read_ytdl_file(self, ctx, resume_len):
+        """
+        Set ctx["fragment_index"] from the .ytdl file, and return how much of
+        the resume_len bytes of the temporary file it accounts for.
+        """
         assert "ytdl_corrupt" not in ctx
-        stream, _ = sanitize_open(self.ytdl_filename(ctx["filename"]), "r")
+        stream, _ = sanitize_open(self.ytdl_filename(ctx["filename"]), "rb")
         try:
-            ctx["fragment_index"] = json.loads(stream.read())["downloader"][
-                "current_fragment"
-            ]["index"]
+            journal = stream.read()
+            if journal.startswith(b"{"):
+                ctx["fragment_index"] = json.loads(journal.decode("utf-8"))[
+                    "downloader"
+                ]["current_fragment"]["index"]
+                return resume_len
+            if not journal.startswith(self._JOURNAL_MAGIC):
+                raise ValueError("Not a fragment journal")
+            record_size = self._JOURNAL_RECORD.size
+            # A record cut short by a crash is ignored
+            end = len(journal) - (len(journal) - len(self._JOURNAL_MAGIC)) % record_size
+            fragment_index, size = 0, 0
+            for offset in range(len(self._JOURNAL_MAGIC), end, record_size):
+                record = self._JOURNAL_RECORD.unpack_from(journal, offset)
+                if size <= record[1] <= resume_len:
+                    fragment_index, size = record
+            ctx["fragment_index"] = fragment_index
+            return size
         except Exception:
             ctx["ytdl_corrupt"] = True
+            return resume_len
         finally:
             stream.close()
 
-    def _write_ytdl_file(self, ctx):
-        frag_index_stream, _ = sanitize_open(self.ytdl_filename(ctx["filename"]), "w")
-        downloader = {
-            "current_fragment": {
-                "index": ctx["fragment_index"],
-            },
-        }
-        if ctx.get("fragment_count") is not None:
-            downloader["fragment_count"] = ctx["fragment_count"]
-        frag_index_stream.write(json.dumps({"downloader": downloader}))
-        frag_index_stream.close()
+    def _open_ytdl_file(self, ctx, resume_len):
+        """
+        Start a new .ytdl file, with the fragments up to ctx["fragment_index"]
+        in the first resume_len bytes of the temporary file.
+        """
+        stream = open(encodeFilename(self.ytdl_filename(ctx["filename"])), "wb", 0)
+        header = self._JOURNAL_MAGIC
+        if ctx["fragment_index"]:
+            header += self._JOURNAL_RECORD.pack(ctx["fragment_index"], resume_len)
+        stream.write(header)
+        self._ytdl_stream = stream
+
+    def _write_ytdl_file(self, ctx, size):
+        self._ytdl_stream.write(
+            self._JOURNAL_RECORD.pack(ctx["fragment_index"], size)
+        )
 
-    def _download_fragment(self, ctx, frag_url, info_dict, headers=None):
+    def _close_ytdl_file(self):
+        if self._ytdl_stream is not None:
+            self._ytdl_stream.close()
+            self._ytdl_stream = None
+        if self._spill_stream is not None:
+            self._spill_stream.close()
+            self._spill_stream = None
+
+    def spill_filename(self, filename):
+        return self.ytdl_filename(filename) + ".spill"
+
+    def _read_spill_file(self, ctx):
+        """
+        Set ctx["spilled"] to the fragments after ctx["fragment_index"] in the
+        .ytdl.spill file, {frag_index: (offset, length)}, and open it.
+        """
+        ctx["spilled"] = {}
+        spill_filename = encodeFilename(self.spill_filename(ctx["filename"]))
+        if not os.path.isfile(spill_filename):
+            return
+        stream = open(spill_filename, "r+b")
+        self._spill_stream = stream
+        file_size = os.fstat(stream.fileno()).st_size
+        record_size = self._JOURNAL_RECORD.size
+        end = 0
+        if stream.read(len(self._SPILL_MAGIC)) == self._SPILL_MAGIC:
+            end = len(self._SPILL_MAGIC)
+            # A fragment cut short by a crash is ignored
+            while end + record_size <= file_size:
+                frag_index, length = self._JOURNAL_RECORD.unpack(
+                    stream.read(record_size)
+                )
+                if end + record_size + length > file_size:
+                    break
+                if frag_index > ctx["fragment_index"]:
+                    ctx["spilled"][frag_index] = (end + record_size, length)
+                end += record_size + length
+                stream.seek(end)
+        if not ctx["spilled"]:
+            end = 0
+        stream.seek(end)
+        stream.truncate()
+        if not end:
+            stream.write(self._SPILL_MAGIC)
+
+    def _spill_fragment(self, ctx, frag_index, frag_content):
+        if self._spill_stream is None:
+            self._spill_stream = open(
+                encodeFilename(self.spill_filename(ctx["filename"])), "w+b"
+            )
+            self._spill_stream.write(self._SPILL_MAGIC)
+        stream = self._spill_stream
+        stream.seek(0, os.SEEK_END)
+        stream.write(self._JOURNAL_RECORD.pack(frag_index, len(frag_content)))
+        ctx["spilled"][frag_index] = (stream.tell(), len(frag_content))
+        stream.write(frag_content)
+
+    def _read_spilled_fragment(self, ctx, frag_index):
+        """The content of a spilled fragment, or None."""
+        entry = ctx.get("spilled", {}).get(frag_index)
+        if entry is None:
+            return None
+        self._spill_stream.seek(entry[0])
+        return self._spill_stream.read(entry[1])
+
+    def _spill_done_fragments(self, ctx, pending):
+        """Spill the fragments after the first pending one that are done."""
+        for fragment, future in itertools.islice(pending, 1, None):
+            if fragment["frag_index"] in ctx["spilled"] or not future.done():
+                continue
+            if future.exception() is not None:
+                continue
+            _, success, frag_content = future.result()
+            if success and frag_content is not None:
+                self._spill_fragment(ctx, fragment["frag_index"], frag_content)
+
+    def download(self, filename, info_dict, sink=None):
+        try:
+            return super(FragmentFD, self).download(filename, info_dict, sink=sink)
+        finally:
+            # Still open if the download failed, the temporary file isn't
+            # flushed after every fragment
+            self._close_ytdl_file()
+            if self._dest_stream is not None:
+                self._dest_stream.close()
+                self._dest_stream = None
+
+    def _download_fragment(
+        self, ctx, frag_url, info_dict, headers=None, make_decryptor=None
+    ):
+        """
+        Download a fragment, and decrypt it if make_decryptor is given. It is
+        called for every attempt and returns a new decryptor (see
+        aes_cbc_decryptor) or None. Returns (success, content).
+        """
+        if not self.params.get("keep_fragments", False):
+            return self._read_fragment(
+                ctx, frag_url, info_dict, headers, make_decryptor
+            )
         fragment_filename = "%s-Frag%d" % (ctx["tmpfilename"], ctx["fragment_index"])
         fragment_info_dict = {
             "url": frag_url,
@@ -118,18 +275,319 @@ class FragmentFD(FileDownloader):
         ctx["fragment_filename_sanitized"] = frag_sanitized
         frag_content = down.read()
         down.close()
+        decryptor = make_decryptor() if make_decryptor else None
+        if decryptor is not None:
+            frag_content = decryptor.update(frag_content) + decryptor.finalize()
         return True, frag_content
 
+    def _read_fragment(
+        self, ctx, frag_url, info_dict, headers=None, make_decryptor=None
+    ):
+        """
+        Download a fragment into memory, with the same retries and progress
+        reports as the HttpFD used for fragments kept on disk. With
+        make_decryptor, every block is decrypted in place as soon as it is
+        read, by a new decryptor for every attempt.
+
+        The content is a memoryview of ctx["fragment_buffer"], which is
+        reused by the next fragment downloaded with the same ctx, so it has
+        to be used up before.
+        """
+        dl = ctx["dl"]
+        headers = dict(headers or info_dict.get("http_headers") or {})
+        # Do not include the Accept-Encoding header
+        headers["Youtubedl-no-compression"] = "True"
+        is_test = self.params.get("test", False)
+        if is_test:
+            headers["Range"] = "bytes=0-%d" % (self._TEST_FILE_SIZE - 1)
+        request = sanitized_Request(frag_url, None, headers)
+
+        count = 0
+        retries = self.params.get("retries", 0)
+        while count <= retries:
+            # A retry reads the fragment again from the beginning
+            decryptor = make_decryptor() if make_decryptor else None
+            try:
+                urlh = self.ydl.urlopen(request)
+                data_len = int_or_none(urlh.info().get("Content-length"))
+                if is_test and (data_len is None or data_len > self._TEST_FILE_SIZE):
+                    data_len = self._TEST_FILE_SIZE
+
+                buf = ctx.get("fragment_buffer")
+                if buf is None or (data_len is not None and len(buf) < data_len):
+                    # Never resized in place, the previous content may still
+                    # be referenced
+                    buf = ctx["fragment_buffer"] = bytearray(data_len or 1024 * 1024)
+                view = memoryview(buf)
+
+                byte_counter = 0
+                # Bytes decrypted in place at the start of the buffer
+                decrypted_counter = 0
+                block_size = self.params.get("buffersize", 1024)
+                resize_buffer = not self.params.get("noresizebuffer", False)
+                max_block_size = dl.throttled_block_size(frag_url)
+                start = time.time()
+                before = start
+                while data_len is None or byte_counter < data_len:
+                    if byte_counter == len(buf):
+                        buf = bytearray(2 * len(buf))
+                        buf[:byte_counter] = view
+                        ctx["fragment_buffer"] = buf
+                        view = memoryview(buf)
+                    end = len(buf) if data_len is None else data_len
+                    read = urlh.readinto(
+                        view[byte_counter : min(end, byte_counter + int(block_size))]
+                    )
+                    if not read:
+                        break
+                    if decryptor is not None:
+                        decrypted = decryptor.update(
+                            view[byte_counter : byte_counter + read]
+                        )
+                        view[decrypted_counter : decrypted_counter + len(decrypted)] = (
+                            decrypted
+                        )
+                        decrypted_counter += len(decrypted)
+                    byte_counter += read
+
+                    now = time.time()
+                    throttled = dl.throttle(read, frag_url)
+                    if resize_buffer:
+                        block_size = self.best_block_size(now - before, read)
+                    if resize_buffer and max_block_size:
+                        block_size = (
+                            max_block_size
+                            if throttled
+                            else min(block_size, max_block_size)
+                        )
+                    before = time.time()
+                    dl._hook_progress(
+                        {
+                            "status": "downloading",
+                            "downloaded_bytes": byte_counter,
+                            "total_bytes": data_len,
+                            "filename": ctx["filename"],
+                            "speed": self.calc_speed(start, now, byte_counter),
+                            "elapsed": now - start,
+                        }
+                    )
+
+                if data_len is not None and byte_counter != data_len:
+                    raise ContentTooShortError(byte_counter, data_len)
+                if decryptor is not None:
+                    decrypted = decryptor.finalize()
+                    view[decrypted_counter : decrypted_counter + len(decrypted)] = (
+                        decrypted
+                    )
+            except compat_urllib_error.HTTPError as err:
+                if err.code < 500 or err.code >= 600:
+                    # Unexpected HTTP error, retried as a fragment
+                    raise
+                error = err
+            except compat_urllib_error.URLError as err:
+                if not isinstance(getattr(err, "reason", None), socket.timeout):
+                    raise
+                error = err
+            except socket.timeout as err:
+                error = err
+            except socket.error as err:
+                if err.errno not in (errno.ECONNRESET, errno.ETIMEDOUT):
+                    raise
+                error = err
+            except ContentTooShortError as err:
+                error = err
+            else:
+                if self.params.get("updatetime", True):
+                    filetime = timeconvert(urlh.info().get("last-modified"))
+                    if filetime:
+                        ctx["fragment_filetime"] = filetime
+                dl._hook_progress(
+                    {
+                        "status": "finished",
+                        "downloaded_bytes": byte_counter,
+                        "total_bytes": byte_counter,
+                        "filename": ctx["filename"],
+                        "elapsed": time.time() - start,
+                    }
+                )
+                return True, view[:byte_counter]
+
+            count += 1
+            if count <= retries:
+                dl.report_retry(error, count, retries)
+
+        dl.report_error("giving up after %s retries" % retries)
+        return False, None
+
+    def _fetch_fragment(self, ctx, fragment, info_dict, decryptor=None):
+        """
+        Download a fragment of _download_fragments(), retrying it on HTTP
+        errors. Returns (success, content), with None content if the
+        fragment was skipped.
+        """
+        fragment_retries = self.params.get("fragment_retries", 0)
+        frag_index = fragment["frag_index"]
+        count = 0
+        while count <= fragment_retries:
+            try:
+                success, frag_content = self._download_fragment(
+                    ctx,
+                    fragment["url"],
+                    info_dict,
+                    fragment.get("headers"),
+                    functools.partial(decryptor, fragment) if decryptor else None,
+                )
+                if not success:
+                    return False, None
+                return True, frag_content
+            except compat_urllib_error.HTTPError as err:
+                # Unavailable (possibly temporary) fragments may be served.
+                # First we try to retry then either skip or abort.
+                # See https://github.com/ytdl-org/youtube-dl/issues/10165,
+                # https://github.com/ytdl-org/youtube-dl/issues/10448).
+                count += 1
+                if count <= fragment_retries:
+                    self.report_retry_fragment(err, frag_index, count, fragment_retries)
+            except DownloadError:
+                # Don't retry fragment if error occurred during HTTP downloading
+                # itself since it has own retry settings
+                if not fragment["fatal"]:
+                    self.report_skip_fragment(frag_index)
+                    return True, None
+                raise
+
+        if not fragment["fatal"]:
+            self.report_skip_fragment(frag_index)
+            return True, None
+        self.report_error("giving up after %s fragment retries" % fragment_retries)
+        return False, None
+
+    def _download_fragments(self, ctx, fragments, info_dict, decryptor=None):
+        """
+        Download fragments and append them to the destination in order.
+
+        fragments is a list of dicts with the 1-based frag_index, the url,
+        optionally the http headers, and whether the download has to be
+        aborted if the fragment is unavailable (fatal). decryptor, if given,
+        is called with a fragment and returns a new decryptor for it (see
+        aes_cbc_decryptor) or None. Fragments before ctx["fragment_index"] are already
+        downloaded and skipped. Returns whether the download succeeded.
+        """
+        fragments = [f for f in fragments if f["frag_index"] > ctx["fragment_index"]]
+        max_workers = self.params.get("concurrent_fragment_downloads") or 1
+
+        if max_workers <= 1:
+            for fragment in fragments:
+                frag_content = self._read_spilled_fragment(ctx, fragment["frag_index"])
+                if frag_content is not None:
+                    ctx["fragment_index"] = fragment["frag_index"]
+                    self._append_fragment(ctx, frag_content)
+                    continue
+                success, frag_content = self._fetch_fragment(
+                    ctx, fragment, info_dict, decryptor
+                )
+                if not success:
+                    return False
+                if frag_content is None:
+                    continue
+                self._append_fragment(ctx, frag_content)
+            return True
+
+        def download(fragment):
+            # Every fragment gets its own downloader and copy of the context,
+            # only the main thread appends to the destination
+            frag_ctx = dict(
+                ctx,
+                fragment_index=fragment["frag_index"] - 1,
+                prev_frag_downloaded_bytes=0,
+                fragment_buffer=None,
+            )
+            frag_ctx["dl"] = self._make_fragment_downloader()
+            frag_ctx["dl"].add_progress_hook(ctx["make_frag_progress_hook"](frag_ctx))
+            success, frag_content = self._fetch_fragment(
+                frag_ctx, fragment, info_dict, decryptor
+            )
+            return frag_ctx, success, frag_content
+
+        # At most as many fragments waiting to be appended as are downloading
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="youtube-dl-fragment"
+        )
+        pending = collections.deque()
+        fragments = iter(fragments)
+        try:
+            while True:
+                for fragment in itertools.islice(
+                    fragments, 2 * max_workers - len(pending)
+                ):
+                    frag_content = self._read_spilled_fragment(
+                        ctx, fragment["frag_index"]
+                    )
+                    if frag_content is None:
+                        future = executor.submit(download, fragment)
+                    else:
+                        future = Future()
+                        future.set_result(({}, True, frag_content))
+                    pending.append((fragment, future))
+                if not pending:
+                    return True
+                fragment, future = pending[0]
+                if "spilled" in ctx and not future.done():
+                    # Keep what is done out of order in case of a crash
+                    self._spill_done_fragments(ctx, pending)
+                    wait(
+                        [f for _, f in pending if not f.done()],
+                        return_when=FIRST_COMPLETED,
+                    )
+                    continue
+                pending.popleft()
+                frag_ctx, success, frag_content = future.result()
+                if not success:
+                    return False
+                if frag_content is None:
+                    continue
+                if frag_ctx.get("fragment_filetime"):
+                    ctx["fragment_filetime"] = frag_ctx["fragment_filetime"]
+                if frag_ctx.get("fragment_filename_sanitized"):
+                    ctx["fragment_filename_sanitized"] = frag_ctx[
+                        "fragment_filename_sanitized"
+                    ]
+                ctx["fragment_index"] = fragment["frag_index"]
+                self._append_fragment(ctx, frag_content)
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            # Remove what was downloaded but not appended
+            for _, future in pending:
+                if future.cancelled() or future.exception() is not None:
+                    continue
+                frag_ctx = future.result()[0]
+                frag_filename = frag_ctx.get("fragment_filename_sanitized")
+                if frag_filename and not self.params.get("keep_fragments", False):
+                    try:
+                        os.remove(encodeFilename(frag_filename))
+                    except OSError:
+                        pass
+
     def _append_fragment(self, ctx, frag_content):
         try:
             ctx["dest_stream"].write(frag_content)
-            ctx["dest_stream"].flush()
-        finally:
+            # Readers of stdout and sinks want every fragment as it comes. The
+            # temporary file isn't flushed: after a crash, records of data
+            # that didn't make it to disk are ignored by _read_ytdl_file()
+            if ctx["tmpfilename"] == "-":
+                ctx["dest_stream"].flush()
             if self.__do_ytdl_file(ctx):
-                self._write_ytdl_file(ctx)
-            if not self.params.get("keep_fragments", False):
-                os.remove(encodeFilename(ctx["fragment_filename_sanitized"]))
-            del ctx["fragment_filename_sanitized"]
+                self._write_ytdl_file(ctx, ctx["dest_stream"].tell())
+                spilled = ctx["spilled"]
+                if spilled.pop(ctx["fragment_index"], None) and not spilled:
+                    self._spill_stream.seek(len(self._SPILL_MAGIC))
+                    self._spill_stream.truncate()
+        finally:
+            frag_filename = ctx.pop("fragment_filename_sanitized", None)
+            if frag_filename and not self.params.get("keep_fragments", False):
+                os.remove(encodeFilename(frag_filename))
 
     def _prepare_frag_download(self, ctx):
         if "live" not in ctx:
@@ -143,18 +601,7 @@ class FragmentFD(FileDownloader):
             total_frags_str = "unknown (live)"
         self.to_screen("[%s] Total fragments: %s" % (self.FD_NAME, total_frags_str))
         self.report_destination(ctx["filename"])
-        dl = HttpQuietDownloader(
-            self.ydl,
-            {
-                "continuedl": True,
-                "quiet": True,
-                "noprogress": True,
-                "ratelimit": self.params.get("ratelimit"),
-                "retries": self.params.get("retries", 0),
-                "nopart": self.params.get("nopart", False),
-                "test": self.params.get("test", False),
-            },
-        )
+        dl = self._make_fragment_downloader()
         tmpfilename = self.temp_name(ctx["filename"])
         open_mode = "wb"
         resume_len = 0
@@ -174,7 +621,7 @@ class FragmentFD(FileDownloader):
 
         if self.__do_ytdl_file(ctx):
             if os.path.isfile(encodeFilename(self.ytdl_filename(ctx["filename"]))):
-                self._read_ytdl_file(ctx)
+                journal_len = self._read_ytdl_file(ctx, resume_len)
                 is_corrupt = ctx.get("ytdl_corrupt") is True
                 is_inconsistent = ctx["fragment_index"] > 0 and resume_len == 0
                 if is_corrupt or is_inconsistent:
@@ -186,15 +633,24 @@ class FragmentFD(FileDownloader):
                     self.report_warning(
                         "%s. Restarting from the beginning..." % message
                     )
-                    ctx["fragment_index"] = resume_len = 0
+                    ctx["fragment_index"] = journal_len = 0
                     if "ytdl_corrupt" in ctx:
                         del ctx["ytdl_corrupt"]
-                    self._write_ytdl_file(ctx)
             else:
-                self._write_ytdl_file(ctx)
+                # Nothing says what is in the temporary file
+                journal_len = 0
                 assert ctx["fragment_index"] == 0
-
-        dest_stream, tmpfilename = sanitize_open(tmpfilename, open_mode)
+            if journal_len < resume_len:
+                # Drop what was written after the last recorded fragment
+                with open(encodeFilename(tmpfilename), "r+b") as stream:
+                    stream.truncate(journal_len)
+                resume_len = journal_len
+            self._open_ytdl_file(ctx, resume_len)
+            self._read_spill_file(ctx)
+
+        dest_stream, tmpfilename = self.open_output(tmpfilename, open_mode)
+        if tmpfilename != "-":
+            self._dest_stream = dest_stream
 
         ctx.update(
             {
@@ -206,6 +662,25 @@ class FragmentFD(FileDownloader):
             }
         )
 
+    def _make_fragment_downloader(self):
+        dl = HttpQuietDownloader(
+            self.ydl,
+            {
+                "continuedl": True,
+                "quiet": True,
+                "noprogress": True,
+                "ratelimit": self.params.get("ratelimit"),
+                "host_ratelimit": self.params.get("host_ratelimit"),
+                "global_ratelimit": self.params.get("global_ratelimit"),
+                "retries": self.params.get("retries", 0),
+                "nopart": self.params.get("nopart", False),
+                "test": self.params.get("test", False),
+            },
+        )
+        # ratelimit is for the whole download, not each fragment
+        dl._ratelimit_bucket = self.ratelimit_bucket()
+        return dl
+
     def _start_frag_download(self, ctx):
         resume_len = ctx["complete_frags_downloaded_bytes"]
         total_frags = ctx["total_frags"]
@@ -230,10 +705,20 @@ class FragmentFD(FileDownloader):
             }
         )
 
-        def frag_progress_hook(s):
-            if s["status"] not in ("downloading", "finished"):
-                return
+        # Concurrent fragment downloads report from several threads
+        progress_lock = threading.Lock()
+
+        def make_frag_progress_hook(frag_ctx):
+            def frag_progress_hook(s):
+                if s["status"] not in ("downloading", "finished"):
+                    return
+
+                with progress_lock:
+                    update_progress(frag_ctx, s)
+
+            return frag_progress_hook
 
+        def update_progress(frag_ctx, s):
             time_now = time.time()
             state["elapsed"] = time_now - start
             frag_total_bytes = s.get("total_bytes") or 0
@@ -247,16 +732,18 @@ class FragmentFD(FileDownloader):
 
             if s["status"] == "finished":
                 state["fragment_index"] += 1
-                ctx["fragment_index"] = state["fragment_index"]
+                if frag_ctx is ctx:
+                    # Concurrent downloads set it once the fragment is appended
+                    ctx["fragment_index"] = state["fragment_index"]
                 state["downloaded_bytes"] += (
-                    frag_total_bytes - ctx["prev_frag_downloaded_bytes"]
+                    frag_total_bytes - frag_ctx["prev_frag_downloaded_bytes"]
                 )
                 ctx["complete_frags_downloaded_bytes"] = state["downloaded_bytes"]
-                ctx["prev_frag_downloaded_bytes"] = 0
+                frag_ctx["prev_frag_downloaded_bytes"] = 0
             else:
                 frag_downloaded_bytes = s["downloaded_bytes"]
                 state["downloaded_bytes"] += (
-                    frag_downloaded_bytes - ctx["prev_frag_downloaded_bytes"]
+                    frag_downloaded_bytes - frag_ctx["prev_frag_downloaded_bytes"]
                 )
                 if not ctx["live"]:
                     state["eta"] = self.calc_eta(
@@ -267,19 +754,24 @@ class FragmentFD(FileDownloader):
                     )
                 state["speed"] = s.get("speed") or ctx.get("speed")
                 ctx["speed"] = state["speed"]
-                ctx["prev_frag_downloaded_bytes"] = frag_downloaded_bytes
+                frag_ctx["prev_frag_downloaded_bytes"] = frag_downloaded_bytes
             self._hook_progress(state)
 
-        ctx["dl"].add_progress_hook(frag_progress_hook)
+        ctx["make_frag_progress_hook"] = make_frag_progress_hook
+        ctx["dl"].add_progress_hook(make_frag_progress_hook(ctx))
 
         return start
 
     def _finish_frag_download(self, ctx):
         ctx["dest_stream"].close()
         if self.__do_ytdl_file(ctx):
+            self._close_ytdl_file()
             ytdl_filename = encodeFilename(self.ytdl_filename(ctx["filename"]))
             if os.path.isfile(ytdl_filename):
                 os.remove(ytdl_filename)
+            spill_filename = encodeFilename(self.spill_filename(ctx["filename"]))
+            if os.path.isfile(spill_filename):
+                os.remove(spill_filename)
         elapsed = time.time() - ctx["started"]
 
         if ctx["tmpfilename"] == "-":
@@ -1,34 +1,52 @@
 from __future__ import unicode_literals
 
+import collections
 import re
 import binascii
-
-try:
-    from Crypto.Cipher import AES
-
-    can_decrypt_frag = True
-except ImportError:
-    can_decrypt_frag = False
+import socket
+import threading
+import time
 
 from .fragment import FragmentFD
 from .external import FFmpegFD
 
+from ..aes import AES_BACKEND, aes_cbc_decryptor
 from ..compat import (
+    compat_http_client,
     compat_urllib_error,
     compat_urlparse,
     compat_struct_pack,
 )
 from ..utils import (
+    error_to_compat_str,
     parse_m3u8_attributes,
     update_url_query,
 )
 
 
 class HlsFD(FragmentFD):
-    """A limited implementation that does not require ffmpeg"""
+    """
+    A limited implementation that does not require ffmpeg
+
+    Live streams are recorded from the live edge, starting with the last
+    LIVE_START_FRAGMENTS fragments. When more than LIVE_WINDOW new
+    fragments are listed at once the download is falling behind, and only
+    the newest of them are downloaded.
+
+    Available options:
+
+    live_refresh_retries:
+                        Number of times to retry refreshing the playlist of a
+                        live stream on network errors, waiting twice as long
+                        every time (default 10). An HTTP 4xx error ends the
+                        download as the end of the stream.
+    """
 
     FD_NAME = "hlsnative"
 
+    LIVE_START_FRAGMENTS = 3
+    LIVE_WINDOW = 10
+
     @staticmethod
     def can_download(manifest, info_dict):
         UNSUPPORTED_FEATURES = (
@@ -53,9 +71,7 @@ class HlsFD(FragmentFD):
             not re.search(feature, manifest) for feature in UNSUPPORTED_FEATURES
         ]
         is_aes128_enc = "#EXT-X-KEY:METHOD=AES-128" in manifest
-        check_results.append(can_decrypt_frag or not is_aes128_enc)
         check_results.append(not (is_aes128_enc and r"#EXT-X-BYTERANGE" in manifest))
-        check_results.append(not info_dict.get("is_live"))
         return all(check_results)
 
     def real_download(self, filename, info_dict):
@@ -67,10 +83,12 @@ class HlsFD(FragmentFD):
         s = urlh.read().decode("utf-8", "ignore")
 
         if not self.can_download(s, info_dict):
-            if info_dict.get("extra_param_to_segment_url") or info_dict.get(
-                "_decryption_key_url"
-            ):
-                self.report_error("pycrypto not found. Please install it.")
+            if self.sink is not None:
+                # ffmpeg would write to the real stdout
+                self.report_error(
+                    "hlsnative has detected features it does not support, "
+                    "and ffmpeg can't download to a sink"
+                )
                 return False
             self.report_warning(
                 "hlsnative has detected features it does not support, "
@@ -81,71 +99,115 @@ class HlsFD(FragmentFD):
                 fd.add_progress_hook(ph)
             return fd.real_download(filename, info_dict)
 
-        def is_ad_fragment_start(s):
-            return (
-                s.startswith("#ANVATO-SEGMENT-INFO")
-                and "type=ad" in s
-                or s.startswith("#UPLYNK-SEGMENT")
-                and s.endswith(",ad")
-            )
+        fragments, ad_frags = self._parse_fragments(s, man_url, info_dict)
 
-        def is_ad_fragment_end(s):
-            return (
-                s.startswith("#ANVATO-SEGMENT-INFO")
-                and "type=master" in s
-                or s.startswith("#UPLYNK-SEGMENT")
-                and s.endswith(",segment")
+        if AES_BACKEND == "builtin" and "#EXT-X-KEY:METHOD=AES-128" in s:
+            self.report_warning(
+                "No native AES implementation found, decrypting with the much "
+                "slower builtin one. Install cryptography or pycryptodome."
             )
 
-        media_frags = 0
-        ad_frags = 0
-        ad_frag_next = False
-        for line in s.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("#"):
-                if is_ad_fragment_start(line):
-                    ad_frag_next = True
-                elif is_ad_fragment_end(line):
-                    ad_frag_next = False
-                continue
-            if ad_frag_next:
-                ad_frags += 1
-                continue
-            media_frags += 1
-
+        live = bool(info_dict.get("is_live"))
         ctx = {
             "filename": filename,
-            "total_frags": media_frags,
+            "total_frags": None if live else len(fragments),
             "ad_frags": ad_frags,
+            "live": live,
         }
 
         self._prepare_and_start_frag_download(ctx)
 
-        fragment_retries = self.params.get("fragment_retries", 0)
-        skip_unavailable_fragments = self.params.get("skip_unavailable_fragments", True)
         test = self.params.get("test", False)
 
+        # Fragments may be downloaded by several threads, each key is
+        # fetched once. Live streams may rotate keys forever, so only the
+        # most recent ones are kept.
+        keys = collections.OrderedDict()
+        key_lock = threading.Lock()
+
+        def get_key(decrypt_info):
+            key_url = info_dict.get("_decryption_key_url") or decrypt_info["URI"]
+            with key_lock:
+                key = keys.pop(key_url, None)
+                if key is None:
+                    key = self.ydl.urlopen(
+                        self._prepare_url(info_dict, key_url)
+                    ).read()
+                keys[key_url] = key
+                while len(keys) > 8:
+                    keys.popitem(last=False)
+                return key
+
+        def decryptor(fragment):
+            decrypt_info = fragment["decrypt_info"]
+            # Don't decrypt the content in tests since the data is explicitly truncated and it's not to a valid block
+            # size (see https://github.com/ytdl-org/youtube-dl/pull/27660). Tests only care that the correct data downloaded,
+            # not what it decrypts to.
+            if decrypt_info["METHOD"] != "AES-128" or test:
+                return None
+            iv = decrypt_info.get("IV") or compat_struct_pack(
+                ">8xq", fragment["media_sequence"]
+            )
+            return aes_cbc_decryptor(get_key(decrypt_info), iv)
+
+        if live:
+            success = self._download_live(ctx, man_url, s, info_dict, decryptor)
+        else:
+            # We only download the first fragment during the test
+            if test:
+                fragments = fragments[:1]
+            success = self._download_fragments(ctx, fragments, info_dict, decryptor)
+        if not success:
+            return False
+
+        self._finish_frag_download(ctx)
+
+        return True
+
+    @staticmethod
+    def _is_ad_fragment_start(s):
+        return (
+            s.startswith("#ANVATO-SEGMENT-INFO")
+            and "type=ad" in s
+            or s.startswith("#UPLYNK-SEGMENT")
+            and s.endswith(",ad")
+        )
+
+    @staticmethod
+    def _is_ad_fragment_end(s):
+        return (
+            s.startswith("#ANVATO-SEGMENT-INFO")
+            and "type=master" in s
+            or s.startswith("#UPLYNK-SEGMENT")
+            and s.endswith(",segment")
+        )
+
+    def _parse_fragments(self, s, man_url, info_dict):
+        """
+        Return the media fragments of the m3u8 playlist s, as expected by
+        _download_fragments(), and the number of ad fragments left out.
+        """
+        skip_unavailable_fragments = self.params.get("skip_unavailable_fragments", True)
+
         extra_query = None
         extra_param_to_segment_url = info_dict.get("extra_param_to_segment_url")
         if extra_param_to_segment_url:
             extra_query = compat_urlparse.parse_qs(extra_param_to_segment_url)
-        i = 0
         media_sequence = 0
         decrypt_info = {"METHOD": "NONE"}
         byte_range = {}
         frag_index = 0
+        ad_frags = 0
         ad_frag_next = False
+        fragments = []
         for line in s.splitlines():
             line = line.strip()
             if line:
                 if not line.startswith("#"):
                     if ad_frag_next:
+                        ad_frags += 1
                         continue
                     frag_index += 1
-                    if frag_index <= ctx["fragment_index"]:
-                        continue
                     frag_url = (
                         line
                         if re.match(r"^https?://", line)
@@ -153,70 +215,24 @@ class HlsFD(FragmentFD):
                     )
                     if extra_query:
                         frag_url = update_url_query(frag_url, extra_query)
-                    count = 0
-                    headers = info_dict.get("http_headers", {})
+                    headers = dict(info_dict.get("http_headers", {}))
                     if byte_range:
                         headers["Range"] = "bytes=%d-%d" % (
                             byte_range["start"],
                             byte_range["end"] - 1,
                         )
-                    while count <= fragment_retries:
-                        try:
-                            success, frag_content = self._download_fragment(
-                                ctx, frag_url, info_dict, headers
-                            )
-                            if not success:
-                                return False
-                            break
-                        except compat_urllib_error.HTTPError as err:
-                            # Unavailable (possibly temporary) fragments may be served.
-                            # First we try to retry then either skip or abort.
-                            # See https://github.com/ytdl-org/youtube-dl/issues/10165,
-                            # https://github.com/ytdl-org/youtube-dl/issues/10448).
-                            count += 1
-                            if count <= fragment_retries:
-                                self.report_retry_fragment(
-                                    err, frag_index, count, fragment_retries
-                                )
-                    if count > fragment_retries:
-                        if skip_unavailable_fragments:
-                            i += 1
-                            media_sequence += 1
-                            self.report_skip_fragment(frag_index)
-                            continue
-                        self.report_error(
-                            "giving up after %s fragment retries" % fragment_retries
-                        )
-                        return False
-                    if decrypt_info["METHOD"] == "AES-128":
-                        iv = decrypt_info.get("IV") or compat_struct_pack(
-                            ">8xq", media_sequence
-                        )
-                        decrypt_info["KEY"] = (
-                            decrypt_info.get("KEY")
-                            or self.ydl.urlopen(
-                                self._prepare_url(
-                                    info_dict,
-                                    info_dict.get("_decryption_key_url")
-                                    or decrypt_info["URI"],
-                                )
-                            ).read()
-                        )
-                        # Don't decrypt the content in tests since the data is explicitly truncated and it's not to a valid block
-                        # size (see https://github.com/ytdl-org/youtube-dl/pull/27660). Tests only care that the correct data downloaded,
-                        # not what it decrypts to.
-                        if not test:
-                            frag_content = AES.new(
-                                decrypt_info["KEY"], AES.MODE_CBC, iv
-                            ).decrypt(frag_content)
-                    self._append_fragment(ctx, frag_content)
-                    # We only download the first fragment during the test
-                    if test:
-                        break
-                    i += 1
+                    fragments.append(
+                        {
+                            "frag_index": frag_index,
+                            "url": frag_url,
+                            "headers": headers,
+                            "fatal": not skip_unavailable_fragments,
+                            "decrypt_info": decrypt_info,
+                            "media_sequence": media_sequence,
+                        }
+                    )
                     media_sequence += 1
                 elif line.startswith("#EXT-X-KEY"):
-                    decrypt_url = decrypt_info.get("URI")
                     decrypt_info = parse_m3u8_attributes(line[11:])
                     if decrypt_info["METHOD"] == "AES-128":
                         if "IV" in decrypt_info:
@@ -231,8 +247,6 @@ class HlsFD(FragmentFD):
                             decrypt_info["URI"] = update_url_query(
                                 decrypt_info["URI"], extra_query
                             )
-                        if decrypt_url != decrypt_info["URI"]:
-                            decrypt_info["KEY"] = None
                 elif line.startswith("#EXT-X-MEDIA-SEQUENCE"):
                     media_sequence = int(line[22:])
                 elif line.startswith("#EXT-X-BYTERANGE"):
@@ -246,11 +260,116 @@ class HlsFD(FragmentFD):
                         "start": sub_range_start,
                         "end": sub_range_start + int(splitted_byte_range[0]),
                     }
-                elif is_ad_fragment_start(line):
+                elif self._is_ad_fragment_start(line):
                     ad_frag_next = True
-                elif is_ad_fragment_end(line):
+                elif self._is_ad_fragment_end(line):
                     ad_frag_next = False
 
-        self._finish_frag_download(ctx)
+        return fragments, ad_frags
 
-        return True
+    def _download_live(self, ctx, man_url, s, info_dict, decryptor):
+        """
+        Download a live stream from its edge until the playlist ends or the
+        download is interrupted, refreshing the playlist every target
+        duration and only downloading the fragments that are new since the
+        previous refresh.
+        """
+        test = self.params.get("test", False)
+        refresh_retries = self.params.get("live_refresh_retries", 10)
+        # Media sequence of the last fragment taken from the playlist, and of
+        # the one before the first
+        last_sequence = None
+        first_sequence = None
+        try:
+            while True:
+                refreshed = time.time()
+                fragments = self._parse_fragments(s, man_url, info_dict)[0]
+                if last_sequence is None:
+                    # Start at the live edge
+                    fragments = fragments[-self.LIVE_START_FRAGMENTS :]
+                else:
+                    if fragments and fragments[0]["media_sequence"] > last_sequence + 1:
+                        self.report_warning(
+                            "Missed %d fragments which left the live playlist"
+                            % (fragments[0]["media_sequence"] - last_sequence - 1)
+                        )
+                    fragments = [
+                        f for f in fragments if f["media_sequence"] > last_sequence
+                    ]
+                if len(fragments) > self.LIVE_WINDOW:
+                    self.report_warning(
+                        "Falling behind the live stream, skipping %d fragments"
+                        % (len(fragments) - self.LIVE_WINDOW)
+                    )
+                    fragments = fragments[-self.LIVE_WINDOW :]
+
+                if fragments:
+                    if first_sequence is None:
+                        first_sequence = fragments[0]["media_sequence"] - 1
+                    for fragment in fragments:
+                        fragment["frag_index"] = (
+                            fragment["media_sequence"] - first_sequence
+                        )
+                    last_sequence = fragments[-1]["media_sequence"]
+                    if test:
+                        return self._download_fragments(
+                            ctx, fragments[:1], info_dict, decryptor
+                        )
+                    if not self._download_fragments(
+                        ctx, fragments, info_dict, decryptor
+                    ):
+                        return False
+
+                if "#EXT-X-ENDLIST" in s:
+                    return True
+
+                # Reload after the target duration, or half of it if the
+                # playlist didn't change (RFC 8216, section 6.3.4)
+                mobj = re.search(r"#EXT-X-TARGETDURATION:(\d+)", s)
+                target_duration = int(mobj.group(1)) if mobj else 10
+                if not fragments:
+                    target_duration /= 2.0
+                time.sleep(max(refreshed + target_duration - time.time(), 0))
+
+                count = 0
+                while True:
+                    try:
+                        s = (
+                            self.ydl.urlopen(self._prepare_url(info_dict, man_url))
+                            .read()
+                            .decode("utf-8", "ignore")
+                        )
+                        break
+                    except compat_urllib_error.HTTPError as err:
+                        if 400 <= err.code < 500:
+                            # The stream is over or gone
+                            self.to_screen(
+                                "[%s] Live playlist is gone (%s), stopping the "
+                                "download" % (self.FD_NAME, error_to_compat_str(err))
+                            )
+                            return True
+                        error = err
+                    except (
+                        compat_urllib_error.URLError,
+                        compat_http_client.HTTPException,
+                        socket.error,
+                    ) as err:
+                        error = err
+                    count += 1
+                    if count > refresh_retries:
+                        self.report_error(
+                            "Unable to refresh the live playlist, giving up after "
+                            "%s retries: %s"
+                            % (refresh_retries, error_to_compat_str(error))
+                        )
+                        return False
+                    self.report_warning(
+                        "Unable to refresh the live playlist: %s. Retrying (attempt "
+                        "%d of %s)..."
+                        % (error_to_compat_str(error), count, refresh_retries)
+                    )
+                    time.sleep(min(2 ** (count - 1), 30))
+        except KeyboardInterrupt:
+            # Stop recording, but keep what was downloaded
+            self.to_screen("\n[%s] Interrupted, stopping the download" % self.FD_NAME)
+            return True
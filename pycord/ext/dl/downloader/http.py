@@ -1,14 +1,22 @@
 from __future__ import unicode_literals
 
 import errno
+import json
 import os
 import socket
+import threading
 import time
 import random
 import re
+from concurrent.futures import (
+    FIRST_EXCEPTION,
+    ThreadPoolExecutor,
+    wait,
+)
 
 from .common import FileDownloader
 from ..compat import (
+    compat_http_client,
     compat_str,
     compat_urllib_error,
 )
@@ -18,6 +26,7 @@ from ..utils import (
     int_or_none,
     sanitize_open,
     sanitized_Request,
+    write_json_file,
     write_xattr,
     XAttrMetadataError,
     XAttrUnavailableError,
@@ -25,6 +34,15 @@ from ..utils import (
 
 
 class HttpFD(FileDownloader):
+    SUPPORTS_SINK = True
+
+    # Size of the buffer blocks are read into, and of the writes to the file
+    _WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+    # Don't split into ranges smaller than this
+    MIN_SEGMENT_SIZE = 1024 * 1024
+    # How often the resume state of a segmented download is written, in seconds
+    SEGMENT_STATE_INTERVAL = 1.0
+
     def real_download(self, filename, info_dict):
         url = info_dict["url"]
 
@@ -55,6 +73,14 @@ class HttpFD(FileDownloader):
             )
         )
 
+        connections = self.params.get("http_connections") or 1
+        if connections > 1 and not is_test and ctx.tmpfilename != "-":
+            result = self._download_segmented(
+                ctx.filename, ctx.tmpfilename, url, headers, chunk_size, info_dict
+            )
+            if result is not None:
+                return result
+
         ctx.open_mode = "wb"
         ctx.resume_len = 0
         ctx.data_len = None
@@ -244,13 +270,37 @@ class HttpFD(FileDownloader):
             block_size = ctx.block_size
             start = time.time()
 
-            # measure time over whole while-loop, so slow_down() and best_block_size() work together properly
-            now = None  # needed for slow_down() in the first loop run
+            # Blocks are read into a preallocated buffer, which is written out
+            # once it reaches the next multiple of its size in the file. Only
+            # stdout and sinks get every block as it comes.
+            to_stdout = ctx.tmpfilename == "-"
+            buffer_size = self._WRITE_BUFFER_SIZE
+            if data_len is not None:
+                buffer_size = max(min(buffer_size, data_len - ctx.resume_len), 1)
+            buf = memoryview(bytearray(buffer_size))
+            ctx.buffered = 0
+
+            resize_buffer = not self.params.get("noresizebuffer", False)
+            max_block_size = self.throttled_block_size(url)
+
             before = start  # start measuring
 
+            def write_buffer():
+                if not ctx.buffered:
+                    return True
+                try:
+                    ctx.stream.write(buf[: ctx.buffered])
+                except (IOError, OSError) as err:
+                    self.to_stderr("\n")
+                    self.report_error("unable to write data: %s" % str(err))
+                    return False
+                ctx.buffered = 0
+                return True
+
             def retry(e):
-                to_stdout = ctx.tmpfilename == "-"
                 if ctx.stream is not None:
+                    # What has been read so far is good
+                    write_buffer()
                     if not to_stdout:
                         ctx.stream.close()
                     ctx.stream = None
@@ -262,12 +312,21 @@ class HttpFD(FileDownloader):
                 raise RetryDownload(e)
 
             while True:
+                file_pos = byte_counter - ctx.buffered
+                read_size = min(
+                    block_size,
+                    buffer_size - file_pos % buffer_size - ctx.buffered,
+                )
+                if data_len is not None:
+                    read_size = min(read_size, data_len - byte_counter)
                 try:
                     # Download and write
-                    data_block = ctx.data.read(
-                        block_size
-                        if data_len is None
-                        else min(block_size, data_len - byte_counter)
+                    read = (
+                        ctx.data.readinto(
+                            buf[ctx.buffered : ctx.buffered + read_size]
+                        )
+                        if read_size
+                        else 0
                     )
                 # socket.timeout is a subclass of socket.error but may not have
                 # errno set
@@ -283,16 +342,17 @@ class HttpFD(FileDownloader):
                         retry(e)
                     raise
 
-                byte_counter += len(data_block)
+                byte_counter += read
+                ctx.buffered += read
 
                 # exit loop when download is finished
-                if len(data_block) == 0:
+                if read == 0:
                     break
 
                 # Open destination file just in time
                 if ctx.stream is None:
                     try:
-                        ctx.stream, ctx.tmpfilename = sanitize_open(
+                        ctx.stream, ctx.tmpfilename = self.open_output(
                             ctx.tmpfilename, ctx.open_mode
                         )
                         assert ctx.stream is not None
@@ -317,25 +377,33 @@ class HttpFD(FileDownloader):
                                 "unable to set filesize xattr: %s" % str(err)
                             )
 
-                try:
-                    ctx.stream.write(data_block)
-                except (IOError, OSError) as err:
-                    self.to_stderr("\n")
-                    self.report_error("unable to write data: %s" % str(err))
-                    return False
+                if to_stdout or byte_counter % buffer_size == 0:
+                    if not write_buffer():
+                        return False
 
-                # Apply rate limit
-                self.slow_down(start, now, byte_counter - ctx.resume_len)
+                # end measuring of one loop run, waiting for the rate limit
+                # says nothing about the speed
+                after = time.time()
 
-                # end measuring of one loop run
-                now = time.time()
-                after = now
+                # Apply rate limit
+                throttled = self.throttle(read, url)
 
-                # Adjust block size
-                if not self.params.get("noresizebuffer", False):
-                    block_size = self.best_block_size(after - before, len(data_block))
+                # Adjust block size, short reads only happen at the end of
+                # the buffer and say nothing about the speed
+                if resize_buffer and read == block_size:
+                    block_size = self.smooth_block_size(
+                        block_size, after - before, read
+                    )
+                if resize_buffer and max_block_size:
+                    # Faster than the rate limit, read what it lets through
+                    # at once so that downloads sharing it take even turns
+                    block_size = (
+                        max_block_size
+                        if throttled
+                        else min(block_size, max_block_size)
+                    )
 
-                before = after
+                now = before = time.time()
 
                 # Progress message
                 speed = self.calc_speed(start, now, byte_counter - ctx.resume_len)
@@ -365,6 +433,9 @@ class HttpFD(FileDownloader):
                 if data_len is not None and byte_counter == data_len:
                     break
 
+            if ctx.stream is not None and not write_buffer():
+                return False
+
             if (
                 not is_test
                 and ctx.chunk_size
@@ -424,3 +495,292 @@ class HttpFD(FileDownloader):
 
         self.report_error("giving up after %s retries" % retries)
         return False
+
+    def _probe_range(self, url, headers):
+        """
+        Return the size of the file and the response to a one byte range
+        request, or None if the server doesn't serve ranges.
+        """
+        request = sanitized_Request(url, None, headers)
+        request.add_header("Range", "bytes=0-0")
+        # Leave errors to the single connection download to report or retry
+        try:
+            data = self.ydl.urlopen(request)
+        except (
+            compat_urllib_error.URLError,
+            compat_http_client.HTTPException,
+            socket.error,
+        ):
+            return None, None
+        content_range_m = re.search(
+            r"bytes 0-0/(\d+)", data.headers.get("Content-Range") or ""
+        )
+        if data.getcode() != 206 or not content_range_m:
+            # Don't read the whole file only to download it again
+            data.close()
+            return None, None
+        try:
+            data.read()
+        except (compat_http_client.HTTPException, socket.error):
+            data.close()
+            return None, None
+        return int(content_range_m.group(1)), data
+
+    def _download_segmented(
+        self, filename, tmpfilename, url, headers, chunk_size, info_dict
+    ):
+        """
+        Download the file over several connections, each one fetching the
+        next byte range not taken yet into its place in a preallocated
+        temporary file. The ranges are chunk_size large, or the size of the
+        file split between the connections.
+
+        Progress is kept in the .ytdl file next to the temporary file, so that
+        the download can be resumed. Returns None if the file can't be
+        downloaded this way, e.g. because the server doesn't serve ranges.
+        """
+        ytdl_filename = encodeFilename("%s.ytdl" % filename)
+        continuedl = self.params.get("continuedl", True)
+        state = None
+        if continuedl and os.path.isfile(encodeFilename(tmpfilename)):
+            if not os.path.isfile(ytdl_filename):
+                # Started by a single connection download, let it resume
+                return None
+            try:
+                with open(ytdl_filename, "r") as ytdl_file:
+                    state = json.loads(ytdl_file.read())["downloader"]
+                segments = state["segments"]
+                assert all(len(segment) == 3 for segment in segments)
+            except (ValueError, KeyError, TypeError, AssertionError, IOError):
+                self.report_warning("Unable to resume from %s" % ytdl_filename)
+                state = None
+
+        data_len, data = self._probe_range(url, headers)
+        if data_len is None:
+            return None
+        if state is not None and state.get("total_bytes") != data_len:
+            self.report_unable_to_resume()
+            state = None
+
+        connections = self.params["http_connections"]
+        if state is None:
+            segment_size = max(
+                chunk_size or -(-data_len // connections), self.MIN_SEGMENT_SIZE
+            )
+            if segment_size >= data_len:
+                return None
+            segments = [
+                [start, min(start + segment_size, data_len) - 1, 0]
+                for start in range(0, data_len, segment_size)
+            ]
+
+            min_data_len = self.params.get("min_filesize")
+            max_data_len = self.params.get("max_filesize")
+            if min_data_len is not None and data_len < min_data_len:
+                self.to_screen(
+                    "\r[download] File is smaller than min-filesize (%s bytes < %s bytes). Aborting."
+                    % (data_len, min_data_len)
+                )
+                return False
+            if max_data_len is not None and data_len > max_data_len:
+                self.to_screen(
+                    "\r[download] File is larger than max-filesize (%s bytes > %s bytes). Aborting."
+                    % (data_len, max_data_len)
+                )
+                return False
+
+        try:
+            stream, tmpfilename = sanitize_open(
+                tmpfilename, "wb" if state is None else "r+b"
+            )
+            if state is None:
+                stream.truncate(data_len)
+            stream.close()
+        except (OSError, IOError) as err:
+            self.report_error("unable to open for writing: %s" % str(err))
+            return False
+        filename = self.undo_temp_name(tmpfilename)
+        self.report_destination(filename)
+        if self.params.get("xattr_set_filesize", False):
+            try:
+                write_xattr(
+                    tmpfilename, "user.ytdl.filesize", str(data_len).encode("utf-8")
+                )
+            except (XAttrUnavailableError, XAttrMetadataError) as err:
+                self.report_error("unable to set filesize xattr: %s" % str(err))
+
+        resume_len = sum(segment[2] for segment in segments)
+        if resume_len:
+            self.report_resuming_byte(resume_len)
+
+        retries = self.params.get("retries", 0)
+        lock = threading.Lock()
+        stop = threading.Event()
+        ctx = {
+            "downloaded_bytes": resume_len,
+            "start": time.time(),
+        }
+
+        def write_state():
+            with lock:
+                downloader = {
+                    "total_bytes": data_len,
+                    "segments": [list(segment) for segment in segments],
+                }
+            write_json_file({"downloader": downloader}, ytdl_filename)
+
+        def report_progress(byte_counter):
+            now = time.time()
+            self._hook_progress(
+                {
+                    "status": "downloading",
+                    "downloaded_bytes": byte_counter,
+                    "total_bytes": data_len,
+                    "tmpfilename": tmpfilename,
+                    "filename": filename,
+                    "eta": self.calc_eta(
+                        ctx["start"],
+                        now,
+                        data_len - resume_len,
+                        byte_counter - resume_len,
+                    ),
+                    "speed": self.calc_speed(
+                        ctx["start"], now, byte_counter - resume_len
+                    ),
+                    "elapsed": now - ctx["start"],
+                }
+            )
+
+        def download_segment(segment):
+            segment_len = segment[1] - segment[0] + 1
+            count = 0
+            block_size = self.params.get("buffersize", 1024)
+            buf = memoryview(bytearray(max(self._WRITE_BUFFER_SIZE, block_size)))
+            resize_buffer = not self.params.get("noresizebuffer", False)
+            max_block_size = self.throttled_block_size(url)
+            with open(encodeFilename(tmpfilename), "r+b", 0) as stream:
+                while segment[2] < segment_len and not stop.is_set():
+                    range_start = segment[0] + segment[2]
+                    request = sanitized_Request(url, None, headers)
+                    request.add_header(
+                        "Range", "bytes=%d-%d" % (range_start, segment[1])
+                    )
+                    try:
+                        data = self.ydl.urlopen(request)
+                        # A server ignoring the range would send the whole file
+                        content_range_m = re.search(
+                            r"bytes (\d+)-", data.headers.get("Content-Range") or ""
+                        )
+                        if (
+                            not content_range_m
+                            or int(content_range_m.group(1)) != range_start
+                        ):
+                            data.close()
+                            raise ContentTooShortError(segment[2], segment_len)
+                        stream.seek(range_start)
+                        got_data = False
+                        before = time.time()
+                        while not stop.is_set():
+                            read_size = min(
+                                block_size, len(buf), segment[1] + 1 - stream.tell()
+                            )
+                            read = data.readinto(buf[:read_size]) if read_size else 0
+                            if not read:
+                                break
+                            got_data = True
+                            stream.write(buf[:read])
+                            with lock:
+                                segment[2] += read
+                                ctx["downloaded_bytes"] += read
+                                byte_counter = ctx["downloaded_bytes"]
+                                report_progress(byte_counter)
+                            now = time.time()
+                            throttled = self.throttle(read, url)
+                            if resize_buffer and read == block_size:
+                                block_size = self.smooth_block_size(
+                                    block_size, now - before, read
+                                )
+                            if resize_buffer and max_block_size:
+                                block_size = (
+                                    max_block_size
+                                    if throttled
+                                    else min(block_size, max_block_size)
+                                )
+                            before = time.time()
+                        data.close()
+                        if got_data or stop.is_set():
+                            continue
+                        raise ContentTooShortError(segment[2], segment_len)
+                    except compat_urllib_error.HTTPError as err:
+                        if err.code < 500 or err.code >= 600:
+                            raise
+                        source_error = err
+                    except compat_urllib_error.URLError as err:
+                        if not isinstance(err.reason, socket.error):
+                            raise
+                        source_error = err
+                    except (socket.error, ContentTooShortError) as err:
+                        source_error = err
+                    count += 1
+                    if count > retries:
+                        raise source_error
+                    self.report_retry(source_error, count, retries)
+
+        executor = ThreadPoolExecutor(max_workers=connections)
+        futures = [
+            executor.submit(download_segment, segment)
+            for segment in segments
+            if segment[0] + segment[2] <= segment[1]
+        ]
+        try:
+            while futures:
+                done, not_done = wait(
+                    futures,
+                    timeout=self.SEGMENT_STATE_INTERVAL,
+                    return_when=FIRST_EXCEPTION,
+                )
+                for future in done:
+                    # Raises the error of a failed range
+                    future.result()
+                futures = list(not_done)
+                write_state()
+        except (
+            compat_urllib_error.URLError,
+            socket.error,
+            ContentTooShortError,
+        ) as err:
+            stop.set()
+            executor.shutdown(wait=True)
+            write_state()
+            self.to_stderr("\n")
+            self.report_error("unable to download range: %s" % str(err))
+            return False
+        except BaseException:
+            stop.set()
+            executor.shutdown(wait=True)
+            write_state()
+            raise
+        executor.shutdown(wait=True)
+
+        self.try_rename(tmpfilename, filename)
+        try:
+            os.remove(ytdl_filename)
+        except OSError:
+            pass
+
+        # Update file modification time
+        if self.params.get("updatetime", True):
+            info_dict["filetime"] = self.try_utime(
+                filename, data.info().get("last-modified", None)
+            )
+
+        self._hook_progress(
+            {
+                "downloaded_bytes": data_len,
+                "total_bytes": data_len,
+                "filename": filename,
+                "status": "finished",
+                "elapsed": time.time() - ctx["start"],
+            }
+        )
+        return True
@@ -0,0 +1,55 @@
+from __future__ import division, unicode_literals
+
+import threading
+import time
+
+
+class TokenBucket(object):
+    """
+    Bandwidth budget of rate bytes per second, allowing bursts of up to
+    burst bytes (a quarter of a second worth by default).
+
+    consume() takes the bytes that were just downloaded and reserves the time
+    it takes to download them at the rate, after what was reserved before.
+    It returns how long to sleep until that reservation is over, so that
+    concurrent downloads sharing a bucket take turns instead of all going at
+    the full rate.
+    """
+
+    def __init__(self, rate, burst=None):
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.burst = burst if burst is not None else rate / 4
+        # When the time reserved so far is over
+        self._next_free = time.monotonic()
+
+    def set_rate(self, rate, burst=None):
+        with self._lock:
+            self.rate = rate
+            self.burst = burst if burst is not None else rate / 4
+
+    def consume(self, amount):
+        with self._lock:
+            now = time.monotonic()
+            # Time left unused can make up for up to burst bytes
+            start = max(self._next_free, now - self.burst / self.rate)
+            self._next_free = start + amount / self.rate
+            return max(self._next_free - now, 0)
+
+
+_shared_buckets = {}
+_shared_lock = threading.Lock()
+
+
+def shared_bucket(key, rate):
+    """
+    Return the bucket for key shared by the whole process, with its rate set
+    to rate.
+    """
+    with _shared_lock:
+        bucket = _shared_buckets.get(key)
+        if bucket is None:
+            bucket = _shared_buckets[key] = TokenBucket(rate)
+    if bucket.rate != rate:
+        bucket.set_rate(rate)
+    return bucket
@@ -0,0 +1,162 @@
+from __future__ import unicode_literals
+
+import asyncio
+import errno
+import threading
+
+
+class DownloadSink(object):
+    """
+    Where a downloader writes the downloaded (and decrypted) bytes instead of
+    a file, see FileDownloader.download.
+
+    Any object with write(), flush() and close() methods can be used as a
+    sink, e.g. the stdin of a subprocess. The downloader calls write() with
+    every block as it comes in, on the downloading thread, so a slow sink
+    slows the download down. close() is called once the download is over,
+    whether it succeeded or not.
+    """
+
+    def write(self, data):
+        raise NotImplementedError("This method must be implemented by subclasses")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class CallbackSink(DownloadSink):
+    """
+    Calls callback with every block of bytes, and on_close (if given) once
+    the download is over.
+    """
+
+    def __init__(self, callback, on_close=None):
+        self.callback = callback
+        self.on_close = on_close
+        self._closed = False
+
+    def write(self, data):
+        # The downloader may reuse the buffer data is a view of
+        self.callback(bytes(data))
+        return len(data)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self.on_close is not None:
+            self.on_close()
+
+
+class PipeSink(DownloadSink):
+    """
+    An in-memory pipe holding at most max_size bytes: the downloader writes
+    into it and blocks while it is full, and a consumer on another thread
+    reads from it like from a file, e.g.::
+
+        sink = PipeSink()
+        threading.Thread(
+            target=ydl.download_to_sink, args=(info, sink), daemon=True
+        ).start()
+        voice_client.play(discord.FFmpegPCMAudio(sink, pipe=True))
+
+    read() returns b"" once everything has been read and the download is
+    over. A consumer that stops early should call cancel(), so that the
+    download fails at its next write instead of waiting forever.
+    """
+
+    def __init__(self, max_size=4 * 1024 * 1024):
+        self.max_size = max_size
+        self._buffer = bytearray()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._cancelled = False
+
+    def write(self, data):
+        data = memoryview(data)
+        size = len(data)
+        with self._cond:
+            while data:
+                while len(self._buffer) >= self.max_size and not self._cancelled:
+                    self._cond.wait()
+                if self._cancelled:
+                    raise IOError(errno.EPIPE, "The reader of the pipe went away")
+                room = self.max_size - len(self._buffer)
+                self._buffer += data[:room]
+                data = data[room:]
+                self._cond.notify_all()
+        return size
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def read(self, size=-1):
+        """
+        Return up to size bytes (everything buffered if size is negative),
+        waiting for the downloader if there are none yet.
+        """
+        with self._cond:
+            while not self._buffer and not self._closed and not self._cancelled:
+                self._cond.wait()
+            if size < 0 or size > len(self._buffer):
+                size = len(self._buffer)
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+            self._cond.notify_all()
+        return data
+
+    def readable(self):
+        return True
+
+    def cancel(self):
+        """Stop reading, the download fails at its next write."""
+        with self._cond:
+            self._cancelled = True
+            del self._buffer[:]
+            self._cond.notify_all()
+
+
+class AsyncQueueSink(DownloadSink):
+    """
+    Puts every block of bytes into an asyncio.Queue running on loop, and
+    None once the download is over. With a bounded queue, the downloader
+    waits while the queue is full, so a consumer that stops early should
+    call cancel(). The download must not run on the thread of the loop, see
+    AsyncYoutubeDL.download_to_sink_async.
+    """
+
+    def __init__(self, queue, loop):
+        self.queue = queue
+        self.loop = loop
+        self._closed = False
+        self._cancelled = False
+
+    def _put(self, item):
+        asyncio.run_coroutine_threadsafe(self.queue.put(item), self.loop).result()
+
+    def write(self, data):
+        if self._cancelled:
+            raise IOError(errno.EPIPE, "The reader of the queue went away")
+        self._put(bytes(data))
+        return len(data)
+
+    def close(self):
+        if self._closed or self._cancelled:
+            return
+        self._closed = True
+        self._put(None)
+
+    def cancel(self):
+        """
+        Stop reading, the download fails at its next write. Must be called
+        on the thread of the loop.
+        """
+        self._cancelled = True
+        # Wake up a write waiting for room
+        while not self.queue.empty():
+            self.queue.get_nowait()
@@ -2,11 +2,12 @@ from __future__ import unicode_literals
 
 try:
     from .lazy_extractors import *
-    from .lazy_extractors import _ALL_CLASSES
+    from .lazy_extractors import _ALL_CLASSES, _HOSTS
 
     _LAZY_LOADER = True
 except ImportError:
     _LAZY_LOADER = False
+    _HOSTS = {}
     from .extractors import *
 
     _ALL_CLASSES = [
@@ -0,0 +1,9171 @@
+# This file is generated by devscripts/make_lazy_extractors.py, do not edit.
+# coding: utf-8
+from __future__ import unicode_literals
+
+import re
+from ..utils import compat_parse_qs
+from ..utils import compat_urllib_parse_urlparse
+from ..utils import int_or_none
+
+
+class LazyLoadExtractor(object):
+    _module = None
+
+    @classmethod
+    def ie_key(cls):
+        return cls.__name__[:-2]
+
+    def __new__(cls, *args, **kwargs):
+        mod = __import__(cls._module, fromlist=(cls.__name__,))
+        real_cls = getattr(mod, cls.__name__)
+        instance = real_cls.__new__(real_cls)
+        instance.__init__(*args, **kwargs)
+        return instance
+
+    @classmethod
+    def suitable(cls, url):
+        """Receives a URL and returns True if suitable for this IE."""
+
+        # This does not use has/getattr intentionally - we want to know whether
+        # we have cached the regexp for *this* class, whereas getattr would also
+        # match the superclass
+        if "_VALID_URL_RE" not in cls.__dict__:
+            cls._VALID_URL_RE = re.compile(cls._VALID_URL)
+        return cls._VALID_URL_RE.match(url) is not None
+
+class LazyLoadSearchExtractor(LazyLoadExtractor):
+    pass
+
+class ABCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?abc\\.net\\.au/news/(?:[^/]+/){1,2}(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.abc'
+    IE_NAME = 'abc.net.au'
+
+class ABCIViewIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://iview\\.abc\\.net\\.au/(?:[^/]+/)*video/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.abc'
+    IE_NAME = 'abc.net.au:iview'
+
+class AbcNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://abcnews\\.go\\.com/(?:[^/]+/)+(?P<display_id>[0-9a-z-]+)/story\\?id=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.abcnews'
+    IE_NAME = 'abcnews'
+
+class AMPIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.amp'
+
+class AbcNewsVideoIE(AMPIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            abcnews\\.go\\.com/\n                            (?:\n                                (?:[^/]+/)*video/(?P<display_id>[0-9a-z-]+)-|\n                                video/(?:embed|itemfeed)\\?.*?\\bid=\n                            )|\n                            fivethirtyeight\\.abcnews\\.go\\.com/video/embed/\\d+/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.abcnews'
+    IE_NAME = 'abcnews:video'
+
+class ABCOTVSIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<site>abc(?:7(?:news|ny|chicago)?|11|13|30)|6abc)\\.com(?:(?:/[^/]+)*/(?P<display_id>[^/]+))?/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.abcotvs'
+    IE_NAME = 'abcotvs'
+
+class ABCOTVSClipsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://clips\\.abcotvs\\.com/(?:[^/]+/)*video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.abcotvs'
+    IE_NAME = 'abcotvs:clips'
+
+class AcademicEarthCourseIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://(?:www\\.)?academicearth\\.org/playlists/(?P<id>[^?#/]+)'
+    _module = 'pycord.ext.dl.extractor.academicearth'
+    IE_NAME = 'AcademicEarth:Course'
+
+class ACastBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.acast'
+
+class ACastIE(ACastBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?:embed|www)\\.)?acast\\.com/|\n                            play\\.acast\\.com/s/\n                        )\n                        (?P<channel>[^/]+)/(?P<id>[^/#?]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.acast'
+    IE_NAME = 'acast'
+
+class ACastChannelIE(ACastBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?acast\\.com/|\n                            play\\.acast\\.com/s/\n                        )\n                        (?P<id>[^/#?]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.acast'
+    IE_NAME = 'acast:channel'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if ACastIE.suitable(url) else super(ACastChannelIE, cls).suitable(url)
+        )
+
+class ADNIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?animedigitalnetwork\\.fr/video/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.adn'
+
+class AdobeConnectIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://\\w+\\.adobeconnect\\.com/(?P<id>[\\w-]+)'
+    _module = 'pycord.ext.dl.extractor.adobeconnect'
+
+class AdobeTVBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.adobetv'
+
+class AdobeTVEmbedIE(AdobeTVBaseIE):
+    _VALID_URL = 'https?://tv\\.adobe\\.com/embed/\\d+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.adobetv'
+    IE_NAME = 'adobetv:embed'
+
+class AdobeTVIE(AdobeTVBaseIE):
+    _VALID_URL = 'https?://tv\\.adobe\\.com/(?:(?P<language>fr|de|es|jp)/)?watch/(?P<show_urlname>[^/]+)/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.adobetv'
+    IE_NAME = 'adobetv'
+
+class AdobeTVPlaylistBaseIE(AdobeTVBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.adobetv'
+
+class AdobeTVShowIE(AdobeTVPlaylistBaseIE):
+    _VALID_URL = 'https?://tv\\.adobe\\.com/(?:(?P<language>fr|de|es|jp)/)?show/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.adobetv'
+    IE_NAME = 'adobetv:show'
+
+class AdobeTVChannelIE(AdobeTVPlaylistBaseIE):
+    _VALID_URL = 'https?://tv\\.adobe\\.com/(?:(?P<language>fr|de|es|jp)/)?channel/(?P<id>[^/]+)(?:/(?P<category_urlname>[^/]+))?'
+    _module = 'pycord.ext.dl.extractor.adobetv'
+    IE_NAME = 'adobetv:channel'
+
+class AdobeTVVideoIE(AdobeTVBaseIE):
+    _VALID_URL = 'https?://video\\.tv\\.adobe\\.com/v/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.adobetv'
+    IE_NAME = 'adobetv:video'
+
+class AdobePassIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.adobepass'
+
+class TurnerBaseIE(AdobePassIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.turner'
+
+class AdultSwimIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?adultswim\\.com/videos/(?P<show_path>[^/?#]+)(?:/(?P<episode_path>[^/?#]+))?'
+    _module = 'pycord.ext.dl.extractor.adultswim'
+
+class OnceIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.+?\\.unicornmedia\\.com/now/(?:ads/vmap/)?[^/]+/[^/]+/(?P<domain_id>[^/]+)/(?P<application_id>[^/]+)/(?:[^/]+/)?(?P<media_item_id>[^/]+)/content\\.(?:once|m3u8|mp4)'
+    _module = 'pycord.ext.dl.extractor.once'
+
+class ThePlatformBaseIE(OnceIE):
+    _VALID_URL = 'https?://.+?\\.unicornmedia\\.com/now/(?:ads/vmap/)?[^/]+/[^/]+/(?P<domain_id>[^/]+)/(?P<application_id>[^/]+)/(?:[^/]+/)?(?P<media_item_id>[^/]+)/content\\.(?:once|m3u8|mp4)'
+    _module = 'pycord.ext.dl.extractor.theplatform'
+
+class ThePlatformIE(ThePlatformBaseIE, AdobePassIE):
+    _VALID_URL = '(?x)\n        (?:https?://(?:link|player)\\.theplatform\\.com/[sp]/(?P<provider_id>[^/]+)/\n           (?:(?:(?:[^/]+/)+select/)?(?P<media>media/(?:guid/\\d+/)?)?|(?P<config>(?:[^/\\?]+/(?:swf|config)|onsite)/select/))?\n         |theplatform:)(?P<id>[^/\\?&]+)'
+    _module = 'pycord.ext.dl.extractor.theplatform'
+
+class AENetworksBaseIE(ThePlatformIE):
+    _VALID_URL = '(?x)\n        (?:https?://(?:link|player)\\.theplatform\\.com/[sp]/(?P<provider_id>[^/]+)/\n           (?:(?:(?:[^/]+/)+select/)?(?P<media>media/(?:guid/\\d+/)?)?|(?P<config>(?:[^/\\?]+/(?:swf|config)|onsite)/select/))?\n         |theplatform:)(?P<id>[^/\\?&]+)'
+    _module = 'pycord.ext.dl.extractor.aenetworks'
+
+class AENetworksIE(AENetworksBaseIE):
+    _VALID_URL = '(?x)https?://\n        (?:(?:www|play|watch)\\.)?\n        (?P<domain>\n            (?:history(?:vault)?|aetv|mylifetime|lifetimemovieclub)\\.com|\n            fyi\\.tv\n        )/(?P<id>\n        shows/[^/]+/season-\\d+/episode-\\d+|\n        (?:\n            (?:movie|special)s/[^/]+|\n            (?:shows/[^/]+/)?videos\n        )/[^/?#&]+\n    )'
+    _module = 'pycord.ext.dl.extractor.aenetworks'
+    IE_NAME = 'aenetworks'
+
+class AENetworksListBaseIE(AENetworksBaseIE):
+    _VALID_URL = '(?x)\n        (?:https?://(?:link|player)\\.theplatform\\.com/[sp]/(?P<provider_id>[^/]+)/\n           (?:(?:(?:[^/]+/)+select/)?(?P<media>media/(?:guid/\\d+/)?)?|(?P<config>(?:[^/\\?]+/(?:swf|config)|onsite)/select/))?\n         |theplatform:)(?P<id>[^/\\?&]+)'
+    _module = 'pycord.ext.dl.extractor.aenetworks'
+
+class AENetworksCollectionIE(AENetworksListBaseIE):
+    _VALID_URL = '(?x)https?://\n        (?:(?:www|play|watch)\\.)?\n        (?P<domain>\n            (?:history(?:vault)?|aetv|mylifetime|lifetimemovieclub)\\.com|\n            fyi\\.tv\n        )/(?:[^/]+/)*(?:list|collections)/(?P<id>[^/?#&]+)/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.aenetworks'
+    IE_NAME = 'aenetworks:collection'
+
+class AENetworksShowIE(AENetworksListBaseIE):
+    _VALID_URL = '(?x)https?://\n        (?:(?:www|play|watch)\\.)?\n        (?P<domain>\n            (?:history(?:vault)?|aetv|mylifetime|lifetimemovieclub)\\.com|\n            fyi\\.tv\n        )/shows/(?P<id>[^/?#&]+)/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.aenetworks'
+    IE_NAME = 'aenetworks:show'
+
+class HistoryTopicIE(AENetworksBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?history\\.com/topics/[^/]+/(?P<id>[\\w+-]+?)-video'
+    _module = 'pycord.ext.dl.extractor.aenetworks'
+    IE_NAME = 'history:topic'
+
+class HistoryPlayerIE(AENetworksBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<domain>(?:history|biography)\\.com)/player/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.aenetworks'
+    IE_NAME = 'history:player'
+
+class BiographyIE(AENetworksBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?biography\\.com/video/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.aenetworks'
+
+class AfreecaTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?:live|afbbs|www)\\.)?afreeca(?:tv)?\\.com(?::\\d+)?\n                            (?:\n                                /app/(?:index|read_ucc_bbs)\\.cgi|\n                                /player/[Pp]layer\\.(?:swf|html)\n                            )\\?.*?\\bnTitleNo=|\n                            vod\\.afreecatv\\.com/PLAYER/STATION/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.afreecatv'
+    IE_NAME = 'afreecatv'
+
+class AirMozillaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://air\\.mozilla\\.org/(?P<id>[0-9a-z-]+)/?'
+    _module = 'pycord.ext.dl.extractor.airmozilla'
+
+class AlJazeeraIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?aljazeera\\.com/(?P<type>program/[^/]+|(?:feature|video)s)/\\d{4}/\\d{1,2}/\\d{1,2}/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.aljazeera'
+
+class AlphaPornoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?alphaporno\\.com/videos/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.alphaporno'
+
+class AmaraIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?amara\\.org/(?:\\w+/)?videos/(?P<id>\\w+)'
+    _module = 'pycord.ext.dl.extractor.amara'
+
+class AMCNetworksIE(ThePlatformIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>amc|bbcamerica|ifc|(?:we|sundance)tv)\\.com/(?P<id>(?:movies|shows(?:/[^/]+)+)/[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.amcnetworks'
+
+class AmericasTestKitchenIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:americastestkitchen|cooks(?:country|illustrated))\\.com/(?P<resource_type>episode|videos)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.americastestkitchen'
+
+class AmericasTestKitchenSeasonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<show>americastestkitchen|cookscountry)\\.com/episodes/browse/season_(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.americastestkitchen'
+
+class AnimeOnDemandIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?anime-on-demand\\.de/anime/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.animeondemand'
+
+class AnvatoIE(LazyLoadExtractor):
+    _VALID_URL = 'anvato:(?P<access_key_or_mcp>[^:]+):(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.anvato'
+
+class YahooIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<url>https?://(?:(?P<country>[a-zA-Z]{2}(?:-[a-zA-Z]{2})?|malaysia)\\.)?(?:[\\da-zA-Z_-]+\\.)?yahoo\\.com/(?:[^/]+/)*(?P<id>[^?&#]*-[0-9]+(?:-[a-z]+)?)\\.html)'
+    _module = 'pycord.ext.dl.extractor.yahoo'
+
+class AolIE(YahooIE):
+    _VALID_URL = '(?:aol-video:|https?://(?:www\\.)?aol\\.(?:com|ca|co\\.uk|de|jp)/video/(?:[^/]+/)*)(?P<id>\\d{9}|[0-9a-f]{24}|[0-9a-f]{8}-(?:[0-9a-f]{4}-){3}[0-9a-f]{12})'
+    _module = 'pycord.ext.dl.extractor.aol'
+    IE_NAME = 'aol.com'
+
+class AllocineIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?allocine\\.fr/(?:article|video|film)/(?:fichearticle_gen_carticle=|player_gen_cmedia=|fichefilm_gen_cfilm=|video-)(?P<id>[0-9]+)(?:\\.html)?'
+    _module = 'pycord.ext.dl.extractor.allocine'
+
+class AliExpressLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://live\\.aliexpress\\.com/live/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.aliexpress'
+
+class APAIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<base_url>https?://[^/]+\\.apa\\.at)/embed/(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.apa'
+
+class AparatIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?aparat\\.com/(?:v/|video/video/embed/videohash/)(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.aparat'
+
+class AppleConnectIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://itunes\\.apple\\.com/\\w{0,2}/?post/(?:id)?sa\\.(?P<id>[\\w-]+)'
+    _module = 'pycord.ext.dl.extractor.appleconnect'
+
+class AppleTrailersIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|movie)?trailers\\.apple\\.com/(?:trailers|ca)/(?P<company>[^/]+)/(?P<movie>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.appletrailers'
+    IE_NAME = 'appletrailers'
+
+class AppleTrailersSectionIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?trailers\\.apple\\.com/#section=(?P<id>justadded|exclusive|justhd|mostpopular|moviestudios)'
+    _module = 'pycord.ext.dl.extractor.appletrailers'
+    IE_NAME = 'appletrailers:section'
+
+class ApplePodcastsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://podcasts\\.apple\\.com/(?:[^/]+/)?podcast(?:/[^/]+){1,2}.*?\\bi=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.applepodcasts'
+
+class ArchiveOrgIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?archive\\.org/(?:details|embed)/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.archiveorg'
+    IE_NAME = 'archive.org'
+
+class ArcPublishingIE(LazyLoadExtractor):
+    _VALID_URL = 'arcpublishing:(?P<org>[a-z]+):(?P<id>[\\da-f]{8}-(?:[\\da-f]{4}-){3}[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.arcpublishing'
+
+class ArkenaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:\n                                video\\.(?:arkena|qbrick)\\.com/play2/embed/player\\?|\n                                play\\.arkena\\.com/(?:config|embed)/avp/v\\d/player/media/(?P<id>[^/]+)/[^/]+/(?P<account_id>\\d+)\n                            )\n                        '
+    _module = 'pycord.ext.dl.extractor.arkena'
+
+class ARDMediathekBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.ard'
+
+class ARDBetaMediathekIE(ARDMediathekBaseIE):
+    _VALID_URL = 'https://(?:(?:beta|www)\\.)?ardmediathek\\.de/(?:[^/]+/)?(?:player|live|video)/(?:[^/]+/)*(?P<id>Y3JpZDovL[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.ard'
+
+class ARDIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<mainurl>https?://(?:www\\.)?daserste\\.de/(?:[^/?#&]+/)+(?P<id>[^/?#&]+))\\.html'
+    _module = 'pycord.ext.dl.extractor.ard'
+
+class ARDMediathekIE(ARDMediathekBaseIE):
+    _VALID_URL = '^https?://(?:(?:(?:www|classic)\\.)?ardmediathek\\.de|mediathek\\.(?:daserste|rbb-online)\\.de|one\\.ard\\.de)/(?:.*/)(?P<video_id>[0-9]+|[^0-9][^/\\?]+)[^/\\?]*(?:\\?.*)?'
+    _module = 'pycord.ext.dl.extractor.ard'
+    IE_NAME = 'ARD:mediathek'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if ARDBetaMediathekIE.suitable(url)
+            else super(ARDMediathekIE, cls).suitable(url)
+        )
+
+class ArteTVBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.arte'
+
+class ArteTVIE(ArteTVBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?arte\\.tv/(?P<lang>fr|de|en|es|it|pl)/videos|\n                            api\\.arte\\.tv/api/player/v\\d+/config/(?P<lang_2>fr|de|en|es|it|pl)\n                        )\n                        /(?P<id>\\d{6}-\\d{3}-[AF])\n                    '
+    _module = 'pycord.ext.dl.extractor.arte'
+
+class ArteTVEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?arte\\.tv/player/v\\d+/index\\.php\\?.*?\\bjson_url=.+'
+    _module = 'pycord.ext.dl.extractor.arte'
+
+class ArteTVPlaylistIE(ArteTVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?arte\\.tv/(?P<lang>fr|de|en|es|it|pl)/videos/(?P<id>RC-\\d{6})'
+    _module = 'pycord.ext.dl.extractor.arte'
+
+class ArnesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.arnes\\.si/(?:[a-z]{2}/)?(?:watch|embed|api/(?:asset|public/video))/(?P<id>[0-9a-zA-Z]{12})'
+    _module = 'pycord.ext.dl.extractor.arnes'
+    IE_NAME = 'video.arnes.si'
+
+class AsianCrushBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.asiancrush'
+
+class AsianCrushIE(AsianCrushBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<host>(?:(?:asiancrush|yuyutv|midnightpulp)\\.com|(?:cocoro|retrocrush)\\.tv))/video/(?:[^/]+/)?0+(?P<id>\\d+)v\\b'
+    _module = 'pycord.ext.dl.extractor.asiancrush'
+
+class AsianCrushPlaylistIE(AsianCrushBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<host>(?:(?:asiancrush|yuyutv|midnightpulp)\\.com|(?:cocoro|retrocrush)\\.tv))/series/0+(?P<id>\\d+)s\\b'
+    _module = 'pycord.ext.dl.extractor.asiancrush'
+
+class AtresPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?atresplayer\\.com/[^/]+/[^/]+/[^/]+/[^/]+/(?P<display_id>.+?)_(?P<id>[0-9a-f]{24})'
+    _module = 'pycord.ext.dl.extractor.atresplayer'
+
+class ATTTechChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://techchannel\\.att\\.com/play-video\\.cfm/([^/]+/)*(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.atttechchannel'
+
+class ATVAtIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?atv\\.at/(?:[^/]+/){2}(?P<id>[dv]\\d+)'
+    _module = 'pycord.ext.dl.extractor.atvat'
+
+class AudiMediaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?audi-mediacenter\\.com/(?:en|de)/audimediatv/(?:video/)?(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.audimedia'
+
+class AudioBoomIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?audioboom\\.com/(?:boos|posts)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.audioboom'
+
+class AudiomackIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?audiomack\\.com/song/(?P<id>[\\w/-]+)'
+    _module = 'pycord.ext.dl.extractor.audiomack'
+    IE_NAME = 'audiomack'
+
+class AudiomackAlbumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?audiomack\\.com/album/(?P<id>[\\w/-]+)'
+    _module = 'pycord.ext.dl.extractor.audiomack'
+    IE_NAME = 'audiomack:album'
+
+class AWAANIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:awaan|dcndigital)\\.ae/(?:#/)?show/(?P<show_id>\\d+)/[^/]+(?:/(?P<video_id>\\d+)/(?P<season_id>\\d+))?'
+    _module = 'pycord.ext.dl.extractor.awaan'
+
+class AWAANBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.awaan'
+
+class AWAANVideoIE(AWAANBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:awaan|dcndigital)\\.ae/(?:#/)?(?:video(?:/[^/]+)?|media|catchup/[^/]+/[^/]+)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.awaan'
+    IE_NAME = 'awaan:video'
+
+class AWAANLiveIE(AWAANBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:awaan|dcndigital)\\.ae/(?:#/)?live/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.awaan'
+    IE_NAME = 'awaan:live'
+
+class AWAANSeasonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:awaan|dcndigital)\\.ae/(?:#/)?program/(?:(?P<show_id>\\d+)|season/(?P<season_id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.awaan'
+    IE_NAME = 'awaan:season'
+
+class AZMedienIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?P<host>\n                            telezueri\\.ch|\n                            telebaern\\.tv|\n                            telem1\\.ch\n                        )/\n                        [^/]+/\n                        (?P<id>\n                            [^/]+-(?P<article_id>\\d+)\n                        )\n                        (?:\n                            \\#video=\n                            (?P<kaltura_id>\n                                [_0-9a-z]+\n                            )\n                        )?\n                    '
+    _module = 'pycord.ext.dl.extractor.azmedien'
+
+class BaiduVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v\\.baidu\\.com/(?P<type>[a-z]+)/(?P<id>\\d+)\\.htm'
+    _module = 'pycord.ext.dl.extractor.baidu'
+
+class BrightcoveNewIE(AdobePassIE):
+    _VALID_URL = 'https?://players\\.brightcove\\.net/(?P<account_id>\\d+)/(?P<player_id>[^/]+)_(?P<embed>[^/]+)/index\\.html\\?.*(?P<content_type>video|playlist)Id=(?P<video_id>\\d+|ref:[^&]+)'
+    _module = 'pycord.ext.dl.extractor.brightcove'
+    IE_NAME = 'brightcove:new'
+
+class BandaiChannelIE(BrightcoveNewIE):
+    _VALID_URL = 'https?://(?:www\\.)?b-ch\\.com/titles/(?P<id>\\d+/\\d+)'
+    _module = 'pycord.ext.dl.extractor.bandaichannel'
+    IE_NAME = 'bandaichannel'
+
+class BandcampIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^/]+\\.bandcamp\\.com/track/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.bandcamp'
+
+class BandcampAlbumIE(BandcampIE):
+    _VALID_URL = 'https?://(?:(?P<subdomain>[^.]+)\\.)?bandcamp\\.com(?:/album/(?P<id>[^/?#&]+))?'
+    _module = 'pycord.ext.dl.extractor.bandcamp'
+    IE_NAME = 'Bandcamp:album'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if BandcampWeeklyIE.suitable(url) or BandcampIE.suitable(url)
+            else super(BandcampAlbumIE, cls).suitable(url)
+        )
+
+class BandcampWeeklyIE(BandcampIE):
+    _VALID_URL = 'https?://(?:www\\.)?bandcamp\\.com/?\\?(?:.*?&)?show=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.bandcamp'
+    IE_NAME = 'Bandcamp:weekly'
+
+class BBCCoUkIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?bbc\\.co\\.uk/\n                        (?:\n                            programmes/(?!articles/)|\n                            iplayer(?:/[^/]+)?/(?:episode/|playlist/)|\n                            music/(?:clips|audiovideo/popular)[/#]|\n                            radio/player/|\n                            sounds/play/|\n                            events/[^/]+/play/[^/]+/\n                        )\n                        (?P<id>(?:[pbm][\\da-z]{7}|w[\\da-z]{7,14}))(?!/(?:episodes|broadcasts|clips))\n                    '
+    _module = 'pycord.ext.dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk'
+
+class BBCCoUkArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.co\\.uk/programmes/articles/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk:article'
+
+class BBCCoUkIPlayerPlaylistBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.bbc'
+
+class BBCCoUkIPlayerEpisodesIE(BBCCoUkIPlayerPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.co\\.uk/iplayer/episodes/(?P<id>(?:[pbm][\\da-z]{7}|w[\\da-z]{7,14}))'
+    _module = 'pycord.ext.dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk:iplayer:episodes'
+
+class BBCCoUkIPlayerGroupIE(BBCCoUkIPlayerPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.co\\.uk/iplayer/group/(?P<id>(?:[pbm][\\da-z]{7}|w[\\da-z]{7,14}))'
+    _module = 'pycord.ext.dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk:iplayer:group'
+
+class BBCCoUkPlaylistBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.bbc'
+
+class BBCCoUkPlaylistIE(BBCCoUkPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.co\\.uk/programmes/(?P<id>(?:[pbm][\\da-z]{7}|w[\\da-z]{7,14}))/(?:episodes|broadcasts|clips)'
+    _module = 'pycord.ext.dl.extractor.bbc'
+    IE_NAME = 'bbc.co.uk:playlist'
+
+class BBCIE(BBCCoUkIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbc\\.(?:com|co\\.uk)/(?:[^/]+/)+(?P<id>[^/#?]+)'
+    _module = 'pycord.ext.dl.extractor.bbc'
+    IE_NAME = 'bbc'
+
+    @classmethod
+    def suitable(cls, url):
+        EXCLUDE_IE = (
+            BBCCoUkIE,
+            BBCCoUkArticleIE,
+            BBCCoUkIPlayerEpisodesIE,
+            BBCCoUkIPlayerGroupIE,
+            BBCCoUkPlaylistIE,
+        )
+        return (
+            False
+            if any(ie.suitable(url) for ie in EXCLUDE_IE)
+            else super(BBCIE, cls).suitable(url)
+        )
+
+class BeegIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?beeg\\.(?:com|porn(?:/video)?)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.beeg'
+
+class BehindKinkIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?behindkink\\.com/(?P<year>[0-9]{4})/(?P<month>[0-9]{2})/(?P<day>[0-9]{2})/(?P<id>[^/#?_]+)'
+    _module = 'pycord.ext.dl.extractor.behindkink'
+
+class BellMediaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?\n        (?P<domain>\n            (?:\n                ctv|\n                tsn|\n                bnn(?:bloomberg)?|\n                thecomedynetwork|\n                discovery|\n                discoveryvelocity|\n                sciencechannel|\n                investigationdiscovery|\n                animalplanet|\n                bravo|\n                mtv|\n                space|\n                etalk|\n                marilyn\n            )\\.ca|\n            (?:much|cp24)\\.com\n        )/.*?(?:\\b(?:vid(?:eoid)?|clipId)=|-vid|~|%7E|/(?:episode)?)(?P<id>[0-9]{6,})'
+    _module = 'pycord.ext.dl.extractor.bellmedia'
+
+class BeatportIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|pro\\.)?beatport\\.com/track/(?P<display_id>[^/]+)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.beatport'
+
+class MTVServicesInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.mtv'
+
+class BetIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bet\\.com/(?:[^/]+/)+(?P<id>.+?)\\.html'
+    _module = 'pycord.ext.dl.extractor.bet'
+
+class BFIPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.bfi\\.org\\.uk/[^/]+/film/watch-(?P<id>[\\w-]+)-online'
+    _module = 'pycord.ext.dl.extractor.bfi'
+    IE_NAME = 'bfi:player'
+
+class BFMTVBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.bfmtv'
+
+class BFMTVIE(BFMTVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bfmtv\\.com/(?:[^/]+/)*[^/?&#]+_V[A-Z]-(?P<id>\\d{12})\\.html'
+    _module = 'pycord.ext.dl.extractor.bfmtv'
+    IE_NAME = 'bfmtv'
+
+class BFMTVLiveIE(BFMTVIE):
+    _VALID_URL = 'https?://(?:www\\.)?bfmtv\\.com/(?P<id>(?:[^/]+/)?en-direct)'
+    _module = 'pycord.ext.dl.extractor.bfmtv'
+    IE_NAME = 'bfmtv:live'
+
+class BFMTVArticleIE(BFMTVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bfmtv\\.com/(?:[^/]+/)*[^/?&#]+_A[A-Z]-(?P<id>\\d{12})\\.html'
+    _module = 'pycord.ext.dl.extractor.bfmtv'
+    IE_NAME = 'bfmtv:article'
+
+class BibelTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bibeltv\\.de/mediathek/videos/(?:crn/)?(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.bibeltv'
+
+class BigflixIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bigflix\\.com/.+/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.bigflix'
+
+class BildIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bild\\.de/(?:[^/]+/)+(?P<display_id>[^/]+)-(?P<id>\\d+)(?:,auto=true)?\\.bild\\.html'
+    _module = 'pycord.ext.dl.extractor.bild'
+
+class BiliBiliIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:(?:www|bangumi)\\.)?\n                        bilibili\\.(?:tv|com)/\n                        (?:\n                            (?:\n                                video/[aA][vV]|\n                                anime/(?P<anime_id>\\d+)/play\\#\n                            )(?P<id_bv>\\d+)|\n                            video/[bB][vV](?P<id>[^/?#&]+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.bilibili'
+
+class BiliBiliBangumiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://bangumi\\.bilibili\\.com/anime/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.bilibili'
+    IE_NAME = 'bangumi.bilibili.com'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if BiliBiliIE.suitable(url)
+            else super(BiliBiliBangumiIE, cls).suitable(url)
+        )
+
+class BilibiliAudioBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.bilibili'
+
+class BilibiliAudioIE(BilibiliAudioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bilibili\\.com/audio/au(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.bilibili'
+
+class BilibiliAudioAlbumIE(BilibiliAudioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?bilibili\\.com/audio/am(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.bilibili'
+
+class BiliBiliPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.bilibili\\.com/player\\.html\\?.*?\\baid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.bilibili'
+
+class BioBioChileTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:tv|www)\\.biobiochile\\.cl/(?:notas|noticias)/(?:[^/]+/)+(?P<id>[^/]+)\\.shtml'
+    _module = 'pycord.ext.dl.extractor.biobiochiletv'
+
+class BitChuteIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bitchute\\.com/(?:video|embed|torrent/[^/]+)/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.bitchute'
+
+class BitChuteChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bitchute\\.com/channel/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.bitchute'
+
+class BIQLEIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?biqle\\.(?:com|org|ru)/watch/(?P<id>-?\\d+_\\d+)'
+    _module = 'pycord.ext.dl.extractor.biqle'
+
+class BleacherReportIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bleacherreport\\.com/articles/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.bleacherreport'
+
+class BleacherReportCMSIE(AMPIE):
+    _VALID_URL = 'https?://(?:www\\.)?bleacherreport\\.com/video_embed\\?id=(?P<id>[0-9a-f-]{36}|\\d{5})'
+    _module = 'pycord.ext.dl.extractor.bleacherreport'
+
+class BloombergIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bloomberg\\.com/(?:[^/]+/)*(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.bloomberg'
+
+class BokeCCBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.bokecc'
+
+class BokeCCIE(BokeCCBaseIE):
+    _VALID_URL = 'https?://union\\.bokecc\\.com/playvideo\\.bo\\?(?P<query>.*)'
+    _module = 'pycord.ext.dl.extractor.bokecc'
+
+class BongaCamsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<host>(?:[^/]+\\.)?bongacams\\d*\\.com)/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.bongacams'
+
+class BostonGlobeIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)https?://(?:www\\.)?bostonglobe\\.com/.*/(?P<id>[^/]+)/\\w+(?:\\.html)?'
+    _module = 'pycord.ext.dl.extractor.bostonglobe'
+
+class BoxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^.]+\\.)?app\\.box\\.com/s/(?P<shared_name>[^/]+)/file/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.box'
+
+class BpbIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bpb\\.de/mediathek/(?P<id>[0-9]+)/'
+    _module = 'pycord.ext.dl.extractor.bpb'
+
+class BRIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<base_url>https?://(?:www\\.)?br(?:-klassik)?\\.de)/(?:[a-z0-9\\-_]+/)+(?P<id>[a-z0-9\\-_]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.br'
+
+class BRMediathekIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?br\\.de/mediathek/video/[^/?&#]*?-(?P<id>av:[0-9a-f]{24})'
+    _module = 'pycord.ext.dl.extractor.br'
+
+class BravoTVIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<req_id>bravotv|oxygen)\\.com/(?:[^/]+/)+(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.bravotv'
+
+class BreakIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?break\\.com/video/(?P<display_id>[^/]+?)(?:-(?P<id>\\d+))?(?:[/?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.breakcom'
+
+class BrightcoveLegacyIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://.*brightcove\\.com/(services|viewer).*?\\?|brightcove:)(?P<query>.*)'
+    _module = 'pycord.ext.dl.extractor.brightcove'
+    IE_NAME = 'brightcove:legacy'
+
+class BusinessInsiderIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?businessinsider\\.(?:com|nl)/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.businessinsider'
+
+class BuzzFeedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?buzzfeed\\.com/[^?#]*?/(?P<id>[^?#]+)'
+    _module = 'pycord.ext.dl.extractor.buzzfeed'
+
+class BYUtvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?byutv\\.org/(?:watch|player)/(?!event/)(?P<id>[0-9a-f-]+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'pycord.ext.dl.extractor.byutv'
+
+class C56IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|player)\\.)?56\\.com/(?:.+?/)?(?:v_|(?:play_album.+-))(?P<textid>.+?)\\.(?:html|swf)'
+    _module = 'pycord.ext.dl.extractor.c56'
+    IE_NAME = '56.com'
+
+class CamdemyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?camdemy\\.com/media/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.camdemy'
+
+class CamdemyFolderIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?camdemy\\.com/folder/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.camdemy'
+
+class CamModelsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cammodels\\.com/cam/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.cammodels'
+
+class CamTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|api)\\.)?camtube\\.co/recordings?/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.camtube'
+
+class CamWithHerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?camwithher\\.tv/view_video\\.php\\?.*\\bviewkey=(?P<id>\\w+)'
+    _module = 'pycord.ext.dl.extractor.camwithher'
+
+class CanalplusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>mycanal|piwiplus)\\.fr/(?:[^/]+/)*(?P<display_id>[^?/]+)(?:\\.html\\?.*\\bvid=|/p/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.canalplus'
+
+class Canalc2IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?canalc2\\.tv/video/|archives-canalc2\\.u-strasbg\\.fr/video\\.asp\\?.*\\bidVideo=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.canalc2'
+    IE_NAME = 'canalc2.tv'
+
+class CanvasIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://mediazone\\.vrt\\.be/api/v1/(?P<site_id>canvas|een|ketnet|vrt(?:video|nieuws)|sporza|dako)/assets/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.canvas'
+
+class CanvasEenIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site_id>canvas|een)\\.be/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.canvas'
+
+class GigyaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.gigya'
+
+class VrtNUIE(GigyaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?vrt\\.be/vrtnu/a-z/(?:[^/]+/){2}(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.canvas'
+
+class DagelijkseKostIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://dagelijksekost\\.een\\.be/gerechten/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.canvas'
+
+class CarambaTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?:carambatv:|https?://video1\\.carambatv\\.ru/v/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.carambatv'
+
+class CarambaTVPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://carambatv\\.ru/(?:[^/]+/)+(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.carambatv'
+
+class CartoonNetworkIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?cartoonnetwork\\.com/video/(?:[^/]+/)+(?P<id>[^/?#]+)-(?:clip|episode)\\.html'
+    _module = 'pycord.ext.dl.extractor.cartoonnetwork'
+
+class CBCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cbc\\.ca/(?!player/)(?:[^/]+/)+(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.cbc'
+    IE_NAME = 'cbc.ca'
+
+    @classmethod
+    def suitable(cls, url):
+        return False if CBCPlayerIE.suitable(url) else super(CBCIE, cls).suitable(url)
+
+class CBCPlayerIE(LazyLoadExtractor):
+    _VALID_URL = '(?:cbcplayer:|https?://(?:www\\.)?cbc\\.ca/(?:player/play/|i/caffeine/syndicate/\\?mediaId=))(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.cbc'
+    IE_NAME = 'cbc.ca:player'
+
+class CBCWatchBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.cbc'
+
+class CBCWatchVideoIE(CBCWatchBaseIE):
+    _VALID_URL = 'https?://api-cbc\\.cloud\\.clearleap\\.com/cloffice/client/web/play/?\\?.*?\\bcontentId=(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.cbc'
+    IE_NAME = 'cbc.ca:watch:video'
+
+class CBCWatchIE(CBCWatchBaseIE):
+    _VALID_URL = 'https?://(?:gem|watch)\\.cbc\\.ca/(?:[^/]+/)+(?P<id>[0-9a-f-]+)'
+    _module = 'pycord.ext.dl.extractor.cbc'
+    IE_NAME = 'cbc.ca:watch'
+
+class CBCOlympicsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://olympics\\.cbc\\.ca/video/[^/]+/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.cbc'
+    IE_NAME = 'cbc.ca:olympics'
+
+class ThePlatformFeedIE(ThePlatformBaseIE):
+    _VALID_URL = 'https?://feed\\.theplatform\\.com/f/(?P<provider_id>[^/]+)/(?P<feed_id>[^?/]+)\\?(?:[^&]+&)*(?P<filter>by(?:Gui|I)d=(?P<id>[^&]+))'
+    _module = 'pycord.ext.dl.extractor.theplatform'
+
+class CBSBaseIE(ThePlatformFeedIE):
+    _VALID_URL = 'https?://feed\\.theplatform\\.com/f/(?P<provider_id>[^/]+)/(?P<feed_id>[^?/]+)\\?(?:[^&]+&)*(?P<filter>by(?:Gui|I)d=(?P<id>[^&]+))'
+    _module = 'pycord.ext.dl.extractor.cbs'
+
+class CBSIE(CBSBaseIE):
+    _VALID_URL = '(?:cbs:|https?://(?:www\\.)?(?:(?:cbs|paramountplus)\\.com/shows/[^/]+/video|colbertlateshow\\.com/(?:video|podcasts))/)(?P<id>[\\w-]+)'
+    _module = 'pycord.ext.dl.extractor.cbs'
+
+class CBSLocalIE(AnvatoIE):
+    _VALID_URL = 'https?://[a-z]+\\.cbslocal\\.com/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.cbslocal'
+
+class CBSLocalArticleIE(AnvatoIE):
+    _VALID_URL = 'https?://[a-z]+\\.cbslocal\\.com/\\d+/\\d+/\\d+/(?P<id>[0-9a-z-]+)'
+    _module = 'pycord.ext.dl.extractor.cbslocal'
+
+class CBSInteractiveIE(CBSIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>cnet|zdnet)\\.com/(?:videos|video(?:/share)?)/(?P<id>[^/?]+)'
+    _module = 'pycord.ext.dl.extractor.cbsinteractive'
+
+class CBSNewsEmbedIE(CBSIE):
+    _VALID_URL = 'https?://(?:www\\.)?cbsnews\\.com/embed/video[^#]*#(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.cbsnews'
+    IE_NAME = 'cbsnews:embed'
+
+class CBSNewsIE(CBSIE):
+    _VALID_URL = 'https?://(?:www\\.)?cbsnews\\.com/(?:news|video)/(?P<id>[\\da-z_-]+)'
+    _module = 'pycord.ext.dl.extractor.cbsnews'
+    IE_NAME = 'cbsnews'
+
+class CBSNewsLiveVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cbsnews\\.com/live/video/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.cbsnews'
+    IE_NAME = 'cbsnews:livevideo'
+
+class CBSSportsEmbedIE(LazyLoadExtractor):
+    _VALID_URL = '(?ix)https?://(?:(?:www\\.)?cbs|embed\\.247)sports\\.com/player/embed.+?\n        (?:\n            ids%3D(?P<id>[\\da-f]{8}-(?:[\\da-f]{4}-){3}[\\da-f]{12})|\n            pcid%3D(?P<pcid>\\d+)\n        )'
+    _module = 'pycord.ext.dl.extractor.cbssports'
+    IE_NAME = 'cbssports:embed'
+
+class CBSSportsBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.cbssports'
+
+class CBSSportsIE(CBSSportsBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?cbssports\\.com/[^/]+/video/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.cbssports'
+    IE_NAME = 'cbssports'
+
+class TwentyFourSevenSportsIE(CBSSportsBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?247sports\\.com/Video/(?:[^/?#&]+-)?(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.cbssports'
+    IE_NAME = '247sports'
+
+class CCCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?media\\.ccc\\.de/v/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.ccc'
+    IE_NAME = 'media.ccc.de'
+
+class CCCPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?media\\.ccc\\.de/c/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.ccc'
+    IE_NAME = 'media.ccc.de:lists'
+
+class CCMAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ccma\\.cat/(?:[^/]+/)*?(?P<type>video|audio)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.ccma'
+
+class CCTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:[^/]+)\\.(?:cntv|cctv)\\.(?:com|cn)|(?:www\\.)?ncpa-classic\\.com)/(?:[^/]+/)*?(?P<id>[^/?#&]+?)(?:/index)?(?:\\.s?html|[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.cctv'
+
+class CDAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?cda\\.pl/video|ebd\\.cda\\.pl/[0-9]+x[0-9]+)/(?P<id>[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.cda'
+
+class CeskaTelevizeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ceskatelevize\\.cz/ivysilani/(?:[^/?#&]+/)*(?P<id>[^/#?]+)'
+    _module = 'pycord.ext.dl.extractor.ceskatelevize'
+
+class CeskaTelevizePoradyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ceskatelevize\\.cz/porady/(?:[^/?#&]+/)*(?P<id>[^/#?]+)'
+    _module = 'pycord.ext.dl.extractor.ceskatelevize'
+
+class Channel9IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:channel9\\.msdn\\.com|s\\.ch9\\.ms)/(?P<contentpath>.+?)(?P<rss>/RSS)?/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.channel9'
+    IE_NAME = 'channel9'
+
+class CharlieRoseIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?charlierose\\.com/(?:video|episode)(?:s|/player)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.charlierose'
+
+class ChaturbateIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?chaturbate\\.com/(?:fullvideo/?\\?.*?\\bb=)?(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.chaturbate'
+
+class ChilloutzoneIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?chilloutzone\\.net/video/(?P<id>[\\w|-]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.chilloutzone'
+
+class ChirbitIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?chirb\\.it/(?:(?:wp|pl)/|fb_chirbit_player\\.swf\\?key=)?(?P<id>[\\da-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.chirbit'
+    IE_NAME = 'chirbit'
+
+class ChirbitProfileIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?chirbit\\.com/(?:rss/)?(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.chirbit'
+    IE_NAME = 'chirbit:profile'
+
+class CinchcastIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.cinchcast\\.com/.*?(?:assetId|show_id)=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.cinchcast'
+
+class HBOBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.hbo'
+
+class CinemaxIE(HBOBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?cinemax\\.com/(?P<path>[^/]+/video/[0-9a-z-]+-(?P<id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.cinemax'
+
+class CiscoLiveBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.ciscolive'
+
+class CiscoLiveSessionIE(CiscoLiveBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ciscolive(?:\\.cisco)?\\.com/[^#]*#/session/(?P<id>[^/?&]+)'
+    _module = 'pycord.ext.dl.extractor.ciscolive'
+
+class CiscoLiveSearchIE(CiscoLiveBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ciscolive(?:\\.cisco)?\\.com/(?:global/)?on-demand-library(?:\\.html|/)'
+    _module = 'pycord.ext.dl.extractor.ciscolive'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if CiscoLiveSessionIE.suitable(url)
+            else super(CiscoLiveSearchIE, cls).suitable(url)
+        )
+
+class CJSWIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cjsw\\.com/program/(?P<program>[^/]+)/episode/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.cjsw'
+
+class CliphunterIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?cliphunter\\.com/w/\n        (?P<id>[0-9]+)/\n        (?P<seo>.+?)(?:$|[#\\?])\n    '
+    _module = 'pycord.ext.dl.extractor.cliphunter'
+    IE_NAME = 'cliphunter'
+
+class ClippitIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?clippituser\\.tv/c/(?P<id>[a-z]+)'
+    _module = 'pycord.ext.dl.extractor.clippit'
+
+class OnetBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.onet'
+
+class ClipRsIE(OnetBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?clip\\.rs/(?P<id>[^/]+)/\\d+'
+    _module = 'pycord.ext.dl.extractor.cliprs'
+
+class ClipsyndicateIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:chic|www)\\.clipsyndicate\\.com/video/play(list/\\d+)?/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.clipsyndicate'
+
+class CloserToTruthIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?closertotruth\\.com/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.closertotruth'
+
+class CloudflareStreamIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:watch\\.)?(?:cloudflarestream\\.com|(?:videodelivery|bytehighway)\\.net)/|\n                            embed\\.(?:cloudflarestream\\.com|(?:videodelivery|bytehighway)\\.net)/embed/[^/]+\\.js\\?.*?\\bvideo=\n                        )\n                        (?P<id>[\\da-f]{32}|[\\w-]+\\.[\\w-]+\\.[\\w-]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.cloudflarestream'
+
+class CloudyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cloudy\\.ec/(?:v/|embed\\.php\\?.*?\\bid=)(?P<id>[A-Za-z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.cloudy'
+
+class ClubicIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?clubic\\.com/video/(?:[^/]+/)*video.*-(?P<id>[0-9]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.clubic'
+
+class ClypIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?clyp\\.it/(?P<id>[a-z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.clyp'
+
+class MTVIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mtv\\.com/(?:video-clips|(?:full-)?episodes)/(?P<id>[^/?#.]+)'
+    _module = 'pycord.ext.dl.extractor.mtv'
+    IE_NAME = 'mtv'
+
+class CMTIE(MTVIE):
+    _VALID_URL = 'https?://(?:www\\.)?cmt\\.com/(?:videos|shows|(?:full-)?episodes|video-clips)/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.cmt'
+    IE_NAME = 'cmt.com'
+
+class CNBCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.cnbc\\.com/gallery/\\?video=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.cnbc'
+
+class CNBCVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cnbc\\.com(?P<path>/video/(?:[^/]+/)+(?P<id>[^./?#&]+)\\.html)'
+    _module = 'pycord.ext.dl.extractor.cnbc'
+
+class CNNIE(TurnerBaseIE):
+    _VALID_URL = '(?x)https?://(?:(?P<sub_domain>edition|www|money)\\.)?cnn\\.com/(?:video/(?:data/.+?|\\?)/)?videos?/\n        (?P<path>.+?/(?P<title>[^/]+?)(?:\\.(?:[a-z\\-]+)|(?=&)))'
+    _module = 'pycord.ext.dl.extractor.cnn'
+
+class CNNBlogsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^\\.]+\\.blogs\\.cnn\\.com/.+'
+    _module = 'pycord.ext.dl.extractor.cnn'
+
+class CNNArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:edition|www)\\.)?cnn\\.com/(?!videos?/)'
+    _module = 'pycord.ext.dl.extractor.cnn'
+
+class CoubIE(LazyLoadExtractor):
+    _VALID_URL = '(?:coub:|https?://(?:coub\\.com/(?:view|embed|coubs)/|c-cdn\\.coub\\.com/fb-player\\.swf\\?.*\\bcoub(?:ID|id)=))(?P<id>[\\da-z]+)'
+    _module = 'pycord.ext.dl.extractor.coub'
+
+class ComedyCentralIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cc\\.com/(?:episodes|video(?:-clips)?)/(?P<id>[0-9a-z]{6})'
+    _module = 'pycord.ext.dl.extractor.comedycentral'
+
+class ComedyCentralTVIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?comedycentral\\.tv/folgen/(?P<id>[0-9a-z]{6})'
+    _module = 'pycord.ext.dl.extractor.comedycentral'
+
+class CommonMistakesIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        (?:url|URL)$\n    '
+    _module = 'pycord.ext.dl.extractor.commonmistakes'
+
+class UnicodeBOMIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<bom>\\ufeff)(?P<id>.*)$'
+    _module = 'pycord.ext.dl.extractor.commonmistakes'
+
+class MmsIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)mms://.+'
+    _module = 'pycord.ext.dl.extractor.commonprotocols'
+
+class RtmpIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)rtmp[est]?://.+'
+    _module = 'pycord.ext.dl.extractor.commonprotocols'
+
+class CondeNastIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:video|www|player(?:-backend)?)\\.(?:allure|architecturaldigest|arstechnica|bonappetit|brides|cnevids|cntraveler|details|epicurious|glamour|golfdigest|gq|newyorker|self|teenvogue|vanityfair|vogue|wired|wmagazine)\\.com/\n        (?:\n            (?:\n                embed(?:js)?|\n                (?:script|inline)/video\n            )/(?P<id>[0-9a-f]{24})(?:/(?P<player_id>[0-9a-f]{24}))?(?:.+?\\btarget=(?P<target>[^&]+))?|\n            (?P<type>watch|series|video)/(?P<display_id>[^/?#]+)\n        )'
+    _module = 'pycord.ext.dl.extractor.condenast'
+
+class CONtvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?contv\\.com/details-movie/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.contv'
+
+class CorusIE(ThePlatformFeedIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?P<domain>\n                            (?:\n                                globaltv|\n                                etcanada|\n                                seriesplus|\n                                wnetwork|\n                                ytv\n                            )\\.com|\n                            (?:\n                                hgtv|\n                                foodnetwork|\n                                slice|\n                                history|\n                                showcase|\n                                bigbrothercanada|\n                                abcspark|\n                                disney(?:channel|lachaine)\n                            )\\.ca\n                        )\n                        /(?:[^/]+/)*\n                        (?:\n                            video\\.html\\?.*?\\bv=|\n                            videos?/(?:[^/]+/)*(?:[a-z0-9-]+-)?\n                        )\n                        (?P<id>\n                            [\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12}|\n                            (?:[A-Z]{4})?\\d{12,20}\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.corus'
+
+class CrackedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cracked\\.com/video_(?P<id>\\d+)_[\\da-z-]+\\.html'
+    _module = 'pycord.ext.dl.extractor.cracked'
+
+class CrackleIE(LazyLoadExtractor):
+    _VALID_URL = '(?:crackle:|https?://(?:(?:www|m)\\.)?(?:sony)?crackle\\.com/(?:playlist/\\d+/|(?:[^/]+/)+))(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.crackle'
+
+class CrooksAndLiarsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://embed\\.crooksandliars\\.com/(?:embed|v)/(?P<id>[A-Za-z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.crooksandliars'
+
+class CrunchyrollBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.crunchyroll'
+
+class VRVBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.vrv'
+
+class VRVIE(VRVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?vrv\\.co/watch/(?P<id>[A-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.vrv'
+    IE_NAME = 'vrv'
+
+class CrunchyrollIE(CrunchyrollBaseIE, VRVIE):
+    _VALID_URL = 'https?://(?:(?P<prefix>www|m)\\.)?(?P<url>crunchyroll\\.(?:com|fr)/(?:media(?:-|/\\?id=)|(?:[^/]*/){1,2}[^/?&]*?)(?P<video_id>[0-9]+))(?:[/?&]|$)'
+    _module = 'pycord.ext.dl.extractor.crunchyroll'
+    IE_NAME = 'crunchyroll'
+
+class CrunchyrollShowPlaylistIE(CrunchyrollBaseIE):
+    _VALID_URL = 'https?://(?:(?P<prefix>www|m)\\.)?(?P<url>crunchyroll\\.com/(?!(?:news|anime-news|library|forum|launchcalendar|lineup|store|comics|freetrial|login|media-\\d+))(?P<id>[\\w\\-]+))/?(?:\\?|$)'
+    _module = 'pycord.ext.dl.extractor.crunchyroll'
+    IE_NAME = 'crunchyroll:playlist'
+
+class CSpanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?c-span\\.org/video/\\?(?P<id>[0-9a-f]+)'
+    _module = 'pycord.ext.dl.extractor.cspan'
+
+class CtsNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://news\\.cts\\.com\\.tw/[a-z]+/[a-z]+/\\d+/(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.ctsnews'
+
+class CTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ctv\\.ca/(?P<id>(?:show|movie)s/[^/]+/[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.ctv'
+
+class CTVNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?ctvnews\\.ca/(?:video\\?(?:clip|playlist|bin)Id=|.*?)(?P<id>[0-9.]+)'
+    _module = 'pycord.ext.dl.extractor.ctvnews'
+
+class CultureUnpluggedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cultureunplugged\\.com/documentary/watch-online/play/(?P<id>\\d+)(?:/(?P<display_id>[^/]+))?'
+    _module = 'pycord.ext.dl.extractor.cultureunplugged'
+
+class CuriosityStreamBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.curiositystream'
+
+class CuriosityStreamIE(CuriosityStreamBaseIE):
+    _VALID_URL = 'https?://(?:app\\.)?curiositystream\\.com/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.curiositystream'
+    IE_NAME = 'curiositystream'
+
+class CuriosityStreamCollectionIE(CuriosityStreamBaseIE):
+    _VALID_URL = 'https?://(?:app\\.)?curiositystream\\.com/(?:collections?|series)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.curiositystream'
+    IE_NAME = 'curiositystream:collection'
+
+class CWTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?cw(?:tv(?:pr)?|seed)\\.com/(?:shows/)?(?:[^/]+/)+[^?]*\\?.*\\b(?:play|watch)=(?P<id>[a-z0-9]{8}-[a-z0-9]{4}-[a-z0-9]{4}-[a-z0-9]{4}-[a-z0-9]{12})'
+    _module = 'pycord.ext.dl.extractor.cwtv'
+
+class DailyMailIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dailymail\\.co\\.uk/(?:video/[^/]+/video-|embed/video/)(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.dailymail'
+
+class DailymotionBaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.dailymotion'
+
+class DailymotionIE(DailymotionBaseInfoExtractor):
+    _VALID_URL = '(?ix)\n                    https?://\n                        (?:\n                            (?:(?:www|touch)\\.)?dailymotion\\.[a-z]{2,3}/(?:(?:(?:embed|swf|\\#)/)?video|swf)|\n                            (?:www\\.)?lequipe\\.fr/video\n                        )\n                        /(?P<id>[^/?_]+)(?:.+?\\bplaylist=(?P<playlist_id>x[0-9a-z]+))?\n                    '
+    _module = 'pycord.ext.dl.extractor.dailymotion'
+    IE_NAME = 'dailymotion'
+
+class DailymotionPlaylistBaseIE(DailymotionBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.dailymotion'
+
+class DailymotionPlaylistIE(DailymotionPlaylistBaseIE):
+    _VALID_URL = '(?:https?://)?(?:www\\.)?dailymotion\\.[a-z]{2,3}/playlist/(?P<id>x[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.dailymotion'
+    IE_NAME = 'dailymotion:playlist'
+
+class DailymotionUserIE(DailymotionPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?dailymotion\\.[a-z]{2,3}/(?!(?:embed|swf|#|video|playlist)/)(?:(?:old/)?user/)?(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.dailymotion'
+    IE_NAME = 'dailymotion:user'
+
+class DaumBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.daum'
+
+class DaumIE(DaumBaseIE):
+    _VALID_URL = 'https?://(?:(?:m\\.)?tvpot\\.daum\\.net/v/|videofarm\\.daum\\.net/controller/player/VodPlayer\\.swf\\?vid=)(?P<id>[^?#&]+)'
+    _module = 'pycord.ext.dl.extractor.daum'
+    IE_NAME = 'daum.net'
+
+class DaumClipIE(DaumBaseIE):
+    _VALID_URL = 'https?://(?:m\\.)?tvpot\\.daum\\.net/(?:clip/ClipView.(?:do|tv)|mypot/View.do)\\?.*?clipid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.daum'
+    IE_NAME = 'daum.net:clip'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if DaumPlaylistIE.suitable(url) or DaumUserIE.suitable(url)
+            else super(DaumClipIE, cls).suitable(url)
+        )
+
+class DaumListIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.daum'
+
+class DaumPlaylistIE(DaumListIE):
+    _VALID_URL = 'https?://(?:m\\.)?tvpot\\.daum\\.net/mypot/(?:View\\.do|Top\\.tv)\\?.*?playlistid=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.daum'
+    IE_NAME = 'daum.net:playlist'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if DaumUserIE.suitable(url)
+            else super(DaumPlaylistIE, cls).suitable(url)
+        )
+
+class DaumUserIE(DaumListIE):
+    _VALID_URL = 'https?://(?:m\\.)?tvpot\\.daum\\.net/mypot/(?:View|Top)\\.(?:do|tv)\\?.*?ownerid=(?P<id>[0-9a-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.daum'
+    IE_NAME = 'daum.net:user'
+
+class DBTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dagbladet\\.no/video/(?:(?:embed|(?P<display_id>[^/]+))/)?(?P<id>[0-9A-Za-z_-]{11}|[a-zA-Z0-9]{8})'
+    _module = 'pycord.ext.dl.extractor.dbtv'
+
+class DctpTvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dctp\\.tv/(?:#/)?filme/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.dctp'
+
+class DeezerPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?deezer\\.com/playlist/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.deezer'
+
+class DemocracynowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?democracynow\\.org/(?P<id>[^\\?]*)'
+    _module = 'pycord.ext.dl.extractor.democracynow'
+    IE_NAME = 'democracynow'
+
+class DFBIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tv\\.dfb\\.de/video/(?P<display_id>[^/]+)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.dfb'
+    IE_NAME = 'tv.dfb.de'
+
+class DHMIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dhm\\.de/filmarchiv/(?:[^/]+/)+(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.dhm'
+
+class DiggIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?digg\\.com/video/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.digg'
+
+class DotsubIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dotsub\\.com/view/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.dotsub'
+
+class DouyuShowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v(?:mobile)?\\.douyu\\.com/show/(?P<id>[0-9a-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.douyutv'
+
+class DouyuTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?douyu(?:tv)?\\.com/(?:[^/]+/)*(?P<id>[A-Za-z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.douyutv'
+
+class DPlayIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://\n        (?P<domain>\n            (?:www\\.)?(?P<host>d\n                (?:\n                    play\\.(?P<country>dk|fi|jp|se|no)|\n                    iscoveryplus\\.(?P<plus_country>dk|es|fi|it|se|no)\n                )\n            )|\n            (?P<subdomain_country>es|it)\\.dplay\\.com\n        )/[^/]+/(?P<id>[^/]+/[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.dplay'
+
+class DiscoveryPlusIE(DPlayIE):
+    _VALID_URL = 'https?://(?:www\\.)?discoveryplus\\.com/video/(?P<id>[^/]+/[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.dplay'
+
+class HGTVDeIE(DPlayIE):
+    _VALID_URL = 'https?://de\\.hgtv\\.com/sendungen/(?P<id>[^/]+/[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.dplay'
+
+class ZDFBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.zdf'
+
+class ZDFIE(ZDFBaseIE):
+    _VALID_URL = 'https?://www\\.zdf\\.de/(?:[^/]+/)*(?P<id>[^/?#&]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.zdf'
+
+class DreiSatIE(ZDFIE):
+    _VALID_URL = 'https?://(?:www\\.)?3sat\\.de/(?:[^/]+/)*(?P<id>[^/?#&]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.dreisat'
+    IE_NAME = '3sat'
+
+class DRBonanzaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dr\\.dk/bonanza/[^/]+/\\d+/[^/]+/(?P<id>\\d+)/(?P<display_id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.drbonanza'
+
+class DrTuberIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?drtuber\\.com/(?:video|embed)/(?P<id>\\d+)(?:/(?P<display_id>[\\w-]+))?'
+    _module = 'pycord.ext.dl.extractor.drtuber'
+
+class DRTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?dr\\.dk/(?:tv/se|nyheder|radio(?:/ondemand)?)/(?:[^/]+/)*|\n                            (?:www\\.)?(?:dr\\.dk|dr-massive\\.com)/drtv/(?:se|episode|program)/\n                        )\n                        (?P<id>[\\da-z_-]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.drtv'
+    IE_NAME = 'drtv'
+
+class DRTVLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dr\\.dk/(?:tv|TV)/live/(?P<id>[\\da-z-]+)'
+    _module = 'pycord.ext.dl.extractor.drtv'
+    IE_NAME = 'drtv:live'
+
+class DTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?d\\.tube/(?:#!/)?v/(?P<uploader_id>[0-9a-z.-]+)/(?P<id>[0-9a-z]{8})'
+    _module = 'pycord.ext.dl.extractor.dtube'
+
+class DVTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.aktualne\\.cz/(?:[^/]+/)+r~(?P<id>[0-9a-f]{32})'
+    _module = 'pycord.ext.dl.extractor.dvtv'
+    IE_NAME = 'dvtv'
+
+class DumpertIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<protocol>https?)://(?:(?:www|legacy)\\.)?dumpert\\.nl/(?:mediabase|embed|item)/(?P<id>[0-9]+[/_][0-9a-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.dumpert'
+
+class DefenseGouvFrIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.*?\\.defense\\.gouv\\.fr/layout/set/ligthboxvideo/base-de-medias/webtv/(?P<id>[^/?#]*)'
+    _module = 'pycord.ext.dl.extractor.defense'
+    IE_NAME = 'defense.gouv.fr'
+
+class DiscoveryGoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.discoverygo'
+
+class DiscoveryIE(DiscoveryGoBaseIE):
+    _VALID_URL = '(?x)https?://\n        (?P<site>\n            go\\.discovery|\n            www\\.\n                (?:\n                    investigationdiscovery|\n                    discoverylife|\n                    animalplanet|\n                    ahctv|\n                    destinationamerica|\n                    sciencechannel|\n                    tlc\n                )|\n            watch\\.\n                (?:\n                    hgtv|\n                    foodnetwork|\n                    travelchannel|\n                    diynetwork|\n                    cookingchanneltv|\n                    motortrend\n                )\n        )\\.com/tv-shows/(?P<show_slug>[^/]+)/(?:video|full-episode)s/(?P<id>[^./?#]+)'
+    _module = 'pycord.ext.dl.extractor.discovery'
+
+class DiscoveryGoIE(DiscoveryGoBaseIE):
+    _VALID_URL = '(?x)https?://(?:www\\.)?(?:\n            discovery|\n            investigationdiscovery|\n            discoverylife|\n            animalplanet|\n            ahctv|\n            destinationamerica|\n            sciencechannel|\n            tlc|\n            velocitychannel\n        )go\\.com/(?:[^/]+/)+(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.discoverygo'
+
+class DiscoveryGoPlaylistIE(DiscoveryGoBaseIE):
+    _VALID_URL = '(?x)https?://(?:www\\.)?(?:\n            discovery|\n            investigationdiscovery|\n            discoverylife|\n            animalplanet|\n            ahctv|\n            destinationamerica|\n            sciencechannel|\n            tlc|\n            velocitychannel\n        )go\\.com/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.discoverygo'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if DiscoveryGoIE.suitable(url)
+            else super(DiscoveryGoPlaylistIE, cls).suitable(url)
+        )
+
+class DiscoveryNetworksDeIE(DPlayIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<domain>(?:tlc|dmax)\\.de|dplay\\.co\\.uk)/(?:programme|show|sendungen)/(?P<programme>[^/]+)/(?:video/)?(?P<alternate_id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.discoverynetworks'
+
+class DiscoveryVRIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?discoveryvr\\.com/watch/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.discoveryvr'
+
+class DisneyIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?P<domain>(?:[^/]+\\.)?(?:disney\\.[a-z]{2,3}(?:\\.[a-z]{2})?|disney(?:(?:me|latino)\\.com|turkiye\\.com\\.tr|channel\\.de)|(?:starwars|marvelkids)\\.com))/(?:(?:embed/|(?:[^/]+/)+[\\w-]+-)(?P<id>[a-z0-9]{24})|(?:[^/]+/)?(?P<display_id>[^/?#]+))'
+    _module = 'pycord.ext.dl.extractor.disney'
+
+class DigitallySpeakingIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:s?evt\\.dispeak|events\\.digitallyspeaking)\\.com/(?:[^/]+/)+xml/(?P<id>[^.]+)\\.xml'
+    _module = 'pycord.ext.dl.extractor.dispeak'
+
+class DropboxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dropbox[.]com/sh?/(?P<id>[a-zA-Z0-9]{15})/.*'
+    _module = 'pycord.ext.dl.extractor.dropbox'
+
+class DWIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dw\\.com/(?:[^/]+/)+(?:av|e)-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.dw'
+    IE_NAME = 'dw'
+
+class DWArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dw\\.com/(?:[^/]+/)+a-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.dw'
+    IE_NAME = 'dw:article'
+
+class EaglePlatformIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        eagleplatform:(?P<custom_host>[^/]+):|\n                        https?://(?P<host>.+?\\.media\\.eagleplatform\\.com)/index/player\\?.*\\brecord_id=\n                    )\n                    (?P<id>\\d+)\n                '
+    _module = 'pycord.ext.dl.extractor.eagleplatform'
+
+class EbaumsWorldIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ebaumsworld\\.com/videos/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.ebaumsworld'
+
+class EchoMskIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?echo\\.msk\\.ru/sounds/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.echomsk'
+
+class EggheadBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.egghead'
+
+class EggheadCourseIE(EggheadBaseIE):
+    _VALID_URL = 'https://(?:app\\.)?egghead\\.io/(?:course|playlist)s/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.egghead'
+    IE_NAME = 'egghead:course'
+
+class EggheadLessonIE(EggheadBaseIE):
+    _VALID_URL = 'https://(?:app\\.)?egghead\\.io/(?:api/v1/)?lessons/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.egghead'
+    IE_NAME = 'egghead:lesson'
+
+class EHowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ehow\\.com/[^/_?]*_(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.ehow'
+    IE_NAME = 'eHow'
+
+class EightTracksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://8tracks\\.com/(?P<user>[^/]+)/(?P<id>[^/#]+)(?:#.*)?$'
+    _module = 'pycord.ext.dl.extractor.eighttracks'
+    IE_NAME = '8tracks'
+
+class EinthusanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<host>einthusan\\.(?:tv|com|ca))/movie/watch/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.einthusan'
+
+class EitbIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?eitb\\.tv/(?:eu/bideoa|es/video)/[^/]+/\\d+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.eitb'
+    IE_NAME = 'eitb.tv'
+
+class EllenTubeBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.ellentube'
+
+class EllenTubeIE(EllenTubeBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            ellentube:|\n                            https://api-prod\\.ellentube\\.com/ellenapi/api/item/\n                        )\n                        (?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})\n                    '
+    _module = 'pycord.ext.dl.extractor.ellentube'
+
+class EllenTubeVideoIE(EllenTubeBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ellentube\\.com/video/(?P<id>.+?)\\.html'
+    _module = 'pycord.ext.dl.extractor.ellentube'
+
+class EllenTubePlaylistIE(EllenTubeBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ellentube\\.com/(?:episode|studios)/(?P<id>.+?)\\.html'
+    _module = 'pycord.ext.dl.extractor.ellentube'
+
+class ElPaisIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^.]+\\.)?elpais\\.com/.*/(?P<id>[^/#?]+)\\.html(?:$|[?#])'
+    _module = 'pycord.ext.dl.extractor.elpais'
+
+class EmbedlyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|cdn\\.)?embedly\\.com/widgets/media\\.html\\?(?:[^#]*?&)?url=(?P<id>[^#&]+)'
+    _module = 'pycord.ext.dl.extractor.embedly'
+
+class EngadgetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?engadget\\.com/video/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.engadget'
+
+class EpornerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?eporner\\.com/(?:(?:hd-porn|embed)/|video-)(?P<id>\\w+)(?:/(?P<display_id>[\\w-]+))?'
+    _module = 'pycord.ext.dl.extractor.eporner'
+
+class EroProfileIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?eroprofile\\.com/m/videos/view/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.eroprofile'
+
+class EscapistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://?(?:(?:www|v1)\\.)?escapistmagazine\\.com/videos/view/[^/]+/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.escapist'
+
+class ESPNIE(OnceIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:\n                                (?:\n                                    (?:(?:\\w+\\.)+)?espn\\.go|\n                                    (?:www\\.)?espn\n                                )\\.com/\n                                (?:\n                                    (?:\n                                        video/(?:clip|iframe/twitter)|\n                                        watch/player\n                                    )\n                                    (?:\n                                        .*?\\?.*?\\bid=|\n                                        /_/id/\n                                    )|\n                                    [^/]+/video/\n                                )\n                            )|\n                            (?:www\\.)espnfc\\.(?:com|us)/(?:video/)?[^/]+/\\d+/video/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.espn'
+
+class ESPNArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:espn\\.go|(?:www\\.)?espn)\\.com/(?:[^/]+/)*(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.espn'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if ESPNIE.suitable(url) else super(ESPNArticleIE, cls).suitable(url)
+        )
+
+class FiveThirtyEightIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fivethirtyeight\\.com/features/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.espn'
+
+class EsriVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.esri\\.com/watch/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.esri'
+
+class EuropaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://ec\\.europa\\.eu/avservices/(?:video/player|audio/audioDetails)\\.cfm\\?.*?\\bref=(?P<id>[A-Za-z0-9-]+)'
+    _module = 'pycord.ext.dl.extractor.europa'
+
+class ExpoTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?expotv\\.com/videos/[^?#]*/(?P<id>[0-9]+)($|[?#])'
+    _module = 'pycord.ext.dl.extractor.expotv'
+
+class ExpressenIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?(?:expressen|di)\\.se/\n                        (?:(?:tvspelare/video|videoplayer/embed)/)?\n                        tv/(?:[^/]+/)*\n                        (?P<id>[^/?#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.expressen'
+
+class KeezMoviesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?keezmovies\\.com/video/(?:(?P<display_id>[^/]+)-)?(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.keezmovies'
+
+class ExtremeTubeIE(KeezMoviesIE):
+    _VALID_URL = 'https?://(?:www\\.)?extremetube\\.com/(?:[^/]+/)?video/(?P<id>[^/#?&]+)'
+    _module = 'pycord.ext.dl.extractor.extremetube'
+
+class EyedoTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?eyedo\\.tv/[^/]+/(?:#!/)?Live/Detail/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.eyedotv'
+
+class FacebookIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                (?:\n                    https?://\n                        (?:[\\w-]+\\.)?(?:facebook\\.com|facebookcorewwwi\\.onion)/\n                        (?:[^#]*?\\#!/)?\n                        (?:\n                            (?:\n                                video/video\\.php|\n                                photo\\.php|\n                                video\\.php|\n                                video/embed|\n                                story\\.php|\n                                watch(?:/live)?/?\n                            )\\?(?:.*?)(?:v|video_id|story_fbid)=|\n                            [^/]+/videos/(?:[^/]+/)?|\n                            [^/]+/posts/|\n                            groups/[^/]+/permalink/|\n                            watchparty/\n                        )|\n                    facebook:\n                )\n                (?P<id>[0-9]+)\n                '
+    _module = 'pycord.ext.dl.extractor.facebook'
+    IE_NAME = 'facebook'
+
+class FacebookPluginsVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[\\w-]+\\.)?facebook\\.com/plugins/video\\.php\\?.*?\\bhref=(?P<id>https.+)'
+    _module = 'pycord.ext.dl.extractor.facebook'
+
+class FazIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?faz\\.net/(?:[^/]+/)*.*?-(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.faz'
+    IE_NAME = 'faz.net'
+
+class FC2IE(LazyLoadExtractor):
+    _VALID_URL = '^(?:https?://video\\.fc2\\.com/(?:[^/]+/)*content/|fc2:)(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.fc2'
+    IE_NAME = 'fc2'
+
+class FC2EmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.fc2\\.com/flv2\\.swf\\?(?P<query>.+)'
+    _module = 'pycord.ext.dl.extractor.fc2'
+    IE_NAME = 'fc2:embed'
+
+class FczenitIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fc-zenit\\.ru/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.fczenit'
+
+class FilmOnIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://(?:www\\.)?filmon\\.com/vod/view/|filmon:)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.filmon'
+    IE_NAME = 'filmon'
+
+class FilmOnChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?filmon\\.com/(?:tv|channel)/(?P<id>[a-z0-9-]+)'
+    _module = 'pycord.ext.dl.extractor.filmon'
+    IE_NAME = 'filmon:channel'
+
+class FilmwebIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?filmweb\\.no/(?P<type>trailere|filmnytt)/article(?P<id>\\d+)\\.ece'
+    _module = 'pycord.ext.dl.extractor.filmweb'
+
+class FirstTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?1tv\\.ru/(?:[^/]+/)+(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.firsttv'
+    IE_NAME = '1tv'
+
+class FiveMinIE(LazyLoadExtractor):
+    _VALID_URL = '(?:5min:|https?://(?:[^/]*?5min\\.com/|delivery\\.vidible\\.tv/aol)(?:(?:Scripts/PlayerSeed\\.js|playerseed/?)?\\?.*?playList=)?)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.fivemin'
+    IE_NAME = '5min'
+
+class FiveTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?5-tv\\.ru/\n                        (?:\n                            (?:[^/]+/)+(?P<id>\\d+)|\n                            (?P<path>[^/?#]+)(?:[/?#])?\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.fivetv'
+
+class FlickrIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|secure\\.)?flickr\\.com/photos/[\\w\\-_@]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.flickr'
+
+class FolketingetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ft\\.dk/webtv/video/[^?#]*?\\.(?P<id>[0-9]+)\\.aspx'
+    _module = 'pycord.ext.dl.extractor.folketinget'
+
+class FootyRoomIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://footyroom\\.com/matches/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.footyroom'
+
+class Formula1IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?formula1\\.com/en/latest/video\\.[^.]+\\.(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.formula1'
+
+class FourTubeBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.fourtube'
+
+class FourTubeIE(FourTubeBaseIE):
+    _VALID_URL = 'https?://(?:(?P<kind>www|m)\\.)?4tube\\.com/(?:videos|embed)/(?P<id>\\d+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'pycord.ext.dl.extractor.fourtube'
+    IE_NAME = '4tube'
+
+class PornTubeIE(FourTubeBaseIE):
+    _VALID_URL = 'https?://(?:(?P<kind>www|m)\\.)?porntube\\.com/(?:videos/(?P<display_id>[^/]+)_|embed/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.fourtube'
+
+class PornerBrosIE(FourTubeBaseIE):
+    _VALID_URL = 'https?://(?:(?P<kind>www|m)\\.)?pornerbros\\.com/(?:videos/(?P<display_id>[^/]+)_|embed/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.fourtube'
+
+class FuxIE(FourTubeBaseIE):
+    _VALID_URL = 'https?://(?:(?P<kind>www|m)\\.)?fux\\.com/(?:video|embed)/(?P<id>\\d+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'pycord.ext.dl.extractor.fourtube'
+
+class FOXIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?fox\\.com/watch/(?P<id>[\\da-fA-F]+)'
+    _module = 'pycord.ext.dl.extractor.fox'
+
+class FOX9IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fox9\\.com/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.fox9'
+
+class FOX9NewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fox9\\.com/news/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.fox9'
+
+class FoxgayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?foxgay\\.com/videos/(?:\\S+-)?(?P<id>\\d+)\\.shtml'
+    _module = 'pycord.ext.dl.extractor.foxgay'
+
+class FoxNewsIE(AMPIE):
+    _VALID_URL = 'https?://(?P<host>video\\.(?:insider\\.)?fox(?:news|business)\\.com)/v/(?:video-embed\\.html\\?video_id=)?(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.foxnews'
+    IE_NAME = 'foxnews'
+
+class FoxNewsArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:insider\\.)?foxnews\\.com/(?!v)([^/]+/)+(?P<id>[a-z-]+)'
+    _module = 'pycord.ext.dl.extractor.foxnews'
+    IE_NAME = 'foxnews:article'
+
+class FoxSportsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?foxsports\\.com/(?:[^/]+/)*video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.foxsports'
+
+class FranceCultureIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?franceculture\\.fr/emissions/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.franceculture'
+
+class FranceInterIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?franceinter\\.fr/emissions/(?P<id>[^?#]+)'
+    _module = 'pycord.ext.dl.extractor.franceinter'
+
+class FranceTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        https?://\n                            sivideo\\.webservices\\.francetelevisions\\.fr/tools/getInfosOeuvre/v2/\\?\n                            .*?\\bidDiffusion=[^&]+|\n                        (?:\n                            https?://videos\\.francetv\\.fr/video/|\n                            francetv:\n                        )\n                        (?P<id>[^@]+)(?:@(?P<catalog>.+))?\n                    )\n                    '
+    _module = 'pycord.ext.dl.extractor.francetv'
+
+class FranceTVBaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.francetv'
+
+class FranceTVSiteIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?france\\.tv|mobile\\.france\\.tv)/(?:[^/]+/)*(?P<id>[^/]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.francetv'
+
+class FranceTVEmbedIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://embed\\.francetv\\.fr/*\\?.*?\\bue=(?P<id>[^&]+)'
+    _module = 'pycord.ext.dl.extractor.francetv'
+
+class FranceTVInfoIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:www|mobile|france3-regions)\\.francetvinfo\\.fr/(?:[^/]+/)*(?P<id>[^/?#&.]+)'
+    _module = 'pycord.ext.dl.extractor.francetv'
+    IE_NAME = 'francetvinfo.fr'
+
+class FranceTVInfoSportIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://sport\\.francetvinfo\\.fr/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.francetv'
+    IE_NAME = 'sport.francetvinfo.fr'
+
+class FranceTVJeunesseIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = '(?P<url>https?://(?:www\\.)?(?:zouzous|ludo)\\.fr/heros/(?P<id>[^/?#&]+))'
+    _module = 'pycord.ext.dl.extractor.francetv'
+
+class GenerationWhatIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://generation-what\\.francetv\\.fr/[^/]+/video/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.francetv'
+    IE_NAME = 'france2.fr:generation-what'
+
+class CultureboxIE(FranceTVBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:m\\.)?culturebox\\.francetvinfo\\.fr/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.francetv'
+
+class FreesoundIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?freesound\\.org/people/[^/]+/sounds/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.freesound'
+
+class FreespeechIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?freespeech\\.org/stories/(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.freespeech'
+    IE_NAME = 'freespeech.org'
+
+class FreshLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://freshlive\\.tv/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.freshlive'
+
+class FrontendMastersBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.frontendmasters'
+
+class FrontendMastersIE(FrontendMastersBaseIE):
+    _VALID_URL = '(?:frontendmasters:|https?://api\\.frontendmasters\\.com/v\\d+/kabuki/video/)(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.frontendmasters'
+
+class FrontendMastersPageBaseIE(FrontendMastersBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.frontendmasters'
+
+class FrontendMastersLessonIE(FrontendMastersPageBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?frontendmasters\\.com/courses/(?P<course_name>[^/]+)/(?P<lesson_name>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.frontendmasters'
+
+class FrontendMastersCourseIE(FrontendMastersPageBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?frontendmasters\\.com/courses/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.frontendmasters'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if FrontendMastersLessonIE.suitable(url)
+            else super(FrontendMastersBaseIE, cls).suitable(url)
+        )
+
+class FujiTVFODPlus7IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://i\\.fod\\.fujitv\\.co\\.jp/plus7/web/[0-9a-z]{4}/(?P<id>[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.fujitv'
+
+class FunimationIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?funimation(?:\\.com|now\\.uk)/(?:[^/]+/)?shows/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.funimation'
+
+class FunkIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?funk\\.net/(?:channel|playlist)/[^/]+/(?P<display_id>[0-9a-z-]+)-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.funk'
+
+class FusionIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?fusion\\.(?:net|tv)/(?:video/|show/.+?\\bvideo=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.fusion'
+
+class GaiaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?gaia\\.com/video/(?P<id>[^/?]+).*?\\bfullplayer=(?P<type>feature|preview)'
+    _module = 'pycord.ext.dl.extractor.gaia'
+
+class GameInformerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?gameinformer\\.com/(?:[^/]+/)*(?P<id>[^.?&#]+)'
+    _module = 'pycord.ext.dl.extractor.gameinformer'
+
+class GameSpotIE(OnceIE):
+    _VALID_URL = 'https?://(?:www\\.)?gamespot\\.com/(?:video|article|review)s/(?:[^/]+/\\d+-|embed/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.gamespot'
+
+class GameStarIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?game(?P<site>pro|star)\\.de/videos/.*,(?P<id>[0-9]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.gamestar'
+
+class GaskrankIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?gaskrank\\.tv/tv/(?P<categories>[^/]+)/(?P<id>[^/]+)\\.htm'
+    _module = 'pycord.ext.dl.extractor.gaskrank'
+
+class GazetaIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<url>https?://(?:www\\.)?gazeta\\.ru/(?:[^/]+/)?video/(?:main/)*(?:\\d{4}/\\d{2}/\\d{2}/)?(?P<id>[A-Za-z0-9-_.]+)\\.s?html)'
+    _module = 'pycord.ext.dl.extractor.gazeta'
+
+class GDCVaultIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?gdcvault\\.com/play/(?P<id>\\d+)(?:/(?P<name>[\\w-]+))?'
+    _module = 'pycord.ext.dl.extractor.gdcvault'
+
+class GediDigitalIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://video\\.\n        (?:\n            (?:\n                (?:espresso\\.)?repubblica\n                |lastampa\n                |ilsecoloxix\n            )|\n            (?:\n                iltirreno\n                |messaggeroveneto\n                |ilpiccolo\n                |gazzettadimantova\n                |mattinopadova\n                |laprovinciapavese\n                |tribunatreviso\n                |nuovavenezia\n                |gazzettadimodena\n                |lanuovaferrara\n                |corrierealpi\n                |lasentinella\n            )\\.gelocal\n        )\\.it(?:/[^/]+){2,3}?/(?P<id>\\d+)(?:[/?&#]|$)'
+    _module = 'pycord.ext.dl.extractor.gedidigital'
+
+class GfycatIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|giant|thumbs)\\.)?gfycat\\.com/(?:ru/|ifr/|gifs/detail/)?(?P<id>[^-/?#\\.]+)'
+    _module = 'pycord.ext.dl.extractor.gfycat'
+
+class GiantBombIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?giantbomb\\.com/(?:videos|shows)/(?P<display_id>[^/]+)/(?P<id>\\d+-\\d+)'
+    _module = 'pycord.ext.dl.extractor.giantbomb'
+
+class GigaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?giga\\.de/(?:[^/]+/)*(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.giga'
+
+class GlideIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://share\\.glide\\.me/(?P<id>[A-Za-z0-9\\-=_+]+)'
+    _module = 'pycord.ext.dl.extractor.glide'
+
+class GloboIE(LazyLoadExtractor):
+    _VALID_URL = '(?:globo:|https?://.+?\\.globo\\.com/(?:[^/]+/)*(?:v/(?:[^/]+/)?|videos/))(?P<id>\\d{7,})'
+    _module = 'pycord.ext.dl.extractor.globo'
+
+class GloboArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.+?\\.globo\\.com/(?:[^/]+/)*(?P<id>[^/.]+)(?:\\.html)?'
+    _module = 'pycord.ext.dl.extractor.globo'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if GloboIE.suitable(url) else super(GloboArticleIE, cls).suitable(url)
+        )
+
+class GoIE(AdobePassIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?P<sub_domain>abc|freeform|watchdisneychannel|watchdisneyjunior|watchdisneyxd|disneynow|fxnow.fxnetworks)\\.)?go|\n                            (?P<sub_domain_2>abc|freeform|disneynow|fxnow\\.fxnetworks)\n                        )\\.com/\n                        (?:\n                            (?:[^/]+/)*(?P<id>[Vv][Dd][Kk][Aa]\\w+)|\n                            (?:[^/]+/)*(?P<display_id>[^/?\\#]+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.go'
+
+class GodTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?godtube\\.com/watch/\\?v=(?P<id>[\\da-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.godtube'
+
+class GolemIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://video\\.golem\\.de/.+?/(?P<id>.+?)/'
+    _module = 'pycord.ext.dl.extractor.golem'
+
+class GoogleDriveIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:\n                                (?:docs|drive)\\.google\\.com/\n                                (?:\n                                    (?:uc|open)\\?.*?id=|\n                                    file/d/\n                                )|\n                                video\\.google\\.com/get_player\\?.*?docid=\n                            )\n                            (?P<id>[a-zA-Z0-9_-]{28,})\n                    '
+    _module = 'pycord.ext.dl.extractor.googledrive'
+
+class GooglePodcastsBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.googlepodcasts'
+
+class GooglePodcastsIE(GooglePodcastsBaseIE):
+    _VALID_URL = 'https?://podcasts\\.google\\.com/feed/(?P<feed_url>[^/]+)/episode/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.googlepodcasts'
+    IE_NAME = 'google:podcasts'
+
+class GooglePodcastsFeedIE(GooglePodcastsBaseIE):
+    _VALID_URL = 'https?://podcasts\\.google\\.com/feed/(?P<id>[^/?&#]+)/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.googlepodcasts'
+    IE_NAME = 'google:podcasts:feed'
+
+class GoogleSearchIE(LazyLoadSearchExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.googlesearch'
+    IE_NAME = 'video.google:search'
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'gvsearch(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+class GoshgayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?goshgay\\.com/video(?P<id>\\d+?)($|/)'
+    _module = 'pycord.ext.dl.extractor.goshgay'
+
+class GPUTechConfIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://on-demand\\.gputechconf\\.com/gtc/2015/video/S(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.gputechconf'
+
+class GrouponIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?groupon\\.com/deals/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.groupon'
+
+class HBOIE(HBOBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?hbo\\.com/(?:video|embed)(?:/[^/]+)*/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.hbo'
+    IE_NAME = 'hbo'
+
+class HearThisAtIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hearthis\\.at/(?P<artist>[^/]+)/(?P<title>[A-Za-z0-9\\-]+)/?$'
+    _module = 'pycord.ext.dl.extractor.hearthisat'
+
+class HeiseIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?heise\\.de/(?:[^/]+/)+[^/]+-(?P<id>[0-9]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.heise'
+
+class HellPornoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hellporno\\.(?:com/videos|net/v)/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.hellporno'
+
+class HelsinkiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.helsinki\\.fi/Arkisto/flash\\.php\\?id=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.helsinki'
+
+class HentaiStigmaIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://hentai\\.animestigma\\.com/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.hentaistigma'
+
+class HGTVComShowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hgtv\\.com/shows/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.hgtv'
+    IE_NAME = 'hgtv.com:show'
+
+class HKETVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hkedcity\\.net/etv/resource/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.hketv'
+    IE_NAME = 'hketv'
+
+class HiDiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hidive\\.com/stream/(?P<title>[^/]+)/(?P<key>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.hidive'
+
+class HistoricFilmsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?historicfilms\\.com/(?:tapes/|play)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.historicfilms'
+
+class HitboxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:hitbox|smashcast)\\.tv/(?:[^/]+/)*videos?/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.hitbox'
+    IE_NAME = 'hitbox'
+
+class HitboxLiveIE(HitboxIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:hitbox|smashcast)\\.tv/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.hitbox'
+    IE_NAME = 'hitbox:live'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if HitboxIE.suitable(url) else super(HitboxLiveIE, cls).suitable(url)
+        )
+
+class HitRecordIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hitrecord\\.org/records/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.hitrecord'
+
+class HornBunnyIE(LazyLoadExtractor):
+    _VALID_URL = 'http?://(?:www\\.)?hornbunny\\.com/videos/(?P<title_dash>[a-z-]+)-(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.hornbunny'
+
+class HotNewHipHopIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hotnewhiphop\\.com/.*\\.(?P<id>.*)\\.html'
+    _module = 'pycord.ext.dl.extractor.hotnewhiphop'
+
+class HotStarBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.hotstar'
+
+class HotStarIE(HotStarBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?hotstar\\.com/(?:.+[/-])?(?P<id>\\d{10})'
+    _module = 'pycord.ext.dl.extractor.hotstar'
+    IE_NAME = 'hotstar'
+
+class HotStarPlaylistIE(HotStarBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?hotstar\\.com/(?:[a-z]{2}/)?tv/[^/]+/s-\\w+/list/[^/]+/t-(?P<id>\\w+)'
+    _module = 'pycord.ext.dl.extractor.hotstar'
+    IE_NAME = 'hotstar:playlist'
+
+class HowcastIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?howcast\\.com/videos/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.howcast'
+
+class HowStuffWorksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[\\da-z-]+\\.(?:howstuffworks|stuff(?:(?:youshould|theydontwantyouto)know|toblowyourmind|momnevertoldyou)|(?:brain|car)stuffshow|fwthinking|geniusstuff)\\.com/(?:[^/]+/)*(?:\\d+-)?(?P<id>.+?)-video\\.htm'
+    _module = 'pycord.ext.dl.extractor.howstuffworks'
+
+class HRTiBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.hrti'
+
+class HRTiIE(HRTiBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            hrti:(?P<short_id>[0-9]+)|\n                            https?://\n                                hrti\\.hrt\\.hr/(?:\\#/)?video/show/(?P<id>[0-9]+)/(?P<display_id>[^/]+)?\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.hrti'
+
+class HRTiPlaylistIE(HRTiBaseIE):
+    _VALID_URL = 'https?://hrti\\.hrt\\.hr/(?:#/)?video/list/category/(?P<id>[0-9]+)/(?P<display_id>[^/]+)?'
+    _module = 'pycord.ext.dl.extractor.hrti'
+
+class HuajiaoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?huajiao\\.com/l/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.huajiao'
+
+class HuffPostIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(embed\\.)?live\\.huffingtonpost\\.com/\n        (?:\n            r/segment/[^/]+/|\n            HPLEmbedPlayer/\\?segmentId=\n        )\n        (?P<id>[0-9a-f]+)'
+    _module = 'pycord.ext.dl.extractor.huffpost'
+
+class HungamaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?hungama\\.com/\n                        (?:\n                            (?:video|movie)/[^/]+/|\n                            tv-show/(?:[^/]+/){2}\\d+/episode/[^/]+/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.hungama'
+
+class HungamaSongIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hungama\\.com/song/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.hungama'
+
+class HypemIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?hypem\\.com/track/(?P<id>[0-9a-z]{5})'
+    _module = 'pycord.ext.dl.extractor.hypem'
+
+class IGNBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.ign'
+
+class IGNIE(IGNBaseIE):
+    _VALID_URL = 'https?://(?:.+?\\.ign|www\\.pcmag)\\.com/videos/(?:\\d{4}/\\d{2}/\\d{2}/)?(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.ign'
+    IE_NAME = 'ign.com'
+
+class IGNVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.+?\\.ign\\.com/(?:[a-z]{2}/)?[^/]+/(?P<id>\\d+)/(?:video|trailer)/'
+    _module = 'pycord.ext.dl.extractor.ign'
+
+class IGNArticleIE(IGNBaseIE):
+    _VALID_URL = 'https?://.+?\\.ign\\.com/(?:articles(?:/\\d{4}/\\d{2}/\\d{2})?|(?:[a-z]{2}/)?feature/\\d+)/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.ign'
+
+class IHeartRadioBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.iheart'
+
+class IHeartRadioIE(IHeartRadioBaseIE):
+    _VALID_URL = '(?:https?://(?:www\\.)?iheart\\.com/podcast/[^/]+/episode/(?P<display_id>[^/?&#]+)-|iheartradio:)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.iheart'
+
+class IHeartRadioPodcastIE(IHeartRadioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?iheart(?:podcastnetwork)?\\.com/podcast/[^/?&#]+-(?P<id>\\d+)/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.iheart'
+    IE_NAME = 'iheartradio:podcast'
+
+class ImdbIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|m)\\.imdb\\.com/(?:video|title|list).*?[/-]vi(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.imdb'
+    IE_NAME = 'imdb'
+
+class ImdbListIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?imdb\\.com/list/ls(?P<id>\\d{9})(?!/videoplayer/vi\\d+)'
+    _module = 'pycord.ext.dl.extractor.imdb'
+    IE_NAME = 'imdb:list'
+
+class ImgurIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:i\\.)?imgur\\.com/(?!(?:a|gallery|(?:t(?:opic)?|r)/[^/]+)/)(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.imgur'
+
+class ImgurGalleryIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:i\\.)?imgur\\.com/(?:gallery|(?:t(?:opic)?|r)/[^/]+)/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.imgur'
+    IE_NAME = 'imgur:gallery'
+
+class ImgurAlbumIE(ImgurGalleryIE):
+    _VALID_URL = 'https?://(?:i\\.)?imgur\\.com/a/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.imgur'
+    IE_NAME = 'imgur:album'
+
+class InaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?ina\\.fr/(?:video|audio)/(?P<id>[A-Z0-9_]+)'
+    _module = 'pycord.ext.dl.extractor.ina'
+
+class IncIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?inc\\.com/(?:[^/]+/)+(?P<id>[^.]+).html'
+    _module = 'pycord.ext.dl.extractor.inc'
+
+class IndavideoEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:embed\\.)?indavideo\\.hu/player/video/|assets\\.indavideo\\.hu/swf/player\\.swf\\?.*\\b(?:v(?:ID|id))=)(?P<id>[\\da-f]+)'
+    _module = 'pycord.ext.dl.extractor.indavideo'
+
+class InfoQIE(BokeCCBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?infoq\\.com/(?:[^/]+/)+(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.infoq'
+
+class InstagramIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<url>https?://(?:www\\.)?instagram\\.com/(?:p|tv|reel)/(?P<id>[^/?#&]+))'
+    _module = 'pycord.ext.dl.extractor.instagram'
+
+class InstagramPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.instagram'
+
+class InstagramUserIE(InstagramPlaylistIE):
+    _VALID_URL = 'https?://(?:www\\.)?instagram\\.com/(?P<id>[^/]{2,})/?(?:$|[?#])'
+    _module = 'pycord.ext.dl.extractor.instagram'
+    IE_NAME = 'instagram:user'
+
+class InstagramTagIE(InstagramPlaylistIE):
+    _VALID_URL = 'https?://(?:www\\.)?instagram\\.com/explore/tags/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.instagram'
+    IE_NAME = 'instagram:tag'
+
+class InternazionaleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?internazionale\\.it/video/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.internazionale'
+
+class InternetVideoArchiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.internetvideoarchive\\.net/(?:player|flash/players)/.*?\\?.*?publishedid.*?'
+    _module = 'pycord.ext.dl.extractor.internetvideoarchive'
+
+class IPrimaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+)\\.iprima\\.cz/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.iprima'
+
+class IqiyiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:[^.]+\\.)?iqiyi\\.com|www\\.pps\\.tv)/.+\\.html'
+    _module = 'pycord.ext.dl.extractor.iqiyi'
+    IE_NAME = 'iqiyi'
+
+class Ir90TvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?90tv\\.ir/video/(?P<id>[0-9]+)/.*'
+    _module = 'pycord.ext.dl.extractor.ir90tv'
+
+class ITVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?itv\\.com/hub/[^/]+/(?P<id>[0-9a-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.itv'
+
+class ITVBTCCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?itv\\.com/btcc/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.itv'
+
+class IviIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ivi\\.(?:ru|tv)/(?:watch/(?:[^/]+/)?|video/player\\?.*?videoId=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.ivi'
+    IE_NAME = 'ivi'
+
+class IviCompilationIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ivi\\.ru/watch/(?!\\d+)(?P<compilationid>[a-z\\d_-]+)(?:/season(?P<seasonid>\\d+))?$'
+    _module = 'pycord.ext.dl.extractor.ivi'
+    IE_NAME = 'ivi:compilation'
+
+class IvideonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ivideon\\.com/tv/(?:[^/]+/)*camera/(?P<id>\\d+-[\\da-f]+)/(?P<camera_id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.ivideon'
+    IE_NAME = 'ivideon'
+
+class IwaraIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|ecchi\\.)?iwara\\.tv/videos/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.iwara'
+
+class IzleseneIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?:(?:www|m)\\.)?izlesene\\.com/\n        (?:video|embedplayer)/(?:[^/]+/)?(?P<id>[0-9]+)\n        '
+    _module = 'pycord.ext.dl.extractor.izlesene'
+
+class JamendoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            licensing\\.jamendo\\.com/[^/]+|\n                            (?:www\\.)?jamendo\\.com\n                        )\n                        /track/(?P<id>[0-9]+)(?:/(?P<display_id>[^/?#&]+))?\n                    '
+    _module = 'pycord.ext.dl.extractor.jamendo'
+
+class JamendoAlbumIE(JamendoIE):
+    _VALID_URL = 'https?://(?:www\\.)?jamendo\\.com/album/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.jamendo'
+
+class JeuxVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.*?\\.jeuxvideo\\.com/.*/(.*?)\\.htm'
+    _module = 'pycord.ext.dl.extractor.jeuxvideo'
+
+class JoveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?jove\\.com/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.jove'
+
+class JojIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        joj:|\n                        https?://media\\.joj\\.sk/embed/\n                    )\n                    (?P<id>[^/?#^]+)\n                '
+    _module = 'pycord.ext.dl.extractor.joj'
+
+class JWPlatformIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://(?:content\\.jwplatform|cdn\\.jwplayer)\\.com/(?:(?:feed|player|thumb|preview)s|jw6|v2/media)/|jwplatform:)(?P<id>[a-zA-Z0-9]{8})'
+    _module = 'pycord.ext.dl.extractor.jwplatform'
+
+class KakaoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:play-)?tv\\.kakao\\.com/(?:channel/\\d+|embed/player)/cliplink/(?P<id>\\d+|[^?#&]+@my)'
+    _module = 'pycord.ext.dl.extractor.kakao'
+
+class KalturaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                (?:\n                    kaltura:(?P<partner_id>\\d+):(?P<id>[0-9a-z_]+)|\n                    https?://\n                        (:?(?:www|cdnapi(?:sec)?)\\.)?kaltura\\.com(?::\\d+)?/\n                        (?:\n                            (?:\n                                # flash player\n                                index\\.php/(?:kwidget|extwidget/preview)|\n                                # html5 player\n                                html5/html5lib/[^/]+/mwEmbedFrame\\.php\n                            )\n                        )(?:/(?P<path>[^?]+))?(?:\\?(?P<query>.*))?\n                )\n                '
+    _module = 'pycord.ext.dl.extractor.kaltura'
+
+class KankanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.*?\\.)?kankan\\.com/.+?/(?P<id>\\d+)\\.shtml'
+    _module = 'pycord.ext.dl.extractor.kankan'
+
+class KaraoketvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?karaoketv\\.co\\.il/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.karaoketv'
+
+class KarriereVideosIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?karrierevideos\\.at(?:/[^/]+)+/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.karrierevideos'
+
+class KetnetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ketnet\\.be/(?P<id>(?:[^/]+/)*[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.ketnet'
+
+class KhanAcademyBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.khanacademy'
+
+class KhanAcademyIE(KhanAcademyBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?khanacademy\\.org/(?P<id>(?:[^/]+/){4}v/[^?#/&]+)'
+    _module = 'pycord.ext.dl.extractor.khanacademy'
+    IE_NAME = 'khanacademy'
+
+class KhanAcademyUnitIE(KhanAcademyBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?khanacademy\\.org/(?P<id>(?:[^/]+/){2}[^?#/&]+)/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.khanacademy'
+    IE_NAME = 'khanacademy:unit'
+
+class KickStarterIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kickstarter\\.com/projects/(?P<id>[^/]*)/.*'
+    _module = 'pycord.ext.dl.extractor.kickstarter'
+
+class KinjaEmbedIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:[^.]+\\.)?\n        (?:\n            avclub|\n            clickhole|\n            deadspin|\n            gizmodo|\n            jalopnik|\n            jezebel|\n            kinja|\n            kotaku|\n            lifehacker|\n            splinternews|\n            the(?:inventory|onion|root|takeout)\n        )\\.com/\n        (?:\n            ajax/inset|\n            embed/video\n        )/iframe\\?.*?\\bid=\n        (?P<type>\n            fb|\n            imgur|\n            instagram|\n            jwp(?:layer)?-video|\n            kinjavideo|\n            mcp|\n            megaphone|\n            ooyala|\n            soundcloud(?:-playlist)?|\n            tumblr-post|\n            twitch-stream|\n            twitter|\n            ustream-channel|\n            vimeo|\n            vine|\n            youtube-(?:list|video)\n        )-(?P<id>[^&]+)'
+    _module = 'pycord.ext.dl.extractor.kinja'
+
+class KinoPoiskIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kinopoisk\\.ru/film/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.kinopoisk'
+
+class KonserthusetPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:konserthusetplay|rspoplay)\\.se/\\?.*\\bm=(?P<id>[^&]+)'
+    _module = 'pycord.ext.dl.extractor.konserthusetplay'
+
+class KrasViewIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://krasview\\.ru/(?:video|embed)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.krasview'
+
+class Ku6IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v\\.ku6\\.com/show/(?P<id>[a-zA-Z0-9\\-\\_]+)(?:\\.)*html'
+    _module = 'pycord.ext.dl.extractor.ku6'
+
+class KUSIIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kusi\\.com/(?P<path>story/.+|video\\?clipId=(?P<clipId>\\d+))'
+    _module = 'pycord.ext.dl.extractor.kusi'
+
+class KuwoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.kuwo'
+
+class KuwoIE(KuwoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?kuwo\\.cn/yinyue/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.kuwo'
+    IE_NAME = 'kuwo:song'
+
+class KuwoAlbumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kuwo\\.cn/album/(?P<id>\\d+?)/'
+    _module = 'pycord.ext.dl.extractor.kuwo'
+    IE_NAME = 'kuwo:album'
+
+class KuwoChartIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://yinyue\\.kuwo\\.cn/billboard_(?P<id>[^.]+).htm'
+    _module = 'pycord.ext.dl.extractor.kuwo'
+    IE_NAME = 'kuwo:chart'
+
+class KuwoSingerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?kuwo\\.cn/mingxing/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.kuwo'
+    IE_NAME = 'kuwo:singer'
+
+class KuwoCategoryIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://yinyue\\.kuwo\\.cn/yy/cinfo_(?P<id>\\d+?).htm'
+    _module = 'pycord.ext.dl.extractor.kuwo'
+    IE_NAME = 'kuwo:category'
+
+class KuwoMvIE(KuwoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?kuwo\\.cn/mv/(?P<id>\\d+?)/'
+    _module = 'pycord.ext.dl.extractor.kuwo'
+    IE_NAME = 'kuwo:mv'
+
+class LA7IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)(https?://)?(?:\n        (?:www\\.)?la7\\.it/([^/]+)/(?:rivedila7|video)/|\n        tg\\.la7\\.it/repliche-tgla7\\?id=\n    )(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.la7'
+    IE_NAME = 'la7.it'
+
+class Laola1TvEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?laola1\\.tv/titanplayer\\.php\\?.*?\\bvideoid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.laola1tv'
+    IE_NAME = 'laola1tv:embed'
+
+class Laola1TvBaseIE(Laola1TvEmbedIE):
+    _VALID_URL = 'https?://(?:www\\.)?laola1\\.tv/titanplayer\\.php\\?.*?\\bvideoid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.laola1tv'
+
+class Laola1TvIE(Laola1TvBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?laola1\\.tv/[a-z]+-[a-z]+/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.laola1tv'
+    IE_NAME = 'laola1tv'
+
+class EHFTVIE(Laola1TvBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ehftv\\.com/[a-z]+(?:-[a-z]+)?/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.laola1tv'
+    IE_NAME = 'ehftv'
+
+class ITTFIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tv\\.ittf\\.com/video/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.laola1tv'
+
+class LBRYBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.lbry'
+
+class LBRYIE(LBRYBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:lbry\\.tv|odysee\\.com)/(?P<id>\\$/[^/]+/[^/]+/[0-9a-f]{1,40}|@[^:/?#&]+(?::[0-9a-f]{1,40})?/[^:/?#&]+(?::[0-9a-f]{1,40})?|(?!@)[^:/?#&]+(?::[0-9a-f]{1,40})?)'
+    _module = 'pycord.ext.dl.extractor.lbry'
+    IE_NAME = 'lbry'
+
+class LBRYChannelIE(LBRYBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:lbry\\.tv|odysee\\.com)/(?P<id>@[^:/?#&]+(?::[0-9a-f]{1,40})?)/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.lbry'
+    IE_NAME = 'lbry:channel'
+
+class LCIIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lci\\.fr/[^/]+/[\\w-]+-(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.lci'
+
+class LcpPlayIE(ArkenaIE):
+    _VALID_URL = 'https?://play\\.lcp\\.fr/embed/(?P<id>[^/]+)/(?P<account_id>[^/]+)/[^/]+/[^/]+'
+    _module = 'pycord.ext.dl.extractor.lcp'
+
+class LcpIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lcp\\.fr/(?:[^/]+/)*(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.lcp'
+
+class Lecture2GoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://lecture2go\\.uni-hamburg\\.de/veranstaltungen/-/v/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.lecture2go'
+
+class LecturioBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.lecturio'
+
+class LecturioIE(LecturioBaseIE):
+    _VALID_URL = '(?x)\n                    https://\n                        (?:\n                            app\\.lecturio\\.com/([^/]+/(?P<nt>[^/?#&]+)\\.lecture|(?:\\#/)?lecture/c/\\d+/(?P<id>\\d+))|\n                            (?:www\\.)?lecturio\\.de/[^/]+/(?P<nt_de>[^/?#&]+)\\.vortrag\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.lecturio'
+
+class LecturioCourseIE(LecturioBaseIE):
+    _VALID_URL = 'https://app\\.lecturio\\.com/(?:[^/]+/(?P<nt>[^/?#&]+)\\.course|(?:#/)?course/c/(?P<id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.lecturio'
+
+class LecturioDeCourseIE(LecturioBaseIE):
+    _VALID_URL = 'https://(?:www\\.)?lecturio\\.de/[^/]+/(?P<id>[^/?#&]+)\\.kurs'
+    _module = 'pycord.ext.dl.extractor.lecturio'
+
+class LeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.le\\.com/ptv/vplay|(?:sports\\.le|(?:www\\.)?lesports)\\.com/(?:match|video))/(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.leeco'
+
+class LePlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[a-z]+\\.le\\.com/(?!video)[a-z]+/(?P<id>[a-z0-9_]+)'
+    _module = 'pycord.ext.dl.extractor.leeco'
+
+    @classmethod
+    def suitable(cls, url):
+        return False if LeIE.suitable(url) else super(LePlaylistIE, cls).suitable(url)
+
+class LetvCloudIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://yuntv\\.letv\\.com/bcloud.html\\?.+'
+    _module = 'pycord.ext.dl.extractor.leeco'
+
+class LEGOIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lego\\.com/(?P<locale>[a-z]{2}-[a-z]{2})/(?:[^/]+/)*videos/(?:[^/]+/)*[^/?#]+-(?P<id>[0-9a-f]{32})'
+    _module = 'pycord.ext.dl.extractor.lego'
+
+class LemondeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?lemonde\\.fr/(?:[^/]+/)*(?P<id>[^/]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.lemonde'
+
+class LentaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lenta\\.ru/[^/]+/\\d+/\\d+/\\d+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.lenta'
+
+class LibraryOfCongressIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?loc\\.gov/(?:item/|today/cyberlc/feature_wdesc\\.php\\?.*\\brec=)(?P<id>[0-9a-z_.]+)'
+    _module = 'pycord.ext.dl.extractor.libraryofcongress'
+    IE_NAME = 'loc'
+
+class LibsynIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<mainurl>https?://html5-player\\.libsyn\\.com/embed/episode/id/(?P<id>[0-9]+))'
+    _module = 'pycord.ext.dl.extractor.libsyn'
+
+class LifeNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://life\\.ru/t/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.lifenews'
+    IE_NAME = 'life'
+
+class LifeEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://embed\\.life\\.ru/(?:embed|video)/(?P<id>[\\da-f]{32})'
+    _module = 'pycord.ext.dl.extractor.lifenews'
+    IE_NAME = 'life:embed'
+
+class LimelightBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.limelight'
+
+class LimelightMediaIE(LimelightBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            limelight:media:|\n                            https?://\n                                (?:\n                                    link\\.videoplatform\\.limelight\\.com/media/|\n                                    assets\\.delvenetworks\\.com/player/loader\\.swf\n                                )\n                                \\?.*?\\bmediaId=\n                        )\n                        (?P<id>[a-z0-9]{32})\n                    '
+    _module = 'pycord.ext.dl.extractor.limelight'
+    IE_NAME = 'limelight'
+
+class LimelightChannelIE(LimelightBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            limelight:channel:|\n                            https?://\n                                (?:\n                                    link\\.videoplatform\\.limelight\\.com/media/|\n                                    assets\\.delvenetworks\\.com/player/loader\\.swf\n                                )\n                                \\?.*?\\bchannelId=\n                        )\n                        (?P<id>[a-z0-9]{32})\n                    '
+    _module = 'pycord.ext.dl.extractor.limelight'
+    IE_NAME = 'limelight:channel'
+
+class LimelightChannelListIE(LimelightBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            limelight:channel_list:|\n                            https?://\n                                (?:\n                                    link\\.videoplatform\\.limelight\\.com/media/|\n                                    assets\\.delvenetworks\\.com/player/loader\\.swf\n                                )\n                                \\?.*?\\bchannelListId=\n                        )\n                        (?P<id>[a-z0-9]{32})\n                    '
+    _module = 'pycord.ext.dl.extractor.limelight'
+    IE_NAME = 'limelight:channel_list'
+
+class LineTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tv\\.line\\.me/v/(?P<id>\\d+)_[^/]+-(?P<segment>ep\\d+-\\d+)'
+    _module = 'pycord.ext.dl.extractor.line'
+
+class LineLiveBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.line'
+
+class LineLiveIE(LineLiveBaseIE):
+    _VALID_URL = 'https?://live\\.line\\.me/channels/(?P<channel_id>\\d+)/broadcast/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.line'
+
+class LineLiveChannelIE(LineLiveBaseIE):
+    _VALID_URL = 'https?://live\\.line\\.me/channels/(?P<id>\\d+)(?!/broadcast/\\d+)(?:[/?&#]|$)'
+    _module = 'pycord.ext.dl.extractor.line'
+
+class LinkedInLearningBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.linkedin'
+
+class LinkedInLearningIE(LinkedInLearningBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?linkedin\\.com/learning/(?P<course_slug>[^/]+)/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.linkedin'
+    IE_NAME = 'linkedin:learning'
+
+class LinkedInLearningCourseIE(LinkedInLearningBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?linkedin\\.com/learning/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.linkedin'
+    IE_NAME = 'linkedin:learning:course'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if LinkedInLearningIE.suitable(url)
+            else super(LinkedInLearningCourseIE, cls).suitable(url)
+        )
+
+class LinuxAcademyIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?linuxacademy\\.com/cp/\n                        (?:\n                            courses/lesson/course/(?P<chapter_id>\\d+)/lesson/(?P<lesson_id>\\d+)|\n                            modules/view/id/(?P<course_id>\\d+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.linuxacademy'
+
+class LiTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?litv\\.tv/(?:vod|promo)/[^/]+/(?:content\\.do)?\\?.*?\\b(?:content_)?id=(?P<id>[^&]+)'
+    _module = 'pycord.ext.dl.extractor.litv'
+
+class LiveJournalIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^.]+\\.)?livejournal\\.com/video/album/\\d+.+?\\bid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.livejournal'
+
+class LivestreamIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:new\\.)?livestream\\.com/(?:accounts/(?P<account_id>\\d+)|(?P<account_name>[^/]+))/(?:events/(?P<event_id>\\d+)|(?P<event_name>[^/]+))(?:/videos/(?P<id>\\d+))?'
+    _module = 'pycord.ext.dl.extractor.livestream'
+    IE_NAME = 'livestream'
+
+class LivestreamOriginalIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://original\\.livestream\\.com/\n        (?P<user>[^/\\?#]+)(?:/(?P<type>video|folder)\n        (?:(?:\\?.*?Id=|/)(?P<id>.*?)(&|$))?)?\n        '
+    _module = 'pycord.ext.dl.extractor.livestream'
+    IE_NAME = 'livestream:original'
+
+class LivestreamShortenerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://livestre\\.am/(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.livestream'
+    IE_NAME = 'livestream:shortener'
+
+class LnkGoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lnk(?:go)?\\.(?:alfa\\.)?lt/(?:visi-video/[^/]+|video)/(?P<id>[A-Za-z0-9-]+)(?:/(?P<episode_id>\\d+))?'
+    _module = 'pycord.ext.dl.extractor.lnkgo'
+
+class LocalNews8IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?localnews8\\.com/(?:[^/]+/)*(?P<display_id>[^/]+)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.localnews8'
+
+class NuevoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nuevo'
+
+class LoveHomePornIE(NuevoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?lovehomeporn\\.com/video/(?P<id>\\d+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'pycord.ext.dl.extractor.lovehomeporn'
+
+class LRTIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?lrt\\.lt(?P<path>/mediateka/irasas/(?P<id>[0-9]+))'
+    _module = 'pycord.ext.dl.extractor.lrt'
+    IE_NAME = 'lrt.lt'
+
+class LyndaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.lynda'
+
+class LyndaIE(LyndaBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?(?:lynda\\.com|educourse\\.ga)/\n                        (?:\n                            (?:[^/]+/){2,3}(?P<course_id>\\d+)|\n                            player/embed\n                        )/\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.lynda'
+    IE_NAME = 'lynda'
+
+class LyndaCourseIE(LyndaBaseIE):
+    _VALID_URL = 'https?://(?:www|m)\\.(?:lynda\\.com|educourse\\.ga)/(?P<coursepath>(?:[^/]+/){2,3}(?P<courseid>\\d+))-2\\.html'
+    _module = 'pycord.ext.dl.extractor.lynda'
+    IE_NAME = 'lynda:course'
+
+class M6IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?m6\\.fr/[^/]+/videos/(?P<id>\\d+)-[^\\.]+\\.html'
+    _module = 'pycord.ext.dl.extractor.m6'
+    IE_NAME = 'm6'
+
+class MailRuIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:(?:www|m)\\.)?my\\.mail\\.ru/+\n                        (?:\n                            video/.*\\#video=/?(?P<idv1>(?:[^/]+/){3}\\d+)|\n                            (?:(?P<idv2prefix>(?:[^/]+/+){2})video/(?P<idv2suffix>[^/]+/\\d+))\\.html|\n                            (?:video/embed|\\+/video/meta)/(?P<metaid>\\d+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.mailru'
+    IE_NAME = 'mailru'
+
+class MailRuMusicSearchBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.mailru'
+
+class MailRuMusicIE(MailRuMusicSearchBaseIE):
+    _VALID_URL = 'https?://my\\.mail\\.ru/+music/+songs/+[^/?#&]+-(?P<id>[\\da-f]+)'
+    _module = 'pycord.ext.dl.extractor.mailru'
+    IE_NAME = 'mailru:music'
+
+class MailRuMusicSearchIE(MailRuMusicSearchBaseIE):
+    _VALID_URL = 'https?://my\\.mail\\.ru/+music/+search/+(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.mailru'
+    IE_NAME = 'mailru:music:search'
+
+class MallTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|sk)\\.)?mall\\.tv/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.malltv'
+
+class MangomoloBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.mangomolo'
+
+class MangomoloVideoIE(MangomoloBaseIE):
+    _VALID_URL = 'https?://(?:admin\\.mangomolo\\.com/analytics/index\\.php/customers/embed/|player\\.mangomolo\\.com/v1/)video\\?.*?\\bid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.mangomolo'
+    IE_NAME = 'mangomolo:video'
+
+class MangomoloLiveIE(MangomoloBaseIE):
+    _VALID_URL = 'https?://(?:admin\\.mangomolo\\.com/analytics/index\\.php/customers/embed/|player\\.mangomolo\\.com/v1/)(live|index)\\?.*?\\bchannelid=(?P<id>(?:[A-Za-z0-9+/=]|%2B|%2F|%3D)+)'
+    _module = 'pycord.ext.dl.extractor.mangomolo'
+    IE_NAME = 'mangomolo:live'
+
+class ManyVidsIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)https?://(?:www\\.)?manyvids\\.com/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.manyvids'
+
+class MaoriTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?maoritelevision\\.com/shows/(?:[^/]+/)+(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.maoritv'
+
+class MarkizaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?videoarchiv\\.markiza\\.sk/(?:video/(?:[^/]+/)*|embed/)(?P<id>\\d+)(?:[_/]|$)'
+    _module = 'pycord.ext.dl.extractor.markiza'
+
+class MarkizaPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:(?:[^/]+\\.)?markiza|tvnoviny)\\.sk/(?:[^/]+/)*(?P<id>\\d+)_'
+    _module = 'pycord.ext.dl.extractor.markiza'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if MarkizaIE.suitable(url)
+            else super(MarkizaPageIE, cls).suitable(url)
+        )
+
+class MassengeschmackTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?massengeschmack\\.tv/play/(?P<id>[^?&#]+)'
+    _module = 'pycord.ext.dl.extractor.massengeschmacktv'
+    IE_NAME = 'massengeschmack.tv'
+
+class MatchTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://matchtv\\.ru(?:/on-air|/?#live-player)'
+    _module = 'pycord.ext.dl.extractor.matchtv'
+
+class MDRIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:mdr|kika)\\.de/(?:.*)/[a-z-]+-?(?P<id>\\d+)(?:_.+?)?\\.html'
+    _module = 'pycord.ext.dl.extractor.mdr'
+
+class MedalTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?medal\\.tv/clips/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.medaltv'
+
+class MediasetIE(ThePlatformBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        mediaset:|\n                        https?://\n                            (?:(?:www|static3)\\.)?mediasetplay\\.mediaset\\.it/\n                            (?:\n                                (?:video|on-demand|movie)/(?:[^/]+/)+[^/]+_|\n                                player/index\\.html\\?.*?\\bprogramGuid=\n                            )\n                    )(?P<id>[0-9A-Z]{16,})\n                    '
+    _module = 'pycord.ext.dl.extractor.mediaset'
+
+class MediasiteIE(LazyLoadExtractor):
+    _VALID_URL = '(?xi)https?://[^/]+/Mediasite/(?:Play|Showcase/(?:default|livebroadcast)/Presentation)/(?P<id>(?:[0-9a-f]{32,34}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12,14}))(?P<query>\\?[^#]+|)'
+    _module = 'pycord.ext.dl.extractor.mediasite'
+
+class MediasiteCatalogIE(LazyLoadExtractor):
+    _VALID_URL = '(?xi)\n                        (?P<url>https?://[^/]+/Mediasite)\n                        /Catalog/Full/\n                        (?P<catalog_id>(?:[0-9a-f]{32,34}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12,14}))\n                        (?:\n                            /(?P<current_folder_id>(?:[0-9a-f]{32,34}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12,14}))\n                            /(?P<root_dynamic_folder_id>(?:[0-9a-f]{32,34}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12,14}))\n                        )?\n                    '
+    _module = 'pycord.ext.dl.extractor.mediasite'
+
+class MediasiteNamedCatalogIE(LazyLoadExtractor):
+    _VALID_URL = '(?xi)(?P<url>https?://[^/]+/Mediasite)/Catalog/catalogs/(?P<catalog_name>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.mediasite'
+
+class MediciIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?medici\\.tv/#!/(?P<id>[^?#&]+)'
+    _module = 'pycord.ext.dl.extractor.medici'
+
+class MegaphoneIE(LazyLoadExtractor):
+    _VALID_URL = 'https://player\\.megaphone\\.fm/(?P<id>[A-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.megaphone'
+    IE_NAME = 'megaphone.fm'
+
+class MeipaiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?meipai\\.com/media/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.meipai'
+
+class MelonVODIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vod\\.melon\\.com/video/detail2\\.html?\\?.*?mvId=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.melonvod'
+
+class METAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.meta\\.ua/(?:iframe/)?(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.meta'
+
+class MetacafeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?metacafe\\.com/watch/(?P<video_id>[^/]+)/(?P<display_id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.metacafe'
+    IE_NAME = 'metacafe'
+
+class MetacriticIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?metacritic\\.com/.+?/trailers/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.metacritic'
+
+class MgoonIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?\n    (?:(:?m\\.)?mgoon\\.com/(?:ch/(?:.+)/v|play/view)|\n        video\\.mgoon\\.com)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.mgoon'
+
+class MGTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:w(?:ww)?\\.)?mgtv\\.com/(v|b)/(?:[^/]+/)*(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.mgtv'
+
+class MiaoPaiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?miaopai\\.com/show/(?P<id>[-A-Za-z0-9~_]+)'
+    _module = 'pycord.ext.dl.extractor.miaopai'
+
+class MicrosoftVirtualAcademyBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.microsoftvirtualacademy'
+
+class MicrosoftVirtualAcademyIE(MicrosoftVirtualAcademyBaseIE):
+    _VALID_URL = '(?:mva:|https?://(?:mva\\.microsoft|(?:www\\.)?microsoftvirtualacademy)\\.com/[^/]+/training-courses/[^/?#&]+-)(?P<course_id>\\d+)(?::|\\?l=)(?P<id>[\\da-zA-Z]+_\\d+)'
+    _module = 'pycord.ext.dl.extractor.microsoftvirtualacademy'
+    IE_NAME = 'mva'
+
+class MicrosoftVirtualAcademyCourseIE(MicrosoftVirtualAcademyBaseIE):
+    _VALID_URL = '(?:mva:course:|https?://(?:mva\\.microsoft|(?:www\\.)?microsoftvirtualacademy)\\.com/[^/]+/training-courses/(?P<display_id>[^/?#&]+)-)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.microsoftvirtualacademy'
+    IE_NAME = 'mva:course'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if MicrosoftVirtualAcademyIE.suitable(url)
+            else super(MicrosoftVirtualAcademyCourseIE, cls).suitable(url)
+        )
+
+class MindsBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.minds'
+
+class MindsIE(MindsBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?minds\\.com/(?:media|newsfeed|archive/view)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.minds'
+    IE_NAME = 'minds'
+
+class MindsFeedBaseIE(MindsBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.minds'
+
+class MindsChannelIE(MindsFeedBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?minds\\.com/(?!(?:newsfeed|media|api|archive|groups)/)(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.minds'
+    IE_NAME = 'minds:channel'
+
+class MindsGroupIE(MindsFeedBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?minds\\.com/groups/profile/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.minds'
+    IE_NAME = 'minds:group'
+
+class MinistryGridIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ministrygrid\\.com/([^/?#]*/)*(?P<id>[^/#?]+)/?(?:$|[?#])'
+    _module = 'pycord.ext.dl.extractor.ministrygrid'
+
+class MinotoIE(LazyLoadExtractor):
+    _VALID_URL = '(?:minoto:|https?://(?:play|iframe|embed)\\.minoto-video\\.com/(?P<player_id>[0-9]+)/)(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.minoto'
+
+class MioMioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?miomio\\.tv/watch/cc(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.miomio'
+    IE_NAME = 'miomio.tv'
+
+class TechTVMITIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://techtv\\.mit\\.edu/(?:videos|embeds)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.mit'
+    IE_NAME = 'techtv.mit.edu'
+
+class OCWMITIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://ocw\\.mit\\.edu/courses/(?P<topic>[a-z0-9\\-]+)'
+    _module = 'pycord.ext.dl.extractor.mit'
+    IE_NAME = 'ocw.mit.edu'
+
+class TelecincoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:telecinco\\.es|cuatro\\.com|mediaset\\.es)/(?:[^/]+/)+(?P<id>.+?)\\.html'
+    _module = 'pycord.ext.dl.extractor.telecinco'
+
+class MiTeleIE(TelecincoIE):
+    _VALID_URL = 'https?://(?:www\\.)?mitele\\.es/(?:[^/]+/)+(?P<id>[^/]+)/player'
+    _module = 'pycord.ext.dl.extractor.mitele'
+
+class MixcloudBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.mixcloud'
+
+class MixcloudIE(MixcloudBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|beta|m)\\.)?mixcloud\\.com/([^/]+)/(?!stream|uploads|favorites|listens|playlists)([^/]+)'
+    _module = 'pycord.ext.dl.extractor.mixcloud'
+    IE_NAME = 'mixcloud'
+
+class MixcloudPlaylistBaseIE(MixcloudBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.mixcloud'
+
+class MixcloudUserIE(MixcloudPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mixcloud\\.com/(?P<id>[^/]+)/(?P<type>uploads|favorites|listens|stream)?/?$'
+    _module = 'pycord.ext.dl.extractor.mixcloud'
+    IE_NAME = 'mixcloud:user'
+
+class MixcloudPlaylistIE(MixcloudPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mixcloud\\.com/(?P<user>[^/]+)/playlists/(?P<playlist>[^/]+)/?$'
+    _module = 'pycord.ext.dl.extractor.mixcloud'
+    IE_NAME = 'mixcloud:playlist'
+
+class MLBBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.mlb'
+
+class MLBIE(MLBBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:[\\da-z_-]+\\.)*mlb\\.com/\n                        (?:\n                            (?:\n                                (?:[^/]+/)*video/[^/]+/c-|\n                                (?:\n                                    shared/video/embed/(?:embed|m-internal-embed)\\.html|\n                                    (?:[^/]+/)+(?:play|index)\\.jsp|\n                                )\\?.*?\\bcontent_id=\n                            )\n                            (?P<id>\\d+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.mlb'
+
+class MLBVideoIE(MLBBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mlb\\.com/(?:[^/]+/)*video/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.mlb'
+
+    @classmethod
+    def suitable(cls, url):
+        return False if MLBIE.suitable(url) else super(MLBVideoIE, cls).suitable(url)
+
+class MnetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mnet\\.(?:com|interest\\.me)/tv/vod/(?:.*?\\bclip_id=)?(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.mnet'
+
+class MoeVideoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?P<host>(?:www\\.)?\n        (?:(?:moevideo|playreplay|videochart)\\.net|thesame\\.tv))/\n        (?:video|framevideo|embed)/(?P<id>[0-9a-z]+\\.[0-9A-Za-z]+)'
+    _module = 'pycord.ext.dl.extractor.moevideo'
+
+class MofosexIE(KeezMoviesIE):
+    _VALID_URL = 'https?://(?:www\\.)?mofosex\\.com/videos/(?P<id>\\d+)/(?P<display_id>[^/?#&.]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.mofosex'
+
+class MofosexEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mofosex\\.com/embed/?\\?.*?\\bvideoid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.mofosex'
+
+class MojvideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mojvideo\\.com/video-(?P<display_id>[^/]+)/(?P<id>[a-f0-9]+)'
+    _module = 'pycord.ext.dl.extractor.mojvideo'
+
+class MorningstarIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|news)\\.)morningstar\\.com/[cC]over/video[cC]enter\\.aspx\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.morningstar'
+
+class MotherlessIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?motherless\\.com/(?:g/[a-z0-9_]+/)?(?P<id>[A-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.motherless'
+
+class MotherlessGroupIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?motherless\\.com/gv?/(?P<id>[a-z0-9_]+)'
+    _module = 'pycord.ext.dl.extractor.motherless'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if MotherlessIE.suitable(url)
+            else super(MotherlessGroupIE, cls).suitable(url)
+        )
+
+class MotorsportIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?motorsport\\.com/[^/?#]+/video/(?:[^/?#]+/)(?P<id>[^/]+)/?(?:$|[?#])'
+    _module = 'pycord.ext.dl.extractor.motorsport'
+
+class MovieClipsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?movieclips\\.com/videos/.+-(?P<id>\\d+)(?:\\?|$)'
+    _module = 'pycord.ext.dl.extractor.movieclips'
+
+class MoviezineIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?moviezine\\.se/video/(?P<id>[^?#]+)'
+    _module = 'pycord.ext.dl.extractor.moviezine'
+
+class MovingImageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://movingimage\\.nls\\.uk/film/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.movingimage'
+
+class MSNIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|preview)\\.)?msn\\.com/(?:[^/]+/)+(?P<display_id>[^/]+)/[a-z]{2}-(?P<id>[\\da-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.msn'
+
+class MTVVideoIE(MTVServicesInfoExtractor):
+    _VALID_URL = '(?x)^https?://\n        (?:(?:www\\.)?mtv\\.com/videos/.+?/(?P<videoid>[0-9]+)/[^/]+$|\n           m\\.mtv\\.com/videos/video\\.rbml\\?.*?id=(?P<mgid>[^&]+))'
+    _module = 'pycord.ext.dl.extractor.mtv'
+    IE_NAME = 'mtv:video'
+
+class MTVServicesEmbeddedIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://media\\.mtvnservices\\.com/embed/(?P<mgid>.+?)(\\?|/|$)'
+    _module = 'pycord.ext.dl.extractor.mtv'
+    IE_NAME = 'mtvservices:embedded'
+
+class MTVDEIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mtv\\.de/(?:musik/videoclips|folgen|news)/(?P<id>[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.mtv'
+    IE_NAME = 'mtv.de'
+
+class MTVJapanIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mtvjapan\\.com/videos/(?P<id>[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.mtv'
+    IE_NAME = 'mtvjapan'
+
+class MuenchenTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?muenchen\\.tv/livestream'
+    _module = 'pycord.ext.dl.extractor.muenchentv'
+
+class MwaveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://mwave\\.interest\\.me/(?:[^/]+/)?mnettv/videodetail\\.m\\?searchVideoDetailVO\\.clip_id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.mwave'
+
+class MwaveMeetGreetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://mwave\\.interest\\.me/(?:[^/]+/)?meetgreet/view/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.mwave'
+
+class MyChannelsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?mychannels\\.com/.*(?P<id_type>video|production)_id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.mychannels'
+
+class MySpaceIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        myspace\\.com/[^/]+/\n                        (?P<mediatype>\n                            video/[^/]+/(?P<video_id>\\d+)|\n                            music/song/[^/?#&]+-(?P<song_id>\\d+)-\\d+(?:[/?#&]|$)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.myspace'
+
+class MySpaceAlbumIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://myspace\\.com/([^/]+)/music/album/(?P<title>.*-)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.myspace'
+    IE_NAME = 'MySpace:album'
+
+class MySpassIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?myspass\\.de/([^/]+/)*(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.myspass'
+
+class SprutoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.vimple'
+
+class MyviIE(SprutoBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            https?://\n                                (?:www\\.)?\n                                myvi\\.\n                                (?:\n                                    (?:ru/player|tv)/\n                                    (?:\n                                        (?:\n                                            embed/html|\n                                            flash|\n                                            api/Video/Get\n                                        )/|\n                                        content/preloader\\.swf\\?.*\\bid=\n                                    )|\n                                    ru/watch/\n                                )|\n                            myvi:\n                        )\n                        (?P<id>[\\da-zA-Z_-]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.myvi'
+
+class MyviEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?myvi\\.tv/(?:[^?]+\\?.*?\\bv=|embed/)(?P<id>[\\da-z]+)'
+    _module = 'pycord.ext.dl.extractor.myvi'
+
+    @classmethod
+    def suitable(cls, url):
+        return False if MyviIE.suitable(url) else super(MyviEmbedIE, cls).suitable(url)
+
+class MyVidsterIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?myvidster\\.com/video/(?P<id>\\d+)/'
+    _module = 'pycord.ext.dl.extractor.myvidster'
+
+class NationalGeographicVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.nationalgeographic\\.com/.*?'
+    _module = 'pycord.ext.dl.extractor.nationalgeographic'
+    IE_NAME = 'natgeo:video'
+
+class NationalGeographicTVIE(FOXIE):
+    _VALID_URL = 'https?://(?:www\\.)?nationalgeographic\\.com/tv/watch/(?P<id>[\\da-fA-F]+)'
+    _module = 'pycord.ext.dl.extractor.nationalgeographic'
+
+class NaverBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.naver'
+
+class NaverIE(NaverBaseIE):
+    _VALID_URL = 'https?://(?:m\\.)?tv(?:cast)?\\.naver\\.com/(?:v|embed)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.naver'
+
+class NBACVPBaseIE(TurnerBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nba'
+
+class NBAWatchBaseIE(NBACVPBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nba'
+
+class NBAWatchEmbedIE(NBAWatchBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?nba\\.com(?:/watch)?|watch\\.nba\\.com)/embed\\?.*?\\bid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nba'
+
+class NBAWatchIE(NBAWatchBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?nba\\.com(?:/watch)?|watch\\.nba\\.com)/(?:nba/)?video/(?P<id>.+?(?=/index\\.html)|(?:[^/]+/)*[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nba'
+    IE_NAME = 'nba:watch'
+
+class NBAWatchCollectionIE(NBAWatchBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?nba\\.com(?:/watch)?|watch\\.nba\\.com)/list/collection/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nba'
+    IE_NAME = 'nba:watch:collection'
+
+class NBABaseIE(NBACVPBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nba'
+
+class NBAEmbedIE(NBABaseIE):
+    _VALID_URL = 'https?://secure\\.nba\\.com/assets/amp/include/video/(?:topI|i)frame\\.html\\?.*?\\bcontentId=(?P<id>[^?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nba'
+
+class NBAIE(NBABaseIE):
+    _VALID_URL = '(?x)\n        https?://(?:www\\.)?nba\\.com/\n            (?P<team>\n                blazers|\n                bucks|\n                bulls|\n                cavaliers|\n                celtics|\n                clippers|\n                grizzlies|\n                hawks|\n                heat|\n                hornets|\n                jazz|\n                kings|\n                knicks|\n                lakers|\n                magic|\n                mavericks|\n                nets|\n                nuggets|\n                pacers|\n                pelicans|\n                pistons|\n                raptors|\n                rockets|\n                sixers|\n                spurs|\n                suns|\n                thunder|\n                timberwolves|\n                warriors|\n                wizards\n            )\n        (?:/play\\#)?/(?!video/channel|series)video/(?P<id>(?:[^/]+/)*[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nba'
+
+class NBAChannelIE(NBABaseIE):
+    _VALID_URL = '(?x)\n        https?://(?:www\\.)?nba\\.com/\n            (?P<team>\n                blazers|\n                bucks|\n                bulls|\n                cavaliers|\n                celtics|\n                clippers|\n                grizzlies|\n                hawks|\n                heat|\n                hornets|\n                jazz|\n                kings|\n                knicks|\n                lakers|\n                magic|\n                mavericks|\n                nets|\n                nuggets|\n                pacers|\n                pelicans|\n                pistons|\n                raptors|\n                rockets|\n                sixers|\n                spurs|\n                suns|\n                thunder|\n                timberwolves|\n                warriors|\n                wizards\n            )\n        (?:/play\\#)?/(?:video/channel|series)/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nba'
+
+class NBCIE(AdobePassIE):
+    _VALID_URL = 'https?(?P<permalink>://(?:www\\.)?nbc\\.com/(?:classic-tv/)?[^/]+/video/[^/]+/(?P<id>n?\\d+))'
+    _module = 'pycord.ext.dl.extractor.nbc'
+
+class NBCNewsIE(ThePlatformIE):
+    _VALID_URL = '(?x)https?://(?:www\\.)?(?:nbcnews|today|msnbc)\\.com/([^/]+/)*(?:.*-)?(?P<id>[^/?]+)'
+    _module = 'pycord.ext.dl.extractor.nbc'
+
+class NBCOlympicsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://www\\.nbcolympics\\.com/video/(?P<id>[a-z-]+)'
+    _module = 'pycord.ext.dl.extractor.nbc'
+    IE_NAME = 'nbcolympics'
+
+class NBCOlympicsStreamIE(AdobePassIE):
+    _VALID_URL = 'https?://stream\\.nbcolympics\\.com/(?P<id>[0-9a-z-]+)'
+    _module = 'pycord.ext.dl.extractor.nbc'
+    IE_NAME = 'nbcolympics:stream'
+
+class NBCSportsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nbcsports\\.com//?(?!vplayer/)(?:[^/]+/)+(?P<id>[0-9a-z-]+)'
+    _module = 'pycord.ext.dl.extractor.nbc'
+
+class NBCSportsStreamIE(AdobePassIE):
+    _VALID_URL = 'https?://stream\\.nbcsports\\.com/.+?\\bpid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nbc'
+
+class NBCSportsVPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:vplayer\\.nbcsports\\.com|(?:www\\.)?nbcsports\\.com/vplayer)/(?:[^/]+/)+(?P<id>[0-9a-zA-Z_]+)'
+    _module = 'pycord.ext.dl.extractor.nbc'
+
+class NDRBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.ndr'
+
+class NDRIE(NDRBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ndr\\.de/(?:[^/]+/)*(?P<id>[^/?#]+),[\\da-z]+\\.html'
+    _module = 'pycord.ext.dl.extractor.ndr'
+    IE_NAME = 'ndr'
+
+class NJoyIE(NDRBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?n-joy\\.de/(?:[^/]+/)*(?:(?P<display_id>[^/?#]+),)?(?P<id>[\\da-z]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.ndr'
+    IE_NAME = 'njoy'
+
+class NDREmbedBaseIE(LazyLoadExtractor):
+    _VALID_URL = '(?:ndr:(?P<id_s>[\\da-z]+)|https?://www\\.ndr\\.de/(?P<id>[\\da-z]+)-ppjson\\.json)'
+    _module = 'pycord.ext.dl.extractor.ndr'
+    IE_NAME = 'ndr:embed:base'
+
+class NDREmbedIE(NDREmbedBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?ndr\\.de/(?:[^/]+/)*(?P<id>[\\da-z]+)-(?:player|externalPlayer)\\.html'
+    _module = 'pycord.ext.dl.extractor.ndr'
+    IE_NAME = 'ndr:embed'
+
+class NJoyEmbedIE(NDREmbedBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?n-joy\\.de/(?:[^/]+/)*(?P<id>[\\da-z]+)-(?:player|externalPlayer)_[^/]+\\.html'
+    _module = 'pycord.ext.dl.extractor.ndr'
+    IE_NAME = 'njoy:embed'
+
+class NDTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?ndtv\\.com/(?:[^/]+/)*videos?/?(?:[^/]+/)*[^/?^&]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.ndtv'
+
+class NetzkinoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?netzkino\\.de/\\#!/(?P<category>[^/]+)/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.netzkino'
+
+class NerdCubedFeedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nerdcubed\\.co\\.uk/feed\\.json'
+    _module = 'pycord.ext.dl.extractor.nerdcubed'
+
+class NetEaseMusicBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.neteasemusic'
+
+class NetEaseMusicIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?song\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.neteasemusic'
+    IE_NAME = 'netease:song'
+
+class NetEaseMusicAlbumIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?album\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.neteasemusic'
+    IE_NAME = 'netease:album'
+
+class NetEaseMusicSingerIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?artist\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.neteasemusic'
+    IE_NAME = 'netease:singer'
+
+class NetEaseMusicListIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?(playlist|discover/toplist)\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.neteasemusic'
+    IE_NAME = 'netease:playlist'
+
+class NetEaseMusicMvIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?mv\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.neteasemusic'
+    IE_NAME = 'netease:mv'
+
+class NetEaseMusicProgramIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/?)program\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.neteasemusic'
+    IE_NAME = 'netease:program'
+
+class NetEaseMusicDjRadioIE(NetEaseMusicBaseIE):
+    _VALID_URL = 'https?://music\\.163\\.com/(#/)?djradio\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.neteasemusic'
+    IE_NAME = 'netease:djradio'
+
+class NewgroundsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?newgrounds\\.com/(?:audio/listen|portal/view)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.newgrounds'
+
+class NewgroundsPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?newgrounds\\.com/(?:collection|[^/]+/search/[^/]+)/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.newgrounds'
+
+class NewstubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?newstube\\.ru/media/(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.newstube'
+
+class NextMediaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://hk\\.apple\\.nextmedia\\.com/[^/]+/[^/]+/(?P<date>\\d+)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nextmedia'
+
+class NextMediaActionNewsIE(NextMediaIE):
+    _VALID_URL = 'https?://hk\\.dv\\.nextmedia\\.com/actionnews/[^/]+/(?P<date>\\d+)/(?P<id>\\d+)/\\d+'
+    _module = 'pycord.ext.dl.extractor.nextmedia'
+
+class AppleDailyIE(NextMediaIE):
+    _VALID_URL = 'https?://(www|ent)\\.appledaily\\.com\\.tw/[^/]+/[^/]+/[^/]+/(?P<date>\\d+)/(?P<id>\\d+)(/.*)?'
+    _module = 'pycord.ext.dl.extractor.nextmedia'
+
+class NextTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nexttv\\.com\\.tw/(?:[^/]+/)+(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nextmedia'
+
+class NexxIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        (?:\n                            https?://api\\.nexx(?:\\.cloud|cdn\\.com)/v3/(?P<domain_id>\\d+)/videos/byid/|\n                            nexx:(?:(?P<domain_id_s>\\d+):)?|\n                            https?://arc\\.nexx\\.cloud/api/video/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.nexx'
+
+class NexxEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://embed\\.nexx(?:\\.cloud|cdn\\.com)/\\d+/(?:video/)?(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nexx'
+
+class NFLBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nfl'
+
+class NFLIE(NFLBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?P<host>\n                            (?:www\\.)?\n                            (?:\n                                (?:\n                                    nfl|\n                                    buffalobills|\n                                    miamidolphins|\n                                    patriots|\n                                    newyorkjets|\n                                    baltimoreravens|\n                                    bengals|\n                                    clevelandbrowns|\n                                    steelers|\n                                    houstontexans|\n                                    colts|\n                                    jaguars|\n                                    (?:titansonline|tennesseetitans)|\n                                    denverbroncos|\n                                    (?:kc)?chiefs|\n                                    raiders|\n                                    chargers|\n                                    dallascowboys|\n                                    giants|\n                                    philadelphiaeagles|\n                                    (?:redskins|washingtonfootball)|\n                                    chicagobears|\n                                    detroitlions|\n                                    packers|\n                                    vikings|\n                                    atlantafalcons|\n                                    panthers|\n                                    neworleanssaints|\n                                    buccaneers|\n                                    azcardinals|\n                                    (?:stlouis|the)rams|\n                                    49ers|\n                                    seahawks\n                                )\\.com|\n                                .+?\\.clubs\\.nfl\\.com\n                            )\n                        )/\n                    (?:videos?|listen|audio)/(?P<id>[^/#?&]+)'
+    _module = 'pycord.ext.dl.extractor.nfl'
+    IE_NAME = 'nfl.com'
+
+class NFLArticleIE(NFLBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?P<host>\n                            (?:www\\.)?\n                            (?:\n                                (?:\n                                    nfl|\n                                    buffalobills|\n                                    miamidolphins|\n                                    patriots|\n                                    newyorkjets|\n                                    baltimoreravens|\n                                    bengals|\n                                    clevelandbrowns|\n                                    steelers|\n                                    houstontexans|\n                                    colts|\n                                    jaguars|\n                                    (?:titansonline|tennesseetitans)|\n                                    denverbroncos|\n                                    (?:kc)?chiefs|\n                                    raiders|\n                                    chargers|\n                                    dallascowboys|\n                                    giants|\n                                    philadelphiaeagles|\n                                    (?:redskins|washingtonfootball)|\n                                    chicagobears|\n                                    detroitlions|\n                                    packers|\n                                    vikings|\n                                    atlantafalcons|\n                                    panthers|\n                                    neworleanssaints|\n                                    buccaneers|\n                                    azcardinals|\n                                    (?:stlouis|the)rams|\n                                    49ers|\n                                    seahawks\n                                )\\.com|\n                                .+?\\.clubs\\.nfl\\.com\n                            )\n                        )/\n                    news/(?P<id>[^/#?&]+)'
+    _module = 'pycord.ext.dl.extractor.nfl'
+    IE_NAME = 'nfl.com:article'
+
+class NhkBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nhk'
+
+class NhkVodIE(NhkBaseIE):
+    _VALID_URL = 'https?://www3\\.nhk\\.or\\.jp/nhkworld/(?P<lang>[a-z]{2})/ondemand/(?P<type>video|audio)/(?P<id>\\d{7}|[^/]+?-\\d{8}-[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.nhk'
+
+class NhkVodProgramIE(NhkBaseIE):
+    _VALID_URL = 'https?://www3\\.nhk\\.or\\.jp/nhkworld/(?P<lang>[a-z]{2})/ondemand/program/(?P<type>video|audio)/(?P<id>[0-9a-z]+)(?:.+?\\btype=(?P<episode_type>clip|(?:radio|tv)Episode))?'
+    _module = 'pycord.ext.dl.extractor.nhk'
+
+class NHLBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nhl'
+
+class NHLIE(NHLBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>nhl|wch2016)\\.com/(?:[^/]+/)*c-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nhl'
+    IE_NAME = 'nhl.com'
+
+class NickIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?P<domain>(?:(?:www|beta)\\.)?nick(?:jr)?\\.com)/(?:[^/]+/)?(?:videos/clip|[^/]+/videos)/(?P<id>[^/?#.]+)'
+    _module = 'pycord.ext.dl.extractor.nick'
+    IE_NAME = 'nick.com'
+
+class NickBrIE(MTVServicesInfoExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?P<domain>(?:www\\.)?nickjr|mundonick\\.uol)\\.com\\.br|\n                            (?:www\\.)?nickjr\\.[a-z]{2}|\n                            (?:www\\.)?nickelodeonjunior\\.fr\n                        )\n                        /(?:programas/)?[^/]+/videos/(?:episodios/)?(?P<id>[^/?\\#.]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.nick'
+    IE_NAME = 'nickelodeon:br'
+
+class NickDeIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<host>nick\\.(?:de|com\\.pl|ch)|nickelodeon\\.(?:nl|be|at|dk|no|se))/[^/]+/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nick'
+    IE_NAME = 'nick.de'
+
+class NickNightIE(NickDeIE):
+    _VALID_URL = 'https?://(?:www\\.)(?P<host>nicknight\\.(?:de|at|tv))/(?:playlist|shows)/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nick'
+    IE_NAME = 'nicknight'
+
+class NickRuIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)nickelodeon\\.(?:ru|fr|es|pt|ro|hu|com\\.tr)/[^/]+/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nick'
+    IE_NAME = 'nickelodeonru'
+
+class NiconicoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.|secure\\.|sp\\.)?nicovideo\\.jp/watch/(?P<id>(?:[a-z]{2})?[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.niconico'
+    IE_NAME = 'niconico'
+
+class NiconicoPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nicovideo\\.jp/(?:user/\\d+/)?mylist/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.niconico'
+
+class NineCNineMediaIE(LazyLoadExtractor):
+    _VALID_URL = '9c9media:(?P<destination_code>[^:]+):(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.ninecninemedia'
+    IE_NAME = '9c9media'
+
+class NineGagIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?9gag\\.com/gag/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.ninegag'
+    IE_NAME = '9gag'
+
+class NineNowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?9now\\.com\\.au/(?:[^/]+/){2}(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.ninenow'
+    IE_NAME = '9now.com.au'
+
+class NintendoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nintendo\\.com/(?:games/detail|nintendo-direct)/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nintendo'
+
+class NJPWWorldIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(front\\.)?njpwworld\\.com/p/(?P<id>[a-z0-9_]+)'
+    _module = 'pycord.ext.dl.extractor.njpwworld'
+
+class NobelPrizeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nobelprize\\.org/mediaplayer.*?\\bid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nobelprize'
+
+class NonkTubeIE(NuevoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?nonktube\\.com/(?:(?:video|embed)/|media/nuevo/embed\\.php\\?.*?\\bid=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nonktube'
+
+class NoovoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?noovo\\.ca/videos/(?P<id>[^/]+/[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.noovo'
+
+class NormalbootsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?normalboots\\.com/video/(?P<id>[0-9a-z-]*)/?$'
+    _module = 'pycord.ext.dl.extractor.normalboots'
+
+class NosVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nosvideo\\.com/(?:embed/|\\?v=)(?P<id>[A-Za-z0-9]{12})/?'
+    _module = 'pycord.ext.dl.extractor.nosvideo'
+
+class NovaEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://media\\.cms\\.nova\\.cz/embed/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nova'
+
+class NovaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^.]+\\.)?(?P<site>tv(?:noviny)?|tn|novaplus|vymena|fanda|krasna|doma|prask)\\.nova\\.cz/(?:[^/]+/)+(?P<id>[^/]+?)(?:\\.html|/|$)'
+    _module = 'pycord.ext.dl.extractor.nova'
+
+class NownessBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nowness'
+
+class NownessIE(NownessBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|cn)\\.)?nowness\\.com/(?:story|(?:series|category)/[^/]+)/(?P<id>[^/]+?)(?:$|[?#])'
+    _module = 'pycord.ext.dl.extractor.nowness'
+    IE_NAME = 'nowness'
+
+class NownessPlaylistIE(NownessBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|cn)\\.)?nowness\\.com/playlist/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nowness'
+    IE_NAME = 'nowness:playlist'
+
+class NownessSeriesIE(NownessBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|cn)\\.)?nowness\\.com/series/(?P<id>[^/]+?)(?:$|[?#])'
+    _module = 'pycord.ext.dl.extractor.nowness'
+    IE_NAME = 'nowness:series'
+
+class NozIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?noz\\.de/video/(?P<id>[0-9]+)/'
+    _module = 'pycord.ext.dl.extractor.noz'
+
+class NPOBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.npo'
+
+class NPOIE(NPOBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        npo:|\n                        https?://\n                            (?:www\\.)?\n                            (?:\n                                npo\\.nl/(?:[^/]+/)*|\n                                (?:ntr|npostart)\\.nl/(?:[^/]+/){2,}|\n                                omroepwnl\\.nl/video/fragment/[^/]+__|\n                                (?:zapp|npo3)\\.nl/(?:[^/]+/){2,}\n                            )\n                        )\n                        (?P<id>[^/?#]+)\n                '
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'npo'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if any(
+                ie.suitable(url) for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE)
+            )
+            else super(NPOIE, cls).suitable(url)
+        )
+
+class NPOPlaylistBaseIE(NPOIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        npo:|\n                        https?://\n                            (?:www\\.)?\n                            (?:\n                                npo\\.nl/(?:[^/]+/)*|\n                                (?:ntr|npostart)\\.nl/(?:[^/]+/){2,}|\n                                omroepwnl\\.nl/video/fragment/[^/]+__|\n                                (?:zapp|npo3)\\.nl/(?:[^/]+/){2,}\n                            )\n                        )\n                        (?P<id>[^/?#]+)\n                '
+    _module = 'pycord.ext.dl.extractor.npo'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if any(
+                ie.suitable(url) for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE)
+            )
+            else super(NPOIE, cls).suitable(url)
+        )
+
+class AndereTijdenIE(NPOPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?anderetijden\\.nl/programma/(?:[^/]+/)+(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'anderetijden'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if any(
+                ie.suitable(url) for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE)
+            )
+            else super(NPOIE, cls).suitable(url)
+        )
+
+class NPOLiveIE(NPOBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?npo(?:start)?\\.nl/live(?:/(?P<id>[^/?#&]+))?'
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'npo.nl:live'
+
+class NPORadioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?npo\\.nl/radio/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'npo.nl:radio'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if NPORadioFragmentIE.suitable(url)
+            else super(NPORadioIE, cls).suitable(url)
+        )
+
+class NPORadioFragmentIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?npo\\.nl/radio/[^/]+/fragment/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'npo.nl:radio:fragment'
+
+class NPODataMidEmbedIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.npo'
+
+class SchoolTVIE(NPODataMidEmbedIE):
+    _VALID_URL = 'https?://(?:www\\.)?schooltv\\.nl/video/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'schooltv'
+
+class HetKlokhuisIE(NPODataMidEmbedIE):
+    _VALID_URL = 'https?://(?:www\\.)?hetklokhuis\\.nl/[^/]+/\\d+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'hetklokhuis'
+
+class VPROIE(NPOPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:(?:tegenlicht\\.)?vpro|2doc)\\.nl/(?:[^/]+/)*(?P<id>[^/]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'vpro'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if any(
+                ie.suitable(url) for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE)
+            )
+            else super(NPOIE, cls).suitable(url)
+        )
+
+class WNLIE(NPOPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?omroepwnl\\.nl/video/detail/(?P<id>[^/]+)__\\d+'
+    _module = 'pycord.ext.dl.extractor.npo'
+    IE_NAME = 'wnl'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if any(
+                ie.suitable(url) for ie in (NPOLiveIE, NPORadioIE, NPORadioFragmentIE)
+            )
+            else super(NPOIE, cls).suitable(url)
+        )
+
+class NprIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?npr\\.org/(?:sections/[^/]+/)?\\d{4}/\\d{2}/\\d{2}/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.npr'
+
+class NRKBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKIE(NRKBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            nrk:|\n                            https?://\n                                (?:\n                                    (?:www\\.)?nrk\\.no/video/(?:PS\\*|[^_]+_)|\n                                    v8[-.]psapi\\.nrk\\.no/mediaelement/\n                                )\n                            )\n                            (?P<id>[^?\\#&]+)\n                        '
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKPlaylistBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKPlaylistIE(NRKPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?nrk\\.no/(?!video|skole)(?:[^/]+/)+(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKSkoleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nrk\\.no/skole/?\\?.*\\bmediaId=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:tv|radio)\\.nrk(?:super)?\\.no/(?:[^/]+/)*(?P<id>[a-zA-Z]{4}\\d{8})'
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKTVDirekteIE(NRKTVIE):
+    _VALID_URL = 'https?://(?:tv|radio)\\.nrk\\.no/direkte/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKRadioPodkastIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://radio\\.nrk\\.no/pod[ck]ast/(?:[^/]+/)+(?P<id>l_[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKTVEpisodeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tv\\.nrk\\.no/serie/(?P<id>[^/]+/sesong/(?P<season_number>\\d+)/episode/(?P<episode_number>\\d+))'
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKTVEpisodesIE(NRKPlaylistBaseIE):
+    _VALID_URL = 'https?://tv\\.nrk\\.no/program/[Ee]pisodes/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKTVSerieBaseIE(NRKBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+class NRKTVSeasonIE(NRKTVSerieBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?P<domain>tv|radio)\\.nrk\\.no/\n                        (?P<serie_kind>serie|pod[ck]ast)/\n                        (?P<serie>[^/]+)/\n                        (?:\n                            (?:sesong/)?(?P<id>\\d+)|\n                            sesong/(?P<id_2>[^/?#&]+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if NRKTVIE.suitable(url)
+            or NRKTVEpisodeIE.suitable(url)
+            or NRKRadioPodkastIE.suitable(url)
+            else super(NRKTVSeasonIE, cls).suitable(url)
+        )
+
+class NRKTVSeriesIE(NRKTVSerieBaseIE):
+    _VALID_URL = 'https?://(?P<domain>(?:tv|radio)\\.nrk|(?:tv\\.)?nrksuper)\\.no/(?P<serie_kind>serie|pod[ck]ast)/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.nrk'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if any(
+                ie.suitable(url)
+                for ie in (NRKTVIE, NRKTVEpisodeIE, NRKRadioPodkastIE, NRKTVSeasonIE)
+            )
+            else super(NRKTVSeriesIE, cls).suitable(url)
+        )
+
+class NRLTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nrl\\.com/tv(/[^/]+)*/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.nrl'
+
+class NTVCoJpCUIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://cu\\.ntv\\.co\\.jp/(?!program)(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.ntvcojp'
+    IE_NAME = 'cu.ntv.co.jp'
+
+class NTVDeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?n-tv\\.de/mediathek/videos/[^/?#]+/[^/?#]+-article(?P<id>.+)\\.html'
+    _module = 'pycord.ext.dl.extractor.ntvde'
+    IE_NAME = 'n-tv.de'
+
+class NTVRuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ntv\\.ru/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.ntvru'
+    IE_NAME = 'ntv.ru'
+
+class NYTimesBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.nytimes'
+
+class NYTimesIE(NYTimesBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?nytimes\\.com/video/(?:[^/]+/)+?|graphics8\\.nytimes\\.com/bcvideo/\\d+(?:\\.\\d+)?/iframe/embed\\.html\\?videoId=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nytimes'
+
+class NYTimesArticleIE(NYTimesBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?nytimes\\.com/(.(?<!video))*?/(?:[^/]+/)*(?P<id>[^.]+)(?:\\.html)?'
+    _module = 'pycord.ext.dl.extractor.nytimes'
+
+class NYTimesCookingIE(NYTimesBaseIE):
+    _VALID_URL = 'https?://cooking\\.nytimes\\.com/(?:guid|recip)es/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nytimes'
+
+class NuvidIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|m)\\.nuvid\\.com/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.nuvid'
+
+class NZZIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?nzz\\.ch/(?:[^/]+/)*[^/?#]+-ld\\.(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.nzz'
+
+class OdaTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?odatv\\.com/(?:mob|vid)_video\\.php\\?.*\\bid=(?P<id>[^&]+)'
+    _module = 'pycord.ext.dl.extractor.odatv'
+
+class OdnoklassnikiIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                https?://\n                    (?:(?:www|m|mobile)\\.)?\n                    (?:odnoklassniki|ok)\\.ru/\n                    (?:\n                        video(?:embed)?/|\n                        web-api/video/moviePlayer/|\n                        live/|\n                        dk\\?.*?st\\.mvId=\n                    )\n                    (?P<id>[\\d-]+)\n                '
+    _module = 'pycord.ext.dl.extractor.odnoklassniki'
+
+class OktoberfestTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?oktoberfest-tv\\.de/[^/]+/[^/]+/video/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.oktoberfesttv'
+
+class OnDemandKoreaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ondemandkorea\\.com/(?P<id>[^/]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.ondemandkorea'
+
+class OnetIE(OnetBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?onet\\.tv|onet100\\.vod\\.pl)/[a-z]/[a-z]+/(?P<display_id>[0-9a-z-]+)/(?P<id>[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.onet'
+    IE_NAME = 'onet.tv'
+
+class OnetChannelIE(OnetBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?onet\\.tv|onet100\\.vod\\.pl)/[a-z]/(?P<id>[a-z]+)(?:[?#]|$)'
+    _module = 'pycord.ext.dl.extractor.onet'
+    IE_NAME = 'onet.tv:channel'
+
+class OnetMVPIE(OnetBaseIE):
+    _VALID_URL = 'onetmvp:(?P<id>\\d+\\.\\d+)'
+    _module = 'pycord.ext.dl.extractor.onet'
+
+class OnetPlIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?(?:onet|businessinsider\\.com|plejada)\\.pl/(?:[^/]+/)+(?P<id>[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.onet'
+    IE_NAME = 'onet.pl'
+
+class OnionStudiosIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?onionstudios\\.com/(?:video(?:s/[^/]+-|/)|embed\\?.*\\bid=)(?P<id>\\d+)(?!-)'
+    _module = 'pycord.ext.dl.extractor.onionstudios'
+
+class OoyalaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.ooyala'
+
+class OoyalaIE(OoyalaBaseIE):
+    _VALID_URL = '(?:ooyala:|https?://.+?\\.ooyala\\.com/.*?(?:embedCode|ec)=)(?P<id>.+?)(&|$)'
+    _module = 'pycord.ext.dl.extractor.ooyala'
+
+class OoyalaExternalIE(OoyalaBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        ooyalaexternal:|\n                        https?://.+?\\.ooyala\\.com/.*?\\bexternalId=\n                    )\n                    (?P<partner_id>[^:]+)\n                    :\n                    (?P<id>.+)\n                    (?:\n                        :|\n                        .*?&pcode=\n                    )\n                    (?P<pcode>.+?)\n                    (?:&|$)\n                    '
+    _module = 'pycord.ext.dl.extractor.ooyala'
+
+class OraTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:ora\\.tv|unsafespeech\\.com)/([^/]+/)*(?P<id>[^/\\?#]+)'
+    _module = 'pycord.ext.dl.extractor.ora'
+
+class ORFTVthekIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tvthek\\.orf\\.at/(?:[^/]+/)+(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:tvthek'
+
+class ORFRadioIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.orf'
+
+class ORFFM4IE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>fm4)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>4\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:fm4'
+
+class ORFFM4StoryIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://fm4\\.orf\\.at/stories/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:fm4:story'
+
+class ORFOE1IE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>oe1)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:oe1'
+
+class ORFOE3IE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>oe3)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:oe3'
+
+class ORFNOEIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>noe)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:noe'
+
+class ORFWIEIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>wien)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:wien'
+
+class ORFBGLIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>burgenland)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:burgenland'
+
+class ORFOOEIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>ooe)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:oberoesterreich'
+
+class ORFSTMIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>steiermark)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:steiermark'
+
+class ORFKTNIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>kaernten)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:kaernten'
+
+class ORFSBGIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>salzburg)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:salzburg'
+
+class ORFTIRIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>tirol)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:tirol'
+
+class ORFVBGIE(ORFRadioIE):
+    _VALID_URL = 'https?://(?P<station>vorarlberg)\\.orf\\.at/player/(?P<date>[0-9]+)/(?P<show>\\w+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:vorarlberg'
+
+class ORFIPTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://iptv\\.orf\\.at/(?:#/)?stories/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.orf'
+    IE_NAME = 'orf:iptv'
+
+class OutsideTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?outsidetv\\.com/(?:[^/]+/)*?play/[a-zA-Z0-9]{8}/\\d+/\\d+/(?P<id>[a-zA-Z0-9]{8})'
+    _module = 'pycord.ext.dl.extractor.outsidetv'
+
+class PacktPubBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.packtpub'
+
+class PacktPubIE(PacktPubBaseIE):
+    _VALID_URL = 'https?://(?:(?:www\\.)?packtpub\\.com/mapt|subscription\\.packtpub\\.com)/video/[^/]+/(?P<course_id>\\d+)/(?P<chapter_id>[^/]+)/(?P<id>[^/]+)(?:/(?P<display_id>[^/?&#]+))?'
+    _module = 'pycord.ext.dl.extractor.packtpub'
+
+class PacktPubCourseIE(PacktPubBaseIE):
+    _VALID_URL = '(?P<url>https?://(?:(?:www\\.)?packtpub\\.com/mapt|subscription\\.packtpub\\.com)/video/[^/]+/(?P<id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.packtpub'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if PacktPubIE.suitable(url)
+            else super(PacktPubCourseIE, cls).suitable(url)
+        )
+
+class PalcoMP3BaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.palcomp3'
+
+class PalcoMP3IE(PalcoMP3BaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?palcomp3\\.com(?:\\.br)?/(?P<artist>[^/]+)/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.palcomp3'
+    IE_NAME = 'PalcoMP3:song'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if PalcoMP3VideoIE.suitable(url)
+            else super(PalcoMP3IE, cls).suitable(url)
+        )
+
+class PalcoMP3ArtistIE(PalcoMP3BaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?palcomp3\\.com(?:\\.br)?/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.palcomp3'
+    IE_NAME = 'PalcoMP3:artist'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if re.match(PalcoMP3IE._VALID_URL, url)
+            else super(PalcoMP3ArtistIE, cls).suitable(url)
+        )
+
+class PalcoMP3VideoIE(PalcoMP3BaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?palcomp3\\.com(?:\\.br)?/(?P<artist>[^/]+)/(?P<id>[^/?&#]+)/?#clipe'
+    _module = 'pycord.ext.dl.extractor.palcomp3'
+    IE_NAME = 'PalcoMP3:video'
+
+class PandoraTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:\n                                (?:www\\.)?pandora\\.tv/view/(?P<user_id>[^/]+)/(?P<id>\\d+)|  # new format\n                                (?:.+?\\.)?channel\\.pandora\\.tv/channel/video\\.ptv\\?|        # old format\n                                m\\.pandora\\.tv/?\\?                                          # mobile\n                            )\n                    '
+    _module = 'pycord.ext.dl.extractor.pandoratv'
+    IE_NAME = 'pandora.tv'
+
+class ParliamentLiveUKIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)https?://(?:www\\.)?parliamentlive\\.tv/Event/Index/(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.parliamentliveuk'
+    IE_NAME = 'parliamentlive.tv'
+
+class PatreonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?patreon\\.com/(?:creation\\?hid=|posts/(?:[\\w-]+-)?)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.patreon'
+
+class PBSIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://\n        (?:\n           # Direct video URL\n           (?:(?:video|www|player)\\.pbs\\.org|video\\.aptv\\.org|video\\.gpb\\.org|video\\.mpbonline\\.org|video\\.wnpt\\.org|video\\.wfsu\\.org|video\\.wsre\\.org|video\\.wtcitv\\.org|video\\.pba\\.org|video\\.alaskapublic\\.org|video\\.azpbs\\.org|portal\\.knme\\.org|video\\.vegaspbs\\.org|watch\\.aetn\\.org|video\\.ket\\.org|video\\.wkno\\.org|video\\.lpb\\.org|videos\\.oeta\\.tv|video\\.optv\\.org|watch\\.wsiu\\.org|video\\.keet\\.org|pbs\\.kixe\\.org|video\\.kpbs\\.org|video\\.kqed\\.org|vids\\.kvie\\.org|video\\.pbssocal\\.org|video\\.valleypbs\\.org|video\\.cptv\\.org|watch\\.knpb\\.org|video\\.soptv\\.org|video\\.rmpbs\\.org|video\\.kenw\\.org|video\\.kued\\.org|video\\.wyomingpbs\\.org|video\\.cpt12\\.org|video\\.kbyueleven\\.org|video\\.thirteen\\.org|video\\.wgbh\\.org|video\\.wgby\\.org|watch\\.njtvonline\\.org|watch\\.wliw\\.org|video\\.mpt\\.tv|watch\\.weta\\.org|video\\.whyy\\.org|video\\.wlvt\\.org|video\\.wvpt\\.net|video\\.whut\\.org|video\\.wedu\\.org|video\\.wgcu\\.org|video\\.wpbt2\\.org|video\\.wucftv\\.org|video\\.wuft\\.org|watch\\.wxel\\.org|video\\.wlrn\\.org|video\\.wusf\\.usf\\.edu|video\\.scetv\\.org|video\\.unctv\\.org|video\\.pbshawaii\\.org|video\\.idahoptv\\.org|video\\.ksps\\.org|watch\\.opb\\.org|watch\\.nwptv\\.org|video\\.will\\.illinois\\.edu|video\\.networkknowledge\\.tv|video\\.wttw\\.com|video\\.iptv\\.org|video\\.ninenet\\.org|video\\.wfwa\\.org|video\\.wfyi\\.org|video\\.mptv\\.org|video\\.wnin\\.org|video\\.wnit\\.org|video\\.wpt\\.org|video\\.wvut\\.org|video\\.weiu\\.net|video\\.wqpt\\.org|video\\.wycc\\.org|video\\.wipb\\.org|video\\.indianapublicmedia\\.org|watch\\.cetconnect\\.org|video\\.thinktv\\.org|video\\.wbgu\\.org|video\\.wgvu\\.org|video\\.netnebraska\\.org|video\\.pioneer\\.org|watch\\.sdpb\\.org|video\\.tpt\\.org|watch\\.ksmq\\.org|watch\\.kpts\\.org|watch\\.ktwu\\.org|watch\\.easttennesseepbs\\.org|video\\.wcte\\.tv|video\\.wljt\\.org|video\\.wosu\\.org|video\\.woub\\.org|video\\.wvpublic\\.org|video\\.wkyupbs\\.org|video\\.kera\\.org|video\\.mpbn\\.net|video\\.mountainlake\\.org|video\\.nhptv\\.org|video\\.vpt\\.org|video\\.witf\\.org|watch\\.wqed\\.org|video\\.wmht\\.org|video\\.deltabroadcasting\\.org|video\\.dptv\\.org|video\\.wcmu\\.org|video\\.wkar\\.org|wnmuvideo\\.nmu\\.edu|video\\.wdse\\.org|video\\.wgte\\.org|video\\.lptv\\.org|video\\.kmos\\.org|watch\\.montanapbs\\.org|video\\.krwg\\.org|video\\.kacvtv\\.org|video\\.kcostv\\.org|video\\.wcny\\.org|video\\.wned\\.org|watch\\.wpbstv\\.org|video\\.wskg\\.org|video\\.wxxi\\.org|video\\.wpsu\\.org|on-demand\\.wvia\\.org|video\\.wtvi\\.org|video\\.westernreservepublicmedia\\.org|video\\.ideastream\\.org|video\\.kcts9\\.org|video\\.basinpbs\\.org|video\\.houstonpbs\\.org|video\\.klrn\\.org|video\\.klru\\.tv|video\\.wtjx\\.org|video\\.ideastations\\.org|video\\.kbtc\\.org)/(?:(?:vir|port)alplayer|video)/(?P<id>[0-9]+)(?:[?/]|$) |\n           # Article with embedded player (or direct video)\n           (?:www\\.)?pbs\\.org/(?:[^/]+/){1,5}(?P<presumptive_id>[^/]+?)(?:\\.html)?/?(?:$|[?\\#]) |\n           # Player\n           (?:video|player)\\.pbs\\.org/(?:widget/)?partnerplayer/(?P<player_id>[^/]+)/\n        )\n    '
+    _module = 'pycord.ext.dl.extractor.pbs'
+    IE_NAME = 'pbs'
+
+class PearVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pearvideo\\.com/video_(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.pearvideo'
+
+class PeerTubeIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        peertube:(?P<host>[^:]+):|\n                        https?://(?P<host_2>(?:\n                            # Taken from https://instances.joinpeertube.org/instances\n                            peertube\\.rainbowswingers\\.net|\n                            tube\\.stanisic\\.nl|\n                            peer\\.suiri\\.us|\n                            medias\\.libox\\.fr|\n                            videomensoif\\.ynh\\.fr|\n                            peertube\\.travelpandas\\.eu|\n                            peertube\\.rachetjay\\.fr|\n                            peertube\\.montecsys\\.fr|\n                            tube\\.eskuero\\.me|\n                            peer\\.tube|\n                            peertube\\.umeahackerspace\\.se|\n                            tube\\.nx-pod\\.de|\n                            video\\.monsieurbidouille\\.fr|\n                            tube\\.openalgeria\\.org|\n                            vid\\.lelux\\.fi|\n                            video\\.anormallostpod\\.ovh|\n                            tube\\.crapaud-fou\\.org|\n                            peertube\\.stemy\\.me|\n                            lostpod\\.space|\n                            exode\\.me|\n                            peertube\\.snargol\\.com|\n                            vis\\.ion\\.ovh|\n                            videosdulib\\.re|\n                            v\\.mbius\\.io|\n                            videos\\.judrey\\.eu|\n                            peertube\\.osureplayviewer\\.xyz|\n                            peertube\\.mathieufamily\\.ovh|\n                            www\\.videos-libr\\.es|\n                            fightforinfo\\.com|\n                            peertube\\.fediverse\\.ru|\n                            peertube\\.oiseauroch\\.fr|\n                            video\\.nesven\\.eu|\n                            v\\.bearvideo\\.win|\n                            video\\.qoto\\.org|\n                            justporn\\.cc|\n                            video\\.vny\\.fr|\n                            peervideo\\.club|\n                            tube\\.taker\\.fr|\n                            peertube\\.chantierlibre\\.org|\n                            tube\\.ipfixe\\.info|\n                            tube\\.kicou\\.info|\n                            tube\\.dodsorf\\.as|\n                            videobit\\.cc|\n                            video\\.yukari\\.moe|\n                            videos\\.elbinario\\.net|\n                            hkvideo\\.live|\n                            pt\\.tux\\.tf|\n                            www\\.hkvideo\\.live|\n                            FIGHTFORINFO\\.com|\n                            pt\\.765racing\\.com|\n                            peertube\\.gnumeria\\.eu\\.org|\n                            nordenmedia\\.com|\n                            peertube\\.co\\.uk|\n                            tube\\.darfweb\\.eu|\n                            tube\\.kalah-france\\.org|\n                            0ch\\.in|\n                            vod\\.mochi\\.academy|\n                            film\\.node9\\.org|\n                            peertube\\.hatthieves\\.es|\n                            video\\.fitchfamily\\.org|\n                            peertube\\.ddns\\.net|\n                            video\\.ifuncle\\.kr|\n                            video\\.fdlibre\\.eu|\n                            tube\\.22decembre\\.eu|\n                            peertube\\.harmoniescreatives\\.com|\n                            tube\\.fabrigli\\.fr|\n                            video\\.thedwyers\\.co|\n                            video\\.bruitbruit\\.com|\n                            peertube\\.foxfam\\.club|\n                            peer\\.philoxweb\\.be|\n                            videos\\.bugs\\.social|\n                            peertube\\.malbert\\.xyz|\n                            peertube\\.bilange\\.ca|\n                            libretube\\.net|\n                            diytelevision\\.com|\n                            peertube\\.fedilab\\.app|\n                            libre\\.video|\n                            video\\.mstddntfdn\\.online|\n                            us\\.tv|\n                            peertube\\.sl-network\\.fr|\n                            peertube\\.dynlinux\\.io|\n                            peertube\\.david\\.durieux\\.family|\n                            peertube\\.linuxrocks\\.online|\n                            peerwatch\\.xyz|\n                            v\\.kretschmann\\.social|\n                            tube\\.otter\\.sh|\n                            yt\\.is\\.nota\\.live|\n                            tube\\.dragonpsi\\.xyz|\n                            peertube\\.boneheadmedia\\.com|\n                            videos\\.funkwhale\\.audio|\n                            watch\\.44con\\.com|\n                            peertube\\.gcaillaut\\.fr|\n                            peertube\\.icu|\n                            pony\\.tube|\n                            spacepub\\.space|\n                            tube\\.stbr\\.io|\n                            v\\.mom-gay\\.faith|\n                            tube\\.port0\\.xyz|\n                            peertube\\.simounet\\.net|\n                            play\\.jergefelt\\.se|\n                            peertube\\.zeteo\\.me|\n                            tube\\.danq\\.me|\n                            peertube\\.kerenon\\.com|\n                            tube\\.fab-l3\\.org|\n                            tube\\.calculate\\.social|\n                            peertube\\.mckillop\\.org|\n                            tube\\.netzspielplatz\\.de|\n                            vod\\.ksite\\.de|\n                            peertube\\.laas\\.fr|\n                            tube\\.govital\\.net|\n                            peertube\\.stephenson\\.cc|\n                            bistule\\.nohost\\.me|\n                            peertube\\.kajalinifi\\.de|\n                            video\\.ploud\\.jp|\n                            video\\.omniatv\\.com|\n                            peertube\\.ffs2play\\.fr|\n                            peertube\\.leboulaire\\.ovh|\n                            peertube\\.tronic-studio\\.com|\n                            peertube\\.public\\.cat|\n                            peertube\\.metalbanana\\.net|\n                            video\\.1000i100\\.fr|\n                            peertube\\.alter-nativ-voll\\.de|\n                            tube\\.pasa\\.tf|\n                            tube\\.worldofhauru\\.xyz|\n                            pt\\.kamp\\.site|\n                            peertube\\.teleassist\\.fr|\n                            videos\\.mleduc\\.xyz|\n                            conf\\.tube|\n                            media\\.privacyinternational\\.org|\n                            pt\\.forty-two\\.nl|\n                            video\\.halle-leaks\\.de|\n                            video\\.grosskopfgames\\.de|\n                            peertube\\.schaeferit\\.de|\n                            peertube\\.jackbot\\.fr|\n                            tube\\.extinctionrebellion\\.fr|\n                            peertube\\.f-si\\.org|\n                            video\\.subak\\.ovh|\n                            videos\\.koweb\\.fr|\n                            peertube\\.zergy\\.net|\n                            peertube\\.roflcopter\\.fr|\n                            peertube\\.floss-marketing-school\\.com|\n                            vloggers\\.social|\n                            peertube\\.iriseden\\.eu|\n                            videos\\.ubuntu-paris\\.org|\n                            peertube\\.mastodon\\.host|\n                            armstube\\.com|\n                            peertube\\.s2s\\.video|\n                            peertube\\.lol|\n                            tube\\.open-plug\\.eu|\n                            open\\.tube|\n                            peertube\\.ch|\n                            peertube\\.normandie-libre\\.fr|\n                            peertube\\.slat\\.org|\n                            video\\.lacaveatonton\\.ovh|\n                            peertube\\.uno|\n                            peertube\\.servebeer\\.com|\n                            peertube\\.fedi\\.quebec|\n                            tube\\.h3z\\.jp|\n                            tube\\.plus200\\.com|\n                            peertube\\.eric\\.ovh|\n                            tube\\.metadocs\\.cc|\n                            tube\\.unmondemeilleur\\.eu|\n                            gouttedeau\\.space|\n                            video\\.antirep\\.net|\n                            nrop\\.cant\\.at|\n                            tube\\.ksl-bmx\\.de|\n                            tube\\.plaf\\.fr|\n                            tube\\.tchncs\\.de|\n                            video\\.devinberg\\.com|\n                            hitchtube\\.fr|\n                            peertube\\.kosebamse\\.com|\n                            yunopeertube\\.myddns\\.me|\n                            peertube\\.varney\\.fr|\n                            peertube\\.anon-kenkai\\.com|\n                            tube\\.maiti\\.info|\n                            tubee\\.fr|\n                            videos\\.dinofly\\.com|\n                            toobnix\\.org|\n                            videotape\\.me|\n                            voca\\.tube|\n                            video\\.heromuster\\.com|\n                            video\\.lemediatv\\.fr|\n                            video\\.up\\.edu\\.ph|\n                            balafon\\.video|\n                            video\\.ivel\\.fr|\n                            thickrips\\.cloud|\n                            pt\\.laurentkruger\\.fr|\n                            video\\.monarch-pass\\.net|\n                            peertube\\.artica\\.center|\n                            video\\.alternanet\\.fr|\n                            indymotion\\.fr|\n                            fanvid\\.stopthatimp\\.net|\n                            video\\.farci\\.org|\n                            v\\.lesterpig\\.com|\n                            video\\.okaris\\.de|\n                            tube\\.pawelko\\.net|\n                            peertube\\.mablr\\.org|\n                            tube\\.fede\\.re|\n                            pytu\\.be|\n                            evertron\\.tv|\n                            devtube\\.dev-wiki\\.de|\n                            raptube\\.antipub\\.org|\n                            video\\.selea\\.se|\n                            peertube\\.mygaia\\.org|\n                            video\\.oh14\\.de|\n                            peertube\\.livingutopia\\.org|\n                            peertube\\.the-penguin\\.de|\n                            tube\\.thechangebook\\.org|\n                            tube\\.anjara\\.eu|\n                            pt\\.pube\\.tk|\n                            video\\.samedi\\.pm|\n                            mplayer\\.demouliere\\.eu|\n                            widemus\\.de|\n                            peertube\\.me|\n                            peertube\\.zapashcanon\\.fr|\n                            video\\.latavernedejohnjohn\\.fr|\n                            peertube\\.pcservice46\\.fr|\n                            peertube\\.mazzonetto\\.eu|\n                            video\\.irem\\.univ-paris-diderot\\.fr|\n                            video\\.livecchi\\.cloud|\n                            alttube\\.fr|\n                            video\\.coop\\.tools|\n                            video\\.cabane-libre\\.org|\n                            peertube\\.openstreetmap\\.fr|\n                            videos\\.alolise\\.org|\n                            irrsinn\\.video|\n                            video\\.antopie\\.org|\n                            scitech\\.video|\n                            tube2\\.nemsia\\.org|\n                            video\\.amic37\\.fr|\n                            peertube\\.freeforge\\.eu|\n                            video\\.arbitrarion\\.com|\n                            video\\.datsemultimedia\\.com|\n                            stoptrackingus\\.tv|\n                            peertube\\.ricostrongxxx\\.com|\n                            docker\\.videos\\.lecygnenoir\\.info|\n                            peertube\\.togart\\.de|\n                            tube\\.postblue\\.info|\n                            videos\\.domainepublic\\.net|\n                            peertube\\.cyber-tribal\\.com|\n                            video\\.gresille\\.org|\n                            peertube\\.dsmouse\\.net|\n                            cinema\\.yunohost\\.support|\n                            tube\\.theocevaer\\.fr|\n                            repro\\.video|\n                            tube\\.4aem\\.com|\n                            quaziinc\\.com|\n                            peertube\\.metawurst\\.space|\n                            videos\\.wakapo\\.com|\n                            video\\.ploud\\.fr|\n                            video\\.freeradical\\.zone|\n                            tube\\.valinor\\.fr|\n                            refuznik\\.video|\n                            pt\\.kircheneuenburg\\.de|\n                            peertube\\.asrun\\.eu|\n                            peertube\\.lagob\\.fr|\n                            videos\\.side-ways\\.net|\n                            91video\\.online|\n                            video\\.valme\\.io|\n                            video\\.taboulisme\\.com|\n                            videos-libr\\.es|\n                            tv\\.mooh\\.fr|\n                            nuage\\.acostey\\.fr|\n                            video\\.monsieur-a\\.fr|\n                            peertube\\.librelois\\.fr|\n                            videos\\.pair2jeux\\.tube|\n                            videos\\.pueseso\\.club|\n                            peer\\.mathdacloud\\.ovh|\n                            media\\.assassinate-you\\.net|\n                            vidcommons\\.org|\n                            ptube\\.rousset\\.nom\\.fr|\n                            tube\\.cyano\\.at|\n                            videos\\.squat\\.net|\n                            video\\.iphodase\\.fr|\n                            peertube\\.makotoworkshop\\.org|\n                            peertube\\.serveur\\.slv-valbonne\\.fr|\n                            vault\\.mle\\.party|\n                            hostyour\\.tv|\n                            videos\\.hack2g2\\.fr|\n                            libre\\.tube|\n                            pire\\.artisanlogiciel\\.net|\n                            videos\\.numerique-en-commun\\.fr|\n                            video\\.netsyms\\.com|\n                            video\\.die-partei\\.social|\n                            video\\.writeas\\.org|\n                            peertube\\.swarm\\.solvingmaz\\.es|\n                            tube\\.pericoloso\\.ovh|\n                            watching\\.cypherpunk\\.observer|\n                            videos\\.adhocmusic\\.com|\n                            tube\\.rfc1149\\.net|\n                            peertube\\.librelabucm\\.org|\n                            videos\\.numericoop\\.fr|\n                            peertube\\.koehn\\.com|\n                            peertube\\.anarchmusicall\\.net|\n                            tube\\.kampftoast\\.de|\n                            vid\\.y-y\\.li|\n                            peertube\\.xtenz\\.xyz|\n                            diode\\.zone|\n                            tube\\.egf\\.mn|\n                            peertube\\.nomagic\\.uk|\n                            visionon\\.tv|\n                            videos\\.koumoul\\.com|\n                            video\\.rastapuls\\.com|\n                            video\\.mantlepro\\.com|\n                            video\\.deadsuperhero\\.com|\n                            peertube\\.musicstudio\\.pro|\n                            peertube\\.we-keys\\.fr|\n                            artitube\\.artifaille\\.fr|\n                            peertube\\.ethernia\\.net|\n                            tube\\.midov\\.pl|\n                            peertube\\.fr|\n                            watch\\.snoot\\.tube|\n                            peertube\\.donnadieu\\.fr|\n                            argos\\.aquilenet\\.fr|\n                            tube\\.nemsia\\.org|\n                            tube\\.bruniau\\.net|\n                            videos\\.darckoune\\.moe|\n                            tube\\.traydent\\.info|\n                            dev\\.videos\\.lecygnenoir\\.info|\n                            peertube\\.nayya\\.org|\n                            peertube\\.live|\n                            peertube\\.mofgao\\.space|\n                            video\\.lequerrec\\.eu|\n                            peertube\\.amicale\\.net|\n                            aperi\\.tube|\n                            tube\\.ac-lyon\\.fr|\n                            video\\.lw1\\.at|\n                            www\\.yiny\\.org|\n                            videos\\.pofilo\\.fr|\n                            tube\\.lou\\.lt|\n                            choob\\.h\\.etbus\\.ch|\n                            tube\\.hoga\\.fr|\n                            peertube\\.heberge\\.fr|\n                            video\\.obermui\\.de|\n                            videos\\.cloudfrancois\\.fr|\n                            betamax\\.video|\n                            video\\.typica\\.us|\n                            tube\\.piweb\\.be|\n                            video\\.blender\\.org|\n                            peertube\\.cat|\n                            tube\\.kdy\\.ch|\n                            pe\\.ertu\\.be|\n                            peertube\\.social|\n                            videos\\.lescommuns\\.org|\n                            tv\\.datamol\\.org|\n                            videonaute\\.fr|\n                            dialup\\.express|\n                            peertube\\.nogafa\\.org|\n                            megatube\\.lilomoino\\.fr|\n                            peertube\\.tamanoir\\.foucry\\.net|\n                            peertube\\.devosi\\.org|\n                            peertube\\.1312\\.media|\n                            tube\\.bootlicker\\.party|\n                            skeptikon\\.fr|\n                            video\\.blueline\\.mg|\n                            tube\\.homecomputing\\.fr|\n                            tube\\.ouahpiti\\.info|\n                            video\\.tedomum\\.net|\n                            video\\.g3l\\.org|\n                            fontube\\.fr|\n                            peertube\\.gaialabs\\.ch|\n                            tube\\.kher\\.nl|\n                            peertube\\.qtg\\.fr|\n                            video\\.migennes\\.net|\n                            tube\\.p2p\\.legal|\n                            troll\\.tv|\n                            videos\\.iut-orsay\\.fr|\n                            peertube\\.solidev\\.net|\n                            videos\\.cemea\\.org|\n                            video\\.passageenseine\\.fr|\n                            videos\\.festivalparminous\\.org|\n                            peertube\\.touhoppai\\.moe|\n                            sikke\\.fi|\n                            peer\\.hostux\\.social|\n                            share\\.tube|\n                            peertube\\.walkingmountains\\.fr|\n                            videos\\.benpro\\.fr|\n                            peertube\\.parleur\\.net|\n                            peertube\\.heraut\\.eu|\n                            tube\\.aquilenet\\.fr|\n                            peertube\\.gegeweb\\.eu|\n                            framatube\\.org|\n                            thinkerview\\.video|\n                            tube\\.conferences-gesticulees\\.net|\n                            peertube\\.datagueule\\.tv|\n                            video\\.lqdn\\.fr|\n                            tube\\.mochi\\.academy|\n                            media\\.zat\\.im|\n                            video\\.colibris-outilslibres\\.org|\n                            tube\\.svnet\\.fr|\n                            peertube\\.video|\n                            peertube3\\.cpy\\.re|\n                            peertube2\\.cpy\\.re|\n                            videos\\.tcit\\.fr|\n                            peertube\\.cpy\\.re|\n                            canard\\.tube\n                        ))/(?:videos/(?:watch|embed)|api/v\\d/videos)/\n                    )\n                    (?P<id>[\\da-fA-F]{8}-[\\da-fA-F]{4}-[\\da-fA-F]{4}-[\\da-fA-F]{4}-[\\da-fA-F]{12})\n                    '
+    _module = 'pycord.ext.dl.extractor.peertube'
+
+class PeopleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?people\\.com/people/videos/0,,(?P<id>\\d+),00\\.html'
+    _module = 'pycord.ext.dl.extractor.people'
+
+class PerformGroupIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.performgroup\\.com/eplayer(?:/eplayer\\.html|\\.js)#/?(?P<id>[0-9a-f]{26})\\.(?P<auth_token>[0-9a-z]{26})'
+    _module = 'pycord.ext.dl.extractor.performgroup'
+
+class PeriscopeBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.periscope'
+
+class PeriscopeIE(PeriscopeBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:periscope|pscp)\\.tv/[^/]+/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.periscope'
+    IE_NAME = 'periscope'
+
+class PeriscopeUserIE(PeriscopeBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:periscope|pscp)\\.tv/(?P<id>[^/]+)/?$'
+    _module = 'pycord.ext.dl.extractor.periscope'
+    IE_NAME = 'periscope:user'
+
+class PhilharmonieDeParisIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            live\\.philharmoniedeparis\\.fr/(?:[Cc]oncert/|embed(?:app)?/|misc/Playlist\\.ashx\\?id=)|\n                            pad\\.philharmoniedeparis\\.fr/doc/CIMU/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.philharmoniedeparis'
+
+class PhoenixIE(ZDFBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?phoenix\\.de/(?:[^/]+/)*[^/?#&]*-a-(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.phoenix'
+    IE_NAME = 'phoenix.de'
+
+class PhotobucketIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[a-z0-9]+\\.)?photobucket\\.com/.*(([\\?\\&]current=)|_)(?P<id>.*)\\.(?P<ext>(flv)|(mp4))'
+    _module = 'pycord.ext.dl.extractor.photobucket'
+
+class PicartoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www.)?picarto\\.tv/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.picarto'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if PicartoVodIE.suitable(url) else super(PicartoIE, cls).suitable(url)
+        )
+
+class PicartoVodIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www.)?picarto\\.tv/videopopout/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.picarto'
+
+class PikselIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://\n        (?:\n            (?:\n                player\\.\n                    (?:\n                        olympusattelecom|\n                        vibebyvista\n                    )|\n                (?:api|player)\\.multicastmedia|\n                (?:api-ovp|player)\\.piksel\n            )\\.com|\n            (?:\n                mz-edge\\.stream\\.co|\n                movie-s\\.nhk\\.or\n            )\\.jp|\n            vidego\\.baltimorecity\\.gov\n        )/v/(?:refid/(?P<refid>[^/]+)/prefid/)?(?P<id>[\\w-]+)'
+    _module = 'pycord.ext.dl.extractor.piksel'
+
+class PinkbikeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?pinkbike\\.com/video/|es\\.pinkbike\\.org/i/kvid/kvid-y5\\.swf\\?id=)(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.pinkbike'
+
+class PinterestBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.pinterest'
+
+class PinterestIE(PinterestBaseIE):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?pinterest\\.(?:com|fr|de|ch|jp|cl|ca|it|co\\.uk|nz|ru|com\\.au|at|pt|co\\.kr|es|com\\.mx|dk|ph|th|com\\.uy|co|nl|info|kr|ie|vn|com\\.vn|ec|mx|in|pe|co\\.at|hu|co\\.in|co\\.nz|id|com\\.ec|com\\.py|tw|be|uk|com\\.bo|com\\.pe)/pin/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.pinterest'
+
+class PinterestCollectionIE(PinterestBaseIE):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?pinterest\\.(?:com|fr|de|ch|jp|cl|ca|it|co\\.uk|nz|ru|com\\.au|at|pt|co\\.kr|es|com\\.mx|dk|ph|th|com\\.uy|co|nl|info|kr|ie|vn|com\\.vn|ec|mx|in|pe|co\\.at|hu|co\\.in|co\\.nz|id|com\\.ec|com\\.py|tw|be|uk|com\\.bo|com\\.pe)/(?P<username>[^/]+)/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.pinterest'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if PinterestIE.suitable(url)
+            else super(PinterestCollectionIE, cls).suitable(url)
+        )
+
+class PladformIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:\n                                out\\.pladform\\.ru/player|\n                                static\\.pladform\\.ru/player\\.swf\n                            )\n                            \\?.*\\bvideoid=|\n                            video\\.pladform\\.ru/catalog/video/videoid/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.pladform'
+
+class PlatziBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.platzi'
+
+class PlatziIE(PlatziBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            platzi\\.com/clases|           # es version\n                            courses\\.platzi\\.com/classes  # en version\n                        )/[^/]+/(?P<id>\\d+)-[^/?\\#&]+\n                    '
+    _module = 'pycord.ext.dl.extractor.platzi'
+
+class PlatziCourseIE(PlatziBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            platzi\\.com/clases|           # es version\n                            courses\\.platzi\\.com/classes  # en version\n                        )/(?P<id>[^/?\\#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.platzi'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if PlatziIE.suitable(url)
+            else super(PlatziCourseIE, cls).suitable(url)
+        )
+
+class PlayFMIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?play\\.fm/(?P<slug>(?:[^/]+/)+(?P<id>[^/]+))/?(?:$|[?#])'
+    _module = 'pycord.ext.dl.extractor.playfm'
+    IE_NAME = 'play.fm'
+
+class PlayPlusTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?playplus\\.(?:com|tv)/VOD/(?P<project_id>[0-9]+)/(?P<id>[0-9a-f]{32})'
+    _module = 'pycord.ext.dl.extractor.playplustv'
+
+class PlaysTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?plays\\.tv/(?:video|embeds)/(?P<id>[0-9a-f]{18})'
+    _module = 'pycord.ext.dl.extractor.plays'
+
+class PlayStuffIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?play\\.stuff\\.co\\.nz/details/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.playstuff'
+
+class PlaytvakIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?(?:playtvak|idnes|lidovky|metro)\\.cz/.*\\?(?:c|idvideo)=(?P<id>[^&]+)'
+    _module = 'pycord.ext.dl.extractor.playtvak'
+
+class PlayvidIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?playvid\\.com/watch(\\?v=|/)(?P<id>.+?)(?:#|$)'
+    _module = 'pycord.ext.dl.extractor.playvid'
+
+class PlaywireIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:config|cdn)\\.playwire\\.com(?:/v2)?/(?P<publisher_id>\\d+)/(?:videos/v2|embed|config)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.playwire'
+
+class PluralsightBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.pluralsight'
+
+class PluralsightIE(PluralsightBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|app)\\.)?pluralsight\\.com/(?:training/)?player\\?'
+    _module = 'pycord.ext.dl.extractor.pluralsight'
+    IE_NAME = 'pluralsight'
+
+class PluralsightCourseIE(PluralsightBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|app)\\.)?pluralsight\\.com/(?:library/)?courses/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.pluralsight'
+    IE_NAME = 'pluralsight:course'
+
+class PodomaticIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?P<proto>https?)://\n                        (?:\n                            (?P<channel>[^.]+)\\.podomatic\\.com/entry|\n                            (?:www\\.)?podomatic\\.com/podcasts/(?P<channel_2>[^/]+)/episodes\n                        )/\n                        (?P<id>[^/?#&]+)\n                '
+    _module = 'pycord.ext.dl.extractor.podomatic'
+    IE_NAME = 'podomatic'
+
+class PokemonIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pokemon\\.com/[a-z]{2}(?:.*?play=(?P<id>[a-z0-9]{32})|/(?:[^/]+/)+(?P<display_id>[^/?#&]+))'
+    _module = 'pycord.ext.dl.extractor.pokemon'
+
+class PolskieRadioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?polskieradio\\.pl/\\d+/\\d+/Artykul/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.polskieradio'
+
+class PolskieRadioCategoryIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?polskieradio\\.pl/\\d+(?:,[^/]+)?/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.polskieradio'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if PolskieRadioIE.suitable(url)
+            else super(PolskieRadioCategoryIE, cls).suitable(url)
+        )
+
+class PopcorntimesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://popcorntimes\\.tv/[^/]+/m/(?P<id>[^/]+)/(?P<display_id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.popcorntimes'
+
+class PopcornTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^/]+\\.popcorntv\\.it/guarda/(?P<display_id>[^/]+)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.popcorntv'
+
+class Porn91IE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://)(?:www\\.|)91porn\\.com/.+?\\?viewkey=(?P<id>[\\w\\d]+)'
+    _module = 'pycord.ext.dl.extractor.porn91'
+    IE_NAME = '91porn'
+
+class PornComIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[a-zA-Z]+\\.)?porn\\.com/videos/(?:(?P<display_id>[^/]+)-)?(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.porncom'
+
+class PornHdIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pornhd\\.com/(?:[a-z]{2,4}/)?videos/(?P<id>\\d+)(?:/(?P<display_id>.+))?'
+    _module = 'pycord.ext.dl.extractor.pornhd'
+
+class PornHubBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.pornhub'
+
+class PornHubIE(PornHubBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:[^/]+\\.)?\n                            (?:(?P<host>pornhub(?:premium)?\\.(?:com|net|org))|pornhubthbh7ap3u\\.onion)\n                            /(?:(?:view_video\\.php|video/show)\\?viewkey=|embed/)|\n                            (?:www\\.)?thumbzilla\\.com/video/\n                        )\n                        (?P<id>[\\da-z]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.pornhub'
+
+class PornHubPlaylistBaseIE(PornHubBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.pornhub'
+
+class PornHubUserIE(PornHubPlaylistBaseIE):
+    _VALID_URL = '(?P<url>https?://(?:[^/]+\\.)?(?:(?P<host>pornhub(?:premium)?\\.(?:com|net|org))|pornhubthbh7ap3u\\.onion)/(?:(?:user|channel)s|model|pornstar)/(?P<id>[^/?#&]+))(?:[?#&]|/(?!videos)|$)'
+    _module = 'pycord.ext.dl.extractor.pornhub'
+
+class PornHubPagedPlaylistBaseIE(PornHubPlaylistBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.pornhub'
+
+class PornHubPagedVideoListIE(PornHubPagedPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?(?:(?P<host>pornhub(?:premium)?\\.(?:com|net|org))|pornhubthbh7ap3u\\.onion)/(?P<id>(?:[^/]+/)*[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.pornhub'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if PornHubIE.suitable(url)
+            or PornHubUserIE.suitable(url)
+            or PornHubUserVideosUploadIE.suitable(url)
+            else super(PornHubPagedVideoListIE, cls).suitable(url)
+        )
+
+class PornHubUserVideosUploadIE(PornHubPagedPlaylistBaseIE):
+    _VALID_URL = '(?P<url>https?://(?:[^/]+\\.)?(?:(?P<host>pornhub(?:premium)?\\.(?:com|net|org))|pornhubthbh7ap3u\\.onion)/(?:(?:user|channel)s|model|pornstar)/(?P<id>[^/]+)/videos/upload)'
+    _module = 'pycord.ext.dl.extractor.pornhub'
+
+class PornotubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:\\w+\\.)?pornotube\\.com/(?:[^?#]*?)/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.pornotube'
+
+class PornoVoisinesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pornovoisines\\.com/videos/show/(?P<id>\\d+)/(?P<display_id>[^/.]+)'
+    _module = 'pycord.ext.dl.extractor.pornovoisines'
+
+class PornoXOIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pornoxo\\.com/videos/(?P<id>\\d+)/(?P<display_id>[^/]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.pornoxo'
+
+class PuhuTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?puhutv\\.com/(?P<id>[^/?#&]+)-izle'
+    _module = 'pycord.ext.dl.extractor.puhutv'
+    IE_NAME = 'puhutv'
+
+class PuhuTVSerieIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?puhutv\\.com/(?P<id>[^/?#&]+)-detay'
+    _module = 'pycord.ext.dl.extractor.puhutv'
+    IE_NAME = 'puhutv:serie'
+
+class PressTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?presstv\\.ir/[^/]+/(?P<y>\\d+)/(?P<m>\\d+)/(?P<d>\\d+)/(?P<id>\\d+)/(?P<display_id>[^/]+)?'
+    _module = 'pycord.ext.dl.extractor.presstv'
+
+class ProSiebenSat1BaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.prosiebensat1'
+
+class ProSiebenSat1IE(ProSiebenSat1BaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?:\n                            (?:beta\\.)?\n                            (?:\n                                prosieben(?:maxx)?|sixx|sat1(?:gold)?|kabeleins(?:doku)?|the-voice-of-germany|advopedia\n                            )\\.(?:de|at|ch)|\n                            ran\\.de|fem\\.com|advopedia\\.de|galileo\\.tv/video\n                        )\n                        /(?P<id>.+)\n                    '
+    _module = 'pycord.ext.dl.extractor.prosiebensat1'
+    IE_NAME = 'prosiebensat1'
+
+class Puls4IE(ProSiebenSat1BaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?puls4\\.com/(?P<id>[^?#&]+)'
+    _module = 'pycord.ext.dl.extractor.puls4'
+
+class PyvideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?pyvideo\\.org/(?P<category>[^/]+)/(?P<id>[^/?#&.]+)'
+    _module = 'pycord.ext.dl.extractor.pyvideo'
+
+class QQMusicIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/song/(?P<id>[0-9A-Za-z]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic'
+
+class QQPlaylistBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.qqmusic'
+
+class QQMusicSingerIE(QQPlaylistBaseIE):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/singer/(?P<id>[0-9A-Za-z]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic:singer'
+
+class QQMusicAlbumIE(QQPlaylistBaseIE):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/album/(?P<id>[0-9A-Za-z]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic:album'
+
+class QQMusicToplistIE(QQPlaylistBaseIE):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/toplist/(?P<id>[0-9]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic:toplist'
+
+class QQMusicPlaylistIE(QQPlaylistBaseIE):
+    _VALID_URL = 'https?://y\\.qq\\.com/n/yqq/playlist/(?P<id>[0-9]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.qqmusic'
+    IE_NAME = 'qqmusic:playlist'
+
+class R7IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        https?://\n                        (?:\n                            (?:[a-zA-Z]+)\\.r7\\.com(?:/[^/]+)+/idmedia/|\n                            noticias\\.r7\\.com(?:/[^/]+)+/[^/]+-|\n                            player\\.r7\\.com/video/i/\n                        )\n                        (?P<id>[\\da-f]{24})\n                    '
+    _module = 'pycord.ext.dl.extractor.r7'
+
+class R7ArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[a-zA-Z]+)\\.r7\\.com/(?:[^/]+/)+[^/?#&]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.r7'
+
+    @classmethod
+    def suitable(cls, url):
+        return False if R7IE.suitable(url) else super(R7ArticleIE, cls).suitable(url)
+
+class RadioCanadaIE(LazyLoadExtractor):
+    _VALID_URL = '(?:radiocanada:|https?://ici\\.radio-canada\\.ca/widgets/mediaconsole/)(?P<app_code>[^:/]+)[:/](?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.radiocanada'
+    IE_NAME = 'radiocanada'
+
+class RadioCanadaAudioVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://ici\\.radio-canada\\.ca/([^/]+/)*media-(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.radiocanada'
+    IE_NAME = 'radiocanada:audiovideo'
+
+class RadioDeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<id>.+?)\\.(?:radio\\.(?:de|at|fr|pt|es|pl|it)|rad\\.io)'
+    _module = 'pycord.ext.dl.extractor.radiode'
+    IE_NAME = 'radio.de'
+
+class RadioJavanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?radiojavan\\.com/videos/video/(?P<id>[^/]+)/?'
+    _module = 'pycord.ext.dl.extractor.radiojavan'
+
+class RadioBremenIE(LazyLoadExtractor):
+    _VALID_URL = 'http?://(?:www\\.)?radiobremen\\.de/mediathek/(?:index\\.html)?\\?id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.radiobremen'
+    IE_NAME = 'radiobremen'
+
+class RadioFranceIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://maison\\.radiofrance\\.fr/radiovisions/(?P<id>[^?#]+)'
+    _module = 'pycord.ext.dl.extractor.radiofrance'
+    IE_NAME = 'radiofrance'
+
+class RaiBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.rai'
+
+class RaiPlayIE(RaiBaseIE):
+    _VALID_URL = '(?P<base>https?://(?:www\\.)?raiplay\\.it/.+?-(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12}))\\.(?:html|json)'
+    _module = 'pycord.ext.dl.extractor.rai'
+
+class RaiPlayLiveIE(RaiPlayIE):
+    _VALID_URL = '(?P<base>https?://(?:www\\.)?raiplay\\.it/dirette/(?P<id>[^/?#&]+))'
+    _module = 'pycord.ext.dl.extractor.rai'
+
+class RaiPlayPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<base>https?://(?:www\\.)?raiplay\\.it/programmi/(?P<id>[^/?#&]+))'
+    _module = 'pycord.ext.dl.extractor.rai'
+
+class RaiIE(RaiBaseIE):
+    _VALID_URL = 'https?://[^/]+\\.(?:rai\\.(?:it|tv)|rainews\\.it)/.+?-(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})(?:-.+?)?\\.html'
+    _module = 'pycord.ext.dl.extractor.rai'
+
+class RayWenderlichIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            videos\\.raywenderlich\\.com/courses|\n                            (?:www\\.)?raywenderlich\\.com\n                        )/\n                        (?P<course_id>[^/]+)/lessons/(?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.raywenderlich'
+
+class RayWenderlichCourseIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            videos\\.raywenderlich\\.com/courses|\n                            (?:www\\.)?raywenderlich\\.com\n                        )/\n                        (?P<id>[^/]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.raywenderlich'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if RayWenderlichIE.suitable(url)
+            else super(RayWenderlichCourseIE, cls).suitable(url)
+        )
+
+class RBMARadioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:rbmaradio|redbullradio)\\.com/shows/(?P<show_id>[^/]+)/episodes/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.rbmaradio'
+
+class RDSIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rds\\.ca/vid(?:[eé]|%C3%A9)os/(?:[^/]+/)*(?P<id>[^/]+)-\\d+\\.\\d+'
+    _module = 'pycord.ext.dl.extractor.rds'
+
+class RedBullTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?redbull(?:\\.tv|\\.com(?:/[^/]+)?(?:/tv)?)(?:/events/[^/]+)?/(?:videos?|live|(?:film|episode)s)/(?P<id>AP-\\w+)'
+    _module = 'pycord.ext.dl.extractor.redbulltv'
+
+class RedBullEmbedIE(RedBullTVIE):
+    _VALID_URL = 'https?://(?:www\\.)?redbull\\.com/embed/(?P<id>rrn:content:[^:]+:[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12}:[a-z]{2}-[A-Z]{2,3})'
+    _module = 'pycord.ext.dl.extractor.redbulltv'
+
+class RedBullTVRrnContentIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?redbull\\.com/(?P<region>[a-z]{2,3})-(?P<lang>[a-z]{2})/tv/(?:video|live|film)/(?P<id>rrn:content:[^:]+:[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.redbulltv'
+
+class RedBullIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?redbull\\.com/(?P<region>[a-z]{2,3})-(?P<lang>[a-z]{2})/(?P<type>(?:episode|film|(?:(?:recap|trailer)-)?video)s|live)/(?!AP-|rrn:content:)(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.redbulltv'
+
+class RedditIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v\\.redd\\.it/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.reddit'
+
+class RedditRIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<url>https?://(?:[^/]+\\.)?reddit\\.com/r/[^/]+/comments/(?P<id>[^/?#&]+))'
+    _module = 'pycord.ext.dl.extractor.reddit'
+
+class RedTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:\\w+\\.)?redtube\\.com/|embed\\.redtube\\.com/\\?.*?\\bid=)(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.redtube'
+
+class RegioTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?regio-tv\\.de/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.regiotv'
+
+class RENTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?:rentv:|https?://(?:www\\.)?ren\\.tv/(?:player|video/epizod)/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rentv'
+
+class RENTVArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ren\\.tv/novosti/\\d{4}-\\d{2}-\\d{2}/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.rentv'
+
+class RestudyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|portal)\\.)?restudy\\.dk/video/[^/]+/id/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.restudy'
+
+class ReutersIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?reuters\\.com/.*?\\?.*?videoId=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.reuters'
+
+class ReverbNationIE(LazyLoadExtractor):
+    _VALID_URL = '^https?://(?:www\\.)?reverbnation\\.com/.*?/song/(?P<id>\\d+).*?$'
+    _module = 'pycord.ext.dl.extractor.reverbnation'
+
+class RICEIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://mediahub\\.rice\\.edu/app/[Pp]ortal/video\\.aspx\\?(?P<query>.+)'
+    _module = 'pycord.ext.dl.extractor.rice'
+
+class RMCDecouverteIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://rmcdecouverte\\.bfmtv\\.com/(?:(?:[^/]+/)*program_(?P<id>\\d+)|(?P<live_id>mediaplayer-direct))'
+    _module = 'pycord.ext.dl.extractor.rmcdecouverte'
+
+class Ro220IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)(?:https?://)?(?:www\\.)?220\\.ro/(?P<category>[^/]+)/(?P<shorttitle>[^/]+)/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.ro220'
+    IE_NAME = '220.ro'
+
+class RockstarGamesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rockstargames\\.com/videos(?:/video/|#?/?\\?.*\\bvideo=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rockstargames'
+
+class RoosterTeethIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?roosterteeth\\.com/(?:episode|watch)/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.roosterteeth'
+
+class RottenTomatoesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rottentomatoes\\.com/m/[^/]+/trailers/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rottentomatoes'
+
+class RoxwelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?roxwel\\.com/player/(?P<filename>.+?)(\\.|\\?|$)'
+    _module = 'pycord.ext.dl.extractor.roxwel'
+
+class RozhlasIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?prehravac\\.rozhlas\\.cz/audio/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.rozhlas'
+
+class RTBFIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?:www\\.)?rtbf\\.be/\n        (?:\n            video/[^?]+\\?.*\\bid=|\n            ouftivi/(?:[^/]+/)*[^?]+\\?.*\\bvideoId=|\n            auvio/[^/]+\\?.*\\b(?P<live>l)?id=\n        )(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rtbf'
+
+class RteBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.rte'
+
+class RteIE(RteBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?rte\\.ie/player/[^/]{2,3}/show/[^/]+/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.rte'
+    IE_NAME = 'rte'
+
+class RteRadioIE(RteBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?rte\\.ie/radio/utils/radioplayer/rteradioweb\\.html#!rii=(?:b?[0-9]*)(?:%3A|:|%5F|_)(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.rte'
+    IE_NAME = 'rte:radio'
+
+class RtlNlIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?:(?:www|static)\\.)?\n        (?:\n            rtlxl\\.nl/(?:[^\\#]*\\#!|programma)/[^/]+/|\n            rtl\\.nl/(?:(?:system/videoplayer/(?:[^/]+/)+(?:video_)?embed\\.html|embed)\\b.+?\\buuid=|video/)|\n            embed\\.rtl\\.nl/\\#uuid=\n        )\n        (?P<id>[0-9a-f-]+)'
+    _module = 'pycord.ext.dl.extractor.rtlnl'
+    IE_NAME = 'rtl.nl'
+
+class RTL2IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtl2\\.de/sendung/[^/]+/(?:video/(?P<vico_id>\\d+)[^/]+/(?P<vivi_id>\\d+)-|folge/)(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.rtl2'
+    IE_NAME = 'rtl2'
+
+class RTL2YouBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.rtl2'
+
+class RTL2YouIE(RTL2YouBaseIE):
+    _VALID_URL = 'http?://you\\.rtl2\\.de/(?:video/\\d+/|youplayer/index\\.html\\?.*?\\bvid=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rtl2'
+    IE_NAME = 'rtl2:you'
+
+class RTL2YouSeriesIE(RTL2YouBaseIE):
+    _VALID_URL = 'http?://you\\.rtl2\\.de/videos/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rtl2'
+    IE_NAME = 'rtl2:you:series'
+
+class RTPIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtp\\.pt/play/p(?P<program_id>[0-9]+)/(?P<id>[^/?#]+)/?'
+    _module = 'pycord.ext.dl.extractor.rtp'
+
+class SRGSSRIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        https?://tp\\.srgssr\\.ch/p(?:/[^/]+)+\\?urn=urn|\n                        srgssr\n                    ):\n                    (?P<bu>\n                        srf|rts|rsi|rtr|swi\n                    ):(?:[^:]+:)?\n                    (?P<type>\n                        video|audio\n                    ):\n                    (?P<id>\n                        [0-9a-f\\-]{36}|\\d+\n                    )\n                    '
+    _module = 'pycord.ext.dl.extractor.srgssr'
+
+class RTSIE(SRGSSRIE):
+    _VALID_URL = 'rts:(?P<rts_id>\\d+)|https?://(?:.+?\\.)?rts\\.ch/(?:[^/]+/){2,}(?P<id>[0-9]+)-(?P<display_id>.+?)\\.html'
+    _module = 'pycord.ext.dl.extractor.rts'
+
+class RTVEALaCartaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtve\\.es/(m/)?(alacarta/videos|filmoteca)/[^/]+/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rtve'
+    IE_NAME = 'rtve.es:alacarta'
+
+class RTVELiveIE(RTVEALaCartaIE):
+    _VALID_URL = 'https?://(?:www\\.)?rtve\\.es/directo/(?P<id>[a-zA-Z0-9-]+)'
+    _module = 'pycord.ext.dl.extractor.rtve'
+    IE_NAME = 'rtve.es:live'
+
+class RTVEInfantilIE(RTVEALaCartaIE):
+    _VALID_URL = 'https?://(?:www\\.)?rtve\\.es/infantil/serie/[^/]+/video/[^/]+/(?P<id>[0-9]+)/'
+    _module = 'pycord.ext.dl.extractor.rtve'
+    IE_NAME = 'rtve.es:infantil'
+
+class RTVETelevisionIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtve\\.es/television/[^/]+/[^/]+/(?P<id>\\d+).shtml'
+    _module = 'pycord.ext.dl.extractor.rtve'
+    IE_NAME = 'rtve.es:television'
+
+class RTVNHIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtvnh\\.nl/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.rtvnh'
+
+class RTVSIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rtvs\\.sk/(?:radio|televizia)/archiv/\\d+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rtvs'
+
+class RUHDIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ruhd\\.ru/play\\.php\\?vid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.ruhd'
+
+class RumbleEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?rumble\\.com/embed/(?:[0-9a-z]+\\.)?(?P<id>[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.rumble'
+
+class RutubeBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.rutube'
+
+class RutubeIE(RutubeBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/(?:video|(?:play/)?embed)/(?P<id>[\\da-z]{32})'
+    _module = 'pycord.ext.dl.extractor.rutube'
+    IE_NAME = 'rutube'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if RutubePlaylistIE.suitable(url)
+            else super(RutubeIE, cls).suitable(url)
+        )
+
+class RutubePlaylistBaseIE(RutubeBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.rutube'
+
+class RutubeChannelIE(RutubePlaylistBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/tags/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rutube'
+    IE_NAME = 'rutube:channel'
+
+class RutubeEmbedIE(RutubeBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/(?:video|play)/embed/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.rutube'
+    IE_NAME = 'rutube:embed'
+
+class RutubeMovieIE(RutubePlaylistBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/metainfo/tv/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rutube'
+    IE_NAME = 'rutube:movie'
+
+class RutubePersonIE(RutubePlaylistBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/video/person/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rutube'
+    IE_NAME = 'rutube:person'
+
+class RutubePlaylistIE(RutubePlaylistBaseIE):
+    _VALID_URL = 'https?://rutube\\.ru/(?:video|(?:play/)?embed)/[\\da-z]{32}/\\?.*?\\bpl_id=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.rutube'
+    IE_NAME = 'rutube:playlist'
+
+    @classmethod
+    def suitable(cls, url):
+        if not super(RutubePlaylistIE, cls).suitable(url):
+            return False
+        params = compat_parse_qs(compat_urllib_parse_urlparse(url).query)
+        return params.get("pl_type", [None])[0] and int_or_none(
+            params.get("pl_id", [None])[0]
+        )
+
+class RUTVIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:test)?player\\.(?:rutv\\.ru|vgtrk\\.com)/\n                        (?P<path>\n                            flash\\d+v/container\\.swf\\?id=|\n                            iframe/(?P<type>swf|video|live)/id/|\n                            index/iframe/cast_id/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.rutv'
+
+class RuutuIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?(?:ruutu|supla)\\.fi/(?:video|supla|audio)/|\n                            static\\.nelonenmedia\\.fi/player/misc/embed_player\\.html\\?.*?\\bnid=\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.ruutu'
+
+class RuvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ruv\\.is/(?:sarpurinn/[^/]+|node)/(?P<id>[^/]+(?:/\\d+)?)'
+    _module = 'pycord.ext.dl.extractor.ruv'
+
+class SafariBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.safari'
+
+class SafariIE(SafariBaseIE):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:www\\.)?(?:safaribooksonline|(?:learning\\.)?oreilly)\\.com/\n                            (?:\n                                library/view/[^/]+/(?P<course_id>[^/]+)/(?P<part>[^/?\\#&]+)\\.html|\n                                videos/[^/]+/[^/]+/(?P<reference_id>[^-]+-[^/?\\#&]+)\n                            )\n                    '
+    _module = 'pycord.ext.dl.extractor.safari'
+    IE_NAME = 'safari'
+
+class SafariApiIE(SafariBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:safaribooksonline|(?:learning\\.)?oreilly)\\.com/api/v1/book/(?P<course_id>[^/]+)/chapter(?:-content)?/(?P<part>[^/?#&]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.safari'
+    IE_NAME = 'safari:api'
+
+class SafariCourseIE(SafariBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?(?:safaribooksonline|(?:learning\\.)?oreilly)\\.com/\n                            (?:\n                                library/view/[^/]+|\n                                api/v1/book|\n                                videos/[^/]+\n                            )|\n                            techbus\\.safaribooksonline\\.com\n                        )\n                        /(?P<id>[^/]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.safari'
+    IE_NAME = 'safari:course'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if SafariIE.suitable(url) or SafariApiIE.suitable(url)
+            else super(SafariCourseIE, cls).suitable(url)
+        )
+
+class SampleFocusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?samplefocus\\.com/samples/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.samplefocus'
+
+class SapoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:v2|www)\\.)?videos\\.sapo\\.(?:pt|cv|ao|mz|tl)/(?P<id>[\\da-zA-Z]{20})'
+    _module = 'pycord.ext.dl.extractor.sapo'
+
+class SaveFromIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^.]+\\.savefrom\\.net/\\#url=(?P<url>.*)$'
+    _module = 'pycord.ext.dl.extractor.savefrom'
+    IE_NAME = 'savefrom.net'
+
+class SBSIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?sbs\\.com\\.au/(?:ondemand(?:/video/(?:single/)?|.*?\\bplay=|/watch/)|news/(?:embeds/)?video/)(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.sbs'
+
+class ScreencastIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?screencast\\.com/t/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.screencast'
+
+class ScreencastOMaticIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://screencast-o-matic\\.com/(?:(?:watch|player)/|embed\\?.*?\\bsc=)(?P<id>[0-9a-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.screencastomatic'
+
+class AWSIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.aws'
+
+class ScrippsNetworksWatchIE(AWSIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        watch\\.\n                        (?P<site>geniuskitchen)\\.com/\n                        (?:\n                            player\\.[A-Z0-9]+\\.html\\#|\n                            show/(?:[^/]+/){2}|\n                            player/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.scrippsnetworks'
+    IE_NAME = 'scrippsnetworks:watch'
+
+class ScrippsNetworksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>cookingchanneltv|discovery|(?:diy|food)network|hgtv|travelchannel)\\.com/videos/[0-9a-z-]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.scrippsnetworks'
+
+class SCTEBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.scte'
+
+class SCTEIE(SCTEBaseIE):
+    _VALID_URL = 'https?://learning\\.scte\\.org/mod/scorm/view\\.php?.*?\\bid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.scte'
+
+class SCTECourseIE(SCTEBaseIE):
+    _VALID_URL = 'https?://learning\\.scte\\.org/(?:mod/sub)?course/view\\.php?.*?\\bid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.scte'
+
+class SeekerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?seeker\\.com/(?P<display_id>.*)-(?P<article_id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.seeker'
+
+class SenateISVPIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?senate\\.gov/isvp/?\\?(?P<qs>.+)'
+    _module = 'pycord.ext.dl.extractor.senateisvp'
+
+class SendtoNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://embed\\.sendtonews\\.com/player2/embedplayer\\.php\\?.*\\bSC=(?P<id>[0-9A-Za-z-]+)'
+    _module = 'pycord.ext.dl.extractor.sendtonews'
+
+class ServusIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?:\n                            servus\\.com/(?:(?:at|de)/p/[^/]+|tv/videos)|\n                            (?:servustv|pm-wissen)\\.com/videos\n                        )\n                        /(?P<id>[aA]{2}-\\w+|\\d+-\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.servus'
+
+class SevenPlusIE(BrightcoveNewIE):
+    _VALID_URL = 'https?://(?:www\\.)?7plus\\.com\\.au/(?P<path>[^?]+\\?.*?\\bepisode-id=(?P<id>[^&#]+))'
+    _module = 'pycord.ext.dl.extractor.sevenplus'
+    IE_NAME = '7plus'
+
+class SexuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?sexu\\.com/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.sexu'
+
+class SeznamZpravyIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?seznamzpravy\\.cz/iframe/player\\?.*\\bsrc='
+    _module = 'pycord.ext.dl.extractor.seznamzpravy'
+
+class SeznamZpravyArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:seznam\\.cz/zpravy|seznamzpravy\\.cz)/clanek/(?:[^/?#&]+)-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.seznamzpravy'
+
+class ShahidBaseIE(AWSIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.shahid'
+
+class ShahidIE(ShahidBaseIE):
+    _VALID_URL = 'https?://shahid\\.mbc\\.net/[a-z]{2}/(?:serie|show|movie)s/[^/]+/(?P<type>episode|clip|movie)-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.shahid'
+
+class ShahidShowIE(ShahidBaseIE):
+    _VALID_URL = 'https?://shahid\\.mbc\\.net/[a-z]{2}/(?:show|serie)s/[^/]+/(?:show|series)-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.shahid'
+
+class SharedBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.shared'
+
+class SharedIE(SharedBaseIE):
+    _VALID_URL = 'https?://shared\\.sx/(?P<id>[\\da-z]{10})'
+    _module = 'pycord.ext.dl.extractor.shared'
+
+class VivoIE(SharedBaseIE):
+    _VALID_URL = 'https?://vivo\\.s[xt]/(?P<id>[\\da-z]{10})'
+    _module = 'pycord.ext.dl.extractor.shared'
+
+class ShowRoomLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?showroom-live\\.com/(?!onlive|timetable|event|campaign|news|ranking|room)(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.showroomlive'
+
+class SimplecastBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.simplecast'
+
+class SimplecastIE(SimplecastBaseIE):
+    _VALID_URL = 'https?://(?:api\\.simplecast\\.com/episodes|player\\.simplecast\\.com)/(?P<id>[\\da-f]{8}-(?:[\\da-f]{4}-){3}[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.simplecast'
+    IE_NAME = 'simplecast'
+
+class SimplecastEpisodeIE(SimplecastBaseIE):
+    _VALID_URL = 'https?://(?!api\\.)[^/]+\\.simplecast\\.com/episodes/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.simplecast'
+    IE_NAME = 'simplecast:episode'
+
+class SimplecastPodcastIE(SimplecastBaseIE):
+    _VALID_URL = 'https?://(?!(?:api|cdn|embed|feeds|player)\\.)(?P<id>[^/]+)\\.simplecast\\.com(?!/episodes/[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.simplecast'
+    IE_NAME = 'simplecast:podcast'
+
+class SinaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:.*?\\.)?video\\.sina\\.com\\.cn/\n                        (?:\n                            (?:view/|.*\\#)(?P<video_id>\\d+)|\n                            .+?/(?P<pseudo_id>[^/?#]+)(?:\\.s?html)|\n                            # This is used by external sites like Weibo\n                            api/sinawebApi/outplay.php/(?P<token>.+?)\\.swf\n                        )\n                  '
+    _module = 'pycord.ext.dl.extractor.sina'
+
+class SixPlayIE(LazyLoadExtractor):
+    _VALID_URL = '(?:6play:|https?://(?:www\\.)?(?P<domain>6play\\.fr|rtlplay\\.be|play\\.rtl\\.hr|rtlmost\\.hu)/.+?-c_)(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.sixplay'
+    IE_NAME = '6play'
+
+class SkyItPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.sky\\.it/player/(?:external|social)\\.html\\?.*?\\bid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.skyit'
+    IE_NAME = 'player.sky.it'
+
+class SkyItVideoIE(SkyItPlayerIE):
+    _VALID_URL = 'https?://(?:masterchef|video|xfactor)\\.sky\\.it(?:/[^/]+)*/video/[0-9a-z-]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.skyit'
+    IE_NAME = 'video.sky.it'
+
+class SkyItVideoLiveIE(SkyItPlayerIE):
+    _VALID_URL = 'https?://video\\.sky\\.it/diretta/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.skyit'
+    IE_NAME = 'video.sky.it:live'
+
+class SkyItIE(SkyItPlayerIE):
+    _VALID_URL = 'https?://(?:sport|tg24)\\.sky\\.it(?:/[^/]+)*/\\d{4}/\\d{2}/\\d{2}/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.skyit'
+    IE_NAME = 'sky.it'
+
+class SkyItAcademyIE(SkyItIE):
+    _VALID_URL = 'https?://(?:www\\.)?skyacademy\\.it(?:/[^/]+)*/\\d{4}/\\d{2}/\\d{2}/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.skyit'
+    IE_NAME = 'skyacademy.it'
+
+class SkyItArteIE(SkyItIE):
+    _VALID_URL = 'https?://arte\\.sky\\.it/video/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.skyit'
+    IE_NAME = 'arte.sky.it'
+
+class CieloTVItIE(SkyItIE):
+    _VALID_URL = 'https?://(?:www\\.)?cielotv\\.it/video/(?P<id>[^.]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.skyit'
+    IE_NAME = 'cielotv.it'
+
+class TV8ItIE(SkyItVideoIE):
+    _VALID_URL = 'https?://tv8\\.it/showvideo/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.skyit'
+    IE_NAME = 'tv8.it'
+
+class SkylineWebcamsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?skylinewebcams\\.com/[^/]+/webcam/(?:[^/]+/)+(?P<id>[^/]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.skylinewebcams'
+
+class SkyNewsArabiaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.skynewsarabia'
+
+class SkyNewsArabiaIE(SkyNewsArabiaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?skynewsarabia\\.com/web/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.skynewsarabia'
+    IE_NAME = 'skynewsarabia:video'
+
+class SkyNewsArabiaArticleIE(SkyNewsArabiaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?skynewsarabia\\.com/web/article/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.skynewsarabia'
+    IE_NAME = 'skynewsarabia:article'
+
+class SkyBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.sky'
+
+class SkyNewsIE(SkyBaseIE):
+    _VALID_URL = 'https?://news\\.sky\\.com/video/[0-9a-z-]+-(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.sky'
+    IE_NAME = 'sky:news'
+
+class SkySportsIE(SkyBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?skysports\\.com/watch/video/([^/]+/)*(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.sky'
+    IE_NAME = 'sky:sports'
+
+class SkySportsNewsIE(SkyBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?skysports\\.com/([^/]+/)*news/\\d+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.sky'
+    IE_NAME = 'sky:sports:news'
+
+class SlideshareIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?slideshare\\.net/[^/]+?/(?P<title>.+?)($|\\?)'
+    _module = 'pycord.ext.dl.extractor.slideshare'
+
+class SlidesLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://slideslive\\.com/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.slideslive'
+
+class SlutloadIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:\\w+\\.)?slutload\\.com/(?:video/[^/]+|embed_player|watch)/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.slutload'
+
+class SnotrIE(LazyLoadExtractor):
+    _VALID_URL = 'http?://(?:www\\.)?snotr\\.com/video/(?P<id>\\d+)/([\\w]+)'
+    _module = 'pycord.ext.dl.extractor.snotr'
+
+class SohuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<mytv>my\\.)?tv\\.sohu\\.com/.+?/(?(mytv)|n)(?P<id>\\d+)\\.shtml.*?'
+    _module = 'pycord.ext.dl.extractor.sohu'
+
+class SonyLIVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?sonyliv\\.com/(?:s(?:how|port)s/[^/]+|movies|clip|trailer|music-videos)/[^/?#&]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.sonyliv'
+
+class SoundcloudEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:w|player|p)\\.soundcloud\\.com/player/?.*?\\burl=(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+
+class SoundcloudIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)^(?:https?://)?\n                    (?:(?:(?:www\\.|m\\.)?soundcloud\\.com/\n                            (?!stations/track)\n                            (?P<uploader>[\\w\\d-]+)/\n                            (?!(?:tracks|albums|sets(?:/.+?)?|reposts|likes|spotlight)/?(?:$|[?#]))\n                            (?P<title>[\\w\\d-]+)/?\n                            (?P<token>[^?]+?)?(?:[?].*)?$)\n                       |(?:api(?:-v2)?\\.soundcloud\\.com/tracks/(?P<track_id>\\d+)\n                          (?:/?\\?secret_token=(?P<secret_token>[^&]+))?)\n                    )\n                    '
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud'
+
+class SoundcloudPlaylistBaseIE(SoundcloudIE):
+    _VALID_URL = '(?x)^(?:https?://)?\n                    (?:(?:(?:www\\.|m\\.)?soundcloud\\.com/\n                            (?!stations/track)\n                            (?P<uploader>[\\w\\d-]+)/\n                            (?!(?:tracks|albums|sets(?:/.+?)?|reposts|likes|spotlight)/?(?:$|[?#]))\n                            (?P<title>[\\w\\d-]+)/?\n                            (?P<token>[^?]+?)?(?:[?].*)?$)\n                       |(?:api(?:-v2)?\\.soundcloud\\.com/tracks/(?P<track_id>\\d+)\n                          (?:/?\\?secret_token=(?P<secret_token>[^&]+))?)\n                    )\n                    '
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+
+class SoundcloudSetIE(SoundcloudPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?soundcloud\\.com/(?P<uploader>[\\w\\d-]+)/sets/(?P<slug_title>[\\w\\d-]+)(?:/(?P<token>[^?/]+))?'
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:set'
+
+class SoundcloudPagedPlaylistBaseIE(SoundcloudIE):
+    _VALID_URL = '(?x)^(?:https?://)?\n                    (?:(?:(?:www\\.|m\\.)?soundcloud\\.com/\n                            (?!stations/track)\n                            (?P<uploader>[\\w\\d-]+)/\n                            (?!(?:tracks|albums|sets(?:/.+?)?|reposts|likes|spotlight)/?(?:$|[?#]))\n                            (?P<title>[\\w\\d-]+)/?\n                            (?P<token>[^?]+?)?(?:[?].*)?$)\n                       |(?:api(?:-v2)?\\.soundcloud\\.com/tracks/(?P<track_id>\\d+)\n                          (?:/?\\?secret_token=(?P<secret_token>[^&]+))?)\n                    )\n                    '
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+
+class SoundcloudUserIE(SoundcloudPagedPlaylistBaseIE):
+    _VALID_URL = '(?x)\n                        https?://\n                            (?:(?:www|m)\\.)?soundcloud\\.com/\n                            (?P<user>[^/]+)\n                            (?:/\n                                (?P<rsrc>tracks|albums|sets|reposts|likes|spotlight)\n                            )?\n                            /?(?:[?#].*)?$\n                    '
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:user'
+
+class SoundcloudTrackStationIE(SoundcloudPagedPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?soundcloud\\.com/stations/track/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:trackstation'
+
+class SoundcloudPlaylistIE(SoundcloudPlaylistBaseIE):
+    _VALID_URL = 'https?://api(?:-v2)?\\.soundcloud\\.com/playlists/(?P<id>[0-9]+)(?:/?\\?secret_token=(?P<token>[^&]+?))?$'
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:playlist'
+
+class SoundcloudSearchIE(LazyLoadSearchExtractor, SoundcloudIE):
+    _VALID_URL = '(?x)^(?:https?://)?\n                    (?:(?:(?:www\\.|m\\.)?soundcloud\\.com/\n                            (?!stations/track)\n                            (?P<uploader>[\\w\\d-]+)/\n                            (?!(?:tracks|albums|sets(?:/.+?)?|reposts|likes|spotlight)/?(?:$|[?#]))\n                            (?P<title>[\\w\\d-]+)/?\n                            (?P<token>[^?]+?)?(?:[?].*)?$)\n                       |(?:api(?:-v2)?\\.soundcloud\\.com/tracks/(?P<track_id>\\d+)\n                          (?:/?\\?secret_token=(?P<secret_token>[^&]+))?)\n                    )\n                    '
+    _module = 'pycord.ext.dl.extractor.soundcloud'
+    IE_NAME = 'soundcloud:search'
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'scsearch(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+class SoundgasmIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?soundgasm\\.net/u/(?P<user>[0-9a-zA-Z_-]+)/(?P<display_id>[0-9a-zA-Z_-]+)'
+    _module = 'pycord.ext.dl.extractor.soundgasm'
+    IE_NAME = 'soundgasm'
+
+class SoundgasmProfileIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?soundgasm\\.net/u/(?P<id>[^/]+)/?(?:\\#.*)?$'
+    _module = 'pycord.ext.dl.extractor.soundgasm'
+    IE_NAME = 'soundgasm:profile'
+
+class SouthParkIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southpark(?:\\.cc|studios)\\.com/(?:clips|(?:full-)?episodes|collections)/(?P<id>.+?)(\\?|#|$))'
+    _module = 'pycord.ext.dl.extractor.southpark'
+    IE_NAME = 'southpark.cc.com'
+
+class SouthParkDeIE(SouthParkIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southpark\\.de/(?:clips|alle-episoden|collections)/(?P<id>.+?)(\\?|#|$))'
+    _module = 'pycord.ext.dl.extractor.southpark'
+    IE_NAME = 'southpark.de'
+
+class SouthParkDkIE(SouthParkIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southparkstudios\\.(?:dk|nu)/(?:clips|full-episodes|collections)/(?P<id>.+?)(\\?|#|$))'
+    _module = 'pycord.ext.dl.extractor.southpark'
+    IE_NAME = 'southparkstudios.dk'
+
+class SouthParkEsIE(SouthParkIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southpark\\.cc\\.com/episodios-en-espanol/(?P<id>.+?)(\\?|#|$))'
+    _module = 'pycord.ext.dl.extractor.southpark'
+    IE_NAME = 'southpark.cc.com:español'
+
+class SouthParkNlIE(SouthParkIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<url>southpark\\.nl/(?:clips|(?:full-)?episodes|collections)/(?P<id>.+?)(\\?|#|$))'
+    _module = 'pycord.ext.dl.extractor.southpark'
+    IE_NAME = 'southpark.nl'
+
+class SpankBangIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:[^/]+\\.)?spankbang\\.com/\n                        (?:\n                            (?P<id>[\\da-z]+)/(?:video|play|embed)\\b|\n                            [\\da-z]+-(?P<id_2>[\\da-z]+)/playlist/[^/?#&]+\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.spankbang'
+
+class SpankBangPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?spankbang\\.com/(?P<id>[\\da-z]+)/playlist/(?P<display_id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.spankbang'
+
+class SpankwireIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?spankwire\\.com/\n                        (?:\n                            [^/]+/video|\n                            EmbedPlayer\\.aspx/?\\?.*?\\bArticleId=\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.spankwire'
+
+class SpiegelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:spiegel|manager-magazin)\\.de(?:/[^/]+)+/[^/]*-(?P<id>[0-9]+|[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})(?:-embed|-iframe)?(?:\\.html)?(?:#.*)?$'
+    _module = 'pycord.ext.dl.extractor.spiegel'
+
+class BellatorIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bellator\\.com/[^/]+/[\\da-z]{6}(?:[/?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.spike'
+
+class ParamountNetworkIE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?paramountnetwork\\.com/[^/]+/[\\da-z]{6}(?:[/?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.spike'
+
+class StitcherBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.stitcher'
+
+class StitcherIE(StitcherBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?stitcher\\.com/(?:podcast|show)/(?:[^/]+/)+e(?:pisode)?/(?:[^/#?&]+-)?(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.stitcher'
+
+class StitcherShowIE(StitcherBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?stitcher\\.com/(?:podcast|show)/(?P<id>[^/#?&]+)/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.stitcher'
+
+class Sport5IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|vod)?\\.sport5\\.co\\.il/.*\\b(?:Vi|docID)=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.sport5'
+
+class SportBoxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:news\\.sportbox|matchtv)\\.ru/vdl/player(?:/[^/]+/|\\?.*?\\bn?id=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.sportbox'
+
+class SportDeutschlandIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://sportdeutschland\\.tv/(?P<id>(?:[^/]+/)?[^?#/&]+)'
+    _module = 'pycord.ext.dl.extractor.sportdeutschland'
+
+class SpotifyBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.spotify'
+
+class SpotifyIE(SpotifyBaseIE):
+    _VALID_URL = 'https?://open\\.spotify\\.com/episode/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.spotify'
+    IE_NAME = 'spotify'
+
+class SpotifyShowIE(SpotifyBaseIE):
+    _VALID_URL = 'https?://open\\.spotify\\.com/show/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.spotify'
+    IE_NAME = 'spotify:show'
+
+class SpreakerIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        api\\.spreaker\\.com/\n                        (?:\n                            (?:download/)?episode|\n                            v2/episodes\n                        )/\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.spreaker'
+
+class SpreakerPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?spreaker\\.com/user/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.spreaker'
+
+class SpreakerShowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://api\\.spreaker\\.com/show/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.spreaker'
+
+class SpreakerShowPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?spreaker\\.com/show/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.spreaker'
+
+class SpringboardPlatformIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        cms\\.springboardplatform\\.com/\n                        (?:\n                            (?:previews|embed_iframe)/(?P<index>\\d+)/video/(?P<id>\\d+)|\n                            xml_feeds_advanced/index/(?P<index_2>\\d+)/rss3/(?P<id_2>\\d+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.springboardplatform'
+
+class SproutIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:sproutonline|universalkids)\\.com/(?:watch|(?:[^/]+/)*videos)/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.sprout'
+
+class SRGSSRPlayIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:(?:www|play)\\.)?\n                        (?P<bu>srf|rts|rsi|rtr|swissinfo)\\.ch/play/(?:tv|radio)/\n                        (?:\n                            [^/]+/(?P<type>video|audio)/[^?]+|\n                            popup(?P<type_2>video|audio)player\n                        )\n                        \\?.*?\\b(?:id=|urn=urn:[^:]+:video:)(?P<id>[0-9a-f\\-]{36}|\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.srgssr'
+
+class SRMediathekIE(ARDMediathekBaseIE):
+    _VALID_URL = 'https?://sr-mediathek(?:\\.sr-online)?\\.de/index\\.php\\?.*?&id=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.srmediathek'
+    IE_NAME = 'sr:mediathek'
+
+class StanfordOpenClassroomIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://openclassroom\\.stanford\\.edu(?P<path>/?|(/MainFolder/(?:HomePage|CoursePage|VideoPage)\\.php([?]course=(?P<course>[^&]+)(&video=(?P<video>[^&]+))?(&.*)?)?))$'
+    _module = 'pycord.ext.dl.extractor.stanfordoc'
+    IE_NAME = 'stanfordoc'
+
+class SteamIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://store\\.steampowered\\.com/\n            (agecheck/)?\n            (?P<urltype>video|app)/ #If the page is only for videos or for a game\n            (?P<gameID>\\d+)/?\n            (?P<videoID>\\d*)(?P<extra>\\??) # For urltype == video we sometimes get the videoID\n        |\n        https?://(?:www\\.)?steamcommunity\\.com/sharedfiles/filedetails/\\?id=(?P<fileID>[0-9]+)\n    '
+    _module = 'pycord.ext.dl.extractor.steam'
+
+class StoryFireBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.storyfire'
+
+class StoryFireIE(StoryFireBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?storyfire\\.com/video-details/(?P<id>[0-9a-f]{24})'
+    _module = 'pycord.ext.dl.extractor.storyfire'
+
+class StoryFireUserIE(StoryFireBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?storyfire\\.com/user/(?P<id>[^/]+)/video'
+    _module = 'pycord.ext.dl.extractor.storyfire'
+
+class StoryFireSeriesIE(StoryFireBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?storyfire\\.com/write/series/stories/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.storyfire'
+
+class StreamableIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://streamable\\.com/(?:[es]/)?(?P<id>\\w+)'
+    _module = 'pycord.ext.dl.extractor.streamable'
+
+class StreamcloudIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://streamcloud\\.eu/(?P<id>[a-zA-Z0-9_-]+)(?:/(?P<fname>[^#?]*)\\.html)?'
+    _module = 'pycord.ext.dl.extractor.streamcloud'
+    IE_NAME = 'streamcloud.eu'
+
+class StreamCZIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?stream\\.cz/.+/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.streamcz'
+
+class StreetVoiceIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?streetvoice\\.com/[^/]+/songs/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.streetvoice'
+
+class StretchInternetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://portal\\.stretchinternet\\.com/[^/]+/(?:portal|full)\\.htm\\?.*?\\beventId=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.stretchinternet'
+
+class STVPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.stv\\.tv/(?P<type>episode|video)/(?P<id>[a-z0-9]{4})'
+    _module = 'pycord.ext.dl.extractor.stv'
+    IE_NAME = 'stv:player'
+
+class SunPornoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?sunporno\\.com/videos|embeds\\.sunporno\\.com/embed)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.sunporno'
+
+class SverigesRadioBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.sverigesradio'
+
+class SverigesRadioEpisodeIE(SverigesRadioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?sverigesradio\\.se/(?:sida/)?avsnitt/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.sverigesradio'
+    IE_NAME = 'sverigesradio:episode'
+
+class SverigesRadioPublicationIE(SverigesRadioBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?sverigesradio\\.se/sida/(?:artikel|gruppsida)\\.aspx\\?.*?\\bartikel=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.sverigesradio'
+    IE_NAME = 'sverigesradio:publication'
+
+class SVTBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.svt'
+
+class SVTIE(SVTBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?svt\\.se/wd\\?(?:.*?&)?widgetId=(?P<widget_id>\\d+)&.*?\\barticleId=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.svt'
+
+class SVTPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?svt\\.se/(?P<path>(?:[^/]+/)*(?P<id>[^/?&#]+))'
+    _module = 'pycord.ext.dl.extractor.svt'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if SVTIE.suitable(url) or SVTPlayIE.suitable(url)
+            else super(SVTPageIE, cls).suitable(url)
+        )
+
+class SVTPlayBaseIE(SVTBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.svt'
+
+class SVTPlayIE(SVTPlayBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        (?:\n                            svt:|\n                            https?://(?:www\\.)?svt\\.se/barnkanalen/barnplay/[^/]+/\n                        )\n                        (?P<svt_id>[^/?#&]+)|\n                        https?://(?:www\\.)?(?:svtplay|oppetarkiv)\\.se/(?:video|klipp|kanaler)/(?P<id>[^/?#&]+)\n                        (?:.*?(?:modalId|id)=(?P<modal_id>[\\da-zA-Z-]+))?\n                    )\n                    '
+    _module = 'pycord.ext.dl.extractor.svt'
+
+class SVTSeriesIE(SVTPlayBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?svtplay\\.se/(?P<id>[^/?&#]+)(?:.+?\\btab=(?P<season_slug>[^&#]+))?'
+    _module = 'pycord.ext.dl.extractor.svt'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if SVTIE.suitable(url) or SVTPlayIE.suitable(url)
+            else super(SVTSeriesIE, cls).suitable(url)
+        )
+
+class SWRMediathekIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?swrmediathek\\.de/(?:content/)?player\\.htm\\?show=(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.swrmediathek'
+
+class SyfyIE(AdobePassIE):
+    _VALID_URL = 'https?://(?:www\\.)?syfy\\.com/(?:[^/]+/)?videos/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.syfy'
+
+class SztvHuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?sztv\\.hu|www\\.tvszombathely\\.hu)/(?:[^/]+)/.+-(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.sztvhu'
+
+class TagesschauPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tagesschau\\.de/multimedia/(?P<kind>audio|video)/(?P=kind)-(?P<id>\\d+)~player(?:_[^/?#&]+)?\\.html'
+    _module = 'pycord.ext.dl.extractor.tagesschau'
+    IE_NAME = 'tagesschau:player'
+
+class TagesschauIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tagesschau\\.de/(?P<path>[^/]+/(?:[^/]+/)*?(?P<id>[^/#?]+?(?:-?[0-9]+)?))(?:~_?[^/#?]+?)?\\.html'
+    _module = 'pycord.ext.dl.extractor.tagesschau'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TagesschauPlayerIE.suitable(url)
+            else super(TagesschauIE, cls).suitable(url)
+        )
+
+class TassIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:tass\\.ru|itar-tass\\.com)/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tass'
+
+class TBSIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>tbs|tntdrama)\\.com(?P<path>/(?:movies|shows/[^/]+/(?:clips|season-\\d+/episode-\\d+))/(?P<id>[^/?#]+))'
+    _module = 'pycord.ext.dl.extractor.tbs'
+
+class TDSLifewayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tds\\.lifeway\\.com/v1/trainingdeliverysystem/courses/(?P<id>\\d+)/index\\.html'
+    _module = 'pycord.ext.dl.extractor.tdslifeway'
+
+class TeachableBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.teachable'
+
+class TeachableIE(TeachableBaseIE):
+    _VALID_URL = '(?x)\n                    (?:\n                        teachable:https?://(?P<site_t>[^/]+)|\n                        https?://(?:www\\.)?(?P<site>v1\\.upskillcourses\\.com|gns3\\.teachable\\.com|academyhacker\\.com|stackskills\\.com|market\\.saleshacker\\.com|learnability\\.org|edurila\\.com|courses\\.workitdaily\\.com)\n                    )\n                    /courses/[^/]+/lectures/(?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.teachable'
+
+class TeachableCourseIE(TeachableBaseIE):
+    _VALID_URL = '(?x)\n                        (?:\n                            teachable:https?://(?P<site_t>[^/]+)|\n                            https?://(?:www\\.)?(?P<site>v1\\.upskillcourses\\.com|gns3\\.teachable\\.com|academyhacker\\.com|stackskills\\.com|market\\.saleshacker\\.com|learnability\\.org|edurila\\.com|courses\\.workitdaily\\.com)\n                        )\n                        /(?:courses|p)/(?:enrolled/)?(?P<id>[^/?#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.teachable'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TeachableIE.suitable(url)
+            else super(TeachableCourseIE, cls).suitable(url)
+        )
+
+class TeacherTubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?teachertube\\.com/(viewVideo\\.php\\?video_id=|music\\.php\\?music_id=|video/(?:[\\da-z-]+-)?|audio/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.teachertube'
+    IE_NAME = 'teachertube'
+
+class TeacherTubeUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?teachertube\\.com/(user/profile|collection)/(?P<user>[0-9a-zA-Z]+)/?'
+    _module = 'pycord.ext.dl.extractor.teachertube'
+    IE_NAME = 'teachertube:user:collection'
+
+class TeachingChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?teachingchannel\\.org/videos?/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.teachingchannel'
+
+class TeamcocoIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:\\w+\\.)?teamcoco\\.com/(?P<id>([^/]+/)*[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.teamcoco'
+
+class TeamTreeHouseIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?teamtreehouse\\.com/library/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.teamtreehouse'
+
+class TechTalksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://techtalks\\.tv/talks/(?:[^/]+/)?(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.techtalks'
+
+class TEDIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        (?P<proto>https?://)\n        (?P<type>www|embed(?:-ssl)?)(?P<urlmain>\\.ted\\.com/\n        (\n            (?P<type_playlist>playlists(?:/(?P<playlist_id>\\d+))?) # We have a playlist\n            |\n            ((?P<type_talk>talks)) # We have a simple talk\n            |\n            (?P<type_watch>watch)/[^/]+/[^/]+\n        )\n        (/lang/(.*?))? # The url may contain the language\n        /(?P<name>[\\w-]+) # Here goes the name and then ".html"\n        .*)$\n        '
+    _module = 'pycord.ext.dl.extractor.ted'
+    IE_NAME = 'ted'
+
+class Tele5IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tele5\\.de/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.tele5'
+
+class Tele13IE(LazyLoadExtractor):
+    _VALID_URL = '^https?://(?:www\\.)?t13\\.cl/videos(?:/[^/]+)+/(?P<id>[\\w-]+)'
+    _module = 'pycord.ext.dl.extractor.tele13'
+
+class TeleBruxellesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:telebruxelles|bx1)\\.be/(?:[^/]+/)*(?P<id>[^/#?]+)'
+    _module = 'pycord.ext.dl.extractor.telebruxelles'
+
+class TelegraafIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?telegraaf\\.nl/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.telegraaf'
+
+class TeleMBIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?telemb\\.be/(?P<display_id>.+?)_d_(?P<id>\\d+)\\.html'
+    _module = 'pycord.ext.dl.extractor.telemb'
+
+class TeleQuebecBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.telequebec'
+
+class TeleQuebecIE(TeleQuebecBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            zonevideo\\.telequebec\\.tv/media|\n                            coucou\\.telequebec\\.tv/videos\n                        )/(?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.telequebec'
+
+class TeleQuebecSquatIE(LazyLoadExtractor):
+    _VALID_URL = 'https://squat\\.telequebec\\.tv/videos/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.telequebec'
+
+class TeleQuebecEmissionIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            [^/]+\\.telequebec\\.tv/emissions/|\n                            (?:www\\.)?telequebec\\.tv/\n                        )\n                        (?P<id>[^?#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.telequebec'
+
+class TeleQuebecLiveIE(TeleQuebecBaseIE):
+    _VALID_URL = 'https?://zonevideo\\.telequebec\\.tv/(?P<id>endirect)'
+    _module = 'pycord.ext.dl.extractor.telequebec'
+
+class TeleQuebecVideoIE(TeleQuebecBaseIE):
+    _VALID_URL = 'https?://video\\.telequebec\\.tv/player(?:-live)?/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.telequebec'
+
+class TeleTaskIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tele-task\\.de/archive/video/html5/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.teletask'
+
+class TelewebionIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?telewebion\\.com/#!/episode/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.telewebion'
+
+class TennisTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tennistv\\.com/videos/(?P<id>[-a-z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.tennistv'
+
+class TenPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?10play\\.com\\.au/(?:[^/]+/)+(?P<id>tpv\\d{6}[a-z]{5})'
+    _module = 'pycord.ext.dl.extractor.tenplay'
+
+class TestURLIE(LazyLoadExtractor):
+    _VALID_URL = 'test(?:url)?:(?P<id>(?P<extractor>.+?)(?:_(?P<num>[0-9]+))?)$'
+    _module = 'pycord.ext.dl.extractor.testurl'
+
+class TF1IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tf1\\.fr/[^/]+/(?P<program_slug>[^/]+)/videos/(?P<id>[^/?&#]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.tf1'
+
+class TFOIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tfo\\.org/(?:en|fr)/(?:[^/]+/){2}(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tfo'
+
+class TheInterceptIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://theintercept\\.com/fieldofvision/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.theintercept'
+
+class TheSceneIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://thescene\\.com/watch/[^/]+/(?P<id>[^/#?]+)'
+    _module = 'pycord.ext.dl.extractor.thescene'
+
+class TheStarIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?thestar\\.com/(?:[^/]+/)*(?P<id>.+)\\.html'
+    _module = 'pycord.ext.dl.extractor.thestar'
+
+class TheSunIE(LazyLoadExtractor):
+    _VALID_URL = 'https://(?:www\\.)?thesun\\.co\\.uk/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.thesun'
+
+class TheWeatherChannelIE(ThePlatformIE):
+    _VALID_URL = 'https?://(?:www\\.)?weather\\.com(?P<asset_name>(?:/(?P<locale>[a-z]{2}-[A-Z]{2}))?/(?:[^/]+/)*video/(?P<id>[^/?#]+))'
+    _module = 'pycord.ext.dl.extractor.theweatherchannel'
+
+class ThisAmericanLifeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?thisamericanlife\\.org/(?:radio-archives/episode/|play_full\\.php\\?play=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.thisamericanlife'
+
+class ThisAVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?thisav\\.com/video/(?P<id>[0-9]+)/.*'
+    _module = 'pycord.ext.dl.extractor.thisav'
+
+class ThisOldHouseIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?thisoldhouse\\.com/(?:watch|how-to|tv-episode|(?:[^/]+/)?\\d+)/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.thisoldhouse'
+
+class ThreeQSDNIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://playout\\.3qsdn\\.com/(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.threeqsdn'
+    IE_NAME = '3qsdn'
+
+class TikTokBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.tiktok'
+
+class TikTokIE(TikTokBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tiktok\\.com/@[^/]+/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tiktok'
+
+class TikTokUserIE(TikTokBaseIE):
+    _VALID_URL = 'https://(?:www\\.)?tiktok\\.com/@(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.tiktok'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if TikTokIE.suitable(url) else super(TikTokUserIE, cls).suitable(url)
+        )
+
+class TinyPicIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?tinypic\\.com/player\\.php\\?v=(?P<id>[^&]+)&s=\\d+'
+    _module = 'pycord.ext.dl.extractor.tinypic'
+    IE_NAME = 'tinypic'
+
+class TMZIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tmz\\.com/videos/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.tmz'
+
+class TMZArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tmz\\.com/\\d{4}/\\d{2}/\\d{2}/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.tmz'
+
+class TNAFlixNetworkBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.tnaflix'
+
+class TNAFlixNetworkEmbedIE(TNAFlixNetworkBaseIE):
+    _VALID_URL = 'https?://player\\.(?:tna|emp)flix\\.com/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tnaflix'
+
+class TNAEMPFlixBaseIE(TNAFlixNetworkBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.tnaflix'
+
+class TNAFlixIE(TNAEMPFlixBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tnaflix\\.com/[^/]+/(?P<display_id>[^/]+)/video(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tnaflix'
+
+class EMPFlixIE(TNAEMPFlixBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?empflix\\.com/(?:videos/(?P<display_id>.+?)-|[^/]+/(?P<display_id_2>[^/]+)/video)(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.tnaflix'
+
+class MovieFapIE(TNAFlixNetworkBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?moviefap\\.com/videos/(?P<id>[0-9a-f]+)/(?P<display_id>[^/]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.tnaflix'
+
+class ToggleIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://(?:(?:www\\.)?mewatch|video\\.toggle)\\.sg/(?:en|zh)/(?:[^/]+/){2,}|toggle:)(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.toggle'
+    IE_NAME = 'toggle'
+
+class MeWatchIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|live)\\.)?mewatch\\.sg/watch/[^/?#&]+-(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.toggle'
+    IE_NAME = 'mewatch'
+
+class TOnlineIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?t-online\\.de/tv/(?:[^/]+/)*id_(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tonline'
+    IE_NAME = 't-online.de'
+
+class ToonGogglesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?toongoggles\\.com/shows/(?P<show_id>\\d+)(?:/[^/]+/episodes/(?P<episode_id>\\d+))?'
+    _module = 'pycord.ext.dl.extractor.toongoggles'
+
+class TouTvIE(RadioCanadaIE):
+    _VALID_URL = 'https?://ici\\.tou\\.tv/(?P<id>[a-zA-Z0-9_-]+(?:/S[0-9]+[EC][0-9]+)?)'
+    _module = 'pycord.ext.dl.extractor.toutv'
+    IE_NAME = 'tou.tv'
+
+class ToypicsUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videos\\.toypics\\.net/(?!view)(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.toypics'
+
+class ToypicsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videos\\.toypics\\.net/view/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.toypics'
+
+class TrailerAddictIE(LazyLoadExtractor):
+    _VALID_URL = '(?:https?://)?(?:www\\.)?traileraddict\\.com/(?:trailer|clip)/(?P<movie>.+?)/(?P<trailer_name>.+)'
+    _module = 'pycord.ext.dl.extractor.traileraddict'
+
+class TriluliluIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?trilulilu\\.ro/(?:[^/]+/)?(?P<id>[^/#\\?]+)'
+    _module = 'pycord.ext.dl.extractor.trilulilu'
+
+class TrovoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.trovo'
+
+class TrovoIE(TrovoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?trovo\\.live/(?!(?:clip|video)/)(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.trovo'
+
+class TrovoVodIE(TrovoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?trovo\\.live/(?:clip|video)/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.trovo'
+
+class TruNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?trunews\\.com/stream/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.trunews'
+
+class TruTVIE(TurnerBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?trutv\\.com/(?:shows|full-episodes)/(?P<series_slug>[0-9A-Za-z-]+)/(?:videos/(?P<clip_slug>[0-9A-Za-z-]+)|(?P<id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.trutv'
+
+class Tube8IE(KeezMoviesIE):
+    _VALID_URL = 'https?://(?:www\\.)?tube8\\.com/(?:[^/]+/)+(?P<display_id>[^/]+)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tube8'
+
+class TubiTvIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tubitv\\.com/(?:video|movies|tv-shows)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.tubitv'
+
+class TumblrIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<blog_name>[^/?#&]+)\\.tumblr\\.com/(?:post|video)/(?P<id>[0-9]+)(?:$|[/?#])'
+    _module = 'pycord.ext.dl.extractor.tumblr'
+
+class TuneInBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.tunein'
+
+class TuneInClipIE(TuneInBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tunein\\.com/station/.*?audioClipId\\=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tunein'
+    IE_NAME = 'tunein:clip'
+
+class TuneInStationIE(TuneInBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tunein\\.com/(?:radio/.*?-s|station/.*?StationId=|embed/player/s)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tunein'
+    IE_NAME = 'tunein:station'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TuneInClipIE.suitable(url)
+            else super(TuneInStationIE, cls).suitable(url)
+        )
+
+class TuneInProgramIE(TuneInBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tunein\\.com/(?:radio/.*?-p|program/.*?ProgramId=|embed/player/p)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tunein'
+    IE_NAME = 'tunein:program'
+
+class TuneInTopicIE(TuneInBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tunein\\.com/(?:topic/.*?TopicId=|embed/player/t)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tunein'
+    IE_NAME = 'tunein:topic'
+
+class TuneInShortenerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tun\\.in/(?P<id>[A-Za-z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.tunein'
+    IE_NAME = 'tunein:shortener'
+
+class TunePkIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:www\\.)?tune\\.pk/(?:video/|player/embed_player.php?.*?\\bvid=)|\n                            embed\\.tune\\.pk/play/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.tunepk'
+
+class TurboIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?turbo\\.fr/videos-voiture/(?P<id>[0-9]+)-'
+    _module = 'pycord.ext.dl.extractor.turbo'
+
+class TV2IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tv2\\.no/v/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tv2'
+
+class TV2ArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tv2\\.no/(?:a|\\d{4}/\\d{2}/\\d{2}(/[^/]+)+)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tv2'
+
+class KatsomoIE(TV2IE):
+    _VALID_URL = 'https?://(?:www\\.)?(?:katsomo|mtv(uutiset)?)\\.fi/(?:sarja/[0-9a-z-]+-\\d+/[0-9a-z-]+-|(?:#!/)?jakso/(?:\\d+/[^/]+/)?|video/prog)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tv2'
+
+class MTVUutisetArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)mtvuutiset\\.fi/artikkeli/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tv2'
+
+class TV2DKIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        (?:\n                            tvsyd|\n                            tv2ostjylland|\n                            tvmidtvest|\n                            tv2fyn|\n                            tv2east|\n                            tv2lorry|\n                            tv2nord\n                        )\\.dk/\n                        (:[^/]+/)*\n                        (?P<id>[^/?\\#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.tv2dk'
+
+class TV2DKBornholmPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://play\\.tv2bornholm\\.dk/\\?.*?\\bid=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tv2dk'
+
+class TV2HuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tv2\\.hu/(?:[^/]+/)+(?P<id>\\d+)_[^/?#]+?\\.html'
+    _module = 'pycord.ext.dl.extractor.tv2hu'
+    IE_NAME = 'tv2.hu'
+
+class TV4IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?\n        (?:\n            tv4\\.se/(?:[^/]+)/klipp/(?:.*)-|\n            tv4play\\.se/\n            (?:\n                (?:program|barn)/(?:(?:[^/]+/){1,2}|(?:[^\\?]+)\\?video_id=)|\n                iframe/video/|\n                film/|\n                sport/|\n            )\n        )(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.tv4'
+
+class TV5MondePlusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:tv5mondeplus|revoir\\.tv5monde)\\.com/toutes-les-videos/[^/]+/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.tv5mondeplus'
+
+class TV5UnisBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.tv5unis'
+
+class TV5UnisVideoIE(TV5UnisBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tv5unis\\.ca/videos/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tv5unis'
+    IE_NAME = 'tv5unis:video'
+
+class TV5UnisIE(TV5UnisBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?tv5unis\\.ca/videos/(?P<id>[^/]+)(?:/saisons/(?P<season_number>\\d+)/episodes/(?P<episode_number>\\d+))?/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.tv5unis'
+    IE_NAME = 'tv5unis'
+
+class TVAIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://videos?\\.tva\\.ca/details/_(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tva'
+
+class QubIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?qub\\.ca/(?:[^/]+/)*[0-9a-z-]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tva'
+
+class TVANouvellesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvanouvelles\\.ca/videos/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tvanouvelles'
+
+class TVANouvellesArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvanouvelles\\.ca/(?:[^/]+/)+(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.tvanouvelles'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TVANouvellesIE.suitable(url)
+            else super(TVANouvellesArticleIE, cls).suitable(url)
+        )
+
+class TVCIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvc\\.ru/video/iframe/id/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tvc'
+
+class TVCArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvc\\.ru/(?!video/iframe/id/)(?P<id>[^?#]+)'
+    _module = 'pycord.ext.dl.extractor.tvc'
+
+class TVerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tver\\.jp/(?P<path>(?:corner|episode|feature)/(?P<id>f?\\d+))'
+    _module = 'pycord.ext.dl.extractor.tver'
+
+class TvigleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:tvigle\\.ru/(?:[^/]+/)+(?P<display_id>[^/]+)/$|cloud\\.tvigle\\.ru/video/(?P<id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.tvigle'
+    IE_NAME = 'tvigle'
+
+class TVLandIE(ParamountNetworkIE):
+    _VALID_URL = 'https?://(?:www\\.)?tvland\\.com/(?:video-clips|(?:full-)?episodes)/(?P<id>[^/?#.]+)'
+    _module = 'pycord.ext.dl.extractor.tvland'
+    IE_NAME = 'tvland.com'
+
+class TVN24IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:[^/]+)\\.)?tvn24(?:bis)?\\.pl/(?:[^/]+/)*(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.tvn24'
+
+class TVNetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+)\\.tvnet\\.gov\\.vn/[^/]+/(?:\\d+/)?(?P<id>\\d+)(?:/|$)'
+    _module = 'pycord.ext.dl.extractor.tvnet'
+
+class TVNoeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvnoe\\.cz/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.tvnoe'
+
+class TVNowBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.tvnow'
+
+class TVNowIE(TVNowBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?tvnow\\.(?:de|at|ch)/(?P<station>[^/]+)/\n                        (?P<show_id>[^/]+)/\n                        (?!(?:list|jahr)(?:/|$))(?P<id>[^/?\\#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.tvnow'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TVNowNewIE.suitable(url)
+            or TVNowSeasonIE.suitable(url)
+            or TVNowAnnualIE.suitable(url)
+            or TVNowShowIE.suitable(url)
+            else super(TVNowIE, cls).suitable(url)
+        )
+
+class TVNowNewIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?P<base_url>https?://\n                        (?:www\\.)?tvnow\\.(?:de|at|ch)/\n                        (?:shows|serien))/\n                        (?P<show>[^/]+)-\\d+/\n                        [^/]+/\n                        episode-\\d+-(?P<episode>[^/?$&]+)-(?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.tvnow'
+
+class TVNowNewBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.tvnow'
+
+class TVNowListBaseIE(TVNowNewBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.tvnow'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TVNowNewIE.suitable(url)
+            else super(TVNowListBaseIE, cls).suitable(url)
+        )
+
+class TVNowSeasonIE(TVNowListBaseIE):
+    _VALID_URL = '(?x)\n                    (?P<base_url>\n                        https?://\n                            (?:www\\.)?tvnow\\.(?:de|at|ch)/(?:shows|serien)/\n                            [^/?#&]+-(?P<show_id>\\d+)\n                    )\n                    /staffel-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tvnow'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TVNowNewIE.suitable(url)
+            else super(TVNowListBaseIE, cls).suitable(url)
+        )
+
+class TVNowAnnualIE(TVNowListBaseIE):
+    _VALID_URL = '(?x)\n                    (?P<base_url>\n                        https?://\n                            (?:www\\.)?tvnow\\.(?:de|at|ch)/(?:shows|serien)/\n                            [^/?#&]+-(?P<show_id>\\d+)\n                    )\n                    /(?P<year>\\d{4})-(?P<month>\\d{2})'
+    _module = 'pycord.ext.dl.extractor.tvnow'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TVNowNewIE.suitable(url)
+            else super(TVNowListBaseIE, cls).suitable(url)
+        )
+
+class TVNowShowIE(TVNowListBaseIE):
+    _VALID_URL = '(?x)\n                    (?P<base_url>\n                        https?://\n                            (?:www\\.)?tvnow\\.(?:de|at|ch)/(?:shows|serien)/\n                            [^/?#&]+-(?P<show_id>\\d+)\n                    )\n                    '
+    _module = 'pycord.ext.dl.extractor.tvnow'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if TVNowNewIE.suitable(url)
+            or TVNowSeasonIE.suitable(url)
+            or TVNowAnnualIE.suitable(url)
+            else super(TVNowShowIE, cls).suitable(url)
+        )
+
+class TVPEmbedIE(LazyLoadExtractor):
+    _VALID_URL = '(?:tvp:|https?://[^/]+\\.tvp\\.(?:pl|info)/sess/tvplayer\\.php\\?.*?object_id=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tvp'
+    IE_NAME = 'tvp:embed'
+
+class TVPIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://[^/]+\\.tvp\\.(?:pl|info)/(?:video/(?:[^,\\s]*,)*|(?:(?!\\d+/)[^/]+/)*)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tvp'
+    IE_NAME = 'tvp'
+
+class TVPWebsiteIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vod\\.tvp\\.pl/website/(?P<display_id>[^,]+),(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tvp'
+    IE_NAME = 'tvp:series'
+
+class TVPlayIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        mtg:|\n                        https?://\n                            (?:www\\.)?\n                            (?:\n                                tvplay(?:\\.skaties)?\\.lv(?:/parraides)?|\n                                (?:tv3play|play\\.tv3)\\.lt(?:/programos)?|\n                                tv3play(?:\\.tv3)?\\.ee/sisu|\n                                (?:tv(?:3|6|8|10)play|viafree)\\.se/program|\n                                (?:(?:tv3play|viasat4play|tv6play|viafree)\\.no|(?:tv3play|viafree)\\.dk)/programmer|\n                                play\\.nova(?:tv)?\\.bg/programi\n                            )\n                            /(?:[^/]+/)+\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.tvplay'
+    IE_NAME = 'mtg'
+
+class ViafreeIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?\n                        viafree\\.(?P<country>dk|no|se)\n                        /(?P<id>program(?:mer)?/(?:[^/]+/)+[^/?#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.tvplay'
+
+    @classmethod
+    def suitable(cls, url):
+        return False if TVPlayIE.suitable(url) else super(ViafreeIE, cls).suitable(url)
+
+class TVPlayHomeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:tv3?)?play\\.(?:tv3\\.lt|skaties\\.lv|tv3\\.ee)/(?:[^/]+/)*[^/?#&]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tvplay'
+
+class TVPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?tvplayer\\.com/watch/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.tvplayer'
+
+class TweakersIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://tweakers\\.net/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.tweakers'
+
+class TwentyFourVideoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?P<host>\n                            (?:(?:www|porno?)\\.)?24video\\.\n                            (?:net|me|xxx|sexy?|tube|adult|site|vip)\n                        )/\n                        (?:\n                            video/(?:(?:view|xml)/)?|\n                            player/new24_play\\.swf\\?id=\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.twentyfourvideo'
+    IE_NAME = '24video'
+
+class TwentyMinutenIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?20min\\.ch/\n                        (?:\n                            videotv/*\\?.*?\\bvid=|\n                            videoplayer/videoplayer\\.html\\?.*?\\bvideoId@\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.twentymin'
+    IE_NAME = '20min'
+
+class TwentyThreeVideoIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<domain>[^.]+\\.(?:twentythree\\.net|23video\\.com|filmweb\\.no))/v\\.ihtml/player\\.html\\?(?P<query>.*?\\bphoto(?:_|%5f)id=(?P<id>\\d+).*)'
+    _module = 'pycord.ext.dl.extractor.twentythreevideo'
+    IE_NAME = '23video'
+
+class TwitCastingIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?twitcasting\\.tv/(?P<uploader_id>[^/]+)/movie/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.twitcasting'
+
+class TwitchBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.twitch'
+
+class TwitchVodIE(TwitchBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?:www|go|m)\\.)?twitch\\.tv/(?:[^/]+/v(?:ideo)?|videos)/|\n                            player\\.twitch\\.tv/\\?.*?\\bvideo=v?\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.twitch'
+    IE_NAME = 'twitch:vod'
+
+class TwitchCollectionIE(TwitchBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/collections/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.twitch'
+
+class TwitchPlaylistBaseIE(TwitchBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.twitch'
+
+class TwitchVideosIE(TwitchPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/(?P<id>[^/]+)/(?:videos|profile)'
+    _module = 'pycord.ext.dl.extractor.twitch'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if any(
+                ie.suitable(url)
+                for ie in (TwitchVideosClipsIE, TwitchVideosCollectionsIE)
+            )
+            else super(TwitchVideosIE, cls).suitable(url)
+        )
+
+class TwitchVideosClipsIE(TwitchPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/(?P<id>[^/]+)/(?:clips|videos/*?\\?.*?\\bfilter=clips)'
+    _module = 'pycord.ext.dl.extractor.twitch'
+
+class TwitchVideosCollectionsIE(TwitchPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|go|m)\\.)?twitch\\.tv/(?P<id>[^/]+)/videos/*?\\?.*?\\bfilter=collections'
+    _module = 'pycord.ext.dl.extractor.twitch'
+
+class TwitchStreamIE(TwitchBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:(?:www|go|m)\\.)?twitch\\.tv/|\n                            player\\.twitch\\.tv/\\?.*?\\bchannel=\n                        )\n                        (?P<id>[^/#?]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.twitch'
+    IE_NAME = 'twitch:stream'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if any(
+                ie.suitable(url)
+                for ie in (
+                    TwitchVodIE,
+                    TwitchCollectionIE,
+                    TwitchVideosIE,
+                    TwitchVideosClipsIE,
+                    TwitchVideosCollectionsIE,
+                    TwitchClipsIE,
+                )
+            )
+            else super(TwitchStreamIE, cls).suitable(url)
+        )
+
+class TwitchClipsIE(TwitchBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            clips\\.twitch\\.tv/(?:embed\\?.*?\\bclip=|(?:[^/]+/)*)|\n                            (?:(?:www|go|m)\\.)?twitch\\.tv/[^/]+/clip/\n                        )\n                        (?P<id>[^/?#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.twitch'
+    IE_NAME = 'twitch:clips'
+
+class TwitterCardIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|m(?:obile)?)\\.)?twitter\\.com/i/(?:cards/tfw/v1|videos(?:/tweet)?)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.twitter'
+    IE_NAME = 'twitter:card'
+
+class TwitterBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.twitter'
+
+class TwitterIE(TwitterBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m(?:obile)?)\\.)?twitter\\.com/(?:(?:i/web|[^/]+)/status|statuses)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.twitter'
+    IE_NAME = 'twitter'
+
+class TwitterAmplifyIE(TwitterBaseIE):
+    _VALID_URL = 'https?://amp\\.twimg\\.com/v/(?P<id>[0-9a-f\\-]{36})'
+    _module = 'pycord.ext.dl.extractor.twitter'
+    IE_NAME = 'twitter:amplify'
+
+class TwitterBroadcastIE(TwitterBaseIE, PeriscopeBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m(?:obile)?)\\.)?twitter\\.com/i/broadcasts/(?P<id>[0-9a-zA-Z]{13})'
+    _module = 'pycord.ext.dl.extractor.twitter'
+    IE_NAME = 'twitter:broadcast'
+
+class UdemyIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:[^/]+\\.)?udemy\\.com/\n                        (?:\n                            [^#]+\\#/lecture/|\n                            lecture/view/?\\?lectureId=|\n                            [^/]+/learn/v4/t/lecture/\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.udemy'
+    IE_NAME = 'udemy'
+
+class UdemyCourseIE(UdemyIE):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?udemy\\.com/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.udemy'
+    IE_NAME = 'udemy:course'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if UdemyIE.suitable(url) else super(UdemyCourseIE, cls).suitable(url)
+        )
+
+class UDNEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video\\.udn\\.com/(?:embed|play)/news/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.udn'
+
+class ImgGamingBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.imggaming'
+
+class UFCTVIE(ImgGamingBaseIE):
+    _VALID_URL = 'https?://(?P<domain>(?:(?:app|www)\\.)?(?:ufc\\.tv|(?:ufc)?fightpass\\.com)|ufcfightpass\\.img(?:dge|gaming)\\.com)/(?P<type>live|playlist|video)/(?P<id>\\d+)(?:\\?.*?\\bplaylistId=(?P<playlist_id>\\d+))?'
+    _module = 'pycord.ext.dl.extractor.ufctv'
+
+class UFCArabiaIE(ImgGamingBaseIE):
+    _VALID_URL = 'https?://(?P<domain>(?:(?:app|www)\\.)?ufcarabia\\.(?:ae|com))/(?P<type>live|playlist|video)/(?P<id>\\d+)(?:\\?.*?\\bplaylistId=(?P<playlist_id>\\d+))?'
+    _module = 'pycord.ext.dl.extractor.ufctv'
+
+class UKTVPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://uktvplay\\.uktv\\.co\\.uk/(?:.+?\\?.*?\\bvideo=|([^/]+/)*watch-online/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.uktvplay'
+
+class DigitekaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://(?:www\\.)?(?:digiteka\\.net|ultimedia\\.com)/\n        (?:\n            deliver/\n            (?P<embed_type>\n                generic|\n                musique\n            )\n            (?:/[^/]+)*/\n            (?:\n                src|\n                article\n            )|\n            default/index/video\n            (?P<site_type>\n                generic|\n                music\n            )\n            /id\n        )/(?P<id>[\\d+a-z]+)'
+    _module = 'pycord.ext.dl.extractor.digiteka'
+
+class DLiveVODIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dlive\\.tv/p/(?P<uploader_id>.+?)\\+(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.dlive'
+    IE_NAME = 'dlive:vod'
+
+class DLiveStreamIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?dlive\\.tv/(?!p/)(?P<id>[\\w.-]+)'
+    _module = 'pycord.ext.dl.extractor.dlive'
+    IE_NAME = 'dlive:stream'
+
+class UMGDeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?universal-music\\.de/[^/]+/videos/[^/?#]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.umg'
+    IE_NAME = 'umg:de'
+
+class UnistraIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://utv\\.unistra\\.fr/(?:index|video)\\.php\\?id_video\\=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.unistra'
+
+class UnityIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?unity3d\\.com/learn/tutorials/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.unity'
+
+class UOLIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?uol\\.com\\.br/.*?(?:(?:mediaId|v)=|view/(?:[a-z0-9]+/)?|video(?:=|/(?:\\d{4}/\\d{2}/\\d{2}/)?))(?P<id>\\d+|[\\w-]+-[A-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.uol'
+    IE_NAME = 'uol.com.br'
+
+class UplynkIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://.*?\\.uplynk\\.com/(?P<path>ext/[0-9a-f]{32}/(?P<external_id>[^/?&]+)|(?P<id>[0-9a-f]{32}))\\.(?:m3u8|json)(?:.*?\\bpbs=(?P<session_id>[^&]+))?'
+    _module = 'pycord.ext.dl.extractor.uplynk'
+    IE_NAME = 'uplynk'
+
+class UplynkPreplayIE(UplynkIE):
+    _VALID_URL = 'https?://.*?\\.uplynk\\.com/preplay2?/(?P<path>ext/[0-9a-f]{32}/(?P<external_id>[^/?&]+)|(?P<id>[0-9a-f]{32}))\\.json'
+    _module = 'pycord.ext.dl.extractor.uplynk'
+    IE_NAME = 'uplynk:preplay'
+
+class UrortIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?urort\\.p3\\.no/#!/Band/(?P<id>[^/]+)$'
+    _module = 'pycord.ext.dl.extractor.urort'
+
+class URPlayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ur(?:play|skola)\\.se/(?:program|Produkter)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.urplay'
+
+class USANetworkIE(NBCIE):
+    _VALID_URL = 'https?(?P<permalink>://(?:www\\.)?usanetwork\\.com/[^/]+/video/[^/]+/(?P<id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.usanetwork'
+
+class USATodayIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?usatoday\\.com/(?:[^/]+/)*(?P<id>[^?/#]+)'
+    _module = 'pycord.ext.dl.extractor.usatoday'
+
+class UstreamIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:ustream\\.tv|video\\.ibm\\.com)/(?P<type>recorded|embed|embed/recorded)/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.ustream'
+    IE_NAME = 'ustream'
+
+class UstreamChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?ustream\\.tv/channel/(?P<slug>.+)'
+    _module = 'pycord.ext.dl.extractor.ustream'
+    IE_NAME = 'ustream:channel'
+
+class UstudioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|v1)\\.)?ustudio\\.com/video/(?P<id>[^/]+)/(?P<display_id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.ustudio'
+    IE_NAME = 'ustudio'
+
+class UstudioEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:app|embed)\\.)?ustudio\\.com/embed/(?P<uid>[^/]+)/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.ustudio'
+    IE_NAME = 'ustudio:embed'
+
+class Varzesh3IE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?video\\.varzesh3\\.com/(?:[^/]+/)+(?P<id>[^/]+)/?'
+    _module = 'pycord.ext.dl.extractor.varzesh3'
+
+class Vbox7IE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:[^/]+\\.)?vbox7\\.com/\n                        (?:\n                            play:|\n                            (?:\n                                emb/external\\.php|\n                                player/ext\\.swf\n                            )\\?.*?\\bvid=\n                        )\n                        (?P<id>[\\da-fA-F]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.vbox7'
+
+class VeeHDIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://veehd\\.com/video/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.veehd'
+
+class VeohIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?veoh\\.com/(?:watch|embed|iphone/#_Watch)/(?P<id>(?:v|e|yapi-)[\\da-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.veoh'
+
+class VestiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?vesti\\.ru/(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.vesti'
+
+class VevoBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.vevo'
+
+class VevoIE(VevoBaseIE):
+    _VALID_URL = '(?x)\n        (?:https?://(?:www\\.)?vevo\\.com/watch/(?!playlist|genre)(?:[^/]+/(?:[^/]+/)?)?|\n           https?://cache\\.vevo\\.com/m/html/embed\\.html\\?video=|\n           https?://videoplayer\\.vevo\\.com/embed/embedded\\?videoId=|\n           https?://embed\\.vevo\\.com/.*?[?&]isrc=|\n           vevo:)\n        (?P<id>[^&?#]+)'
+    _module = 'pycord.ext.dl.extractor.vevo'
+
+class VevoPlaylistIE(VevoBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?vevo\\.com/watch/(?P<kind>playlist|genre)/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.vevo'
+
+class BTArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bt\\.no/(?:[^/]+/)+(?P<id>[^/]+)-\\d+\\.html'
+    _module = 'pycord.ext.dl.extractor.vgtv'
+    IE_NAME = 'bt:article'
+
+class BTVestlendingenIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?bt\\.no/spesial/vestlendingen/#!/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.vgtv'
+    IE_NAME = 'bt:vestlendingen'
+
+class XstreamIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    (?:\n                        xstream:|\n                        https?://frontend\\.xstream\\.(?:dk|net)/\n                    )\n                    (?P<partner_id>[^/]+)\n                    (?:\n                        :|\n                        /feed/video/\\?.*?\\bid=\n                    )\n                    (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.xstream'
+
+class VGTVIE(XstreamIE):
+    _VALID_URL = '(?x)\n                    (?:https?://(?:www\\.)?\n                    (?P<host>\n                        vgtv.no|bt.no/tv|aftenbladet.no/tv|fvn.no/fvntv|aftenposten.no/webtv|ap.vgtv.no/webtv|tv.aftonbladet.se|tv.aftonbladet.se/abtv|www.aftonbladet.se/tv\n                    )\n                    /?\n                    (?:\n                        (?:\\#!/)?(?:video|live)/|\n                        embed?.*id=|\n                        a(?:rticles)?/\n                    )|\n                    (?P<appname>\n                        vgtv|bttv|satv|fvntv|aptv|abtv\n                    ):)\n                    (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.vgtv'
+
+class VH1IE(MTVServicesInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vh1\\.com/(?:video-clips|episodes)/(?P<id>[^/?#.]+)'
+    _module = 'pycord.ext.dl.extractor.vh1'
+    IE_NAME = 'vh1.com'
+
+class ViceBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.vice'
+
+class ViceIE(ViceBaseIE, AdobePassIE):
+    _VALID_URL = 'https?://(?:(?:video|vms)\\.vice|(?:www\\.)?vice(?:land|tv))\\.com/(?P<locale>[^/]+)/(?:video/[^/]+|embed)/(?P<id>[\\da-f]{24})'
+    _module = 'pycord.ext.dl.extractor.vice'
+    IE_NAME = 'vice'
+
+class ViceArticleIE(ViceBaseIE):
+    _VALID_URL = 'https://(?:www\\.)?vice\\.com/(?P<locale>[^/]+)/article/(?:[0-9a-z]{6}/)?(?P<id>[^?#]+)'
+    _module = 'pycord.ext.dl.extractor.vice'
+    IE_NAME = 'vice:article'
+
+class ViceShowIE(ViceBaseIE):
+    _VALID_URL = 'https?://(?:video\\.vice|(?:www\\.)?vice(?:land|tv))\\.com/(?P<locale>[^/]+)/show/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.vice'
+    IE_NAME = 'vice:show'
+
+class VidbitIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vidbit\\.co/(?:watch|embed)\\?.*?\\bv=(?P<id>[\\da-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.vidbit'
+
+class ViddlerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?viddler\\.com/(?:v|embed|player)/(?P<id>[a-z0-9]+)(?:.+?\\bsecret=(\\d+))?'
+    _module = 'pycord.ext.dl.extractor.viddler'
+
+class VideaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        videa(?:kid)?\\.hu/\n                        (?:\n                            videok/(?:[^/]+/)*[^?#&]+-|\n                            (?:videojs_)?player\\?.*?\\bv=|\n                            player/v/\n                        )\n                        (?P<id>[^?#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.videa'
+
+class VideoDetectiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?videodetective\\.com/[^/]+/[^/]+/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.videodetective'
+
+class VideofyMeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.videofy\\.me/.+?|p\\.videofy\\.me/v)/(?P<id>\\d+)(&|#|$)'
+    _module = 'pycord.ext.dl.extractor.videofyme'
+    IE_NAME = 'videofy.me'
+
+class VideomoreIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    videomore:(?P<sid>\\d+)$|\n                    https?://\n                        (?:\n                            videomore\\.ru/\n                            (?:\n                                embed|\n                                [^/]+/[^/]+\n                            )/|\n                            (?:\n                                (?:player\\.)?videomore\\.ru|\n                                siren\\.more\\.tv/player\n                            )/[^/]*\\?.*?\\btrack_id=|\n                            odysseus\\.more.tv/player/(?P<partner_id>\\d+)/\n                        )\n                        (?P<id>\\d+)\n                        (?:[/?#&]|\\.(?:xml|json)|$)\n                    '
+    _module = 'pycord.ext.dl.extractor.videomore'
+    IE_NAME = 'videomore'
+
+class VideomoreBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.videomore'
+
+class VideomoreVideoIE(VideomoreBaseIE):
+    _VALID_URL = 'https?://(?:videomore\\.ru|more\\.tv)/(?P<id>(?:(?:[^/]+/){2})?[^/?#&]+)(?:/*|[?#&].*?)$'
+    _module = 'pycord.ext.dl.extractor.videomore'
+    IE_NAME = 'videomore:video'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if VideomoreIE.suitable(url)
+            else super(VideomoreVideoIE, cls).suitable(url)
+        )
+
+class VideomoreSeasonIE(VideomoreBaseIE):
+    _VALID_URL = 'https?://(?:videomore\\.ru|more\\.tv)/(?!embed)(?P<id>[^/]+/[^/?#&]+)(?:/*|[?#&].*?)$'
+    _module = 'pycord.ext.dl.extractor.videomore'
+    IE_NAME = 'videomore:season'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if (VideomoreIE.suitable(url) or VideomoreVideoIE.suitable(url))
+            else super(VideomoreSeasonIE, cls).suitable(url)
+        )
+
+class VideoPressIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://video(?:\\.word)?press\\.com/embed/(?P<id>[\\da-zA-Z]{8})'
+    _module = 'pycord.ext.dl.extractor.videopress'
+
+class VidioIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vidio\\.com/watch/(?P<id>\\d+)-(?P<display_id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.vidio'
+
+class VidLiiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vidlii\\.com/(?:watch|embed)\\?.*?\\bv=(?P<id>[0-9A-Za-z_-]{11})'
+    _module = 'pycord.ext.dl.extractor.vidlii'
+
+class VidmeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vid\\.me/(?:e/)?(?P<id>[\\da-zA-Z]{,5})(?:[^\\da-zA-Z]|$)'
+    _module = 'pycord.ext.dl.extractor.vidme'
+    IE_NAME = 'vidme'
+
+class VidmeListBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.vidme'
+
+class VidmeUserIE(VidmeListBaseIE):
+    _VALID_URL = 'https?://vid\\.me/(?:e/)?(?P<id>[\\da-zA-Z_-]{6,})(?!/likes)(?:[^\\da-zA-Z_-]|$)'
+    _module = 'pycord.ext.dl.extractor.vidme'
+    IE_NAME = 'vidme:user'
+
+class VidmeUserLikesIE(VidmeListBaseIE):
+    _VALID_URL = 'https?://vid\\.me/(?:e/)?(?P<id>[\\da-zA-Z_-]{6,})/likes'
+    _module = 'pycord.ext.dl.extractor.vidme'
+    IE_NAME = 'vidme:user:likes'
+
+class VierIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:www\\.)?(?P<site>vier|vijf)\\.be/\n                        (?:\n                            (?:\n                                [^/]+/videos|\n                                video(?:/[^/]+)*\n                            )/\n                            (?P<display_id>[^/]+)(?:/(?P<id>\\d+))?|\n                            (?:\n                                video/v3/embed|\n                                embed/video/public\n                            )/(?P<embed_id>\\d+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.vier'
+    IE_NAME = 'vier'
+
+class VierVideosIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>vier|vijf)\\.be/(?P<program>[^/]+)/videos(?:\\?.*\\bpage=(?P<page>\\d+)|$)'
+    _module = 'pycord.ext.dl.extractor.vier'
+    IE_NAME = 'vier:videos'
+
+class ViewLiftBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.viewlift'
+
+class ViewLiftIE(ViewLiftBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<domain>(?:(?:main\\.)?snagfilms|snagxtreme|funnyforfree|kiddovid|winnersview|(?:monumental|lax)sportsnetwork|vayafilm|failarmy|ftfnext|lnppass\\.legapallacanestro|moviespree|app\\.myoutdoortv|neoufitness|pflmma|theidentitytb)\\.com|(?:hoichoi|app\\.horseandcountry|kronon|marquee|supercrosslive)\\.tv)(?P<path>(?:/(?:films/title|show|(?:news/)?videos?|watch))?/(?P<id>[^?#]+))'
+    _module = 'pycord.ext.dl.extractor.viewlift'
+    IE_NAME = 'viewlift'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if ViewLiftEmbedIE.suitable(url)
+            else super(ViewLiftIE, cls).suitable(url)
+        )
+
+class ViewLiftEmbedIE(ViewLiftBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|embed)\\.)?(?P<domain>(?:(?:main\\.)?snagfilms|snagxtreme|funnyforfree|kiddovid|winnersview|(?:monumental|lax)sportsnetwork|vayafilm|failarmy|ftfnext|lnppass\\.legapallacanestro|moviespree|app\\.myoutdoortv|neoufitness|pflmma|theidentitytb)\\.com|(?:hoichoi|app\\.horseandcountry|kronon|marquee|supercrosslive)\\.tv)/embed/player\\?.*\\bfilmId=(?P<id>[\\da-f]{8}-(?:[\\da-f]{4}-){3}[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.viewlift'
+    IE_NAME = 'viewlift:embed'
+
+class ViideaIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://(?:www\\.)?(?:\n            videolectures\\.net|\n            flexilearn\\.viidea\\.net|\n            presentations\\.ocwconsortium\\.org|\n            video\\.travel-zoom\\.si|\n            video\\.pomp-forum\\.si|\n            tv\\.nil\\.si|\n            video\\.hekovnik.com|\n            video\\.szko\\.si|\n            kpk\\.viidea\\.com|\n            inside\\.viidea\\.net|\n            video\\.kiberpipa\\.org|\n            bvvideo\\.si|\n            kongres\\.viidea\\.net|\n            edemokracija\\.viidea\\.com\n        )(?:/lecture)?/(?P<id>[^/]+)(?:/video/(?P<part>\\d+))?/*(?:[#?].*)?$'
+    _module = 'pycord.ext.dl.extractor.viidea'
+
+class VimeoBaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.vimeo'
+
+class VimeoIE(VimeoBaseInfoExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:\n                                www|\n                                player\n                            )\n                            \\.\n                        )?\n                        vimeo(?:pro)?\\.com/\n                        (?!(?:channels|album|showcase)/[^/?#]+/?(?:$|[?#])|[^/]+/review/|ondemand/)\n                        (?:.*?/)?\n                        (?:\n                            (?:\n                                play_redirect_hls|\n                                moogaloop\\.swf)\\?clip_id=\n                            )?\n                        (?:videos?/)?\n                        (?P<id>[0-9]+)\n                        (?:/(?P<unlisted_hash>[\\da-f]{10}))?\n                        /?(?:[?&].*)?(?:[#].*)?$\n                    '
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo'
+
+class VimeoAlbumIE(VimeoBaseInfoExtractor):
+    _VALID_URL = 'https://vimeo\\.com/(?:album|showcase)/(?P<id>\\d+)(?:$|[?#]|/(?!video))'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo:album'
+
+class VimeoChannelIE(VimeoBaseInfoExtractor):
+    _VALID_URL = 'https://vimeo\\.com/channels/(?P<id>[^/?#]+)/?(?:$|[?#])'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo:channel'
+
+class VimeoGroupsIE(VimeoChannelIE):
+    _VALID_URL = 'https://vimeo\\.com/groups/(?P<id>[^/]+)(?:/(?!videos?/\\d+)|$)'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo:group'
+
+class VimeoLikesIE(VimeoChannelIE):
+    _VALID_URL = 'https://(?:www\\.)?vimeo\\.com/(?P<id>[^/]+)/likes/?(?:$|[?#]|sort:)'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo:likes'
+
+class VimeoOndemandIE(VimeoIE):
+    _VALID_URL = 'https?://(?:www\\.)?vimeo\\.com/ondemand/(?:[^/]+/)?(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo:ondemand'
+
+class VimeoReviewIE(VimeoBaseInfoExtractor):
+    _VALID_URL = '(?P<url>https://vimeo\\.com/[^/]+/review/(?P<id>[^/]+)/[0-9a-f]{10})'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo:review'
+
+class VimeoUserIE(VimeoChannelIE):
+    _VALID_URL = 'https://vimeo\\.com/(?!(?:[0-9]+|watchlater)(?:$|[?#/]))(?P<id>[^/]+)(?:/videos|[#?]|$)'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo:user'
+
+class VimeoWatchLaterIE(VimeoChannelIE):
+    _VALID_URL = 'https://vimeo\\.com/(?:home/)?watchlater|:vimeowatchlater'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vimeo:watchlater'
+
+class VHXEmbedIE(VimeoBaseInfoExtractor):
+    _VALID_URL = 'https?://embed\\.vhx\\.tv/videos/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.vimeo'
+    IE_NAME = 'vhx:embed'
+
+class VimpleIE(SprutoBaseIE):
+    _VALID_URL = 'https?://(?:player\\.vimple\\.(?:ru|co)/iframe|vimple\\.(?:ru|co))/(?P<id>[\\da-f-]{32,36})'
+    _module = 'pycord.ext.dl.extractor.vimple'
+
+class VineIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vine\\.co/(?:v|oembed)/(?P<id>\\w+)'
+    _module = 'pycord.ext.dl.extractor.vine'
+
+class VineUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vine\\.co/(?P<u>u/)?(?P<user>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.vine'
+    IE_NAME = 'vine:user'
+
+    @classmethod
+    def suitable(cls, url):
+        return False if VineIE.suitable(url) else super(VineUserIE, cls).suitable(url)
+
+class VikiBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.viki'
+
+class VikiIE(VikiBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?viki\\.(?:com|net|mx|jp|fr)/(?:videos|player)/(?P<id>[0-9]+v)'
+    _module = 'pycord.ext.dl.extractor.viki'
+    IE_NAME = 'viki'
+
+class VikiChannelIE(VikiBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?viki\\.(?:com|net|mx|jp|fr)/(?:tv|news|movies|artists)/(?P<id>[0-9]+c)'
+    _module = 'pycord.ext.dl.extractor.viki'
+    IE_NAME = 'viki:channel'
+
+class ViqeoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        (?:\n                            viqeo:|\n                            https?://cdn\\.viqeo\\.tv/embed/*\\?.*?\\bvid=|\n                            https?://api\\.viqeo\\.tv/v\\d+/data/startup?.*?\\bvideo(?:%5B%5D|\\[\\])=\n                        )\n                        (?P<id>[\\da-f]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.viqeo'
+
+class ViuBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.viu'
+
+class ViuIE(ViuBaseIE):
+    _VALID_URL = '(?:viu:|https?://[^/]+\\.viu\\.com/[a-z]{2}/media/)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.viu'
+
+class ViuPlaylistIE(ViuBaseIE):
+    _VALID_URL = 'https?://www\\.viu\\.com/[^/]+/listing/playlist-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.viu'
+    IE_NAME = 'viu:playlist'
+
+class ViuOTTIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?viu\\.com/ott/(?P<country_code>[a-z]{2})/[a-z]{2}-[a-z]{2}/vod/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.viu'
+    IE_NAME = 'viu:ott'
+
+class VKBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.vk'
+
+class VKIE(VKBaseIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:\n                                (?:(?:m|new)\\.)?vk\\.com/video_|\n                                (?:www\\.)?daxab.com/\n                            )\n                            ext\\.php\\?(?P<embed_query>.*?\\boid=(?P<oid>-?\\d+).*?\\bid=(?P<id>\\d+).*)|\n                            (?:\n                                (?:(?:m|new)\\.)?vk\\.com/(?:.+?\\?.*?z=)?video|\n                                (?:www\\.)?daxab.com/embed/\n                            )\n                            (?P<videoid>-?\\d+_\\d+)(?:.*\\blist=(?P<list_id>[\\da-f]+))?\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.vk'
+    IE_NAME = 'vk'
+
+class VKUserVideosIE(VKBaseIE):
+    _VALID_URL = 'https?://(?:(?:m|new)\\.)?vk\\.com/videos(?P<id>-?[0-9]+)(?!\\?.*\\bz=video)(?:[/?#&](?:.*?\\bsection=(?P<section>\\w+))?|$)'
+    _module = 'pycord.ext.dl.extractor.vk'
+    IE_NAME = 'vk:uservideos'
+
+class VKWallPostIE(VKBaseIE):
+    _VALID_URL = 'https?://(?:(?:(?:(?:m|new)\\.)?vk\\.com/(?:[^?]+\\?.*\\bw=)?wall(?P<id>-?\\d+_\\d+)))'
+    _module = 'pycord.ext.dl.extractor.vk'
+    IE_NAME = 'vk:wallpost'
+
+class VLiveBaseIE(NaverBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.vlive'
+
+class VLiveIE(VLiveBaseIE):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?vlive\\.tv/(?:video|embed)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.vlive'
+    IE_NAME = 'vlive'
+
+class VLivePostIE(VLiveIE):
+    _VALID_URL = 'https?://(?:(?:www|m)\\.)?vlive\\.tv/post/(?P<id>\\d-\\d+)'
+    _module = 'pycord.ext.dl.extractor.vlive'
+    IE_NAME = 'vlive:post'
+
+class VLiveChannelIE(VLiveBaseIE):
+    _VALID_URL = 'https?://(?:channels\\.vlive\\.tv|(?:(?:www|m)\\.)?vlive\\.tv/channel)/(?P<id>[0-9A-Z]+)'
+    _module = 'pycord.ext.dl.extractor.vlive'
+    IE_NAME = 'vlive:channel'
+
+class VodlockerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vodlocker\\.(?:com|city)/(?:embed-)?(?P<id>[0-9a-zA-Z]+)(?:\\..*?)?'
+    _module = 'pycord.ext.dl.extractor.vodlocker'
+
+class VODPlIE(OnetBaseIE):
+    _VALID_URL = 'https?://vod\\.pl/(?:[^/]+/)+(?P<id>[0-9a-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.vodpl'
+
+class VODPlatformIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www\\.)?vod-platform\\.net|embed\\.kwikmotion\\.com)/[eE]mbed/(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.vodplatform'
+
+class VoiceRepublicIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://voicerepublic\\.com/(?:talks|embed)/(?P<id>[0-9a-z-]+)'
+    _module = 'pycord.ext.dl.extractor.voicerepublic'
+
+class VootIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?voot\\.com/(?:[^/]+/)+(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.voot'
+
+class VoxMediaVolumeIE(OnceIE):
+    _VALID_URL = 'https?://volume\\.vox-cdn\\.com/embed/(?P<id>[0-9a-f]{9})'
+    _module = 'pycord.ext.dl.extractor.voxmedia'
+
+class VoxMediaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:(?:theverge|vox|sbnation|eater|polygon|curbed|racked|funnyordie)\\.com|recode\\.net)/(?:[^/]+/)*(?P<id>[^/?]+)'
+    _module = 'pycord.ext.dl.extractor.voxmedia'
+
+class VRTIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<site>vrt\\.be/vrtnws|sporza\\.be)/[a-z]{2}/\\d{4}/\\d{2}/\\d{2}/(?P<id>[^/?&#]+)'
+    _module = 'pycord.ext.dl.extractor.vrt'
+
+class VrakIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vrak\\.tv/videos\\?.*?\\btarget=(?P<id>[\\d.]+)'
+    _module = 'pycord.ext.dl.extractor.vrak'
+
+class VRVSeriesIE(VRVBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?vrv\\.co/series/(?P<id>[A-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.vrv'
+    IE_NAME = 'vrv:series'
+
+class VShareIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vshare\\.io/[dv]/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.vshare'
+
+class VTMIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vtm\\.be/([^/?&#]+)~v(?P<id>[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12})'
+    _module = 'pycord.ext.dl.extractor.vtm'
+
+class MedialaanIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:embed\\.)?mychannels.video/embed/|\n                            embed\\.mychannels\\.video/(?:s(?:dk|cript)/)?production/|\n                            (?:www\\.)?(?:\n                                (?:\n                                    7sur7|\n                                    demorgen|\n                                    hln|\n                                    joe|\n                                    qmusic\n                                )\\.be|\n                                (?:\n                                    [abe]d|\n                                    bndestem|\n                                    destentor|\n                                    gelderlander|\n                                    pzc|\n                                    tubantia|\n                                    volkskrant\n                                )\\.nl\n                            )/video/(?:[^/]+/)*[^/?&#]+~p\n                        )\n                        (?P<id>\\d+)\n                    '
+    _module = 'pycord.ext.dl.extractor.medialaan'
+
+class VubeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vube\\.com/(?:[^/]+/)+(?P<id>[\\da-zA-Z]{10})\\b'
+    _module = 'pycord.ext.dl.extractor.vube'
+    IE_NAME = 'vube'
+
+class VuClipIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:m\\.)?vuclip\\.com/w\\?.*?cid=(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.vuclip'
+
+class VVVVIDIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?vvvvid\\.it/(?:#!)?(?:show|anime|film|series)/(?P<show_id>\\d+)/[^/]+/(?P<season_id>\\d+)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.vvvvid'
+
+class VVVVIDShowIE(VVVVIDIE):
+    _VALID_URL = '(?P<base_url>https?://(?:www\\.)?vvvvid\\.it/(?:#!)?(?:show|anime|film|series)/(?P<id>\\d+)(?:/(?P<show_title>[^/?&#]+))?)/?(?:[?#&]|$)'
+    _module = 'pycord.ext.dl.extractor.vvvvid'
+
+class VyboryMosIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vybory\\.mos\\.ru/(?:#precinct/|account/channels\\?.*?\\bstation_id=)(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.vyborymos'
+
+class VzaarIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|view)\\.)?vzaar\\.com/(?:videos/)?(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.vzaar'
+
+class WakanimIE(LazyLoadExtractor):
+    _VALID_URL = 'https://(?:www\\.)?wakanim\\.tv/[^/]+/v2/catalogue/episode/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.wakanim'
+
+class WallaIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vod\\.walla\\.co\\.il/[^/]+/(?P<id>\\d+)/(?P<display_id>.+)'
+    _module = 'pycord.ext.dl.extractor.walla'
+
+class WashingtonPostIE(LazyLoadExtractor):
+    _VALID_URL = '(?:washingtonpost:|https?://(?:www\\.)?washingtonpost\\.com/(?:video|posttv)/(?:[^/]+/)*)(?P<id>[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.washingtonpost'
+    IE_NAME = 'washingtonpost'
+
+class WashingtonPostArticleIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?washingtonpost\\.com/(?:[^/]+/)*(?P<id>[^/?#]+)'
+    _module = 'pycord.ext.dl.extractor.washingtonpost'
+    IE_NAME = 'washingtonpost:article'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if WashingtonPostIE.suitable(url)
+            else super(WashingtonPostArticleIE, cls).suitable(url)
+        )
+
+class WatIE(LazyLoadExtractor):
+    _VALID_URL = '(?:wat:|https?://(?:www\\.)?wat\\.tv/video/.*-)(?P<id>[0-9a-z]+)'
+    _module = 'pycord.ext.dl.extractor.wat'
+    IE_NAME = 'wat.tv'
+
+class WatchBoxIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?watchbox\\.de/(?P<kind>serien|filme)/(?:[^/]+/)*[^/]+-(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.watchbox'
+
+class WatchIndianPornIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?watchindianporn\\.net/(?:[^/]+/)*video/(?P<display_id>[^/]+)-(?P<id>[a-zA-Z0-9]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.watchindianporn'
+
+class WDRIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://deviceids-medp\\.wdr\\.de/ondemand/\\d+/(?P<id>\\d+)\\.js'
+    _module = 'pycord.ext.dl.extractor.wdr'
+
+class WDRPageIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\d?\\.)?(?:(?:kinder\\.)?wdr\\d?|sportschau)\\.de/(?:mediathek/)?(?:[^/]+/)*(?P<display_id>[^/]+)\\.html|https?://(?:www\\.)wdrmaus.de/(?:[^/]+/){1,2}[^/?#]+\\.php5'
+    _module = 'pycord.ext.dl.extractor.wdr'
+
+class WDRElefantIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)wdrmaus\\.de/elefantenseite/#(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.wdr'
+
+class WDRMobileIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        https?://mobile-ondemand\\.wdr\\.de/\n        .*?/fsk(?P<age_limit>[0-9]+)\n        /[0-9]+/[0-9]+/\n        (?P<id>[0-9]+)_(?P<title>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.wdr'
+    IE_NAME = 'wdr:mobile'
+
+class WebcasterIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://bl\\.webcaster\\.pro/(?:quote|media)/start/free_(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.webcaster'
+
+class WebcasterFeedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://bl\\.webcaster\\.pro/feed/start/free_(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.webcaster'
+
+class WebOfStoriesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?webofstories\\.com/play/(?:[^/]+/)?(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.webofstories'
+
+class WebOfStoriesPlaylistIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?webofstories\\.com/playAll/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.webofstories'
+
+class WeiboIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?weibo\\.com/[0-9]+/(?P<id>[a-zA-Z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.weibo'
+
+class WeiboMobileIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://m\\.weibo\\.cn/status/(?P<id>[0-9]+)(\\?.+)?'
+    _module = 'pycord.ext.dl.extractor.weibo'
+
+class WeiqiTVIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?weiqitv\\.com/index/video_play\\?videoId=(?P<id>[A-Za-z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.weiqitv'
+
+class WistiaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.wistia'
+
+class WistiaIE(WistiaBaseIE):
+    _VALID_URL = '(?:wistia:|https?://(?:fast\\.)?wistia\\.(?:net|com)/embed/(?:iframe|medias)/)(?P<id>[a-z0-9]{10})'
+    _module = 'pycord.ext.dl.extractor.wistia'
+
+class WistiaPlaylistIE(WistiaBaseIE):
+    _VALID_URL = 'https?://(?:fast\\.)?wistia\\.(?:net|com)/embed/playlists/(?P<id>[a-z0-9]{10})'
+    _module = 'pycord.ext.dl.extractor.wistia'
+
+class WorldStarHipHopIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www|m)\\.worldstar(?:candy|hiphop)\\.com/(?:videos|android)/video\\.php\\?.*?\\bv=(?P<id>[^&]+)'
+    _module = 'pycord.ext.dl.extractor.worldstarhiphop'
+
+class WSJIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        (?:\n                            https?://video-api\\.wsj\\.com/api-video/player/iframe\\.html\\?.*?\\bguid=|\n                            https?://(?:www\\.)?(?:wsj|barrons)\\.com/video/(?:[^/]+/)+|\n                            wsj:\n                        )\n                        (?P<id>[a-fA-F0-9-]{36})\n                    '
+    _module = 'pycord.ext.dl.extractor.wsj'
+
+class WSJArticleIE(LazyLoadExtractor):
+    _VALID_URL = '(?i)https?://(?:www\\.)?wsj\\.com/articles/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.wsj'
+
+class WWEBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.wwe'
+
+class WWEIE(WWEBaseIE):
+    _VALID_URL = 'https?://(?:[^/]+\\.)?wwe\\.com/(?:[^/]+/)*videos/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.wwe'
+
+class XBefIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?xbef\\.com/video/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.xbef'
+
+class XboxClipsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:xboxclips\\.com|gameclips\\.io)/(?:video\\.php\\?.*vid=|[^/]+/)(?P<id>[\\da-f]{8}-(?:[\\da-f]{4}-){3}[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.xboxclips'
+
+class XFileShareIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?P<host>aparat\\.cam|clipwatching\\.com|gounlimited\\.to|govid\\.me|holavid\\.com|streamty\\.com|thevideobee\\.to|uqload\\.com|vidbom\\.com|vidlo\\.us|vidlocker\\.xyz|vidshare\\.tv|vup\\.to|wolfstream\\.tv|xvideosharing\\.com)/(?:embed-)?(?P<id>[0-9a-zA-Z]+)'
+    _module = 'pycord.ext.dl.extractor.xfileshare'
+
+class XHamsterIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:.+?\\.)?(?:xhamster\\.(?:com|one|desi)|xhms\\.pro|xhamster\\d+\\.com)/\n                        (?:\n                            movies/(?P<id>[\\dA-Za-z]+)/(?P<display_id>[^/]*)\\.html|\n                            videos/(?P<display_id_2>[^/]*)-(?P<id_2>[\\dA-Za-z]+)\n                        )\n                    '
+    _module = 'pycord.ext.dl.extractor.xhamster'
+
+class XHamsterEmbedIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?(?:xhamster\\.(?:com|one|desi)|xhms\\.pro|xhamster\\d+\\.com)/xembed\\.php\\?video=(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.xhamster'
+
+class XHamsterUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?(?:xhamster\\.(?:com|one|desi)|xhms\\.pro|xhamster\\d+\\.com)/users/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.xhamster'
+
+class XiamiBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.xiami'
+
+class XiamiSongIE(XiamiBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?xiami\\.com/song/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.xiami'
+    IE_NAME = 'xiami:song'
+
+class XiamiPlaylistBaseIE(XiamiBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.xiami'
+
+class XiamiAlbumIE(XiamiPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?xiami\\.com/album/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.xiami'
+    IE_NAME = 'xiami:album'
+
+class XiamiArtistIE(XiamiPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?xiami\\.com/artist/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.xiami'
+    IE_NAME = 'xiami:artist'
+
+class XiamiCollectionIE(XiamiPlaylistBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?xiami\\.com/collect/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.xiami'
+    IE_NAME = 'xiami:collection'
+
+class XimalayaBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.ximalaya'
+
+class XimalayaIE(XimalayaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.|m\\.)?ximalaya\\.com/(?P<uid>[0-9]+)/sound/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.ximalaya'
+    IE_NAME = 'ximalaya'
+
+class XimalayaAlbumIE(XimalayaBaseIE):
+    _VALID_URL = 'https?://(?:www\\.|m\\.)?ximalaya\\.com/(?P<uid>[0-9]+)/album/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.ximalaya'
+    IE_NAME = 'ximalaya:album'
+
+class XMinusIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?x-minus\\.org/track/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.xminus'
+
+class XNXXIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:video|www)\\.xnxx\\.com/video-?(?P<id>[0-9a-z]+)/'
+    _module = 'pycord.ext.dl.extractor.xnxx'
+
+class XTubeUserIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?xtube\\.com/profile/(?P<id>[^/]+-\\d+)'
+    _module = 'pycord.ext.dl.extractor.xtube'
+
+class XTubeIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                        (?:\n                            xtube:|\n                            https?://(?:www\\.)?xtube\\.com/(?:watch\\.php\\?.*\\bv=|video-watch/(?:embedded/)?(?P<display_id>[^/]+)-)\n                        )\n                        (?P<id>[^/?&#]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.xtube'
+
+class XuiteIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://vlog\\.xuite\\.net/(?:play|embed)/(?P<id>(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?)'
+    _module = 'pycord.ext.dl.extractor.xuite'
+
+class XVideosIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            (?:[^/]+\\.)?xvideos2?\\.com/video|\n                            (?:www\\.)?xvideos\\.es/video|\n                            flashservice\\.xvideos\\.com/embedframe/|\n                            static-hw\\.xvideos\\.com/swf/xv-player\\.swf\\?.*?\\bid_video=\n                        )\n                        (?P<id>[0-9]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.xvideos'
+
+class XXXYMoviesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?xxxymovies\\.com/videos/(?P<id>\\d+)/(?P<display_id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.xxxymovies'
+
+class YahooSearchIE(LazyLoadSearchExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.yahoo'
+    IE_NAME = 'screen.yahoo:search'
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'yvsearch(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+class YahooGyaOPlayerIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:gyao\\.yahoo\\.co\\.jp/(?:player|episode/[^/]+)|streaming\\.yahoo\\.co\\.jp/c/y)/(?P<id>\\d+/v\\d+/v\\d+|[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.yahoo'
+    IE_NAME = 'yahoo:gyao:player'
+
+class YahooGyaOIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:gyao\\.yahoo\\.co\\.jp/(?:p|title(?:/[^/]+)?)|streaming\\.yahoo\\.co\\.jp/p/y)/(?P<id>\\d+/v\\d+|[\\da-f]{8}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{4}-[\\da-f]{12})'
+    _module = 'pycord.ext.dl.extractor.yahoo'
+    IE_NAME = 'yahoo:gyao'
+
+class YahooJapanNewsIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?P<host>(?:news|headlines)\\.yahoo\\.co\\.jp)[^\\d]*(?P<id>\\d[\\d-]*\\d)?'
+    _module = 'pycord.ext.dl.extractor.yahoo'
+    IE_NAME = 'yahoo:japannews'
+
+class YandexDiskIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)https?://\n        (?P<domain>\n            yadi\\.sk|\n            disk\\.yandex\\.\n                (?:\n                    az|\n                    by|\n                    co(?:m(?:\\.(?:am|ge|tr))?|\\.il)|\n                    ee|\n                    fr|\n                    k[gz]|\n                    l[tv]|\n                    md|\n                    t[jm]|\n                    u[az]|\n                    ru\n                )\n        )/(?:[di]/|public.*?\\bhash=)(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.yandexdisk'
+
+class YandexMusicBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.yandexmusic'
+
+class YandexMusicTrackIE(YandexMusicBaseIE):
+    _VALID_URL = 'https?://music\\.yandex\\.(?P<tld>ru|kz|ua|by|com)/album/(?P<album_id>\\d+)/track/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.yandexmusic'
+    IE_NAME = 'yandexmusic:track'
+
+class YandexMusicPlaylistBaseIE(YandexMusicBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.yandexmusic'
+
+class YandexMusicAlbumIE(YandexMusicPlaylistBaseIE):
+    _VALID_URL = 'https?://music\\.yandex\\.(?P<tld>ru|kz|ua|by|com)/album/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.yandexmusic'
+    IE_NAME = 'yandexmusic:album'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if YandexMusicTrackIE.suitable(url)
+            else super(YandexMusicAlbumIE, cls).suitable(url)
+        )
+
+class YandexMusicPlaylistIE(YandexMusicPlaylistBaseIE):
+    _VALID_URL = 'https?://music\\.yandex\\.(?P<tld>ru|kz|ua|by|com)/users/(?P<user>[^/]+)/playlists/(?P<id>\\d+)'
+    _module = 'pycord.ext.dl.extractor.yandexmusic'
+    IE_NAME = 'yandexmusic:playlist'
+
+class YandexMusicArtistBaseIE(YandexMusicPlaylistBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.yandexmusic'
+
+class YandexMusicArtistTracksIE(YandexMusicArtistBaseIE):
+    _VALID_URL = 'https?://music\\.yandex\\.(?P<tld>ru|kz|ua|by|com)/artist/(?P<id>\\d+)/tracks'
+    _module = 'pycord.ext.dl.extractor.yandexmusic'
+    IE_NAME = 'yandexmusic:artist:tracks'
+
+class YandexMusicArtistAlbumsIE(YandexMusicArtistBaseIE):
+    _VALID_URL = 'https?://music\\.yandex\\.(?P<tld>ru|kz|ua|by|com)/artist/(?P<id>\\d+)/albums'
+    _module = 'pycord.ext.dl.extractor.yandexmusic'
+    IE_NAME = 'yandexmusic:artist:albums'
+
+class YandexVideoIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\n                            yandex\\.ru(?:/(?:portal/(?:video|efir)|efir))?/?\\?.*?stream_id=|\n                            frontend\\.vh\\.yandex\\.ru/player/\n                        )\n                        (?P<id>(?:[\\da-f]{32}|[\\w-]{12}))\n                    '
+    _module = 'pycord.ext.dl.extractor.yandexvideo'
+
+class YapFilesIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:(?:www|api)\\.)?yapfiles\\.ru/get_player/*\\?.*?\\bv=(?P<id>\\w+)'
+    _module = 'pycord.ext.dl.extractor.yapfiles'
+
+class YesJapanIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?yesjapan\\.com/video/(?P<slug>[A-Za-z0-9\\-]*)_(?P<id>[A-Za-z0-9]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.yesjapan'
+
+class YinYueTaiIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://v\\.yinyuetai\\.com/video(?:/h5)?/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.yinyuetai'
+    IE_NAME = 'yinyuetai:video'
+
+class YnetIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:.+?\\.)?ynet\\.co\\.il/(?:.+?/)?0,7340,(?P<id>L(?:-[0-9]+)+),00\\.html'
+    _module = 'pycord.ext.dl.extractor.ynet'
+
+class YouJizzIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:\\w+\\.)?youjizz\\.com/videos/(?:[^/#?]*-(?P<id>\\d+)\\.html|embed/(?P<embed_id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.youjizz'
+
+class YoukuIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        (?:\n            https?://(\n                (?:v|player)\\.youku\\.com/(?:v_show/id_|player\\.php/sid/)|\n                video\\.tudou\\.com/v/)|\n            youku:)\n        (?P<id>[A-Za-z0-9]+)(?:\\.html|/v\\.swf|)\n    '
+    _module = 'pycord.ext.dl.extractor.youku'
+    IE_NAME = 'youku'
+
+class YoukuShowIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://list\\.youku\\.com/show/id_(?P<id>[0-9a-z]+)\\.html'
+    _module = 'pycord.ext.dl.extractor.youku'
+    IE_NAME = 'youku:show'
+
+class YouNowLiveIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?younow\\.com/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.younow'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if YouNowChannelIE.suitable(url) or YouNowMomentIE.suitable(url)
+            else super(YouNowLiveIE, cls).suitable(url)
+        )
+
+class YouNowChannelIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?younow\\.com/(?P<id>[^/]+)/channel'
+    _module = 'pycord.ext.dl.extractor.younow'
+
+class YouNowMomentIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?younow\\.com/[^/]+/(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.younow'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if YouNowChannelIE.suitable(url)
+            else super(YouNowMomentIE, cls).suitable(url)
+        )
+
+class YouPornIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youporn\\.com/(?:watch|embed)/(?P<id>\\d+)(?:/(?P<display_id>[^/?#&]+))?'
+    _module = 'pycord.ext.dl.extractor.youporn'
+
+class YourPornIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?sxyprn\\.com/post/(?P<id>[^/?#&.]+)'
+    _module = 'pycord.ext.dl.extractor.yourporn'
+
+class YourUploadIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?(?:yourupload\\.com/(?:watch|embed)|embed\\.yourupload\\.com)/(?P<id>[A-Za-z0-9]+)'
+    _module = 'pycord.ext.dl.extractor.yourupload'
+
+class YoutubeBaseInfoExtractor(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.youtube'
+
+class YoutubeIE(YoutubeBaseInfoExtractor):
+    _VALID_URL = '(?x)^\n                     (\n                         (?:https?://|//)                                    # http(s):// or protocol-independent URL\n                         (?:(?:(?:(?:\\w+\\.)?[yY][oO][uU][tT][uU][bB][eE](?:-nocookie|kids)?\\.com|\n                            (?:www\\.)?deturl\\.com/www\\.youtube\\.com|\n                            (?:www\\.)?pwnyoutube\\.com|\n                            (?:www\\.)?hooktube\\.com|\n                            (?:www\\.)?yourepeat\\.com|\n                            tube\\.majestyc\\.net|\n                            (?:www\\.)?redirect\\.invidious\\.io|(?:(?:www|dev)\\.)?invidio\\.us|(?:(?:www|no)\\.)?invidiou\\.sh|(?:(?:www|fi)\\.)?invidious\\.snopyta\\.org|(?:www\\.)?invidious\\.kabi\\.tk|(?:www\\.)?invidious\\.13ad\\.de|(?:www\\.)?invidious\\.mastodon\\.host|(?:www\\.)?invidious\\.zapashcanon\\.fr|(?:www\\.)?(?:invidious(?:-us)?|piped)\\.kavin\\.rocks|(?:www\\.)?invidious\\.tinfoil-hat\\.net|(?:www\\.)?invidious\\.himiko\\.cloud|(?:www\\.)?invidious\\.reallyancient\\.tech|(?:www\\.)?invidious\\.tube|(?:www\\.)?invidiou\\.site|(?:www\\.)?invidious\\.site|(?:www\\.)?invidious\\.xyz|(?:www\\.)?invidious\\.nixnet\\.xyz|(?:www\\.)?invidious\\.048596\\.xyz|(?:www\\.)?invidious\\.drycat\\.fr|(?:www\\.)?inv\\.skyn3t\\.in|(?:www\\.)?tube\\.poal\\.co|(?:www\\.)?tube\\.connect\\.cafe|(?:www\\.)?vid\\.wxzm\\.sx|(?:www\\.)?vid\\.mint\\.lgbt|(?:www\\.)?vid\\.puffyan\\.us|(?:www\\.)?yewtu\\.be|(?:www\\.)?yt\\.elukerio\\.org|(?:www\\.)?yt\\.lelux\\.fi|(?:www\\.)?invidious\\.ggc-project\\.de|(?:www\\.)?yt\\.maisputain\\.ovh|(?:www\\.)?ytprivate\\.com|(?:www\\.)?invidious\\.13ad\\.de|(?:www\\.)?invidious\\.toot\\.koeln|(?:www\\.)?invidious\\.fdn\\.fr|(?:www\\.)?watch\\.nettohikari\\.com|(?:www\\.)?invidious\\.namazso\\.eu|(?:www\\.)?invidious\\.silkky\\.cloud|(?:www\\.)?invidious\\.exonip\\.de|(?:www\\.)?invidious\\.riverside\\.rocks|(?:www\\.)?invidious\\.blamefran\\.net|(?:www\\.)?invidious\\.moomoo\\.de|(?:www\\.)?ytb\\.trom\\.tf|(?:www\\.)?yt\\.cyberhost\\.uk|(?:www\\.)?kgg2m7yk5aybusll\\.onion|(?:www\\.)?qklhadlycap4cnod\\.onion|(?:www\\.)?axqzx4s6s54s32yentfqojs3x5i7faxza6xo3ehd4bzzsg2ii4fv2iid\\.onion|(?:www\\.)?c7hqkpkpemu6e7emz5b4vyz7idjgdvgaaa3dyimmeojqbgpea3xqjoid\\.onion|(?:www\\.)?fz253lmuao3strwbfbmx46yu7acac2jz27iwtorgmbqlkurlclmancad\\.onion|(?:www\\.)?invidious\\.l4qlywnpwqsluw65ts7md3khrivpirse744un3x7mlskqauz5pyuzgqd\\.onion|(?:www\\.)?owxfohz4kjyv25fvlqilyxast7inivgiktls3th44jhk3ej3i7ya\\.b32\\.i2p|(?:www\\.)?4l2dgddgsrkf2ous66i6seeyi6etzfgrue332grh2n7madpwopotugyd\\.onion|(?:www\\.)?w6ijuptxiku4xpnnaetxvnkc5vqcdu7mgns2u77qefoixi63vbvnpnqd\\.onion|(?:www\\.)?kbjggqkzv65ivcqj6bumvp337z6264huv5kpkwuv6gu5yjiskvan7fad\\.onion|(?:www\\.)?grwp24hodrefzvjjuccrkw3mjq4tzhaaq32amf33dzpmuxe7ilepcmad\\.onion|(?:www\\.)?hpniueoejy4opn7bc4ftgazyqjoeqwlvh2uiku2xqku6zpoa4bf5ruid\\.onion|\n                            youtube\\.googleapis\\.com)/                        # the various hostnames, with wildcard subdomains\n                         (?:.*?\\#/)?                                          # handle anchor (#/) redirect urls\n                         (?:                                                  # the various things that can precede the ID:\n                             (?:(?:v|embed|e)/(?!videoseries))                # v/ or embed/ or e/\n                             |(?:                                             # or the v= param in all its forms\n                                 (?:(?:watch|movie)(?:_popup)?(?:\\.php)?/?)?  # preceding watch(_popup|.php) or nothing (like /?v=xxxx)\n                                 (?:\\?|\\#!?)                                  # the params delimiter ? or # or #!\n                                 (?:.*?[&;])??                                # any other preceding param (like /?s=tuff&v=xxxx or ?s=tuff&amp;v=V36LpHqtcDY)\n                                 v=\n                             )\n                         ))\n                         |(?:\n                            youtu\\.be|                                        # just youtu.be/xxxx\n                            vid\\.plus|                                        # or vid.plus/xxxx\n                            zwearz\\.com/watch|                                # or zwearz.com/watch/xxxx\n                            (?:www\\.)?redirect\\.invidious\\.io|(?:(?:www|dev)\\.)?invidio\\.us|(?:(?:www|no)\\.)?invidiou\\.sh|(?:(?:www|fi)\\.)?invidious\\.snopyta\\.org|(?:www\\.)?invidious\\.kabi\\.tk|(?:www\\.)?invidious\\.13ad\\.de|(?:www\\.)?invidious\\.mastodon\\.host|(?:www\\.)?invidious\\.zapashcanon\\.fr|(?:www\\.)?(?:invidious(?:-us)?|piped)\\.kavin\\.rocks|(?:www\\.)?invidious\\.tinfoil-hat\\.net|(?:www\\.)?invidious\\.himiko\\.cloud|(?:www\\.)?invidious\\.reallyancient\\.tech|(?:www\\.)?invidious\\.tube|(?:www\\.)?invidiou\\.site|(?:www\\.)?invidious\\.site|(?:www\\.)?invidious\\.xyz|(?:www\\.)?invidious\\.nixnet\\.xyz|(?:www\\.)?invidious\\.048596\\.xyz|(?:www\\.)?invidious\\.drycat\\.fr|(?:www\\.)?inv\\.skyn3t\\.in|(?:www\\.)?tube\\.poal\\.co|(?:www\\.)?tube\\.connect\\.cafe|(?:www\\.)?vid\\.wxzm\\.sx|(?:www\\.)?vid\\.mint\\.lgbt|(?:www\\.)?vid\\.puffyan\\.us|(?:www\\.)?yewtu\\.be|(?:www\\.)?yt\\.elukerio\\.org|(?:www\\.)?yt\\.lelux\\.fi|(?:www\\.)?invidious\\.ggc-project\\.de|(?:www\\.)?yt\\.maisputain\\.ovh|(?:www\\.)?ytprivate\\.com|(?:www\\.)?invidious\\.13ad\\.de|(?:www\\.)?invidious\\.toot\\.koeln|(?:www\\.)?invidious\\.fdn\\.fr|(?:www\\.)?watch\\.nettohikari\\.com|(?:www\\.)?invidious\\.namazso\\.eu|(?:www\\.)?invidious\\.silkky\\.cloud|(?:www\\.)?invidious\\.exonip\\.de|(?:www\\.)?invidious\\.riverside\\.rocks|(?:www\\.)?invidious\\.blamefran\\.net|(?:www\\.)?invidious\\.moomoo\\.de|(?:www\\.)?ytb\\.trom\\.tf|(?:www\\.)?yt\\.cyberhost\\.uk|(?:www\\.)?kgg2m7yk5aybusll\\.onion|(?:www\\.)?qklhadlycap4cnod\\.onion|(?:www\\.)?axqzx4s6s54s32yentfqojs3x5i7faxza6xo3ehd4bzzsg2ii4fv2iid\\.onion|(?:www\\.)?c7hqkpkpemu6e7emz5b4vyz7idjgdvgaaa3dyimmeojqbgpea3xqjoid\\.onion|(?:www\\.)?fz253lmuao3strwbfbmx46yu7acac2jz27iwtorgmbqlkurlclmancad\\.onion|(?:www\\.)?invidious\\.l4qlywnpwqsluw65ts7md3khrivpirse744un3x7mlskqauz5pyuzgqd\\.onion|(?:www\\.)?owxfohz4kjyv25fvlqilyxast7inivgiktls3th44jhk3ej3i7ya\\.b32\\.i2p|(?:www\\.)?4l2dgddgsrkf2ous66i6seeyi6etzfgrue332grh2n7madpwopotugyd\\.onion|(?:www\\.)?w6ijuptxiku4xpnnaetxvnkc5vqcdu7mgns2u77qefoixi63vbvnpnqd\\.onion|(?:www\\.)?kbjggqkzv65ivcqj6bumvp337z6264huv5kpkwuv6gu5yjiskvan7fad\\.onion|(?:www\\.)?grwp24hodrefzvjjuccrkw3mjq4tzhaaq32amf33dzpmuxe7ilepcmad\\.onion|(?:www\\.)?hpniueoejy4opn7bc4ftgazyqjoeqwlvh2uiku2xqku6zpoa4bf5ruid\\.onion\n                         )/\n                         |(?:www\\.)?cleanvideosearch\\.com/media/action/yt/watch\\?videoId=\n                         )\n                     )?                                                       # all until now is optional -> you can pass the naked ID\n                     (?P<id>[0-9A-Za-z_-]{11})                                # here is it! the YouTube video ID\n                     (?(1).+)?                                                # if we found the ID, everything can follow\n                     $'
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube'
+
+    @classmethod
+    def suitable(cls, url):
+        # Hack for lazy extractors until more generic solution is implemented
+        # (see #28780)
+        from .youtube import parse_qs
+
+        qs = parse_qs(url)
+        if qs.get("list", [None])[0]:
+            return False
+        return super(YoutubeIE, cls).suitable(url)
+
+class YoutubeFavouritesIE(YoutubeBaseInfoExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/my_favorites|:ytfav(?:ou?rites)?'
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube:favorites'
+
+class YoutubeTabIE(YoutubeBaseInfoExtractor):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\\w+\\.)?\n                        (?:\n                            youtube(?:kids)?\\.com|\n                            invidio\\.us\n                        )/\n                        (?:\n                            (?:channel|c|user|feed|hashtag)/|\n                            (?:playlist|watch)\\?.*?\\blist=|\n                            (?!(?:watch|embed|v|e)\\b)\n                        )\n                        (?P<id>[^/?\\#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube:tab'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if YoutubeIE.suitable(url) else super(YoutubeTabIE, cls).suitable(url)
+        )
+
+class YoutubeFeedsInfoExtractor(YoutubeTabIE):
+    _VALID_URL = '(?x)\n                    https?://\n                        (?:\\w+\\.)?\n                        (?:\n                            youtube(?:kids)?\\.com|\n                            invidio\\.us\n                        )/\n                        (?:\n                            (?:channel|c|user|feed|hashtag)/|\n                            (?:playlist|watch)\\?.*?\\blist=|\n                            (?!(?:watch|embed|v|e)\\b)\n                        )\n                        (?P<id>[^/?\\#&]+)\n                    '
+    _module = 'pycord.ext.dl.extractor.youtube'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if YoutubeIE.suitable(url) else super(YoutubeTabIE, cls).suitable(url)
+        )
+
+class YoutubeHistoryIE(YoutubeFeedsInfoExtractor):
+    _VALID_URL = ':ythistory'
+    _module = 'pycord.ext.dl.extractor.youtube'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if YoutubeIE.suitable(url) else super(YoutubeTabIE, cls).suitable(url)
+        )
+
+class YoutubePlaylistIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)(?:\n                        (?:https?://)?\n                        (?:\\w+\\.)?\n                        (?:\n                            (?:\n                                youtube(?:kids)?\\.com|\n                                invidio\\.us\n                            )\n                            /.*?\\?.*?\\blist=\n                        )?\n                        (?P<id>(?:(?:PL|LL|EC|UU|FL|RD|UL|TL|PU|OLAK5uy_)[0-9A-Za-z-_]{10,}|RDMM))\n                     )'
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube:playlist'
+
+    @classmethod
+    def suitable(cls, url):
+        if YoutubeTabIE.suitable(url):
+            return False
+        # Hack for lazy extractors until more generic solution is implemented
+        # (see #28780)
+        from .youtube import parse_qs
+
+        qs = parse_qs(url)
+        if qs.get("v", [None])[0]:
+            return False
+        return super(YoutubePlaylistIE, cls).suitable(url)
+
+class YoutubeRecommendedIE(YoutubeFeedsInfoExtractor):
+    _VALID_URL = ':ytrec(?:ommended)?'
+    _module = 'pycord.ext.dl.extractor.youtube'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if YoutubeIE.suitable(url) else super(YoutubeTabIE, cls).suitable(url)
+        )
+
+class YoutubeSearchIE(LazyLoadSearchExtractor, YoutubeBaseInfoExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube:search'
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'ytsearch(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+class YoutubeSearchDateIE(YoutubeSearchIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube:search:date'
+
+    @classmethod
+    def suitable(cls, url):
+        return re.match(cls._make_valid_url(), url) is not None
+
+    @classmethod
+    def _make_valid_url(cls):
+        return 'ytsearchdate(?P<prefix>|[1-9][0-9]*|all):(?P<query>[\\s\\S]+)'
+
+class YoutubeSubscriptionsIE(YoutubeFeedsInfoExtractor):
+    _VALID_URL = ':ytsubs(?:criptions)?'
+    _module = 'pycord.ext.dl.extractor.youtube'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if YoutubeIE.suitable(url) else super(YoutubeTabIE, cls).suitable(url)
+        )
+
+class YoutubeTruncatedIDIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?youtube\\.com/watch\\?v=(?P<id>[0-9A-Za-z_-]{1,10})$'
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube:truncated_id'
+
+class YoutubeTruncatedURLIE(LazyLoadExtractor):
+    _VALID_URL = '(?x)\n        (?:https?://)?\n        (?:\\w+\\.)?[yY][oO][uU][tT][uU][bB][eE](?:-nocookie)?\\.com/\n        (?:watch\\?(?:\n            feature=[a-z_]+|\n            annotation_id=annotation_[^&]+|\n            x-yt-cl=[0-9]+|\n            hl=[^&]*|\n            t=[0-9]+\n        )?\n        |\n            attribution_link\\?a=[^&]+\n        )\n        $\n    '
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube:truncated_url'
+
+class YoutubeYtBeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://youtu\\.be/(?P<id>[0-9A-Za-z_-]{11})/*?.*?\\blist=(?P<playlist_id>(?:(?:PL|LL|EC|UU|FL|RD|UL|TL|PU|OLAK5uy_)[0-9A-Za-z-_]{10,}|RDMM))'
+    _module = 'pycord.ext.dl.extractor.youtube'
+
+class YoutubeYtUserIE(LazyLoadExtractor):
+    _VALID_URL = 'ytuser:(?P<id>.+)'
+    _module = 'pycord.ext.dl.extractor.youtube'
+
+class YoutubeWatchLaterIE(LazyLoadExtractor):
+    _VALID_URL = ':ytwatchlater'
+    _module = 'pycord.ext.dl.extractor.youtube'
+    IE_NAME = 'youtube:watchlater'
+
+class ZapiksIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?zapiks\\.(?:fr|com)/(?:(?:[a-z]{2}/)?(?P<display_id>.+?)\\.html|index\\.php\\?.*\\bmedia_id=(?P<id>\\d+))'
+    _module = 'pycord.ext.dl.extractor.zapiks'
+
+class ZattooPlatformBaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class ZattooBaseIE(ZattooPlatformBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class ZattooIE(ZattooBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?zattoo\\.com/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class BBVTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?bbv\\-tv\\.net/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class EinsUndEinsTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?1und1\\.tv/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class EWETVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?tvonline\\.ewe\\.de/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class GlattvisionTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?iptv\\.glattvision\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class MNetTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?tvplus\\.m\\-net\\.de/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class MyVisionTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?myvisiontv\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class NetPlusIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?netplus\\.tv/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class OsnatelTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?tvonline\\.osnatel\\.de/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class QuantumTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?quantum\\-tv\\.com/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class QuicklineBaseIE(ZattooPlatformBaseIE):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class QuicklineIE(QuicklineBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mobiltv\\.quickline\\.com/watch/(?P<channel>[^/]+)/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class QuicklineLiveIE(QuicklineBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?mobiltv\\.quickline\\.com/watch/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False
+            if QuicklineIE.suitable(url)
+            else super(QuicklineLiveIE, cls).suitable(url)
+        )
+
+class SaltTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?tv\\.salt\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class SAKTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?saktv\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class VTXTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?vtxtv\\.ch/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class WalyTVIE(ZattooIE):
+    _VALID_URL = 'https?://(?:www\\.)?player\\.waly\\.tv/watch/(?P<channel>[^/]+?)/(?P<id>[0-9]+)[^/]+(?:/(?P<recid>[0-9]+))?'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+class ZattooLiveIE(ZattooBaseIE):
+    _VALID_URL = 'https?://(?:www\\.)?zattoo\\.com/watch/(?P<id>[^/]+)'
+    _module = 'pycord.ext.dl.extractor.zattoo'
+
+    @classmethod
+    def suitable(cls, url):
+        return (
+            False if ZattooIE.suitable(url) else super(ZattooLiveIE, cls).suitable(url)
+        )
+
+class ZDFChannelIE(ZDFBaseIE):
+    _VALID_URL = 'https?://www\\.zdf\\.de/(?:[^/]+/)*(?P<id>[^/?#&]+)'
+    _module = 'pycord.ext.dl.extractor.zdf'
+
+    @classmethod
+    def suitable(cls, url):
+        return False if ZDFIE.suitable(url) else super(ZDFChannelIE, cls).suitable(url)
+
+class ZhihuIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://(?:www\\.)?zhihu\\.com/zvideo/(?P<id>[0-9]+)'
+    _module = 'pycord.ext.dl.extractor.zhihu'
+
+class ZingMp3BaseIE(LazyLoadExtractor):
+    _VALID_URL = None
+    _module = 'pycord.ext.dl.extractor.zingmp3'
+
+class ZingMp3IE(ZingMp3BaseIE):
+    _VALID_URL = 'https?://(?:mp3\\.zing|zingmp3)\\.vn/(?:bai-hat|video-clip)/[^/]+/(?P<id>\\w+)\\.html'
+    _module = 'pycord.ext.dl.extractor.zingmp3'
+    IE_NAME = 'zingmp3'
+
+class ZingMp3AlbumIE(ZingMp3BaseIE):
+    _VALID_URL = 'https?://(?:mp3\\.zing|zingmp3)\\.vn/(?:album|playlist)/[^/]+/(?P<id>\\w+)\\.html'
+    _module = 'pycord.ext.dl.extractor.zingmp3'
+    IE_NAME = 'zingmp3:album'
+
+class ZoomIE(LazyLoadExtractor):
+    _VALID_URL = '(?P<base_url>https?://(?:[^.]+\\.)?zoom.us/)rec(?:ording)?/(?:play|share)/(?P<id>[A-Za-z0-9_.-]+)'
+    _module = 'pycord.ext.dl.extractor.zoom'
+    IE_NAME = 'zoom'
+
+class ZypeIE(LazyLoadExtractor):
+    _VALID_URL = 'https?://player\\.zype\\.com/embed/(?P<id>[\\da-fA-F]+)\\.(?:js|json|html)\\?.*?(?:access_token|(?:ap[ip]|player)_key)=[^&]+'
+    _module = 'pycord.ext.dl.extractor.zype'
+
+class GenericIE(LazyLoadExtractor):
+    _VALID_URL = '.*'
+    _module = 'pycord.ext.dl.extractor.generic'
+    IE_NAME = 'generic'
+
+_ALL_CLASSES = [
+    ABCIE,
+    ABCIViewIE,
+    AbcNewsIE,
+    AbcNewsVideoIE,
+    ABCOTVSIE,
+    ABCOTVSClipsIE,
+    AcademicEarthCourseIE,
+    ACastIE,
+    ACastChannelIE,
+    ADNIE,
+    AdobeConnectIE,
+    AdobeTVEmbedIE,
+    AdobeTVIE,
+    AdobeTVShowIE,
+    AdobeTVChannelIE,
+    AdobeTVVideoIE,
+    AdultSwimIE,
+    AENetworksIE,
+    AENetworksCollectionIE,
+    AENetworksShowIE,
+    HistoryTopicIE,
+    HistoryPlayerIE,
+    BiographyIE,
+    AfreecaTVIE,
+    AirMozillaIE,
+    AlJazeeraIE,
+    AlphaPornoIE,
+    AmaraIE,
+    AMCNetworksIE,
+    AmericasTestKitchenIE,
+    AmericasTestKitchenSeasonIE,
+    AnimeOnDemandIE,
+    AnvatoIE,
+    AolIE,
+    AllocineIE,
+    AliExpressLiveIE,
+    APAIE,
+    AparatIE,
+    AppleConnectIE,
+    AppleTrailersIE,
+    AppleTrailersSectionIE,
+    ApplePodcastsIE,
+    ArchiveOrgIE,
+    ArcPublishingIE,
+    ArkenaIE,
+    ARDBetaMediathekIE,
+    ARDIE,
+    ARDMediathekIE,
+    ArteTVIE,
+    ArteTVEmbedIE,
+    ArteTVPlaylistIE,
+    ArnesIE,
+    AsianCrushIE,
+    AsianCrushPlaylistIE,
+    AtresPlayerIE,
+    ATTTechChannelIE,
+    ATVAtIE,
+    AudiMediaIE,
+    AudioBoomIE,
+    AudiomackIE,
+    AudiomackAlbumIE,
+    AWAANIE,
+    AWAANVideoIE,
+    AWAANLiveIE,
+    AWAANSeasonIE,
+    AZMedienIE,
+    BaiduVideoIE,
+    BandaiChannelIE,
+    BandcampIE,
+    BandcampAlbumIE,
+    BandcampWeeklyIE,
+    BBCCoUkIE,
+    BBCCoUkArticleIE,
+    BBCCoUkIPlayerEpisodesIE,
+    BBCCoUkIPlayerGroupIE,
+    BBCCoUkPlaylistIE,
+    BBCIE,
+    BeegIE,
+    BehindKinkIE,
+    BellMediaIE,
+    BeatportIE,
+    BetIE,
+    BFIPlayerIE,
+    BFMTVIE,
+    BFMTVLiveIE,
+    BFMTVArticleIE,
+    BibelTVIE,
+    BigflixIE,
+    BildIE,
+    BiliBiliIE,
+    BiliBiliBangumiIE,
+    BilibiliAudioIE,
+    BilibiliAudioAlbumIE,
+    BiliBiliPlayerIE,
+    BioBioChileTVIE,
+    BitChuteIE,
+    BitChuteChannelIE,
+    BIQLEIE,
+    BleacherReportIE,
+    BleacherReportCMSIE,
+    BloombergIE,
+    BokeCCIE,
+    BongaCamsIE,
+    BostonGlobeIE,
+    BoxIE,
+    BpbIE,
+    BRIE,
+    BRMediathekIE,
+    BravoTVIE,
+    BreakIE,
+    BrightcoveLegacyIE,
+    BrightcoveNewIE,
+    BusinessInsiderIE,
+    BuzzFeedIE,
+    BYUtvIE,
+    C56IE,
+    CamdemyIE,
+    CamdemyFolderIE,
+    CamModelsIE,
+    CamTubeIE,
+    CamWithHerIE,
+    CanalplusIE,
+    Canalc2IE,
+    CanvasIE,
+    CanvasEenIE,
+    VrtNUIE,
+    DagelijkseKostIE,
+    CarambaTVIE,
+    CarambaTVPageIE,
+    CartoonNetworkIE,
+    CBCIE,
+    CBCPlayerIE,
+    CBCWatchVideoIE,
+    CBCWatchIE,
+    CBCOlympicsIE,
+    CBSIE,
+    CBSLocalIE,
+    CBSLocalArticleIE,
+    CBSInteractiveIE,
+    CBSNewsEmbedIE,
+    CBSNewsIE,
+    CBSNewsLiveVideoIE,
+    CBSSportsEmbedIE,
+    CBSSportsIE,
+    TwentyFourSevenSportsIE,
+    CCCIE,
+    CCCPlaylistIE,
+    CCMAIE,
+    CCTVIE,
+    CDAIE,
+    CeskaTelevizeIE,
+    CeskaTelevizePoradyIE,
+    Channel9IE,
+    CharlieRoseIE,
+    ChaturbateIE,
+    ChilloutzoneIE,
+    ChirbitIE,
+    ChirbitProfileIE,
+    CinchcastIE,
+    CinemaxIE,
+    CiscoLiveSessionIE,
+    CiscoLiveSearchIE,
+    CJSWIE,
+    CliphunterIE,
+    ClippitIE,
+    ClipRsIE,
+    ClipsyndicateIE,
+    CloserToTruthIE,
+    CloudflareStreamIE,
+    CloudyIE,
+    ClubicIE,
+    ClypIE,
+    CMTIE,
+    CNBCIE,
+    CNBCVideoIE,
+    CNNIE,
+    CNNBlogsIE,
+    CNNArticleIE,
+    CoubIE,
+    ComedyCentralIE,
+    ComedyCentralTVIE,
+    CommonMistakesIE,
+    UnicodeBOMIE,
+    MmsIE,
+    RtmpIE,
+    CondeNastIE,
+    CONtvIE,
+    CorusIE,
+    CrackedIE,
+    CrackleIE,
+    CrooksAndLiarsIE,
+    CrunchyrollIE,
+    CrunchyrollShowPlaylistIE,
+    CSpanIE,
+    CtsNewsIE,
+    CTVIE,
+    CTVNewsIE,
+    CultureUnpluggedIE,
+    CuriosityStreamIE,
+    CuriosityStreamCollectionIE,
+    CWTVIE,
+    DailyMailIE,
+    DailymotionIE,
+    DailymotionPlaylistIE,
+    DailymotionUserIE,
+    DaumIE,
+    DaumClipIE,
+    DaumPlaylistIE,
+    DaumUserIE,
+    DBTVIE,
+    DctpTvIE,
+    DeezerPlaylistIE,
+    DemocracynowIE,
+    DFBIE,
+    DHMIE,
+    DiggIE,
+    DotsubIE,
+    DouyuShowIE,
+    DouyuTVIE,
+    DPlayIE,
+    DiscoveryPlusIE,
+    HGTVDeIE,
+    DreiSatIE,
+    DRBonanzaIE,
+    DrTuberIE,
+    DRTVIE,
+    DRTVLiveIE,
+    DTubeIE,
+    DVTVIE,
+    DumpertIE,
+    DefenseGouvFrIE,
+    DiscoveryIE,
+    DiscoveryGoIE,
+    DiscoveryGoPlaylistIE,
+    DiscoveryNetworksDeIE,
+    DiscoveryVRIE,
+    DisneyIE,
+    DigitallySpeakingIE,
+    DropboxIE,
+    DWIE,
+    DWArticleIE,
+    EaglePlatformIE,
+    EbaumsWorldIE,
+    EchoMskIE,
+    EggheadCourseIE,
+    EggheadLessonIE,
+    EHowIE,
+    EightTracksIE,
+    EinthusanIE,
+    EitbIE,
+    EllenTubeIE,
+    EllenTubeVideoIE,
+    EllenTubePlaylistIE,
+    ElPaisIE,
+    EmbedlyIE,
+    EngadgetIE,
+    EpornerIE,
+    EroProfileIE,
+    EscapistIE,
+    ESPNIE,
+    ESPNArticleIE,
+    FiveThirtyEightIE,
+    EsriVideoIE,
+    EuropaIE,
+    ExpoTVIE,
+    ExpressenIE,
+    ExtremeTubeIE,
+    EyedoTVIE,
+    FacebookIE,
+    FacebookPluginsVideoIE,
+    FazIE,
+    FC2IE,
+    FC2EmbedIE,
+    FczenitIE,
+    FilmOnIE,
+    FilmOnChannelIE,
+    FilmwebIE,
+    FirstTVIE,
+    FiveMinIE,
+    FiveTVIE,
+    FlickrIE,
+    FolketingetIE,
+    FootyRoomIE,
+    Formula1IE,
+    FourTubeIE,
+    PornTubeIE,
+    PornerBrosIE,
+    FuxIE,
+    FOXIE,
+    FOX9IE,
+    FOX9NewsIE,
+    FoxgayIE,
+    FoxNewsIE,
+    FoxNewsArticleIE,
+    FoxSportsIE,
+    FranceCultureIE,
+    FranceInterIE,
+    FranceTVIE,
+    FranceTVSiteIE,
+    FranceTVEmbedIE,
+    FranceTVInfoIE,
+    FranceTVInfoSportIE,
+    FranceTVJeunesseIE,
+    GenerationWhatIE,
+    CultureboxIE,
+    FreesoundIE,
+    FreespeechIE,
+    FreshLiveIE,
+    FrontendMastersIE,
+    FrontendMastersLessonIE,
+    FrontendMastersCourseIE,
+    FujiTVFODPlus7IE,
+    FunimationIE,
+    FunkIE,
+    FusionIE,
+    GaiaIE,
+    GameInformerIE,
+    GameSpotIE,
+    GameStarIE,
+    GaskrankIE,
+    GazetaIE,
+    GDCVaultIE,
+    GediDigitalIE,
+    GfycatIE,
+    GiantBombIE,
+    GigaIE,
+    GlideIE,
+    GloboIE,
+    GloboArticleIE,
+    GoIE,
+    GodTubeIE,
+    GolemIE,
+    GoogleDriveIE,
+    GooglePodcastsIE,
+    GooglePodcastsFeedIE,
+    GoogleSearchIE,
+    GoshgayIE,
+    GPUTechConfIE,
+    GrouponIE,
+    HBOIE,
+    HearThisAtIE,
+    HeiseIE,
+    HellPornoIE,
+    HelsinkiIE,
+    HentaiStigmaIE,
+    HGTVComShowIE,
+    HKETVIE,
+    HiDiveIE,
+    HistoricFilmsIE,
+    HitboxIE,
+    HitboxLiveIE,
+    HitRecordIE,
+    HornBunnyIE,
+    HotNewHipHopIE,
+    HotStarIE,
+    HotStarPlaylistIE,
+    HowcastIE,
+    HowStuffWorksIE,
+    HRTiIE,
+    HRTiPlaylistIE,
+    HuajiaoIE,
+    HuffPostIE,
+    HungamaIE,
+    HungamaSongIE,
+    HypemIE,
+    IGNIE,
+    IGNVideoIE,
+    IGNArticleIE,
+    IHeartRadioIE,
+    IHeartRadioPodcastIE,
+    ImdbIE,
+    ImdbListIE,
+    ImgurIE,
+    ImgurAlbumIE,
+    ImgurGalleryIE,
+    InaIE,
+    IncIE,
+    IndavideoEmbedIE,
+    InfoQIE,
+    InstagramIE,
+    InstagramUserIE,
+    InstagramTagIE,
+    InternazionaleIE,
+    InternetVideoArchiveIE,
+    IPrimaIE,
+    IqiyiIE,
+    Ir90TvIE,
+    ITVIE,
+    ITVBTCCIE,
+    IviIE,
+    IviCompilationIE,
+    IvideonIE,
+    IwaraIE,
+    IzleseneIE,
+    JamendoIE,
+    JamendoAlbumIE,
+    JeuxVideoIE,
+    JoveIE,
+    JojIE,
+    JWPlatformIE,
+    KakaoIE,
+    KalturaIE,
+    KankanIE,
+    KaraoketvIE,
+    KarriereVideosIE,
+    KeezMoviesIE,
+    KetnetIE,
+    KhanAcademyIE,
+    KhanAcademyUnitIE,
+    KickStarterIE,
+    KinjaEmbedIE,
+    KinoPoiskIE,
+    KonserthusetPlayIE,
+    KrasViewIE,
+    Ku6IE,
+    KUSIIE,
+    KuwoIE,
+    KuwoAlbumIE,
+    KuwoChartIE,
+    KuwoSingerIE,
+    KuwoCategoryIE,
+    KuwoMvIE,
+    LA7IE,
+    Laola1TvEmbedIE,
+    Laola1TvIE,
+    EHFTVIE,
+    ITTFIE,
+    LBRYIE,
+    LBRYChannelIE,
+    LCIIE,
+    LcpPlayIE,
+    LcpIE,
+    Lecture2GoIE,
+    LecturioIE,
+    LecturioCourseIE,
+    LecturioDeCourseIE,
+    LeIE,
+    LePlaylistIE,
+    LetvCloudIE,
+    LEGOIE,
+    LemondeIE,
+    LentaIE,
+    LibraryOfCongressIE,
+    LibsynIE,
+    LifeNewsIE,
+    LifeEmbedIE,
+    LimelightMediaIE,
+    LimelightChannelIE,
+    LimelightChannelListIE,
+    LineTVIE,
+    LineLiveIE,
+    LineLiveChannelIE,
+    LinkedInLearningIE,
+    LinkedInLearningCourseIE,
+    LinuxAcademyIE,
+    LiTVIE,
+    LiveJournalIE,
+    LivestreamIE,
+    LivestreamOriginalIE,
+    LivestreamShortenerIE,
+    LnkGoIE,
+    LocalNews8IE,
+    LoveHomePornIE,
+    LRTIE,
+    LyndaIE,
+    LyndaCourseIE,
+    M6IE,
+    MailRuIE,
+    MailRuMusicIE,
+    MailRuMusicSearchIE,
+    MallTVIE,
+    MangomoloVideoIE,
+    MangomoloLiveIE,
+    ManyVidsIE,
+    MaoriTVIE,
+    MarkizaIE,
+    MarkizaPageIE,
+    MassengeschmackTVIE,
+    MatchTVIE,
+    MDRIE,
+    MedalTVIE,
+    MediasetIE,
+    MediasiteIE,
+    MediasiteCatalogIE,
+    MediasiteNamedCatalogIE,
+    MediciIE,
+    MegaphoneIE,
+    MeipaiIE,
+    MelonVODIE,
+    METAIE,
+    MetacafeIE,
+    MetacriticIE,
+    MgoonIE,
+    MGTVIE,
+    MiaoPaiIE,
+    MicrosoftVirtualAcademyIE,
+    MicrosoftVirtualAcademyCourseIE,
+    MindsIE,
+    MindsChannelIE,
+    MindsGroupIE,
+    MinistryGridIE,
+    MinotoIE,
+    MioMioIE,
+    TechTVMITIE,
+    OCWMITIE,
+    MiTeleIE,
+    MixcloudIE,
+    MixcloudUserIE,
+    MixcloudPlaylistIE,
+    MLBIE,
+    MLBVideoIE,
+    MnetIE,
+    MoeVideoIE,
+    MofosexIE,
+    MofosexEmbedIE,
+    MojvideoIE,
+    MorningstarIE,
+    MotherlessIE,
+    MotherlessGroupIE,
+    MotorsportIE,
+    MovieClipsIE,
+    MoviezineIE,
+    MovingImageIE,
+    MSNIE,
+    MTVIE,
+    MTVVideoIE,
+    MTVServicesEmbeddedIE,
+    MTVDEIE,
+    MTVJapanIE,
+    MuenchenTVIE,
+    MwaveIE,
+    MwaveMeetGreetIE,
+    MyChannelsIE,
+    MySpaceIE,
+    MySpaceAlbumIE,
+    MySpassIE,
+    MyviIE,
+    MyviEmbedIE,
+    MyVidsterIE,
+    NationalGeographicVideoIE,
+    NationalGeographicTVIE,
+    NaverIE,
+    NBAWatchEmbedIE,
+    NBAWatchIE,
+    NBAWatchCollectionIE,
+    NBAEmbedIE,
+    NBAIE,
+    NBAChannelIE,
+    NBCIE,
+    NBCNewsIE,
+    NBCOlympicsIE,
+    NBCOlympicsStreamIE,
+    NBCSportsIE,
+    NBCSportsStreamIE,
+    NBCSportsVPlayerIE,
+    NDRIE,
+    NJoyIE,
+    NDREmbedBaseIE,
+    NDREmbedIE,
+    NJoyEmbedIE,
+    NDTVIE,
+    NetzkinoIE,
+    NerdCubedFeedIE,
+    NetEaseMusicIE,
+    NetEaseMusicAlbumIE,
+    NetEaseMusicSingerIE,
+    NetEaseMusicListIE,
+    NetEaseMusicMvIE,
+    NetEaseMusicProgramIE,
+    NetEaseMusicDjRadioIE,
+    NewgroundsIE,
+    NewgroundsPlaylistIE,
+    NewstubeIE,
+    NextMediaIE,
+    NextMediaActionNewsIE,
+    AppleDailyIE,
+    NextTVIE,
+    NexxIE,
+    NexxEmbedIE,
+    NFLIE,
+    NFLArticleIE,
+    NhkVodIE,
+    NhkVodProgramIE,
+    NHLIE,
+    NickIE,
+    NickBrIE,
+    NickDeIE,
+    NickNightIE,
+    NickRuIE,
+    NiconicoIE,
+    NiconicoPlaylistIE,
+    NineCNineMediaIE,
+    NineGagIE,
+    NineNowIE,
+    NintendoIE,
+    NJPWWorldIE,
+    NobelPrizeIE,
+    NonkTubeIE,
+    NoovoIE,
+    NormalbootsIE,
+    NosVideoIE,
+    NovaEmbedIE,
+    NovaIE,
+    NownessIE,
+    NownessPlaylistIE,
+    NownessSeriesIE,
+    NozIE,
+    AndereTijdenIE,
+    NPOIE,
+    NPOLiveIE,
+    NPORadioIE,
+    NPORadioFragmentIE,
+    SchoolTVIE,
+    HetKlokhuisIE,
+    VPROIE,
+    WNLIE,
+    NprIE,
+    NRKIE,
+    NRKPlaylistIE,
+    NRKSkoleIE,
+    NRKTVIE,
+    NRKTVDirekteIE,
+    NRKRadioPodkastIE,
+    NRKTVEpisodeIE,
+    NRKTVEpisodesIE,
+    NRKTVSeasonIE,
+    NRKTVSeriesIE,
+    NRLTVIE,
+    NTVCoJpCUIE,
+    NTVDeIE,
+    NTVRuIE,
+    NYTimesIE,
+    NYTimesArticleIE,
+    NYTimesCookingIE,
+    NuvidIE,
+    NZZIE,
+    OdaTVIE,
+    OdnoklassnikiIE,
+    OktoberfestTVIE,
+    OnDemandKoreaIE,
+    OnetIE,
+    OnetChannelIE,
+    OnetMVPIE,
+    OnetPlIE,
+    OnionStudiosIE,
+    OoyalaIE,
+    OoyalaExternalIE,
+    OraTVIE,
+    ORFTVthekIE,
+    ORFFM4IE,
+    ORFFM4StoryIE,
+    ORFOE1IE,
+    ORFOE3IE,
+    ORFNOEIE,
+    ORFWIEIE,
+    ORFBGLIE,
+    ORFOOEIE,
+    ORFSTMIE,
+    ORFKTNIE,
+    ORFSBGIE,
+    ORFTIRIE,
+    ORFVBGIE,
+    ORFIPTVIE,
+    OutsideTVIE,
+    PacktPubIE,
+    PacktPubCourseIE,
+    PalcoMP3IE,
+    PalcoMP3ArtistIE,
+    PalcoMP3VideoIE,
+    PandoraTVIE,
+    ParliamentLiveUKIE,
+    PatreonIE,
+    PBSIE,
+    PearVideoIE,
+    PeerTubeIE,
+    PeopleIE,
+    PerformGroupIE,
+    PeriscopeIE,
+    PeriscopeUserIE,
+    PhilharmonieDeParisIE,
+    PhoenixIE,
+    PhotobucketIE,
+    PicartoIE,
+    PicartoVodIE,
+    PikselIE,
+    PinkbikeIE,
+    PinterestIE,
+    PinterestCollectionIE,
+    PladformIE,
+    PlatziIE,
+    PlatziCourseIE,
+    PlayFMIE,
+    PlayPlusTVIE,
+    PlaysTVIE,
+    PlayStuffIE,
+    PlaytvakIE,
+    PlayvidIE,
+    PlaywireIE,
+    PluralsightIE,
+    PluralsightCourseIE,
+    PodomaticIE,
+    PokemonIE,
+    PolskieRadioIE,
+    PolskieRadioCategoryIE,
+    PopcorntimesIE,
+    PopcornTVIE,
+    Porn91IE,
+    PornComIE,
+    PornHdIE,
+    PornHubIE,
+    PornHubUserIE,
+    PornHubPagedVideoListIE,
+    PornHubUserVideosUploadIE,
+    PornotubeIE,
+    PornoVoisinesIE,
+    PornoXOIE,
+    PuhuTVIE,
+    PuhuTVSerieIE,
+    PressTVIE,
+    ProSiebenSat1IE,
+    Puls4IE,
+    PyvideoIE,
+    QQMusicIE,
+    QQMusicSingerIE,
+    QQMusicAlbumIE,
+    QQMusicToplistIE,
+    QQMusicPlaylistIE,
+    R7IE,
+    R7ArticleIE,
+    RadioCanadaIE,
+    RadioCanadaAudioVideoIE,
+    RadioDeIE,
+    RadioJavanIE,
+    RadioBremenIE,
+    RadioFranceIE,
+    RaiPlayIE,
+    RaiPlayLiveIE,
+    RaiPlayPlaylistIE,
+    RaiIE,
+    RayWenderlichIE,
+    RayWenderlichCourseIE,
+    RBMARadioIE,
+    RDSIE,
+    RedBullTVIE,
+    RedBullEmbedIE,
+    RedBullTVRrnContentIE,
+    RedBullIE,
+    RedditIE,
+    RedditRIE,
+    RedTubeIE,
+    RegioTVIE,
+    RENTVIE,
+    RENTVArticleIE,
+    RestudyIE,
+    ReutersIE,
+    ReverbNationIE,
+    RICEIE,
+    RMCDecouverteIE,
+    Ro220IE,
+    RockstarGamesIE,
+    RoosterTeethIE,
+    RottenTomatoesIE,
+    RoxwelIE,
+    RozhlasIE,
+    RTBFIE,
+    RteIE,
+    RteRadioIE,
+    RtlNlIE,
+    RTL2IE,
+    RTL2YouIE,
+    RTL2YouSeriesIE,
+    RTPIE,
+    RTSIE,
+    RTVEALaCartaIE,
+    RTVELiveIE,
+    RTVEInfantilIE,
+    RTVETelevisionIE,
+    RTVNHIE,
+    RTVSIE,
+    RUHDIE,
+    RumbleEmbedIE,
+    RutubeIE,
+    RutubeChannelIE,
+    RutubeEmbedIE,
+    RutubeMovieIE,
+    RutubePersonIE,
+    RutubePlaylistIE,
+    RUTVIE,
+    RuutuIE,
+    RuvIE,
+    SafariIE,
+    SafariApiIE,
+    SafariCourseIE,
+    SampleFocusIE,
+    SapoIE,
+    SaveFromIE,
+    SBSIE,
+    ScreencastIE,
+    ScreencastOMaticIE,
+    ScrippsNetworksWatchIE,
+    ScrippsNetworksIE,
+    SCTEIE,
+    SCTECourseIE,
+    SeekerIE,
+    SenateISVPIE,
+    SendtoNewsIE,
+    ServusIE,
+    SevenPlusIE,
+    SexuIE,
+    SeznamZpravyIE,
+    SeznamZpravyArticleIE,
+    ShahidIE,
+    ShahidShowIE,
+    SharedIE,
+    VivoIE,
+    ShowRoomLiveIE,
+    SimplecastIE,
+    SimplecastEpisodeIE,
+    SimplecastPodcastIE,
+    SinaIE,
+    SixPlayIE,
+    SkyItPlayerIE,
+    SkyItVideoIE,
+    SkyItVideoLiveIE,
+    SkyItIE,
+    SkyItAcademyIE,
+    SkyItArteIE,
+    CieloTVItIE,
+    TV8ItIE,
+    SkylineWebcamsIE,
+    SkyNewsArabiaIE,
+    SkyNewsArabiaArticleIE,
+    SkyNewsIE,
+    SkySportsIE,
+    SkySportsNewsIE,
+    SlideshareIE,
+    SlidesLiveIE,
+    SlutloadIE,
+    SnotrIE,
+    SohuIE,
+    SonyLIVIE,
+    SoundcloudEmbedIE,
+    SoundcloudIE,
+    SoundcloudSetIE,
+    SoundcloudUserIE,
+    SoundcloudTrackStationIE,
+    SoundcloudPlaylistIE,
+    SoundcloudSearchIE,
+    SoundgasmIE,
+    SoundgasmProfileIE,
+    SouthParkIE,
+    SouthParkDeIE,
+    SouthParkDkIE,
+    SouthParkEsIE,
+    SouthParkNlIE,
+    SpankBangIE,
+    SpankBangPlaylistIE,
+    SpankwireIE,
+    SpiegelIE,
+    BellatorIE,
+    ParamountNetworkIE,
+    StitcherIE,
+    StitcherShowIE,
+    Sport5IE,
+    SportBoxIE,
+    SportDeutschlandIE,
+    SpotifyIE,
+    SpotifyShowIE,
+    SpreakerIE,
+    SpreakerPageIE,
+    SpreakerShowIE,
+    SpreakerShowPageIE,
+    SpringboardPlatformIE,
+    SproutIE,
+    SRGSSRIE,
+    SRGSSRPlayIE,
+    SRMediathekIE,
+    StanfordOpenClassroomIE,
+    SteamIE,
+    StoryFireIE,
+    StoryFireUserIE,
+    StoryFireSeriesIE,
+    StreamableIE,
+    StreamcloudIE,
+    StreamCZIE,
+    StreetVoiceIE,
+    StretchInternetIE,
+    STVPlayerIE,
+    SunPornoIE,
+    SverigesRadioEpisodeIE,
+    SverigesRadioPublicationIE,
+    SVTIE,
+    SVTPageIE,
+    SVTPlayIE,
+    SVTSeriesIE,
+    SWRMediathekIE,
+    SyfyIE,
+    SztvHuIE,
+    TagesschauPlayerIE,
+    TagesschauIE,
+    TassIE,
+    TBSIE,
+    TDSLifewayIE,
+    TeachableIE,
+    TeachableCourseIE,
+    TeacherTubeIE,
+    TeacherTubeUserIE,
+    TeachingChannelIE,
+    TeamcocoIE,
+    TeamTreeHouseIE,
+    TechTalksIE,
+    TEDIE,
+    Tele5IE,
+    Tele13IE,
+    TeleBruxellesIE,
+    TelecincoIE,
+    TelegraafIE,
+    TeleMBIE,
+    TeleQuebecIE,
+    TeleQuebecSquatIE,
+    TeleQuebecEmissionIE,
+    TeleQuebecLiveIE,
+    TeleQuebecVideoIE,
+    TeleTaskIE,
+    TelewebionIE,
+    TennisTVIE,
+    TenPlayIE,
+    TestURLIE,
+    TF1IE,
+    TFOIE,
+    TheInterceptIE,
+    ThePlatformIE,
+    ThePlatformFeedIE,
+    TheSceneIE,
+    TheStarIE,
+    TheSunIE,
+    TheWeatherChannelIE,
+    ThisAmericanLifeIE,
+    ThisAVIE,
+    ThisOldHouseIE,
+    ThreeQSDNIE,
+    TikTokIE,
+    TikTokUserIE,
+    TinyPicIE,
+    TMZIE,
+    TMZArticleIE,
+    TNAFlixNetworkEmbedIE,
+    TNAFlixIE,
+    EMPFlixIE,
+    MovieFapIE,
+    ToggleIE,
+    MeWatchIE,
+    TOnlineIE,
+    ToonGogglesIE,
+    TouTvIE,
+    ToypicsUserIE,
+    ToypicsIE,
+    TrailerAddictIE,
+    TriluliluIE,
+    TrovoIE,
+    TrovoVodIE,
+    TruNewsIE,
+    TruTVIE,
+    Tube8IE,
+    TubiTvIE,
+    TumblrIE,
+    TuneInClipIE,
+    TuneInStationIE,
+    TuneInProgramIE,
+    TuneInTopicIE,
+    TuneInShortenerIE,
+    TunePkIE,
+    TurboIE,
+    TV2IE,
+    TV2ArticleIE,
+    KatsomoIE,
+    MTVUutisetArticleIE,
+    TV2DKIE,
+    TV2DKBornholmPlayIE,
+    TV2HuIE,
+    TV4IE,
+    TV5MondePlusIE,
+    TV5UnisVideoIE,
+    TV5UnisIE,
+    TVAIE,
+    QubIE,
+    TVANouvellesIE,
+    TVANouvellesArticleIE,
+    TVCIE,
+    TVCArticleIE,
+    TVerIE,
+    TvigleIE,
+    TVLandIE,
+    TVN24IE,
+    TVNetIE,
+    TVNoeIE,
+    TVNowIE,
+    TVNowNewIE,
+    TVNowSeasonIE,
+    TVNowAnnualIE,
+    TVNowShowIE,
+    TVPEmbedIE,
+    TVPIE,
+    TVPWebsiteIE,
+    TVPlayIE,
+    ViafreeIE,
+    TVPlayHomeIE,
+    TVPlayerIE,
+    TweakersIE,
+    TwentyFourVideoIE,
+    TwentyMinutenIE,
+    TwentyThreeVideoIE,
+    TwitCastingIE,
+    TwitchVodIE,
+    TwitchCollectionIE,
+    TwitchVideosIE,
+    TwitchVideosClipsIE,
+    TwitchVideosCollectionsIE,
+    TwitchStreamIE,
+    TwitchClipsIE,
+    TwitterCardIE,
+    TwitterIE,
+    TwitterAmplifyIE,
+    TwitterBroadcastIE,
+    UdemyIE,
+    UdemyCourseIE,
+    UDNEmbedIE,
+    UFCTVIE,
+    UFCArabiaIE,
+    UKTVPlayIE,
+    DigitekaIE,
+    DLiveVODIE,
+    DLiveStreamIE,
+    UMGDeIE,
+    UnistraIE,
+    UnityIE,
+    UOLIE,
+    UplynkIE,
+    UplynkPreplayIE,
+    UrortIE,
+    URPlayIE,
+    USANetworkIE,
+    USATodayIE,
+    UstreamIE,
+    UstreamChannelIE,
+    UstudioIE,
+    UstudioEmbedIE,
+    Varzesh3IE,
+    Vbox7IE,
+    VeeHDIE,
+    VeohIE,
+    VestiIE,
+    VevoIE,
+    VevoPlaylistIE,
+    BTArticleIE,
+    BTVestlendingenIE,
+    VGTVIE,
+    VH1IE,
+    ViceIE,
+    ViceArticleIE,
+    ViceShowIE,
+    VidbitIE,
+    ViddlerIE,
+    VideaIE,
+    VideoDetectiveIE,
+    VideofyMeIE,
+    VideomoreIE,
+    VideomoreVideoIE,
+    VideomoreSeasonIE,
+    VideoPressIE,
+    VidioIE,
+    VidLiiIE,
+    VidmeIE,
+    VidmeUserIE,
+    VidmeUserLikesIE,
+    VierIE,
+    VierVideosIE,
+    ViewLiftIE,
+    ViewLiftEmbedIE,
+    ViideaIE,
+    VimeoIE,
+    VimeoAlbumIE,
+    VimeoChannelIE,
+    VimeoGroupsIE,
+    VimeoLikesIE,
+    VimeoOndemandIE,
+    VimeoReviewIE,
+    VimeoUserIE,
+    VimeoWatchLaterIE,
+    VHXEmbedIE,
+    VimpleIE,
+    VineIE,
+    VineUserIE,
+    VikiIE,
+    VikiChannelIE,
+    ViqeoIE,
+    ViuIE,
+    ViuPlaylistIE,
+    ViuOTTIE,
+    VKIE,
+    VKUserVideosIE,
+    VKWallPostIE,
+    VLiveIE,
+    VLivePostIE,
+    VLiveChannelIE,
+    VodlockerIE,
+    VODPlIE,
+    VODPlatformIE,
+    VoiceRepublicIE,
+    VootIE,
+    VoxMediaVolumeIE,
+    VoxMediaIE,
+    VRTIE,
+    VrakIE,
+    VRVIE,
+    VRVSeriesIE,
+    VShareIE,
+    VTMIE,
+    MedialaanIE,
+    VubeIE,
+    VuClipIE,
+    VVVVIDIE,
+    VVVVIDShowIE,
+    VyboryMosIE,
+    VzaarIE,
+    WakanimIE,
+    WallaIE,
+    WashingtonPostIE,
+    WashingtonPostArticleIE,
+    WatIE,
+    WatchBoxIE,
+    WatchIndianPornIE,
+    WDRIE,
+    WDRPageIE,
+    WDRElefantIE,
+    WDRMobileIE,
+    WebcasterIE,
+    WebcasterFeedIE,
+    WebOfStoriesIE,
+    WebOfStoriesPlaylistIE,
+    WeiboIE,
+    WeiboMobileIE,
+    WeiqiTVIE,
+    WistiaIE,
+    WistiaPlaylistIE,
+    WorldStarHipHopIE,
+    WSJIE,
+    WSJArticleIE,
+    WWEIE,
+    XBefIE,
+    XboxClipsIE,
+    XFileShareIE,
+    XHamsterIE,
+    XHamsterEmbedIE,
+    XHamsterUserIE,
+    XiamiSongIE,
+    XiamiAlbumIE,
+    XiamiArtistIE,
+    XiamiCollectionIE,
+    XimalayaIE,
+    XimalayaAlbumIE,
+    XMinusIE,
+    XNXXIE,
+    XstreamIE,
+    XTubeUserIE,
+    XTubeIE,
+    XuiteIE,
+    XVideosIE,
+    XXXYMoviesIE,
+    YahooIE,
+    YahooSearchIE,
+    YahooGyaOPlayerIE,
+    YahooGyaOIE,
+    YahooJapanNewsIE,
+    YandexDiskIE,
+    YandexMusicTrackIE,
+    YandexMusicAlbumIE,
+    YandexMusicPlaylistIE,
+    YandexMusicArtistTracksIE,
+    YandexMusicArtistAlbumsIE,
+    YandexVideoIE,
+    YapFilesIE,
+    YesJapanIE,
+    YinYueTaiIE,
+    YnetIE,
+    YouJizzIE,
+    YoukuIE,
+    YoukuShowIE,
+    YouNowLiveIE,
+    YouNowChannelIE,
+    YouNowMomentIE,
+    YouPornIE,
+    YourPornIE,
+    YourUploadIE,
+    YoutubeIE,
+    YoutubeFavouritesIE,
+    YoutubeHistoryIE,
+    YoutubeTabIE,
+    YoutubePlaylistIE,
+    YoutubeRecommendedIE,
+    YoutubeSearchDateIE,
+    YoutubeSearchIE,
+    YoutubeSubscriptionsIE,
+    YoutubeTruncatedIDIE,
+    YoutubeTruncatedURLIE,
+    YoutubeYtBeIE,
+    YoutubeYtUserIE,
+    YoutubeWatchLaterIE,
+    ZapiksIE,
+    BBVTVIE,
+    EinsUndEinsTVIE,
+    EWETVIE,
+    GlattvisionTVIE,
+    MNetTVIE,
+    MyVisionTVIE,
+    NetPlusIE,
+    OsnatelTVIE,
+    QuantumTVIE,
+    QuicklineIE,
+    QuicklineLiveIE,
+    SaltTVIE,
+    SAKTVIE,
+    VTXTVIE,
+    WalyTVIE,
+    ZattooIE,
+    ZattooLiveIE,
+    ZDFIE,
+    ZDFChannelIE,
+    ZhihuIE,
+    ZingMp3IE,
+    ZingMp3AlbumIE,
+    ZoomIE,
+    ZypeIE,
+    GenericIE,
+]
+
+_HOSTS = {
+    'ABCIE': ('pycord.ext.dl.extractor.abc', ('abc.net.au', 'www.abc.net.au')),
+    'ABCIViewIE': ('pycord.ext.dl.extractor.abc', ('iview.abc.net.au',)),
+    'AbcNewsIE': ('pycord.ext.dl.extractor.abcnews', ('abcnews.go.com',)),
+    'AbcNewsVideoIE': ('pycord.ext.dl.extractor.abcnews', ('abcnews.go.com', 'fivethirtyeight.abcnews.go.com')),
+    'ABCOTVSIE': ('pycord.ext.dl.extractor.abcotvs', ('6abc.com', 'abc11.com', 'abc13.com', 'abc30.com', 'abc7.com', 'abc7chicago.com', 'abc7news.com', 'abc7ny.com')),
+    'ABCOTVSClipsIE': ('pycord.ext.dl.extractor.abcotvs', ('clips.abcotvs.com',)),
+    'AcademicEarthCourseIE': ('pycord.ext.dl.extractor.academicearth', ('academicearth.org', 'www.academicearth.org')),
+    'ACastIE': ('pycord.ext.dl.extractor.acast', ('acast.com', 'embed.acast.com', 'play.acast.com', 'www.acast.com')),
+    'ACastChannelIE': ('pycord.ext.dl.extractor.acast', ('acast.com', 'play.acast.com', 'www.acast.com')),
+    'ADNIE': ('pycord.ext.dl.extractor.adn', ('animedigitalnetwork.fr', 'www.animedigitalnetwork.fr')),
+    'AdobeConnectIE': ('pycord.ext.dl.extractor.adobeconnect', ('adobeconnect.com',)),
+    'AdobeTVEmbedIE': ('pycord.ext.dl.extractor.adobetv', ('tv.adobe.com',)),
+    'AdobeTVIE': ('pycord.ext.dl.extractor.adobetv', ('tv.adobe.com',)),
+    'AdobeTVShowIE': ('pycord.ext.dl.extractor.adobetv', ('tv.adobe.com',)),
+    'AdobeTVChannelIE': ('pycord.ext.dl.extractor.adobetv', ('tv.adobe.com',)),
+    'AdobeTVVideoIE': ('pycord.ext.dl.extractor.adobetv', ('video.tv.adobe.com',)),
+    'AdultSwimIE': ('pycord.ext.dl.extractor.adultswim', ('adultswim.com', 'www.adultswim.com')),
+    'AENetworksIE': ('pycord.ext.dl.extractor.aenetworks', ('aetv.com', 'fyi.tv', 'history.com', 'historyvault.com', 'lifetimemovieclub.com', 'mylifetime.com', 'play.aetv.com', 'play.fyi.tv', 'play.history.com', 'play.historyvault.com', 'play.lifetimemovieclub.com', 'play.mylifetime.com', 'watch.aetv.com', 'watch.fyi.tv', 'watch.history.com', 'watch.historyvault.com', 'watch.lifetimemovieclub.com', 'watch.mylifetime.com', 'www.aetv.com', 'www.fyi.tv', 'www.history.com', 'www.historyvault.com', 'www.lifetimemovieclub.com', 'www.mylifetime.com')),
+    'AENetworksCollectionIE': ('pycord.ext.dl.extractor.aenetworks', ('aetv.com', 'fyi.tv', 'history.com', 'historyvault.com', 'lifetimemovieclub.com', 'mylifetime.com', 'play.aetv.com', 'play.fyi.tv', 'play.history.com', 'play.historyvault.com', 'play.lifetimemovieclub.com', 'play.mylifetime.com', 'watch.aetv.com', 'watch.fyi.tv', 'watch.history.com', 'watch.historyvault.com', 'watch.lifetimemovieclub.com', 'watch.mylifetime.com', 'www.aetv.com', 'www.fyi.tv', 'www.history.com', 'www.historyvault.com', 'www.lifetimemovieclub.com', 'www.mylifetime.com')),
+    'AENetworksShowIE': ('pycord.ext.dl.extractor.aenetworks', ('aetv.com', 'fyi.tv', 'history.com', 'historyvault.com', 'lifetimemovieclub.com', 'mylifetime.com', 'play.aetv.com', 'play.fyi.tv', 'play.history.com', 'play.historyvault.com', 'play.lifetimemovieclub.com', 'play.mylifetime.com', 'watch.aetv.com', 'watch.fyi.tv', 'watch.history.com', 'watch.historyvault.com', 'watch.lifetimemovieclub.com', 'watch.mylifetime.com', 'www.aetv.com', 'www.fyi.tv', 'www.history.com', 'www.historyvault.com', 'www.lifetimemovieclub.com', 'www.mylifetime.com')),
+    'HistoryTopicIE': ('pycord.ext.dl.extractor.aenetworks', ('history.com', 'www.history.com')),
+    'HistoryPlayerIE': ('pycord.ext.dl.extractor.aenetworks', ('biography.com', 'history.com', 'www.biography.com', 'www.history.com')),
+    'BiographyIE': ('pycord.ext.dl.extractor.aenetworks', ('biography.com', 'www.biography.com')),
+    'AfreecaTVIE': ('pycord.ext.dl.extractor.afreecatv', ('afbbs.afreeca.com', 'afbbs.afreecatv.com', 'afreeca.com', 'afreecatv.com', 'live.afreeca.com', 'live.afreecatv.com', 'vod.afreecatv.com', 'www.afreeca.com', 'www.afreecatv.com')),
+    'AirMozillaIE': ('pycord.ext.dl.extractor.airmozilla', ('air.mozilla.org',)),
+    'AlJazeeraIE': ('pycord.ext.dl.extractor.aljazeera', ('aljazeera.com', 'www.aljazeera.com')),
+    'AlphaPornoIE': ('pycord.ext.dl.extractor.alphaporno', ('alphaporno.com', 'www.alphaporno.com')),
+    'AmaraIE': ('pycord.ext.dl.extractor.amara', ('amara.org', 'www.amara.org')),
+    'AMCNetworksIE': ('pycord.ext.dl.extractor.amcnetworks', ('amc.com', 'bbcamerica.com', 'ifc.com', 'sundancetv.com', 'wetv.com', 'www.amc.com', 'www.bbcamerica.com', 'www.ifc.com', 'www.sundancetv.com', 'www.wetv.com')),
+    'AmericasTestKitchenIE': ('pycord.ext.dl.extractor.americastestkitchen', ('americastestkitchen.com', 'cookscountry.com', 'cooksillustrated.com', 'www.americastestkitchen.com', 'www.cookscountry.com', 'www.cooksillustrated.com')),
+    'AmericasTestKitchenSeasonIE': ('pycord.ext.dl.extractor.americastestkitchen', ('americastestkitchen.com', 'cookscountry.com', 'www.americastestkitchen.com', 'www.cookscountry.com')),
+    'AnimeOnDemandIE': ('pycord.ext.dl.extractor.animeondemand', ('anime-on-demand.de', 'www.anime-on-demand.de')),
+    'AnvatoIE': ('pycord.ext.dl.extractor.anvato', ('anvato:',)),
+    'AolIE': ('pycord.ext.dl.extractor.aol', ('aol-video:', 'aol.ca', 'aol.co.uk', 'aol.com', 'aol.de', 'aol.jp', 'www.aol.ca', 'www.aol.co.uk', 'www.aol.com', 'www.aol.de', 'www.aol.jp')),
+    'AllocineIE': ('pycord.ext.dl.extractor.allocine', ('allocine.fr', 'www.allocine.fr')),
+    'AliExpressLiveIE': ('pycord.ext.dl.extractor.aliexpress', ('live.aliexpress.com',)),
+    'APAIE': ('pycord.ext.dl.extractor.apa', ('apa.at',)),
+    'AparatIE': ('pycord.ext.dl.extractor.aparat', ('aparat.com', 'www.aparat.com')),
+    'AppleConnectIE': ('pycord.ext.dl.extractor.appleconnect', ('itunes.apple.com',)),
+    'AppleTrailersIE': ('pycord.ext.dl.extractor.appletrailers', ('movietrailers.apple.com', 'trailers.apple.com', 'www.trailers.apple.com')),
+    'AppleTrailersSectionIE': ('pycord.ext.dl.extractor.appletrailers', ('trailers.apple.com', 'www.trailers.apple.com')),
+    'ApplePodcastsIE': ('pycord.ext.dl.extractor.applepodcasts', ('podcasts.apple.com',)),
+    'ArchiveOrgIE': ('pycord.ext.dl.extractor.archiveorg', ('archive.org', 'www.archive.org')),
+    'ArcPublishingIE': ('pycord.ext.dl.extractor.arcpublishing', ('arcpublishing:',)),
+    'ArkenaIE': ('pycord.ext.dl.extractor.arkena', ('play.arkena.com', 'video.arkena.com', 'video.qbrick.com')),
+    'ARDBetaMediathekIE': ('pycord.ext.dl.extractor.ard', ('ardmediathek.de', 'beta.ardmediathek.de', 'www.ardmediathek.de')),
+    'ARDIE': ('pycord.ext.dl.extractor.ard', ('daserste.de', 'www.daserste.de')),
+    'ARDMediathekIE': ('pycord.ext.dl.extractor.ard', ('ardmediathek.de', 'classic.ardmediathek.de', 'mediathek.daserste.de', 'mediathek.rbb-online.de', 'one.ard.de', 'www.ardmediathek.de')),
+    'ArteTVIE': ('pycord.ext.dl.extractor.arte', ('api.arte.tv', 'arte.tv', 'www.arte.tv')),
+    'ArteTVEmbedIE': ('pycord.ext.dl.extractor.arte', ('arte.tv', 'www.arte.tv')),
+    'ArteTVPlaylistIE': ('pycord.ext.dl.extractor.arte', ('arte.tv', 'www.arte.tv')),
+    'ArnesIE': ('pycord.ext.dl.extractor.arnes', ('video.arnes.si',)),
+    'AsianCrushIE': ('pycord.ext.dl.extractor.asiancrush', ('asiancrush.com', 'cocoro.tv', 'midnightpulp.com', 'retrocrush.tv', 'www.asiancrush.com', 'www.cocoro.tv', 'www.midnightpulp.com', 'www.retrocrush.tv', 'www.yuyutv.com', 'yuyutv.com')),
+    'AsianCrushPlaylistIE': ('pycord.ext.dl.extractor.asiancrush', ('asiancrush.com', 'cocoro.tv', 'midnightpulp.com', 'retrocrush.tv', 'www.asiancrush.com', 'www.cocoro.tv', 'www.midnightpulp.com', 'www.retrocrush.tv', 'www.yuyutv.com', 'yuyutv.com')),
+    'AtresPlayerIE': ('pycord.ext.dl.extractor.atresplayer', ('atresplayer.com', 'www.atresplayer.com')),
+    'ATTTechChannelIE': ('pycord.ext.dl.extractor.atttechchannel', ('techchannel.att.com',)),
+    'ATVAtIE': ('pycord.ext.dl.extractor.atvat', ('atv.at', 'www.atv.at')),
+    'AudiMediaIE': ('pycord.ext.dl.extractor.audimedia', ('audi-mediacenter.com', 'www.audi-mediacenter.com')),
+    'AudioBoomIE': ('pycord.ext.dl.extractor.audioboom', ('audioboom.com', 'www.audioboom.com')),
+    'AudiomackIE': ('pycord.ext.dl.extractor.audiomack', ('audiomack.com', 'www.audiomack.com')),
+    'AudiomackAlbumIE': ('pycord.ext.dl.extractor.audiomack', ('audiomack.com', 'www.audiomack.com')),
+    'AWAANIE': ('pycord.ext.dl.extractor.awaan', ('awaan.ae', 'dcndigital.ae', 'www.awaan.ae', 'www.dcndigital.ae')),
+    'AWAANVideoIE': ('pycord.ext.dl.extractor.awaan', ('awaan.ae', 'dcndigital.ae', 'www.awaan.ae', 'www.dcndigital.ae')),
+    'AWAANLiveIE': ('pycord.ext.dl.extractor.awaan', ('awaan.ae', 'dcndigital.ae', 'www.awaan.ae', 'www.dcndigital.ae')),
+    'AWAANSeasonIE': ('pycord.ext.dl.extractor.awaan', ('awaan.ae', 'dcndigital.ae', 'www.awaan.ae', 'www.dcndigital.ae')),
+    'AZMedienIE': ('pycord.ext.dl.extractor.azmedien', ('telebaern.tv', 'telem1.ch', 'telezueri.ch', 'www.telebaern.tv', 'www.telem1.ch', 'www.telezueri.ch')),
+    'BaiduVideoIE': ('pycord.ext.dl.extractor.baidu', ('v.baidu.com',)),
+    'BandaiChannelIE': ('pycord.ext.dl.extractor.bandaichannel', ('b-ch.com', 'www.b-ch.com')),
+    'BandcampIE': ('pycord.ext.dl.extractor.bandcamp', ('bandcamp.com',)),
+    'BandcampAlbumIE': ('pycord.ext.dl.extractor.bandcamp', None),
+    'BandcampWeeklyIE': ('pycord.ext.dl.extractor.bandcamp', ('bandcamp.com', 'www.bandcamp.com')),
+    'BBCCoUkIE': ('pycord.ext.dl.extractor.bbc', ('bbc.co.uk', 'www.bbc.co.uk')),
+    'BBCCoUkArticleIE': ('pycord.ext.dl.extractor.bbc', ('bbc.co.uk', 'www.bbc.co.uk')),
+    'BBCCoUkIPlayerEpisodesIE': ('pycord.ext.dl.extractor.bbc', ('bbc.co.uk', 'www.bbc.co.uk')),
+    'BBCCoUkIPlayerGroupIE': ('pycord.ext.dl.extractor.bbc', ('bbc.co.uk', 'www.bbc.co.uk')),
+    'BBCCoUkPlaylistIE': ('pycord.ext.dl.extractor.bbc', ('bbc.co.uk', 'www.bbc.co.uk')),
+    'BBCIE': ('pycord.ext.dl.extractor.bbc', ('bbc.co.uk', 'bbc.com', 'www.bbc.co.uk', 'www.bbc.com')),
+    'BeegIE': ('pycord.ext.dl.extractor.beeg', ('beeg.com', 'beeg.porn', 'www.beeg.com', 'www.beeg.porn')),
+    'BehindKinkIE': ('pycord.ext.dl.extractor.behindkink', ('behindkink.com', 'www.behindkink.com')),
+    'BellMediaIE': ('pycord.ext.dl.extractor.bellmedia', ('animalplanet.ca', 'bnn.ca', 'bnnbloomberg.ca', 'bravo.ca', 'cp24.com', 'ctv.ca', 'discovery.ca', 'discoveryvelocity.ca', 'etalk.ca', 'investigationdiscovery.ca', 'marilyn.ca', 'mtv.ca', 'much.com', 'sciencechannel.ca', 'space.ca', 'thecomedynetwork.ca', 'tsn.ca', 'www.animalplanet.ca', 'www.bnn.ca', 'www.bnnbloomberg.ca', 'www.bravo.ca', 'www.cp24.com', 'www.ctv.ca', 'www.discovery.ca', 'www.discoveryvelocity.ca', 'www.etalk.ca', 'www.investigationdiscovery.ca', 'www.marilyn.ca', 'www.mtv.ca', 'www.much.com', 'www.sciencechannel.ca', 'www.space.ca', 'www.thecomedynetwork.ca', 'www.tsn.ca')),
+    'BeatportIE': ('pycord.ext.dl.extractor.beatport', ('beatport.com', 'pro.beatport.com', 'www.beatport.com')),
+    'BetIE': ('pycord.ext.dl.extractor.bet', ('bet.com', 'www.bet.com')),
+    'BFIPlayerIE': ('pycord.ext.dl.extractor.bfi', ('player.bfi.org.uk',)),
+    'BFMTVIE': ('pycord.ext.dl.extractor.bfmtv', ('bfmtv.com', 'www.bfmtv.com')),
+    'BFMTVLiveIE': ('pycord.ext.dl.extractor.bfmtv', ('bfmtv.com', 'www.bfmtv.com')),
+    'BFMTVArticleIE': ('pycord.ext.dl.extractor.bfmtv', ('bfmtv.com', 'www.bfmtv.com')),
+    'BibelTVIE': ('pycord.ext.dl.extractor.bibeltv', ('bibeltv.de', 'www.bibeltv.de')),
+    'BigflixIE': ('pycord.ext.dl.extractor.bigflix', ('bigflix.com', 'www.bigflix.com')),
+    'BildIE': ('pycord.ext.dl.extractor.bild', ('bild.de', 'www.bild.de')),
+    'BiliBiliIE': ('pycord.ext.dl.extractor.bilibili', ('bangumi.bilibili.com', 'bangumi.bilibili.tv', 'bilibili.com', 'bilibili.tv', 'www.bilibili.com', 'www.bilibili.tv')),
+    'BiliBiliBangumiIE': ('pycord.ext.dl.extractor.bilibili', ('bangumi.bilibili.com',)),
+    'BilibiliAudioIE': ('pycord.ext.dl.extractor.bilibili', ('bilibili.com', 'www.bilibili.com')),
+    'BilibiliAudioAlbumIE': ('pycord.ext.dl.extractor.bilibili', ('bilibili.com', 'www.bilibili.com')),
+    'BiliBiliPlayerIE': ('pycord.ext.dl.extractor.bilibili', ('player.bilibili.com',)),
+    'BioBioChileTVIE': ('pycord.ext.dl.extractor.biobiochiletv', ('tv.biobiochile.cl', 'www.biobiochile.cl')),
+    'BitChuteIE': ('pycord.ext.dl.extractor.bitchute', ('bitchute.com', 'www.bitchute.com')),
+    'BitChuteChannelIE': ('pycord.ext.dl.extractor.bitchute', ('bitchute.com', 'www.bitchute.com')),
+    'BIQLEIE': ('pycord.ext.dl.extractor.biqle', ('biqle.com', 'biqle.org', 'biqle.ru', 'www.biqle.com', 'www.biqle.org', 'www.biqle.ru')),
+    'BleacherReportIE': ('pycord.ext.dl.extractor.bleacherreport', ('bleacherreport.com', 'www.bleacherreport.com')),
+    'BleacherReportCMSIE': ('pycord.ext.dl.extractor.bleacherreport', ('bleacherreport.com', 'www.bleacherreport.com')),
+    'BloombergIE': ('pycord.ext.dl.extractor.bloomberg', ('bloomberg.com', 'www.bloomberg.com')),
+    'BokeCCIE': ('pycord.ext.dl.extractor.bokecc', ('union.bokecc.com',)),
+    'BongaCamsIE': ('pycord.ext.dl.extractor.bongacams', ('bongacams.com', 'com')),
+    'BostonGlobeIE': ('pycord.ext.dl.extractor.bostonglobe', ('bostonglobe.com', 'www.bostonglobe.com')),
+    'BoxIE': ('pycord.ext.dl.extractor.box', None),
+    'BpbIE': ('pycord.ext.dl.extractor.bpb', ('bpb.de', 'www.bpb.de')),
+    'BRIE': ('pycord.ext.dl.extractor.br', ('br-klassik.de', 'br.de', 'www.br-klassik.de', 'www.br.de')),
+    'BRMediathekIE': ('pycord.ext.dl.extractor.br', ('br.de', 'www.br.de')),
+    'BravoTVIE': ('pycord.ext.dl.extractor.bravotv', ('bravotv.com', 'oxygen.com', 'www.bravotv.com', 'www.oxygen.com')),
+    'BreakIE': ('pycord.ext.dl.extractor.breakcom', ('break.com', 'www.break.com')),
+    'BrightcoveLegacyIE': ('pycord.ext.dl.extractor.brightcove', None),
+    'BrightcoveNewIE': ('pycord.ext.dl.extractor.brightcove', ('players.brightcove.net',)),
+    'BusinessInsiderIE': ('pycord.ext.dl.extractor.businessinsider', ('businessinsider.com', 'businessinsider.nl')),
+    'BuzzFeedIE': ('pycord.ext.dl.extractor.buzzfeed', ('buzzfeed.com', 'www.buzzfeed.com')),
+    'BYUtvIE': ('pycord.ext.dl.extractor.byutv', ('byutv.org', 'www.byutv.org')),
+    'C56IE': ('pycord.ext.dl.extractor.c56', ('56.com', 'player.56.com', 'www.56.com')),
+    'CamdemyIE': ('pycord.ext.dl.extractor.camdemy', ('camdemy.com', 'www.camdemy.com')),
+    'CamdemyFolderIE': ('pycord.ext.dl.extractor.camdemy', ('camdemy.com', 'www.camdemy.com')),
+    'CamModelsIE': ('pycord.ext.dl.extractor.cammodels', ('cammodels.com', 'www.cammodels.com')),
+    'CamTubeIE': ('pycord.ext.dl.extractor.camtube', ('api.camtube.co', 'camtube.co', 'www.camtube.co')),
+    'CamWithHerIE': ('pycord.ext.dl.extractor.camwithher', ('camwithher.tv', 'www.camwithher.tv')),
+    'CanalplusIE': ('pycord.ext.dl.extractor.canalplus', ('mycanal.fr', 'piwiplus.fr', 'www.mycanal.fr', 'www.piwiplus.fr')),
+    'Canalc2IE': ('pycord.ext.dl.extractor.canalc2', ('archives-canalc2.u-strasbg.fr', 'canalc2.tv', 'www.canalc2.tv')),
+    'CanvasIE': ('pycord.ext.dl.extractor.canvas', ('mediazone.vrt.be',)),
+    'CanvasEenIE': ('pycord.ext.dl.extractor.canvas', ('canvas.be', 'een.be', 'www.canvas.be', 'www.een.be')),
+    'VrtNUIE': ('pycord.ext.dl.extractor.canvas', ('vrt.be', 'www.vrt.be')),
+    'DagelijkseKostIE': ('pycord.ext.dl.extractor.canvas', ('dagelijksekost.een.be',)),
+    'CarambaTVIE': ('pycord.ext.dl.extractor.carambatv', ('carambatv:', 'video1.carambatv.ru')),
+    'CarambaTVPageIE': ('pycord.ext.dl.extractor.carambatv', ('carambatv.ru',)),
+    'CartoonNetworkIE': ('pycord.ext.dl.extractor.cartoonnetwork', ('cartoonnetwork.com', 'www.cartoonnetwork.com')),
+    'CBCIE': ('pycord.ext.dl.extractor.cbc', ('cbc.ca', 'www.cbc.ca')),
+    'CBCPlayerIE': ('pycord.ext.dl.extractor.cbc', ('cbc.ca', 'cbcplayer:', 'www.cbc.ca')),
+    'CBCWatchVideoIE': ('pycord.ext.dl.extractor.cbc', ('api-cbc.cloud.clearleap.com',)),
+    'CBCWatchIE': ('pycord.ext.dl.extractor.cbc', ('gem.cbc.ca', 'watch.cbc.ca')),
+    'CBCOlympicsIE': ('pycord.ext.dl.extractor.cbc', ('olympics.cbc.ca',)),
+    'CBSIE': ('pycord.ext.dl.extractor.cbs', ('cbs.com', 'cbs:', 'colbertlateshow.com', 'paramountplus.com', 'www.cbs.com', 'www.colbertlateshow.com', 'www.paramountplus.com')),
+    'CBSLocalIE': ('pycord.ext.dl.extractor.cbslocal', ('cbslocal.com',)),
+    'CBSLocalArticleIE': ('pycord.ext.dl.extractor.cbslocal', ('cbslocal.com',)),
+    'CBSInteractiveIE': ('pycord.ext.dl.extractor.cbsinteractive', ('cnet.com', 'www.cnet.com', 'www.zdnet.com', 'zdnet.com')),
+    'CBSNewsEmbedIE': ('pycord.ext.dl.extractor.cbsnews', ('cbsnews.com', 'www.cbsnews.com')),
+    'CBSNewsIE': ('pycord.ext.dl.extractor.cbsnews', ('cbsnews.com', 'www.cbsnews.com')),
+    'CBSNewsLiveVideoIE': ('pycord.ext.dl.extractor.cbsnews', ('cbsnews.com', 'www.cbsnews.com')),
+    'CBSSportsEmbedIE': ('pycord.ext.dl.extractor.cbssports', ('cbssports.com', 'embed.247sports.com', 'www.cbssports.com')),
+    'CBSSportsIE': ('pycord.ext.dl.extractor.cbssports', ('cbssports.com', 'www.cbssports.com')),
+    'TwentyFourSevenSportsIE': ('pycord.ext.dl.extractor.cbssports', ('247sports.com', 'www.247sports.com')),
+    'CCCIE': ('pycord.ext.dl.extractor.ccc', ('media.ccc.de', 'www.media.ccc.de')),
+    'CCCPlaylistIE': ('pycord.ext.dl.extractor.ccc', ('media.ccc.de', 'www.media.ccc.de')),
+    'CCMAIE': ('pycord.ext.dl.extractor.ccma', ('ccma.cat', 'www.ccma.cat')),
+    'CCTVIE': ('pycord.ext.dl.extractor.cctv', ('cctv.cn', 'cctv.com', 'cntv.cn', 'cntv.com', 'ncpa-classic.com', 'www.ncpa-classic.com')),
+    'CDAIE': ('pycord.ext.dl.extractor.cda', ('cda.pl', 'ebd.cda.pl', 'www.cda.pl')),
+    'CeskaTelevizeIE': ('pycord.ext.dl.extractor.ceskatelevize', ('ceskatelevize.cz', 'www.ceskatelevize.cz')),
+    'CeskaTelevizePoradyIE': ('pycord.ext.dl.extractor.ceskatelevize', ('ceskatelevize.cz', 'www.ceskatelevize.cz')),
+    'Channel9IE': ('pycord.ext.dl.extractor.channel9', ('channel9.msdn.com', 's.ch9.ms', 'www.channel9.msdn.com', 'www.s.ch9.ms')),
+    'CharlieRoseIE': ('pycord.ext.dl.extractor.charlierose', ('charlierose.com', 'www.charlierose.com')),
+    'ChaturbateIE': ('pycord.ext.dl.extractor.chaturbate', ('chaturbate.com',)),
+    'ChilloutzoneIE': ('pycord.ext.dl.extractor.chilloutzone', ('chilloutzone.net', 'www.chilloutzone.net')),
+    'ChirbitIE': ('pycord.ext.dl.extractor.chirbit', ('chirb.it', 'www.chirb.it')),
+    'ChirbitProfileIE': ('pycord.ext.dl.extractor.chirbit', ('chirbit.com', 'www.chirbit.com')),
+    'CinchcastIE': ('pycord.ext.dl.extractor.cinchcast', ('player.cinchcast.com',)),
+    'CinemaxIE': ('pycord.ext.dl.extractor.cinemax', ('cinemax.com', 'www.cinemax.com')),
+    'CiscoLiveSessionIE': ('pycord.ext.dl.extractor.ciscolive', ('ciscolive.cisco.com', 'ciscolive.com', 'www.ciscolive.cisco.com', 'www.ciscolive.com')),
+    'CiscoLiveSearchIE': ('pycord.ext.dl.extractor.ciscolive', ('ciscolive.cisco.com', 'ciscolive.com', 'www.ciscolive.cisco.com', 'www.ciscolive.com')),
+    'CJSWIE': ('pycord.ext.dl.extractor.cjsw', ('cjsw.com', 'www.cjsw.com')),
+    'CliphunterIE': ('pycord.ext.dl.extractor.cliphunter', ('cliphunter.com', 'www.cliphunter.com')),
+    'ClippitIE': ('pycord.ext.dl.extractor.clippit', ('clippituser.tv', 'www.clippituser.tv')),
+    'ClipRsIE': ('pycord.ext.dl.extractor.cliprs', ('clip.rs', 'www.clip.rs')),
+    'ClipsyndicateIE': ('pycord.ext.dl.extractor.clipsyndicate', ('chic.clipsyndicate.com', 'www.clipsyndicate.com')),
+    'CloserToTruthIE': ('pycord.ext.dl.extractor.closertotruth', ('closertotruth.com', 'www.closertotruth.com')),
+    'CloudflareStreamIE': ('pycord.ext.dl.extractor.cloudflarestream', ('bytehighway.net', 'cloudflarestream.com', 'embed.bytehighway.net', 'embed.cloudflarestream.com', 'embed.videodelivery.net', 'videodelivery.net', 'watch.bytehighway.net', 'watch.cloudflarestream.com', 'watch.videodelivery.net')),
+    'CloudyIE': ('pycord.ext.dl.extractor.cloudy', ('cloudy.ec', 'www.cloudy.ec')),
+    'ClubicIE': ('pycord.ext.dl.extractor.clubic', ('clubic.com', 'www.clubic.com')),
+    'ClypIE': ('pycord.ext.dl.extractor.clyp', ('clyp.it', 'www.clyp.it')),
+    'CMTIE': ('pycord.ext.dl.extractor.cmt', ('cmt.com', 'www.cmt.com')),
+    'CNBCIE': ('pycord.ext.dl.extractor.cnbc', ('video.cnbc.com',)),
+    'CNBCVideoIE': ('pycord.ext.dl.extractor.cnbc', ('cnbc.com', 'www.cnbc.com')),
+    'CNNIE': ('pycord.ext.dl.extractor.cnn', ('cnn.com', 'edition.cnn.com', 'money.cnn.com', 'www.cnn.com')),
+    'CNNBlogsIE': ('pycord.ext.dl.extractor.cnn', None),
+    'CNNArticleIE': ('pycord.ext.dl.extractor.cnn', ('cnn.com', 'edition.cnn.com', 'www.cnn.com')),
+    'CoubIE': ('pycord.ext.dl.extractor.coub', ('c-cdn.coub.com', 'coub.com', 'coub:')),
+    'ComedyCentralIE': ('pycord.ext.dl.extractor.comedycentral', ('cc.com', 'www.cc.com')),
+    'ComedyCentralTVIE': ('pycord.ext.dl.extractor.comedycentral', ('comedycentral.tv', 'www.comedycentral.tv')),
+    'CommonMistakesIE': ('pycord.ext.dl.extractor.commonmistakes', None),
+    'UnicodeBOMIE': ('pycord.ext.dl.extractor.commonmistakes', None),
+    'MmsIE': ('pycord.ext.dl.extractor.commonprotocols', None),
+    'RtmpIE': ('pycord.ext.dl.extractor.commonprotocols', None),
+    'CondeNastIE': ('pycord.ext.dl.extractor.condenast', ('player-backend.allure.com', 'player-backend.architecturaldigest.com', 'player-backend.arstechnica.com', 'player-backend.bonappetit.com', 'player-backend.brides.com', 'player-backend.cnevids.com', 'player-backend.cntraveler.com', 'player-backend.details.com', 'player-backend.epicurious.com', 'player-backend.glamour.com', 'player-backend.golfdigest.com', 'player-backend.gq.com', 'player-backend.newyorker.com', 'player-backend.self.com', 'player-backend.teenvogue.com', 'player-backend.vanityfair.com', 'player-backend.vogue.com', 'player-backend.wired.com', 'player-backend.wmagazine.com', 'player.allure.com', 'player.architecturaldigest.com', 'player.arstechnica.com', 'player.bonappetit.com', 'player.brides.com', 'player.cnevids.com', 'player.cntraveler.com', 'player.details.com', 'player.epicurious.com', 'player.glamour.com', 'player.golfdigest.com', 'player.gq.com', 'player.newyorker.com', 'player.self.com', 'player.teenvogue.com', 'player.vanityfair.com', 'player.vogue.com', 'player.wired.com', 'player.wmagazine.com', 'video.allure.com', 'video.architecturaldigest.com', 'video.arstechnica.com', 'video.bonappetit.com', 'video.brides.com', 'video.cnevids.com', 'video.cntraveler.com', 'video.details.com', 'video.epicurious.com', 'video.glamour.com', 'video.golfdigest.com', 'video.gq.com', 'video.newyorker.com', 'video.self.com', 'video.teenvogue.com', 'video.vanityfair.com', 'video.vogue.com', 'video.wired.com', 'video.wmagazine.com', 'www.allure.com', 'www.architecturaldigest.com', 'www.arstechnica.com', 'www.bonappetit.com', 'www.brides.com', 'www.cnevids.com', 'www.cntraveler.com', 'www.details.com', 'www.epicurious.com', 'www.glamour.com', 'www.golfdigest.com', 'www.gq.com', 'www.newyorker.com', 'www.self.com', 'www.teenvogue.com', 'www.vanityfair.com', 'www.vogue.com', 'www.wired.com', 'www.wmagazine.com')),
+    'CONtvIE': ('pycord.ext.dl.extractor.contv', ('contv.com', 'www.contv.com')),
+    'CorusIE': ('pycord.ext.dl.extractor.corus', ('abcspark.ca', 'bigbrothercanada.ca', 'disneychannel.ca', 'disneylachaine.ca', 'etcanada.com', 'foodnetwork.ca', 'globaltv.com', 'hgtv.ca', 'history.ca', 'seriesplus.com', 'showcase.ca', 'slice.ca', 'wnetwork.com', 'www.abcspark.ca', 'www.bigbrothercanada.ca', 'www.disneychannel.ca', 'www.disneylachaine.ca', 'www.etcanada.com', 'www.foodnetwork.ca', 'www.globaltv.com', 'www.hgtv.ca', 'www.history.ca', 'www.seriesplus.com', 'www.showcase.ca', 'www.slice.ca', 'www.wnetwork.com', 'www.ytv.com', 'ytv.com')),
+    'CrackedIE': ('pycord.ext.dl.extractor.cracked', ('cracked.com', 'www.cracked.com')),
+    'CrackleIE': ('pycord.ext.dl.extractor.crackle', ('crackle.com', 'crackle:', 'm.crackle.com', 'm.sonycrackle.com', 'sonycrackle.com', 'www.crackle.com', 'www.sonycrackle.com')),
+    'CrooksAndLiarsIE': ('pycord.ext.dl.extractor.crooksandliars', ('embed.crooksandliars.com',)),
+    'CrunchyrollIE': ('pycord.ext.dl.extractor.crunchyroll', ('crunchyroll.com', 'crunchyroll.fr', 'm.crunchyroll.com', 'm.crunchyroll.fr', 'www.crunchyroll.com', 'www.crunchyroll.fr')),
+    'CrunchyrollShowPlaylistIE': ('pycord.ext.dl.extractor.crunchyroll', ('crunchyroll.com', 'm.crunchyroll.com', 'www.crunchyroll.com')),
+    'CSpanIE': ('pycord.ext.dl.extractor.cspan', ('c-span.org', 'www.c-span.org')),
+    'CtsNewsIE': ('pycord.ext.dl.extractor.ctsnews', ('news.cts.com.tw',)),
+    'CTVIE': ('pycord.ext.dl.extractor.ctv', ('ctv.ca', 'www.ctv.ca')),
+    'CTVNewsIE': ('pycord.ext.dl.extractor.ctvnews', None),
+    'CultureUnpluggedIE': ('pycord.ext.dl.extractor.cultureunplugged', ('cultureunplugged.com', 'www.cultureunplugged.com')),
+    'CuriosityStreamIE': ('pycord.ext.dl.extractor.curiositystream', ('app.curiositystream.com', 'curiositystream.com')),
+    'CuriosityStreamCollectionIE': ('pycord.ext.dl.extractor.curiositystream', ('app.curiositystream.com', 'curiositystream.com')),
+    'CWTVIE': ('pycord.ext.dl.extractor.cwtv', ('cwseed.com', 'cwtv.com', 'cwtvpr.com', 'www.cwseed.com', 'www.cwtv.com', 'www.cwtvpr.com')),
+    'DailyMailIE': ('pycord.ext.dl.extractor.dailymail', ('dailymail.co.uk', 'www.dailymail.co.uk')),
+    'DailymotionIE': ('pycord.ext.dl.extractor.dailymotion', None),
+    'DailymotionPlaylistIE': ('pycord.ext.dl.extractor.dailymotion', None),
+    'DailymotionUserIE': ('pycord.ext.dl.extractor.dailymotion', None),
+    'DaumIE': ('pycord.ext.dl.extractor.daum', ('m.tvpot.daum.net', 'tvpot.daum.net', 'videofarm.daum.net')),
+    'DaumClipIE': ('pycord.ext.dl.extractor.daum', ('m.tvpot.daum.net', 'tvpot.daum.net')),
+    'DaumPlaylistIE': ('pycord.ext.dl.extractor.daum', ('m.tvpot.daum.net', 'tvpot.daum.net')),
+    'DaumUserIE': ('pycord.ext.dl.extractor.daum', ('m.tvpot.daum.net', 'tvpot.daum.net')),
+    'DBTVIE': ('pycord.ext.dl.extractor.dbtv', ('dagbladet.no', 'www.dagbladet.no')),
+    'DctpTvIE': ('pycord.ext.dl.extractor.dctp', ('dctp.tv', 'www.dctp.tv')),
+    'DeezerPlaylistIE': ('pycord.ext.dl.extractor.deezer', ('deezer.com', 'www.deezer.com')),
+    'DemocracynowIE': ('pycord.ext.dl.extractor.democracynow', ('democracynow.org', 'www.democracynow.org')),
+    'DFBIE': ('pycord.ext.dl.extractor.dfb', ('tv.dfb.de',)),
+    'DHMIE': ('pycord.ext.dl.extractor.dhm', ('dhm.de', 'www.dhm.de')),
+    'DiggIE': ('pycord.ext.dl.extractor.digg', ('digg.com', 'www.digg.com')),
+    'DotsubIE': ('pycord.ext.dl.extractor.dotsub', ('dotsub.com', 'www.dotsub.com')),
+    'DouyuShowIE': ('pycord.ext.dl.extractor.douyutv', ('v.douyu.com', 'vmobile.douyu.com')),
+    'DouyuTVIE': ('pycord.ext.dl.extractor.douyutv', ('douyu.com', 'douyutv.com', 'www.douyu.com', 'www.douyutv.com')),
+    'DPlayIE': ('pycord.ext.dl.extractor.dplay', ('discoveryplus.dk', 'discoveryplus.es', 'discoveryplus.fi', 'discoveryplus.it', 'discoveryplus.no', 'discoveryplus.se', 'dplay.dk', 'dplay.fi', 'dplay.jp', 'dplay.no', 'dplay.se', 'es.dplay.com', 'it.dplay.com', 'www.discoveryplus.dk', 'www.discoveryplus.es', 'www.discoveryplus.fi', 'www.discoveryplus.it', 'www.discoveryplus.no', 'www.discoveryplus.se', 'www.dplay.dk', 'www.dplay.fi', 'www.dplay.jp', 'www.dplay.no', 'www.dplay.se')),
+    'DiscoveryPlusIE': ('pycord.ext.dl.extractor.dplay', ('discoveryplus.com', 'www.discoveryplus.com')),
+    'HGTVDeIE': ('pycord.ext.dl.extractor.dplay', ('de.hgtv.com',)),
+    'DreiSatIE': ('pycord.ext.dl.extractor.dreisat', ('3sat.de', 'www.3sat.de')),
+    'DRBonanzaIE': ('pycord.ext.dl.extractor.drbonanza', ('dr.dk', 'www.dr.dk')),
+    'DrTuberIE': ('pycord.ext.dl.extractor.drtuber', ('drtuber.com', 'm.drtuber.com', 'www.drtuber.com')),
+    'DRTVIE': ('pycord.ext.dl.extractor.drtv', ('dr-massive.com', 'dr.dk', 'www.dr-massive.com', 'www.dr.dk')),
+    'DRTVLiveIE': ('pycord.ext.dl.extractor.drtv', ('dr.dk', 'www.dr.dk')),
+    'DTubeIE': ('pycord.ext.dl.extractor.dtube', ('d.tube', 'www.d.tube')),
+    'DVTVIE': ('pycord.ext.dl.extractor.dvtv', ('video.aktualne.cz',)),
+    'DumpertIE': ('pycord.ext.dl.extractor.dumpert', ('dumpert.nl', 'legacy.dumpert.nl', 'www.dumpert.nl')),
+    'DefenseGouvFrIE': ('pycord.ext.dl.extractor.defense', None),
+    'DiscoveryIE': ('pycord.ext.dl.extractor.discovery', ('go.discovery.com', 'watch.cookingchanneltv.com', 'watch.diynetwork.com', 'watch.foodnetwork.com', 'watch.hgtv.com', 'watch.motortrend.com', 'watch.travelchannel.com', 'www.ahctv.com', 'www.animalplanet.com', 'www.destinationamerica.com', 'www.discoverylife.com', 'www.investigationdiscovery.com', 'www.sciencechannel.com', 'www.tlc.com')),
+    'DiscoveryGoIE': ('pycord.ext.dl.extractor.discoverygo', ('ahctvgo.com', 'animalplanetgo.com', 'destinationamericago.com', 'discoverygo.com', 'discoverylifego.com', 'investigationdiscoverygo.com', 'sciencechannelgo.com', 'tlcgo.com', 'velocitychannelgo.com', 'www.ahctvgo.com', 'www.animalplanetgo.com', 'www.destinationamericago.com', 'www.discoverygo.com', 'www.discoverylifego.com', 'www.investigationdiscoverygo.com', 'www.sciencechannelgo.com', 'www.tlcgo.com', 'www.velocitychannelgo.com')),
+    'DiscoveryGoPlaylistIE': ('pycord.ext.dl.extractor.discoverygo', ('ahctvgo.com', 'animalplanetgo.com', 'destinationamericago.com', 'discoverygo.com', 'discoverylifego.com', 'investigationdiscoverygo.com', 'sciencechannelgo.com', 'tlcgo.com', 'velocitychannelgo.com', 'www.ahctvgo.com', 'www.animalplanetgo.com', 'www.destinationamericago.com', 'www.discoverygo.com', 'www.discoverylifego.com', 'www.investigationdiscoverygo.com', 'www.sciencechannelgo.com', 'www.tlcgo.com', 'www.velocitychannelgo.com')),
+    'DiscoveryNetworksDeIE': ('pycord.ext.dl.extractor.discoverynetworks', ('dmax.de', 'dplay.co.uk', 'tlc.de', 'www.dmax.de', 'www.dplay.co.uk', 'www.tlc.de')),
+    'DiscoveryVRIE': ('pycord.ext.dl.extractor.discoveryvr', ('discoveryvr.com', 'www.discoveryvr.com')),
+    'DisneyIE': ('pycord.ext.dl.extractor.disney', None),
+    'DigitallySpeakingIE': ('pycord.ext.dl.extractor.dispeak', ('events.digitallyspeaking.com', 'evt.dispeak.com', 'sevt.dispeak.com')),
+    'DropboxIE': ('pycord.ext.dl.extractor.dropbox', ('dropbox.com', 'www.dropbox.com')),
+    'DWIE': ('pycord.ext.dl.extractor.dw', ('dw.com', 'www.dw.com')),
+    'DWArticleIE': ('pycord.ext.dl.extractor.dw', ('dw.com', 'www.dw.com')),
+    'EaglePlatformIE': ('pycord.ext.dl.extractor.eagleplatform', None),
+    'EbaumsWorldIE': ('pycord.ext.dl.extractor.ebaumsworld', ('ebaumsworld.com', 'www.ebaumsworld.com')),
+    'EchoMskIE': ('pycord.ext.dl.extractor.echomsk', ('echo.msk.ru', 'www.echo.msk.ru')),
+    'EggheadCourseIE': ('pycord.ext.dl.extractor.egghead', ('app.egghead.io', 'egghead.io')),
+    'EggheadLessonIE': ('pycord.ext.dl.extractor.egghead', ('app.egghead.io', 'egghead.io')),
+    'EHowIE': ('pycord.ext.dl.extractor.ehow', ('ehow.com', 'www.ehow.com')),
+    'EightTracksIE': ('pycord.ext.dl.extractor.eighttracks', ('8tracks.com',)),
+    'EinthusanIE': ('pycord.ext.dl.extractor.einthusan', ('einthusan.ca', 'einthusan.com', 'einthusan.tv')),
+    'EitbIE': ('pycord.ext.dl.extractor.eitb', ('eitb.tv', 'www.eitb.tv')),
+    'EllenTubeIE': ('pycord.ext.dl.extractor.ellentube', ('api-prod.ellentube.com', 'ellentube:')),
+    'EllenTubeVideoIE': ('pycord.ext.dl.extractor.ellentube', ('ellentube.com', 'www.ellentube.com')),
+    'EllenTubePlaylistIE': ('pycord.ext.dl.extractor.ellentube', ('ellentube.com', 'www.ellentube.com')),
+    'ElPaisIE': ('pycord.ext.dl.extractor.elpais', None),
+    'EmbedlyIE': ('pycord.ext.dl.extractor.embedly', ('cdn.embedly.com', 'embedly.com', 'wwwembedly.com')),
+    'EngadgetIE': ('pycord.ext.dl.extractor.engadget', ('engadget.com', 'www.engadget.com')),
+    'EpornerIE': ('pycord.ext.dl.extractor.eporner', ('eporner.com', 'www.eporner.com')),
+    'EroProfileIE': ('pycord.ext.dl.extractor.eroprofile', ('eroprofile.com', 'www.eroprofile.com')),
+    'EscapistIE': ('pycord.ext.dl.extractor.escapist', ('escapistmagazine.com', 'http:', 'https:', 'v1.escapistmagazine.com', 'www.escapistmagazine.com')),
+    'ESPNIE': ('pycord.ext.dl.extractor.espn', ('espn.com', 'espn.go.com', 'www.espn.com', 'www.espnfc.com', 'www.espnfc.us')),
+    'ESPNArticleIE': ('pycord.ext.dl.extractor.espn', ('espn.com', 'espn.go.com', 'www.espn.com')),
+    'FiveThirtyEightIE': ('pycord.ext.dl.extractor.espn', ('fivethirtyeight.com', 'www.fivethirtyeight.com')),
+    'EsriVideoIE': ('pycord.ext.dl.extractor.esri', ('video.esri.com',)),
+    'EuropaIE': ('pycord.ext.dl.extractor.europa', ('ec.europa.eu',)),
+    'ExpoTVIE': ('pycord.ext.dl.extractor.expotv', ('expotv.com', 'www.expotv.com')),
+    'ExpressenIE': ('pycord.ext.dl.extractor.expressen', ('di.se', 'expressen.se', 'www.di.se', 'www.expressen.se')),
+    'ExtremeTubeIE': ('pycord.ext.dl.extractor.extremetube', ('extremetube.com', 'www.extremetube.com')),
+    'EyedoTVIE': ('pycord.ext.dl.extractor.eyedotv', ('eyedo.tv', 'www.eyedo.tv')),
+    'FacebookIE': ('pycord.ext.dl.extractor.facebook', ('facebook.com', 'facebook:', 'facebookcorewwwi.onion')),
+    'FacebookPluginsVideoIE': ('pycord.ext.dl.extractor.facebook', ('facebook.com',)),
+    'FazIE': ('pycord.ext.dl.extractor.faz', ('faz.net', 'www.faz.net')),
+    'FC2IE': ('pycord.ext.dl.extractor.fc2', ('fc2:', 'video.fc2.com')),
+    'FC2EmbedIE': ('pycord.ext.dl.extractor.fc2', ('video.fc2.com',)),
+    'FczenitIE': ('pycord.ext.dl.extractor.fczenit', ('fc-zenit.ru', 'www.fc-zenit.ru')),
+    'FilmOnIE': ('pycord.ext.dl.extractor.filmon', ('filmon.com', 'filmon:', 'www.filmon.com')),
+    'FilmOnChannelIE': ('pycord.ext.dl.extractor.filmon', ('filmon.com', 'www.filmon.com')),
+    'FilmwebIE': ('pycord.ext.dl.extractor.filmweb', ('filmweb.no', 'www.filmweb.no')),
+    'FirstTVIE': ('pycord.ext.dl.extractor.firsttv', ('1tv.ru', 'www.1tv.ru')),
+    'FiveMinIE': ('pycord.ext.dl.extractor.fivemin', None),
+    'FiveTVIE': ('pycord.ext.dl.extractor.fivetv', ('5-tv.ru', 'www.5-tv.ru')),
+    'FlickrIE': ('pycord.ext.dl.extractor.flickr', ('flickr.com', 'secure.flickr.com', 'www.flickr.com')),
+    'FolketingetIE': ('pycord.ext.dl.extractor.folketinget', ('ft.dk', 'www.ft.dk')),
+    'FootyRoomIE': ('pycord.ext.dl.extractor.footyroom', ('footyroom.com',)),
+    'Formula1IE': ('pycord.ext.dl.extractor.formula1', ('formula1.com', 'www.formula1.com')),
+    'FourTubeIE': ('pycord.ext.dl.extractor.fourtube', ('4tube.com', 'm.4tube.com', 'www.4tube.com')),
+    'PornTubeIE': ('pycord.ext.dl.extractor.fourtube', ('m.porntube.com', 'porntube.com', 'www.porntube.com')),
+    'PornerBrosIE': ('pycord.ext.dl.extractor.fourtube', ('m.pornerbros.com', 'pornerbros.com', 'www.pornerbros.com')),
+    'FuxIE': ('pycord.ext.dl.extractor.fourtube', ('fux.com', 'm.fux.com', 'www.fux.com')),
+    'FOXIE': ('pycord.ext.dl.extractor.fox', ('fox.com', 'www.fox.com')),
+    'FOX9IE': ('pycord.ext.dl.extractor.fox9', ('fox9.com', 'www.fox9.com')),
+    'FOX9NewsIE': ('pycord.ext.dl.extractor.fox9', ('fox9.com', 'www.fox9.com')),
+    'FoxgayIE': ('pycord.ext.dl.extractor.foxgay', ('foxgay.com', 'www.foxgay.com')),
+    'FoxNewsIE': ('pycord.ext.dl.extractor.foxnews', ('video.foxbusiness.com', 'video.foxnews.com', 'video.insider.foxbusiness.com', 'video.insider.foxnews.com')),
+    'FoxNewsArticleIE': ('pycord.ext.dl.extractor.foxnews', ('foxnews.com', 'insider.foxnews.com', 'www.foxnews.com', 'www.insider.foxnews.com')),
+    'FoxSportsIE': ('pycord.ext.dl.extractor.foxsports', ('foxsports.com', 'www.foxsports.com')),
+    'FranceCultureIE': ('pycord.ext.dl.extractor.franceculture', ('franceculture.fr', 'www.franceculture.fr')),
+    'FranceInterIE': ('pycord.ext.dl.extractor.franceinter', ('franceinter.fr', 'www.franceinter.fr')),
+    'FranceTVIE': ('pycord.ext.dl.extractor.francetv', ('francetv:', 'sivideo.webservices.francetelevisions.fr', 'videos.francetv.fr')),
+    'FranceTVSiteIE': ('pycord.ext.dl.extractor.francetv', ('france.tv', 'mobile.france.tv', 'www.france.tv')),
+    'FranceTVEmbedIE': ('pycord.ext.dl.extractor.francetv', ('embed.francetv.fr',)),
+    'FranceTVInfoIE': ('pycord.ext.dl.extractor.francetv', ('france3-regions.francetvinfo.fr', 'mobile.francetvinfo.fr', 'www.francetvinfo.fr')),
+    'FranceTVInfoSportIE': ('pycord.ext.dl.extractor.francetv', ('sport.francetvinfo.fr',)),
+    'FranceTVJeunesseIE': ('pycord.ext.dl.extractor.francetv', ('ludo.fr', 'www.ludo.fr', 'www.zouzous.fr', 'zouzous.fr')),
+    'GenerationWhatIE': ('pycord.ext.dl.extractor.francetv', ('generation-what.francetv.fr',)),
+    'CultureboxIE': ('pycord.ext.dl.extractor.francetv', ('culturebox.francetvinfo.fr', 'm.culturebox.francetvinfo.fr')),
+    'FreesoundIE': ('pycord.ext.dl.extractor.freesound', ('freesound.org', 'www.freesound.org')),
+    'FreespeechIE': ('pycord.ext.dl.extractor.freespeech', ('freespeech.org', 'www.freespeech.org')),
+    'FreshLiveIE': ('pycord.ext.dl.extractor.freshlive', ('freshlive.tv',)),
+    'FrontendMastersIE': ('pycord.ext.dl.extractor.frontendmasters', ('api.frontendmasters.com', 'frontendmasters:')),
+    'FrontendMastersLessonIE': ('pycord.ext.dl.extractor.frontendmasters', ('frontendmasters.com', 'www.frontendmasters.com')),
+    'FrontendMastersCourseIE': ('pycord.ext.dl.extractor.frontendmasters', ('frontendmasters.com', 'www.frontendmasters.com')),
+    'FujiTVFODPlus7IE': ('pycord.ext.dl.extractor.fujitv', ('i.fod.fujitv.co.jp',)),
+    'FunimationIE': ('pycord.ext.dl.extractor.funimation', ('funimation.com', 'funimationnow.uk', 'www.funimation.com', 'www.funimationnow.uk')),
+    'FunkIE': ('pycord.ext.dl.extractor.funk', ('funk.net', 'www.funk.net')),
+    'FusionIE': ('pycord.ext.dl.extractor.fusion', ('fusion.net', 'fusion.tv', 'www.fusion.net', 'www.fusion.tv')),
+    'GaiaIE': ('pycord.ext.dl.extractor.gaia', ('gaia.com', 'www.gaia.com')),
+    'GameInformerIE': ('pycord.ext.dl.extractor.gameinformer', ('gameinformer.com', 'www.gameinformer.com')),
+    'GameSpotIE': ('pycord.ext.dl.extractor.gamespot', ('gamespot.com', 'www.gamespot.com')),
+    'GameStarIE': ('pycord.ext.dl.extractor.gamestar', ('gamepro.de', 'gamestar.de', 'www.gamepro.de', 'www.gamestar.de')),
+    'GaskrankIE': ('pycord.ext.dl.extractor.gaskrank', ('gaskrank.tv', 'www.gaskrank.tv')),
+    'GazetaIE': ('pycord.ext.dl.extractor.gazeta', ('gazeta.ru', 'www.gazeta.ru')),
+    'GDCVaultIE': ('pycord.ext.dl.extractor.gdcvault', ('gdcvault.com', 'www.gdcvault.com')),
+    'GediDigitalIE': ('pycord.ext.dl.extractor.gedidigital', ('video.corrierealpi.gelocal.it', 'video.espresso.repubblica.it', 'video.gazzettadimantova.gelocal.it', 'video.gazzettadimodena.gelocal.it', 'video.ilpiccolo.gelocal.it', 'video.ilsecoloxix.it', 'video.iltirreno.gelocal.it', 'video.lanuovaferrara.gelocal.it', 'video.laprovinciapavese.gelocal.it', 'video.lasentinella.gelocal.it', 'video.lastampa.it', 'video.mattinopadova.gelocal.it', 'video.messaggeroveneto.gelocal.it', 'video.nuovavenezia.gelocal.it', 'video.repubblica.it', 'video.tribunatreviso.gelocal.it')),
+    'GfycatIE': ('pycord.ext.dl.extractor.gfycat', ('gfycat.com', 'giant.gfycat.com', 'thumbs.gfycat.com', 'www.gfycat.com')),
+    'GiantBombIE': ('pycord.ext.dl.extractor.giantbomb', ('giantbomb.com', 'www.giantbomb.com')),
+    'GigaIE': ('pycord.ext.dl.extractor.giga', ('giga.de', 'www.giga.de')),
+    'GlideIE': ('pycord.ext.dl.extractor.glide', ('share.glide.me',)),
+    'GloboIE': ('pycord.ext.dl.extractor.globo', None),
+    'GloboArticleIE': ('pycord.ext.dl.extractor.globo', None),
+    'GoIE': ('pycord.ext.dl.extractor.go', None),
+    'GodTubeIE': ('pycord.ext.dl.extractor.godtube', ('godtube.com', 'www.godtube.com')),
+    'GolemIE': ('pycord.ext.dl.extractor.golem', ('video.golem.de',)),
+    'GoogleDriveIE': ('pycord.ext.dl.extractor.googledrive', ('docs.google.com', 'drive.google.com', 'video.google.com')),
+    'GooglePodcastsIE': ('pycord.ext.dl.extractor.googlepodcasts', ('podcasts.google.com',)),
+    'GooglePodcastsFeedIE': ('pycord.ext.dl.extractor.googlepodcasts', ('podcasts.google.com',)),
+    'GoogleSearchIE': ('pycord.ext.dl.extractor.googlesearch', None),
+    'GoshgayIE': ('pycord.ext.dl.extractor.goshgay', ('goshgay.com', 'www.goshgay.com')),
+    'GPUTechConfIE': ('pycord.ext.dl.extractor.gputechconf', ('on-demand.gputechconf.com',)),
+    'GrouponIE': ('pycord.ext.dl.extractor.groupon', ('groupon.com', 'www.groupon.com')),
+    'HBOIE': ('pycord.ext.dl.extractor.hbo', ('hbo.com', 'www.hbo.com')),
+    'HearThisAtIE': ('pycord.ext.dl.extractor.hearthisat', ('hearthis.at', 'www.hearthis.at')),
+    'HeiseIE': ('pycord.ext.dl.extractor.heise', ('heise.de', 'www.heise.de')),
+    'HellPornoIE': ('pycord.ext.dl.extractor.hellporno', ('hellporno.com', 'hellporno.net', 'www.hellporno.com', 'www.hellporno.net')),
+    'HelsinkiIE': ('pycord.ext.dl.extractor.helsinki', ('video.helsinki.fi',)),
+    'HentaiStigmaIE': ('pycord.ext.dl.extractor.hentaistigma', ('hentai.animestigma.com',)),
+    'HGTVComShowIE': ('pycord.ext.dl.extractor.hgtv', ('hgtv.com', 'www.hgtv.com')),
+    'HKETVIE': ('pycord.ext.dl.extractor.hketv', ('hkedcity.net', 'www.hkedcity.net')),
+    'HiDiveIE': ('pycord.ext.dl.extractor.hidive', ('hidive.com', 'www.hidive.com')),
+    'HistoricFilmsIE': ('pycord.ext.dl.extractor.historicfilms', ('historicfilms.com', 'www.historicfilms.com')),
+    'HitboxIE': ('pycord.ext.dl.extractor.hitbox', ('hitbox.tv', 'smashcast.tv', 'www.hitbox.tv', 'www.smashcast.tv')),
+    'HitboxLiveIE': ('pycord.ext.dl.extractor.hitbox', ('hitbox.tv', 'smashcast.tv', 'www.hitbox.tv', 'www.smashcast.tv')),
+    'HitRecordIE': ('pycord.ext.dl.extractor.hitrecord', ('hitrecord.org', 'www.hitrecord.org')),
+    'HornBunnyIE': ('pycord.ext.dl.extractor.hornbunny', ('hornbunny.com', 'www.hornbunny.com')),
+    'HotNewHipHopIE': ('pycord.ext.dl.extractor.hotnewhiphop', ('hotnewhiphop.com', 'www.hotnewhiphop.com')),
+    'HotStarIE': ('pycord.ext.dl.extractor.hotstar', ('hotstar.com', 'www.hotstar.com')),
+    'HotStarPlaylistIE': ('pycord.ext.dl.extractor.hotstar', ('hotstar.com', 'www.hotstar.com')),
+    'HowcastIE': ('pycord.ext.dl.extractor.howcast', ('howcast.com', 'www.howcast.com')),
+    'HowStuffWorksIE': ('pycord.ext.dl.extractor.howstuffworks', ('brainstuffshow.com', 'carstuffshow.com', 'fwthinking.com', 'geniusstuff.com', 'howstuffworks.com', 'stuffmomnevertoldyou.com', 'stufftheydontwantyoutoknow.com', 'stufftoblowyourmind.com', 'stuffyoushouldknow.com')),
+    'HRTiIE': ('pycord.ext.dl.extractor.hrti', ('hrti.hrt.hr', 'hrti:')),
+    'HRTiPlaylistIE': ('pycord.ext.dl.extractor.hrti', ('hrti.hrt.hr',)),
+    'HuajiaoIE': ('pycord.ext.dl.extractor.huajiao', ('huajiao.com', 'www.huajiao.com')),
+    'HuffPostIE': ('pycord.ext.dl.extractor.huffpost', ('embed.live.huffingtonpost.com', 'live.huffingtonpost.com')),
+    'HungamaIE': ('pycord.ext.dl.extractor.hungama', ('hungama.com', 'www.hungama.com')),
+    'HungamaSongIE': ('pycord.ext.dl.extractor.hungama', ('hungama.com', 'www.hungama.com')),
+    'HypemIE': ('pycord.ext.dl.extractor.hypem', ('hypem.com', 'www.hypem.com')),
+    'IGNIE': ('pycord.ext.dl.extractor.ign', None),
+    'IGNVideoIE': ('pycord.ext.dl.extractor.ign', None),
+    'IGNArticleIE': ('pycord.ext.dl.extractor.ign', None),
+    'IHeartRadioIE': ('pycord.ext.dl.extractor.iheart', ('iheart.com', 'iheartradio:', 'www.iheart.com')),
+    'IHeartRadioPodcastIE': ('pycord.ext.dl.extractor.iheart', ('iheart.com', 'iheartpodcastnetwork.com', 'www.iheart.com', 'www.iheartpodcastnetwork.com')),
+    'ImdbIE': ('pycord.ext.dl.extractor.imdb', ('m.imdb.com', 'www.imdb.com')),
+    'ImdbListIE': ('pycord.ext.dl.extractor.imdb', ('imdb.com', 'www.imdb.com')),
+    'ImgurIE': ('pycord.ext.dl.extractor.imgur', ('i.imgur.com', 'imgur.com')),
+    'ImgurAlbumIE': ('pycord.ext.dl.extractor.imgur', ('i.imgur.com', 'imgur.com')),
+    'ImgurGalleryIE': ('pycord.ext.dl.extractor.imgur', ('i.imgur.com', 'imgur.com')),
+    'InaIE': ('pycord.ext.dl.extractor.ina', ('ina.fr', 'm.ina.fr', 'www.ina.fr')),
+    'IncIE': ('pycord.ext.dl.extractor.inc', ('inc.com', 'www.inc.com')),
+    'IndavideoEmbedIE': ('pycord.ext.dl.extractor.indavideo', ('assets.indavideo.hu', 'embed.indavideo.hu', 'indavideo.hu')),
+    'InfoQIE': ('pycord.ext.dl.extractor.infoq', ('infoq.com', 'www.infoq.com')),
+    'InstagramIE': ('pycord.ext.dl.extractor.instagram', ('instagram.com', 'www.instagram.com')),
+    'InstagramUserIE': ('pycord.ext.dl.extractor.instagram', ('instagram.com', 'www.instagram.com')),
+    'InstagramTagIE': ('pycord.ext.dl.extractor.instagram', ('instagram.com', 'www.instagram.com')),
+    'InternazionaleIE': ('pycord.ext.dl.extractor.internazionale', ('internazionale.it', 'www.internazionale.it')),
+    'InternetVideoArchiveIE': ('pycord.ext.dl.extractor.internetvideoarchive', ('video.internetvideoarchive.net',)),
+    'IPrimaIE': ('pycord.ext.dl.extractor.iprima', ('iprima.cz',)),
+    'IqiyiIE': ('pycord.ext.dl.extractor.iqiyi', None),
+    'Ir90TvIE': ('pycord.ext.dl.extractor.ir90tv', ('90tv.ir', 'www.90tv.ir')),
+    'ITVIE': ('pycord.ext.dl.extractor.itv', ('itv.com', 'www.itv.com')),
+    'ITVBTCCIE': ('pycord.ext.dl.extractor.itv', ('itv.com', 'www.itv.com')),
+    'IviIE': ('pycord.ext.dl.extractor.ivi', ('ivi.ru', 'ivi.tv', 'www.ivi.ru', 'www.ivi.tv')),
+    'IviCompilationIE': ('pycord.ext.dl.extractor.ivi', ('ivi.ru', 'www.ivi.ru')),
+    'IvideonIE': ('pycord.ext.dl.extractor.ivideon', ('ivideon.com', 'www.ivideon.com')),
+    'IwaraIE': ('pycord.ext.dl.extractor.iwara', ('ecchi.iwara.tv', 'iwara.tv', 'www.iwara.tv')),
+    'IzleseneIE': ('pycord.ext.dl.extractor.izlesene', ('izlesene.com', 'm.izlesene.com', 'www.izlesene.com')),
+    'JamendoIE': ('pycord.ext.dl.extractor.jamendo', ('jamendo.com', 'licensing.jamendo.com', 'www.jamendo.com')),
+    'JamendoAlbumIE': ('pycord.ext.dl.extractor.jamendo', ('jamendo.com', 'www.jamendo.com')),
+    'JeuxVideoIE': ('pycord.ext.dl.extractor.jeuxvideo', None),
+    'JoveIE': ('pycord.ext.dl.extractor.jove', ('jove.com', 'www.jove.com')),
+    'JojIE': ('pycord.ext.dl.extractor.joj', ('joj:', 'media.joj.sk')),
+    'JWPlatformIE': ('pycord.ext.dl.extractor.jwplatform', ('cdn.jwplayer.com', 'content.jwplatform.com', 'jwplatform:')),
+    'KakaoIE': ('pycord.ext.dl.extractor.kakao', ('play-tv.kakao.com', 'tv.kakao.com')),
+    'KalturaIE': ('pycord.ext.dl.extractor.kaltura', None),
+    'KankanIE': ('pycord.ext.dl.extractor.kankan', None),
+    'KaraoketvIE': ('pycord.ext.dl.extractor.karaoketv', ('karaoketv.co.il', 'www.karaoketv.co.il')),
+    'KarriereVideosIE': ('pycord.ext.dl.extractor.karrierevideos', ('karrierevideos.at', 'www.karrierevideos.at')),
+    'KeezMoviesIE': ('pycord.ext.dl.extractor.keezmovies', ('keezmovies.com', 'www.keezmovies.com')),
+    'KetnetIE': ('pycord.ext.dl.extractor.ketnet', ('ketnet.be', 'www.ketnet.be')),
+    'KhanAcademyIE': ('pycord.ext.dl.extractor.khanacademy', ('khanacademy.org', 'www.khanacademy.org')),
+    'KhanAcademyUnitIE': ('pycord.ext.dl.extractor.khanacademy', ('khanacademy.org', 'www.khanacademy.org')),
+    'KickStarterIE': ('pycord.ext.dl.extractor.kickstarter', ('kickstarter.com', 'www.kickstarter.com')),
+    'KinjaEmbedIE': ('pycord.ext.dl.extractor.kinja', None),
+    'KinoPoiskIE': ('pycord.ext.dl.extractor.kinopoisk', ('kinopoisk.ru', 'www.kinopoisk.ru')),
+    'KonserthusetPlayIE': ('pycord.ext.dl.extractor.konserthusetplay', ('konserthusetplay.se', 'rspoplay.se', 'www.konserthusetplay.se', 'www.rspoplay.se')),
+    'KrasViewIE': ('pycord.ext.dl.extractor.krasview', ('krasview.ru',)),
+    'Ku6IE': ('pycord.ext.dl.extractor.ku6', ('v.ku6.com',)),
+    'KUSIIE': ('pycord.ext.dl.extractor.kusi', ('kusi.com', 'www.kusi.com')),
+    'KuwoIE': ('pycord.ext.dl.extractor.kuwo', ('kuwo.cn', 'www.kuwo.cn')),
+    'KuwoAlbumIE': ('pycord.ext.dl.extractor.kuwo', ('kuwo.cn', 'www.kuwo.cn')),
+    'KuwoChartIE': ('pycord.ext.dl.extractor.kuwo', ('yinyue.kuwo.cn',)),
+    'KuwoSingerIE': ('pycord.ext.dl.extractor.kuwo', ('kuwo.cn', 'www.kuwo.cn')),
+    'KuwoCategoryIE': ('pycord.ext.dl.extractor.kuwo', ('yinyue.kuwo.cn',)),
+    'KuwoMvIE': ('pycord.ext.dl.extractor.kuwo', ('kuwo.cn', 'www.kuwo.cn')),
+    'LA7IE': ('pycord.ext.dl.extractor.la7', None),
+    'Laola1TvEmbedIE': ('pycord.ext.dl.extractor.laola1tv', ('laola1.tv', 'www.laola1.tv')),
+    'Laola1TvIE': ('pycord.ext.dl.extractor.laola1tv', ('laola1.tv', 'www.laola1.tv')),
+    'EHFTVIE': ('pycord.ext.dl.extractor.laola1tv', ('ehftv.com', 'www.ehftv.com')),
+    'ITTFIE': ('pycord.ext.dl.extractor.laola1tv', ('tv.ittf.com',)),
+    'LBRYIE': ('pycord.ext.dl.extractor.lbry', ('lbry.tv', 'odysee.com', 'www.lbry.tv', 'www.odysee.com')),
+    'LBRYChannelIE': ('pycord.ext.dl.extractor.lbry', ('lbry.tv', 'odysee.com', 'www.lbry.tv', 'www.odysee.com')),
+    'LCIIE': ('pycord.ext.dl.extractor.lci', ('lci.fr', 'www.lci.fr')),
+    'LcpPlayIE': ('pycord.ext.dl.extractor.lcp', ('play.lcp.fr',)),
+    'LcpIE': ('pycord.ext.dl.extractor.lcp', ('lcp.fr', 'www.lcp.fr')),
+    'Lecture2GoIE': ('pycord.ext.dl.extractor.lecture2go', ('lecture2go.uni-hamburg.de',)),
+    'LecturioIE': ('pycord.ext.dl.extractor.lecturio', ('app.lecturio.com', 'lecturio.de', 'www.lecturio.de')),
+    'LecturioCourseIE': ('pycord.ext.dl.extractor.lecturio', ('app.lecturio.com',)),
+    'LecturioDeCourseIE': ('pycord.ext.dl.extractor.lecturio', ('lecturio.de', 'www.lecturio.de')),
+    'LeIE': ('pycord.ext.dl.extractor.leeco', ('lesports.com', 'sports.le.com', 'www.le.com', 'www.lesports.com')),
+    'LePlaylistIE': ('pycord.ext.dl.extractor.leeco', ('le.com',)),
+    'LetvCloudIE': ('pycord.ext.dl.extractor.leeco', ('yuntv.letv.com',)),
+    'LEGOIE': ('pycord.ext.dl.extractor.lego', ('lego.com', 'www.lego.com')),
+    'LemondeIE': ('pycord.ext.dl.extractor.lemonde', None),
+    'LentaIE': ('pycord.ext.dl.extractor.lenta', ('lenta.ru', 'www.lenta.ru')),
+    'LibraryOfCongressIE': ('pycord.ext.dl.extractor.libraryofcongress', ('loc.gov', 'www.loc.gov')),
+    'LibsynIE': ('pycord.ext.dl.extractor.libsyn', ('html5-player.libsyn.com',)),
+    'LifeNewsIE': ('pycord.ext.dl.extractor.lifenews', ('life.ru',)),
+    'LifeEmbedIE': ('pycord.ext.dl.extractor.lifenews', ('embed.life.ru',)),
+    'LimelightMediaIE': ('pycord.ext.dl.extractor.limelight', ('assets.delvenetworks.com', 'limelight:', 'link.videoplatform.limelight.com')),
+    'LimelightChannelIE': ('pycord.ext.dl.extractor.limelight', ('assets.delvenetworks.com', 'limelight:', 'link.videoplatform.limelight.com')),
+    'LimelightChannelListIE': ('pycord.ext.dl.extractor.limelight', ('assets.delvenetworks.com', 'limelight:', 'link.videoplatform.limelight.com')),
+    'LineTVIE': ('pycord.ext.dl.extractor.line', ('tv.line.me',)),
+    'LineLiveIE': ('pycord.ext.dl.extractor.line', ('live.line.me',)),
+    'LineLiveChannelIE': ('pycord.ext.dl.extractor.line', ('live.line.me',)),
+    'LinkedInLearningIE': ('pycord.ext.dl.extractor.linkedin', ('linkedin.com', 'www.linkedin.com')),
+    'LinkedInLearningCourseIE': ('pycord.ext.dl.extractor.linkedin', ('linkedin.com', 'www.linkedin.com')),
+    'LinuxAcademyIE': ('pycord.ext.dl.extractor.linuxacademy', ('linuxacademy.com', 'www.linuxacademy.com')),
+    'LiTVIE': ('pycord.ext.dl.extractor.litv', ('litv.tv', 'www.litv.tv')),
+    'LiveJournalIE': ('pycord.ext.dl.extractor.livejournal', None),
+    'LivestreamIE': ('pycord.ext.dl.extractor.livestream', ('livestream.com', 'new.livestream.com')),
+    'LivestreamOriginalIE': ('pycord.ext.dl.extractor.livestream', ('original.livestream.com',)),
+    'LivestreamShortenerIE': ('pycord.ext.dl.extractor.livestream', ('livestre.am',)),
+    'LnkGoIE': ('pycord.ext.dl.extractor.lnkgo', ('lnk.alfa.lt', 'lnk.lt', 'lnkgo.alfa.lt', 'lnkgo.lt', 'www.lnk.alfa.lt', 'www.lnk.lt', 'www.lnkgo.alfa.lt', 'www.lnkgo.lt')),
+    'LocalNews8IE': ('pycord.ext.dl.extractor.localnews8', ('localnews8.com', 'www.localnews8.com')),
+    'LoveHomePornIE': ('pycord.ext.dl.extractor.lovehomeporn', ('lovehomeporn.com', 'www.lovehomeporn.com')),
+    'LRTIE': ('pycord.ext.dl.extractor.lrt', ('lrt.lt', 'www.lrt.lt')),
+    'LyndaIE': ('pycord.ext.dl.extractor.lynda', ('educourse.ga', 'lynda.com', 'www.educourse.ga', 'www.lynda.com')),
+    'LyndaCourseIE': ('pycord.ext.dl.extractor.lynda', ('m.educourse.ga', 'm.lynda.com', 'www.educourse.ga', 'www.lynda.com')),
+    'M6IE': ('pycord.ext.dl.extractor.m6', ('m6.fr', 'www.m6.fr')),
+    'MailRuIE': ('pycord.ext.dl.extractor.mailru', ('m.my.mail.ru', 'my.mail.ru', 'www.my.mail.ru')),
+    'MailRuMusicIE': ('pycord.ext.dl.extractor.mailru', ('my.mail.ru',)),
+    'MailRuMusicSearchIE': ('pycord.ext.dl.extractor.mailru', ('my.mail.ru',)),
+    'MallTVIE': ('pycord.ext.dl.extractor.malltv', ('mall.tv', 'sk.mall.tv', 'www.mall.tv')),
+    'MangomoloVideoIE': ('pycord.ext.dl.extractor.mangomolo', ('admin.mangomolo.com', 'player.mangomolo.com')),
+    'MangomoloLiveIE': ('pycord.ext.dl.extractor.mangomolo', ('admin.mangomolo.com', 'player.mangomolo.com')),
+    'ManyVidsIE': ('pycord.ext.dl.extractor.manyvids', ('manyvids.com', 'www.manyvids.com')),
+    'MaoriTVIE': ('pycord.ext.dl.extractor.maoritv', ('maoritelevision.com', 'www.maoritelevision.com')),
+    'MarkizaIE': ('pycord.ext.dl.extractor.markiza', ('videoarchiv.markiza.sk', 'www.videoarchiv.markiza.sk')),
+    'MarkizaPageIE': ('pycord.ext.dl.extractor.markiza', ('markiza.sk', 'tvnoviny.sk', 'www.markiza.sk', 'www.tvnoviny.sk')),
+    'MassengeschmackTVIE': ('pycord.ext.dl.extractor.massengeschmacktv', ('massengeschmack.tv', 'www.massengeschmack.tv')),
+    'MatchTVIE': ('pycord.ext.dl.extractor.matchtv', ('matchtv.ru',)),
+    'MDRIE': ('pycord.ext.dl.extractor.mdr', ('kika.de', 'mdr.de', 'www.kika.de', 'www.mdr.de')),
+    'MedalTVIE': ('pycord.ext.dl.extractor.medaltv', ('medal.tv', 'www.medal.tv')),
+    'MediasetIE': ('pycord.ext.dl.extractor.mediaset', ('mediaset:', 'mediasetplay.mediaset.it', 'static3.mediasetplay.mediaset.it', 'www.mediasetplay.mediaset.it')),
+    'MediasiteIE': ('pycord.ext.dl.extractor.mediasite', None),
+    'MediasiteCatalogIE': ('pycord.ext.dl.extractor.mediasite', None),
+    'MediasiteNamedCatalogIE': ('pycord.ext.dl.extractor.mediasite', None),
+    'MediciIE': ('pycord.ext.dl.extractor.medici', ('medici.tv', 'www.medici.tv')),
+    'MegaphoneIE': ('pycord.ext.dl.extractor.megaphone', ('player.megaphone.fm',)),
+    'MeipaiIE': ('pycord.ext.dl.extractor.meipai', ('meipai.com', 'www.meipai.com')),
+    'MelonVODIE': ('pycord.ext.dl.extractor.melonvod', ('vod.melon.com',)),
+    'METAIE': ('pycord.ext.dl.extractor.meta', ('video.meta.ua',)),
+    'MetacafeIE': ('pycord.ext.dl.extractor.metacafe', ('metacafe.com', 'www.metacafe.com')),
+    'MetacriticIE': ('pycord.ext.dl.extractor.metacritic', ('metacritic.com', 'www.metacritic.com')),
+    'MgoonIE': ('pycord.ext.dl.extractor.mgoon', None),
+    'MGTVIE': ('pycord.ext.dl.extractor.mgtv', ('mgtv.com', 'w.mgtv.com', 'www.mgtv.com')),
+    'MiaoPaiIE': ('pycord.ext.dl.extractor.miaopai', ('miaopai.com', 'www.miaopai.com')),
+    'MicrosoftVirtualAcademyIE': ('pycord.ext.dl.extractor.microsoftvirtualacademy', ('microsoftvirtualacademy.com', 'mva.microsoft.com', 'mva:', 'www.microsoftvirtualacademy.com')),
+    'MicrosoftVirtualAcademyCourseIE': ('pycord.ext.dl.extractor.microsoftvirtualacademy', ('microsoftvirtualacademy.com', 'mva.microsoft.com', 'mva:', 'www.microsoftvirtualacademy.com')),
+    'MindsIE': ('pycord.ext.dl.extractor.minds', ('minds.com', 'www.minds.com')),
+    'MindsChannelIE': ('pycord.ext.dl.extractor.minds', ('minds.com', 'www.minds.com')),
+    'MindsGroupIE': ('pycord.ext.dl.extractor.minds', ('minds.com', 'www.minds.com')),
+    'MinistryGridIE': ('pycord.ext.dl.extractor.ministrygrid', ('ministrygrid.com', 'www.ministrygrid.com')),
+    'MinotoIE': ('pycord.ext.dl.extractor.minoto', ('embed.minoto-video.com', 'iframe.minoto-video.com', 'minoto:', 'play.minoto-video.com')),
+    'MioMioIE': ('pycord.ext.dl.extractor.miomio', ('miomio.tv', 'www.miomio.tv')),
+    'TechTVMITIE': ('pycord.ext.dl.extractor.mit', ('techtv.mit.edu',)),
+    'OCWMITIE': ('pycord.ext.dl.extractor.mit', ('ocw.mit.edu',)),
+    'MiTeleIE': ('pycord.ext.dl.extractor.mitele', ('mitele.es', 'www.mitele.es')),
+    'MixcloudIE': ('pycord.ext.dl.extractor.mixcloud', ('beta.mixcloud.com', 'm.mixcloud.com', 'mixcloud.com', 'www.mixcloud.com')),
+    'MixcloudUserIE': ('pycord.ext.dl.extractor.mixcloud', ('mixcloud.com', 'www.mixcloud.com')),
+    'MixcloudPlaylistIE': ('pycord.ext.dl.extractor.mixcloud', ('mixcloud.com', 'www.mixcloud.com')),
+    'MLBIE': ('pycord.ext.dl.extractor.mlb', ('mlb.com',)),
+    'MLBVideoIE': ('pycord.ext.dl.extractor.mlb', ('mlb.com', 'www.mlb.com')),
+    'MnetIE': ('pycord.ext.dl.extractor.mnet', ('mnet.com', 'mnet.interest.me', 'www.mnet.com', 'www.mnet.interest.me')),
+    'MoeVideoIE': ('pycord.ext.dl.extractor.moevideo', ('moevideo.net', 'playreplay.net', 'thesame.tv', 'videochart.net', 'www.moevideo.net', 'www.playreplay.net', 'www.thesame.tv', 'www.videochart.net')),
+    'MofosexIE': ('pycord.ext.dl.extractor.mofosex', ('mofosex.com', 'www.mofosex.com')),
+    'MofosexEmbedIE': ('pycord.ext.dl.extractor.mofosex', ('mofosex.com', 'www.mofosex.com')),
+    'MojvideoIE': ('pycord.ext.dl.extractor.mojvideo', ('mojvideo.com', 'www.mojvideo.com')),
+    'MorningstarIE': ('pycord.ext.dl.extractor.morningstar', ('news.morningstar.com', 'www.morningstar.com')),
+    'MotherlessIE': ('pycord.ext.dl.extractor.motherless', ('motherless.com', 'www.motherless.com')),
+    'MotherlessGroupIE': ('pycord.ext.dl.extractor.motherless', ('motherless.com', 'www.motherless.com')),
+    'MotorsportIE': ('pycord.ext.dl.extractor.motorsport', ('motorsport.com', 'www.motorsport.com')),
+    'MovieClipsIE': ('pycord.ext.dl.extractor.movieclips', ('movieclips.com', 'www.movieclips.com')),
+    'MoviezineIE': ('pycord.ext.dl.extractor.moviezine', ('moviezine.se', 'www.moviezine.se')),
+    'MovingImageIE': ('pycord.ext.dl.extractor.movingimage', ('movingimage.nls.uk',)),
+    'MSNIE': ('pycord.ext.dl.extractor.msn', ('msn.com', 'preview.msn.com', 'www.msn.com')),
+    'MTVIE': ('pycord.ext.dl.extractor.mtv', ('mtv.com', 'www.mtv.com')),
+    'MTVVideoIE': ('pycord.ext.dl.extractor.mtv', ('m.mtv.com', 'mtv.com', 'www.mtv.com')),
+    'MTVServicesEmbeddedIE': ('pycord.ext.dl.extractor.mtv', ('media.mtvnservices.com',)),
+    'MTVDEIE': ('pycord.ext.dl.extractor.mtv', ('mtv.de', 'www.mtv.de')),
+    'MTVJapanIE': ('pycord.ext.dl.extractor.mtv', ('mtvjapan.com', 'www.mtvjapan.com')),
+    'MuenchenTVIE': ('pycord.ext.dl.extractor.muenchentv', ('muenchen.tv', 'www.muenchen.tv')),
+    'MwaveIE': ('pycord.ext.dl.extractor.mwave', ('mwave.interest.me',)),
+    'MwaveMeetGreetIE': ('pycord.ext.dl.extractor.mwave', ('mwave.interest.me',)),
+    'MyChannelsIE': ('pycord.ext.dl.extractor.mychannels', ('mychannels.com', 'www.mychannels.com')),
+    'MySpaceIE': ('pycord.ext.dl.extractor.myspace', ('myspace.com',)),
+    'MySpaceAlbumIE': ('pycord.ext.dl.extractor.myspace', ('myspace.com',)),
+    'MySpassIE': ('pycord.ext.dl.extractor.myspass', ('myspass.de', 'www.myspass.de')),
+    'MyviIE': ('pycord.ext.dl.extractor.myvi', ('myvi.ru', 'myvi.tv', 'myvi:', 'www.myvi.ru', 'www.myvi.tv')),
+    'MyviEmbedIE': ('pycord.ext.dl.extractor.myvi', ('myvi.tv', 'www.myvi.tv')),
+    'MyVidsterIE': ('pycord.ext.dl.extractor.myvidster', ('myvidster.com', 'www.myvidster.com')),
+    'NationalGeographicVideoIE': ('pycord.ext.dl.extractor.nationalgeographic', ('video.nationalgeographic.com',)),
+    'NationalGeographicTVIE': ('pycord.ext.dl.extractor.nationalgeographic', ('nationalgeographic.com', 'www.nationalgeographic.com')),
+    'NaverIE': ('pycord.ext.dl.extractor.naver', ('m.tv.naver.com', 'm.tvcast.naver.com', 'tv.naver.com', 'tvcast.naver.com')),
+    'NBAWatchEmbedIE': ('pycord.ext.dl.extractor.nba', ('nba.com', 'watch.nba.com', 'www.nba.com')),
+    'NBAWatchIE': ('pycord.ext.dl.extractor.nba', ('nba.com', 'watch.nba.com', 'www.nba.com')),
+    'NBAWatchCollectionIE': ('pycord.ext.dl.extractor.nba', ('nba.com', 'watch.nba.com', 'www.nba.com')),
+    'NBAEmbedIE': ('pycord.ext.dl.extractor.nba', ('secure.nba.com',)),
+    'NBAIE': ('pycord.ext.dl.extractor.nba', ('nba.com', 'www.nba.com')),
+    'NBAChannelIE': ('pycord.ext.dl.extractor.nba', ('nba.com', 'www.nba.com')),
+    'NBCIE': ('pycord.ext.dl.extractor.nbc', ('nbc.com', 'www.nbc.com')),
+    'NBCNewsIE': ('pycord.ext.dl.extractor.nbc', ('msnbc.com', 'nbcnews.com', 'today.com', 'www.msnbc.com', 'www.nbcnews.com', 'www.today.com')),
+    'NBCOlympicsIE': ('pycord.ext.dl.extractor.nbc', ('www.nbcolympics.com',)),
+    'NBCOlympicsStreamIE': ('pycord.ext.dl.extractor.nbc', ('stream.nbcolympics.com',)),
+    'NBCSportsIE': ('pycord.ext.dl.extractor.nbc', ('nbcsports.com', 'www.nbcsports.com')),
+    'NBCSportsStreamIE': ('pycord.ext.dl.extractor.nbc', ('stream.nbcsports.com',)),
+    'NBCSportsVPlayerIE': ('pycord.ext.dl.extractor.nbc', ('nbcsports.com', 'vplayer.nbcsports.com', 'www.nbcsports.com')),
+    'NDRIE': ('pycord.ext.dl.extractor.ndr', ('ndr.de', 'www.ndr.de')),
+    'NJoyIE': ('pycord.ext.dl.extractor.ndr', ('n-joy.de', 'www.n-joy.de')),
+    'NDREmbedBaseIE': ('pycord.ext.dl.extractor.ndr', ('ndr:', 'www.ndr.de')),
+    'NDREmbedIE': ('pycord.ext.dl.extractor.ndr', ('ndr.de', 'www.ndr.de')),
+    'NJoyEmbedIE': ('pycord.ext.dl.extractor.ndr', ('n-joy.de', 'www.n-joy.de')),
+    'NDTVIE': ('pycord.ext.dl.extractor.ndtv', ('ndtv.com',)),
+    'NetzkinoIE': ('pycord.ext.dl.extractor.netzkino', ('netzkino.de', 'www.netzkino.de')),
+    'NerdCubedFeedIE': ('pycord.ext.dl.extractor.nerdcubed', ('nerdcubed.co.uk', 'www.nerdcubed.co.uk')),
+    'NetEaseMusicIE': ('pycord.ext.dl.extractor.neteasemusic', ('music.163.com',)),
+    'NetEaseMusicAlbumIE': ('pycord.ext.dl.extractor.neteasemusic', ('music.163.com',)),
+    'NetEaseMusicSingerIE': ('pycord.ext.dl.extractor.neteasemusic', ('music.163.com',)),
+    'NetEaseMusicListIE': ('pycord.ext.dl.extractor.neteasemusic', ('music.163.com',)),
+    'NetEaseMusicMvIE': ('pycord.ext.dl.extractor.neteasemusic', ('music.163.com',)),
+    'NetEaseMusicProgramIE': ('pycord.ext.dl.extractor.neteasemusic', ('music.163.com',)),
+    'NetEaseMusicDjRadioIE': ('pycord.ext.dl.extractor.neteasemusic', ('music.163.com',)),
+    'NewgroundsIE': ('pycord.ext.dl.extractor.newgrounds', ('newgrounds.com', 'www.newgrounds.com')),
+    'NewgroundsPlaylistIE': ('pycord.ext.dl.extractor.newgrounds', ('newgrounds.com', 'www.newgrounds.com')),
+    'NewstubeIE': ('pycord.ext.dl.extractor.newstube', ('newstube.ru', 'www.newstube.ru')),
+    'NextMediaIE': ('pycord.ext.dl.extractor.nextmedia', ('hk.apple.nextmedia.com',)),
+    'NextMediaActionNewsIE': ('pycord.ext.dl.extractor.nextmedia', ('hk.dv.nextmedia.com',)),
+    'AppleDailyIE': ('pycord.ext.dl.extractor.nextmedia', ('ent.appledaily.com.tw', 'www.appledaily.com.tw')),
+    'NextTVIE': ('pycord.ext.dl.extractor.nextmedia', ('nexttv.com.tw', 'www.nexttv.com.tw')),
+    'NexxIE': ('pycord.ext.dl.extractor.nexx', ('api.nexx.cloud', 'api.nexxcdn.com', 'arc.nexx.cloud', 'nexx:')),
+    'NexxEmbedIE': ('pycord.ext.dl.extractor.nexx', ('embed.nexx.cloud', 'embed.nexxcdn.com')),
+    'NFLIE': ('pycord.ext.dl.extractor.nfl', None),
+    'NFLArticleIE': ('pycord.ext.dl.extractor.nfl', None),
+    'NhkVodIE': ('pycord.ext.dl.extractor.nhk', ('www3.nhk.or.jp',)),
+    'NhkVodProgramIE': ('pycord.ext.dl.extractor.nhk', ('www3.nhk.or.jp',)),
+    'NHLIE': ('pycord.ext.dl.extractor.nhl', ('nhl.com', 'wch2016.com', 'www.nhl.com', 'www.wch2016.com')),
+    'NickIE': ('pycord.ext.dl.extractor.nick', ('beta.nick.com', 'beta.nickjr.com', 'nick.com', 'nickjr.com', 'www.nick.com', 'www.nickjr.com')),
+    'NickBrIE': ('pycord.ext.dl.extractor.nick', None),
+    'NickDeIE': ('pycord.ext.dl.extractor.nick', ('nick.ch', 'nick.com.pl', 'nick.de', 'nickelodeon.at', 'nickelodeon.be', 'nickelodeon.dk', 'nickelodeon.nl', 'nickelodeon.no', 'nickelodeon.se', 'www.nick.ch', 'www.nick.com.pl', 'www.nick.de', 'www.nickelodeon.at', 'www.nickelodeon.be', 'www.nickelodeon.dk', 'www.nickelodeon.nl', 'www.nickelodeon.no', 'www.nickelodeon.se')),
+    'NickNightIE': ('pycord.ext.dl.extractor.nick', ('www.nicknight.at', 'www.nicknight.de', 'www.nicknight.tv')),
+    'NickRuIE': ('pycord.ext.dl.extractor.nick', ('www.nickelodeon.com.tr', 'www.nickelodeon.es', 'www.nickelodeon.fr', 'www.nickelodeon.hu', 'www.nickelodeon.pt', 'www.nickelodeon.ro', 'www.nickelodeon.ru')),
+    'NiconicoIE': ('pycord.ext.dl.extractor.niconico', ('nicovideo.jp', 'secure.nicovideo.jp', 'sp.nicovideo.jp', 'www.nicovideo.jp')),
+    'NiconicoPlaylistIE': ('pycord.ext.dl.extractor.niconico', ('nicovideo.jp', 'www.nicovideo.jp')),
+    'NineCNineMediaIE': ('pycord.ext.dl.extractor.ninecninemedia', ('9c9media:',)),
+    'NineGagIE': ('pycord.ext.dl.extractor.ninegag', ('9gag.com', 'www.9gag.com')),
+    'NineNowIE': ('pycord.ext.dl.extractor.ninenow', ('9now.com.au', 'www.9now.com.au')),
+    'NintendoIE': ('pycord.ext.dl.extractor.nintendo', ('nintendo.com', 'www.nintendo.com')),
+    'NJPWWorldIE': ('pycord.ext.dl.extractor.njpwworld', ('front.njpwworld.com', 'njpwworld.com')),
+    'NobelPrizeIE': ('pycord.ext.dl.extractor.nobelprize', ('nobelprize.org', 'www.nobelprize.org')),
+    'NonkTubeIE': ('pycord.ext.dl.extractor.nonktube', ('nonktube.com', 'www.nonktube.com')),
+    'NoovoIE': ('pycord.ext.dl.extractor.noovo', ('noovo.ca',)),
+    'NormalbootsIE': ('pycord.ext.dl.extractor.normalboots', ('normalboots.com', 'www.normalboots.com')),
+    'NosVideoIE': ('pycord.ext.dl.extractor.nosvideo', ('nosvideo.com', 'www.nosvideo.com')),
+    'NovaEmbedIE': ('pycord.ext.dl.extractor.nova', ('media.cms.nova.cz',)),
+    'NovaIE': ('pycord.ext.dl.extractor.nova', None),
+    'NownessIE': ('pycord.ext.dl.extractor.nowness', ('cn.nowness.com', 'nowness.com', 'www.nowness.com')),
+    'NownessPlaylistIE': ('pycord.ext.dl.extractor.nowness', ('cn.nowness.com', 'nowness.com', 'www.nowness.com')),
+    'NownessSeriesIE': ('pycord.ext.dl.extractor.nowness', ('cn.nowness.com', 'nowness.com', 'www.nowness.com')),
+    'NozIE': ('pycord.ext.dl.extractor.noz', ('noz.de', 'www.noz.de')),
+    'AndereTijdenIE': ('pycord.ext.dl.extractor.npo', ('anderetijden.nl', 'www.anderetijden.nl')),
+    'NPOIE': ('pycord.ext.dl.extractor.npo', ('npo.nl', 'npo3.nl', 'npo:', 'npostart.nl', 'ntr.nl', 'omroepwnl.nl', 'www.npo.nl', 'www.npo3.nl', 'www.npostart.nl', 'www.ntr.nl', 'www.omroepwnl.nl', 'www.zapp.nl', 'zapp.nl')),
+    'NPOLiveIE': ('pycord.ext.dl.extractor.npo', ('npo.nl', 'npostart.nl', 'www.npo.nl', 'www.npostart.nl')),
+    'NPORadioIE': ('pycord.ext.dl.extractor.npo', ('npo.nl', 'www.npo.nl')),
+    'NPORadioFragmentIE': ('pycord.ext.dl.extractor.npo', ('npo.nl', 'www.npo.nl')),
+    'SchoolTVIE': ('pycord.ext.dl.extractor.npo', ('schooltv.nl', 'www.schooltv.nl')),
+    'HetKlokhuisIE': ('pycord.ext.dl.extractor.npo', ('hetklokhuis.nl', 'www.hetklokhuis.nl')),
+    'VPROIE': ('pycord.ext.dl.extractor.npo', ('2doc.nl', 'tegenlicht.vpro.nl', 'vpro.nl', 'www.2doc.nl', 'www.tegenlicht.vpro.nl', 'www.vpro.nl')),
+    'WNLIE': ('pycord.ext.dl.extractor.npo', ('omroepwnl.nl', 'www.omroepwnl.nl')),
+    'NprIE': ('pycord.ext.dl.extractor.npr', ('npr.org', 'www.npr.org')),
+    'NRKIE': ('pycord.ext.dl.extractor.nrk', ('nrk.no', 'nrk:', 'v8-psapi.nrk.no', 'v8.psapi.nrk.no', 'www.nrk.no')),
+    'NRKPlaylistIE': ('pycord.ext.dl.extractor.nrk', ('nrk.no', 'www.nrk.no')),
+    'NRKSkoleIE': ('pycord.ext.dl.extractor.nrk', ('nrk.no', 'www.nrk.no')),
+    'NRKTVIE': ('pycord.ext.dl.extractor.nrk', ('radio.nrk.no', 'radio.nrksuper.no', 'tv.nrk.no', 'tv.nrksuper.no')),
+    'NRKTVDirekteIE': ('pycord.ext.dl.extractor.nrk', ('radio.nrk.no', 'tv.nrk.no')),
+    'NRKRadioPodkastIE': ('pycord.ext.dl.extractor.nrk', ('radio.nrk.no',)),
+    'NRKTVEpisodeIE': ('pycord.ext.dl.extractor.nrk', ('tv.nrk.no',)),
+    'NRKTVEpisodesIE': ('pycord.ext.dl.extractor.nrk', ('tv.nrk.no',)),
+    'NRKTVSeasonIE': ('pycord.ext.dl.extractor.nrk', ('radio.nrk.no', 'tv.nrk.no')),
+    'NRKTVSeriesIE': ('pycord.ext.dl.extractor.nrk', ('nrksuper.no', 'radio.nrk.no', 'tv.nrk.no', 'tv.nrksuper.no')),
+    'NRLTVIE': ('pycord.ext.dl.extractor.nrl', ('nrl.com', 'www.nrl.com')),
+    'NTVCoJpCUIE': ('pycord.ext.dl.extractor.ntvcojp', ('cu.ntv.co.jp',)),
+    'NTVDeIE': ('pycord.ext.dl.extractor.ntvde', ('n-tv.de', 'www.n-tv.de')),
+    'NTVRuIE': ('pycord.ext.dl.extractor.ntvru', ('ntv.ru', 'www.ntv.ru')),
+    'NYTimesIE': ('pycord.ext.dl.extractor.nytimes', ('graphics8.nytimes.com', 'nytimes.com', 'www.nytimes.com')),
+    'NYTimesArticleIE': ('pycord.ext.dl.extractor.nytimes', ('nytimes.com', 'www.nytimes.com')),
+    'NYTimesCookingIE': ('pycord.ext.dl.extractor.nytimes', ('cooking.nytimes.com',)),
+    'NuvidIE': ('pycord.ext.dl.extractor.nuvid', ('m.nuvid.com', 'www.nuvid.com')),
+    'NZZIE': ('pycord.ext.dl.extractor.nzz', ('nzz.ch', 'www.nzz.ch')),
+    'OdaTVIE': ('pycord.ext.dl.extractor.odatv', ('odatv.com', 'www.odatv.com')),
+    'OdnoklassnikiIE': ('pycord.ext.dl.extractor.odnoklassniki', ('m.odnoklassniki.ru', 'm.ok.ru', 'mobile.odnoklassniki.ru', 'mobile.ok.ru', 'odnoklassniki.ru', 'ok.ru', 'www.odnoklassniki.ru', 'www.ok.ru')),
+    'OktoberfestTVIE': ('pycord.ext.dl.extractor.oktoberfesttv', ('oktoberfest-tv.de', 'www.oktoberfest-tv.de')),
+    'OnDemandKoreaIE': ('pycord.ext.dl.extractor.ondemandkorea', ('ondemandkorea.com', 'www.ondemandkorea.com')),
+    'OnetIE': ('pycord.ext.dl.extractor.onet', ('onet.tv', 'onet100.vod.pl', 'www.onet.tv')),
+    'OnetChannelIE': ('pycord.ext.dl.extractor.onet', ('onet.tv', 'onet100.vod.pl', 'www.onet.tv')),
+    'OnetMVPIE': ('pycord.ext.dl.extractor.onet', ('onetmvp:',)),
+    'OnetPlIE': ('pycord.ext.dl.extractor.onet', ('businessinsider.com.pl', 'onet.pl', 'plejada.pl')),
+    'OnionStudiosIE': ('pycord.ext.dl.extractor.onionstudios', ('onionstudios.com', 'www.onionstudios.com')),
+    'OoyalaIE': ('pycord.ext.dl.extractor.ooyala', None),
+    'OoyalaExternalIE': ('pycord.ext.dl.extractor.ooyala', None),
+    'OraTVIE': ('pycord.ext.dl.extractor.ora', ('ora.tv', 'unsafespeech.com', 'www.ora.tv', 'www.unsafespeech.com')),
+    'ORFTVthekIE': ('pycord.ext.dl.extractor.orf', ('tvthek.orf.at',)),
+    'ORFFM4IE': ('pycord.ext.dl.extractor.orf', ('fm4.orf.at',)),
+    'ORFFM4StoryIE': ('pycord.ext.dl.extractor.orf', ('fm4.orf.at',)),
+    'ORFOE1IE': ('pycord.ext.dl.extractor.orf', ('oe1.orf.at',)),
+    'ORFOE3IE': ('pycord.ext.dl.extractor.orf', ('oe3.orf.at',)),
+    'ORFNOEIE': ('pycord.ext.dl.extractor.orf', ('noe.orf.at',)),
+    'ORFWIEIE': ('pycord.ext.dl.extractor.orf', ('wien.orf.at',)),
+    'ORFBGLIE': ('pycord.ext.dl.extractor.orf', ('burgenland.orf.at',)),
+    'ORFOOEIE': ('pycord.ext.dl.extractor.orf', ('ooe.orf.at',)),
+    'ORFSTMIE': ('pycord.ext.dl.extractor.orf', ('steiermark.orf.at',)),
+    'ORFKTNIE': ('pycord.ext.dl.extractor.orf', ('kaernten.orf.at',)),
+    'ORFSBGIE': ('pycord.ext.dl.extractor.orf', ('salzburg.orf.at',)),
+    'ORFTIRIE': ('pycord.ext.dl.extractor.orf', ('tirol.orf.at',)),
+    'ORFVBGIE': ('pycord.ext.dl.extractor.orf', ('vorarlberg.orf.at',)),
+    'ORFIPTVIE': ('pycord.ext.dl.extractor.orf', ('iptv.orf.at',)),
+    'OutsideTVIE': ('pycord.ext.dl.extractor.outsidetv', ('outsidetv.com', 'www.outsidetv.com')),
+    'PacktPubIE': ('pycord.ext.dl.extractor.packtpub', ('packtpub.com', 'subscription.packtpub.com', 'www.packtpub.com')),
+    'PacktPubCourseIE': ('pycord.ext.dl.extractor.packtpub', ('packtpub.com', 'subscription.packtpub.com', 'www.packtpub.com')),
+    'PalcoMP3IE': ('pycord.ext.dl.extractor.palcomp3', ('palcomp3.com', 'palcomp3.com.br', 'www.palcomp3.com', 'www.palcomp3.com.br')),
+    'PalcoMP3ArtistIE': ('pycord.ext.dl.extractor.palcomp3', ('palcomp3.com', 'palcomp3.com.br', 'www.palcomp3.com', 'www.palcomp3.com.br')),
+    'PalcoMP3VideoIE': ('pycord.ext.dl.extractor.palcomp3', ('palcomp3.com', 'palcomp3.com.br', 'www.palcomp3.com', 'www.palcomp3.com.br')),
+    'PandoraTVIE': ('pycord.ext.dl.extractor.pandoratv', None),
+    'ParliamentLiveUKIE': ('pycord.ext.dl.extractor.parliamentliveuk', ('parliamentlive.tv', 'www.parliamentlive.tv')),
+    'PatreonIE': ('pycord.ext.dl.extractor.patreon', ('patreon.com', 'www.patreon.com')),
+    'PBSIE': ('pycord.ext.dl.extractor.pbs', ('on-demand.wvia.org', 'pbs.kixe.org', 'pbs.org', 'player.pbs.org', 'portal.knme.org', 'video.alaskapublic.org', 'video.aptv.org', 'video.azpbs.org', 'video.basinpbs.org', 'video.cpt12.org', 'video.cptv.org', 'video.deltabroadcasting.org', 'video.dptv.org', 'video.gpb.org', 'video.houstonpbs.org', 'video.idahoptv.org', 'video.ideastations.org', 'video.ideastream.org', 'video.indianapublicmedia.org', 'video.iptv.org', 'video.kacvtv.org', 'video.kbtc.org', 'video.kbyueleven.org', 'video.kcostv.org', 'video.kcts9.org', 'video.keet.org', 'video.kenw.org', 'video.kera.org', 'video.ket.org', 'video.klrn.org', 'video.klru.tv', 'video.kmos.org', 'video.kpbs.org', 'video.kqed.org', 'video.krwg.org', 'video.ksps.org', 'video.kued.org', 'video.lpb.org', 'video.lptv.org', 'video.mountainlake.org', 'video.mpbn.net', 'video.mpbonline.org', 'video.mpt.tv', 'video.mptv.org', 'video.netnebraska.org', 'video.networkknowledge.tv', 'video.nhptv.org', 'video.ninenet.org', 'video.optv.org', 'video.pba.org', 'video.pbs.org', 'video.pbshawaii.org', 'video.pbssocal.org', 'video.pioneer.org', 'video.rmpbs.org', 'video.scetv.org', 'video.soptv.org', 'video.thinktv.org', 'video.thirteen.org', 'video.tpt.org', 'video.unctv.org', 'video.valleypbs.org', 'video.vegaspbs.org', 'video.vpt.org', 'video.wbgu.org', 'video.wcmu.org', 'video.wcny.org', 'video.wcte.tv', 'video.wdse.org', 'video.wedu.org', 'video.weiu.net', 'video.westernreservepublicmedia.org', 'video.wfsu.org', 'video.wfwa.org', 'video.wfyi.org', 'video.wgbh.org', 'video.wgby.org', 'video.wgcu.org', 'video.wgte.org', 'video.wgvu.org', 'video.whut.org', 'video.whyy.org', 'video.will.illinois.edu', 'video.wipb.org', 'video.witf.org', 'video.wkar.org', 'video.wkno.org', 'video.wkyupbs.org', 'video.wljt.org', 'video.wlrn.org', 'video.wlvt.org', 'video.wmht.org', 'video.wned.org', 'video.wnin.org', 'video.wnit.org', 'video.wnpt.org', 'video.wosu.org', 'video.woub.org', 'video.wpbt2.org', 'video.wpsu.org', 'video.wpt.org', 'video.wqpt.org', 'video.wskg.org', 'video.wsre.org', 'video.wtcitv.org', 'video.wtjx.org', 'video.wttw.com', 'video.wtvi.org', 'video.wucftv.org', 'video.wuft.org', 'video.wusf.usf.edu', 'video.wvpt.net', 'video.wvpublic.org', 'video.wvut.org', 'video.wxxi.org', 'video.wycc.org', 'video.wyomingpbs.org', 'videos.oeta.tv', 'vids.kvie.org', 'watch.aetn.org', 'watch.cetconnect.org', 'watch.easttennesseepbs.org', 'watch.knpb.org', 'watch.kpts.org', 'watch.ksmq.org', 'watch.ktwu.org', 'watch.montanapbs.org', 'watch.njtvonline.org', 'watch.nwptv.org', 'watch.opb.org', 'watch.sdpb.org', 'watch.weta.org', 'watch.wliw.org', 'watch.wpbstv.org', 'watch.wqed.org', 'watch.wsiu.org', 'watch.wxel.org', 'wnmuvideo.nmu.edu', 'www.pbs.org')),
+    'PearVideoIE': ('pycord.ext.dl.extractor.pearvideo', ('pearvideo.com', 'www.pearvideo.com')),
+    'PeerTubeIE': ('pycord.ext.dl.extractor.peertube', None),
+    'PeopleIE': ('pycord.ext.dl.extractor.people', ('people.com', 'www.people.com')),
+    'PerformGroupIE': ('pycord.ext.dl.extractor.performgroup', ('player.performgroup.com',)),
+    'PeriscopeIE': ('pycord.ext.dl.extractor.periscope', ('periscope.tv', 'pscp.tv', 'www.periscope.tv', 'www.pscp.tv')),
+    'PeriscopeUserIE': ('pycord.ext.dl.extractor.periscope', ('periscope.tv', 'pscp.tv', 'www.periscope.tv', 'www.pscp.tv')),
+    'PhilharmonieDeParisIE': ('pycord.ext.dl.extractor.philharmoniedeparis', ('live.philharmoniedeparis.fr', 'pad.philharmoniedeparis.fr')),
+    'PhoenixIE': ('pycord.ext.dl.extractor.phoenix', ('phoenix.de', 'www.phoenix.de')),
+    'PhotobucketIE': ('pycord.ext.dl.extractor.photobucket', ('photobucket.com',)),
+    'PicartoIE': ('pycord.ext.dl.extractor.picarto', None),
+    'PicartoVodIE': ('pycord.ext.dl.extractor.picarto', None),
+    'PikselIE': ('pycord.ext.dl.extractor.piksel', ('api-ovp.piksel.com', 'api.multicastmedia.com', 'movie-s.nhk.or.jp', 'mz-edge.stream.co.jp', 'player.multicastmedia.com', 'player.olympusattelecom.com', 'player.piksel.com', 'player.vibebyvista.com', 'vidego.baltimorecity.gov')),
+    'PinkbikeIE': ('pycord.ext.dl.extractor.pinkbike', ('es.pinkbike.org', 'pinkbike.com', 'www.pinkbike.com')),
+    'PinterestIE': ('pycord.ext.dl.extractor.pinterest', ('pinterest.at', 'pinterest.be', 'pinterest.ca', 'pinterest.ch', 'pinterest.cl', 'pinterest.co', 'pinterest.co.at', 'pinterest.co.in', 'pinterest.co.kr', 'pinterest.co.nz', 'pinterest.co.uk', 'pinterest.com', 'pinterest.com.au', 'pinterest.com.bo', 'pinterest.com.ec', 'pinterest.com.mx', 'pinterest.com.pe', 'pinterest.com.py', 'pinterest.com.uy', 'pinterest.com.vn', 'pinterest.de', 'pinterest.dk', 'pinterest.ec', 'pinterest.es', 'pinterest.fr', 'pinterest.hu', 'pinterest.id', 'pinterest.ie', 'pinterest.in', 'pinterest.info', 'pinterest.it', 'pinterest.jp', 'pinterest.kr', 'pinterest.mx', 'pinterest.nl', 'pinterest.nz', 'pinterest.pe', 'pinterest.ph', 'pinterest.pt', 'pinterest.ru', 'pinterest.th', 'pinterest.tw', 'pinterest.uk', 'pinterest.vn')),
+    'PinterestCollectionIE': ('pycord.ext.dl.extractor.pinterest', ('pinterest.at', 'pinterest.be', 'pinterest.ca', 'pinterest.ch', 'pinterest.cl', 'pinterest.co', 'pinterest.co.at', 'pinterest.co.in', 'pinterest.co.kr', 'pinterest.co.nz', 'pinterest.co.uk', 'pinterest.com', 'pinterest.com.au', 'pinterest.com.bo', 'pinterest.com.ec', 'pinterest.com.mx', 'pinterest.com.pe', 'pinterest.com.py', 'pinterest.com.uy', 'pinterest.com.vn', 'pinterest.de', 'pinterest.dk', 'pinterest.ec', 'pinterest.es', 'pinterest.fr', 'pinterest.hu', 'pinterest.id', 'pinterest.ie', 'pinterest.in', 'pinterest.info', 'pinterest.it', 'pinterest.jp', 'pinterest.kr', 'pinterest.mx', 'pinterest.nl', 'pinterest.nz', 'pinterest.pe', 'pinterest.ph', 'pinterest.pt', 'pinterest.ru', 'pinterest.th', 'pinterest.tw', 'pinterest.uk', 'pinterest.vn')),
+    'PladformIE': ('pycord.ext.dl.extractor.pladform', ('out.pladform.ru', 'static.pladform.ru', 'video.pladform.ru')),
+    'PlatziIE': ('pycord.ext.dl.extractor.platzi', ('courses.platzi.com', 'platzi.com')),
+    'PlatziCourseIE': ('pycord.ext.dl.extractor.platzi', ('courses.platzi.com', 'platzi.com')),
+    'PlayFMIE': ('pycord.ext.dl.extractor.playfm', ('play.fm', 'www.play.fm')),
+    'PlayPlusTVIE': ('pycord.ext.dl.extractor.playplustv', ('playplus.com', 'playplus.tv', 'www.playplus.com', 'www.playplus.tv')),
+    'PlaysTVIE': ('pycord.ext.dl.extractor.plays', ('plays.tv', 'www.plays.tv')),
+    'PlayStuffIE': ('pycord.ext.dl.extractor.playstuff', ('play.stuff.co.nz', 'www.play.stuff.co.nz')),
+    'PlaytvakIE': ('pycord.ext.dl.extractor.playtvak', None),
+    'PlayvidIE': ('pycord.ext.dl.extractor.playvid', ('playvid.com', 'www.playvid.com')),
+    'PlaywireIE': ('pycord.ext.dl.extractor.playwire', ('cdn.playwire.com', 'config.playwire.com')),
+    'PluralsightIE': ('pycord.ext.dl.extractor.pluralsight', ('app.pluralsight.com', 'pluralsight.com', 'www.pluralsight.com')),
+    'PluralsightCourseIE': ('pycord.ext.dl.extractor.pluralsight', ('app.pluralsight.com', 'pluralsight.com', 'www.pluralsight.com')),
+    'PodomaticIE': ('pycord.ext.dl.extractor.podomatic', None),
+    'PokemonIE': ('pycord.ext.dl.extractor.pokemon', ('pokemon.com', 'www.pokemon.com')),
+    'PolskieRadioIE': ('pycord.ext.dl.extractor.polskieradio', ('polskieradio.pl', 'www.polskieradio.pl')),
+    'PolskieRadioCategoryIE': ('pycord.ext.dl.extractor.polskieradio', ('polskieradio.pl', 'www.polskieradio.pl')),
+    'PopcorntimesIE': ('pycord.ext.dl.extractor.popcorntimes', ('popcorntimes.tv',)),
+    'PopcornTVIE': ('pycord.ext.dl.extractor.popcorntv', ('popcorntv.it',)),
+    'Porn91IE': ('pycord.ext.dl.extractor.porn91', ('91porn.com', 'www.91porn.com')),
+    'PornComIE': ('pycord.ext.dl.extractor.porncom', ('porn.com',)),
+    'PornHdIE': ('pycord.ext.dl.extractor.pornhd', ('pornhd.com', 'www.pornhd.com')),
+    'PornHubIE': ('pycord.ext.dl.extractor.pornhub', ('pornhub.com', 'pornhub.net', 'pornhub.org', 'pornhubpremium.com', 'pornhubpremium.net', 'pornhubpremium.org', 'pornhubthbh7ap3u.onion', 'thumbzilla.com', 'www.thumbzilla.com')),
+    'PornHubUserIE': ('pycord.ext.dl.extractor.pornhub', ('pornhub.com', 'pornhub.net', 'pornhub.org', 'pornhubpremium.com', 'pornhubpremium.net', 'pornhubpremium.org', 'pornhubthbh7ap3u.onion')),
+    'PornHubPagedVideoListIE': ('pycord.ext.dl.extractor.pornhub', ('pornhub.com', 'pornhub.net', 'pornhub.org', 'pornhubpremium.com', 'pornhubpremium.net', 'pornhubpremium.org', 'pornhubthbh7ap3u.onion')),
+    'PornHubUserVideosUploadIE': ('pycord.ext.dl.extractor.pornhub', ('pornhub.com', 'pornhub.net', 'pornhub.org', 'pornhubpremium.com', 'pornhubpremium.net', 'pornhubpremium.org', 'pornhubthbh7ap3u.onion')),
+    'PornotubeIE': ('pycord.ext.dl.extractor.pornotube', ('pornotube.com',)),
+    'PornoVoisinesIE': ('pycord.ext.dl.extractor.pornovoisines', ('pornovoisines.com', 'www.pornovoisines.com')),
+    'PornoXOIE': ('pycord.ext.dl.extractor.pornoxo', ('pornoxo.com', 'www.pornoxo.com')),
+    'PuhuTVIE': ('pycord.ext.dl.extractor.puhutv', ('puhutv.com', 'www.puhutv.com')),
+    'PuhuTVSerieIE': ('pycord.ext.dl.extractor.puhutv', ('puhutv.com', 'www.puhutv.com')),
+    'PressTVIE': ('pycord.ext.dl.extractor.presstv', ('presstv.ir', 'www.presstv.ir')),
+    'ProSiebenSat1IE': ('pycord.ext.dl.extractor.prosiebensat1', ('advopedia.at', 'advopedia.ch', 'advopedia.de', 'beta.advopedia.at', 'beta.advopedia.ch', 'beta.advopedia.de', 'beta.kabeleins.at', 'beta.kabeleins.ch', 'beta.kabeleins.de', 'beta.kabeleinsdoku.at', 'beta.kabeleinsdoku.ch', 'beta.kabeleinsdoku.de', 'beta.prosieben.at', 'beta.prosieben.ch', 'beta.prosieben.de', 'beta.prosiebenmaxx.at', 'beta.prosiebenmaxx.ch', 'beta.prosiebenmaxx.de', 'beta.sat1.at', 'beta.sat1.ch', 'beta.sat1.de', 'beta.sat1gold.at', 'beta.sat1gold.ch', 'beta.sat1gold.de', 'beta.sixx.at', 'beta.sixx.ch', 'beta.sixx.de', 'beta.the-voice-of-germany.at', 'beta.the-voice-of-germany.ch', 'beta.the-voice-of-germany.de', 'fem.com', 'galileo.tv', 'kabeleins.at', 'kabeleins.ch', 'kabeleins.de', 'kabeleinsdoku.at', 'kabeleinsdoku.ch', 'kabeleinsdoku.de', 'prosieben.at', 'prosieben.ch', 'prosieben.de', 'prosiebenmaxx.at', 'prosiebenmaxx.ch', 'prosiebenmaxx.de', 'ran.de', 'sat1.at', 'sat1.ch', 'sat1.de', 'sat1gold.at', 'sat1gold.ch', 'sat1gold.de', 'sixx.at', 'sixx.ch', 'sixx.de', 'the-voice-of-germany.at', 'the-voice-of-germany.ch', 'the-voice-of-germany.de', 'www.advopedia.at', 'www.advopedia.ch', 'www.advopedia.de', 'www.beta.advopedia.at', 'www.beta.advopedia.ch', 'www.beta.advopedia.de', 'www.beta.kabeleins.at', 'www.beta.kabeleins.ch', 'www.beta.kabeleins.de', 'www.beta.kabeleinsdoku.at', 'www.beta.kabeleinsdoku.ch', 'www.beta.kabeleinsdoku.de', 'www.beta.prosieben.at', 'www.beta.prosieben.ch', 'www.beta.prosieben.de', 'www.beta.prosiebenmaxx.at', 'www.beta.prosiebenmaxx.ch', 'www.beta.prosiebenmaxx.de', 'www.beta.sat1.at', 'www.beta.sat1.ch', 'www.beta.sat1.de', 'www.beta.sat1gold.at', 'www.beta.sat1gold.ch', 'www.beta.sat1gold.de', 'www.beta.sixx.at', 'www.beta.sixx.ch', 'www.beta.sixx.de', 'www.beta.the-voice-of-germany.at', 'www.beta.the-voice-of-germany.ch', 'www.beta.the-voice-of-germany.de', 'www.fem.com', 'www.galileo.tv', 'www.kabeleins.at', 'www.kabeleins.ch', 'www.kabeleins.de', 'www.kabeleinsdoku.at', 'www.kabeleinsdoku.ch', 'www.kabeleinsdoku.de', 'www.prosieben.at', 'www.prosieben.ch', 'www.prosieben.de', 'www.prosiebenmaxx.at', 'www.prosiebenmaxx.ch', 'www.prosiebenmaxx.de', 'www.ran.de', 'www.sat1.at', 'www.sat1.ch', 'www.sat1.de', 'www.sat1gold.at', 'www.sat1gold.ch', 'www.sat1gold.de', 'www.sixx.at', 'www.sixx.ch', 'www.sixx.de', 'www.the-voice-of-germany.at', 'www.the-voice-of-germany.ch', 'www.the-voice-of-germany.de')),
+    'Puls4IE': ('pycord.ext.dl.extractor.puls4', ('puls4.com', 'www.puls4.com')),
+    'PyvideoIE': ('pycord.ext.dl.extractor.pyvideo', ('pyvideo.org', 'www.pyvideo.org')),
+    'QQMusicIE': ('pycord.ext.dl.extractor.qqmusic', ('y.qq.com',)),
+    'QQMusicSingerIE': ('pycord.ext.dl.extractor.qqmusic', ('y.qq.com',)),
+    'QQMusicAlbumIE': ('pycord.ext.dl.extractor.qqmusic', ('y.qq.com',)),
+    'QQMusicToplistIE': ('pycord.ext.dl.extractor.qqmusic', ('y.qq.com',)),
+    'QQMusicPlaylistIE': ('pycord.ext.dl.extractor.qqmusic', ('y.qq.com',)),
+    'R7IE': ('pycord.ext.dl.extractor.r7', ('noticias.r7.com', 'player.r7.com', 'r7.com')),
+    'R7ArticleIE': ('pycord.ext.dl.extractor.r7', ('r7.com',)),
+    'RadioCanadaIE': ('pycord.ext.dl.extractor.radiocanada', ('ici.radio-canada.ca', 'radiocanada:')),
+    'RadioCanadaAudioVideoIE': ('pycord.ext.dl.extractor.radiocanada', ('ici.radio-canada.ca',)),
+    'RadioDeIE': ('pycord.ext.dl.extractor.radiode', None),
+    'RadioJavanIE': ('pycord.ext.dl.extractor.radiojavan', ('radiojavan.com', 'www.radiojavan.com')),
+    'RadioBremenIE': ('pycord.ext.dl.extractor.radiobremen', ('radiobremen.de', 'www.radiobremen.de')),
+    'RadioFranceIE': ('pycord.ext.dl.extractor.radiofrance', ('maison.radiofrance.fr',)),
+    'RaiPlayIE': ('pycord.ext.dl.extractor.rai', ('raiplay.it', 'www.raiplay.it')),
+    'RaiPlayLiveIE': ('pycord.ext.dl.extractor.rai', ('raiplay.it', 'www.raiplay.it')),
+    'RaiPlayPlaylistIE': ('pycord.ext.dl.extractor.rai', ('raiplay.it', 'www.raiplay.it')),
+    'RaiIE': ('pycord.ext.dl.extractor.rai', ('rai.it', 'rai.tv', 'rainews.it')),
+    'RayWenderlichIE': ('pycord.ext.dl.extractor.raywenderlich', ('raywenderlich.com', 'videos.raywenderlich.com', 'www.raywenderlich.com')),
+    'RayWenderlichCourseIE': ('pycord.ext.dl.extractor.raywenderlich', ('raywenderlich.com', 'videos.raywenderlich.com', 'www.raywenderlich.com')),
+    'RBMARadioIE': ('pycord.ext.dl.extractor.rbmaradio', ('rbmaradio.com', 'redbullradio.com', 'www.rbmaradio.com', 'www.redbullradio.com')),
+    'RDSIE': ('pycord.ext.dl.extractor.rds', ('rds.ca', 'www.rds.ca')),
+    'RedBullTVIE': ('pycord.ext.dl.extractor.redbulltv', ('redbull.com', 'redbull.tv', 'www.redbull.com', 'www.redbull.tv')),
+    'RedBullEmbedIE': ('pycord.ext.dl.extractor.redbulltv', ('redbull.com', 'www.redbull.com')),
+    'RedBullTVRrnContentIE': ('pycord.ext.dl.extractor.redbulltv', ('redbull.com', 'www.redbull.com')),
+    'RedBullIE': ('pycord.ext.dl.extractor.redbulltv', ('redbull.com', 'www.redbull.com')),
+    'RedditIE': ('pycord.ext.dl.extractor.reddit', ('v.redd.it',)),
+    'RedditRIE': ('pycord.ext.dl.extractor.reddit', ('reddit.com',)),
+    'RedTubeIE': ('pycord.ext.dl.extractor.redtube', ('embed.redtube.com', 'redtube.com')),
+    'RegioTVIE': ('pycord.ext.dl.extractor.regiotv', ('regio-tv.de', 'www.regio-tv.de')),
+    'RENTVIE': ('pycord.ext.dl.extractor.rentv', ('ren.tv', 'rentv:', 'www.ren.tv')),
+    'RENTVArticleIE': ('pycord.ext.dl.extractor.rentv', ('ren.tv', 'www.ren.tv')),
+    'RestudyIE': ('pycord.ext.dl.extractor.restudy', ('portal.restudy.dk', 'restudy.dk', 'www.restudy.dk')),
+    'ReutersIE': ('pycord.ext.dl.extractor.reuters', ('reuters.com', 'www.reuters.com')),
+    'ReverbNationIE': ('pycord.ext.dl.extractor.reverbnation', ('reverbnation.com', 'www.reverbnation.com')),
+    'RICEIE': ('pycord.ext.dl.extractor.rice', ('mediahub.rice.edu',)),
+    'RMCDecouverteIE': ('pycord.ext.dl.extractor.rmcdecouverte', ('rmcdecouverte.bfmtv.com',)),
+    'Ro220IE': ('pycord.ext.dl.extractor.ro220', None),
+    'RockstarGamesIE': ('pycord.ext.dl.extractor.rockstargames', ('rockstargames.com', 'www.rockstargames.com')),
+    'RoosterTeethIE': ('pycord.ext.dl.extractor.roosterteeth', None),
+    'RottenTomatoesIE': ('pycord.ext.dl.extractor.rottentomatoes', ('rottentomatoes.com', 'www.rottentomatoes.com')),
+    'RoxwelIE': ('pycord.ext.dl.extractor.roxwel', ('roxwel.com', 'www.roxwel.com')),
+    'RozhlasIE': ('pycord.ext.dl.extractor.rozhlas', ('prehravac.rozhlas.cz', 'www.prehravac.rozhlas.cz')),
+    'RTBFIE': ('pycord.ext.dl.extractor.rtbf', ('rtbf.be', 'www.rtbf.be')),
+    'RteIE': ('pycord.ext.dl.extractor.rte', ('rte.ie', 'www.rte.ie')),
+    'RteRadioIE': ('pycord.ext.dl.extractor.rte', ('rte.ie', 'www.rte.ie')),
+    'RtlNlIE': ('pycord.ext.dl.extractor.rtlnl', ('embed.rtl.nl', 'rtl.nl', 'rtlxl.nl', 'static.embed.rtl.nl', 'static.rtl.nl', 'static.rtlxl.nl', 'www.embed.rtl.nl', 'www.rtl.nl', 'www.rtlxl.nl')),
+    'RTL2IE': ('pycord.ext.dl.extractor.rtl2', ('rtl2.de', 'www.rtl2.de')),
+    'RTL2YouIE': ('pycord.ext.dl.extractor.rtl2', ('you.rtl2.de',)),
+    'RTL2YouSeriesIE': ('pycord.ext.dl.extractor.rtl2', ('you.rtl2.de',)),
+    'RTPIE': ('pycord.ext.dl.extractor.rtp', ('rtp.pt', 'www.rtp.pt')),
+    'RTSIE': ('pycord.ext.dl.extractor.rts', None),
+    'RTVEALaCartaIE': ('pycord.ext.dl.extractor.rtve', ('rtve.es', 'www.rtve.es')),
+    'RTVELiveIE': ('pycord.ext.dl.extractor.rtve', ('rtve.es', 'www.rtve.es')),
+    'RTVEInfantilIE': ('pycord.ext.dl.extractor.rtve', ('rtve.es', 'www.rtve.es')),
+    'RTVETelevisionIE': ('pycord.ext.dl.extractor.rtve', ('rtve.es', 'www.rtve.es')),
+    'RTVNHIE': ('pycord.ext.dl.extractor.rtvnh', ('rtvnh.nl', 'www.rtvnh.nl')),
+    'RTVSIE': ('pycord.ext.dl.extractor.rtvs', ('rtvs.sk', 'www.rtvs.sk')),
+    'RUHDIE': ('pycord.ext.dl.extractor.ruhd', ('ruhd.ru', 'www.ruhd.ru')),
+    'RumbleEmbedIE': ('pycord.ext.dl.extractor.rumble', ('rumble.com', 'www.rumble.com')),
+    'RutubeIE': ('pycord.ext.dl.extractor.rutube', ('rutube.ru',)),
+    'RutubeChannelIE': ('pycord.ext.dl.extractor.rutube', ('rutube.ru',)),
+    'RutubeEmbedIE': ('pycord.ext.dl.extractor.rutube', ('rutube.ru',)),
+    'RutubeMovieIE': ('pycord.ext.dl.extractor.rutube', ('rutube.ru',)),
+    'RutubePersonIE': ('pycord.ext.dl.extractor.rutube', ('rutube.ru',)),
+    'RutubePlaylistIE': ('pycord.ext.dl.extractor.rutube', None),
+    'RUTVIE': ('pycord.ext.dl.extractor.rutv', ('player.rutv.ru', 'player.vgtrk.com', 'testplayer.rutv.ru', 'testplayer.vgtrk.com')),
+    'RuutuIE': ('pycord.ext.dl.extractor.ruutu', ('ruutu.fi', 'static.nelonenmedia.fi', 'supla.fi', 'www.ruutu.fi', 'www.supla.fi')),
+    'RuvIE': ('pycord.ext.dl.extractor.ruv', ('ruv.is', 'www.ruv.is')),
+    'SafariIE': ('pycord.ext.dl.extractor.safari', ('learning.oreilly.com', 'oreilly.com', 'safaribooksonline.com', 'www.learning.oreilly.com', 'www.oreilly.com', 'www.safaribooksonline.com')),
+    'SafariApiIE': ('pycord.ext.dl.extractor.safari', ('learning.oreilly.com', 'oreilly.com', 'safaribooksonline.com', 'www.learning.oreilly.com', 'www.oreilly.com', 'www.safaribooksonline.com')),
+    'SafariCourseIE': ('pycord.ext.dl.extractor.safari', ('learning.oreilly.com', 'oreilly.com', 'safaribooksonline.com', 'techbus.safaribooksonline.com', 'www.learning.oreilly.com', 'www.oreilly.com', 'www.safaribooksonline.com')),
+    'SampleFocusIE': ('pycord.ext.dl.extractor.samplefocus', ('samplefocus.com', 'www.samplefocus.com')),
+    'SapoIE': ('pycord.ext.dl.extractor.sapo', ('v2.videos.sapo.ao', 'v2.videos.sapo.cv', 'v2.videos.sapo.mz', 'v2.videos.sapo.pt', 'v2.videos.sapo.tl', 'videos.sapo.ao', 'videos.sapo.cv', 'videos.sapo.mz', 'videos.sapo.pt', 'videos.sapo.tl', 'www.videos.sapo.ao', 'www.videos.sapo.cv', 'www.videos.sapo.mz', 'www.videos.sapo.pt', 'www.videos.sapo.tl')),
+    'SaveFromIE': ('pycord.ext.dl.extractor.savefrom', None),
+    'SBSIE': ('pycord.ext.dl.extractor.sbs', ('sbs.com.au', 'www.sbs.com.au')),
+    'ScreencastIE': ('pycord.ext.dl.extractor.screencast', ('screencast.com', 'www.screencast.com')),
+    'ScreencastOMaticIE': ('pycord.ext.dl.extractor.screencastomatic', ('screencast-o-matic.com',)),
+    'ScrippsNetworksWatchIE': ('pycord.ext.dl.extractor.scrippsnetworks', ('watch.geniuskitchen.com',)),
+    'ScrippsNetworksIE': ('pycord.ext.dl.extractor.scrippsnetworks', ('cookingchanneltv.com', 'discovery.com', 'diynetwork.com', 'foodnetwork.com', 'hgtv.com', 'travelchannel.com', 'www.cookingchanneltv.com', 'www.discovery.com', 'www.diynetwork.com', 'www.foodnetwork.com', 'www.hgtv.com', 'www.travelchannel.com')),
+    'SCTEIE': ('pycord.ext.dl.extractor.scte', ('learning.scte.org',)),
+    'SCTECourseIE': ('pycord.ext.dl.extractor.scte', ('learning.scte.org',)),
+    'SeekerIE': ('pycord.ext.dl.extractor.seeker', ('seeker.com', 'www.seeker.com')),
+    'SenateISVPIE': ('pycord.ext.dl.extractor.senateisvp', ('senate.gov', 'www.senate.gov')),
+    'SendtoNewsIE': ('pycord.ext.dl.extractor.sendtonews', ('embed.sendtonews.com',)),
+    'ServusIE': ('pycord.ext.dl.extractor.servus', ('pm-wissen.com', 'servus.com', 'servustv.com', 'www.pm-wissen.com', 'www.servus.com', 'www.servustv.com')),
+    'SevenPlusIE': ('pycord.ext.dl.extractor.sevenplus', ('7plus.com.au', 'www.7plus.com.au')),
+    'SexuIE': ('pycord.ext.dl.extractor.sexu', ('sexu.com', 'www.sexu.com')),
+    'SeznamZpravyIE': ('pycord.ext.dl.extractor.seznamzpravy', ('seznamzpravy.cz', 'www.seznamzpravy.cz')),
+    'SeznamZpravyArticleIE': ('pycord.ext.dl.extractor.seznamzpravy', ('seznam.cz', 'seznamzpravy.cz', 'www.seznam.cz', 'www.seznamzpravy.cz')),
+    'ShahidIE': ('pycord.ext.dl.extractor.shahid', ('shahid.mbc.net',)),
+    'ShahidShowIE': ('pycord.ext.dl.extractor.shahid', ('shahid.mbc.net',)),
+    'SharedIE': ('pycord.ext.dl.extractor.shared', ('shared.sx',)),
+    'VivoIE': ('pycord.ext.dl.extractor.shared', ('vivo.st', 'vivo.sx')),
+    'ShowRoomLiveIE': ('pycord.ext.dl.extractor.showroomlive', ('showroom-live.com', 'www.showroom-live.com')),
+    'SimplecastIE': ('pycord.ext.dl.extractor.simplecast', ('api.simplecast.com', 'player.simplecast.com')),
+    'SimplecastEpisodeIE': ('pycord.ext.dl.extractor.simplecast', ('simplecast.com',)),
+    'SimplecastPodcastIE': ('pycord.ext.dl.extractor.simplecast', None),
+    'SinaIE': ('pycord.ext.dl.extractor.sina', None),
+    'SixPlayIE': ('pycord.ext.dl.extractor.sixplay', ('6play.fr', '6play:', 'play.rtl.hr', 'rtlmost.hu', 'rtlplay.be', 'www.6play.fr', 'www.play.rtl.hr', 'www.rtlmost.hu', 'www.rtlplay.be')),
+    'SkyItPlayerIE': ('pycord.ext.dl.extractor.skyit', ('player.sky.it',)),
+    'SkyItVideoIE': ('pycord.ext.dl.extractor.skyit', ('masterchef.sky.it', 'video.sky.it', 'xfactor.sky.it')),
+    'SkyItVideoLiveIE': ('pycord.ext.dl.extractor.skyit', ('video.sky.it',)),
+    'SkyItIE': ('pycord.ext.dl.extractor.skyit', ('sport.sky.it', 'tg24.sky.it')),
+    'SkyItAcademyIE': ('pycord.ext.dl.extractor.skyit', ('skyacademy.it', 'www.skyacademy.it')),
+    'SkyItArteIE': ('pycord.ext.dl.extractor.skyit', ('arte.sky.it',)),
+    'CieloTVItIE': ('pycord.ext.dl.extractor.skyit', ('cielotv.it', 'www.cielotv.it')),
+    'TV8ItIE': ('pycord.ext.dl.extractor.skyit', ('tv8.it',)),
+    'SkylineWebcamsIE': ('pycord.ext.dl.extractor.skylinewebcams', ('skylinewebcams.com', 'www.skylinewebcams.com')),
+    'SkyNewsArabiaIE': ('pycord.ext.dl.extractor.skynewsarabia', ('skynewsarabia.com', 'www.skynewsarabia.com')),
+    'SkyNewsArabiaArticleIE': ('pycord.ext.dl.extractor.skynewsarabia', ('skynewsarabia.com', 'www.skynewsarabia.com')),
+    'SkyNewsIE': ('pycord.ext.dl.extractor.sky', ('news.sky.com',)),
+    'SkySportsIE': ('pycord.ext.dl.extractor.sky', ('skysports.com', 'www.skysports.com')),
+    'SkySportsNewsIE': ('pycord.ext.dl.extractor.sky', ('skysports.com', 'www.skysports.com')),
+    'SlideshareIE': ('pycord.ext.dl.extractor.slideshare', ('slideshare.net', 'www.slideshare.net')),
+    'SlidesLiveIE': ('pycord.ext.dl.extractor.slideslive', ('slideslive.com',)),
+    'SlutloadIE': ('pycord.ext.dl.extractor.slutload', ('slutload.com',)),
+    'SnotrIE': ('pycord.ext.dl.extractor.snotr', ('snotr.com', 'www.snotr.com')),
+    'SohuIE': ('pycord.ext.dl.extractor.sohu', ('my.tv.sohu.com', 'tv.sohu.com')),
+    'SonyLIVIE': ('pycord.ext.dl.extractor.sonyliv', ('sonyliv.com', 'www.sonyliv.com')),
+    'SoundcloudEmbedIE': ('pycord.ext.dl.extractor.soundcloud', ('p.soundcloud.com', 'player.soundcloud.com', 'w.soundcloud.com')),
+    'SoundcloudIE': ('pycord.ext.dl.extractor.soundcloud', None),
+    'SoundcloudSetIE': ('pycord.ext.dl.extractor.soundcloud', ('m.soundcloud.com', 'soundcloud.com', 'www.soundcloud.com')),
+    'SoundcloudUserIE': ('pycord.ext.dl.extractor.soundcloud', ('m.soundcloud.com', 'soundcloud.com', 'www.soundcloud.com')),
+    'SoundcloudTrackStationIE': ('pycord.ext.dl.extractor.soundcloud', ('m.soundcloud.com', 'soundcloud.com', 'www.soundcloud.com')),
+    'SoundcloudPlaylistIE': ('pycord.ext.dl.extractor.soundcloud', ('api-v2.soundcloud.com', 'api.soundcloud.com')),
+    'SoundcloudSearchIE': ('pycord.ext.dl.extractor.soundcloud', None),
+    'SoundgasmIE': ('pycord.ext.dl.extractor.soundgasm', ('soundgasm.net', 'www.soundgasm.net')),
+    'SoundgasmProfileIE': ('pycord.ext.dl.extractor.soundgasm', ('soundgasm.net', 'www.soundgasm.net')),
+    'SouthParkIE': ('pycord.ext.dl.extractor.southpark', ('southpark.cc.com', 'southparkstudios.com', 'www.southpark.cc.com', 'www.southparkstudios.com')),
+    'SouthParkDeIE': ('pycord.ext.dl.extractor.southpark', ('southpark.de', 'www.southpark.de')),
+    'SouthParkDkIE': ('pycord.ext.dl.extractor.southpark', ('southparkstudios.dk', 'southparkstudios.nu', 'www.southparkstudios.dk', 'www.southparkstudios.nu')),
+    'SouthParkEsIE': ('pycord.ext.dl.extractor.southpark', ('southpark.cc.com', 'www.southpark.cc.com')),
+    'SouthParkNlIE': ('pycord.ext.dl.extractor.southpark', ('southpark.nl', 'www.southpark.nl')),
+    'SpankBangIE': ('pycord.ext.dl.extractor.spankbang', ('spankbang.com',)),
+    'SpankBangPlaylistIE': ('pycord.ext.dl.extractor.spankbang', ('spankbang.com',)),
+    'SpankwireIE': ('pycord.ext.dl.extractor.spankwire', ('spankwire.com', 'www.spankwire.com')),
+    'SpiegelIE': ('pycord.ext.dl.extractor.spiegel', ('manager-magazin.de', 'spiegel.de', 'www.manager-magazin.de', 'www.spiegel.de')),
+    'BellatorIE': ('pycord.ext.dl.extractor.spike', ('bellator.com', 'www.bellator.com')),
+    'ParamountNetworkIE': ('pycord.ext.dl.extractor.spike', ('paramountnetwork.com', 'www.paramountnetwork.com')),
+    'StitcherIE': ('pycord.ext.dl.extractor.stitcher', ('stitcher.com', 'www.stitcher.com')),
+    'StitcherShowIE': ('pycord.ext.dl.extractor.stitcher', ('stitcher.com', 'www.stitcher.com')),
+    'Sport5IE': ('pycord.ext.dl.extractor.sport5', ('.sport5.co.il', 'vod.sport5.co.il', 'www.sport5.co.il')),
+    'SportBoxIE': ('pycord.ext.dl.extractor.sportbox', ('matchtv.ru', 'news.sportbox.ru')),
+    'SportDeutschlandIE': ('pycord.ext.dl.extractor.sportdeutschland', ('sportdeutschland.tv',)),
+    'SpotifyIE': ('pycord.ext.dl.extractor.spotify', ('open.spotify.com',)),
+    'SpotifyShowIE': ('pycord.ext.dl.extractor.spotify', ('open.spotify.com',)),
+    'SpreakerIE': ('pycord.ext.dl.extractor.spreaker', ('api.spreaker.com',)),
+    'SpreakerPageIE': ('pycord.ext.dl.extractor.spreaker', ('spreaker.com', 'www.spreaker.com')),
+    'SpreakerShowIE': ('pycord.ext.dl.extractor.spreaker', ('api.spreaker.com',)),
+    'SpreakerShowPageIE': ('pycord.ext.dl.extractor.spreaker', ('spreaker.com', 'www.spreaker.com')),
+    'SpringboardPlatformIE': ('pycord.ext.dl.extractor.springboardplatform', ('cms.springboardplatform.com',)),
+    'SproutIE': ('pycord.ext.dl.extractor.sprout', ('sproutonline.com', 'universalkids.com', 'www.sproutonline.com', 'www.universalkids.com')),
+    'SRGSSRIE': ('pycord.ext.dl.extractor.srgssr', ('srgssr:', 'tp.srgssr.ch')),
+    'SRGSSRPlayIE': ('pycord.ext.dl.extractor.srgssr', ('play.rsi.ch', 'play.rtr.ch', 'play.rts.ch', 'play.srf.ch', 'play.swissinfo.ch', 'rsi.ch', 'rtr.ch', 'rts.ch', 'srf.ch', 'swissinfo.ch', 'www.rsi.ch', 'www.rtr.ch', 'www.rts.ch', 'www.srf.ch', 'www.swissinfo.ch')),
+    'SRMediathekIE': ('pycord.ext.dl.extractor.srmediathek', ('sr-mediathek.de', 'sr-mediathek.sr-online.de')),
+    'StanfordOpenClassroomIE': ('pycord.ext.dl.extractor.stanfordoc', ('openclassroom.stanford.edu',)),
+    'SteamIE': ('pycord.ext.dl.extractor.steam', ('steamcommunity.com', 'store.steampowered.com', 'www.steamcommunity.com')),
+    'StoryFireIE': ('pycord.ext.dl.extractor.storyfire', ('storyfire.com', 'www.storyfire.com')),
+    'StoryFireUserIE': ('pycord.ext.dl.extractor.storyfire', ('storyfire.com', 'www.storyfire.com')),
+    'StoryFireSeriesIE': ('pycord.ext.dl.extractor.storyfire', ('storyfire.com', 'www.storyfire.com')),
+    'StreamableIE': ('pycord.ext.dl.extractor.streamable', ('streamable.com',)),
+    'StreamcloudIE': ('pycord.ext.dl.extractor.streamcloud', ('streamcloud.eu',)),
+    'StreamCZIE': ('pycord.ext.dl.extractor.streamcz', ('stream.cz', 'www.stream.cz')),
+    'StreetVoiceIE': ('pycord.ext.dl.extractor.streetvoice', None),
+    'StretchInternetIE': ('pycord.ext.dl.extractor.stretchinternet', ('portal.stretchinternet.com',)),
+    'STVPlayerIE': ('pycord.ext.dl.extractor.stv', ('player.stv.tv',)),
+    'SunPornoIE': ('pycord.ext.dl.extractor.sunporno', ('embeds.sunporno.com', 'sunporno.com', 'www.sunporno.com')),
+    'SverigesRadioEpisodeIE': ('pycord.ext.dl.extractor.sverigesradio', ('sverigesradio.se', 'www.sverigesradio.se')),
+    'SverigesRadioPublicationIE': ('pycord.ext.dl.extractor.sverigesradio', ('sverigesradio.se', 'www.sverigesradio.se')),
+    'SVTIE': ('pycord.ext.dl.extractor.svt', ('svt.se', 'www.svt.se')),
+    'SVTPageIE': ('pycord.ext.dl.extractor.svt', ('svt.se', 'www.svt.se')),
+    'SVTPlayIE': ('pycord.ext.dl.extractor.svt', ('oppetarkiv.se', 'svt.se', 'svt:', 'svtplay.se', 'www.oppetarkiv.se', 'www.svt.se', 'www.svtplay.se')),
+    'SVTSeriesIE': ('pycord.ext.dl.extractor.svt', ('svtplay.se', 'www.svtplay.se')),
+    'SWRMediathekIE': ('pycord.ext.dl.extractor.swrmediathek', ('swrmediathek.de', 'www.swrmediathek.de')),
+    'SyfyIE': ('pycord.ext.dl.extractor.syfy', ('syfy.com', 'www.syfy.com')),
+    'SztvHuIE': ('pycord.ext.dl.extractor.sztvhu', ('sztv.hu', 'www.sztv.hu', 'www.tvszombathely.hu')),
+    'TagesschauPlayerIE': ('pycord.ext.dl.extractor.tagesschau', ('tagesschau.de', 'www.tagesschau.de')),
+    'TagesschauIE': ('pycord.ext.dl.extractor.tagesschau', ('tagesschau.de', 'www.tagesschau.de')),
+    'TassIE': ('pycord.ext.dl.extractor.tass', ('itar-tass.com', 'tass.ru')),
+    'TBSIE': ('pycord.ext.dl.extractor.tbs', ('tbs.com', 'tntdrama.com', 'www.tbs.com', 'www.tntdrama.com')),
+    'TDSLifewayIE': ('pycord.ext.dl.extractor.tdslifeway', ('tds.lifeway.com',)),
+    'TeachableIE': ('pycord.ext.dl.extractor.teachable', ('academyhacker.com', 'courses.workitdaily.com', 'edurila.com', 'gns3.teachable.com', 'learnability.org', 'market.saleshacker.com', 'stackskills.com', 'teachable:', 'v1.upskillcourses.com', 'www.academyhacker.com', 'www.courses.workitdaily.com', 'www.edurila.com', 'www.gns3.teachable.com', 'www.learnability.org', 'www.market.saleshacker.com', 'www.stackskills.com', 'www.v1.upskillcourses.com')),
+    'TeachableCourseIE': ('pycord.ext.dl.extractor.teachable', ('academyhacker.com', 'courses.workitdaily.com', 'edurila.com', 'gns3.teachable.com', 'learnability.org', 'market.saleshacker.com', 'stackskills.com', 'teachable:', 'v1.upskillcourses.com', 'www.academyhacker.com', 'www.courses.workitdaily.com', 'www.edurila.com', 'www.gns3.teachable.com', 'www.learnability.org', 'www.market.saleshacker.com', 'www.stackskills.com', 'www.v1.upskillcourses.com')),
+    'TeacherTubeIE': ('pycord.ext.dl.extractor.teachertube', ('teachertube.com', 'www.teachertube.com')),
+    'TeacherTubeUserIE': ('pycord.ext.dl.extractor.teachertube', ('teachertube.com', 'www.teachertube.com')),
+    'TeachingChannelIE': ('pycord.ext.dl.extractor.teachingchannel', ('teachingchannel.org', 'www.teachingchannel.org')),
+    'TeamcocoIE': ('pycord.ext.dl.extractor.teamcoco', ('teamcoco.com',)),
+    'TeamTreeHouseIE': ('pycord.ext.dl.extractor.teamtreehouse', ('teamtreehouse.com', 'www.teamtreehouse.com')),
+    'TechTalksIE': ('pycord.ext.dl.extractor.techtalks', ('techtalks.tv',)),
+    'TEDIE': ('pycord.ext.dl.extractor.ted', ('embed-ssl.ted.com', 'embed.ted.com', 'www.ted.com')),
+    'Tele5IE': ('pycord.ext.dl.extractor.tele5', ('tele5.de', 'www.tele5.de')),
+    'Tele13IE': ('pycord.ext.dl.extractor.tele13', ('t13.cl', 'www.t13.cl')),
+    'TeleBruxellesIE': ('pycord.ext.dl.extractor.telebruxelles', ('bx1.be', 'telebruxelles.be', 'www.bx1.be', 'www.telebruxelles.be')),
+    'TelecincoIE': ('pycord.ext.dl.extractor.telecinco', ('cuatro.com', 'mediaset.es', 'telecinco.es', 'www.cuatro.com', 'www.mediaset.es', 'www.telecinco.es')),
+    'TelegraafIE': ('pycord.ext.dl.extractor.telegraaf', ('telegraaf.nl', 'www.telegraaf.nl')),
+    'TeleMBIE': ('pycord.ext.dl.extractor.telemb', ('telemb.be', 'www.telemb.be')),
+    'TeleQuebecIE': ('pycord.ext.dl.extractor.telequebec', ('coucou.telequebec.tv', 'zonevideo.telequebec.tv')),
+    'TeleQuebecSquatIE': ('pycord.ext.dl.extractor.telequebec', ('squat.telequebec.tv',)),
+    'TeleQuebecEmissionIE': ('pycord.ext.dl.extractor.telequebec', ('telequebec.tv', 'www.telequebec.tv')),
+    'TeleQuebecLiveIE': ('pycord.ext.dl.extractor.telequebec', ('zonevideo.telequebec.tv',)),
+    'TeleQuebecVideoIE': ('pycord.ext.dl.extractor.telequebec', ('video.telequebec.tv',)),
+    'TeleTaskIE': ('pycord.ext.dl.extractor.teletask', ('tele-task.de', 'www.tele-task.de')),
+    'TelewebionIE': ('pycord.ext.dl.extractor.telewebion', ('telewebion.com', 'www.telewebion.com')),
+    'TennisTVIE': ('pycord.ext.dl.extractor.tennistv', ('tennistv.com', 'www.tennistv.com')),
+    'TenPlayIE': ('pycord.ext.dl.extractor.tenplay', ('10play.com.au', 'www.10play.com.au')),
+    'TestURLIE': ('pycord.ext.dl.extractor.testurl', ('test:', 'testurl:')),
+    'TF1IE': ('pycord.ext.dl.extractor.tf1', ('tf1.fr', 'www.tf1.fr')),
+    'TFOIE': ('pycord.ext.dl.extractor.tfo', ('tfo.org', 'www.tfo.org')),
+    'TheInterceptIE': ('pycord.ext.dl.extractor.theintercept', ('theintercept.com',)),
+    'ThePlatformIE': ('pycord.ext.dl.extractor.theplatform', ('link.theplatform.com', 'player.theplatform.com', 'theplatform:')),
+    'ThePlatformFeedIE': ('pycord.ext.dl.extractor.theplatform', ('feed.theplatform.com',)),
+    'TheSceneIE': ('pycord.ext.dl.extractor.thescene', ('thescene.com',)),
+    'TheStarIE': ('pycord.ext.dl.extractor.thestar', ('thestar.com', 'www.thestar.com')),
+    'TheSunIE': ('pycord.ext.dl.extractor.thesun', ('thesun.co.uk', 'www.thesun.co.uk')),
+    'TheWeatherChannelIE': ('pycord.ext.dl.extractor.theweatherchannel', ('weather.com', 'www.weather.com')),
+    'ThisAmericanLifeIE': ('pycord.ext.dl.extractor.thisamericanlife', ('thisamericanlife.org', 'www.thisamericanlife.org')),
+    'ThisAVIE': ('pycord.ext.dl.extractor.thisav', ('thisav.com', 'www.thisav.com')),
+    'ThisOldHouseIE': ('pycord.ext.dl.extractor.thisoldhouse', ('thisoldhouse.com', 'www.thisoldhouse.com')),
+    'ThreeQSDNIE': ('pycord.ext.dl.extractor.threeqsdn', ('playout.3qsdn.com',)),
+    'TikTokIE': ('pycord.ext.dl.extractor.tiktok', ('tiktok.com', 'www.tiktok.com')),
+    'TikTokUserIE': ('pycord.ext.dl.extractor.tiktok', ('tiktok.com', 'www.tiktok.com')),
+    'TinyPicIE': ('pycord.ext.dl.extractor.tinypic', None),
+    'TMZIE': ('pycord.ext.dl.extractor.tmz', ('tmz.com', 'www.tmz.com')),
+    'TMZArticleIE': ('pycord.ext.dl.extractor.tmz', ('tmz.com', 'www.tmz.com')),
+    'TNAFlixNetworkEmbedIE': ('pycord.ext.dl.extractor.tnaflix', ('player.empflix.com', 'player.tnaflix.com')),
+    'TNAFlixIE': ('pycord.ext.dl.extractor.tnaflix', ('tnaflix.com', 'www.tnaflix.com')),
+    'EMPFlixIE': ('pycord.ext.dl.extractor.tnaflix', ('empflix.com', 'www.empflix.com')),
+    'MovieFapIE': ('pycord.ext.dl.extractor.tnaflix', ('moviefap.com', 'www.moviefap.com')),
+    'ToggleIE': ('pycord.ext.dl.extractor.toggle', ('mewatch.sg', 'toggle:', 'video.toggle.sg', 'www.mewatch.sg')),
+    'MeWatchIE': ('pycord.ext.dl.extractor.toggle', ('live.mewatch.sg', 'mewatch.sg', 'www.mewatch.sg')),
+    'TOnlineIE': ('pycord.ext.dl.extractor.tonline', ('t-online.de', 'www.t-online.de')),
+    'ToonGogglesIE': ('pycord.ext.dl.extractor.toongoggles', ('toongoggles.com', 'www.toongoggles.com')),
+    'TouTvIE': ('pycord.ext.dl.extractor.toutv', ('ici.tou.tv',)),
+    'ToypicsUserIE': ('pycord.ext.dl.extractor.toypics', ('videos.toypics.net',)),
+    'ToypicsIE': ('pycord.ext.dl.extractor.toypics', ('videos.toypics.net',)),
+    'TrailerAddictIE': ('pycord.ext.dl.extractor.traileraddict', None),
+    'TriluliluIE': ('pycord.ext.dl.extractor.trilulilu', ('m.trilulilu.ro', 'trilulilu.ro', 'www.trilulilu.ro')),
+    'TrovoIE': ('pycord.ext.dl.extractor.trovo', ('trovo.live', 'www.trovo.live')),
+    'TrovoVodIE': ('pycord.ext.dl.extractor.trovo', ('trovo.live', 'www.trovo.live')),
+    'TruNewsIE': ('pycord.ext.dl.extractor.trunews', ('trunews.com', 'www.trunews.com')),
+    'TruTVIE': ('pycord.ext.dl.extractor.trutv', ('trutv.com', 'www.trutv.com')),
+    'Tube8IE': ('pycord.ext.dl.extractor.tube8', ('tube8.com', 'www.tube8.com')),
+    'TubiTvIE': ('pycord.ext.dl.extractor.tubitv', ('tubitv.com', 'www.tubitv.com')),
+    'TumblrIE': ('pycord.ext.dl.extractor.tumblr', ('tumblr.com',)),
+    'TuneInClipIE': ('pycord.ext.dl.extractor.tunein', ('tunein.com', 'www.tunein.com')),
+    'TuneInStationIE': ('pycord.ext.dl.extractor.tunein', ('tunein.com', 'www.tunein.com')),
+    'TuneInProgramIE': ('pycord.ext.dl.extractor.tunein', ('tunein.com', 'www.tunein.com')),
+    'TuneInTopicIE': ('pycord.ext.dl.extractor.tunein', ('tunein.com', 'www.tunein.com')),
+    'TuneInShortenerIE': ('pycord.ext.dl.extractor.tunein', ('tun.in',)),
+    'TunePkIE': ('pycord.ext.dl.extractor.tunepk', ('embed.tune.pk', 'tune.pk', 'www.tune.pk')),
+    'TurboIE': ('pycord.ext.dl.extractor.turbo', ('turbo.fr', 'www.turbo.fr')),
+    'TV2IE': ('pycord.ext.dl.extractor.tv2', ('tv2.no', 'www.tv2.no')),
+    'TV2ArticleIE': ('pycord.ext.dl.extractor.tv2', ('tv2.no', 'www.tv2.no')),
+    'KatsomoIE': ('pycord.ext.dl.extractor.tv2', ('katsomo.fi', 'mtv.fi', 'mtvuutiset.fi', 'www.katsomo.fi', 'www.mtv.fi', 'www.mtvuutiset.fi')),
+    'MTVUutisetArticleIE': ('pycord.ext.dl.extractor.tv2', ('www.mtvuutiset.fi',)),
+    'TV2DKIE': ('pycord.ext.dl.extractor.tv2dk', ('tv2east.dk', 'tv2fyn.dk', 'tv2lorry.dk', 'tv2nord.dk', 'tv2ostjylland.dk', 'tvmidtvest.dk', 'tvsyd.dk', 'www.tv2east.dk', 'www.tv2fyn.dk', 'www.tv2lorry.dk', 'www.tv2nord.dk', 'www.tv2ostjylland.dk', 'www.tvmidtvest.dk', 'www.tvsyd.dk')),
+    'TV2DKBornholmPlayIE': ('pycord.ext.dl.extractor.tv2dk', ('play.tv2bornholm.dk',)),
+    'TV2HuIE': ('pycord.ext.dl.extractor.tv2hu', ('tv2.hu', 'www.tv2.hu')),
+    'TV4IE': ('pycord.ext.dl.extractor.tv4', ('tv4.se', 'tv4play.se', 'www.tv4.se', 'www.tv4play.se')),
+    'TV5MondePlusIE': ('pycord.ext.dl.extractor.tv5mondeplus', ('revoir.tv5monde.com', 'tv5mondeplus.com', 'www.revoir.tv5monde.com', 'www.tv5mondeplus.com')),
+    'TV5UnisVideoIE': ('pycord.ext.dl.extractor.tv5unis', ('tv5unis.ca', 'www.tv5unis.ca')),
+    'TV5UnisIE': ('pycord.ext.dl.extractor.tv5unis', ('tv5unis.ca', 'www.tv5unis.ca')),
+    'TVAIE': ('pycord.ext.dl.extractor.tva', ('video.tva.ca', 'videos.tva.ca')),
+    'QubIE': ('pycord.ext.dl.extractor.tva', ('qub.ca', 'www.qub.ca')),
+    'TVANouvellesIE': ('pycord.ext.dl.extractor.tvanouvelles', ('tvanouvelles.ca', 'www.tvanouvelles.ca')),
+    'TVANouvellesArticleIE': ('pycord.ext.dl.extractor.tvanouvelles', ('tvanouvelles.ca', 'www.tvanouvelles.ca')),
+    'TVCIE': ('pycord.ext.dl.extractor.tvc', ('tvc.ru', 'www.tvc.ru')),
+    'TVCArticleIE': ('pycord.ext.dl.extractor.tvc', ('tvc.ru', 'www.tvc.ru')),
+    'TVerIE': ('pycord.ext.dl.extractor.tver', ('tver.jp', 'www.tver.jp')),
+    'TvigleIE': ('pycord.ext.dl.extractor.tvigle', ('cloud.tvigle.ru', 'tvigle.ru', 'www.cloud.tvigle.ru', 'www.tvigle.ru')),
+    'TVLandIE': ('pycord.ext.dl.extractor.tvland', ('tvland.com', 'www.tvland.com')),
+    'TVN24IE': ('pycord.ext.dl.extractor.tvn24', ('tvn24.pl', 'tvn24bis.pl')),
+    'TVNetIE': ('pycord.ext.dl.extractor.tvnet', ('tvnet.gov.vn',)),
+    'TVNoeIE': ('pycord.ext.dl.extractor.tvnoe', ('tvnoe.cz', 'www.tvnoe.cz')),
+    'TVNowIE': ('pycord.ext.dl.extractor.tvnow', ('tvnow.at', 'tvnow.ch', 'tvnow.de', 'www.tvnow.at', 'www.tvnow.ch', 'www.tvnow.de')),
+    'TVNowNewIE': ('pycord.ext.dl.extractor.tvnow', ('tvnow.at', 'tvnow.ch', 'tvnow.de', 'www.tvnow.at', 'www.tvnow.ch', 'www.tvnow.de')),
+    'TVNowSeasonIE': ('pycord.ext.dl.extractor.tvnow', ('tvnow.at', 'tvnow.ch', 'tvnow.de', 'www.tvnow.at', 'www.tvnow.ch', 'www.tvnow.de')),
+    'TVNowAnnualIE': ('pycord.ext.dl.extractor.tvnow', ('tvnow.at', 'tvnow.ch', 'tvnow.de', 'www.tvnow.at', 'www.tvnow.ch', 'www.tvnow.de')),
+    'TVNowShowIE': ('pycord.ext.dl.extractor.tvnow', ('tvnow.at', 'tvnow.ch', 'tvnow.de', 'www.tvnow.at', 'www.tvnow.ch', 'www.tvnow.de')),
+    'TVPEmbedIE': ('pycord.ext.dl.extractor.tvp', ('tvp.info', 'tvp.pl', 'tvp:')),
+    'TVPIE': ('pycord.ext.dl.extractor.tvp', ('tvp.info', 'tvp.pl')),
+    'TVPWebsiteIE': ('pycord.ext.dl.extractor.tvp', ('vod.tvp.pl',)),
+    'TVPlayIE': ('pycord.ext.dl.extractor.tvplay', ('mtg:', 'play.nova.bg', 'play.novatv.bg', 'play.tv3.lt', 'tv10play.se', 'tv3play.dk', 'tv3play.ee', 'tv3play.lt', 'tv3play.no', 'tv3play.se', 'tv3play.tv3.ee', 'tv6play.no', 'tv6play.se', 'tv8play.se', 'tvplay.lv', 'tvplay.skaties.lv', 'viafree.dk', 'viafree.no', 'viafree.se', 'viasat4play.no', 'www.play.nova.bg', 'www.play.novatv.bg', 'www.play.tv3.lt', 'www.tv10play.se', 'www.tv3play.dk', 'www.tv3play.ee', 'www.tv3play.lt', 'www.tv3play.no', 'www.tv3play.se', 'www.tv3play.tv3.ee', 'www.tv6play.no', 'www.tv6play.se', 'www.tv8play.se', 'www.tvplay.lv', 'www.tvplay.skaties.lv', 'www.viafree.dk', 'www.viafree.no', 'www.viafree.se', 'www.viasat4play.no')),
+    'ViafreeIE': ('pycord.ext.dl.extractor.tvplay', ('viafree.dk', 'viafree.no', 'viafree.se', 'www.viafree.dk', 'www.viafree.no', 'www.viafree.se')),
+    'TVPlayHomeIE': ('pycord.ext.dl.extractor.tvplay', ('play.skaties.lv', 'play.tv3.ee', 'play.tv3.lt', 'tv3play.skaties.lv', 'tv3play.tv3.ee', 'tv3play.tv3.lt', 'tvplay.skaties.lv', 'tvplay.tv3.ee', 'tvplay.tv3.lt')),
+    'TVPlayerIE': ('pycord.ext.dl.extractor.tvplayer', ('tvplayer.com', 'www.tvplayer.com')),
+    'TweakersIE': ('pycord.ext.dl.extractor.tweakers', ('tweakers.net',)),
+    'TwentyFourVideoIE': ('pycord.ext.dl.extractor.twentyfourvideo', ('24video.adult', '24video.me', '24video.net', '24video.sex', '24video.sexy', '24video.site', '24video.tube', '24video.vip', '24video.xxx', 'porn.24video.adult', 'porn.24video.me', 'porn.24video.net', 'porn.24video.sex', 'porn.24video.sexy', 'porn.24video.site', 'porn.24video.tube', 'porn.24video.vip', 'porn.24video.xxx', 'porno.24video.adult', 'porno.24video.me', 'porno.24video.net', 'porno.24video.sex', 'porno.24video.sexy', 'porno.24video.site', 'porno.24video.tube', 'porno.24video.vip', 'porno.24video.xxx', 'www.24video.adult', 'www.24video.me', 'www.24video.net', 'www.24video.sex', 'www.24video.sexy', 'www.24video.site', 'www.24video.tube', 'www.24video.vip', 'www.24video.xxx')),
+    'TwentyMinutenIE': ('pycord.ext.dl.extractor.twentymin', ('20min.ch', 'www.20min.ch')),
+    'TwentyThreeVideoIE': ('pycord.ext.dl.extractor.twentythreevideo', None),
+    'TwitCastingIE': ('pycord.ext.dl.extractor.twitcasting', ('twitcasting.tv',)),
+    'TwitchVodIE': ('pycord.ext.dl.extractor.twitch', ('go.twitch.tv', 'm.twitch.tv', 'player.twitch.tv', 'twitch.tv', 'www.twitch.tv')),
+    'TwitchCollectionIE': ('pycord.ext.dl.extractor.twitch', ('go.twitch.tv', 'm.twitch.tv', 'twitch.tv', 'www.twitch.tv')),
+    'TwitchVideosIE': ('pycord.ext.dl.extractor.twitch', ('go.twitch.tv', 'm.twitch.tv', 'twitch.tv', 'www.twitch.tv')),
+    'TwitchVideosClipsIE': ('pycord.ext.dl.extractor.twitch', ('go.twitch.tv', 'm.twitch.tv', 'twitch.tv', 'www.twitch.tv')),
+    'TwitchVideosCollectionsIE': ('pycord.ext.dl.extractor.twitch', ('go.twitch.tv', 'm.twitch.tv', 'twitch.tv', 'www.twitch.tv')),
+    'TwitchStreamIE': ('pycord.ext.dl.extractor.twitch', ('go.twitch.tv', 'm.twitch.tv', 'player.twitch.tv', 'twitch.tv', 'www.twitch.tv')),
+    'TwitchClipsIE': ('pycord.ext.dl.extractor.twitch', ('clips.twitch.tv', 'go.twitch.tv', 'm.twitch.tv', 'twitch.tv', 'www.twitch.tv')),
+    'TwitterCardIE': ('pycord.ext.dl.extractor.twitter', ('m.twitter.com', 'mobile.twitter.com', 'twitter.com', 'www.twitter.com')),
+    'TwitterIE': ('pycord.ext.dl.extractor.twitter', ('m.twitter.com', 'mobile.twitter.com', 'twitter.com', 'www.twitter.com')),
+    'TwitterAmplifyIE': ('pycord.ext.dl.extractor.twitter', ('amp.twimg.com',)),
+    'TwitterBroadcastIE': ('pycord.ext.dl.extractor.twitter', ('m.twitter.com', 'mobile.twitter.com', 'twitter.com', 'www.twitter.com')),
+    'UdemyIE': ('pycord.ext.dl.extractor.udemy', ('udemy.com',)),
+    'UdemyCourseIE': ('pycord.ext.dl.extractor.udemy', ('udemy.com',)),
+    'UDNEmbedIE': ('pycord.ext.dl.extractor.udn', ('video.udn.com',)),
+    'UFCTVIE': ('pycord.ext.dl.extractor.ufctv', ('app.fightpass.com', 'app.ufc.tv', 'app.ufcfightpass.com', 'fightpass.com', 'ufc.tv', 'ufcfightpass.com', 'ufcfightpass.imgdge.com', 'ufcfightpass.imggaming.com', 'www.fightpass.com', 'www.ufc.tv', 'www.ufcfightpass.com')),
+    'UFCArabiaIE': ('pycord.ext.dl.extractor.ufctv', ('app.ufcarabia.ae', 'app.ufcarabia.com', 'ufcarabia.ae', 'ufcarabia.com', 'www.ufcarabia.ae', 'www.ufcarabia.com')),
+    'UKTVPlayIE': ('pycord.ext.dl.extractor.uktvplay', ('uktvplay.uktv.co.uk',)),
+    'DigitekaIE': ('pycord.ext.dl.extractor.digiteka', ('digiteka.net', 'ultimedia.com', 'www.digiteka.net', 'www.ultimedia.com')),
+    'DLiveVODIE': ('pycord.ext.dl.extractor.dlive', ('dlive.tv', 'www.dlive.tv')),
+    'DLiveStreamIE': ('pycord.ext.dl.extractor.dlive', ('dlive.tv', 'www.dlive.tv')),
+    'UMGDeIE': ('pycord.ext.dl.extractor.umg', ('universal-music.de', 'www.universal-music.de')),
+    'UnistraIE': ('pycord.ext.dl.extractor.unistra', ('utv.unistra.fr',)),
+    'UnityIE': ('pycord.ext.dl.extractor.unity', ('unity3d.com', 'www.unity3d.com')),
+    'UOLIE': ('pycord.ext.dl.extractor.uol', None),
+    'UplynkIE': ('pycord.ext.dl.extractor.uplynk', None),
+    'UplynkPreplayIE': ('pycord.ext.dl.extractor.uplynk', None),
+    'UrortIE': ('pycord.ext.dl.extractor.urort', ('urort.p3.no', 'www.urort.p3.no')),
+    'URPlayIE': ('pycord.ext.dl.extractor.urplay', ('urplay.se', 'urskola.se', 'www.urplay.se', 'www.urskola.se')),
+    'USANetworkIE': ('pycord.ext.dl.extractor.usanetwork', ('usanetwork.com', 'www.usanetwork.com')),
+    'USATodayIE': ('pycord.ext.dl.extractor.usatoday', ('usatoday.com', 'www.usatoday.com')),
+    'UstreamIE': ('pycord.ext.dl.extractor.ustream', ('ustream.tv', 'video.ibm.com', 'www.ustream.tv', 'www.video.ibm.com')),
+    'UstreamChannelIE': ('pycord.ext.dl.extractor.ustream', ('ustream.tv', 'www.ustream.tv')),
+    'UstudioIE': ('pycord.ext.dl.extractor.ustudio', ('ustudio.com', 'v1.ustudio.com', 'www.ustudio.com')),
+    'UstudioEmbedIE': ('pycord.ext.dl.extractor.ustudio', ('app.ustudio.com', 'embed.ustudio.com', 'ustudio.com')),
+    'Varzesh3IE': ('pycord.ext.dl.extractor.varzesh3', ('video.varzesh3.com', 'www.video.varzesh3.com')),
+    'Vbox7IE': ('pycord.ext.dl.extractor.vbox7', ('vbox7.com',)),
+    'VeeHDIE': ('pycord.ext.dl.extractor.veehd', ('veehd.com',)),
+    'VeohIE': ('pycord.ext.dl.extractor.veoh', ('veoh.com', 'www.veoh.com')),
+    'VestiIE': ('pycord.ext.dl.extractor.vesti', None),
+    'VevoIE': ('pycord.ext.dl.extractor.vevo', ('cache.vevo.com', 'embed.vevo.com', 'vevo.com', 'vevo:', 'videoplayer.vevo.com', 'www.vevo.com')),
+    'VevoPlaylistIE': ('pycord.ext.dl.extractor.vevo', ('vevo.com', 'www.vevo.com')),
+    'BTArticleIE': ('pycord.ext.dl.extractor.vgtv', ('bt.no', 'www.bt.no')),
+    'BTVestlendingenIE': ('pycord.ext.dl.extractor.vgtv', ('bt.no', 'www.bt.no')),
+    'VGTVIE': ('pycord.ext.dl.extractor.vgtv', None),
+    'VH1IE': ('pycord.ext.dl.extractor.vh1', ('vh1.com', 'www.vh1.com')),
+    'ViceIE': ('pycord.ext.dl.extractor.vice', ('viceland.com', 'vicetv.com', 'video.vice.com', 'vms.vice.com', 'www.viceland.com', 'www.vicetv.com')),
+    'ViceArticleIE': ('pycord.ext.dl.extractor.vice', ('vice.com', 'www.vice.com')),
+    'ViceShowIE': ('pycord.ext.dl.extractor.vice', ('viceland.com', 'vicetv.com', 'video.vice.com', 'www.viceland.com', 'www.vicetv.com')),
+    'VidbitIE': ('pycord.ext.dl.extractor.vidbit', ('vidbit.co', 'www.vidbit.co')),
+    'ViddlerIE': ('pycord.ext.dl.extractor.viddler', ('viddler.com', 'www.viddler.com')),
+    'VideaIE': ('pycord.ext.dl.extractor.videa', ('videa.hu', 'videakid.hu')),
+    'VideoDetectiveIE': ('pycord.ext.dl.extractor.videodetective', ('videodetective.com', 'www.videodetective.com')),
+    'VideofyMeIE': ('pycord.ext.dl.extractor.videofyme', ('p.videofy.me', 'www.videofy.me')),
+    'VideomoreIE': ('pycord.ext.dl.extractor.videomore', None),
+    'VideomoreVideoIE': ('pycord.ext.dl.extractor.videomore', ('more.tv', 'videomore.ru')),
+    'VideomoreSeasonIE': ('pycord.ext.dl.extractor.videomore', ('more.tv', 'videomore.ru')),
+    'VideoPressIE': ('pycord.ext.dl.extractor.videopress', ('video.wordpress.com', 'videopress.com')),
+    'VidioIE': ('pycord.ext.dl.extractor.vidio', ('vidio.com', 'www.vidio.com')),
+    'VidLiiIE': ('pycord.ext.dl.extractor.vidlii', ('vidlii.com', 'www.vidlii.com')),
+    'VidmeIE': ('pycord.ext.dl.extractor.vidme', ('vid.me',)),
+    'VidmeUserIE': ('pycord.ext.dl.extractor.vidme', ('vid.me',)),
+    'VidmeUserLikesIE': ('pycord.ext.dl.extractor.vidme', ('vid.me',)),
+    'VierIE': ('pycord.ext.dl.extractor.vier', ('vier.be', 'vijf.be', 'www.vier.be', 'www.vijf.be')),
+    'VierVideosIE': ('pycord.ext.dl.extractor.vier', ('vier.be', 'vijf.be', 'www.vier.be', 'www.vijf.be')),
+    'ViewLiftIE': ('pycord.ext.dl.extractor.viewlift', ('app.horseandcountry.tv', 'app.myoutdoortv.com', 'failarmy.com', 'ftfnext.com', 'funnyforfree.com', 'hoichoi.tv', 'kiddovid.com', 'kronon.tv', 'laxsportsnetwork.com', 'lnppass.legapallacanestro.com', 'main.snagfilms.com', 'marquee.tv', 'monumentalsportsnetwork.com', 'moviespree.com', 'neoufitness.com', 'pflmma.com', 'snagfilms.com', 'snagxtreme.com', 'supercrosslive.tv', 'theidentitytb.com', 'vayafilm.com', 'winnersview.com', 'www.app.horseandcountry.tv', 'www.app.myoutdoortv.com', 'www.failarmy.com', 'www.ftfnext.com', 'www.funnyforfree.com', 'www.hoichoi.tv', 'www.kiddovid.com', 'www.kronon.tv', 'www.laxsportsnetwork.com', 'www.lnppass.legapallacanestro.com', 'www.main.snagfilms.com', 'www.marquee.tv', 'www.monumentalsportsnetwork.com', 'www.moviespree.com', 'www.neoufitness.com', 'www.pflmma.com', 'www.snagfilms.com', 'www.snagxtreme.com', 'www.supercrosslive.tv', 'www.theidentitytb.com', 'www.vayafilm.com', 'www.winnersview.com')),
+    'ViewLiftEmbedIE': ('pycord.ext.dl.extractor.viewlift', ('app.horseandcountry.tv', 'app.myoutdoortv.com', 'embed.app.horseandcountry.tv', 'embed.app.myoutdoortv.com', 'embed.failarmy.com', 'embed.ftfnext.com', 'embed.funnyforfree.com', 'embed.hoichoi.tv', 'embed.kiddovid.com', 'embed.kronon.tv', 'embed.laxsportsnetwork.com', 'embed.lnppass.legapallacanestro.com', 'embed.main.snagfilms.com', 'embed.marquee.tv', 'embed.monumentalsportsnetwork.com', 'embed.moviespree.com', 'embed.neoufitness.com', 'embed.pflmma.com', 'embed.snagfilms.com', 'embed.snagxtreme.com', 'embed.supercrosslive.tv', 'embed.theidentitytb.com', 'embed.vayafilm.com', 'embed.winnersview.com', 'failarmy.com', 'ftfnext.com', 'funnyforfree.com', 'hoichoi.tv', 'kiddovid.com', 'kronon.tv', 'laxsportsnetwork.com', 'lnppass.legapallacanestro.com', 'main.snagfilms.com', 'marquee.tv', 'monumentalsportsnetwork.com', 'moviespree.com', 'neoufitness.com', 'pflmma.com', 'snagfilms.com', 'snagxtreme.com', 'supercrosslive.tv', 'theidentitytb.com', 'vayafilm.com', 'winnersview.com', 'www.app.horseandcountry.tv', 'www.app.myoutdoortv.com', 'www.failarmy.com', 'www.ftfnext.com', 'www.funnyforfree.com', 'www.hoichoi.tv', 'www.kiddovid.com', 'www.kronon.tv', 'www.laxsportsnetwork.com', 'www.lnppass.legapallacanestro.com', 'www.main.snagfilms.com', 'www.marquee.tv', 'www.monumentalsportsnetwork.com', 'www.moviespree.com', 'www.neoufitness.com', 'www.pflmma.com', 'www.snagfilms.com', 'www.snagxtreme.com', 'www.supercrosslive.tv', 'www.theidentitytb.com', 'www.vayafilm.com', 'www.winnersview.com')),
+    'ViideaIE': ('pycord.ext.dl.extractor.viidea', None),
+    'VimeoIE': ('pycord.ext.dl.extractor.vimeo', ('player.vimeo.com', 'player.vimeopro.com', 'vimeo.com', 'vimeopro.com', 'www.vimeo.com', 'www.vimeopro.com')),
+    'VimeoAlbumIE': ('pycord.ext.dl.extractor.vimeo', ('vimeo.com',)),
+    'VimeoChannelIE': ('pycord.ext.dl.extractor.vimeo', ('vimeo.com',)),
+    'VimeoGroupsIE': ('pycord.ext.dl.extractor.vimeo', ('vimeo.com',)),
+    'VimeoLikesIE': ('pycord.ext.dl.extractor.vimeo', ('vimeo.com', 'www.vimeo.com')),
+    'VimeoOndemandIE': ('pycord.ext.dl.extractor.vimeo', ('vimeo.com', 'www.vimeo.com')),
+    'VimeoReviewIE': ('pycord.ext.dl.extractor.vimeo', ('vimeo.com',)),
+    'VimeoUserIE': ('pycord.ext.dl.extractor.vimeo', ('vimeo.com',)),
+    'VimeoWatchLaterIE': ('pycord.ext.dl.extractor.vimeo', None),
+    'VHXEmbedIE': ('pycord.ext.dl.extractor.vimeo', ('embed.vhx.tv',)),
+    'VimpleIE': ('pycord.ext.dl.extractor.vimple', ('player.vimple.co', 'player.vimple.ru', 'vimple.co', 'vimple.ru')),
+    'VineIE': ('pycord.ext.dl.extractor.vine', ('vine.co', 'www.vine.co')),
+    'VineUserIE': ('pycord.ext.dl.extractor.vine', ('vine.co',)),
+    'VikiIE': ('pycord.ext.dl.extractor.viki', ('viki.com', 'viki.fr', 'viki.jp', 'viki.mx', 'viki.net', 'www.viki.com', 'www.viki.fr', 'www.viki.jp', 'www.viki.mx', 'www.viki.net')),
+    'VikiChannelIE': ('pycord.ext.dl.extractor.viki', ('viki.com', 'viki.fr', 'viki.jp', 'viki.mx', 'viki.net', 'www.viki.com', 'www.viki.fr', 'www.viki.jp', 'www.viki.mx', 'www.viki.net')),
+    'ViqeoIE': ('pycord.ext.dl.extractor.viqeo', ('api.viqeo.tv', 'cdn.viqeo.tv', 'viqeo:')),
+    'ViuIE': ('pycord.ext.dl.extractor.viu', ('viu.com', 'viu:')),
+    'ViuPlaylistIE': ('pycord.ext.dl.extractor.viu', ('www.viu.com',)),
+    'ViuOTTIE': ('pycord.ext.dl.extractor.viu', ('viu.com', 'www.viu.com')),
+    'VKIE': ('pycord.ext.dl.extractor.vk', None),
+    'VKUserVideosIE': ('pycord.ext.dl.extractor.vk', ('m.vk.com', 'new.vk.com', 'vk.com')),
+    'VKWallPostIE': ('pycord.ext.dl.extractor.vk', ('m.vk.com', 'new.vk.com', 'vk.com')),
+    'VLiveIE': ('pycord.ext.dl.extractor.vlive', ('m.vlive.tv', 'vlive.tv', 'www.vlive.tv')),
+    'VLivePostIE': ('pycord.ext.dl.extractor.vlive', ('m.vlive.tv', 'vlive.tv', 'www.vlive.tv')),
+    'VLiveChannelIE': ('pycord.ext.dl.extractor.vlive', ('channels.vlive.tv', 'm.vlive.tv', 'vlive.tv', 'www.vlive.tv')),
+    'VodlockerIE': ('pycord.ext.dl.extractor.vodlocker', ('vodlocker.city', 'vodlocker.com', 'www.vodlocker.city', 'www.vodlocker.com')),
+    'VODPlIE': ('pycord.ext.dl.extractor.vodpl', ('vod.pl',)),
+    'VODPlatformIE': ('pycord.ext.dl.extractor.vodplatform', ('embed.kwikmotion.com', 'vod-platform.net', 'www.vod-platform.net')),
+    'VoiceRepublicIE': ('pycord.ext.dl.extractor.voicerepublic', ('voicerepublic.com',)),
+    'VootIE': ('pycord.ext.dl.extractor.voot', ('voot.com', 'www.voot.com')),
+    'VoxMediaVolumeIE': ('pycord.ext.dl.extractor.voxmedia', ('volume.vox-cdn.com',)),
+    'VoxMediaIE': ('pycord.ext.dl.extractor.voxmedia', ('curbed.com', 'eater.com', 'funnyordie.com', 'polygon.com', 'racked.com', 'recode.net', 'sbnation.com', 'theverge.com', 'vox.com', 'www.curbed.com', 'www.eater.com', 'www.funnyordie.com', 'www.polygon.com', 'www.racked.com', 'www.recode.net', 'www.sbnation.com', 'www.theverge.com', 'www.vox.com')),
+    'VRTIE': ('pycord.ext.dl.extractor.vrt', ('sporza.be', 'vrt.be', 'www.sporza.be', 'www.vrt.be')),
+    'VrakIE': ('pycord.ext.dl.extractor.vrak', ('vrak.tv', 'www.vrak.tv')),
+    'VRVIE': ('pycord.ext.dl.extractor.vrv', ('vrv.co', 'www.vrv.co')),
+    'VRVSeriesIE': ('pycord.ext.dl.extractor.vrv', ('vrv.co', 'www.vrv.co')),
+    'VShareIE': ('pycord.ext.dl.extractor.vshare', ('vshare.io', 'www.vshare.io')),
+    'VTMIE': ('pycord.ext.dl.extractor.vtm', ('vtm.be', 'www.vtm.be')),
+    'MedialaanIE': ('pycord.ext.dl.extractor.medialaan', None),
+    'VubeIE': ('pycord.ext.dl.extractor.vube', ('vube.com',)),
+    'VuClipIE': ('pycord.ext.dl.extractor.vuclip', ('m.vuclip.com', 'vuclip.com')),
+    'VVVVIDIE': ('pycord.ext.dl.extractor.vvvvid', ('vvvvid.it', 'www.vvvvid.it')),
+    'VVVVIDShowIE': ('pycord.ext.dl.extractor.vvvvid', ('vvvvid.it', 'www.vvvvid.it')),
+    'VyboryMosIE': ('pycord.ext.dl.extractor.vyborymos', ('vybory.mos.ru',)),
+    'VzaarIE': ('pycord.ext.dl.extractor.vzaar', ('view.vzaar.com', 'vzaar.com', 'www.vzaar.com')),
+    'WakanimIE': ('pycord.ext.dl.extractor.wakanim', ('wakanim.tv', 'www.wakanim.tv')),
+    'WallaIE': ('pycord.ext.dl.extractor.walla', ('vod.walla.co.il',)),
+    'WashingtonPostIE': ('pycord.ext.dl.extractor.washingtonpost', ('washingtonpost.com', 'washingtonpost:', 'www.washingtonpost.com')),
+    'WashingtonPostArticleIE': ('pycord.ext.dl.extractor.washingtonpost', ('washingtonpost.com', 'www.washingtonpost.com')),
+    'WatIE': ('pycord.ext.dl.extractor.wat', ('wat.tv', 'wat:', 'www.wat.tv')),
+    'WatchBoxIE': ('pycord.ext.dl.extractor.watchbox', ('watchbox.de', 'www.watchbox.de')),
+    'WatchIndianPornIE': ('pycord.ext.dl.extractor.watchindianporn', ('watchindianporn.net', 'www.watchindianporn.net')),
+    'WDRIE': ('pycord.ext.dl.extractor.wdr', ('deviceids-medp.wdr.de',)),
+    'WDRPageIE': ('pycord.ext.dl.extractor.wdr', None),
+    'WDRElefantIE': ('pycord.ext.dl.extractor.wdr', ('www.wdrmaus.de',)),
+    'WDRMobileIE': ('pycord.ext.dl.extractor.wdr', ('mobile-ondemand.wdr.de',)),
+    'WebcasterIE': ('pycord.ext.dl.extractor.webcaster', ('bl.webcaster.pro',)),
+    'WebcasterFeedIE': ('pycord.ext.dl.extractor.webcaster', ('bl.webcaster.pro',)),
+    'WebOfStoriesIE': ('pycord.ext.dl.extractor.webofstories', ('webofstories.com', 'www.webofstories.com')),
+    'WebOfStoriesPlaylistIE': ('pycord.ext.dl.extractor.webofstories', ('webofstories.com', 'www.webofstories.com')),
+    'WeiboIE': ('pycord.ext.dl.extractor.weibo', ('weibo.com', 'www.weibo.com')),
+    'WeiboMobileIE': ('pycord.ext.dl.extractor.weibo', ('m.weibo.cn',)),
+    'WeiqiTVIE': ('pycord.ext.dl.extractor.weiqitv', ('weiqitv.com', 'www.weiqitv.com')),
+    'WistiaIE': ('pycord.ext.dl.extractor.wistia', ('fast.wistia.com', 'fast.wistia.net', 'wistia.com', 'wistia.net', 'wistia:')),
+    'WistiaPlaylistIE': ('pycord.ext.dl.extractor.wistia', ('fast.wistia.com', 'fast.wistia.net', 'wistia.com', 'wistia.net')),
+    'WorldStarHipHopIE': ('pycord.ext.dl.extractor.worldstarhiphop', ('m.worldstarcandy.com', 'm.worldstarhiphop.com', 'www.worldstarcandy.com', 'www.worldstarhiphop.com')),
+    'WSJIE': ('pycord.ext.dl.extractor.wsj', ('barrons.com', 'video-api.wsj.com', 'wsj.com', 'wsj:', 'www.barrons.com', 'www.wsj.com')),
+    'WSJArticleIE': ('pycord.ext.dl.extractor.wsj', ('wsj.com', 'www.wsj.com')),
+    'WWEIE': ('pycord.ext.dl.extractor.wwe', ('wwe.com',)),
+    'XBefIE': ('pycord.ext.dl.extractor.xbef', ('www.xbef.com', 'xbef.com')),
+    'XboxClipsIE': ('pycord.ext.dl.extractor.xboxclips', ('gameclips.io', 'www.gameclips.io', 'www.xboxclips.com', 'xboxclips.com')),
+    'XFileShareIE': ('pycord.ext.dl.extractor.xfileshare', ('aparat.cam', 'clipwatching.com', 'gounlimited.to', 'govid.me', 'holavid.com', 'streamty.com', 'thevideobee.to', 'uqload.com', 'vidbom.com', 'vidlo.us', 'vidlocker.xyz', 'vidshare.tv', 'vup.to', 'wolfstream.tv', 'www.aparat.cam', 'www.clipwatching.com', 'www.gounlimited.to', 'www.govid.me', 'www.holavid.com', 'www.streamty.com', 'www.thevideobee.to', 'www.uqload.com', 'www.vidbom.com', 'www.vidlo.us', 'www.vidlocker.xyz', 'www.vidshare.tv', 'www.vup.to', 'www.wolfstream.tv', 'www.xvideosharing.com', 'xvideosharing.com')),
+    'XHamsterIE': ('pycord.ext.dl.extractor.xhamster', None),
+    'XHamsterEmbedIE': ('pycord.ext.dl.extractor.xhamster', None),
+    'XHamsterUserIE': ('pycord.ext.dl.extractor.xhamster', None),
+    'XiamiSongIE': ('pycord.ext.dl.extractor.xiami', ('www.xiami.com', 'xiami.com')),
+    'XiamiAlbumIE': ('pycord.ext.dl.extractor.xiami', ('www.xiami.com', 'xiami.com')),
+    'XiamiArtistIE': ('pycord.ext.dl.extractor.xiami', ('www.xiami.com', 'xiami.com')),
+    'XiamiCollectionIE': ('pycord.ext.dl.extractor.xiami', ('www.xiami.com', 'xiami.com')),
+    'XimalayaIE': ('pycord.ext.dl.extractor.ximalaya', ('m.ximalaya.com', 'www.ximalaya.com', 'ximalaya.com')),
+    'XimalayaAlbumIE': ('pycord.ext.dl.extractor.ximalaya', ('m.ximalaya.com', 'www.ximalaya.com', 'ximalaya.com')),
+    'XMinusIE': ('pycord.ext.dl.extractor.xminus', ('www.x-minus.org', 'x-minus.org')),
+    'XNXXIE': ('pycord.ext.dl.extractor.xnxx', ('video.xnxx.com', 'www.xnxx.com')),
+    'XstreamIE': ('pycord.ext.dl.extractor.xstream', ('frontend.xstream.dk', 'frontend.xstream.net', 'xstream:')),
+    'XTubeUserIE': ('pycord.ext.dl.extractor.xtube', ('www.xtube.com', 'xtube.com')),
+    'XTubeIE': ('pycord.ext.dl.extractor.xtube', ('www.xtube.com', 'xtube.com', 'xtube:')),
+    'XuiteIE': ('pycord.ext.dl.extractor.xuite', ('vlog.xuite.net',)),
+    'XVideosIE': ('pycord.ext.dl.extractor.xvideos', ('flashservice.xvideos.com', 'static-hw.xvideos.com', 'www.xvideos.es', 'xvideos.com', 'xvideos.es', 'xvideos2.com')),
+    'XXXYMoviesIE': ('pycord.ext.dl.extractor.xxxymovies', ('www.xxxymovies.com', 'xxxymovies.com')),
+    'YahooIE': ('pycord.ext.dl.extractor.yahoo', ('malaysia.yahoo.com', 'yahoo.com')),
+    'YahooSearchIE': ('pycord.ext.dl.extractor.yahoo', None),
+    'YahooGyaOPlayerIE': ('pycord.ext.dl.extractor.yahoo', ('gyao.yahoo.co.jp', 'streaming.yahoo.co.jp')),
+    'YahooGyaOIE': ('pycord.ext.dl.extractor.yahoo', ('gyao.yahoo.co.jp', 'streaming.yahoo.co.jp')),
+    'YahooJapanNewsIE': ('pycord.ext.dl.extractor.yahoo', None),
+    'YandexDiskIE': ('pycord.ext.dl.extractor.yandexdisk', ('disk.yandex.az', 'disk.yandex.by', 'disk.yandex.co.il', 'disk.yandex.com', 'disk.yandex.com.am', 'disk.yandex.com.ge', 'disk.yandex.com.tr', 'disk.yandex.ee', 'disk.yandex.fr', 'disk.yandex.kg', 'disk.yandex.kz', 'disk.yandex.lt', 'disk.yandex.lv', 'disk.yandex.md', 'disk.yandex.ru', 'disk.yandex.tj', 'disk.yandex.tm', 'disk.yandex.ua', 'disk.yandex.uz', 'yadi.sk')),
+    'YandexMusicTrackIE': ('pycord.ext.dl.extractor.yandexmusic', ('music.yandex.by', 'music.yandex.com', 'music.yandex.kz', 'music.yandex.ru', 'music.yandex.ua')),
+    'YandexMusicAlbumIE': ('pycord.ext.dl.extractor.yandexmusic', ('music.yandex.by', 'music.yandex.com', 'music.yandex.kz', 'music.yandex.ru', 'music.yandex.ua')),
+    'YandexMusicPlaylistIE': ('pycord.ext.dl.extractor.yandexmusic', ('music.yandex.by', 'music.yandex.com', 'music.yandex.kz', 'music.yandex.ru', 'music.yandex.ua')),
+    'YandexMusicArtistTracksIE': ('pycord.ext.dl.extractor.yandexmusic', ('music.yandex.by', 'music.yandex.com', 'music.yandex.kz', 'music.yandex.ru', 'music.yandex.ua')),
+    'YandexMusicArtistAlbumsIE': ('pycord.ext.dl.extractor.yandexmusic', ('music.yandex.by', 'music.yandex.com', 'music.yandex.kz', 'music.yandex.ru', 'music.yandex.ua')),
+    'YandexVideoIE': ('pycord.ext.dl.extractor.yandexvideo', ('frontend.vh.yandex.ru', 'yandex.ru')),
+    'YapFilesIE': ('pycord.ext.dl.extractor.yapfiles', ('api.yapfiles.ru', 'www.yapfiles.ru', 'yapfiles.ru')),
+    'YesJapanIE': ('pycord.ext.dl.extractor.yesjapan', ('www.yesjapan.com', 'yesjapan.com')),
+    'YinYueTaiIE': ('pycord.ext.dl.extractor.yinyuetai', ('v.yinyuetai.com',)),
+    'YnetIE': ('pycord.ext.dl.extractor.ynet', None),
+    'YouJizzIE': ('pycord.ext.dl.extractor.youjizz', ('youjizz.com',)),
+    'YoukuIE': ('pycord.ext.dl.extractor.youku', ('player.youku.com', 'v.youku.com', 'video.tudou.com', 'youku:')),
+    'YoukuShowIE': ('pycord.ext.dl.extractor.youku', ('list.youku.com',)),
+    'YouNowLiveIE': ('pycord.ext.dl.extractor.younow', ('www.younow.com', 'younow.com')),
+    'YouNowChannelIE': ('pycord.ext.dl.extractor.younow', ('www.younow.com', 'younow.com')),
+    'YouNowMomentIE': ('pycord.ext.dl.extractor.younow', ('www.younow.com', 'younow.com')),
+    'YouPornIE': ('pycord.ext.dl.extractor.youporn', ('www.youporn.com', 'youporn.com')),
+    'YourPornIE': ('pycord.ext.dl.extractor.yourporn', ('sxyprn.com', 'www.sxyprn.com')),
+    'YourUploadIE': ('pycord.ext.dl.extractor.yourupload', ('embed.yourupload.com', 'www.embed.yourupload.com', 'www.yourupload.com', 'yourupload.com')),
+    'YoutubeIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeFavouritesIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeHistoryIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeTabIE': ('pycord.ext.dl.extractor.youtube', ('invidio.us', 'youtube.com', 'youtubekids.com')),
+    'YoutubePlaylistIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeRecommendedIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeSearchDateIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeSearchIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeSubscriptionsIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeTruncatedIDIE': ('pycord.ext.dl.extractor.youtube', ('www.youtube.com', 'youtube.com')),
+    'YoutubeTruncatedURLIE': ('pycord.ext.dl.extractor.youtube', None),
+    'YoutubeYtBeIE': ('pycord.ext.dl.extractor.youtube', ('youtu.be',)),
+    'YoutubeYtUserIE': ('pycord.ext.dl.extractor.youtube', ('ytuser:',)),
+    'YoutubeWatchLaterIE': ('pycord.ext.dl.extractor.youtube', None),
+    'ZapiksIE': ('pycord.ext.dl.extractor.zapiks', ('www.zapiks.com', 'www.zapiks.fr', 'zapiks.com', 'zapiks.fr')),
+    'BBVTVIE': ('pycord.ext.dl.extractor.zattoo', ('bbv-tv.net', 'www.bbv-tv.net')),
+    'EinsUndEinsTVIE': ('pycord.ext.dl.extractor.zattoo', ('1und1.tv', 'www.1und1.tv')),
+    'EWETVIE': ('pycord.ext.dl.extractor.zattoo', ('tvonline.ewe.de', 'www.tvonline.ewe.de')),
+    'GlattvisionTVIE': ('pycord.ext.dl.extractor.zattoo', ('iptv.glattvision.ch', 'www.iptv.glattvision.ch')),
+    'MNetTVIE': ('pycord.ext.dl.extractor.zattoo', ('tvplus.m-net.de', 'www.tvplus.m-net.de')),
+    'MyVisionTVIE': ('pycord.ext.dl.extractor.zattoo', ('myvisiontv.ch', 'www.myvisiontv.ch')),
+    'NetPlusIE': ('pycord.ext.dl.extractor.zattoo', ('netplus.tv', 'www.netplus.tv')),
+    'OsnatelTVIE': ('pycord.ext.dl.extractor.zattoo', ('tvonline.osnatel.de', 'www.tvonline.osnatel.de')),
+    'QuantumTVIE': ('pycord.ext.dl.extractor.zattoo', ('quantum-tv.com', 'www.quantum-tv.com')),
+    'QuicklineIE': ('pycord.ext.dl.extractor.zattoo', ('mobiltv.quickline.com', 'www.mobiltv.quickline.com')),
+    'QuicklineLiveIE': ('pycord.ext.dl.extractor.zattoo', ('mobiltv.quickline.com', 'www.mobiltv.quickline.com')),
+    'SaltTVIE': ('pycord.ext.dl.extractor.zattoo', ('tv.salt.ch', 'www.tv.salt.ch')),
+    'SAKTVIE': ('pycord.ext.dl.extractor.zattoo', ('saktv.ch', 'www.saktv.ch')),
+    'VTXTVIE': ('pycord.ext.dl.extractor.zattoo', ('vtxtv.ch', 'www.vtxtv.ch')),
+    'WalyTVIE': ('pycord.ext.dl.extractor.zattoo', ('player.waly.tv', 'www.player.waly.tv')),
+    'ZattooIE': ('pycord.ext.dl.extractor.zattoo', ('www.zattoo.com', 'zattoo.com')),
+    'ZattooLiveIE': ('pycord.ext.dl.extractor.zattoo', ('www.zattoo.com', 'zattoo.com')),
+    'ZDFIE': ('pycord.ext.dl.extractor.zdf', ('www.zdf.de',)),
+    'ZDFChannelIE': ('pycord.ext.dl.extractor.zdf', ('www.zdf.de',)),
+    'ZhihuIE': ('pycord.ext.dl.extractor.zhihu', ('www.zhihu.com', 'zhihu.com')),
+    'ZingMp3IE': ('pycord.ext.dl.extractor.zingmp3', ('mp3.zing.vn', 'zingmp3.vn')),
+    'ZingMp3AlbumIE': ('pycord.ext.dl.extractor.zingmp3', ('mp3.zing.vn', 'zingmp3.vn')),
+    'ZoomIE': ('pycord.ext.dl.extractor.zoom', None),
+    'ZypeIE': ('pycord.ext.dl.extractor.zype', ('player.zype.com',)),
+    'GenericIE': ('pycord.ext.dl.extractor.generic', None),
+}
@@ -0,0 +1,238 @@
+from __future__ import unicode_literals
+
+import collections
+import copy
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from .cache import (
+    Cache,
+    SqliteCacheBackend,
+)
+from .compat import (
+    compat_str,
+    compat_urllib_parse_urlparse,
+    compat_urlparse,
+)
+
+
+# Expiry timestamps of signed media URLs, e.g. googlevideo's "expire=...",
+# CloudFront's "Expires=..." or Akamai's "exp=..." token part, and the
+# "/expire/.../" path segment of YouTube manifests.
+_EXPIRY_RE = re.compile(
+    r"(?:^|[?&;~/=])(?:expire|expires|exp)[=/](\d{10})(?:\d{3})?(?=$|[&;~/])",
+    re.IGNORECASE,
+)
+
+_URL_FIELDS = ("url", "manifest_url", "fragment_base_url")
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def url_expiry(url):
+    """The earliest expiry timestamp signed into url, or None."""
+    if not isinstance(url, compat_str):
+        return None
+    expiries = [int(m) for m in _EXPIRY_RE.findall(url)]
+    return min(expiries) if expiries else None
+
+
+def info_expiry(ie_result):
+    """The earliest expiry of the media URLs in an extraction result, or None."""
+    expiry = None
+    todo = [ie_result]
+    while todo:
+        info = todo.pop()
+        for field in _URL_FIELDS:
+            url_exp = url_expiry(info.get(field))
+            if url_exp is not None and (expiry is None or url_exp < expiry):
+                expiry = url_exp
+        for key in ("formats", "requested_formats", "entries"):
+            value = info.get(key)
+            if isinstance(value, list):
+                todo.extend(v for v in value if isinstance(v, dict))
+    return expiry
+
+
+def normalize_url(url):
+    """Lower case the scheme and host, drop the default port and the fragment."""
+    parsed = compat_urllib_parse_urlparse(url)
+    if not parsed.scheme or not parsed.netloc:
+        return url
+
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port and netloc.endswith(":%d" % default_port):
+        netloc = netloc[: -len(":%d" % default_port)]
+
+    return compat_urlparse.urlunparse(
+        (scheme, netloc, parsed.path or "/", parsed.params, parsed.query, "")
+    )
+
+
+class InfoCache(object):
+    """
+    Cache of extraction results, i.e. what InfoExtractor.extract() returns,
+    keyed by the extractor and the normalised URL.
+
+    Entries live for at most ttl seconds, and never past the earliest expiry
+    signed into their media URLs minus expiry_margin seconds. Results with
+    already expired URLs, or with lazily generated playlist entries, are not
+    cached. The in-memory store keeps the max_entries most recently used
+    results; with a sqlite path, results are also stored in, and looked up
+    from, that database (a SqliteCacheBackend, which evicts the least
+    recently used entries past sqlite_max_size bytes) so they outlive the
+    process and can be shared between processes.
+
+    An InfoCache can be shared by YoutubeDL instances with the same options
+    through the info_cache parameter. Pickled copies (e.g. for worker
+    processes) start with an empty memory store but use the same database.
+    """
+
+    SECTION = "info_cache"
+
+    def __init__(
+        self,
+        ttl=3600,
+        max_entries=1024,
+        sqlite=None,
+        expiry_margin=60,
+        sqlite_max_size=64 * 1024 * 1024,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.expiry_margin = expiry_margin
+        self.sqlite = sqlite
+        self.sqlite_max_size = sqlite_max_size
+
+        self._init_state()
+
+    @classmethod
+    def from_params(cls, params):
+        """Create an InfoCache from the info_cache_* YoutubeDL options."""
+        sqlite = params.get("info_cache_sqlite")
+        if sqlite is True:
+            if params.get("cachedir") is False:
+                sqlite = None
+            else:
+                sqlite = os.path.join(Cache.root_dir(params), "cache.sqlite")
+        kwargs = {}
+        if params.get("cache_max_size") is not None:
+            kwargs["sqlite_max_size"] = params["cache_max_size"]
+        return cls(
+            ttl=params.get("info_cache_ttl", 3600),
+            max_entries=params.get("info_cache_size", 1024),
+            sqlite=sqlite,
+            **kwargs
+        )
+
+    def _init_state(self):
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._store = None
+        if self.sqlite:
+            self._store = SqliteCacheBackend(
+                os.path.dirname(self.sqlite) or os.curdir,
+                self.sqlite_max_size,
+                os.path.basename(self.sqlite),
+            )
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        return {
+            "ttl": self.ttl,
+            "max_entries": self.max_entries,
+            "expiry_margin": self.expiry_margin,
+            "sqlite": self.sqlite,
+            "sqlite_max_size": self.sqlite_max_size,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_state()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(ie, url):
+        return "%s %s" % (ie.ie_key(), normalize_url(url))
+
+    def expires(self, ie_result, now=None):
+        """When ie_result should expire, or None if it can't be cached."""
+        if now is None:
+            now = time.time()
+        entries = ie_result.get("entries")
+        if entries is not None and not isinstance(entries, list):
+            return None
+
+        expires = now + self.ttl
+        url_expires = info_expiry(ie_result)
+        if url_expires is not None:
+            expires = min(expires, url_expires - self.expiry_margin)
+        return expires if expires > now else None
+
+    def get(self, key):
+        """Return a copy of the cached result for key, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(entry[1])
+                del self._entries[key]
+
+        if self._store is not None:
+            try:
+                entry = self._store.load(self.SECTION, key, "json")
+            except (KeyError, ValueError, sqlite3.Error):
+                pass
+            else:
+                with self._lock:
+                    self._remember(key, entry["expires"], entry["info"])
+                    self.hits += 1
+                return copy.deepcopy(entry["info"])
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, ie_result):
+        """Cache a copy of ie_result, if it can be cached."""
+        now = time.time()
+        expires = self.expires(ie_result, now)
+        if expires is None:
+            return
+
+        if self._store is not None:
+            entry = {"expires": expires, "info": ie_result}
+            try:
+                self._store.store(self.SECTION, key, entry, "json", expires - now)
+            except (TypeError, ValueError):
+                pass
+
+        with self._lock:
+            self._remember(key, expires, copy.deepcopy(ie_result))
+
+    def _remember(self, key, expires, ie_result):
+        self._entries[key] = (expires, ie_result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self._store is not None:
+            self._store.clear(self.SECTION)
+
+    def close(self):
+        if self._store is not None:
+            self._store.close()
@@ -679,6 +679,18 @@ def parseOpts(overrideArguments=None):
         metavar="RATE",
         help="Maximum download rate in bytes per second (e.g. 50K or 4.2M)",
     )
+    downloader.add_option(
+        "--host-limit-rate",
+        dest="host_ratelimit",
+        metavar="RATE",
+        help="Maximum download rate in bytes per second of all the downloads from the same host together (e.g. 50K or 4.2M)",
+    )
+    downloader.add_option(
+        "--global-limit-rate",
+        dest="global_ratelimit",
+        metavar="RATE",
+        help="Maximum download rate in bytes per second of all the downloads together (e.g. 50K or 4.2M)",
+    )
     downloader.add_option(
         "-R",
         "--retries",
@@ -712,7 +724,23 @@ def parseOpts(overrideArguments=None):
         action="store_true",
         dest="keep_fragments",
         default=False,
-        help="Keep downloaded fragments on disk after downloading is finished; fragments are erased by default",
+        help="Keep downloaded fragments on disk after downloading is finished; by default fragments are only held in memory",
+    )
+    downloader.add_option(
+        "--concurrent-fragments",
+        dest="concurrent_fragment_downloads",
+        metavar="N",
+        default=1,
+        type=int,
+        help="Number of fragments to download at the same time (default is %default) (DASH and hlsnative)",
+    )
+    downloader.add_option(
+        "--http-connections",
+        dest="http_connections",
+        metavar="N",
+        default=1,
+        type=int,
+        help="Number of connections to download a file over HTTP with, each one fetching a different byte range (default is %default)",
     )
     downloader.add_option(
         "--buffer-size",
@@ -753,6 +781,14 @@ def parseOpts(overrideArguments=None):
         action="store_true",
         help="Download playlist videos in random order",
     )
+    downloader.add_option(
+        "--concurrent-playlist-extraction",
+        dest="concurrent_playlist_extraction",
+        metavar="N",
+        default=0,
+        type=int,
+        help="Extract up to N playlist videos at the same time, ahead of the one being downloaded",
+    )
     downloader.add_option(
         "--xattr-set-filesize",
         dest="xattr_set_filesize",
@@ -764,7 +800,7 @@ def parseOpts(overrideArguments=None):
         dest="hls_prefer_native",
         action="store_true",
         default=None,
-        help="Use the native HLS downloader instead of ffmpeg",
+        help="Use the native HLS downloader instead of ffmpeg, also for live streams",
     )
     downloader.add_option(
         "--hls-prefer-ffmpeg",
@@ -1215,6 +1251,13 @@ def parseOpts(overrideArguments=None):
         dest="cachedir",
         help="Disable filesystem caching",
     )
+    filesystem.add_option(
+        "--cache-backend",
+        dest="cache_backend",
+        choices=("file", "sqlite"),
+        default="file",
+        help='How to store the cache: "file" (one file per entry, default) or "sqlite" (a single database file, better for many processes)',
+    )
     filesystem.add_option(
         "--rm-cache-dir",
         action="store_true",
@@ -0,0 +1,242 @@
+"""
+pycord.ext.dl.service
+~~~~~~~~~~~~~~~~~~~~~
+Process pool extraction service.
+
+Extraction spends most of its time in pure Python (regexes, JSInterpreter
+signature solving, manifest parsing), so threads serialise on the GIL.
+ExtractionService spreads extract_info() calls across worker processes,
+each of which keeps its own pre-warmed YoutubeDL instance.
+
+:copyright: 2021 Pycord
+:license: MIT see LICENSE for more info
+"""
+
+import asyncio
+import functools
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .YoutubeDL import YoutubeDL
+from .utils import (
+    DownloadError,
+    error_to_compat_str,
+    PagedList,
+)
+
+__all__ = ("ExtractionService",)
+
+_DEFAULT = object()
+
+# The YoutubeDL instance of a worker process, see _init_worker
+_worker_ydl = None
+
+
+def _init_worker(params):
+    global _worker_ydl
+
+    # Import every extractor module up front, rather than on the first URL
+    # each of them matches, and build the URL index.
+    from .extractor import extractors  # noqa: F401
+
+    _worker_ydl = YoutubeDL(params)
+    _worker_ydl._suitable_ies("")
+
+
+def _plain(obj):
+    """Turn an info dict into something that can be sent between processes."""
+    if isinstance(obj, dict):
+        return dict((key, _plain(value)) for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return [_plain(value) for value in obj]
+    if isinstance(obj, PagedList):
+        return [_plain(value) for value in obj.getslice()]
+    if isinstance(obj, types.GeneratorType):
+        return [_plain(value) for value in obj]
+    return obj
+
+
+def _worker_ping():
+    return True
+
+
+def _worker_call(name, args, kwargs):
+    try:
+        return _plain(getattr(_worker_ydl, name)(*args, **kwargs))
+    except DownloadError as e:
+        # exc_info holds a traceback, which can't be pickled
+        raise DownloadError(error_to_compat_str(e))
+
+
+class ExtractionService(object):
+    """
+    Awaitable YoutubeDL.extract_info() backed by a pool of worker processes.
+
+    Every worker imports all the extractors and creates a YoutubeDL from
+    ``params`` when it starts, then serves calls with that instance.
+    Results are plain info dicts: playlist entries are always lists.
+
+    At most ``max_pending`` calls are queued or running at once, further
+    calls wait for a slot so a burst of requests can't pile up unbounded
+    work. Cancelling a call, or exceeding its timeout, drops it if it is
+    still queued; a call already running in a worker runs to completion
+    and its result is discarded.
+
+    Usage::
+
+        service = ExtractionService({"format": "bestaudio"}, timeout=30)
+        await service.start()
+        info = await service.extract_info(url)
+        ...
+        await service.close()
+
+    params      -- The YoutubeDL options, see YoutubeDL. Must be picklable.
+    max_workers -- Number of worker processes, defaults to the CPU count.
+    max_pending -- Calls queued or running at once, defaults to 2 per worker.
+    timeout     -- Default per call timeout in seconds, None for no timeout.
+    mp_context  -- The multiprocessing context used to start workers.
+    """
+
+    def __init__(
+        self,
+        params=None,
+        max_workers=None,
+        max_pending=None,
+        timeout=None,
+        mp_context=None,
+    ):
+        self.params = dict(params or {})
+        self.timeout = timeout
+        self.mp_context = mp_context
+
+        self._executor = self._make_executor(max_workers)
+        self.max_workers = self._executor._max_workers
+        self.max_pending = max_pending or self.max_workers * 2
+
+        self._slots = None
+        self._pending = 0
+        self._closed = False
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def pending(self):
+        """How many calls are queued or running."""
+        return self._pending
+
+    def _make_executor(self, max_workers):
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=self.mp_context,
+            initializer=_init_worker,
+            initargs=(self.params,),
+        )
+
+    async def start(self):
+        """Start and warm up all the workers, instead of on the first calls."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, _worker_ping)
+                for _ in range(self.max_workers)
+            )
+        )
+
+    async def run(self, name, *args, timeout=_DEFAULT, **kwargs):
+        """
+        Call the YoutubeDL method ``name`` in a worker and return its result.
+        ``timeout`` overrides the default timeout, and includes the time spent
+        waiting for a free slot.
+        """
+        if self._closed:
+            raise RuntimeError("ExtractionService is closed")
+        if timeout is _DEFAULT:
+            timeout = self.timeout
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+
+        return await asyncio.wait_for(self._run(name, args, kwargs), timeout)
+
+    async def _run(self, name, args, kwargs):
+        async with self._slots:
+            if self._closed:
+                raise RuntimeError("ExtractionService is closed")
+
+            loop = asyncio.get_running_loop()
+            executor = self._executor
+
+            self._pending += 1
+            try:
+                return await loop.run_in_executor(
+                    executor, _worker_call, name, args, kwargs
+                )
+            except BrokenProcessPool:
+                # A worker died, e.g. it was killed. Replace the pool so
+                # the following calls can still be served.
+                if executor is self._executor and not self._closed:
+                    self._executor = self._make_executor(self.max_workers)
+                raise
+            finally:
+                self._pending -= 1
+
+    async def extract_info(
+        self,
+        url,
+        ie_key=None,
+        extra_info={},
+        process=True,
+        force_generic_extractor=False,
+        *,
+        timeout=_DEFAULT
+    ):
+        """YoutubeDL.extract_info() with download=False, see there for the arguments."""
+        return await self.run(
+            "extract_info",
+            url,
+            download=False,
+            ie_key=ie_key,
+            extra_info=extra_info,
+            process=process,
+            force_generic_extractor=force_generic_extractor,
+            timeout=timeout,
+        )
+
+    async def process_ie_result(self, ie_result, extra_info={}, *, timeout=_DEFAULT):
+        """YoutubeDL.process_ie_result() with download=False."""
+        return await self.run(
+            "process_ie_result",
+            ie_result,
+            download=False,
+            extra_info=extra_info,
+            timeout=timeout,
+        )
+
+    async def close(self, cancel_pending=True):
+        """
+        Stop accepting calls and shut the workers down once the running calls
+        finish. Queued calls are cancelled unless ``cancel_pending`` is False
+        (always kept on Python 3.8).
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        kwargs = {}
+        if sys.version_info >= (3, 9):
+            kwargs["cancel_futures"] = cancel_pending
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, functools.partial(self._executor.shutdown, **kwargs)
+        )
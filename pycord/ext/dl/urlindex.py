@@ -0,0 +1,432 @@
+from __future__ import unicode_literals
+
+import ast
+import inspect
+import re
+import textwrap
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+
+# Placeholders used while expanding a _VALID_URL prefix:
+# _WILD stands for any run of characters which can not contain "/",
+# _BAD for any run of characters which could, and _END for "$".
+_WILD = "\x00"
+_BAD = "\x01"
+_END = "\x02"
+
+_HOST_TERMINATORS = "/?#:" + _END
+_URL_PIECE_RE = re.compile(r"[@:?#]")
+
+# Give up on patterns whose scheme and host expand to more alternatives
+_MAX_ALTERNATIVES = 512
+
+_REPEATS = tuple(
+    getattr(sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+)
+_ENDS = (sre_constants.AT_END, sre_constants.AT_END_STRING)
+_SLASH_CATEGORIES = (
+    sre_constants.CATEGORY_NOT_DIGIT,
+    sre_constants.CATEGORY_NOT_WORD,
+    sre_constants.CATEGORY_NOT_SPACE,
+)
+
+# The plain _VALID_URL match. Other suitable() overrides are only indexed
+# when they can't accept a URL their _VALID_URL doesn't match.
+_PLAIN_SUITABLE = ("InfoExtractor.suitable", "LazyLoadExtractor.suitable")
+
+_host_cache = {}
+
+
+class _Unindexable(Exception):
+    pass
+
+
+def _class_matches_slash(items):
+    negate = False
+    matches = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            matches = matches or av == 47
+        elif op is sre_constants.RANGE:
+            matches = matches or av[0] <= 47 <= av[1]
+        elif op is sre_constants.CATEGORY:
+            matches = matches or av in _SLASH_CATEGORIES
+        else:
+            return True
+    return matches != negate
+
+
+def _matches_slash(items):
+    """Whether the subpattern could consume a "/"."""
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            if av == 47:
+                return True
+        elif op is sre_constants.NOT_LITERAL:
+            if av != 47:
+                return True
+        elif op is sre_constants.ANY:
+            return True
+        elif op is sre_constants.IN:
+            if _class_matches_slash(av):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            if _matches_slash(av[-1]):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_matches_slash(alt) for alt in av[1]):
+                return True
+        elif op in _REPEATS:
+            if _matches_slash(av[2]):
+                return True
+        elif op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue
+        else:
+            return True
+    return False
+
+
+def _ends_with_dot(items):
+    if not items:
+        return False
+    op, av = items[-1]
+    if op is sre_constants.LITERAL:
+        return av == 46
+    if op is sre_constants.SUBPATTERN:
+        return _ends_with_dot(av[-1])
+    if op is sre_constants.BRANCH:
+        return all(_ends_with_dot(alt) for alt in av[1])
+    return False
+
+
+def _pseudo_scheme_end(prefix):
+    """Index of the ":" ending a scheme not followed by "//", e.g. "ytsearch:"."""
+    colon = prefix.find(":")
+    if colon == -1 or "/" in prefix[:colon]:
+        return -1
+    rest = prefix[colon + 1 : colon + 3]
+    if rest[:1] not in ("", "/") or (len(rest) == 2 and rest != "//"):
+        return colon
+    return -1
+
+
+def _is_closed(prefix):
+    if _pseudo_scheme_end(prefix) != -1:
+        return True
+    start = prefix.find("//")
+    if start == -1:
+        return False
+    return any(c in _HOST_TERMINATORS for c in prefix[start + 2 :])
+
+
+def _literal_class(items):
+    chars = []
+    for op, av in items:
+        if op is not sre_constants.LITERAL:
+            return None
+        chars.append(chr(av))
+    return chars if len(chars) <= 8 else None
+
+
+def _expand(items, prefixes):
+    """Expand the subpattern on every prefix which hasn't reached the end of its host yet."""
+    for op, av in items:
+        open_prefixes = [p for p in prefixes if not _is_closed(p)]
+        if not open_prefixes:
+            break
+        closed = [p for p in prefixes if _is_closed(p)]
+
+        if op is sre_constants.LITERAL:
+            expanded = [p + chr(av) for p in open_prefixes]
+        elif op is sre_constants.NOT_LITERAL:
+            expanded = [p + (_WILD if av == 47 else _BAD) for p in open_prefixes]
+        elif op is sre_constants.ANY:
+            expanded = [p + _BAD for p in open_prefixes]
+        elif op is sre_constants.IN:
+            chars = _literal_class(av)
+            if chars is None:
+                chars = [_BAD if _class_matches_slash(av) else _WILD]
+            expanded = [p + c for p in open_prefixes for c in chars]
+        elif op is sre_constants.SUBPATTERN:
+            expanded = _expand(av[-1], open_prefixes)
+        elif op is sre_constants.BRANCH:
+            expanded = []
+            for alt in av[1]:
+                expanded.extend(_expand(alt, open_prefixes))
+        elif op in _REPEATS:
+            min_, max_, body = av
+            if (min_, max_) == (0, 1):
+                expanded = open_prefixes + _expand(body, open_prefixes)
+            elif min_ == max_ and min_ <= 4:
+                expanded = open_prefixes
+                for _ in range(min_):
+                    expanded = _expand(body, expanded)
+            else:
+                # If a single repetition already ends the host (e.g. (?:/[^/]+)*)
+                # the rest of the repetitions don't matter.
+                try:
+                    expanded = _expand(body, open_prefixes)
+                except _Unindexable:
+                    expanded = None
+                if expanded is None or not all(_is_closed(p) for p in expanded):
+                    wild = _BAD if _matches_slash(body) else _WILD
+                    if _ends_with_dot(body):
+                        wild += "."
+                    expanded = [p + wild for p in open_prefixes]
+                if min_ == 0:
+                    expanded = open_prefixes + expanded
+        elif op is sre_constants.AT:
+            if av in _ENDS:
+                expanded = [p + _END for p in open_prefixes]
+            else:
+                expanded = open_prefixes
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            # Lookarounds only narrow what matches
+            expanded = open_prefixes
+        else:
+            raise _Unindexable(op)
+
+        prefixes = closed + expanded
+        if len(prefixes) > _MAX_ALTERNATIVES:
+            raise _Unindexable("too many alternatives")
+
+    return prefixes
+
+
+def _host_key(prefix):
+    colon = _pseudo_scheme_end(prefix)
+    if colon != -1:
+        scheme = prefix[:colon]
+        if not scheme or any(c in scheme for c in (_WILD, _BAD, _END, "/")):
+            raise _Unindexable("scheme")
+        return scheme.lower() + ":"
+
+    start = prefix.find("//")
+    if start == -1 or not _is_closed(prefix):
+        raise _Unindexable("no host")
+
+    scheme = prefix[:start]
+    if any(c in scheme for c in (_WILD, _BAD, _END, "/")):
+        raise _Unindexable("scheme")
+
+    host = prefix[start + 2 :]
+    end = min(host.find(c) for c in _HOST_TERMINATORS if c in host)
+    host = host[:end]
+
+    if _BAD in host:
+        raise _Unindexable("host")
+
+    wild = host.rfind(_WILD)
+    if wild != -1:
+        if host[wild + 1 : wild + 2] != ".":
+            raise _Unindexable("host")
+        host = host[wild + 2 :]
+
+    if not host or _URL_PIECE_RE.search(host):
+        raise _Unindexable("host")
+
+    return host.lower()
+
+
+def valid_url_hosts(pattern):
+    """
+    Return the set of host names a _VALID_URL pattern can match, or None if it
+    can't be indexed by host.
+
+    A URL matched by the pattern is guaranteed to have one of the returned
+    names as its host or as a dot-separated suffix of its host. Patterns for
+    pseudo URLs such as "anvato:..." are keyed by their scheme, "anvato:".
+    """
+    try:
+        items = sre_parse.parse(pattern)
+        return frozenset(_host_key(p) for p in _expand(items, [""]))
+    except (_Unindexable, re.error, TypeError, ValueError):
+        return None
+
+
+def _is_super_suitable(node):
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "suitable"
+        and isinstance(node.func.value, ast.Call)
+        and isinstance(node.func.value.func, ast.Name)
+        and node.func.value.func.id == "super"
+    )
+
+
+def _narrows(node):
+    """Whether a returned expression can only be truthy when super().suitable() is."""
+    if node is None:
+        return True
+    if isinstance(node, ast.Constant):
+        return not node.value
+    if _is_super_suitable(node):
+        return True
+    if isinstance(node, ast.IfExp):
+        return _narrows(node.body) and _narrows(node.orelse)
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        return any(_narrows(value) for value in node.values)
+    return False
+
+
+def _suitable_narrows(func):
+    try:
+        source = textwrap.dedent(inspect.getsource(func))
+        tree = ast.parse(source)
+    except (OSError, TypeError, SyntaxError):
+        return False
+
+    function = tree.body[0]
+    for node in ast.walk(function):
+        if node is not function and isinstance(
+            node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)
+        ):
+            return False
+        if isinstance(node, ast.Return) and not _narrows(node.value):
+            return False
+    return True
+
+
+def _plain_or_narrowing_suitable(klass):
+    """
+    Whether klass.suitable(url) can only be True when _VALID_URL matches url,
+    e.g. "return False if OtherIE.suitable(url) else super(...).suitable(url)".
+    """
+    for base in klass.__mro__:
+        suitable = base.__dict__.get("suitable")
+        if suitable is None:
+            continue
+        func = getattr(suitable, "__func__", suitable)
+        if func.__qualname__ in _PLAIN_SUITABLE:
+            return True
+        if not _suitable_narrows(func):
+            return False
+    return False
+
+
+def parse_ie_hosts(klass):
+    """
+    valid_url_hosts() for the _VALID_URL of an extractor class, or None if
+    its suitable() may accept URLs the pattern doesn't match.
+    """
+    if not _plain_or_narrowing_suitable(klass):
+        return None
+    return valid_url_hosts(getattr(klass, "_VALID_URL", None))
+
+
+def _generated_hosts(klass):
+    """
+    The parse_ie_hosts() of klass generated into lazy_extractors, as
+    (found, hosts).
+    """
+    from .extractor import _HOSTS
+
+    generated = _HOSTS.get(klass.__name__)
+    # Lazy classes are defined in lazy_extractors, but know their module
+    if generated is None or generated[0] not in (
+        klass.__module__,
+        klass.__dict__.get("_module"),
+    ):
+        return False, None
+    hosts = generated[1]
+    return True, None if hosts is None else frozenset(hosts)
+
+
+def ie_hosts(ie):
+    """
+    Cached parse_ie_hosts() for an extractor class or instance. Parsing every
+    pattern takes about a second, so the hosts of the bundled extractors are
+    generated into lazy_extractors, and only extractors added at runtime are
+    parsed.
+    """
+    klass = ie if isinstance(ie, type) else type(ie)
+    try:
+        return _host_cache[klass]
+    except KeyError:
+        pass
+
+    found, hosts = _generated_hosts(klass)
+    if not found:
+        hosts = parse_ie_hosts(klass)
+
+    _host_cache[klass] = hosts
+    return hosts
+
+
+def url_host_keys(url):
+    """All the keys an indexed extractor matching url could be stored under."""
+    keys = set()
+
+    colon = url.find(":")
+    if colon > 0:
+        keys.add(url[: colon + 1].lower())
+
+    start = url.find("//")
+    if start == -1:
+        return keys
+
+    netloc = url[start + 2 :].split("/", 1)[0].lower()
+    for piece in _URL_PIECE_RE.split(netloc):
+        labels = piece.split(".")
+        keys.update(".".join(labels[i:]) for i in range(len(labels)))
+    return keys
+
+
+class ExtractorIndex(object):
+    """
+    Host keyed index over a list of extractors.
+
+    candidates() returns, in their original order, the only extractors which
+    can possibly be suitable for a URL: those indexed under one of its host
+    suffixes, and those whose _VALID_URL or suitable() can't be indexed.
+    """
+
+    def __init__(self, ies=()):
+        self._ies = []
+        self._by_host = {}
+        self._fallback = []
+
+        for ie in ies:
+            self.add(ie)
+
+    def add(self, ie):
+        """Add an extractor after all the ones already in the index."""
+        position = len(self._ies)
+        self._ies.append(ie)
+
+        hosts = ie_hosts(ie)
+        if hosts is None:
+            self._fallback.append(position)
+            return
+        for host in hosts:
+            self._by_host.setdefault(host, []).append(position)
+
+    def __len__(self):
+        return len(self._ies)
+
+    @property
+    def fallback(self):
+        return [self._ies[position] for position in self._fallback]
+
+    def candidates(self, url):
+        positions = set(self._fallback)
+        for key in url_host_keys(url):
+            positions.update(self._by_host.get(key, ()))
+        return [self._ies[position] for position in sorted(positions)]
+
+    def find(self, url):
+        """Return the first suitable extractor for url, or None."""
+        for ie in self.candidates(url):
+            if ie.suitable(url):
+                return ie
+        return None
@@ -26,11 +26,13 @@ import os
 import platform
 import random
 import re
+import select
 import socket
 import ssl
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import traceback
 import xml.etree.ElementTree
@@ -2529,6 +2531,12 @@ class MaxDownloadsReached(YoutubeDLError):
     pass
 
 
+class ExtractionCancelled(YoutubeDLError):
+    """The extraction or download was cancelled by its caller."""
+
+    pass
+
+
 class UnavailableVideoError(YoutubeDLError):
     """Unavailable Format exception.
 
@@ -2666,6 +2674,194 @@ def handle_youtubedl_headers(headers):
     return filtered_headers
 
 
+class HTTPConnectionPool(object):
+    """
+    Idle keep-alive connections, keyed by (scheme, host, port, proxy).
+
+    A connection is handed back once its response has been read completely
+    and the server didn't ask to close it. At most max_idle connections are
+    kept per key, and connections idle for longer than idle_timeout seconds
+    are dropped instead of reused.
+    """
+
+    def __init__(self, max_idle=16, idle_timeout=60):
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "opened": 0,
+            "reused": 0,
+            "stale": 0,
+            "discarded": 0,
+        }
+
+    @staticmethod
+    def _is_dead(conn):
+        # An idle connection has nothing to read, unless the server closed it
+        try:
+            return bool(select.select([conn.sock], [], [], 0)[0])
+        except (ValueError, socket.error):
+            return True
+
+    def get(self, key):
+        """Return an idle connection for key, or None if there is none."""
+        now = time.time()
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                conn, released = idle.pop()
+            if now - released <= self.idle_timeout and not self._is_dead(conn):
+                with self._lock:
+                    self._stats["reused"] += 1
+                return conn
+            self.discard(conn, stale=True)
+
+    def put(self, key, conn):
+        if conn.sock is not None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle:
+                    idle.append((conn, time.time()))
+                    return
+        self.discard(conn)
+
+    def discard(self, conn, stale=False):
+        conn.close()
+        with self._lock:
+            self._stats["stale" if stale else "discarded"] += 1
+
+    def opened(self, conn):
+        with self._lock:
+            self._stats["opened"] += 1
+
+    def stats(self):
+        """Counters of opened, reused, stale and discarded connections."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = sum(len(idle) for idle in self._idle.values())
+        return stats
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+
+class _PooledHTTPResponse(compat_http_client.HTTPResponse):
+    # Called with whether the connection can be reused once the response
+    # is done with it
+    _release = None
+
+    def _close_conn(self):
+        compat_http_client.HTTPResponse._close_conn(self)
+        # Read to the end
+        release, self._release = self._release, None
+        if release is not None:
+            release(True)
+
+    def close(self):
+        # Closed before the end, whatever is left is still on the socket
+        release, self._release = self._release, None
+        try:
+            compat_http_client.HTTPResponse.close(self)
+        finally:
+            if release is not None:
+                release(False)
+
+
+# What a request on a connection the server has closed in the meantime fails with
+_STALE_CONNECTION_ERRORS = (
+    (compat_http_client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+    if sys.version_info >= (3, 0)
+    else (compat_http_client.BadStatusLine,)
+)
+
+
+def _pooled_do_open(handler, http_class, req, socks_proxy=None, **http_conn_args):
+    """
+    AbstractHTTPHandler.do_open, but taking the connection from the
+    handler's pool and giving it back once the response has been read,
+    instead of opening a new one with "Connection: close" every time.
+    """
+    pool = handler._connection_pool
+    host = req.host
+    if not host:
+        raise compat_urllib_error.URLError("no host given")
+
+    headers = dict(req.unredirected_hdrs)
+    headers.update(
+        dict((k, v) for k, v in req.headers.items() if k not in headers)
+    )
+    headers = dict((name.title(), val) for name, val in headers.items())
+    tunnel_headers = {}
+    if req._tunnel_host and "Proxy-Authorization" in headers:
+        # Proxy-Authorization should not be sent to origin server
+        tunnel_headers["Proxy-Authorization"] = headers.pop("Proxy-Authorization")
+    # An HTTP proxy is either the host or sets up a tunnel
+    key = (req.type, host, req._tunnel_host, socks_proxy)
+
+    # A pooled connection may have been closed by the server in the
+    # meantime, retry those once on a new connection
+    for reused in (True, False):
+        h = pool.get(key) if reused else None
+        if h is None:
+            reused = False
+            h = http_class(host, timeout=req.timeout, **http_conn_args)
+            h.set_debuglevel(handler._debuglevel)
+            h.response_class = _PooledHTTPResponse
+            if req._tunnel_host:
+                h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            pool.opened(h)
+        else:
+            h.timeout = req.timeout
+            h.sock.settimeout(req.timeout)
+        try:
+            try:
+                h.request(
+                    req.get_method(),
+                    req.selector,
+                    req.data,
+                    headers,
+                    encode_chunked=req.has_header("Transfer-encoding"),
+                )
+            except socket.error as err:  # timeout error
+                raise compat_urllib_error.URLError(err)
+            r = h.getresponse()
+        except BaseException as err:
+            if isinstance(err, compat_urllib_error.URLError):
+                err = err.reason
+            if reused and isinstance(err, _STALE_CONNECTION_ERRORS):
+                pool.discard(h, stale=True)
+                continue
+            h.close()
+            raise
+        break
+
+    def release(reusable):
+        if reusable:
+            pool.put(key, h)
+        else:
+            pool.discard(h)
+
+    r._release = release
+    r.url = req.get_full_url()
+    r.msg = r.reason
+    return r
+
+
+def _do_open(handler, http_class, req, socks_proxy=None, **http_conn_args):
+    if handler._connection_pool is None or not hasattr(
+        compat_http_client.HTTPResponse, "_close_conn"
+    ):
+        return handler.do_open(http_class, req, **http_conn_args)
+    return _pooled_do_open(handler, http_class, req, socks_proxy, **http_conn_args)
+
+
 class YoutubeDLHandler(compat_urllib_request.HTTPHandler):
     """Handler for HTTP requests and responses.
 
@@ -2684,9 +2880,10 @@ class YoutubeDLHandler(compat_urllib_request.HTTPHandler):
     public domain.
     """
 
-    def __init__(self, params, *args, **kwargs):
+    def __init__(self, params, connection_pool=None, *args, **kwargs):
         compat_urllib_request.HTTPHandler.__init__(self, *args, **kwargs)
         self._params = params
+        self._connection_pool = connection_pool
 
     def http_open(self, req):
         conn_class = compat_http_client.HTTPConnection
@@ -2696,8 +2893,11 @@ class YoutubeDLHandler(compat_urllib_request.HTTPHandler):
             conn_class = make_socks_conn_class(conn_class, socks_proxy)
             del req.headers["Ytdl-socks-proxy"]
 
-        return self.do_open(
-            functools.partial(_create_http_connection, self, conn_class, False), req
+        return _do_open(
+            self,
+            functools.partial(_create_http_connection, self, conn_class, False),
+            req,
+            socks_proxy,
         )
 
     @staticmethod
@@ -2841,10 +3041,13 @@ def make_socks_conn_class(base_class, socks_proxy):
 
 
 class YoutubeDLHTTPSHandler(compat_urllib_request.HTTPSHandler):
-    def __init__(self, params, https_conn_class=None, *args, **kwargs):
+    def __init__(
+        self, params, https_conn_class=None, connection_pool=None, *args, **kwargs
+    ):
         compat_urllib_request.HTTPSHandler.__init__(self, *args, **kwargs)
         self._https_conn_class = https_conn_class or compat_http_client.HTTPSConnection
         self._params = params
+        self._connection_pool = connection_pool
 
     def https_open(self, req):
         kwargs = {}
@@ -2860,9 +3063,11 @@ class YoutubeDLHTTPSHandler(compat_urllib_request.HTTPSHandler):
             conn_class = make_socks_conn_class(conn_class, socks_proxy)
             del req.headers["Ytdl-socks-proxy"]
 
-        return self.do_open(
+        return _do_open(
+            self,
             functools.partial(_create_http_connection, self, conn_class, True),
             req,
+            socks_proxy,
             **kwargs
         )
 
@@ -4036,6 +4241,9 @@ class PagedList(object):
         # This is only useful for tests
         return len(self.getslice())
 
+    def getslice(self, start=0, end=None):
+        return list(self.iterslice(start, end))
+
 
 class OnDemandPagedList(PagedList):
     def __init__(self, pagefunc, pagesize, use_cache=True):
@@ -4045,8 +4253,8 @@ class OnDemandPagedList(PagedList):
         if use_cache:
             self._cache = {}
 
-    def getslice(self, start=0, end=None):
-        res = []
+    def iterslice(self, start=0, end=None):
+        """Yield the entries from start to end, fetching pages as they are needed"""
         for pagenum in itertools.count(start // self._pagesize):
             firstid = pagenum * self._pagesize
             nextfirstid = pagenum * self._pagesize + self._pagesize
@@ -4071,7 +4279,8 @@ class OnDemandPagedList(PagedList):
 
             if startv != 0 or endv is not None:
                 page_results = page_results[startv:endv]
-            res.extend(page_results)
+            for result in page_results:
+                yield result
 
             # A little optimization - if current page is not "full", ie. does
             # not contain page_size videos then we can assume that this page
@@ -4084,7 +4293,6 @@ class OnDemandPagedList(PagedList):
             # break out early as well
             if end == nextfirstid:
                 break
-        return res
 
 
 class InAdvancePagedList(PagedList):
@@ -4093,8 +4301,8 @@ class InAdvancePagedList(PagedList):
         self._pagecount = pagecount
         self._pagesize = pagesize
 
-    def getslice(self, start=0, end=None):
-        res = []
+    def iterslice(self, start=0, end=None):
+        """Yield the entries from start to end, fetching pages as they are needed"""
         start_page = start // self._pagesize
         end_page = self._pagecount if end is None else (end // self._pagesize + 1)
         skip_elems = start - start_page * self._pagesize
@@ -4108,11 +4316,11 @@ class InAdvancePagedList(PagedList):
                 if len(page) < only_more:
                     only_more -= len(page)
                 else:
-                    page = page[:only_more]
-                    res.extend(page)
-                    break
-            res.extend(page)
-        return res
+                    for result in page[:only_more]:
+                        yield result
+                    return
+            for result in page:
+                yield result
 
 
 def uppercase_escape(s):
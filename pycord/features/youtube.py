@@ -9,10 +9,13 @@ The pycord youtube-dl command.
 
 """
 
+import asyncio
+import warnings
+
 import discord
-import youtube_dl
 from discord.ext import commands
 
+from pycord.ext import dl
 from pycord.features.baseclass import Feature
 from pycord.features.voice import VoiceFeature
 
@@ -22,16 +25,50 @@ BASIC_OPTS = {
     "quiet": True,
 }
 
+EXTRACT_TIMEOUT = 60
+
 
 class BasicYouTubeDLSource(discord.FFmpegPCMAudio):
     """
     Basic audio source for youtube_dl-compatible URLs.
+
+    Use :meth:`from_url` to create one without blocking the event loop.
+    Passing a URL to the constructor is deprecated, it extracts the info in
+    the calling thread.
     """
 
-    def __init__(self, url, download: bool = False):
-        ytdl = youtube_dl.YoutubeDL(BASIC_OPTS)
-        info = ytdl.extract_info(url, download=download)
+    def __init__(self, url: str = None, download: bool = False, *, info: dict = None):
+        if info is None:
+            warnings.warn(
+                "BasicYouTubeDLSource(url) blocks, use BasicYouTubeDLSource.from_url",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            with dl.YoutubeDL(BASIC_OPTS) as ytdl:
+                info = ytdl.extract_info(url, download=download)
+
         super().__init__(info["url"])
+        self.info = info
+
+    @classmethod
+    async def from_url(
+        cls, url: str, download: bool = False, *, ytdl: dl.AsyncYoutubeDL = None
+    ):
+        """
+        Extracts the info for ``url`` in a youtube-dl worker pool, ``ytdl``
+        or a temporary one.
+        """
+
+        if ytdl is not None:
+            info = await ytdl.extract_info_async(url, download=download)
+            return cls(info=info)
+
+        ytdl = dl.AsyncYoutubeDL(BASIC_OPTS, timeout=EXTRACT_TIMEOUT)
+        try:
+            info = await ytdl.extract_info_async(url, download=download)
+        finally:
+            await ytdl.close(cancel=True)
+        return cls(info=info)
 
 
 class YouTubeFeature(Feature):
@@ -39,6 +76,15 @@ class YouTubeFeature(Feature):
     Feature containing the youtube-dl command
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ytdl = dl.AsyncYoutubeDL(BASIC_OPTS, timeout=EXTRACT_TIMEOUT)
+
+    def cog_unload(self):
+        # Extractions still running are cancelled
+        self.bot.loop.create_task(self.ytdl.close(cancel=True))
+        super().cog_unload()
+
     @Feature.Command(
         parent="pyc_voice", name="youtube_dl", aliases=["youtubedl", "ytdl", "yt"]
     )
@@ -52,11 +98,19 @@ class YouTubeFeature(Feature):
 
         voice = ctx.guild.voice_client
 
-        if voice.is_playing():
-            voice.stop()
-
         # remove embed maskers if present
         url = url.lstrip("<").rstrip(">")
 
-        voice.play(discord.PCMVolumeTransformer(BasicYouTubeDLSource(url)))
+        try:
+            async with ctx.typing():
+                source = await BasicYouTubeDLSource.from_url(url, ytdl=self.ytdl)
+        except asyncio.TimeoutError:
+            return await ctx.send(f"Timed out after {EXTRACT_TIMEOUT}s.")
+        except dl.utils.DownloadError as exc:
+            return await ctx.send(f"Could not play that URL: {exc}")
+
+        if voice.is_playing():
+            voice.stop()
+
+        voice.play(discord.PCMVolumeTransformer(source))
         await ctx.send(f"Playing in {voice.channel.name}.")
@@ -0,0 +1,51 @@
+import http.server
+import socketserver
+import threading
+
+import pytest
+
+
+class _Server(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        route = self.server.routes.get(self.path)
+        if route is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        route(self)
+
+    def send_body(self, body, sent=None):
+        """Answer with body, but cut the connection after sent bytes if given."""
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body if sent is None else body[:sent])
+        if sent is not None:
+            self.close_connection = True
+
+
+@pytest.fixture
+def http_server():
+    """
+    A local HTTP server, whose routes map paths to functions called with the
+    request handler. Use server.url(path) for the full URL.
+    """
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.routes = {}
+    server.url = lambda path: "http://127.0.0.1:%d%s" % (server.server_address[1], path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
@@ -0,0 +1,65 @@
+import collections
+import os
+import time
+
+import pytest
+
+from pycord.ext.dl import YoutubeDL
+from pycord.ext.dl.downloader.dash import DashSegmentsFD
+from pycord.ext.dl.utils import DownloadError
+
+FRAGMENTS = 8
+
+
+def test_resume_with_gap_uses_spilled_fragments(http_server, tmp_path):
+    content = [os.urandom(2048) for _ in range(FRAGMENTS)]
+    requests = collections.Counter()
+    failing = [True]
+
+    def fragment(i):
+        def route(handler):
+            requests[i] += 1
+            if i == 2 and failing:
+                # Fails after the fragments after it are done
+                time.sleep(0.5)
+                failing.clear()
+                handler.send_response(404)
+                handler.send_header("Content-Length", "0")
+                handler.end_headers()
+            else:
+                handler.send_body(content[i])
+
+        return route
+
+    for i in range(FRAGMENTS):
+        http_server.routes["/frag/%d" % i] = fragment(i)
+    info = {
+        "url": http_server.url("/"),
+        "fragment_base_url": http_server.url("/"),
+        "fragments": [{"path": "frag/%d" % i} for i in range(FRAGMENTS)],
+    }
+    filename = str(tmp_path / "out.mp4")
+    params = {
+        "quiet": True,
+        "noprogress": True,
+        "concurrent_fragment_downloads": 3,
+        "skip_unavailable_fragments": False,
+    }
+
+    with YoutubeDL(params) as ydl:
+        with pytest.raises(DownloadError):
+            DashSegmentsFD(ydl, ydl.params).download(filename, dict(info))
+    assert os.path.exists(filename + ".ytdl.spill")
+    # Fragments 3 to 6 were done and waiting for fragment 2
+    assert all(requests[i] == 1 for i in range(3, 7))
+
+    with YoutubeDL(params) as ydl:
+        assert DashSegmentsFD(ydl, ydl.params).download(filename, dict(info))
+
+    with open(filename, "rb") as f:
+        assert f.read() == b"".join(content)
+    assert requests[0] == requests[1] == 1
+    assert requests[2] == 2
+    assert all(requests[i] == 1 for i in range(3, FRAGMENTS))
+    assert not os.path.exists(filename + ".ytdl")
+    assert not os.path.exists(filename + ".ytdl.spill")
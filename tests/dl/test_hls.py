@@ -0,0 +1,135 @@
+import os
+
+import pytest
+
+from pycord.ext.dl import YoutubeDL
+from pycord.ext.dl.aes import aes_cbc_encrypt
+from pycord.ext.dl.downloader.hls import HlsFD
+from pycord.ext.dl.utils import bytes_to_intlist, intlist_to_bytes
+
+KEY = bytes(range(16))
+SEGMENTS = 4
+MEDIA_SEQUENCE = 7
+
+
+def encrypt(data, sequence):
+    iv = sequence.to_bytes(16, "big")
+    return intlist_to_bytes(
+        aes_cbc_encrypt(
+            bytes_to_intlist(data), bytes_to_intlist(KEY), bytes_to_intlist(iv)
+        )
+    )
+
+
+@pytest.mark.parametrize("concurrent", [1, 3])
+# In the middle of an AES block, and on a block boundary
+@pytest.mark.parametrize("cut", [1007, 1024])
+def test_truncated_encrypted_segment(http_server, tmp_path, concurrent, cut):
+    plain = [os.urandom(4096) for _ in range(SEGMENTS)]
+    encrypted = [encrypt(p, MEDIA_SEQUENCE + i) for i, p in enumerate(plain)]
+    truncated = [2]
+
+    def segment(i):
+        def route(handler):
+            if i in truncated:
+                truncated.remove(i)
+                handler.send_body(encrypted[i], sent=cut)
+            else:
+                handler.send_body(encrypted[i])
+
+        return route
+
+    playlist = (
+        "#EXTM3U\n#EXT-X-MEDIA-SEQUENCE:%d\n" % MEDIA_SEQUENCE
+        + '#EXT-X-KEY:METHOD=AES-128,URI="key"\n'
+        + "".join("#EXTINF:2,\nseg/%d\n" % i for i in range(SEGMENTS))
+        + "#EXT-X-ENDLIST\n"
+    ).encode()
+    http_server.routes["/index.m3u8"] = lambda h: h.send_body(playlist)
+    http_server.routes["/key"] = lambda h: h.send_body(KEY)
+    for i in range(SEGMENTS):
+        http_server.routes["/seg/%d" % i] = segment(i)
+
+    filename = str(tmp_path / "out.ts")
+    params = {
+        "quiet": True,
+        "noprogress": True,
+        "retries": 2,
+        "concurrent_fragment_downloads": concurrent,
+    }
+    with YoutubeDL(params) as ydl:
+        fd = HlsFD(ydl, ydl.params)
+        assert fd.download(filename, {"url": http_server.url("/index.m3u8")})
+
+    assert not truncated
+    with open(filename, "rb") as f:
+        assert f.read() == b"".join(plain)
+
+
+def live_playlist(sequence, endlist=False):
+    return (
+        "#EXTM3U\n#EXT-X-TARGETDURATION:1\n#EXT-X-MEDIA-SEQUENCE:%d\n" % sequence
+        + "#EXTINF:1,\nlive/%d\n" % sequence
+        + ("#EXT-X-ENDLIST\n" if endlist else "")
+    ).encode()
+
+
+def download_live(http_server, tmp_path, refreshes, **params):
+    """Record a live stream whose playlist refreshes are answered by refreshes."""
+    refreshes = list(refreshes)
+
+    def playlist(handler):
+        if not refreshes:
+            handler.send_body(live_playlist(0))
+            return
+        answer = refreshes.pop(0)
+        if isinstance(answer, int):
+            handler.send_response(answer)
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+        elif answer is None:
+            # Connection reset
+            handler.close_connection = True
+        else:
+            handler.send_body(answer)
+
+    http_server.routes["/live.m3u8"] = playlist
+    for i in range(3):
+        http_server.routes["/live/%d" % i] = lambda h, i=i: h.send_body(b"%d" % i)
+    filename = str(tmp_path / "live.ts")
+    params = dict({"quiet": True, "noprogress": True}, **params)
+    with YoutubeDL(params) as ydl:
+        fd = HlsFD(ydl, ydl.params)
+        info = {"url": http_server.url("/live.m3u8"), "is_live": True}
+        return fd.download(filename, info), filename
+
+
+def test_live_refresh_retries_network_errors(http_server, tmp_path):
+    success, filename = download_live(
+        http_server,
+        tmp_path,
+        [live_playlist(0), 503, None, live_playlist(1, endlist=True)],
+    )
+    assert success
+    with open(filename, "rb") as f:
+        assert f.read() == b"01"
+
+
+def test_live_refresh_stops_at_client_error(http_server, tmp_path):
+    success, filename = download_live(
+        http_server, tmp_path, [live_playlist(0), 404], live_refresh_retries=0
+    )
+    assert success
+    with open(filename, "rb") as f:
+        assert f.read() == b"0"
+
+
+def test_live_refresh_fails_once_retries_are_exhausted(http_server, tmp_path):
+    success, _ = download_live(
+        http_server,
+        tmp_path,
+        [live_playlist(0), 503, None],
+        live_refresh_retries=1,
+        ignoreerrors=True,
+    )
+    assert not success
@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+
+from pycord.ext.dl import YoutubeDL
+from pycord.ext.dl.downloader.http import HttpFD
+from pycord.ext.dl.downloader.ratelimit import TokenBucket
+
+MiB = 1024 * 1024
+
+
+def test_consume_reserves_after_previous_reservations():
+    bucket = TokenBucket(1000, burst=0)
+    assert bucket.consume(100) == pytest.approx(0.1, abs=0.01)
+    # Waits for its own 100 bytes after the 100 reserved before
+    assert bucket.consume(100) == pytest.approx(0.2, abs=0.01)
+
+
+def test_concurrent_downloads_share_global_ratelimit(http_server, tmp_path):
+    body = b"x" * (3 * MiB // 2)
+    http_server.routes["/file"] = lambda h: h.send_body(body)
+    params = {
+        "quiet": True,
+        "noprogress": True,
+        "global_ratelimit": MiB,
+    }
+    finished = {}
+
+    def download(name):
+        with YoutubeDL(params) as ydl:
+            fd = HttpFD(ydl, ydl.params)
+            filename = str(tmp_path / name)
+            assert fd.download(filename, {"url": http_server.url("/file")})
+        finished[name] = time.monotonic()
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=download, args=(name,)) for name in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 3 MiB at 1 MiB/s, both downloads going at half the rate until the end
+    # (in turns of a quarter of a second) instead of one after the other
+    assert abs(finished["a"] - finished["b"]) < 0.75
+    assert max(finished.values()) - start > 2.5
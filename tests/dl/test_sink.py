@@ -0,0 +1,32 @@
+import pytest
+
+from pycord.ext.dl import YoutubeDL
+from pycord.ext.dl.downloader import CallbackSink
+from pycord.ext.dl.utils import DownloadError
+
+
+def test_hls_with_map_to_sink_fails(http_server, capfd):
+    playlist = (
+        b'#EXTM3U\n#EXT-X-MAP:URI="init.mp4"\n'
+        b"#EXTINF:2,\nseg/0.m4s\n#EXT-X-ENDLIST\n"
+    )
+    http_server.routes["/index.m3u8"] = lambda h: h.send_body(playlist)
+    http_server.routes["/init.mp4"] = lambda h: h.send_body(b"init")
+    http_server.routes["/seg/0.m4s"] = lambda h: h.send_body(b"segment")
+    received = []
+    closed = []
+    sink = CallbackSink(received.append, on_close=lambda: closed.append(True))
+    info = {
+        "id": "map",
+        "url": http_server.url("/index.m3u8"),
+        "protocol": "m3u8_native",
+        "ext": "mp4",
+    }
+
+    with YoutubeDL({"quiet": True, "noprogress": True}) as ydl:
+        with pytest.raises(DownloadError, match="can't download to a sink"):
+            ydl.download_to_sink(info, sink)
+
+    assert closed
+    assert not received
+    assert not capfd.readouterr().out